@@ -19,7 +19,6 @@
 #include "generated/enum_flag_bits.h"
 
 namespace sync_utils {
-static constexpr uint32_t kNumPipelineStageBits = sizeof(VkPipelineStageFlags2KHR) * 8;
 
 VkPipelineStageFlags2KHR DisabledPipelineStages(const DeviceFeatures &features) {
     VkPipelineStageFlags2KHR result = 0;
@@ -59,10 +58,9 @@ VkPipelineStageFlags2KHR ExpandPipelineStages(VkPipelineStageFlags2KHR stage_mas
 
     if (VK_PIPELINE_STAGE_ALL_COMMANDS_BIT & stage_mask) {
         expanded &= ~VK_PIPELINE_STAGE_ALL_COMMANDS_BIT;
-        for (const auto &all_commands : syncAllCommandStagesByQueueFlags()) {
-            if (all_commands.first & queue_flags) {
-                expanded |= all_commands.second & ~disabled_feature_mask;
-            }
+        const auto &all_commands = syncAllCommandStagesByQueueFlags();
+        for (VkQueueFlags queue_bits = queue_flags; queue_bits; queue_bits &= queue_bits - 1) {
+            expanded |= all_commands[LeastSignificantBit(queue_bits)] & ~disabled_feature_mask;
         }
     }
     if (VK_PIPELINE_STAGE_ALL_GRAPHICS_BIT & stage_mask) {
@@ -70,8 +68,8 @@ VkPipelineStageFlags2KHR ExpandPipelineStages(VkPipelineStageFlags2KHR stage_mas
         // Make sure we don't pull in the HOST stage from expansion, but keep it if set by the caller.
         // The syncAllCommandStagesByQueueFlags table includes HOST for all queue types since it is
         // allowed but it shouldn't be part of ALL_GRAPHICS
-        expanded |=
-            syncAllCommandStagesByQueueFlags().at(VK_QUEUE_GRAPHICS_BIT) & ~disabled_feature_mask & ~VK_PIPELINE_STAGE_HOST_BIT;
+        expanded |= syncAllCommandStagesByQueueFlags()[LeastSignificantBit(static_cast<VkQueueFlags>(VK_QUEUE_GRAPHICS_BIT))] &
+                    ~disabled_feature_mask & ~VK_PIPELINE_STAGE_HOST_BIT;
     }
     if (VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT_KHR & stage_mask) {
         expanded &= ~VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT_KHR;
@@ -114,15 +112,9 @@ VkAccessFlags2KHR ExpandAccessFlags(VkAccessFlags2KHR access_mask) {
 VkAccessFlags2KHR CompatibleAccessMask(VkPipelineStageFlags2KHR stage_mask) {
     VkAccessFlags2KHR result = 0;
     stage_mask = ExpandPipelineStages(stage_mask);
-    for (size_t i = 0; i < kNumPipelineStageBits; i++) {
-        VkPipelineStageFlags2KHR bit = 1ULL << i;
-        if (stage_mask & bit) {
-            auto access_rec = syncDirectStageToAccessMask().find(bit);
-            if (access_rec != syncDirectStageToAccessMask().end()) {
-                result |= access_rec->second;
-                continue;
-            }
-        }
+    const auto &access_by_stage = syncDirectStageToAccessMask();
+    for (VkPipelineStageFlags2KHR stage_bits = stage_mask; stage_bits; stage_bits &= stage_bits - 1) {
+        result |= access_by_stage[LeastSignificantBit(stage_bits)];
     }
 
     // put the meta-access bits back on
@@ -138,16 +130,10 @@ VkAccessFlags2KHR CompatibleAccessMask(VkPipelineStageFlags2KHR stage_mask) {
 }
 
 VkPipelineStageFlags2KHR RelatedPipelineStages(VkPipelineStageFlags2KHR stage_mask,
-                                               const std::map<VkPipelineStageFlags2KHR, VkPipelineStageFlags2KHR> &map) {
-    VkPipelineStageFlags2KHR unscanned = stage_mask;
+                                               const std::array<VkPipelineStageFlags2KHR, 64> &related_by_stage) {
     VkPipelineStageFlags2KHR related = 0;
-    for (const auto &entry : map) {
-        const auto &stage = entry.first;
-        if (stage & unscanned) {
-            related = related | entry.second;
-            unscanned = unscanned & ~stage;
-            if (!unscanned) break;
-        }
+    for (VkPipelineStageFlags2KHR stage_bits = stage_mask; stage_bits; stage_bits &= stage_bits - 1) {
+        related |= related_by_stage[LeastSignificantBit(stage_bits)];
     }
     return related;
 }
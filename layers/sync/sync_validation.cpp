@@ -166,14 +166,11 @@ static const char *string_SyncHazard(SyncHazard hazard) {
 
 static const SyncStageAccessInfoType *SyncStageAccessInfoFromMask(SyncStageAccessFlags flags) {
     // Return the info for the first bit found
-    const SyncStageAccessInfoType *info = nullptr;
-    for (size_t i = 0; i < flags.size(); i++) {
-        if (flags.test(i)) {
-            info = &syncStageAccessInfoByStageAccessIndex()[i];
-            break;
-        }
+    const int index = flags.LeastSignificantBit();
+    if (index < 0 || static_cast<size_t>(index) >= syncStageAccessInfoByStageAccessIndex().size()) {
+        return nullptr;
     }
-    return info;
+    return &syncStageAccessInfoByStageAccessIndex()[index];
 }
 
 static std::string string_SyncStageAccessFlags(const SyncStageAccessFlags &flags, const char *sep = "|") {
@@ -1588,15 +1585,12 @@ HazardResult AccessContext::DetectImageBarrierHazard(const SyncImageMemoryBarrie
                                     image_barrier.barrier.src_access_scope, image_barrier.range, kDetectAll);
 }
 
-template <typename Flags, typename Map>
-SyncStageAccessFlags AccessScopeImpl(Flags flag_mask, const Map &map) {
+// The tables are indexed by bit position, so only the set bits of the mask are visited
+template <typename Flags, typename Table>
+SyncStageAccessFlags AccessScopeImpl(Flags flag_mask, const Table &table) {
     SyncStageAccessFlags scope = 0;
-    for (const auto &bit_scope : map) {
-        if (flag_mask < bit_scope.first) break;
-
-        if (flag_mask & bit_scope.first) {
-            scope |= bit_scope.second;
-        }
+    for (Flags bits = flag_mask; bits; bits &= bits - 1) {
+        scope |= table[LeastSignificantBit(bits)];
     }
     return scope;
 }
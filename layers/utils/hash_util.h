@@ -30,6 +30,22 @@
 // Hash and equality utilities for supporting hashing containers (e.g. unordered_set, unordered_map)
 namespace hash_util {
 
+// Hash of a null terminated string used by the code generated perfect hash tables (FNV-1a with the murmur3 finalizer).
+// The tables are built with perfectHashString() in scripts/generators/generator_utils.py, both must be kept in sync
+constexpr uint32_t PerfectHashString(uint32_t seed, const char *string) {
+    uint32_t hash = 2166136261u ^ seed;
+    for (; *string != '\0'; ++string) {
+        hash ^= static_cast<uint8_t>(*string);
+        hash *= 16777619u;
+    }
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return hash;
+}
+
 // True iff both pointers are null or both are non-null
 template <typename T>
 bool similar_for_nullity(const T *const lhs, const T *const rhs) {
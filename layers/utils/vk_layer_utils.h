@@ -217,6 +217,28 @@ constexpr T Align(T x, T p2) {
 // Returns the 0-based index of the LSB. An input mask of 0 yields -1
 static inline int LeastSignificantBit(uint32_t mask) { return u_ffs(static_cast<int>(mask)) - 1; }
 
+// LeastSignificantBit(uint64_t) for compilers without a 64-bit bit scan intrinsic, built on the 32-bit version
+static inline int LeastSignificantBitPortable(uint64_t mask) {
+    const uint32_t low = static_cast<uint32_t>(mask);
+    if (low) {
+        return LeastSignificantBit(low);
+    }
+    const uint32_t high = static_cast<uint32_t>(mask >> 32);
+    return high ? LeastSignificantBit(high) + 32 : -1;
+}
+
+// 64-bit version for VkFlags64 masks (ex. VkPipelineStageFlags2). An input mask of 0 yields -1
+static inline int LeastSignificantBit(uint64_t mask) {
+#if defined __GNUC__
+    return mask ? __builtin_ctzll(mask) : -1;
+#elif defined _MSC_VER && (defined _M_X64 || defined _M_ARM64)
+    unsigned long bit_pos;
+    return _BitScanForward64(&bit_pos, mask) ? int(bit_pos) : -1;
+#else
+    return LeastSignificantBitPortable(mask);
+#endif
+}
+
 // Compute a binomial coefficient
 template <typename T>
 constexpr T binom(T n, T k) {
@@ -29,6 +29,7 @@
 #include "chassis.h"
 #include "layer_options.h"
 #include "layer_chassis_dispatch.h"
+#include "utils/hash_util.h"
 
 small_unordered_map<void*, ValidationObject*, 2> layer_data_map;
 
@@ -147,11 +148,13 @@ typedef enum ApiFunctionType {
 } ApiFunctionType;
 
 typedef struct {
+    const char* name;
     ApiFunctionType function_type;
     void* funcptr;
 } function_data;
 
-extern const vvl::unordered_map<std::string, function_data> name_to_funcptr_map;
+// Returns nullptr if the function is not intercepted by the layer
+static const function_data* GetFunctionData(const char* funcName);
 
 // Manually written functions
 
@@ -252,12 +255,12 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
     if (!ApiParentExtensionEnabled(funcName, &layer_data->device_extensions)) {
         return nullptr;
     }
-    const auto &item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        if (item->second.function_type != kFuncTypeDev) {
+    const auto *item = GetFunctionData(funcName);
+    if (item) {
+        if (item->function_type != kFuncTypeDev) {
             return nullptr;
         } else {
-            return reinterpret_cast<PFN_vkVoidFunction>(item->second.funcptr);
+            return reinterpret_cast<PFN_vkVoidFunction>(item->funcptr);
         }
     }
     auto &table = layer_data->device_dispatch_table;
@@ -266,9 +269,9 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance, const char *funcName) {
-    const auto &item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second.funcptr);
+    const auto *item = GetFunctionData(funcName);
+    if (item) {
+        return reinterpret_cast<PFN_vkVoidFunction>(item->funcptr);
     }
     auto layer_data = GetLayerDataPtr(get_dispatch_key(instance), layer_data_map);
     auto &table = layer_data->instance_dispatch_table;
@@ -277,12 +280,12 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetPhysicalDeviceProcAddr(VkInstance instance, const char *funcName) {
-    const auto &item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        if (item->second.function_type != kFuncTypePdev) {
+    const auto *item = GetFunctionData(funcName);
+    if (item) {
+        if (item->function_type != kFuncTypePdev) {
             return nullptr;
         } else {
-            return reinterpret_cast<PFN_vkVoidFunction>(item->second.funcptr);
+            return reinterpret_cast<PFN_vkVoidFunction>(item->funcptr);
         }
     }
     auto layer_data = GetLayerDataPtr(get_dispatch_key(instance), layer_data_map);
@@ -15450,753 +15453,875 @@ VKAPI_ATTR void VKAPI_CALL CmdDrawMeshTasksIndirectCountEXT(
     }
 }
 
-// Map of intercepted ApiName to its associated function data
+// Minimal perfect hash of intercepted ApiName to its associated function data
+static const uint32_t kFunctionDataSeeds[160] = {
+    14, 6, 73, 48, 203, 161, 148, 18, 86, 1, 1, 244, 7, 11, 2, 1,
+    104, 22, 2, 99, 25, 7, 4, 48, 32, 9, 1, 52, 2, 58, 35, 176,
+    60, 134, 30, 1, 6, 1, 780, 64, 70, 79, 53, 70, 377, 1, 229, 353,
+    36, 7, 8, 552, 1, 5, 88, 89, 269, 57, 2, 80, 3, 351, 16, 497,
+    165, 5, 10, 13, 1, 256, 403, 84, 3, 256, 418, 41, 18, 0, 21, 3,
+    41, 68, 723, 15, 8, 284, 164, 17, 1, 3, 545, 25, 51, 114, 1, 10,
+    6, 17, 471, 930, 2285, 0, 672, 1, 0, 39, 234, 65, 23, 4, 440, 216,
+    572, 3, 1044, 43, 209, 381, 18, 481, 52, 2, 1223, 2, 519, 78, 2, 9,
+    94, 47, 136, 2, 0, 7, 9, 20, 44, 15, 29, 272, 57, 6, 244, 8,
+    9, 1, 170, 30, 399, 12, 95, 112, 2371, 94, 2604, 8, 614, 999, 260, 291,
+};
+
 #ifdef _MSC_VER
 #pragma warning( suppress: 6262 ) // VS analysis: this uses more than 16 kiB, which is fine here at global scope
 #endif
-const vvl::unordered_map<std::string, function_data> name_to_funcptr_map = {
-    {"vk_layerGetPhysicalDeviceProcAddr", {kFuncTypeInst, (void*)GetPhysicalDeviceProcAddr}},
-    {"vkCreateInstance", {kFuncTypeInst, (void*)CreateInstance}},
-    {"vkDestroyInstance", {kFuncTypeInst, (void*)DestroyInstance}},
-    {"vkEnumeratePhysicalDevices", {kFuncTypeInst, (void*)EnumeratePhysicalDevices}},
-    {"vkGetPhysicalDeviceFeatures", {kFuncTypePdev, (void*)GetPhysicalDeviceFeatures}},
-    {"vkGetPhysicalDeviceFormatProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceFormatProperties}},
-    {"vkGetPhysicalDeviceImageFormatProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceImageFormatProperties}},
-    {"vkGetPhysicalDeviceProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceProperties}},
-    {"vkGetPhysicalDeviceQueueFamilyProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyProperties}},
-    {"vkGetPhysicalDeviceMemoryProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceMemoryProperties}},
-    {"vkGetInstanceProcAddr", {kFuncTypeInst, (void*)GetInstanceProcAddr}},
-    {"vkGetDeviceProcAddr", {kFuncTypeDev, (void*)GetDeviceProcAddr}},
-    {"vkCreateDevice", {kFuncTypePdev, (void*)CreateDevice}},
-    {"vkDestroyDevice", {kFuncTypeDev, (void*)DestroyDevice}},
-    {"vkEnumerateInstanceExtensionProperties", {kFuncTypeInst, (void*)EnumerateInstanceExtensionProperties}},
-    {"vkEnumerateDeviceExtensionProperties", {kFuncTypePdev, (void*)EnumerateDeviceExtensionProperties}},
-    {"vkEnumerateInstanceLayerProperties", {kFuncTypeInst, (void*)EnumerateInstanceLayerProperties}},
-    {"vkEnumerateDeviceLayerProperties", {kFuncTypePdev, (void*)EnumerateDeviceLayerProperties}},
-    {"vkGetDeviceQueue", {kFuncTypeDev, (void*)GetDeviceQueue}},
-    {"vkQueueSubmit", {kFuncTypeDev, (void*)QueueSubmit}},
-    {"vkQueueWaitIdle", {kFuncTypeDev, (void*)QueueWaitIdle}},
-    {"vkDeviceWaitIdle", {kFuncTypeDev, (void*)DeviceWaitIdle}},
-    {"vkAllocateMemory", {kFuncTypeDev, (void*)AllocateMemory}},
-    {"vkFreeMemory", {kFuncTypeDev, (void*)FreeMemory}},
-    {"vkMapMemory", {kFuncTypeDev, (void*)MapMemory}},
-    {"vkUnmapMemory", {kFuncTypeDev, (void*)UnmapMemory}},
-    {"vkFlushMappedMemoryRanges", {kFuncTypeDev, (void*)FlushMappedMemoryRanges}},
-    {"vkInvalidateMappedMemoryRanges", {kFuncTypeDev, (void*)InvalidateMappedMemoryRanges}},
-    {"vkGetDeviceMemoryCommitment", {kFuncTypeDev, (void*)GetDeviceMemoryCommitment}},
-    {"vkBindBufferMemory", {kFuncTypeDev, (void*)BindBufferMemory}},
-    {"vkBindImageMemory", {kFuncTypeDev, (void*)BindImageMemory}},
-    {"vkGetBufferMemoryRequirements", {kFuncTypeDev, (void*)GetBufferMemoryRequirements}},
-    {"vkGetImageMemoryRequirements", {kFuncTypeDev, (void*)GetImageMemoryRequirements}},
-    {"vkGetImageSparseMemoryRequirements", {kFuncTypeDev, (void*)GetImageSparseMemoryRequirements}},
-    {"vkGetPhysicalDeviceSparseImageFormatProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceSparseImageFormatProperties}},
-    {"vkQueueBindSparse", {kFuncTypeDev, (void*)QueueBindSparse}},
-    {"vkCreateFence", {kFuncTypeDev, (void*)CreateFence}},
-    {"vkDestroyFence", {kFuncTypeDev, (void*)DestroyFence}},
-    {"vkResetFences", {kFuncTypeDev, (void*)ResetFences}},
-    {"vkGetFenceStatus", {kFuncTypeDev, (void*)GetFenceStatus}},
-    {"vkWaitForFences", {kFuncTypeDev, (void*)WaitForFences}},
-    {"vkCreateSemaphore", {kFuncTypeDev, (void*)CreateSemaphore}},
-    {"vkDestroySemaphore", {kFuncTypeDev, (void*)DestroySemaphore}},
-    {"vkCreateEvent", {kFuncTypeDev, (void*)CreateEvent}},
-    {"vkDestroyEvent", {kFuncTypeDev, (void*)DestroyEvent}},
-    {"vkGetEventStatus", {kFuncTypeDev, (void*)GetEventStatus}},
-    {"vkSetEvent", {kFuncTypeDev, (void*)SetEvent}},
-    {"vkResetEvent", {kFuncTypeDev, (void*)ResetEvent}},
-    {"vkCreateQueryPool", {kFuncTypeDev, (void*)CreateQueryPool}},
-    {"vkDestroyQueryPool", {kFuncTypeDev, (void*)DestroyQueryPool}},
-    {"vkGetQueryPoolResults", {kFuncTypeDev, (void*)GetQueryPoolResults}},
-    {"vkCreateBuffer", {kFuncTypeDev, (void*)CreateBuffer}},
-    {"vkDestroyBuffer", {kFuncTypeDev, (void*)DestroyBuffer}},
-    {"vkCreateBufferView", {kFuncTypeDev, (void*)CreateBufferView}},
-    {"vkDestroyBufferView", {kFuncTypeDev, (void*)DestroyBufferView}},
-    {"vkCreateImage", {kFuncTypeDev, (void*)CreateImage}},
-    {"vkDestroyImage", {kFuncTypeDev, (void*)DestroyImage}},
-    {"vkGetImageSubresourceLayout", {kFuncTypeDev, (void*)GetImageSubresourceLayout}},
-    {"vkCreateImageView", {kFuncTypeDev, (void*)CreateImageView}},
-    {"vkDestroyImageView", {kFuncTypeDev, (void*)DestroyImageView}},
-    {"vkCreateShaderModule", {kFuncTypeDev, (void*)CreateShaderModule}},
-    {"vkDestroyShaderModule", {kFuncTypeDev, (void*)DestroyShaderModule}},
-    {"vkCreatePipelineCache", {kFuncTypeDev, (void*)CreatePipelineCache}},
-    {"vkDestroyPipelineCache", {kFuncTypeDev, (void*)DestroyPipelineCache}},
-    {"vkGetPipelineCacheData", {kFuncTypeDev, (void*)GetPipelineCacheData}},
-    {"vkMergePipelineCaches", {kFuncTypeDev, (void*)MergePipelineCaches}},
-    {"vkCreateGraphicsPipelines", {kFuncTypeDev, (void*)CreateGraphicsPipelines}},
-    {"vkCreateComputePipelines", {kFuncTypeDev, (void*)CreateComputePipelines}},
-    {"vkDestroyPipeline", {kFuncTypeDev, (void*)DestroyPipeline}},
-    {"vkCreatePipelineLayout", {kFuncTypeDev, (void*)CreatePipelineLayout}},
-    {"vkDestroyPipelineLayout", {kFuncTypeDev, (void*)DestroyPipelineLayout}},
-    {"vkCreateSampler", {kFuncTypeDev, (void*)CreateSampler}},
-    {"vkDestroySampler", {kFuncTypeDev, (void*)DestroySampler}},
-    {"vkCreateDescriptorSetLayout", {kFuncTypeDev, (void*)CreateDescriptorSetLayout}},
-    {"vkDestroyDescriptorSetLayout", {kFuncTypeDev, (void*)DestroyDescriptorSetLayout}},
-    {"vkCreateDescriptorPool", {kFuncTypeDev, (void*)CreateDescriptorPool}},
-    {"vkDestroyDescriptorPool", {kFuncTypeDev, (void*)DestroyDescriptorPool}},
-    {"vkResetDescriptorPool", {kFuncTypeDev, (void*)ResetDescriptorPool}},
-    {"vkAllocateDescriptorSets", {kFuncTypeDev, (void*)AllocateDescriptorSets}},
-    {"vkFreeDescriptorSets", {kFuncTypeDev, (void*)FreeDescriptorSets}},
-    {"vkUpdateDescriptorSets", {kFuncTypeDev, (void*)UpdateDescriptorSets}},
-    {"vkCreateFramebuffer", {kFuncTypeDev, (void*)CreateFramebuffer}},
-    {"vkDestroyFramebuffer", {kFuncTypeDev, (void*)DestroyFramebuffer}},
-    {"vkCreateRenderPass", {kFuncTypeDev, (void*)CreateRenderPass}},
-    {"vkDestroyRenderPass", {kFuncTypeDev, (void*)DestroyRenderPass}},
-    {"vkGetRenderAreaGranularity", {kFuncTypeDev, (void*)GetRenderAreaGranularity}},
-    {"vkCreateCommandPool", {kFuncTypeDev, (void*)CreateCommandPool}},
-    {"vkDestroyCommandPool", {kFuncTypeDev, (void*)DestroyCommandPool}},
-    {"vkResetCommandPool", {kFuncTypeDev, (void*)ResetCommandPool}},
-    {"vkAllocateCommandBuffers", {kFuncTypeDev, (void*)AllocateCommandBuffers}},
-    {"vkFreeCommandBuffers", {kFuncTypeDev, (void*)FreeCommandBuffers}},
-    {"vkBeginCommandBuffer", {kFuncTypeDev, (void*)BeginCommandBuffer}},
-    {"vkEndCommandBuffer", {kFuncTypeDev, (void*)EndCommandBuffer}},
-    {"vkResetCommandBuffer", {kFuncTypeDev, (void*)ResetCommandBuffer}},
-    {"vkCmdBindPipeline", {kFuncTypeDev, (void*)CmdBindPipeline}},
-    {"vkCmdSetViewport", {kFuncTypeDev, (void*)CmdSetViewport}},
-    {"vkCmdSetScissor", {kFuncTypeDev, (void*)CmdSetScissor}},
-    {"vkCmdSetLineWidth", {kFuncTypeDev, (void*)CmdSetLineWidth}},
-    {"vkCmdSetDepthBias", {kFuncTypeDev, (void*)CmdSetDepthBias}},
-    {"vkCmdSetBlendConstants", {kFuncTypeDev, (void*)CmdSetBlendConstants}},
-    {"vkCmdSetDepthBounds", {kFuncTypeDev, (void*)CmdSetDepthBounds}},
-    {"vkCmdSetStencilCompareMask", {kFuncTypeDev, (void*)CmdSetStencilCompareMask}},
-    {"vkCmdSetStencilWriteMask", {kFuncTypeDev, (void*)CmdSetStencilWriteMask}},
-    {"vkCmdSetStencilReference", {kFuncTypeDev, (void*)CmdSetStencilReference}},
-    {"vkCmdBindDescriptorSets", {kFuncTypeDev, (void*)CmdBindDescriptorSets}},
-    {"vkCmdBindIndexBuffer", {kFuncTypeDev, (void*)CmdBindIndexBuffer}},
-    {"vkCmdBindVertexBuffers", {kFuncTypeDev, (void*)CmdBindVertexBuffers}},
-    {"vkCmdDraw", {kFuncTypeDev, (void*)CmdDraw}},
-    {"vkCmdDrawIndexed", {kFuncTypeDev, (void*)CmdDrawIndexed}},
-    {"vkCmdDrawIndirect", {kFuncTypeDev, (void*)CmdDrawIndirect}},
-    {"vkCmdDrawIndexedIndirect", {kFuncTypeDev, (void*)CmdDrawIndexedIndirect}},
-    {"vkCmdDispatch", {kFuncTypeDev, (void*)CmdDispatch}},
-    {"vkCmdDispatchIndirect", {kFuncTypeDev, (void*)CmdDispatchIndirect}},
-    {"vkCmdCopyBuffer", {kFuncTypeDev, (void*)CmdCopyBuffer}},
-    {"vkCmdCopyImage", {kFuncTypeDev, (void*)CmdCopyImage}},
-    {"vkCmdBlitImage", {kFuncTypeDev, (void*)CmdBlitImage}},
-    {"vkCmdCopyBufferToImage", {kFuncTypeDev, (void*)CmdCopyBufferToImage}},
-    {"vkCmdCopyImageToBuffer", {kFuncTypeDev, (void*)CmdCopyImageToBuffer}},
-    {"vkCmdUpdateBuffer", {kFuncTypeDev, (void*)CmdUpdateBuffer}},
-    {"vkCmdFillBuffer", {kFuncTypeDev, (void*)CmdFillBuffer}},
-    {"vkCmdClearColorImage", {kFuncTypeDev, (void*)CmdClearColorImage}},
-    {"vkCmdClearDepthStencilImage", {kFuncTypeDev, (void*)CmdClearDepthStencilImage}},
-    {"vkCmdClearAttachments", {kFuncTypeDev, (void*)CmdClearAttachments}},
-    {"vkCmdResolveImage", {kFuncTypeDev, (void*)CmdResolveImage}},
-    {"vkCmdSetEvent", {kFuncTypeDev, (void*)CmdSetEvent}},
-    {"vkCmdResetEvent", {kFuncTypeDev, (void*)CmdResetEvent}},
-    {"vkCmdWaitEvents", {kFuncTypeDev, (void*)CmdWaitEvents}},
-    {"vkCmdPipelineBarrier", {kFuncTypeDev, (void*)CmdPipelineBarrier}},
-    {"vkCmdBeginQuery", {kFuncTypeDev, (void*)CmdBeginQuery}},
-    {"vkCmdEndQuery", {kFuncTypeDev, (void*)CmdEndQuery}},
-    {"vkCmdResetQueryPool", {kFuncTypeDev, (void*)CmdResetQueryPool}},
-    {"vkCmdWriteTimestamp", {kFuncTypeDev, (void*)CmdWriteTimestamp}},
-    {"vkCmdCopyQueryPoolResults", {kFuncTypeDev, (void*)CmdCopyQueryPoolResults}},
-    {"vkCmdPushConstants", {kFuncTypeDev, (void*)CmdPushConstants}},
-    {"vkCmdBeginRenderPass", {kFuncTypeDev, (void*)CmdBeginRenderPass}},
-    {"vkCmdNextSubpass", {kFuncTypeDev, (void*)CmdNextSubpass}},
-    {"vkCmdEndRenderPass", {kFuncTypeDev, (void*)CmdEndRenderPass}},
-    {"vkCmdExecuteCommands", {kFuncTypeDev, (void*)CmdExecuteCommands}},
-    {"vkBindBufferMemory2", {kFuncTypeDev, (void*)BindBufferMemory2}},
-    {"vkBindImageMemory2", {kFuncTypeDev, (void*)BindImageMemory2}},
-    {"vkGetDeviceGroupPeerMemoryFeatures", {kFuncTypeDev, (void*)GetDeviceGroupPeerMemoryFeatures}},
-    {"vkCmdSetDeviceMask", {kFuncTypeDev, (void*)CmdSetDeviceMask}},
-    {"vkCmdDispatchBase", {kFuncTypeDev, (void*)CmdDispatchBase}},
-    {"vkEnumeratePhysicalDeviceGroups", {kFuncTypeInst, (void*)EnumeratePhysicalDeviceGroups}},
-    {"vkGetImageMemoryRequirements2", {kFuncTypeDev, (void*)GetImageMemoryRequirements2}},
-    {"vkGetBufferMemoryRequirements2", {kFuncTypeDev, (void*)GetBufferMemoryRequirements2}},
-    {"vkGetImageSparseMemoryRequirements2", {kFuncTypeDev, (void*)GetImageSparseMemoryRequirements2}},
-    {"vkGetPhysicalDeviceFeatures2", {kFuncTypePdev, (void*)GetPhysicalDeviceFeatures2}},
-    {"vkGetPhysicalDeviceProperties2", {kFuncTypePdev, (void*)GetPhysicalDeviceProperties2}},
-    {"vkGetPhysicalDeviceFormatProperties2", {kFuncTypePdev, (void*)GetPhysicalDeviceFormatProperties2}},
-    {"vkGetPhysicalDeviceImageFormatProperties2", {kFuncTypePdev, (void*)GetPhysicalDeviceImageFormatProperties2}},
-    {"vkGetPhysicalDeviceQueueFamilyProperties2", {kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyProperties2}},
-    {"vkGetPhysicalDeviceMemoryProperties2", {kFuncTypePdev, (void*)GetPhysicalDeviceMemoryProperties2}},
-    {"vkGetPhysicalDeviceSparseImageFormatProperties2", {kFuncTypePdev, (void*)GetPhysicalDeviceSparseImageFormatProperties2}},
-    {"vkTrimCommandPool", {kFuncTypeDev, (void*)TrimCommandPool}},
-    {"vkGetDeviceQueue2", {kFuncTypeDev, (void*)GetDeviceQueue2}},
-    {"vkCreateSamplerYcbcrConversion", {kFuncTypeDev, (void*)CreateSamplerYcbcrConversion}},
-    {"vkDestroySamplerYcbcrConversion", {kFuncTypeDev, (void*)DestroySamplerYcbcrConversion}},
-    {"vkCreateDescriptorUpdateTemplate", {kFuncTypeDev, (void*)CreateDescriptorUpdateTemplate}},
-    {"vkDestroyDescriptorUpdateTemplate", {kFuncTypeDev, (void*)DestroyDescriptorUpdateTemplate}},
-    {"vkUpdateDescriptorSetWithTemplate", {kFuncTypeDev, (void*)UpdateDescriptorSetWithTemplate}},
-    {"vkGetPhysicalDeviceExternalBufferProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalBufferProperties}},
-    {"vkGetPhysicalDeviceExternalFenceProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalFenceProperties}},
-    {"vkGetPhysicalDeviceExternalSemaphoreProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalSemaphoreProperties}},
-    {"vkGetDescriptorSetLayoutSupport", {kFuncTypeDev, (void*)GetDescriptorSetLayoutSupport}},
-    {"vkCmdDrawIndirectCount", {kFuncTypeDev, (void*)CmdDrawIndirectCount}},
-    {"vkCmdDrawIndexedIndirectCount", {kFuncTypeDev, (void*)CmdDrawIndexedIndirectCount}},
-    {"vkCreateRenderPass2", {kFuncTypeDev, (void*)CreateRenderPass2}},
-    {"vkCmdBeginRenderPass2", {kFuncTypeDev, (void*)CmdBeginRenderPass2}},
-    {"vkCmdNextSubpass2", {kFuncTypeDev, (void*)CmdNextSubpass2}},
-    {"vkCmdEndRenderPass2", {kFuncTypeDev, (void*)CmdEndRenderPass2}},
-    {"vkResetQueryPool", {kFuncTypeDev, (void*)ResetQueryPool}},
-    {"vkGetSemaphoreCounterValue", {kFuncTypeDev, (void*)GetSemaphoreCounterValue}},
-    {"vkWaitSemaphores", {kFuncTypeDev, (void*)WaitSemaphores}},
-    {"vkSignalSemaphore", {kFuncTypeDev, (void*)SignalSemaphore}},
-    {"vkGetBufferDeviceAddress", {kFuncTypeDev, (void*)GetBufferDeviceAddress}},
-    {"vkGetBufferOpaqueCaptureAddress", {kFuncTypeDev, (void*)GetBufferOpaqueCaptureAddress}},
-    {"vkGetDeviceMemoryOpaqueCaptureAddress", {kFuncTypeDev, (void*)GetDeviceMemoryOpaqueCaptureAddress}},
-    {"vkGetPhysicalDeviceToolProperties", {kFuncTypePdev, (void*)GetPhysicalDeviceToolProperties}},
-    {"vkCreatePrivateDataSlot", {kFuncTypeDev, (void*)CreatePrivateDataSlot}},
-    {"vkDestroyPrivateDataSlot", {kFuncTypeDev, (void*)DestroyPrivateDataSlot}},
-    {"vkSetPrivateData", {kFuncTypeDev, (void*)SetPrivateData}},
-    {"vkGetPrivateData", {kFuncTypeDev, (void*)GetPrivateData}},
-    {"vkCmdSetEvent2", {kFuncTypeDev, (void*)CmdSetEvent2}},
-    {"vkCmdResetEvent2", {kFuncTypeDev, (void*)CmdResetEvent2}},
-    {"vkCmdWaitEvents2", {kFuncTypeDev, (void*)CmdWaitEvents2}},
-    {"vkCmdPipelineBarrier2", {kFuncTypeDev, (void*)CmdPipelineBarrier2}},
-    {"vkCmdWriteTimestamp2", {kFuncTypeDev, (void*)CmdWriteTimestamp2}},
-    {"vkQueueSubmit2", {kFuncTypeDev, (void*)QueueSubmit2}},
-    {"vkCmdCopyBuffer2", {kFuncTypeDev, (void*)CmdCopyBuffer2}},
-    {"vkCmdCopyImage2", {kFuncTypeDev, (void*)CmdCopyImage2}},
-    {"vkCmdCopyBufferToImage2", {kFuncTypeDev, (void*)CmdCopyBufferToImage2}},
-    {"vkCmdCopyImageToBuffer2", {kFuncTypeDev, (void*)CmdCopyImageToBuffer2}},
-    {"vkCmdBlitImage2", {kFuncTypeDev, (void*)CmdBlitImage2}},
-    {"vkCmdResolveImage2", {kFuncTypeDev, (void*)CmdResolveImage2}},
-    {"vkCmdBeginRendering", {kFuncTypeDev, (void*)CmdBeginRendering}},
-    {"vkCmdEndRendering", {kFuncTypeDev, (void*)CmdEndRendering}},
-    {"vkCmdSetCullMode", {kFuncTypeDev, (void*)CmdSetCullMode}},
-    {"vkCmdSetFrontFace", {kFuncTypeDev, (void*)CmdSetFrontFace}},
-    {"vkCmdSetPrimitiveTopology", {kFuncTypeDev, (void*)CmdSetPrimitiveTopology}},
-    {"vkCmdSetViewportWithCount", {kFuncTypeDev, (void*)CmdSetViewportWithCount}},
-    {"vkCmdSetScissorWithCount", {kFuncTypeDev, (void*)CmdSetScissorWithCount}},
-    {"vkCmdBindVertexBuffers2", {kFuncTypeDev, (void*)CmdBindVertexBuffers2}},
-    {"vkCmdSetDepthTestEnable", {kFuncTypeDev, (void*)CmdSetDepthTestEnable}},
-    {"vkCmdSetDepthWriteEnable", {kFuncTypeDev, (void*)CmdSetDepthWriteEnable}},
-    {"vkCmdSetDepthCompareOp", {kFuncTypeDev, (void*)CmdSetDepthCompareOp}},
-    {"vkCmdSetDepthBoundsTestEnable", {kFuncTypeDev, (void*)CmdSetDepthBoundsTestEnable}},
-    {"vkCmdSetStencilTestEnable", {kFuncTypeDev, (void*)CmdSetStencilTestEnable}},
-    {"vkCmdSetStencilOp", {kFuncTypeDev, (void*)CmdSetStencilOp}},
-    {"vkCmdSetRasterizerDiscardEnable", {kFuncTypeDev, (void*)CmdSetRasterizerDiscardEnable}},
-    {"vkCmdSetDepthBiasEnable", {kFuncTypeDev, (void*)CmdSetDepthBiasEnable}},
-    {"vkCmdSetPrimitiveRestartEnable", {kFuncTypeDev, (void*)CmdSetPrimitiveRestartEnable}},
-    {"vkGetDeviceBufferMemoryRequirements", {kFuncTypeDev, (void*)GetDeviceBufferMemoryRequirements}},
-    {"vkGetDeviceImageMemoryRequirements", {kFuncTypeDev, (void*)GetDeviceImageMemoryRequirements}},
-    {"vkGetDeviceImageSparseMemoryRequirements", {kFuncTypeDev, (void*)GetDeviceImageSparseMemoryRequirements}},
-    {"vkDestroySurfaceKHR", {kFuncTypeInst, (void*)DestroySurfaceKHR}},
-    {"vkGetPhysicalDeviceSurfaceSupportKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceSupportKHR}},
-    {"vkGetPhysicalDeviceSurfaceCapabilitiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceCapabilitiesKHR}},
-    {"vkGetPhysicalDeviceSurfaceFormatsKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceFormatsKHR}},
-    {"vkGetPhysicalDeviceSurfacePresentModesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfacePresentModesKHR}},
-    {"vkCreateSwapchainKHR", {kFuncTypeDev, (void*)CreateSwapchainKHR}},
-    {"vkDestroySwapchainKHR", {kFuncTypeDev, (void*)DestroySwapchainKHR}},
-    {"vkGetSwapchainImagesKHR", {kFuncTypeDev, (void*)GetSwapchainImagesKHR}},
-    {"vkAcquireNextImageKHR", {kFuncTypeDev, (void*)AcquireNextImageKHR}},
-    {"vkQueuePresentKHR", {kFuncTypeDev, (void*)QueuePresentKHR}},
-    {"vkGetDeviceGroupPresentCapabilitiesKHR", {kFuncTypeDev, (void*)GetDeviceGroupPresentCapabilitiesKHR}},
-    {"vkGetDeviceGroupSurfacePresentModesKHR", {kFuncTypeDev, (void*)GetDeviceGroupSurfacePresentModesKHR}},
-    {"vkGetPhysicalDevicePresentRectanglesKHR", {kFuncTypePdev, (void*)GetPhysicalDevicePresentRectanglesKHR}},
-    {"vkAcquireNextImage2KHR", {kFuncTypeDev, (void*)AcquireNextImage2KHR}},
-    {"vkGetPhysicalDeviceDisplayPropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceDisplayPropertiesKHR}},
-    {"vkGetPhysicalDeviceDisplayPlanePropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceDisplayPlanePropertiesKHR}},
-    {"vkGetDisplayPlaneSupportedDisplaysKHR", {kFuncTypePdev, (void*)GetDisplayPlaneSupportedDisplaysKHR}},
-    {"vkGetDisplayModePropertiesKHR", {kFuncTypePdev, (void*)GetDisplayModePropertiesKHR}},
-    {"vkCreateDisplayModeKHR", {kFuncTypePdev, (void*)CreateDisplayModeKHR}},
-    {"vkGetDisplayPlaneCapabilitiesKHR", {kFuncTypePdev, (void*)GetDisplayPlaneCapabilitiesKHR}},
-    {"vkCreateDisplayPlaneSurfaceKHR", {kFuncTypeInst, (void*)CreateDisplayPlaneSurfaceKHR}},
-    {"vkCreateSharedSwapchainsKHR", {kFuncTypeDev, (void*)CreateSharedSwapchainsKHR}},
-#ifdef VK_USE_PLATFORM_XLIB_KHR
-    {"vkCreateXlibSurfaceKHR", {kFuncTypeInst, (void*)CreateXlibSurfaceKHR}},
-#endif
-#ifdef VK_USE_PLATFORM_XLIB_KHR
-    {"vkGetPhysicalDeviceXlibPresentationSupportKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceXlibPresentationSupportKHR}},
-#endif
-#ifdef VK_USE_PLATFORM_XCB_KHR
-    {"vkCreateXcbSurfaceKHR", {kFuncTypeInst, (void*)CreateXcbSurfaceKHR}},
+static const function_data kFunctionData[640] = {
+    {"vkCreateDisplayModeKHR", kFuncTypePdev, (void*)CreateDisplayModeKHR},
+    {"vkCreateShaderModule", kFuncTypeDev, (void*)CreateShaderModule},
+    {"vkCmdPipelineBarrier2KHR", kFuncTypeDev, (void*)CmdPipelineBarrier2KHR},
+    {"vkSetHdrMetadataEXT", kFuncTypeDev, (void*)SetHdrMetadataEXT},
+    {"vkCmdBindInvocationMaskHUAWEI", kFuncTypeDev, (void*)CmdBindInvocationMaskHUAWEI},
+#ifdef VK_USE_PLATFORM_FUCHSIA
+    {"vkGetMemoryZirconHandlePropertiesFUCHSIA", kFuncTypeDev, (void*)GetMemoryZirconHandlePropertiesFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_XCB_KHR
-    {"vkGetPhysicalDeviceXcbPresentationSupportKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceXcbPresentationSupportKHR}},
+    {"vkUnmapMemory", kFuncTypeDev, (void*)UnmapMemory},
+    {"vkQueueEndDebugUtilsLabelEXT", kFuncTypeDev, (void*)QueueEndDebugUtilsLabelEXT},
+    {"vkCmdSetStencilTestEnableEXT", kFuncTypeDev, (void*)CmdSetStencilTestEnableEXT},
+    {"vkCmdCopyImageToBuffer", kFuncTypeDev, (void*)CmdCopyImageToBuffer},
+    {"vkQueueSubmit2", kFuncTypeDev, (void*)QueueSubmit2},
+    {"vkCmdDrawIndexedIndirect", kFuncTypeDev, (void*)CmdDrawIndexedIndirect},
+    {"vkCmdCopyImageToBuffer2KHR", kFuncTypeDev, (void*)CmdCopyImageToBuffer2KHR},
+    {"vkDestroyShaderModule", kFuncTypeDev, (void*)DestroyShaderModule},
+    {"vkCmdSetScissor", kFuncTypeDev, (void*)CmdSetScissor},
+    {"vkFreeDescriptorSets", kFuncTypeDev, (void*)FreeDescriptorSets},
+    {"vkWaitForFences", kFuncTypeDev, (void*)WaitForFences},
+    {"vkDestroyAccelerationStructureNV", kFuncTypeDev, (void*)DestroyAccelerationStructureNV},
+    {"vkQueueBeginDebugUtilsLabelEXT", kFuncTypeDev, (void*)QueueBeginDebugUtilsLabelEXT},
+    {"vkCmdResetEvent2KHR", kFuncTypeDev, (void*)CmdResetEvent2KHR},
+    {"vkGetAccelerationStructureMemoryRequirementsNV", kFuncTypeDev, (void*)GetAccelerationStructureMemoryRequirementsNV},
+    {"vkCmdSetDepthBiasEnableEXT", kFuncTypeDev, (void*)CmdSetDepthBiasEnableEXT},
+    {"vkCreatePipelineCache", kFuncTypeDev, (void*)CreatePipelineCache},
+    {"vkGetQueryPoolResults", kFuncTypeDev, (void*)GetQueryPoolResults},
+    {"vkDestroyFramebuffer", kFuncTypeDev, (void*)DestroyFramebuffer},
+    {"vkGetBufferMemoryRequirements2", kFuncTypeDev, (void*)GetBufferMemoryRequirements2},
+    {"vkCreateRenderPass2", kFuncTypeDev, (void*)CreateRenderPass2},
+    {"vkDestroyOpticalFlowSessionNV", kFuncTypeDev, (void*)DestroyOpticalFlowSessionNV},
+    {"vkGetDeferredOperationMaxConcurrencyKHR", kFuncTypeDev, (void*)GetDeferredOperationMaxConcurrencyKHR},
+    {"vkGetDeviceMemoryOpaqueCaptureAddressKHR", kFuncTypeDev, (void*)GetDeviceMemoryOpaqueCaptureAddressKHR},
+    {"vkCreateBufferView", kFuncTypeDev, (void*)CreateBufferView},
+    {"vkCmdDecompressMemoryNV", kFuncTypeDev, (void*)CmdDecompressMemoryNV},
+#ifdef VK_USE_PLATFORM_WIN32_KHR
+    {"vkGetPhysicalDeviceWin32PresentationSupportKHR", kFuncTypePdev, (void*)GetPhysicalDeviceWin32PresentationSupportKHR},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_WAYLAND_KHR
-    {"vkCreateWaylandSurfaceKHR", {kFuncTypeInst, (void*)CreateWaylandSurfaceKHR}},
+    {"vkGetDeviceImageSparseMemoryRequirementsKHR", kFuncTypeDev, (void*)GetDeviceImageSparseMemoryRequirementsKHR},
+    {"vkCmdExecuteCommands", kFuncTypeDev, (void*)CmdExecuteCommands},
+    {"vkCmdWriteTimestamp2KHR", kFuncTypeDev, (void*)CmdWriteTimestamp2KHR},
+    {"vkCmdDispatchBaseKHR", kFuncTypeDev, (void*)CmdDispatchBaseKHR},
+    {"vkDestroyDeferredOperationKHR", kFuncTypeDev, (void*)DestroyDeferredOperationKHR},
+    {"vkCmdSetDepthBoundsTestEnableEXT", kFuncTypeDev, (void*)CmdSetDepthBoundsTestEnableEXT},
+    {"vkGetMemoryFdKHR", kFuncTypeDev, (void*)GetMemoryFdKHR},
+    {"vkCmdSetCoverageReductionModeNV", kFuncTypeDev, (void*)CmdSetCoverageReductionModeNV},
+    {"vkCreateFence", kFuncTypeDev, (void*)CreateFence},
+    {"vkCmdBeginRenderingKHR", kFuncTypeDev, (void*)CmdBeginRenderingKHR},
+    {"vkAcquireDrmDisplayEXT", kFuncTypePdev, (void*)AcquireDrmDisplayEXT},
+#ifdef VK_USE_PLATFORM_SCREEN_QNX
+    {"vkCreateScreenSurfaceQNX", kFuncTypeInst, (void*)CreateScreenSurfaceQNX},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_WAYLAND_KHR
-    {"vkGetPhysicalDeviceWaylandPresentationSupportKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceWaylandPresentationSupportKHR}},
+    {"vkCmdSetPrimitiveRestartEnable", kFuncTypeDev, (void*)CmdSetPrimitiveRestartEnable},
+    {"vkGetPhysicalDeviceFragmentShadingRatesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceFragmentShadingRatesKHR},
+    {"vkCmdResolveImage", kFuncTypeDev, (void*)CmdResolveImage},
+    {"vkGetPhysicalDeviceProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceProperties2KHR},
+    {"vkGetDeviceImageMemoryRequirementsKHR", kFuncTypeDev, (void*)GetDeviceImageMemoryRequirementsKHR},
+    {"vkGetImageSparseMemoryRequirements2KHR", kFuncTypeDev, (void*)GetImageSparseMemoryRequirements2KHR},
+    {"vkBindVideoSessionMemoryKHR", kFuncTypeDev, (void*)BindVideoSessionMemoryKHR},
+    {"vkCmdSetPrimitiveTopologyEXT", kFuncTypeDev, (void*)CmdSetPrimitiveTopologyEXT},
+    {"vkCmdSetRasterizationSamplesEXT", kFuncTypeDev, (void*)CmdSetRasterizationSamplesEXT},
+    {"vkGetBufferDeviceAddress", kFuncTypeDev, (void*)GetBufferDeviceAddress},
+    {"vkCmdSetDiscardRectangleEXT", kFuncTypeDev, (void*)CmdSetDiscardRectangleEXT},
+    {"vkCreateDevice", kFuncTypePdev, (void*)CreateDevice},
+    {"vkGetRayTracingCaptureReplayShaderGroupHandlesKHR", kFuncTypeDev, (void*)GetRayTracingCaptureReplayShaderGroupHandlesKHR},
+    {"vkGetBufferMemoryRequirements2KHR", kFuncTypeDev, (void*)GetBufferMemoryRequirements2KHR},
+    {"vkCmdCopyMicromapEXT", kFuncTypeDev, (void*)CmdCopyMicromapEXT},
+    {"vkCmdSetExclusiveScissorNV", kFuncTypeDev, (void*)CmdSetExclusiveScissorNV},
+    {"vkGetEventStatus", kFuncTypeDev, (void*)GetEventStatus},
+    {"vkGetDisplayModePropertiesKHR", kFuncTypePdev, (void*)GetDisplayModePropertiesKHR},
+    {"vkCmdSetFragmentShadingRateEnumNV", kFuncTypeDev, (void*)CmdSetFragmentShadingRateEnumNV},
+    {"vkCmdSetViewportSwizzleNV", kFuncTypeDev, (void*)CmdSetViewportSwizzleNV},
+    {"vkCopyMemoryToAccelerationStructureKHR", kFuncTypeDev, (void*)CopyMemoryToAccelerationStructureKHR},
+    {"vkGetPhysicalDeviceToolPropertiesEXT", kFuncTypePdev, (void*)GetPhysicalDeviceToolPropertiesEXT},
+    {"vkGetRefreshCycleDurationGOOGLE", kFuncTypeDev, (void*)GetRefreshCycleDurationGOOGLE},
+    {"vkCmdSetViewport", kFuncTypeDev, (void*)CmdSetViewport},
+    {"vkCmdSetDescriptorBufferOffsetsEXT", kFuncTypeDev, (void*)CmdSetDescriptorBufferOffsetsEXT},
+    {"vkGetPhysicalDeviceProperties2", kFuncTypePdev, (void*)GetPhysicalDeviceProperties2},
+    {"vkCmdSetRasterizerDiscardEnable", kFuncTypeDev, (void*)CmdSetRasterizerDiscardEnable},
+    {"vkCmdDecompressMemoryIndirectCountNV", kFuncTypeDev, (void*)CmdDecompressMemoryIndirectCountNV},
+    {"vkWriteMicromapsPropertiesEXT", kFuncTypeDev, (void*)WriteMicromapsPropertiesEXT},
+    {"vkGetInstanceProcAddr", kFuncTypeInst, (void*)GetInstanceProcAddr},
+    {"vkGetImageSubresourceLayout", kFuncTypeDev, (void*)GetImageSubresourceLayout},
+    {"vkCreateHeadlessSurfaceEXT", kFuncTypeInst, (void*)CreateHeadlessSurfaceEXT},
+    {"vkDestroySampler", kFuncTypeDev, (void*)DestroySampler},
+    {"vkGetFenceStatus", kFuncTypeDev, (void*)GetFenceStatus},
+    {"vkCmdSetRasterizationStreamEXT", kFuncTypeDev, (void*)CmdSetRasterizationStreamEXT},
+    {"vkGetPhysicalDeviceCalibrateableTimeDomainsEXT", kFuncTypePdev, (void*)GetPhysicalDeviceCalibrateableTimeDomainsEXT},
+    {"vkGetFenceFdKHR", kFuncTypeDev, (void*)GetFenceFdKHR},
+    {"vkCmdWriteTimestamp2", kFuncTypeDev, (void*)CmdWriteTimestamp2},
+    {"vkCreateVideoSessionParametersKHR", kFuncTypeDev, (void*)CreateVideoSessionParametersKHR},
+    {"vkGetSemaphoreCounterValue", kFuncTypeDev, (void*)GetSemaphoreCounterValue},
+    {"vkGetSemaphoreCounterValueKHR", kFuncTypeDev, (void*)GetSemaphoreCounterValueKHR},
+    {"vkGetDeviceQueue2", kFuncTypeDev, (void*)GetDeviceQueue2},
+    {"vkGetDeviceBufferMemoryRequirementsKHR", kFuncTypeDev, (void*)GetDeviceBufferMemoryRequirementsKHR},
+    {"vkGetSamplerOpaqueCaptureDescriptorDataEXT", kFuncTypeDev, (void*)GetSamplerOpaqueCaptureDescriptorDataEXT},
+    {"vkCmdCopyImage", kFuncTypeDev, (void*)CmdCopyImage},
+    {"vkGetPhysicalDeviceVideoFormatPropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceVideoFormatPropertiesKHR},
+    {"vkCmdSetStencilOpEXT", kFuncTypeDev, (void*)CmdSetStencilOpEXT},
+    {"vkCmdBuildMicromapsEXT", kFuncTypeDev, (void*)CmdBuildMicromapsEXT},
+    {"vkCmdSetProvokingVertexModeEXT", kFuncTypeDev, (void*)CmdSetProvokingVertexModeEXT},
+    {"vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI", kFuncTypeDev, (void*)GetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI},
+    {"vkCmdSetDepthClampEnableEXT", kFuncTypeDev, (void*)CmdSetDepthClampEnableEXT},
+    {"vkCmdSetPrimitiveTopology", kFuncTypeDev, (void*)CmdSetPrimitiveTopology},
+    {"vkDestroyFence", kFuncTypeDev, (void*)DestroyFence},
+    {"vkQueueWaitIdle", kFuncTypeDev, (void*)QueueWaitIdle},
+    {"vkTrimCommandPoolKHR", kFuncTypeDev, (void*)TrimCommandPoolKHR},
+#ifdef VK_USE_PLATFORM_DIRECTFB_EXT
+    {"vkGetPhysicalDeviceDirectFBPresentationSupportEXT", kFuncTypePdev, (void*)GetPhysicalDeviceDirectFBPresentationSupportEXT},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_ANDROID_KHR
-    {"vkCreateAndroidSurfaceKHR", {kFuncTypeInst, (void*)CreateAndroidSurfaceKHR}},
+    {"vkGetDeviceGroupPresentCapabilitiesKHR", kFuncTypeDev, (void*)GetDeviceGroupPresentCapabilitiesKHR},
+    {"vkReleaseProfilingLockKHR", kFuncTypeDev, (void*)ReleaseProfilingLockKHR},
+    {"vkGetPhysicalDeviceExternalSemaphoreProperties", kFuncTypePdev, (void*)GetPhysicalDeviceExternalSemaphoreProperties},
+    {"vkCmdEndRenderingKHR", kFuncTypeDev, (void*)CmdEndRenderingKHR},
+    {"vkGetPhysicalDeviceFormatProperties2", kFuncTypePdev, (void*)GetPhysicalDeviceFormatProperties2},
+    {"vkCmdSetDepthBiasEnable", kFuncTypeDev, (void*)CmdSetDepthBiasEnable},
+    {"vkCmdSetStencilTestEnable", kFuncTypeDev, (void*)CmdSetStencilTestEnable},
+    {"vkDisplayPowerControlEXT", kFuncTypeDev, (void*)DisplayPowerControlEXT},
+    {"vkCmdEndConditionalRenderingEXT", kFuncTypeDev, (void*)CmdEndConditionalRenderingEXT},
+    {"vkResetCommandPool", kFuncTypeDev, (void*)ResetCommandPool},
+    {"vkFreeCommandBuffers", kFuncTypeDev, (void*)FreeCommandBuffers},
+    {"vkCmdBeginRenderPass2KHR", kFuncTypeDev, (void*)CmdBeginRenderPass2KHR},
+    {"vkGetShaderModuleCreateInfoIdentifierEXT", kFuncTypeDev, (void*)GetShaderModuleCreateInfoIdentifierEXT},
+    {"vkGetDeviceQueue", kFuncTypeDev, (void*)GetDeviceQueue},
+    {"vkCmdSetStencilOp", kFuncTypeDev, (void*)CmdSetStencilOp},
+    {"vkCmdDrawMeshTasksIndirectCountEXT", kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectCountEXT},
+    {"vkGetPhysicalDeviceExternalFenceProperties", kFuncTypePdev, (void*)GetPhysicalDeviceExternalFenceProperties},
+    {"vkGetSwapchainStatusKHR", kFuncTypeDev, (void*)GetSwapchainStatusKHR},
+    {"vkCmdCopyMemoryToImageIndirectNV", kFuncTypeDev, (void*)CmdCopyMemoryToImageIndirectNV},
+    {"vkCmdCopyQueryPoolResults", kFuncTypeDev, (void*)CmdCopyQueryPoolResults},
+    {"vkCmdBeginTransformFeedbackEXT", kFuncTypeDev, (void*)CmdBeginTransformFeedbackEXT},
+    {"vkCreateOpticalFlowSessionNV", kFuncTypeDev, (void*)CreateOpticalFlowSessionNV},
+    {"vkGetPipelineCacheData", kFuncTypeDev, (void*)GetPipelineCacheData},
+    {"vkCmdSetStencilCompareMask", kFuncTypeDev, (void*)CmdSetStencilCompareMask},
+    {"vkCmdCuLaunchKernelNVX", kFuncTypeDev, (void*)CmdCuLaunchKernelNVX},
+    {"vkCreateImage", kFuncTypeDev, (void*)CreateImage},
+    {"vkAllocateMemory", kFuncTypeDev, (void*)AllocateMemory},
+    {"vkCmdDebugMarkerBeginEXT", kFuncTypeDev, (void*)CmdDebugMarkerBeginEXT},
+    {"vkCmdCopyBufferToImage", kFuncTypeDev, (void*)CmdCopyBufferToImage},
+#ifdef VK_USE_PLATFORM_FUCHSIA
+    {"vkCreateBufferCollectionFUCHSIA", kFuncTypeDev, (void*)CreateBufferCollectionFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
+    {"vkGetPipelineExecutablePropertiesKHR", kFuncTypeDev, (void*)GetPipelineExecutablePropertiesKHR},
+    {"vkGetPhysicalDeviceImageFormatProperties", kFuncTypePdev, (void*)GetPhysicalDeviceImageFormatProperties},
+    {"vkGetPrivateDataEXT", kFuncTypeDev, (void*)GetPrivateDataEXT},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkCreateWin32SurfaceKHR", {kFuncTypeInst, (void*)CreateWin32SurfaceKHR}},
+    {"vkGetDeviceGroupSurfacePresentModes2EXT", kFuncTypeDev, (void*)GetDeviceGroupSurfacePresentModes2EXT},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
+    {"vkDestroyDebugReportCallbackEXT", kFuncTypeInst, (void*)DestroyDebugReportCallbackEXT},
+    {"vkCmdBeginRendering", kFuncTypeDev, (void*)CmdBeginRendering},
+    {"vkCmdEndQuery", kFuncTypeDev, (void*)CmdEndQuery},
+    {"vkCmdClearDepthStencilImage", kFuncTypeDev, (void*)CmdClearDepthStencilImage},
+    {"vkReleasePerformanceConfigurationINTEL", kFuncTypeDev, (void*)ReleasePerformanceConfigurationINTEL},
+    {"vkGetPhysicalDeviceQueueFamilyProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyProperties2KHR},
+    {"vkCmdDrawIndirectByteCountEXT", kFuncTypeDev, (void*)CmdDrawIndirectByteCountEXT},
+    {"vkCmdSetColorWriteMaskEXT", kFuncTypeDev, (void*)CmdSetColorWriteMaskEXT},
+    {"vkCmdDraw", kFuncTypeDev, (void*)CmdDraw},
+    {"vkCmdBindTransformFeedbackBuffersEXT", kFuncTypeDev, (void*)CmdBindTransformFeedbackBuffersEXT},
+    {"vkCmdTraceRaysNV", kFuncTypeDev, (void*)CmdTraceRaysNV},
+    {"vkCmdOpticalFlowExecuteNV", kFuncTypeDev, (void*)CmdOpticalFlowExecuteNV},
+    {"vkCmdDispatch", kFuncTypeDev, (void*)CmdDispatch},
+    {"vkBindOpticalFlowSessionImageNV", kFuncTypeDev, (void*)BindOpticalFlowSessionImageNV},
+    {"vkGetShaderModuleIdentifierEXT", kFuncTypeDev, (void*)GetShaderModuleIdentifierEXT},
+    {"vkCmdDrawIndexedIndirectCount", kFuncTypeDev, (void*)CmdDrawIndexedIndirectCount},
+    {"vkGetDisplayPlaneSupportedDisplaysKHR", kFuncTypePdev, (void*)GetDisplayPlaneSupportedDisplaysKHR},
+    {"vkGetPipelineExecutableStatisticsKHR", kFuncTypeDev, (void*)GetPipelineExecutableStatisticsKHR},
+    {"vkCreateQueryPool", kFuncTypeDev, (void*)CreateQueryPool},
+    {"vkCmdSetExtraPrimitiveOverestimationSizeEXT", kFuncTypeDev, (void*)CmdSetExtraPrimitiveOverestimationSizeEXT},
+    {"vkCmdDrawMultiEXT", kFuncTypeDev, (void*)CmdDrawMultiEXT},
+    {"vkDestroySwapchainKHR", kFuncTypeDev, (void*)DestroySwapchainKHR},
+    {"vkCmdWaitEvents2KHR", kFuncTypeDev, (void*)CmdWaitEvents2KHR},
+    {"vkGetDescriptorSetLayoutSizeEXT", kFuncTypeDev, (void*)GetDescriptorSetLayoutSizeEXT},
+    {"vkFlushMappedMemoryRanges", kFuncTypeDev, (void*)FlushMappedMemoryRanges},
+    {"vkEnumerateDeviceExtensionProperties", kFuncTypePdev, (void*)EnumerateDeviceExtensionProperties},
+    {"vkSetEvent", kFuncTypeDev, (void*)SetEvent},
+    {"vkResetEvent", kFuncTypeDev, (void*)ResetEvent},
+    {"vkCmdSetTessellationDomainOriginEXT", kFuncTypeDev, (void*)CmdSetTessellationDomainOriginEXT},
+    {"vkCmdSetLineWidth", kFuncTypeDev, (void*)CmdSetLineWidth},
+    {"vkAllocateCommandBuffers", kFuncTypeDev, (void*)AllocateCommandBuffers},
+    {"vkGetPhysicalDeviceFeatures2", kFuncTypePdev, (void*)GetPhysicalDeviceFeatures2},
+    {"vkGetPhysicalDeviceDisplayPropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceDisplayPropertiesKHR},
+    {"vkCmdBindVertexBuffers2", kFuncTypeDev, (void*)CmdBindVertexBuffers2},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetPhysicalDeviceWin32PresentationSupportKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceWin32PresentationSupportKHR}},
+    {"vkImportSemaphoreWin32HandleKHR", kFuncTypeDev, (void*)ImportSemaphoreWin32HandleKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-    {"vkGetPhysicalDeviceVideoCapabilitiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceVideoCapabilitiesKHR}},
-    {"vkGetPhysicalDeviceVideoFormatPropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceVideoFormatPropertiesKHR}},
-    {"vkCreateVideoSessionKHR", {kFuncTypeDev, (void*)CreateVideoSessionKHR}},
-    {"vkDestroyVideoSessionKHR", {kFuncTypeDev, (void*)DestroyVideoSessionKHR}},
-    {"vkGetVideoSessionMemoryRequirementsKHR", {kFuncTypeDev, (void*)GetVideoSessionMemoryRequirementsKHR}},
-    {"vkBindVideoSessionMemoryKHR", {kFuncTypeDev, (void*)BindVideoSessionMemoryKHR}},
-    {"vkCreateVideoSessionParametersKHR", {kFuncTypeDev, (void*)CreateVideoSessionParametersKHR}},
-    {"vkUpdateVideoSessionParametersKHR", {kFuncTypeDev, (void*)UpdateVideoSessionParametersKHR}},
-    {"vkDestroyVideoSessionParametersKHR", {kFuncTypeDev, (void*)DestroyVideoSessionParametersKHR}},
-    {"vkCmdBeginVideoCodingKHR", {kFuncTypeDev, (void*)CmdBeginVideoCodingKHR}},
-    {"vkCmdEndVideoCodingKHR", {kFuncTypeDev, (void*)CmdEndVideoCodingKHR}},
-    {"vkCmdControlVideoCodingKHR", {kFuncTypeDev, (void*)CmdControlVideoCodingKHR}},
-    {"vkCmdDecodeVideoKHR", {kFuncTypeDev, (void*)CmdDecodeVideoKHR}},
-    {"vkCmdBeginRenderingKHR", {kFuncTypeDev, (void*)CmdBeginRenderingKHR}},
-    {"vkCmdEndRenderingKHR", {kFuncTypeDev, (void*)CmdEndRenderingKHR}},
-    {"vkGetPhysicalDeviceFeatures2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceFeatures2KHR}},
-    {"vkGetPhysicalDeviceProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceProperties2KHR}},
-    {"vkGetPhysicalDeviceFormatProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceFormatProperties2KHR}},
-    {"vkGetPhysicalDeviceImageFormatProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceImageFormatProperties2KHR}},
-    {"vkGetPhysicalDeviceQueueFamilyProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyProperties2KHR}},
-    {"vkGetPhysicalDeviceMemoryProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceMemoryProperties2KHR}},
-    {"vkGetPhysicalDeviceSparseImageFormatProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSparseImageFormatProperties2KHR}},
-    {"vkGetDeviceGroupPeerMemoryFeaturesKHR", {kFuncTypeDev, (void*)GetDeviceGroupPeerMemoryFeaturesKHR}},
-    {"vkCmdSetDeviceMaskKHR", {kFuncTypeDev, (void*)CmdSetDeviceMaskKHR}},
-    {"vkCmdDispatchBaseKHR", {kFuncTypeDev, (void*)CmdDispatchBaseKHR}},
-    {"vkTrimCommandPoolKHR", {kFuncTypeDev, (void*)TrimCommandPoolKHR}},
-    {"vkEnumeratePhysicalDeviceGroupsKHR", {kFuncTypeInst, (void*)EnumeratePhysicalDeviceGroupsKHR}},
-    {"vkGetPhysicalDeviceExternalBufferPropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalBufferPropertiesKHR}},
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetMemoryWin32HandleKHR", {kFuncTypeDev, (void*)GetMemoryWin32HandleKHR}},
+    {"vkMergeValidationCachesEXT", kFuncTypeDev, (void*)MergeValidationCachesEXT},
+    {"vkGetDeviceProcAddr", kFuncTypeDev, (void*)GetDeviceProcAddr},
+    {"vkCmdCopyAccelerationStructureNV", kFuncTypeDev, (void*)CmdCopyAccelerationStructureNV},
+    {"vkCmdSetCoarseSampleOrderNV", kFuncTypeDev, (void*)CmdSetCoarseSampleOrderNV},
+    {"vkDestroyValidationCacheEXT", kFuncTypeDev, (void*)DestroyValidationCacheEXT},
+    {"vkGetDynamicRenderingTilePropertiesQCOM", kFuncTypeDev, (void*)GetDynamicRenderingTilePropertiesQCOM},
+    {"vkCmdSetEvent2KHR", kFuncTypeDev, (void*)CmdSetEvent2KHR},
+    {"vkCmdBeginRenderPass", kFuncTypeDev, (void*)CmdBeginRenderPass},
+    {"vkGetImageViewOpaqueCaptureDescriptorDataEXT", kFuncTypeDev, (void*)GetImageViewOpaqueCaptureDescriptorDataEXT},
+    {"vkCmdSetScissorWithCount", kFuncTypeDev, (void*)CmdSetScissorWithCount},
+    {"vkDestroyDebugUtilsMessengerEXT", kFuncTypeInst, (void*)DestroyDebugUtilsMessengerEXT},
+    {"vkCreateFramebuffer", kFuncTypeDev, (void*)CreateFramebuffer},
+    {"vkImportSemaphoreFdKHR", kFuncTypeDev, (void*)ImportSemaphoreFdKHR},
+    {"vkDestroySamplerYcbcrConversion", kFuncTypeDev, (void*)DestroySamplerYcbcrConversion},
+    {"vkCmdWriteBufferMarkerAMD", kFuncTypeDev, (void*)CmdWriteBufferMarkerAMD},
+#ifdef VK_USE_PLATFORM_FUCHSIA
+    {"vkDestroyBufferCollectionFUCHSIA", kFuncTypeDev, (void*)DestroyBufferCollectionFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetMemoryWin32HandlePropertiesKHR", {kFuncTypeDev, (void*)GetMemoryWin32HandlePropertiesKHR}},
+    {"vkCmdSetPatchControlPointsEXT", kFuncTypeDev, (void*)CmdSetPatchControlPointsEXT},
+    {"vkGetDescriptorSetLayoutBindingOffsetEXT", kFuncTypeDev, (void*)GetDescriptorSetLayoutBindingOffsetEXT},
+    {"vkCopyAccelerationStructureKHR", kFuncTypeDev, (void*)CopyAccelerationStructureKHR},
+    {"vkCreatePipelineLayout", kFuncTypeDev, (void*)CreatePipelineLayout},
+    {"vkCmdSetDepthCompareOp", kFuncTypeDev, (void*)CmdSetDepthCompareOp},
+    {"vkCmdSetViewportWScalingNV", kFuncTypeDev, (void*)CmdSetViewportWScalingNV},
+#ifdef VK_USE_PLATFORM_XLIB_KHR
+    {"vkCreateXlibSurfaceKHR", kFuncTypeInst, (void*)CreateXlibSurfaceKHR},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkGetMemoryFdKHR", {kFuncTypeDev, (void*)GetMemoryFdKHR}},
-    {"vkGetMemoryFdPropertiesKHR", {kFuncTypeDev, (void*)GetMemoryFdPropertiesKHR}},
-    {"vkGetPhysicalDeviceExternalSemaphorePropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalSemaphorePropertiesKHR}},
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkImportSemaphoreWin32HandleKHR", {kFuncTypeDev, (void*)ImportSemaphoreWin32HandleKHR}},
+    {"vkGetRayTracingShaderGroupHandlesNV", kFuncTypeDev, (void*)GetRayTracingShaderGroupHandlesNV},
+    {"vkDebugReportMessageEXT", kFuncTypeInst, (void*)DebugReportMessageEXT},
+    {"vkCmdSetDepthTestEnableEXT", kFuncTypeDev, (void*)CmdSetDepthTestEnableEXT},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+    {"vkGetEncodedVideoSessionParametersKHR", kFuncTypeDev, (void*)GetEncodedVideoSessionParametersKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
+    {"vkCmdDispatchIndirect", kFuncTypeDev, (void*)CmdDispatchIndirect},
+    {"vkGetPhysicalDeviceSurfaceFormats2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceFormats2KHR},
+    {"vkCmdNextSubpass2", kFuncTypeDev, (void*)CmdNextSubpass2},
+    {"vkCreateSamplerYcbcrConversionKHR", kFuncTypeDev, (void*)CreateSamplerYcbcrConversionKHR},
+    {"vkCmdCopyMemoryToAccelerationStructureKHR", kFuncTypeDev, (void*)CmdCopyMemoryToAccelerationStructureKHR},
+    {"vkGetImageSparseMemoryRequirements2", kFuncTypeDev, (void*)GetImageSparseMemoryRequirements2},
+    {"vkCmdSetRepresentativeFragmentTestEnableNV", kFuncTypeDev, (void*)CmdSetRepresentativeFragmentTestEnableNV},
+    {"vkGetDrmDisplayEXT", kFuncTypePdev, (void*)GetDrmDisplayEXT},
+    {"vkCmdDrawIndexed", kFuncTypeDev, (void*)CmdDrawIndexed},
+    {"vkSetPrivateDataEXT", kFuncTypeDev, (void*)SetPrivateDataEXT},
+    {"vkGetPhysicalDeviceProperties", kFuncTypePdev, (void*)GetPhysicalDeviceProperties},
+    {"vkCmdSetDiscardRectangleModeEXT", kFuncTypeDev, (void*)CmdSetDiscardRectangleModeEXT},
+    {"vkDestroyMicromapEXT", kFuncTypeDev, (void*)DestroyMicromapEXT},
+    {"vkCmdCopyMemoryToMicromapEXT", kFuncTypeDev, (void*)CmdCopyMemoryToMicromapEXT},
+    {"vkCreateSharedSwapchainsKHR", kFuncTypeDev, (void*)CreateSharedSwapchainsKHR},
+    {"vkCmdBindVertexBuffers2EXT", kFuncTypeDev, (void*)CmdBindVertexBuffers2EXT},
+    {"vkCmdBindShadingRateImageNV", kFuncTypeDev, (void*)CmdBindShadingRateImageNV},
+    {"vkCreateCuModuleNVX", kFuncTypeDev, (void*)CreateCuModuleNVX},
+    {"vkGetPhysicalDeviceDisplayPlaneProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceDisplayPlaneProperties2KHR},
+    {"vkGetImageMemoryRequirements", kFuncTypeDev, (void*)GetImageMemoryRequirements},
+    {"vkGetBufferOpaqueCaptureAddress", kFuncTypeDev, (void*)GetBufferOpaqueCaptureAddress},
+    {"vkCmdSetCullModeEXT", kFuncTypeDev, (void*)CmdSetCullModeEXT},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetSemaphoreWin32HandleKHR", {kFuncTypeDev, (void*)GetSemaphoreWin32HandleKHR}},
+    {"vkAcquireWinrtDisplayNV", kFuncTypePdev, (void*)AcquireWinrtDisplayNV},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-    {"vkImportSemaphoreFdKHR", {kFuncTypeDev, (void*)ImportSemaphoreFdKHR}},
-    {"vkGetSemaphoreFdKHR", {kFuncTypeDev, (void*)GetSemaphoreFdKHR}},
-    {"vkCmdPushDescriptorSetKHR", {kFuncTypeDev, (void*)CmdPushDescriptorSetKHR}},
-    {"vkCmdPushDescriptorSetWithTemplateKHR", {kFuncTypeDev, (void*)CmdPushDescriptorSetWithTemplateKHR}},
-    {"vkCreateDescriptorUpdateTemplateKHR", {kFuncTypeDev, (void*)CreateDescriptorUpdateTemplateKHR}},
-    {"vkDestroyDescriptorUpdateTemplateKHR", {kFuncTypeDev, (void*)DestroyDescriptorUpdateTemplateKHR}},
-    {"vkUpdateDescriptorSetWithTemplateKHR", {kFuncTypeDev, (void*)UpdateDescriptorSetWithTemplateKHR}},
-    {"vkCreateRenderPass2KHR", {kFuncTypeDev, (void*)CreateRenderPass2KHR}},
-    {"vkCmdBeginRenderPass2KHR", {kFuncTypeDev, (void*)CmdBeginRenderPass2KHR}},
-    {"vkCmdNextSubpass2KHR", {kFuncTypeDev, (void*)CmdNextSubpass2KHR}},
-    {"vkCmdEndRenderPass2KHR", {kFuncTypeDev, (void*)CmdEndRenderPass2KHR}},
-    {"vkGetSwapchainStatusKHR", {kFuncTypeDev, (void*)GetSwapchainStatusKHR}},
-    {"vkGetPhysicalDeviceExternalFencePropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalFencePropertiesKHR}},
+    {"vkGetPhysicalDeviceQueueFamilyProperties", kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyProperties},
+    {"vkCopyAccelerationStructureToMemoryKHR", kFuncTypeDev, (void*)CopyAccelerationStructureToMemoryKHR},
+    {"vkGetDeviceGroupSurfacePresentModesKHR", kFuncTypeDev, (void*)GetDeviceGroupSurfacePresentModesKHR},
+    {"vkCmdEndDebugUtilsLabelEXT", kFuncTypeDev, (void*)CmdEndDebugUtilsLabelEXT},
+    {"vkCmdDecodeVideoKHR", kFuncTypeDev, (void*)CmdDecodeVideoKHR},
+    {"vkDestroyDescriptorSetLayout", kFuncTypeDev, (void*)DestroyDescriptorSetLayout},
+    {"vkCmdSetAlphaToOneEnableEXT", kFuncTypeDev, (void*)CmdSetAlphaToOneEnableEXT},
+    {"vkCmdBindDescriptorBuffersEXT", kFuncTypeDev, (void*)CmdBindDescriptorBuffersEXT},
+    {"vkEnumeratePhysicalDeviceGroupsKHR", kFuncTypeInst, (void*)EnumeratePhysicalDeviceGroupsKHR},
+    {"vkCmdSetLineRasterizationModeEXT", kFuncTypeDev, (void*)CmdSetLineRasterizationModeEXT},
+    {"vkCmdBuildAccelerationStructuresKHR", kFuncTypeDev, (void*)CmdBuildAccelerationStructuresKHR},
+    {"vkSignalSemaphoreKHR", kFuncTypeDev, (void*)SignalSemaphoreKHR},
+    {"vkWaitForPresentKHR", kFuncTypeDev, (void*)WaitForPresentKHR},
+    {"vkDestroyPrivateDataSlot", kFuncTypeDev, (void*)DestroyPrivateDataSlot},
+    {"vkGetPhysicalDeviceFeatures2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceFeatures2KHR},
+    {"vkGetDisplayPlaneCapabilitiesKHR", kFuncTypePdev, (void*)GetDisplayPlaneCapabilitiesKHR},
+    {"vkCmdControlVideoCodingKHR", kFuncTypeDev, (void*)CmdControlVideoCodingKHR},
+    {"vkGetCalibratedTimestampsEXT", kFuncTypeDev, (void*)GetCalibratedTimestampsEXT},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkImportFenceWin32HandleKHR", {kFuncTypeDev, (void*)ImportFenceWin32HandleKHR}},
+    {"vkGetSemaphoreWin32HandleKHR", kFuncTypeDev, (void*)GetSemaphoreWin32HandleKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
+#endif
+    {"vkGetDescriptorEXT", kFuncTypeDev, (void*)GetDescriptorEXT},
+#ifdef VK_USE_PLATFORM_XLIB_XRANDR_EXT
+    {"vkAcquireXlibDisplayEXT", kFuncTypePdev, (void*)AcquireXlibDisplayEXT},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
+    {"vkAcquireNextImageKHR", kFuncTypeDev, (void*)AcquireNextImageKHR},
+    {"vkCmdSetFragmentShadingRateKHR", kFuncTypeDev, (void*)CmdSetFragmentShadingRateKHR},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetFenceWin32HandleKHR", {kFuncTypeDev, (void*)GetFenceWin32HandleKHR}},
+    {"vkImportFenceWin32HandleKHR", kFuncTypeDev, (void*)ImportFenceWin32HandleKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-    {"vkImportFenceFdKHR", {kFuncTypeDev, (void*)ImportFenceFdKHR}},
-    {"vkGetFenceFdKHR", {kFuncTypeDev, (void*)GetFenceFdKHR}},
-    {"vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR", {kFuncTypePdev, (void*)EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR}},
-    {"vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR}},
-    {"vkAcquireProfilingLockKHR", {kFuncTypeDev, (void*)AcquireProfilingLockKHR}},
-    {"vkReleaseProfilingLockKHR", {kFuncTypeDev, (void*)ReleaseProfilingLockKHR}},
-    {"vkGetPhysicalDeviceSurfaceCapabilities2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceCapabilities2KHR}},
-    {"vkGetPhysicalDeviceSurfaceFormats2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceFormats2KHR}},
-    {"vkGetPhysicalDeviceDisplayProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceDisplayProperties2KHR}},
-    {"vkGetPhysicalDeviceDisplayPlaneProperties2KHR", {kFuncTypePdev, (void*)GetPhysicalDeviceDisplayPlaneProperties2KHR}},
-    {"vkGetDisplayModeProperties2KHR", {kFuncTypePdev, (void*)GetDisplayModeProperties2KHR}},
-    {"vkGetDisplayPlaneCapabilities2KHR", {kFuncTypePdev, (void*)GetDisplayPlaneCapabilities2KHR}},
-    {"vkGetImageMemoryRequirements2KHR", {kFuncTypeDev, (void*)GetImageMemoryRequirements2KHR}},
-    {"vkGetBufferMemoryRequirements2KHR", {kFuncTypeDev, (void*)GetBufferMemoryRequirements2KHR}},
-    {"vkGetImageSparseMemoryRequirements2KHR", {kFuncTypeDev, (void*)GetImageSparseMemoryRequirements2KHR}},
-    {"vkCreateSamplerYcbcrConversionKHR", {kFuncTypeDev, (void*)CreateSamplerYcbcrConversionKHR}},
-    {"vkDestroySamplerYcbcrConversionKHR", {kFuncTypeDev, (void*)DestroySamplerYcbcrConversionKHR}},
-    {"vkBindBufferMemory2KHR", {kFuncTypeDev, (void*)BindBufferMemory2KHR}},
-    {"vkBindImageMemory2KHR", {kFuncTypeDev, (void*)BindImageMemory2KHR}},
-    {"vkGetDescriptorSetLayoutSupportKHR", {kFuncTypeDev, (void*)GetDescriptorSetLayoutSupportKHR}},
-    {"vkCmdDrawIndirectCountKHR", {kFuncTypeDev, (void*)CmdDrawIndirectCountKHR}},
-    {"vkCmdDrawIndexedIndirectCountKHR", {kFuncTypeDev, (void*)CmdDrawIndexedIndirectCountKHR}},
-    {"vkGetSemaphoreCounterValueKHR", {kFuncTypeDev, (void*)GetSemaphoreCounterValueKHR}},
-    {"vkWaitSemaphoresKHR", {kFuncTypeDev, (void*)WaitSemaphoresKHR}},
-    {"vkSignalSemaphoreKHR", {kFuncTypeDev, (void*)SignalSemaphoreKHR}},
-    {"vkGetPhysicalDeviceFragmentShadingRatesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceFragmentShadingRatesKHR}},
-    {"vkCmdSetFragmentShadingRateKHR", {kFuncTypeDev, (void*)CmdSetFragmentShadingRateKHR}},
-    {"vkWaitForPresentKHR", {kFuncTypeDev, (void*)WaitForPresentKHR}},
-    {"vkGetBufferDeviceAddressKHR", {kFuncTypeDev, (void*)GetBufferDeviceAddressKHR}},
-    {"vkGetBufferOpaqueCaptureAddressKHR", {kFuncTypeDev, (void*)GetBufferOpaqueCaptureAddressKHR}},
-    {"vkGetDeviceMemoryOpaqueCaptureAddressKHR", {kFuncTypeDev, (void*)GetDeviceMemoryOpaqueCaptureAddressKHR}},
-    {"vkCreateDeferredOperationKHR", {kFuncTypeDev, (void*)CreateDeferredOperationKHR}},
-    {"vkDestroyDeferredOperationKHR", {kFuncTypeDev, (void*)DestroyDeferredOperationKHR}},
-    {"vkGetDeferredOperationMaxConcurrencyKHR", {kFuncTypeDev, (void*)GetDeferredOperationMaxConcurrencyKHR}},
-    {"vkGetDeferredOperationResultKHR", {kFuncTypeDev, (void*)GetDeferredOperationResultKHR}},
-    {"vkDeferredOperationJoinKHR", {kFuncTypeDev, (void*)DeferredOperationJoinKHR}},
-    {"vkGetPipelineExecutablePropertiesKHR", {kFuncTypeDev, (void*)GetPipelineExecutablePropertiesKHR}},
-    {"vkGetPipelineExecutableStatisticsKHR", {kFuncTypeDev, (void*)GetPipelineExecutableStatisticsKHR}},
-    {"vkGetPipelineExecutableInternalRepresentationsKHR", {kFuncTypeDev, (void*)GetPipelineExecutableInternalRepresentationsKHR}},
-    {"vkMapMemory2KHR", {kFuncTypeDev, (void*)MapMemory2KHR}},
-    {"vkUnmapMemory2KHR", {kFuncTypeDev, (void*)UnmapMemory2KHR}},
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-    {"vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR}},
+    {"vkGetPhysicalDeviceSparseImageFormatProperties", kFuncTypePdev, (void*)GetPhysicalDeviceSparseImageFormatProperties},
+    {"vkCopyMemoryToMicromapEXT", kFuncTypeDev, (void*)CopyMemoryToMicromapEXT},
+    {"vkSubmitDebugUtilsMessageEXT", kFuncTypeInst, (void*)SubmitDebugUtilsMessageEXT},
+    {"vkDestroyVideoSessionKHR", kFuncTypeDev, (void*)DestroyVideoSessionKHR},
+    {"vkCmdBeginConditionalRenderingEXT", kFuncTypeDev, (void*)CmdBeginConditionalRenderingEXT},
+    {"vkCmdClearColorImage", kFuncTypeDev, (void*)CmdClearColorImage},
+    {"vkCmdSetDepthBounds", kFuncTypeDev, (void*)CmdSetDepthBounds},
+    {"vkAcquireNextImage2KHR", kFuncTypeDev, (void*)AcquireNextImage2KHR},
+    {"vkGetPhysicalDeviceSurfacePresentModesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceSurfacePresentModesKHR},
+    {"vkGetDeviceMemoryCommitment", kFuncTypeDev, (void*)GetDeviceMemoryCommitment},
+#ifdef VK_USE_PLATFORM_MACOS_MVK
+    {"vkCreateMacOSSurfaceMVK", kFuncTypeInst, (void*)CreateMacOSSurfaceMVK},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-    {"vkGetEncodedVideoSessionParametersKHR", {kFuncTypeDev, (void*)GetEncodedVideoSessionParametersKHR}},
+    {"vkCmdSetLineStippleEnableEXT", kFuncTypeDev, (void*)CmdSetLineStippleEnableEXT},
+    {"vkCmdBindShadersEXT", kFuncTypeDev, (void*)CmdBindShadersEXT},
+    {"vkInvalidateMappedMemoryRanges", kFuncTypeDev, (void*)InvalidateMappedMemoryRanges},
+    {"vkCopyMicromapToMemoryEXT", kFuncTypeDev, (void*)CopyMicromapToMemoryEXT},
+    {"vkGetGeneratedCommandsMemoryRequirementsNV", kFuncTypeDev, (void*)GetGeneratedCommandsMemoryRequirementsNV},
+    {"vkCmdSetDepthTestEnable", kFuncTypeDev, (void*)CmdSetDepthTestEnable},
+    {"vkCmdCopyBufferToImage2KHR", kFuncTypeDev, (void*)CmdCopyBufferToImage2KHR},
+    {"vkCmdBindIndexBuffer", kFuncTypeDev, (void*)CmdBindIndexBuffer},
+    {"vkDestroyPipelineLayout", kFuncTypeDev, (void*)DestroyPipelineLayout},
+    {"vkReleaseDisplayEXT", kFuncTypePdev, (void*)ReleaseDisplayEXT},
+    {"vkEndCommandBuffer", kFuncTypeDev, (void*)EndCommandBuffer},
+    {"vkGetAccelerationStructureHandleNV", kFuncTypeDev, (void*)GetAccelerationStructureHandleNV},
+    {"vkCmdSetFrontFace", kFuncTypeDev, (void*)CmdSetFrontFace},
+    {"vkSetDeviceMemoryPriorityEXT", kFuncTypeDev, (void*)SetDeviceMemoryPriorityEXT},
+    {"vkCmdSetVertexInputEXT", kFuncTypeDev, (void*)CmdSetVertexInputEXT},
+    {"vkDestroyRenderPass", kFuncTypeDev, (void*)DestroyRenderPass},
+    {"vkGetImageDrmFormatModifierPropertiesEXT", kFuncTypeDev, (void*)GetImageDrmFormatModifierPropertiesEXT},
+    {"vkGetMemoryRemoteAddressNV", kFuncTypeDev, (void*)GetMemoryRemoteAddressNV},
+    {"vkCmdWriteAccelerationStructuresPropertiesKHR", kFuncTypeDev, (void*)CmdWriteAccelerationStructuresPropertiesKHR},
+    {"vkCmdSetDepthCompareOpEXT", kFuncTypeDev, (void*)CmdSetDepthCompareOpEXT},
+    {"vkCmdDrawMeshTasksEXT", kFuncTypeDev, (void*)CmdDrawMeshTasksEXT},
+#ifdef VK_USE_PLATFORM_DIRECTFB_EXT
+    {"vkCreateDirectFBSurfaceEXT", kFuncTypeInst, (void*)CreateDirectFBSurfaceEXT},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-    {"vkCmdEncodeVideoKHR", {kFuncTypeDev, (void*)CmdEncodeVideoKHR}},
+    {"vkGetPhysicalDevicePresentRectanglesKHR", kFuncTypePdev, (void*)GetPhysicalDevicePresentRectanglesKHR},
+    {"vkCmdUpdateBuffer", kFuncTypeDev, (void*)CmdUpdateBuffer},
+    {"vkCmdEndRenderPass2", kFuncTypeDev, (void*)CmdEndRenderPass2},
+    {"vkCmdTraceRaysIndirect2KHR", kFuncTypeDev, (void*)CmdTraceRaysIndirect2KHR},
+    {"vkSetPrivateData", kFuncTypeDev, (void*)SetPrivateData},
+    {"vkCmdCopyImage2KHR", kFuncTypeDev, (void*)CmdCopyImage2KHR},
+    {"vkDestroyDevice", kFuncTypeDev, (void*)DestroyDevice},
+    {"vkCreateCommandPool", kFuncTypeDev, (void*)CreateCommandPool},
+    {"vkDebugMarkerSetObjectTagEXT", kFuncTypeDev, (void*)DebugMarkerSetObjectTagEXT},
+    {"vkBindBufferMemory2KHR", kFuncTypeDev, (void*)BindBufferMemory2KHR},
+    {"vkGetSemaphoreFdKHR", kFuncTypeDev, (void*)GetSemaphoreFdKHR},
+    {"vkGetSwapchainImagesKHR", kFuncTypeDev, (void*)GetSwapchainImagesKHR},
+    {"vkQueueSubmit", kFuncTypeDev, (void*)QueueSubmit},
+    {"vkCmdPipelineBarrier", kFuncTypeDev, (void*)CmdPipelineBarrier},
+    {"vkBuildAccelerationStructuresKHR", kFuncTypeDev, (void*)BuildAccelerationStructuresKHR},
+    {"vkGetBufferDeviceAddressKHR", kFuncTypeDev, (void*)GetBufferDeviceAddressKHR},
+    {"vkCmdSetDepthWriteEnable", kFuncTypeDev, (void*)CmdSetDepthWriteEnable},
+    {"vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT", kFuncTypeDev, (void*)GetAccelerationStructureOpaqueCaptureDescriptorDataEXT},
+    {"vkAllocateDescriptorSets", kFuncTypeDev, (void*)AllocateDescriptorSets},
+    {"vkCmdSetSampleLocationsEXT", kFuncTypeDev, (void*)CmdSetSampleLocationsEXT},
+    {"vkInitializePerformanceApiINTEL", kFuncTypeDev, (void*)InitializePerformanceApiINTEL},
+#ifdef VK_USE_PLATFORM_FUCHSIA
+    {"vkCreateImagePipeSurfaceFUCHSIA", kFuncTypeInst, (void*)CreateImagePipeSurfaceFUCHSIA},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkCmdSetEvent2KHR", {kFuncTypeDev, (void*)CmdSetEvent2KHR}},
-    {"vkCmdResetEvent2KHR", {kFuncTypeDev, (void*)CmdResetEvent2KHR}},
-    {"vkCmdWaitEvents2KHR", {kFuncTypeDev, (void*)CmdWaitEvents2KHR}},
-    {"vkCmdPipelineBarrier2KHR", {kFuncTypeDev, (void*)CmdPipelineBarrier2KHR}},
-    {"vkCmdWriteTimestamp2KHR", {kFuncTypeDev, (void*)CmdWriteTimestamp2KHR}},
-    {"vkQueueSubmit2KHR", {kFuncTypeDev, (void*)QueueSubmit2KHR}},
-    {"vkCmdWriteBufferMarker2AMD", {kFuncTypeDev, (void*)CmdWriteBufferMarker2AMD}},
-    {"vkGetQueueCheckpointData2NV", {kFuncTypeDev, (void*)GetQueueCheckpointData2NV}},
-    {"vkCmdCopyBuffer2KHR", {kFuncTypeDev, (void*)CmdCopyBuffer2KHR}},
-    {"vkCmdCopyImage2KHR", {kFuncTypeDev, (void*)CmdCopyImage2KHR}},
-    {"vkCmdCopyBufferToImage2KHR", {kFuncTypeDev, (void*)CmdCopyBufferToImage2KHR}},
-    {"vkCmdCopyImageToBuffer2KHR", {kFuncTypeDev, (void*)CmdCopyImageToBuffer2KHR}},
-    {"vkCmdBlitImage2KHR", {kFuncTypeDev, (void*)CmdBlitImage2KHR}},
-    {"vkCmdResolveImage2KHR", {kFuncTypeDev, (void*)CmdResolveImage2KHR}},
-    {"vkCmdTraceRaysIndirect2KHR", {kFuncTypeDev, (void*)CmdTraceRaysIndirect2KHR}},
-    {"vkGetDeviceBufferMemoryRequirementsKHR", {kFuncTypeDev, (void*)GetDeviceBufferMemoryRequirementsKHR}},
-    {"vkGetDeviceImageMemoryRequirementsKHR", {kFuncTypeDev, (void*)GetDeviceImageMemoryRequirementsKHR}},
-    {"vkGetDeviceImageSparseMemoryRequirementsKHR", {kFuncTypeDev, (void*)GetDeviceImageSparseMemoryRequirementsKHR}},
-    {"vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR", {kFuncTypePdev, (void*)GetPhysicalDeviceCooperativeMatrixPropertiesKHR}},
-    {"vkCreateDebugReportCallbackEXT", {kFuncTypeInst, (void*)CreateDebugReportCallbackEXT}},
-    {"vkDestroyDebugReportCallbackEXT", {kFuncTypeInst, (void*)DestroyDebugReportCallbackEXT}},
-    {"vkDebugReportMessageEXT", {kFuncTypeInst, (void*)DebugReportMessageEXT}},
-    {"vkDebugMarkerSetObjectTagEXT", {kFuncTypeDev, (void*)DebugMarkerSetObjectTagEXT}},
-    {"vkDebugMarkerSetObjectNameEXT", {kFuncTypeDev, (void*)DebugMarkerSetObjectNameEXT}},
-    {"vkCmdDebugMarkerBeginEXT", {kFuncTypeDev, (void*)CmdDebugMarkerBeginEXT}},
-    {"vkCmdDebugMarkerEndEXT", {kFuncTypeDev, (void*)CmdDebugMarkerEndEXT}},
-    {"vkCmdDebugMarkerInsertEXT", {kFuncTypeDev, (void*)CmdDebugMarkerInsertEXT}},
-    {"vkCmdBindTransformFeedbackBuffersEXT", {kFuncTypeDev, (void*)CmdBindTransformFeedbackBuffersEXT}},
-    {"vkCmdBeginTransformFeedbackEXT", {kFuncTypeDev, (void*)CmdBeginTransformFeedbackEXT}},
-    {"vkCmdEndTransformFeedbackEXT", {kFuncTypeDev, (void*)CmdEndTransformFeedbackEXT}},
-    {"vkCmdBeginQueryIndexedEXT", {kFuncTypeDev, (void*)CmdBeginQueryIndexedEXT}},
-    {"vkCmdEndQueryIndexedEXT", {kFuncTypeDev, (void*)CmdEndQueryIndexedEXT}},
-    {"vkCmdDrawIndirectByteCountEXT", {kFuncTypeDev, (void*)CmdDrawIndirectByteCountEXT}},
-    {"vkCreateCuModuleNVX", {kFuncTypeDev, (void*)CreateCuModuleNVX}},
-    {"vkCreateCuFunctionNVX", {kFuncTypeDev, (void*)CreateCuFunctionNVX}},
-    {"vkDestroyCuModuleNVX", {kFuncTypeDev, (void*)DestroyCuModuleNVX}},
-    {"vkDestroyCuFunctionNVX", {kFuncTypeDev, (void*)DestroyCuFunctionNVX}},
-    {"vkCmdCuLaunchKernelNVX", {kFuncTypeDev, (void*)CmdCuLaunchKernelNVX}},
-    {"vkGetImageViewHandleNVX", {kFuncTypeDev, (void*)GetImageViewHandleNVX}},
-    {"vkGetImageViewAddressNVX", {kFuncTypeDev, (void*)GetImageViewAddressNVX}},
-    {"vkCmdDrawIndirectCountAMD", {kFuncTypeDev, (void*)CmdDrawIndirectCountAMD}},
-    {"vkCmdDrawIndexedIndirectCountAMD", {kFuncTypeDev, (void*)CmdDrawIndexedIndirectCountAMD}},
-    {"vkGetShaderInfoAMD", {kFuncTypeDev, (void*)GetShaderInfoAMD}},
-#ifdef VK_USE_PLATFORM_GGP
-    {"vkCreateStreamDescriptorSurfaceGGP", {kFuncTypeInst, (void*)CreateStreamDescriptorSurfaceGGP}},
+    {"vkCmdDrawIndirectCount", kFuncTypeDev, (void*)CmdDrawIndirectCount},
+    {"vkCmdBlitImage", kFuncTypeDev, (void*)CmdBlitImage},
+    {"vkGetShaderBinaryDataEXT", kFuncTypeDev, (void*)GetShaderBinaryDataEXT},
+    {"vkDestroyDescriptorUpdateTemplate", kFuncTypeDev, (void*)DestroyDescriptorUpdateTemplate},
+    {"vkEnumerateInstanceExtensionProperties", kFuncTypeInst, (void*)EnumerateInstanceExtensionProperties},
+    {"vkDestroyVideoSessionParametersKHR", kFuncTypeDev, (void*)DestroyVideoSessionParametersKHR},
+    {"vkCmdSetColorBlendEquationEXT", kFuncTypeDev, (void*)CmdSetColorBlendEquationEXT},
+    {"vkCmdDrawIndexedIndirectCountAMD", kFuncTypeDev, (void*)CmdDrawIndexedIndirectCountAMD},
+    {"vkGetPhysicalDeviceExternalSemaphorePropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceExternalSemaphorePropertiesKHR},
+    {"vkCmdBuildAccelerationStructureNV", kFuncTypeDev, (void*)CmdBuildAccelerationStructureNV},
+    {"vkGetPhysicalDeviceFeatures", kFuncTypePdev, (void*)GetPhysicalDeviceFeatures},
+#ifdef VK_USE_PLATFORM_ANDROID_KHR
+    {"vkCreateAndroidSurfaceKHR", kFuncTypeInst, (void*)CreateAndroidSurfaceKHR},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkGetPhysicalDeviceExternalImageFormatPropertiesNV", {kFuncTypePdev, (void*)GetPhysicalDeviceExternalImageFormatPropertiesNV}},
+    {"vkQueuePresentKHR", kFuncTypeDev, (void*)QueuePresentKHR},
+    {"vkCmdDebugMarkerEndEXT", kFuncTypeDev, (void*)CmdDebugMarkerEndEXT},
+    {"vkBindBufferMemory", kFuncTypeDev, (void*)BindBufferMemory},
+    {"vkGetDeviceBufferMemoryRequirements", kFuncTypeDev, (void*)GetDeviceBufferMemoryRequirements},
+    {"vkMergePipelineCaches", kFuncTypeDev, (void*)MergePipelineCaches},
+    {"vkCmdSetPerformanceMarkerINTEL", kFuncTypeDev, (void*)CmdSetPerformanceMarkerINTEL},
+    {"vkCreateDescriptorSetLayout", kFuncTypeDev, (void*)CreateDescriptorSetLayout},
+    {"vkGetVideoSessionMemoryRequirementsKHR", kFuncTypeDev, (void*)GetVideoSessionMemoryRequirementsKHR},
+    {"vkCmdPreprocessGeneratedCommandsNV", kFuncTypeDev, (void*)CmdPreprocessGeneratedCommandsNV},
+    {"vkCmdSetColorBlendEnableEXT", kFuncTypeDev, (void*)CmdSetColorBlendEnableEXT},
+    {"vkCmdWriteBufferMarker2AMD", kFuncTypeDev, (void*)CmdWriteBufferMarker2AMD},
+    {"vkCmdCopyBuffer", kFuncTypeDev, (void*)CmdCopyBuffer},
+    {"vkCmdResolveImage2KHR", kFuncTypeDev, (void*)CmdResolveImage2KHR},
+    {"vkCmdCopyBufferToImage2", kFuncTypeDev, (void*)CmdCopyBufferToImage2},
+    {"vkCmdSetDepthBoundsTestEnable", kFuncTypeDev, (void*)CmdSetDepthBoundsTestEnable},
+    {"vkCmdSetStencilWriteMask", kFuncTypeDev, (void*)CmdSetStencilWriteMask},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetMemoryWin32HandleNV", {kFuncTypeDev, (void*)GetMemoryWin32HandleNV}},
+    {"vkGetFenceWin32HandleKHR", kFuncTypeDev, (void*)GetFenceWin32HandleKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_VI_NN
-    {"vkCreateViSurfaceNN", {kFuncTypeInst, (void*)CreateViSurfaceNN}},
+    {"vkSetDebugUtilsObjectNameEXT", kFuncTypeDev, (void*)SetDebugUtilsObjectNameEXT},
+    {"vkGetImageViewAddressNVX", kFuncTypeDev, (void*)GetImageViewAddressNVX},
+#ifdef VK_USE_PLATFORM_WIN32_KHR
+    {"vkCreateWin32SurfaceKHR", kFuncTypeInst, (void*)CreateWin32SurfaceKHR},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkCmdBeginConditionalRenderingEXT", {kFuncTypeDev, (void*)CmdBeginConditionalRenderingEXT}},
-    {"vkCmdEndConditionalRenderingEXT", {kFuncTypeDev, (void*)CmdEndConditionalRenderingEXT}},
-    {"vkCmdSetViewportWScalingNV", {kFuncTypeDev, (void*)CmdSetViewportWScalingNV}},
-    {"vkReleaseDisplayEXT", {kFuncTypePdev, (void*)ReleaseDisplayEXT}},
-#ifdef VK_USE_PLATFORM_XLIB_XRANDR_EXT
-    {"vkAcquireXlibDisplayEXT", {kFuncTypePdev, (void*)AcquireXlibDisplayEXT}},
+    {"vkRegisterDeviceEventEXT", kFuncTypeDev, (void*)RegisterDeviceEventEXT},
+    {"vkBindBufferMemory2", kFuncTypeDev, (void*)BindBufferMemory2},
+    {"vkCmdEndRenderPass", kFuncTypeDev, (void*)CmdEndRenderPass},
+    {"vkSetLocalDimmingAMD", kFuncTypeDev, (void*)SetLocalDimmingAMD},
+    {"vkGetPhysicalDeviceExternalFencePropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceExternalFencePropertiesKHR},
+    {"vkGetDescriptorSetLayoutSupport", kFuncTypeDev, (void*)GetDescriptorSetLayoutSupport},
+    {"vkGetDescriptorSetLayoutSupportKHR", kFuncTypeDev, (void*)GetDescriptorSetLayoutSupportKHR},
+    {"vkGetImageMemoryRequirements2KHR", kFuncTypeDev, (void*)GetImageMemoryRequirements2KHR},
+#ifdef VK_USE_PLATFORM_XLIB_KHR
+    {"vkGetPhysicalDeviceXlibPresentationSupportKHR", kFuncTypePdev, (void*)GetPhysicalDeviceXlibPresentationSupportKHR},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
+    {"vkGetImageMemoryRequirements2", kFuncTypeDev, (void*)GetImageMemoryRequirements2},
 #ifdef VK_USE_PLATFORM_XLIB_XRANDR_EXT
-    {"vkGetRandROutputDisplayEXT", {kFuncTypePdev, (void*)GetRandROutputDisplayEXT}},
+    {"vkGetRandROutputDisplayEXT", kFuncTypePdev, (void*)GetRandROutputDisplayEXT},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-    {"vkGetPhysicalDeviceSurfaceCapabilities2EXT", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceCapabilities2EXT}},
-    {"vkDisplayPowerControlEXT", {kFuncTypeDev, (void*)DisplayPowerControlEXT}},
-    {"vkRegisterDeviceEventEXT", {kFuncTypeDev, (void*)RegisterDeviceEventEXT}},
-    {"vkRegisterDisplayEventEXT", {kFuncTypeDev, (void*)RegisterDisplayEventEXT}},
-    {"vkGetSwapchainCounterEXT", {kFuncTypeDev, (void*)GetSwapchainCounterEXT}},
-    {"vkGetRefreshCycleDurationGOOGLE", {kFuncTypeDev, (void*)GetRefreshCycleDurationGOOGLE}},
-    {"vkGetPastPresentationTimingGOOGLE", {kFuncTypeDev, (void*)GetPastPresentationTimingGOOGLE}},
-    {"vkCmdSetDiscardRectangleEXT", {kFuncTypeDev, (void*)CmdSetDiscardRectangleEXT}},
-    {"vkCmdSetDiscardRectangleEnableEXT", {kFuncTypeDev, (void*)CmdSetDiscardRectangleEnableEXT}},
-    {"vkCmdSetDiscardRectangleModeEXT", {kFuncTypeDev, (void*)CmdSetDiscardRectangleModeEXT}},
-    {"vkSetHdrMetadataEXT", {kFuncTypeDev, (void*)SetHdrMetadataEXT}},
-#ifdef VK_USE_PLATFORM_IOS_MVK
-    {"vkCreateIOSSurfaceMVK", {kFuncTypeInst, (void*)CreateIOSSurfaceMVK}},
+    {"vkAcquirePerformanceConfigurationINTEL", kFuncTypeDev, (void*)AcquirePerformanceConfigurationINTEL},
+    {"vkCreateDebugUtilsMessengerEXT", kFuncTypeInst, (void*)CreateDebugUtilsMessengerEXT},
+    {"vkCreateGraphicsPipelines", kFuncTypeDev, (void*)CreateGraphicsPipelines},
+#ifdef VK_USE_PLATFORM_METAL_EXT
+    {"vkCreateMetalSurfaceEXT", kFuncTypeInst, (void*)CreateMetalSurfaceEXT},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_MACOS_MVK
-    {"vkCreateMacOSSurfaceMVK", {kFuncTypeInst, (void*)CreateMacOSSurfaceMVK}},
+    {"vkQueueInsertDebugUtilsLabelEXT", kFuncTypeDev, (void*)QueueInsertDebugUtilsLabelEXT},
+    {"vkGetMemoryFdPropertiesKHR", kFuncTypeDev, (void*)GetMemoryFdPropertiesKHR},
+    {"vkCmdSetLineStippleEXT", kFuncTypeDev, (void*)CmdSetLineStippleEXT},
+    {"vkGetPhysicalDeviceDisplayProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceDisplayProperties2KHR},
+    {"vkResetCommandBuffer", kFuncTypeDev, (void*)ResetCommandBuffer},
+    {"vkEnumerateInstanceLayerProperties", kFuncTypeInst, (void*)EnumerateInstanceLayerProperties},
+    {"vkResetQueryPool", kFuncTypeDev, (void*)ResetQueryPool},
+    {"vkCmdEndQueryIndexedEXT", kFuncTypeDev, (void*)CmdEndQueryIndexedEXT},
+    {"vkDestroyShaderEXT", kFuncTypeDev, (void*)DestroyShaderEXT},
+    {"vkGetValidationCacheDataEXT", kFuncTypeDev, (void*)GetValidationCacheDataEXT},
+    {"vkUpdateDescriptorSets", kFuncTypeDev, (void*)UpdateDescriptorSets},
+    {"vkCmdSetCheckpointNV", kFuncTypeDev, (void*)CmdSetCheckpointNV},
+    {"vkCmdBeginDebugUtilsLabelEXT", kFuncTypeDev, (void*)CmdBeginDebugUtilsLabelEXT},
+    {"vkCreatePrivateDataSlot", kFuncTypeDev, (void*)CreatePrivateDataSlot},
+    {"vkCmdCopyAccelerationStructureKHR", kFuncTypeDev, (void*)CmdCopyAccelerationStructureKHR},
+    {"vkCmdSetCoverageModulationModeNV", kFuncTypeDev, (void*)CmdSetCoverageModulationModeNV},
+    {"vkGetPhysicalDeviceVideoCapabilitiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceVideoCapabilitiesKHR},
+    {"vkReleaseSwapchainImagesEXT", kFuncTypeDev, (void*)ReleaseSwapchainImagesEXT},
+    {"vkCmdSetStencilReference", kFuncTypeDev, (void*)CmdSetStencilReference},
+    {"vkGetRenderAreaGranularity", kFuncTypeDev, (void*)GetRenderAreaGranularity},
+    {"vkGetPhysicalDeviceMultisamplePropertiesEXT", kFuncTypePdev, (void*)GetPhysicalDeviceMultisamplePropertiesEXT},
+    {"vkCmdSetScissorWithCountEXT", kFuncTypeDev, (void*)CmdSetScissorWithCountEXT},
+    {"vkUpdateDescriptorSetWithTemplate", kFuncTypeDev, (void*)UpdateDescriptorSetWithTemplate},
+    {"vkDestroyImage", kFuncTypeDev, (void*)DestroyImage},
+    {"vkCmdDrawMultiIndexedEXT", kFuncTypeDev, (void*)CmdDrawMultiIndexedEXT},
+    {"vkGetDeviceImageSparseMemoryRequirements", kFuncTypeDev, (void*)GetDeviceImageSparseMemoryRequirements},
+#ifdef VK_USE_PLATFORM_SCREEN_QNX
+    {"vkGetScreenBufferPropertiesQNX", kFuncTypeDev, (void*)GetScreenBufferPropertiesQNX},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-    {"vkSetDebugUtilsObjectNameEXT", {kFuncTypeDev, (void*)SetDebugUtilsObjectNameEXT}},
-    {"vkSetDebugUtilsObjectTagEXT", {kFuncTypeDev, (void*)SetDebugUtilsObjectTagEXT}},
-    {"vkQueueBeginDebugUtilsLabelEXT", {kFuncTypeDev, (void*)QueueBeginDebugUtilsLabelEXT}},
-    {"vkQueueEndDebugUtilsLabelEXT", {kFuncTypeDev, (void*)QueueEndDebugUtilsLabelEXT}},
-    {"vkQueueInsertDebugUtilsLabelEXT", {kFuncTypeDev, (void*)QueueInsertDebugUtilsLabelEXT}},
-    {"vkCmdBeginDebugUtilsLabelEXT", {kFuncTypeDev, (void*)CmdBeginDebugUtilsLabelEXT}},
-    {"vkCmdEndDebugUtilsLabelEXT", {kFuncTypeDev, (void*)CmdEndDebugUtilsLabelEXT}},
-    {"vkCmdInsertDebugUtilsLabelEXT", {kFuncTypeDev, (void*)CmdInsertDebugUtilsLabelEXT}},
-    {"vkCreateDebugUtilsMessengerEXT", {kFuncTypeInst, (void*)CreateDebugUtilsMessengerEXT}},
-    {"vkDestroyDebugUtilsMessengerEXT", {kFuncTypeInst, (void*)DestroyDebugUtilsMessengerEXT}},
-    {"vkSubmitDebugUtilsMessageEXT", {kFuncTypeInst, (void*)SubmitDebugUtilsMessageEXT}},
-#ifdef VK_USE_PLATFORM_ANDROID_KHR
-    {"vkGetAndroidHardwareBufferPropertiesANDROID", {kFuncTypeDev, (void*)GetAndroidHardwareBufferPropertiesANDROID}},
+    {"vkGetBufferOpaqueCaptureDescriptorDataEXT", kFuncTypeDev, (void*)GetBufferOpaqueCaptureDescriptorDataEXT},
+    {"vkCmdSetViewportShadingRatePaletteNV", kFuncTypeDev, (void*)CmdSetViewportShadingRatePaletteNV},
+    {"vkResetDescriptorPool", kFuncTypeDev, (void*)ResetDescriptorPool},
+    {"vkCmdSetLogicOpEnableEXT", kFuncTypeDev, (void*)CmdSetLogicOpEnableEXT},
+    {"vkDestroyInstance", kFuncTypeInst, (void*)DestroyInstance},
+    {"vkCmdBeginQuery", kFuncTypeDev, (void*)CmdBeginQuery},
+#ifdef VK_USE_PLATFORM_FUCHSIA
+    {"vkGetBufferCollectionPropertiesFUCHSIA", kFuncTypeDev, (void*)GetBufferCollectionPropertiesFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_ANDROID_KHR
-    {"vkGetMemoryAndroidHardwareBufferANDROID", {kFuncTypeDev, (void*)GetMemoryAndroidHardwareBufferANDROID}},
+    {"vkCmdSetRasterizerDiscardEnableEXT", kFuncTypeDev, (void*)CmdSetRasterizerDiscardEnableEXT},
+#ifdef VK_USE_PLATFORM_SCREEN_QNX
+    {"vkGetPhysicalDeviceScreenPresentationSupportQNX", kFuncTypePdev, (void*)GetPhysicalDeviceScreenPresentationSupportQNX},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-    {"vkCmdSetSampleLocationsEXT", {kFuncTypeDev, (void*)CmdSetSampleLocationsEXT}},
-    {"vkGetPhysicalDeviceMultisamplePropertiesEXT", {kFuncTypePdev, (void*)GetPhysicalDeviceMultisamplePropertiesEXT}},
-    {"vkGetImageDrmFormatModifierPropertiesEXT", {kFuncTypeDev, (void*)GetImageDrmFormatModifierPropertiesEXT}},
-    {"vkCreateValidationCacheEXT", {kFuncTypeDev, (void*)CreateValidationCacheEXT}},
-    {"vkDestroyValidationCacheEXT", {kFuncTypeDev, (void*)DestroyValidationCacheEXT}},
-    {"vkMergeValidationCachesEXT", {kFuncTypeDev, (void*)MergeValidationCachesEXT}},
-    {"vkGetValidationCacheDataEXT", {kFuncTypeDev, (void*)GetValidationCacheDataEXT}},
-    {"vkCmdBindShadingRateImageNV", {kFuncTypeDev, (void*)CmdBindShadingRateImageNV}},
-    {"vkCmdSetViewportShadingRatePaletteNV", {kFuncTypeDev, (void*)CmdSetViewportShadingRatePaletteNV}},
-    {"vkCmdSetCoarseSampleOrderNV", {kFuncTypeDev, (void*)CmdSetCoarseSampleOrderNV}},
-    {"vkCreateAccelerationStructureNV", {kFuncTypeDev, (void*)CreateAccelerationStructureNV}},
-    {"vkDestroyAccelerationStructureNV", {kFuncTypeDev, (void*)DestroyAccelerationStructureNV}},
-    {"vkGetAccelerationStructureMemoryRequirementsNV", {kFuncTypeDev, (void*)GetAccelerationStructureMemoryRequirementsNV}},
-    {"vkBindAccelerationStructureMemoryNV", {kFuncTypeDev, (void*)BindAccelerationStructureMemoryNV}},
-    {"vkCmdBuildAccelerationStructureNV", {kFuncTypeDev, (void*)CmdBuildAccelerationStructureNV}},
-    {"vkCmdCopyAccelerationStructureNV", {kFuncTypeDev, (void*)CmdCopyAccelerationStructureNV}},
-    {"vkCmdTraceRaysNV", {kFuncTypeDev, (void*)CmdTraceRaysNV}},
-    {"vkCreateRayTracingPipelinesNV", {kFuncTypeDev, (void*)CreateRayTracingPipelinesNV}},
-    {"vkGetRayTracingShaderGroupHandlesKHR", {kFuncTypeDev, (void*)GetRayTracingShaderGroupHandlesKHR}},
-    {"vkGetRayTracingShaderGroupHandlesNV", {kFuncTypeDev, (void*)GetRayTracingShaderGroupHandlesNV}},
-    {"vkGetAccelerationStructureHandleNV", {kFuncTypeDev, (void*)GetAccelerationStructureHandleNV}},
-    {"vkCmdWriteAccelerationStructuresPropertiesNV", {kFuncTypeDev, (void*)CmdWriteAccelerationStructuresPropertiesNV}},
-    {"vkCompileDeferredNV", {kFuncTypeDev, (void*)CompileDeferredNV}},
-    {"vkGetMemoryHostPointerPropertiesEXT", {kFuncTypeDev, (void*)GetMemoryHostPointerPropertiesEXT}},
-    {"vkCmdWriteBufferMarkerAMD", {kFuncTypeDev, (void*)CmdWriteBufferMarkerAMD}},
-    {"vkGetPhysicalDeviceCalibrateableTimeDomainsEXT", {kFuncTypePdev, (void*)GetPhysicalDeviceCalibrateableTimeDomainsEXT}},
-    {"vkGetCalibratedTimestampsEXT", {kFuncTypeDev, (void*)GetCalibratedTimestampsEXT}},
-    {"vkCmdDrawMeshTasksNV", {kFuncTypeDev, (void*)CmdDrawMeshTasksNV}},
-    {"vkCmdDrawMeshTasksIndirectNV", {kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectNV}},
-    {"vkCmdDrawMeshTasksIndirectCountNV", {kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectCountNV}},
-    {"vkCmdSetExclusiveScissorEnableNV", {kFuncTypeDev, (void*)CmdSetExclusiveScissorEnableNV}},
-    {"vkCmdSetExclusiveScissorNV", {kFuncTypeDev, (void*)CmdSetExclusiveScissorNV}},
-    {"vkCmdSetCheckpointNV", {kFuncTypeDev, (void*)CmdSetCheckpointNV}},
-    {"vkGetQueueCheckpointDataNV", {kFuncTypeDev, (void*)GetQueueCheckpointDataNV}},
-    {"vkInitializePerformanceApiINTEL", {kFuncTypeDev, (void*)InitializePerformanceApiINTEL}},
-    {"vkUninitializePerformanceApiINTEL", {kFuncTypeDev, (void*)UninitializePerformanceApiINTEL}},
-    {"vkCmdSetPerformanceMarkerINTEL", {kFuncTypeDev, (void*)CmdSetPerformanceMarkerINTEL}},
-    {"vkCmdSetPerformanceStreamMarkerINTEL", {kFuncTypeDev, (void*)CmdSetPerformanceStreamMarkerINTEL}},
-    {"vkCmdSetPerformanceOverrideINTEL", {kFuncTypeDev, (void*)CmdSetPerformanceOverrideINTEL}},
-    {"vkAcquirePerformanceConfigurationINTEL", {kFuncTypeDev, (void*)AcquirePerformanceConfigurationINTEL}},
-    {"vkReleasePerformanceConfigurationINTEL", {kFuncTypeDev, (void*)ReleasePerformanceConfigurationINTEL}},
-    {"vkQueueSetPerformanceConfigurationINTEL", {kFuncTypeDev, (void*)QueueSetPerformanceConfigurationINTEL}},
-    {"vkGetPerformanceParameterINTEL", {kFuncTypeDev, (void*)GetPerformanceParameterINTEL}},
-    {"vkSetLocalDimmingAMD", {kFuncTypeDev, (void*)SetLocalDimmingAMD}},
+    {"vkCreateInstance", kFuncTypeInst, (void*)CreateInstance},
+    {"vkCmdBindVertexBuffers", kFuncTypeDev, (void*)CmdBindVertexBuffers},
+    {"vkCmdDrawClusterIndirectHUAWEI", kFuncTypeDev, (void*)CmdDrawClusterIndirectHUAWEI},
+    {"vkGetPhysicalDeviceSurfaceSupportKHR", kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceSupportKHR},
+    {"vkCmdResolveImage2", kFuncTypeDev, (void*)CmdResolveImage2},
+    {"vkMapMemory2KHR", kFuncTypeDev, (void*)MapMemory2KHR},
+    {"vkCmdCopyMemoryIndirectNV", kFuncTypeDev, (void*)CmdCopyMemoryIndirectNV},
+    {"vkCmdSetDepthBias2EXT", kFuncTypeDev, (void*)CmdSetDepthBias2EXT},
+    {"vkCmdSetDepthBias", kFuncTypeDev, (void*)CmdSetDepthBias},
+    {"vkRegisterDisplayEventEXT", kFuncTypeDev, (void*)RegisterDisplayEventEXT},
+    {"vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV", kFuncTypePdev, (void*)GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV},
+    {"vkQueueSubmit2KHR", kFuncTypeDev, (void*)QueueSubmit2KHR},
+    {"vkGetPhysicalDeviceCooperativeMatrixPropertiesNV", kFuncTypePdev, (void*)GetPhysicalDeviceCooperativeMatrixPropertiesNV},
+    {"vkCmdSetAttachmentFeedbackLoopEnableEXT", kFuncTypeDev, (void*)CmdSetAttachmentFeedbackLoopEnableEXT},
 #ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkCreateImagePipeSurfaceFUCHSIA", {kFuncTypeInst, (void*)CreateImagePipeSurfaceFUCHSIA}},
+    {"vkSetBufferCollectionImageConstraintsFUCHSIA", kFuncTypeDev, (void*)SetBufferCollectionImageConstraintsFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_METAL_EXT
-    {"vkCreateMetalSurfaceEXT", {kFuncTypeInst, (void*)CreateMetalSurfaceEXT}},
+    {"vkCopyMicromapEXT", kFuncTypeDev, (void*)CopyMicromapEXT},
+    {"vkGetBufferOpaqueCaptureAddressKHR", kFuncTypeDev, (void*)GetBufferOpaqueCaptureAddressKHR},
+    {"vkGetDeviceImageMemoryRequirements", kFuncTypeDev, (void*)GetDeviceImageMemoryRequirements},
+    {"vkWriteAccelerationStructuresPropertiesKHR", kFuncTypeDev, (void*)WriteAccelerationStructuresPropertiesKHR},
+    {"vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR", kFuncTypePdev, (void*)EnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR},
+    {"vkCmdDrawIndirect", kFuncTypeDev, (void*)CmdDrawIndirect},
+    {"vkGetDeviceMicromapCompatibilityEXT", kFuncTypeDev, (void*)GetDeviceMicromapCompatibilityEXT},
+    {"vkGetAccelerationStructureBuildSizesKHR", kFuncTypeDev, (void*)GetAccelerationStructureBuildSizesKHR},
+#ifdef VK_USE_PLATFORM_XCB_KHR
+    {"vkGetPhysicalDeviceXcbPresentationSupportKHR", kFuncTypePdev, (void*)GetPhysicalDeviceXcbPresentationSupportKHR},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-    {"vkGetBufferDeviceAddressEXT", {kFuncTypeDev, (void*)GetBufferDeviceAddressEXT}},
-    {"vkGetPhysicalDeviceToolPropertiesEXT", {kFuncTypePdev, (void*)GetPhysicalDeviceToolPropertiesEXT}},
-    {"vkGetPhysicalDeviceCooperativeMatrixPropertiesNV", {kFuncTypePdev, (void*)GetPhysicalDeviceCooperativeMatrixPropertiesNV}},
-    {"vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV", {kFuncTypePdev, (void*)GetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV}},
+    {"vkCmdPipelineBarrier2", kFuncTypeDev, (void*)CmdPipelineBarrier2},
+    {"vkGetPhysicalDeviceSurfaceCapabilitiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceCapabilitiesKHR},
+    {"vkCmdSetColorBlendAdvancedEXT", kFuncTypeDev, (void*)CmdSetColorBlendAdvancedEXT},
+    {"vkCmdTraceRaysKHR", kFuncTypeDev, (void*)CmdTraceRaysKHR},
+    {"vkCreateDebugReportCallbackEXT", kFuncTypeInst, (void*)CreateDebugReportCallbackEXT},
+    {"vkGetMemoryHostPointerPropertiesEXT", kFuncTypeDev, (void*)GetMemoryHostPointerPropertiesEXT},
+    {"vkGetBufferMemoryRequirements", kFuncTypeDev, (void*)GetBufferMemoryRequirements},
+    {"vkCmdBlitImage2KHR", kFuncTypeDev, (void*)CmdBlitImage2KHR},
+    {"vkDestroyBuffer", kFuncTypeDev, (void*)DestroyBuffer},
+    {"vkCreateRayTracingPipelinesNV", kFuncTypeDev, (void*)CreateRayTracingPipelinesNV},
+    {"vkGetQueueCheckpointData2NV", kFuncTypeDev, (void*)GetQueueCheckpointData2NV},
+    {"vkCreateDescriptorUpdateTemplate", kFuncTypeDev, (void*)CreateDescriptorUpdateTemplate},
+    {"vkCreateValidationCacheEXT", kFuncTypeDev, (void*)CreateValidationCacheEXT},
+    {"vkCmdBindDescriptorBufferEmbeddedSamplersEXT", kFuncTypeDev, (void*)CmdBindDescriptorBufferEmbeddedSamplersEXT},
+    {"vkCreateEvent", kFuncTypeDev, (void*)CreateEvent},
+    {"vkGetPhysicalDeviceMemoryProperties2", kFuncTypePdev, (void*)GetPhysicalDeviceMemoryProperties2},
+    {"vkDestroyIndirectCommandsLayoutNV", kFuncTypeDev, (void*)DestroyIndirectCommandsLayoutNV},
+    {"vkDestroyImageView", kFuncTypeDev, (void*)DestroyImageView},
+    {"vkCmdBeginRenderPass2", kFuncTypeDev, (void*)CmdBeginRenderPass2},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetPhysicalDeviceSurfacePresentModes2EXT", {kFuncTypePdev, (void*)GetPhysicalDeviceSurfacePresentModes2EXT}},
+    {"vkGetWinrtDisplayNV", kFuncTypePdev, (void*)GetWinrtDisplayNV},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkAcquireFullScreenExclusiveModeEXT", {kFuncTypeDev, (void*)AcquireFullScreenExclusiveModeEXT}},
+    {"vkCmdWriteMicromapsPropertiesEXT", kFuncTypeDev, (void*)CmdWriteMicromapsPropertiesEXT},
+    {"vkCreateAccelerationStructureNV", kFuncTypeDev, (void*)CreateAccelerationStructureNV},
+    {"vk_layerGetPhysicalDeviceProcAddr", kFuncTypeInst, (void*)GetPhysicalDeviceProcAddr},
+    {"vkCmdSetAlphaToCoverageEnableEXT", kFuncTypeDev, (void*)CmdSetAlphaToCoverageEnableEXT},
+    {"vkCmdSetDepthWriteEnableEXT", kFuncTypeDev, (void*)CmdSetDepthWriteEnableEXT},
+#ifdef VK_USE_PLATFORM_WAYLAND_KHR
+    {"vkGetPhysicalDeviceWaylandPresentationSupportKHR", kFuncTypePdev, (void*)GetPhysicalDeviceWaylandPresentationSupportKHR},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkReleaseFullScreenExclusiveModeEXT", {kFuncTypeDev, (void*)ReleaseFullScreenExclusiveModeEXT}},
+    {"vkGetDeviceFaultInfoEXT", kFuncTypeDev, (void*)GetDeviceFaultInfoEXT},
+    {"vkGetPhysicalDeviceToolProperties", kFuncTypePdev, (void*)GetPhysicalDeviceToolProperties},
+#ifdef VK_USE_PLATFORM_METAL_EXT
+    {"vkExportMetalObjectsEXT", kFuncTypeDev, (void*)ExportMetalObjectsEXT},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetDeviceGroupSurfacePresentModes2EXT", {kFuncTypeDev, (void*)GetDeviceGroupSurfacePresentModes2EXT}},
+    {"vkAcquireFullScreenExclusiveModeEXT", kFuncTypeDev, (void*)AcquireFullScreenExclusiveModeEXT},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-    {"vkCreateHeadlessSurfaceEXT", {kFuncTypeInst, (void*)CreateHeadlessSurfaceEXT}},
-    {"vkCmdSetLineStippleEXT", {kFuncTypeDev, (void*)CmdSetLineStippleEXT}},
-    {"vkResetQueryPoolEXT", {kFuncTypeDev, (void*)ResetQueryPoolEXT}},
-    {"vkCmdSetCullModeEXT", {kFuncTypeDev, (void*)CmdSetCullModeEXT}},
-    {"vkCmdSetFrontFaceEXT", {kFuncTypeDev, (void*)CmdSetFrontFaceEXT}},
-    {"vkCmdSetPrimitiveTopologyEXT", {kFuncTypeDev, (void*)CmdSetPrimitiveTopologyEXT}},
-    {"vkCmdSetViewportWithCountEXT", {kFuncTypeDev, (void*)CmdSetViewportWithCountEXT}},
-    {"vkCmdSetScissorWithCountEXT", {kFuncTypeDev, (void*)CmdSetScissorWithCountEXT}},
-    {"vkCmdBindVertexBuffers2EXT", {kFuncTypeDev, (void*)CmdBindVertexBuffers2EXT}},
-    {"vkCmdSetDepthTestEnableEXT", {kFuncTypeDev, (void*)CmdSetDepthTestEnableEXT}},
-    {"vkCmdSetDepthWriteEnableEXT", {kFuncTypeDev, (void*)CmdSetDepthWriteEnableEXT}},
-    {"vkCmdSetDepthCompareOpEXT", {kFuncTypeDev, (void*)CmdSetDepthCompareOpEXT}},
-    {"vkCmdSetDepthBoundsTestEnableEXT", {kFuncTypeDev, (void*)CmdSetDepthBoundsTestEnableEXT}},
-    {"vkCmdSetStencilTestEnableEXT", {kFuncTypeDev, (void*)CmdSetStencilTestEnableEXT}},
-    {"vkCmdSetStencilOpEXT", {kFuncTypeDev, (void*)CmdSetStencilOpEXT}},
-    {"vkReleaseSwapchainImagesEXT", {kFuncTypeDev, (void*)ReleaseSwapchainImagesEXT}},
-    {"vkGetGeneratedCommandsMemoryRequirementsNV", {kFuncTypeDev, (void*)GetGeneratedCommandsMemoryRequirementsNV}},
-    {"vkCmdPreprocessGeneratedCommandsNV", {kFuncTypeDev, (void*)CmdPreprocessGeneratedCommandsNV}},
-    {"vkCmdExecuteGeneratedCommandsNV", {kFuncTypeDev, (void*)CmdExecuteGeneratedCommandsNV}},
-    {"vkCmdBindPipelineShaderGroupNV", {kFuncTypeDev, (void*)CmdBindPipelineShaderGroupNV}},
-    {"vkCreateIndirectCommandsLayoutNV", {kFuncTypeDev, (void*)CreateIndirectCommandsLayoutNV}},
-    {"vkDestroyIndirectCommandsLayoutNV", {kFuncTypeDev, (void*)DestroyIndirectCommandsLayoutNV}},
-    {"vkCmdSetDepthBias2EXT", {kFuncTypeDev, (void*)CmdSetDepthBias2EXT}},
-    {"vkAcquireDrmDisplayEXT", {kFuncTypePdev, (void*)AcquireDrmDisplayEXT}},
-    {"vkGetDrmDisplayEXT", {kFuncTypePdev, (void*)GetDrmDisplayEXT}},
-    {"vkCreatePrivateDataSlotEXT", {kFuncTypeDev, (void*)CreatePrivateDataSlotEXT}},
-    {"vkDestroyPrivateDataSlotEXT", {kFuncTypeDev, (void*)DestroyPrivateDataSlotEXT}},
-    {"vkSetPrivateDataEXT", {kFuncTypeDev, (void*)SetPrivateDataEXT}},
-    {"vkGetPrivateDataEXT", {kFuncTypeDev, (void*)GetPrivateDataEXT}},
-#ifdef VK_USE_PLATFORM_METAL_EXT
-    {"vkExportMetalObjectsEXT", {kFuncTypeDev, (void*)ExportMetalObjectsEXT}},
+    {"vkResetQueryPoolEXT", kFuncTypeDev, (void*)ResetQueryPoolEXT},
+    {"vkDestroySamplerYcbcrConversionKHR", kFuncTypeDev, (void*)DestroySamplerYcbcrConversionKHR},
+    {"vkCmdCopyMicromapToMemoryEXT", kFuncTypeDev, (void*)CmdCopyMicromapToMemoryEXT},
+    {"vkCreateAccelerationStructureKHR", kFuncTypeDev, (void*)CreateAccelerationStructureKHR},
+    {"vkGetDescriptorSetHostMappingVALVE", kFuncTypeDev, (void*)GetDescriptorSetHostMappingVALVE},
+    {"vkCmdSetDepthClipEnableEXT", kFuncTypeDev, (void*)CmdSetDepthClipEnableEXT},
+    {"vkUnmapMemory2KHR", kFuncTypeDev, (void*)UnmapMemory2KHR},
+    {"vkCmdSetPrimitiveRestartEnableEXT", kFuncTypeDev, (void*)CmdSetPrimitiveRestartEnableEXT},
+    {"vkGetDisplayPlaneCapabilities2KHR", kFuncTypePdev, (void*)GetDisplayPlaneCapabilities2KHR},
+    {"vkGetPhysicalDeviceImageFormatProperties2", kFuncTypePdev, (void*)GetPhysicalDeviceImageFormatProperties2},
+    {"vkDestroyEvent", kFuncTypeDev, (void*)DestroyEvent},
+    {"vkGetPipelineExecutableInternalRepresentationsKHR", kFuncTypeDev, (void*)GetPipelineExecutableInternalRepresentationsKHR},
+    {"vkBeginCommandBuffer", kFuncTypeDev, (void*)BeginCommandBuffer},
+    {"vkGetPhysicalDeviceSurfaceFormatsKHR", kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceFormatsKHR},
+#ifdef VK_USE_PLATFORM_VI_NN
+    {"vkCreateViSurfaceNN", kFuncTypeInst, (void*)CreateViSurfaceNN},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkGetDescriptorSetLayoutSizeEXT", {kFuncTypeDev, (void*)GetDescriptorSetLayoutSizeEXT}},
-    {"vkGetDescriptorSetLayoutBindingOffsetEXT", {kFuncTypeDev, (void*)GetDescriptorSetLayoutBindingOffsetEXT}},
-    {"vkGetDescriptorEXT", {kFuncTypeDev, (void*)GetDescriptorEXT}},
-    {"vkCmdBindDescriptorBuffersEXT", {kFuncTypeDev, (void*)CmdBindDescriptorBuffersEXT}},
-    {"vkCmdSetDescriptorBufferOffsetsEXT", {kFuncTypeDev, (void*)CmdSetDescriptorBufferOffsetsEXT}},
-    {"vkCmdBindDescriptorBufferEmbeddedSamplersEXT", {kFuncTypeDev, (void*)CmdBindDescriptorBufferEmbeddedSamplersEXT}},
-    {"vkGetBufferOpaqueCaptureDescriptorDataEXT", {kFuncTypeDev, (void*)GetBufferOpaqueCaptureDescriptorDataEXT}},
-    {"vkGetImageOpaqueCaptureDescriptorDataEXT", {kFuncTypeDev, (void*)GetImageOpaqueCaptureDescriptorDataEXT}},
-    {"vkGetImageViewOpaqueCaptureDescriptorDataEXT", {kFuncTypeDev, (void*)GetImageViewOpaqueCaptureDescriptorDataEXT}},
-    {"vkGetSamplerOpaqueCaptureDescriptorDataEXT", {kFuncTypeDev, (void*)GetSamplerOpaqueCaptureDescriptorDataEXT}},
-    {"vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT", {kFuncTypeDev, (void*)GetAccelerationStructureOpaqueCaptureDescriptorDataEXT}},
-    {"vkCmdSetFragmentShadingRateEnumNV", {kFuncTypeDev, (void*)CmdSetFragmentShadingRateEnumNV}},
-    {"vkGetImageSubresourceLayout2EXT", {kFuncTypeDev, (void*)GetImageSubresourceLayout2EXT}},
-    {"vkGetDeviceFaultInfoEXT", {kFuncTypeDev, (void*)GetDeviceFaultInfoEXT}},
+    {"vkGetImageOpaqueCaptureDescriptorDataEXT", kFuncTypeDev, (void*)GetImageOpaqueCaptureDescriptorDataEXT},
+    {"vkBindAccelerationStructureMemoryNV", kFuncTypeDev, (void*)BindAccelerationStructureMemoryNV},
+    {"vkCmdBeginVideoCodingKHR", kFuncTypeDev, (void*)CmdBeginVideoCodingKHR},
+    {"vkCmdEndRenderPass2KHR", kFuncTypeDev, (void*)CmdEndRenderPass2KHR},
+    {"vkGetPastPresentationTimingGOOGLE", kFuncTypeDev, (void*)GetPastPresentationTimingGOOGLE},
+    {"vkCreateShadersEXT", kFuncTypeDev, (void*)CreateShadersEXT},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkAcquireWinrtDisplayNV", {kFuncTypePdev, (void*)AcquireWinrtDisplayNV}},
+    {"vkGetPhysicalDeviceSurfacePresentModes2EXT", kFuncTypePdev, (void*)GetPhysicalDeviceSurfacePresentModes2EXT},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
+    {"vkCreateVideoSessionKHR", kFuncTypeDev, (void*)CreateVideoSessionKHR},
+    {"vkDestroyCuModuleNVX", kFuncTypeDev, (void*)DestroyCuModuleNVX},
+    {"vkCmdSetExclusiveScissorEnableNV", kFuncTypeDev, (void*)CmdSetExclusiveScissorEnableNV},
+    {"vkCmdSetRayTracingPipelineStackSizeKHR", kFuncTypeDev, (void*)CmdSetRayTracingPipelineStackSizeKHR},
+    {"vkGetFramebufferTilePropertiesQCOM", kFuncTypeDev, (void*)GetFramebufferTilePropertiesQCOM},
+    {"vkDestroyBufferView", kFuncTypeDev, (void*)DestroyBufferView},
+    {"vkDestroyDescriptorUpdateTemplateKHR", kFuncTypeDev, (void*)DestroyDescriptorUpdateTemplateKHR},
 #ifdef VK_USE_PLATFORM_WIN32_KHR
-    {"vkGetWinrtDisplayNV", {kFuncTypePdev, (void*)GetWinrtDisplayNV}},
+    {"vkGetMemoryWin32HandleKHR", kFuncTypeDev, (void*)GetMemoryWin32HandleKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_DIRECTFB_EXT
-    {"vkCreateDirectFBSurfaceEXT", {kFuncTypeInst, (void*)CreateDirectFBSurfaceEXT}},
+    {"vkGetDeviceGroupPeerMemoryFeaturesKHR", kFuncTypeDev, (void*)GetDeviceGroupPeerMemoryFeaturesKHR},
+    {"vkCreateDescriptorUpdateTemplateKHR", kFuncTypeDev, (void*)CreateDescriptorUpdateTemplateKHR},
+    {"vkCmdSetBlendConstants", kFuncTypeDev, (void*)CmdSetBlendConstants},
+    {"vkCmdSetDiscardRectangleEnableEXT", kFuncTypeDev, (void*)CmdSetDiscardRectangleEnableEXT},
+    {"vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceCooperativeMatrixPropertiesKHR},
+    {"vkCmdSetEvent2", kFuncTypeDev, (void*)CmdSetEvent2},
+    {"vkCreateSwapchainKHR", kFuncTypeDev, (void*)CreateSwapchainKHR},
+    {"vkCmdSetDepthClipNegativeOneToOneEXT", kFuncTypeDev, (void*)CmdSetDepthClipNegativeOneToOneEXT},
+    {"vkGetPipelinePropertiesEXT", kFuncTypeDev, (void*)GetPipelinePropertiesEXT},
+#ifdef VK_USE_PLATFORM_XCB_KHR
+    {"vkCreateXcbSurfaceKHR", kFuncTypeInst, (void*)CreateXcbSurfaceKHR},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_DIRECTFB_EXT
-    {"vkGetPhysicalDeviceDirectFBPresentationSupportEXT", {kFuncTypePdev, (void*)GetPhysicalDeviceDirectFBPresentationSupportEXT}},
+    {"vkImportFenceFdKHR", kFuncTypeDev, (void*)ImportFenceFdKHR},
+    {"vkCmdBlitImage2", kFuncTypeDev, (void*)CmdBlitImage2},
+    {"vkGetImageSparseMemoryRequirements", kFuncTypeDev, (void*)GetImageSparseMemoryRequirements},
+#ifdef VK_USE_PLATFORM_GGP
+    {"vkCreateStreamDescriptorSurfaceGGP", kFuncTypeInst, (void*)CreateStreamDescriptorSurfaceGGP},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkCmdSetVertexInputEXT", {kFuncTypeDev, (void*)CmdSetVertexInputEXT}},
+    {"vkGetPerformanceParameterINTEL", kFuncTypeDev, (void*)GetPerformanceParameterINTEL},
+    {"vkCmdDrawMeshTasksIndirectEXT", kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectEXT},
+    {"vkGetImageSubresourceLayout2EXT", kFuncTypeDev, (void*)GetImageSubresourceLayout2EXT},
+    {"vkCmdBindPipelineShaderGroupNV", kFuncTypeDev, (void*)CmdBindPipelineShaderGroupNV},
+    {"vkGetPhysicalDeviceExternalBufferPropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceExternalBufferPropertiesKHR},
+    {"vkCreatePrivateDataSlotEXT", kFuncTypeDev, (void*)CreatePrivateDataSlotEXT},
+    {"vkDestroySurfaceKHR", kFuncTypeInst, (void*)DestroySurfaceKHR},
 #ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkGetMemoryZirconHandleFUCHSIA", {kFuncTypeDev, (void*)GetMemoryZirconHandleFUCHSIA}},
+    {"vkSetBufferCollectionBufferConstraintsFUCHSIA", kFuncTypeDev, (void*)SetBufferCollectionBufferConstraintsFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkGetMemoryZirconHandlePropertiesFUCHSIA", {kFuncTypeDev, (void*)GetMemoryZirconHandlePropertiesFUCHSIA}},
+    {"vkGetAccelerationStructureDeviceAddressKHR", kFuncTypeDev, (void*)GetAccelerationStructureDeviceAddressKHR},
+    {"vkCmdInsertDebugUtilsLabelEXT", kFuncTypeDev, (void*)CmdInsertDebugUtilsLabelEXT},
+    {"vkEnumeratePhysicalDevices", kFuncTypeInst, (void*)EnumeratePhysicalDevices},
+    {"vkCmdSetLogicOpEXT", kFuncTypeDev, (void*)CmdSetLogicOpEXT},
+    {"vkCreateComputePipelines", kFuncTypeDev, (void*)CreateComputePipelines},
+    {"vkCmdSetCoverageToColorEnableNV", kFuncTypeDev, (void*)CmdSetCoverageToColorEnableNV},
+    {"vkGetDisplayModeProperties2KHR", kFuncTypePdev, (void*)GetDisplayModeProperties2KHR},
+    {"vkDeviceWaitIdle", kFuncTypeDev, (void*)DeviceWaitIdle},
+    {"vkCmdPushDescriptorSetWithTemplateKHR", kFuncTypeDev, (void*)CmdPushDescriptorSetWithTemplateKHR},
+    {"vkGetPhysicalDeviceExternalBufferProperties", kFuncTypePdev, (void*)GetPhysicalDeviceExternalBufferProperties},
+    {"vkDestroySemaphore", kFuncTypeDev, (void*)DestroySemaphore},
+    {"vkCmdSetViewportWithCount", kFuncTypeDev, (void*)CmdSetViewportWithCount},
+    {"vkUpdateVideoSessionParametersKHR", kFuncTypeDev, (void*)UpdateVideoSessionParametersKHR},
+#ifdef VK_USE_PLATFORM_ANDROID_KHR
+    {"vkGetMemoryAndroidHardwareBufferANDROID", kFuncTypeDev, (void*)GetMemoryAndroidHardwareBufferANDROID},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkImportSemaphoreZirconHandleFUCHSIA", {kFuncTypeDev, (void*)ImportSemaphoreZirconHandleFUCHSIA}},
+    {"vkCmdSetCoverageModulationTableEnableNV", kFuncTypeDev, (void*)CmdSetCoverageModulationTableEnableNV},
+    {"vkCmdClearAttachments", kFuncTypeDev, (void*)CmdClearAttachments},
+    {"vkCreateDisplayPlaneSurfaceKHR", kFuncTypeInst, (void*)CreateDisplayPlaneSurfaceKHR},
+    {"vkDestroyPrivateDataSlotEXT", kFuncTypeDev, (void*)DestroyPrivateDataSlotEXT},
+    {"vkSetDebugUtilsObjectTagEXT", kFuncTypeDev, (void*)SetDebugUtilsObjectTagEXT},
+#ifdef VK_USE_PLATFORM_ANDROID_KHR
+    {"vkGetAndroidHardwareBufferPropertiesANDROID", kFuncTypeDev, (void*)GetAndroidHardwareBufferPropertiesANDROID},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
+    {"vkCmdCopyAccelerationStructureToMemoryKHR", kFuncTypeDev, (void*)CmdCopyAccelerationStructureToMemoryKHR},
+    {"vkCmdEndRendering", kFuncTypeDev, (void*)CmdEndRendering},
+    {"vkGetDeviceMemoryOpaqueCaptureAddress", kFuncTypeDev, (void*)GetDeviceMemoryOpaqueCaptureAddress},
+    {"vkCmdSetPolygonModeEXT", kFuncTypeDev, (void*)CmdSetPolygonModeEXT},
+    {"vkCmdDrawMeshTasksIndirectNV", kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectNV},
+    {"vkCmdSetConservativeRasterizationModeEXT", kFuncTypeDev, (void*)CmdSetConservativeRasterizationModeEXT},
+    {"vkDestroyPipeline", kFuncTypeDev, (void*)DestroyPipeline},
+    {"vkCreateRenderPass", kFuncTypeDev, (void*)CreateRenderPass},
+    {"vkCmdResetQueryPool", kFuncTypeDev, (void*)CmdResetQueryPool},
+    {"vkGetPhysicalDeviceOpticalFlowImageFormatsNV", kFuncTypePdev, (void*)GetPhysicalDeviceOpticalFlowImageFormatsNV},
+    {"vkCmdFillBuffer", kFuncTypeDev, (void*)CmdFillBuffer},
+    {"vkGetPhysicalDeviceFormatProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceFormatProperties2KHR},
+    {"vkGetQueueCheckpointDataNV", kFuncTypeDev, (void*)GetQueueCheckpointDataNV},
+    {"vkCmdDrawMeshTasksNV", kFuncTypeDev, (void*)CmdDrawMeshTasksNV},
+    {"vkDestroyDescriptorPool", kFuncTypeDev, (void*)DestroyDescriptorPool},
+    {"vkQueueBindSparse", kFuncTypeDev, (void*)QueueBindSparse},
+    {"vkCmdWaitEvents2", kFuncTypeDev, (void*)CmdWaitEvents2},
+    {"vkDebugMarkerSetObjectNameEXT", kFuncTypeDev, (void*)DebugMarkerSetObjectNameEXT},
+    {"vkCmdNextSubpass", kFuncTypeDev, (void*)CmdNextSubpass},
 #ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkGetSemaphoreZirconHandleFUCHSIA", {kFuncTypeDev, (void*)GetSemaphoreZirconHandleFUCHSIA}},
+    {"vkGetSemaphoreZirconHandleFUCHSIA", kFuncTypeDev, (void*)GetSemaphoreZirconHandleFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkCreateBufferCollectionFUCHSIA", {kFuncTypeDev, (void*)CreateBufferCollectionFUCHSIA}},
+    {"vkCmdSetDeviceMaskKHR", kFuncTypeDev, (void*)CmdSetDeviceMaskKHR},
+    {"vkCmdSetPerformanceOverrideINTEL", kFuncTypeDev, (void*)CmdSetPerformanceOverrideINTEL},
+    {"vkCmdSetSampleLocationsEnableEXT", kFuncTypeDev, (void*)CmdSetSampleLocationsEnableEXT},
+    {"vkQueueSetPerformanceConfigurationINTEL", kFuncTypeDev, (void*)QueueSetPerformanceConfigurationINTEL},
+    {"vkCmdCopyBuffer2KHR", kFuncTypeDev, (void*)CmdCopyBuffer2KHR},
+    {"vkCmdResetEvent2", kFuncTypeDev, (void*)CmdResetEvent2},
+    {"vkEnumerateDeviceLayerProperties", kFuncTypePdev, (void*)EnumerateDeviceLayerProperties},
+    {"vkCmdBuildAccelerationStructuresIndirectKHR", kFuncTypeDev, (void*)CmdBuildAccelerationStructuresIndirectKHR},
+#ifdef VK_USE_PLATFORM_WAYLAND_KHR
+    {"vkCreateWaylandSurfaceKHR", kFuncTypeInst, (void*)CreateWaylandSurfaceKHR},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkSetBufferCollectionImageConstraintsFUCHSIA", {kFuncTypeDev, (void*)SetBufferCollectionImageConstraintsFUCHSIA}},
+    {"vkCmdEndTransformFeedbackEXT", kFuncTypeDev, (void*)CmdEndTransformFeedbackEXT},
+    {"vkGetPrivateData", kFuncTypeDev, (void*)GetPrivateData},
+    {"vkCmdSetViewportWithCountEXT", kFuncTypeDev, (void*)CmdSetViewportWithCountEXT},
+    {"vkDestroyAccelerationStructureKHR", kFuncTypeDev, (void*)DestroyAccelerationStructureKHR},
+#ifdef VK_USE_PLATFORM_WIN32_KHR
+    {"vkGetMemoryWin32HandleNV", kFuncTypeDev, (void*)GetMemoryWin32HandleNV},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkSetBufferCollectionBufferConstraintsFUCHSIA", {kFuncTypeDev, (void*)SetBufferCollectionBufferConstraintsFUCHSIA}},
+    {"vkGetPhysicalDeviceSparseImageFormatProperties2", kFuncTypePdev, (void*)GetPhysicalDeviceSparseImageFormatProperties2},
+    {"vkGetDeviceGroupPeerMemoryFeatures", kFuncTypeDev, (void*)GetDeviceGroupPeerMemoryFeatures},
+    {"vkGetPhysicalDeviceMemoryProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceMemoryProperties2KHR},
+    {"vkCreateBuffer", kFuncTypeDev, (void*)CreateBuffer},
+    {"vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR},
+    {"vkGetDeviceAccelerationStructureCompatibilityKHR", kFuncTypeDev, (void*)GetDeviceAccelerationStructureCompatibilityKHR},
+    {"vkCreateRayTracingPipelinesKHR", kFuncTypeDev, (void*)CreateRayTracingPipelinesKHR},
+    {"vkCmdBindDescriptorSets", kFuncTypeDev, (void*)CmdBindDescriptorSets},
+    {"vkCmdDrawIndirectCountKHR", kFuncTypeDev, (void*)CmdDrawIndirectCountKHR},
+    {"vkGetDescriptorSetLayoutHostMappingInfoVALVE", kFuncTypeDev, (void*)GetDescriptorSetLayoutHostMappingInfoVALVE},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+    {"vkCmdEncodeVideoKHR", kFuncTypeDev, (void*)CmdEncodeVideoKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkDestroyBufferCollectionFUCHSIA", {kFuncTypeDev, (void*)DestroyBufferCollectionFUCHSIA}},
+    {"vkCmdSetSampleMaskEXT", kFuncTypeDev, (void*)CmdSetSampleMaskEXT},
+    {"vkUninitializePerformanceApiINTEL", kFuncTypeDev, (void*)UninitializePerformanceApiINTEL},
+    {"vkBindImageMemory", kFuncTypeDev, (void*)BindImageMemory},
+    {"vkBindImageMemory2", kFuncTypeDev, (void*)BindImageMemory2},
+    {"vkCmdSetCullMode", kFuncTypeDev, (void*)CmdSetCullMode},
+    {"vkGetPhysicalDeviceFormatProperties", kFuncTypePdev, (void*)GetPhysicalDeviceFormatProperties},
+    {"vkCmdWriteTimestamp", kFuncTypeDev, (void*)CmdWriteTimestamp},
+    {"vkDestroyPipelineCache", kFuncTypeDev, (void*)DestroyPipelineCache},
+    {"vkCmdCopyImageToBuffer2", kFuncTypeDev, (void*)CmdCopyImageToBuffer2},
+    {"vkCmdSetCoverageModulationTableNV", kFuncTypeDev, (void*)CmdSetCoverageModulationTableNV},
+    {"vkGetPhysicalDeviceQueueFamilyProperties2", kFuncTypePdev, (void*)GetPhysicalDeviceQueueFamilyProperties2},
+    {"vkCmdBindPipeline", kFuncTypeDev, (void*)CmdBindPipeline},
+    {"vkGetPhysicalDeviceSurfaceCapabilities2EXT", kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceCapabilities2EXT},
+    {"vkDestroyQueryPool", kFuncTypeDev, (void*)DestroyQueryPool},
+    {"vkCmdPushDescriptorSetKHR", kFuncTypeDev, (void*)CmdPushDescriptorSetKHR},
+    {"vkCreateRenderPass2KHR", kFuncTypeDev, (void*)CreateRenderPass2KHR},
+    {"vkCmdDrawIndexedIndirectCountKHR", kFuncTypeDev, (void*)CmdDrawIndexedIndirectCountKHR},
+    {"vkCmdSetViewportWScalingEnableNV", kFuncTypeDev, (void*)CmdSetViewportWScalingEnableNV},
+    {"vkWaitSemaphores", kFuncTypeDev, (void*)WaitSemaphores},
+    {"vkEnumeratePhysicalDeviceGroups", kFuncTypeInst, (void*)EnumeratePhysicalDeviceGroups},
+    {"vkDeferredOperationJoinKHR", kFuncTypeDev, (void*)DeferredOperationJoinKHR},
+    {"vkCmdSetColorWriteEnableEXT", kFuncTypeDev, (void*)CmdSetColorWriteEnableEXT},
+    {"vkCmdDispatchBase", kFuncTypeDev, (void*)CmdDispatchBase},
+    {"vkBuildMicromapsEXT", kFuncTypeDev, (void*)BuildMicromapsEXT},
+    {"vkCmdPushConstants", kFuncTypeDev, (void*)CmdPushConstants},
+    {"vkFreeMemory", kFuncTypeDev, (void*)FreeMemory},
+#ifdef VK_USE_PLATFORM_WIN32_KHR
+    {"vkReleaseFullScreenExclusiveModeEXT", kFuncTypeDev, (void*)ReleaseFullScreenExclusiveModeEXT},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
+    {"vkCmdDebugMarkerInsertEXT", kFuncTypeDev, (void*)CmdDebugMarkerInsertEXT},
+    {"vkCmdSetFrontFaceEXT", kFuncTypeDev, (void*)CmdSetFrontFaceEXT},
+    {"vkCmdSetShadingRateImageEnableNV", kFuncTypeDev, (void*)CmdSetShadingRateImageEnableNV},
+    {"vkGetPhysicalDeviceSurfaceCapabilities2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceSurfaceCapabilities2KHR},
+    {"vkGetPhysicalDeviceExternalImageFormatPropertiesNV", kFuncTypePdev, (void*)GetPhysicalDeviceExternalImageFormatPropertiesNV},
+#ifdef VK_USE_PLATFORM_WIN32_KHR
+    {"vkGetMemoryWin32HandlePropertiesKHR", kFuncTypeDev, (void*)GetMemoryWin32HandlePropertiesKHR},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
+#endif
+    {"vkCompileDeferredNV", kFuncTypeDev, (void*)CompileDeferredNV},
+    {"vkBindImageMemory2KHR", kFuncTypeDev, (void*)BindImageMemory2KHR},
+    {"vkGetMicromapBuildSizesEXT", kFuncTypeDev, (void*)GetMicromapBuildSizesEXT},
+    {"vkCmdWaitEvents", kFuncTypeDev, (void*)CmdWaitEvents},
 #ifdef VK_USE_PLATFORM_FUCHSIA
-    {"vkGetBufferCollectionPropertiesFUCHSIA", {kFuncTypeDev, (void*)GetBufferCollectionPropertiesFUCHSIA}},
+    {"vkImportSemaphoreZirconHandleFUCHSIA", kFuncTypeDev, (void*)ImportSemaphoreZirconHandleFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-    {"vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI", {kFuncTypeDev, (void*)GetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI}},
-    {"vkCmdSubpassShadingHUAWEI", {kFuncTypeDev, (void*)CmdSubpassShadingHUAWEI}},
-    {"vkCmdBindInvocationMaskHUAWEI", {kFuncTypeDev, (void*)CmdBindInvocationMaskHUAWEI}},
-    {"vkGetMemoryRemoteAddressNV", {kFuncTypeDev, (void*)GetMemoryRemoteAddressNV}},
-    {"vkGetPipelinePropertiesEXT", {kFuncTypeDev, (void*)GetPipelinePropertiesEXT}},
-    {"vkCmdSetPatchControlPointsEXT", {kFuncTypeDev, (void*)CmdSetPatchControlPointsEXT}},
-    {"vkCmdSetRasterizerDiscardEnableEXT", {kFuncTypeDev, (void*)CmdSetRasterizerDiscardEnableEXT}},
-    {"vkCmdSetDepthBiasEnableEXT", {kFuncTypeDev, (void*)CmdSetDepthBiasEnableEXT}},
-    {"vkCmdSetLogicOpEXT", {kFuncTypeDev, (void*)CmdSetLogicOpEXT}},
-    {"vkCmdSetPrimitiveRestartEnableEXT", {kFuncTypeDev, (void*)CmdSetPrimitiveRestartEnableEXT}},
-#ifdef VK_USE_PLATFORM_SCREEN_QNX
-    {"vkCreateScreenSurfaceQNX", {kFuncTypeInst, (void*)CreateScreenSurfaceQNX}},
+    {"vkGetShaderInfoAMD", kFuncTypeDev, (void*)GetShaderInfoAMD},
+    {"vkCreateCuFunctionNVX", kFuncTypeDev, (void*)CreateCuFunctionNVX},
+    {"vkCmdSetPerformanceStreamMarkerINTEL", kFuncTypeDev, (void*)CmdSetPerformanceStreamMarkerINTEL},
+    {"vkCmdBeginQueryIndexedEXT", kFuncTypeDev, (void*)CmdBeginQueryIndexedEXT},
+    {"vkCmdSetEvent", kFuncTypeDev, (void*)CmdSetEvent},
+    {"vkUpdateDescriptorSetWithTemplateKHR", kFuncTypeDev, (void*)UpdateDescriptorSetWithTemplateKHR},
+    {"vkGetSwapchainCounterEXT", kFuncTypeDev, (void*)GetSwapchainCounterEXT},
+    {"vkCmdDrawClusterHUAWEI", kFuncTypeDev, (void*)CmdDrawClusterHUAWEI},
+    {"vkAcquireProfilingLockKHR", kFuncTypeDev, (void*)AcquireProfilingLockKHR},
+    {"vkCreateMicromapEXT", kFuncTypeDev, (void*)CreateMicromapEXT},
+    {"vkCmdDrawMeshTasksIndirectCountNV", kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectCountNV},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+    {"vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR},
+#else
+    {nullptr, kFuncTypePdev, nullptr},
 #endif
-#ifdef VK_USE_PLATFORM_SCREEN_QNX
-    {"vkGetPhysicalDeviceScreenPresentationSupportQNX", {kFuncTypePdev, (void*)GetPhysicalDeviceScreenPresentationSupportQNX}},
+    {"vkCreateSamplerYcbcrConversion", kFuncTypeDev, (void*)CreateSamplerYcbcrConversion},
+    {"vkWaitSemaphoresKHR", kFuncTypeDev, (void*)WaitSemaphoresKHR},
+    {"vkGetDeferredOperationResultKHR", kFuncTypeDev, (void*)GetDeferredOperationResultKHR},
+    {"vkCmdExecuteGeneratedCommandsNV", kFuncTypeDev, (void*)CmdExecuteGeneratedCommandsNV},
+    {"vkGetBufferDeviceAddressEXT", kFuncTypeDev, (void*)GetBufferDeviceAddressEXT},
+    {"vkTrimCommandPool", kFuncTypeDev, (void*)TrimCommandPool},
+    {"vkCmdResetEvent", kFuncTypeDev, (void*)CmdResetEvent},
+    {"vkGetPhysicalDeviceDisplayPlanePropertiesKHR", kFuncTypePdev, (void*)GetPhysicalDeviceDisplayPlanePropertiesKHR},
+    {"vkMapMemory", kFuncTypeDev, (void*)MapMemory},
+    {"vkCreateSemaphore", kFuncTypeDev, (void*)CreateSemaphore},
+    {"vkCreateImageView", kFuncTypeDev, (void*)CreateImageView},
+#ifdef VK_USE_PLATFORM_IOS_MVK
+    {"vkCreateIOSSurfaceMVK", kFuncTypeInst, (void*)CreateIOSSurfaceMVK},
+#else
+    {nullptr, kFuncTypeInst, nullptr},
 #endif
-    {"vkCmdSetColorWriteEnableEXT", {kFuncTypeDev, (void*)CmdSetColorWriteEnableEXT}},
-    {"vkCmdDrawMultiEXT", {kFuncTypeDev, (void*)CmdDrawMultiEXT}},
-    {"vkCmdDrawMultiIndexedEXT", {kFuncTypeDev, (void*)CmdDrawMultiIndexedEXT}},
-    {"vkCreateMicromapEXT", {kFuncTypeDev, (void*)CreateMicromapEXT}},
-    {"vkDestroyMicromapEXT", {kFuncTypeDev, (void*)DestroyMicromapEXT}},
-    {"vkCmdBuildMicromapsEXT", {kFuncTypeDev, (void*)CmdBuildMicromapsEXT}},
-    {"vkBuildMicromapsEXT", {kFuncTypeDev, (void*)BuildMicromapsEXT}},
-    {"vkCopyMicromapEXT", {kFuncTypeDev, (void*)CopyMicromapEXT}},
-    {"vkCopyMicromapToMemoryEXT", {kFuncTypeDev, (void*)CopyMicromapToMemoryEXT}},
-    {"vkCopyMemoryToMicromapEXT", {kFuncTypeDev, (void*)CopyMemoryToMicromapEXT}},
-    {"vkWriteMicromapsPropertiesEXT", {kFuncTypeDev, (void*)WriteMicromapsPropertiesEXT}},
-    {"vkCmdCopyMicromapEXT", {kFuncTypeDev, (void*)CmdCopyMicromapEXT}},
-    {"vkCmdCopyMicromapToMemoryEXT", {kFuncTypeDev, (void*)CmdCopyMicromapToMemoryEXT}},
-    {"vkCmdCopyMemoryToMicromapEXT", {kFuncTypeDev, (void*)CmdCopyMemoryToMicromapEXT}},
-    {"vkCmdWriteMicromapsPropertiesEXT", {kFuncTypeDev, (void*)CmdWriteMicromapsPropertiesEXT}},
-    {"vkGetDeviceMicromapCompatibilityEXT", {kFuncTypeDev, (void*)GetDeviceMicromapCompatibilityEXT}},
-    {"vkGetMicromapBuildSizesEXT", {kFuncTypeDev, (void*)GetMicromapBuildSizesEXT}},
-    {"vkCmdDrawClusterHUAWEI", {kFuncTypeDev, (void*)CmdDrawClusterHUAWEI}},
-    {"vkCmdDrawClusterIndirectHUAWEI", {kFuncTypeDev, (void*)CmdDrawClusterIndirectHUAWEI}},
-    {"vkSetDeviceMemoryPriorityEXT", {kFuncTypeDev, (void*)SetDeviceMemoryPriorityEXT}},
-    {"vkGetDescriptorSetLayoutHostMappingInfoVALVE", {kFuncTypeDev, (void*)GetDescriptorSetLayoutHostMappingInfoVALVE}},
-    {"vkGetDescriptorSetHostMappingVALVE", {kFuncTypeDev, (void*)GetDescriptorSetHostMappingVALVE}},
-    {"vkCmdCopyMemoryIndirectNV", {kFuncTypeDev, (void*)CmdCopyMemoryIndirectNV}},
-    {"vkCmdCopyMemoryToImageIndirectNV", {kFuncTypeDev, (void*)CmdCopyMemoryToImageIndirectNV}},
-    {"vkCmdDecompressMemoryNV", {kFuncTypeDev, (void*)CmdDecompressMemoryNV}},
-    {"vkCmdDecompressMemoryIndirectCountNV", {kFuncTypeDev, (void*)CmdDecompressMemoryIndirectCountNV}},
-    {"vkCmdSetTessellationDomainOriginEXT", {kFuncTypeDev, (void*)CmdSetTessellationDomainOriginEXT}},
-    {"vkCmdSetDepthClampEnableEXT", {kFuncTypeDev, (void*)CmdSetDepthClampEnableEXT}},
-    {"vkCmdSetPolygonModeEXT", {kFuncTypeDev, (void*)CmdSetPolygonModeEXT}},
-    {"vkCmdSetRasterizationSamplesEXT", {kFuncTypeDev, (void*)CmdSetRasterizationSamplesEXT}},
-    {"vkCmdSetSampleMaskEXT", {kFuncTypeDev, (void*)CmdSetSampleMaskEXT}},
-    {"vkCmdSetAlphaToCoverageEnableEXT", {kFuncTypeDev, (void*)CmdSetAlphaToCoverageEnableEXT}},
-    {"vkCmdSetAlphaToOneEnableEXT", {kFuncTypeDev, (void*)CmdSetAlphaToOneEnableEXT}},
-    {"vkCmdSetLogicOpEnableEXT", {kFuncTypeDev, (void*)CmdSetLogicOpEnableEXT}},
-    {"vkCmdSetColorBlendEnableEXT", {kFuncTypeDev, (void*)CmdSetColorBlendEnableEXT}},
-    {"vkCmdSetColorBlendEquationEXT", {kFuncTypeDev, (void*)CmdSetColorBlendEquationEXT}},
-    {"vkCmdSetColorWriteMaskEXT", {kFuncTypeDev, (void*)CmdSetColorWriteMaskEXT}},
-    {"vkCmdSetRasterizationStreamEXT", {kFuncTypeDev, (void*)CmdSetRasterizationStreamEXT}},
-    {"vkCmdSetConservativeRasterizationModeEXT", {kFuncTypeDev, (void*)CmdSetConservativeRasterizationModeEXT}},
-    {"vkCmdSetExtraPrimitiveOverestimationSizeEXT", {kFuncTypeDev, (void*)CmdSetExtraPrimitiveOverestimationSizeEXT}},
-    {"vkCmdSetDepthClipEnableEXT", {kFuncTypeDev, (void*)CmdSetDepthClipEnableEXT}},
-    {"vkCmdSetSampleLocationsEnableEXT", {kFuncTypeDev, (void*)CmdSetSampleLocationsEnableEXT}},
-    {"vkCmdSetColorBlendAdvancedEXT", {kFuncTypeDev, (void*)CmdSetColorBlendAdvancedEXT}},
-    {"vkCmdSetProvokingVertexModeEXT", {kFuncTypeDev, (void*)CmdSetProvokingVertexModeEXT}},
-    {"vkCmdSetLineRasterizationModeEXT", {kFuncTypeDev, (void*)CmdSetLineRasterizationModeEXT}},
-    {"vkCmdSetLineStippleEnableEXT", {kFuncTypeDev, (void*)CmdSetLineStippleEnableEXT}},
-    {"vkCmdSetDepthClipNegativeOneToOneEXT", {kFuncTypeDev, (void*)CmdSetDepthClipNegativeOneToOneEXT}},
-    {"vkCmdSetViewportWScalingEnableNV", {kFuncTypeDev, (void*)CmdSetViewportWScalingEnableNV}},
-    {"vkCmdSetViewportSwizzleNV", {kFuncTypeDev, (void*)CmdSetViewportSwizzleNV}},
-    {"vkCmdSetCoverageToColorEnableNV", {kFuncTypeDev, (void*)CmdSetCoverageToColorEnableNV}},
-    {"vkCmdSetCoverageToColorLocationNV", {kFuncTypeDev, (void*)CmdSetCoverageToColorLocationNV}},
-    {"vkCmdSetCoverageModulationModeNV", {kFuncTypeDev, (void*)CmdSetCoverageModulationModeNV}},
-    {"vkCmdSetCoverageModulationTableEnableNV", {kFuncTypeDev, (void*)CmdSetCoverageModulationTableEnableNV}},
-    {"vkCmdSetCoverageModulationTableNV", {kFuncTypeDev, (void*)CmdSetCoverageModulationTableNV}},
-    {"vkCmdSetShadingRateImageEnableNV", {kFuncTypeDev, (void*)CmdSetShadingRateImageEnableNV}},
-    {"vkCmdSetRepresentativeFragmentTestEnableNV", {kFuncTypeDev, (void*)CmdSetRepresentativeFragmentTestEnableNV}},
-    {"vkCmdSetCoverageReductionModeNV", {kFuncTypeDev, (void*)CmdSetCoverageReductionModeNV}},
-    {"vkGetShaderModuleIdentifierEXT", {kFuncTypeDev, (void*)GetShaderModuleIdentifierEXT}},
-    {"vkGetShaderModuleCreateInfoIdentifierEXT", {kFuncTypeDev, (void*)GetShaderModuleCreateInfoIdentifierEXT}},
-    {"vkGetPhysicalDeviceOpticalFlowImageFormatsNV", {kFuncTypePdev, (void*)GetPhysicalDeviceOpticalFlowImageFormatsNV}},
-    {"vkCreateOpticalFlowSessionNV", {kFuncTypeDev, (void*)CreateOpticalFlowSessionNV}},
-    {"vkDestroyOpticalFlowSessionNV", {kFuncTypeDev, (void*)DestroyOpticalFlowSessionNV}},
-    {"vkBindOpticalFlowSessionImageNV", {kFuncTypeDev, (void*)BindOpticalFlowSessionImageNV}},
-    {"vkCmdOpticalFlowExecuteNV", {kFuncTypeDev, (void*)CmdOpticalFlowExecuteNV}},
-    {"vkCreateShadersEXT", {kFuncTypeDev, (void*)CreateShadersEXT}},
-    {"vkDestroyShaderEXT", {kFuncTypeDev, (void*)DestroyShaderEXT}},
-    {"vkGetShaderBinaryDataEXT", {kFuncTypeDev, (void*)GetShaderBinaryDataEXT}},
-    {"vkCmdBindShadersEXT", {kFuncTypeDev, (void*)CmdBindShadersEXT}},
-    {"vkGetFramebufferTilePropertiesQCOM", {kFuncTypeDev, (void*)GetFramebufferTilePropertiesQCOM}},
-    {"vkGetDynamicRenderingTilePropertiesQCOM", {kFuncTypeDev, (void*)GetDynamicRenderingTilePropertiesQCOM}},
-    {"vkCmdSetAttachmentFeedbackLoopEnableEXT", {kFuncTypeDev, (void*)CmdSetAttachmentFeedbackLoopEnableEXT}},
-#ifdef VK_USE_PLATFORM_SCREEN_QNX
-    {"vkGetScreenBufferPropertiesQNX", {kFuncTypeDev, (void*)GetScreenBufferPropertiesQNX}},
+    {"vkCmdSetCoverageToColorLocationNV", kFuncTypeDev, (void*)CmdSetCoverageToColorLocationNV},
+    {"vkGetImageViewHandleNVX", kFuncTypeDev, (void*)GetImageViewHandleNVX},
+    {"vkGetRayTracingShaderGroupStackSizeKHR", kFuncTypeDev, (void*)GetRayTracingShaderGroupStackSizeKHR},
+#ifdef VK_USE_PLATFORM_FUCHSIA
+    {"vkGetMemoryZirconHandleFUCHSIA", kFuncTypeDev, (void*)GetMemoryZirconHandleFUCHSIA},
+#else
+    {nullptr, kFuncTypeDev, nullptr},
 #endif
-    {"vkCreateAccelerationStructureKHR", {kFuncTypeDev, (void*)CreateAccelerationStructureKHR}},
-    {"vkDestroyAccelerationStructureKHR", {kFuncTypeDev, (void*)DestroyAccelerationStructureKHR}},
-    {"vkCmdBuildAccelerationStructuresKHR", {kFuncTypeDev, (void*)CmdBuildAccelerationStructuresKHR}},
-    {"vkCmdBuildAccelerationStructuresIndirectKHR", {kFuncTypeDev, (void*)CmdBuildAccelerationStructuresIndirectKHR}},
-    {"vkBuildAccelerationStructuresKHR", {kFuncTypeDev, (void*)BuildAccelerationStructuresKHR}},
-    {"vkCopyAccelerationStructureKHR", {kFuncTypeDev, (void*)CopyAccelerationStructureKHR}},
-    {"vkCopyAccelerationStructureToMemoryKHR", {kFuncTypeDev, (void*)CopyAccelerationStructureToMemoryKHR}},
-    {"vkCopyMemoryToAccelerationStructureKHR", {kFuncTypeDev, (void*)CopyMemoryToAccelerationStructureKHR}},
-    {"vkWriteAccelerationStructuresPropertiesKHR", {kFuncTypeDev, (void*)WriteAccelerationStructuresPropertiesKHR}},
-    {"vkCmdCopyAccelerationStructureKHR", {kFuncTypeDev, (void*)CmdCopyAccelerationStructureKHR}},
-    {"vkCmdCopyAccelerationStructureToMemoryKHR", {kFuncTypeDev, (void*)CmdCopyAccelerationStructureToMemoryKHR}},
-    {"vkCmdCopyMemoryToAccelerationStructureKHR", {kFuncTypeDev, (void*)CmdCopyMemoryToAccelerationStructureKHR}},
-    {"vkGetAccelerationStructureDeviceAddressKHR", {kFuncTypeDev, (void*)GetAccelerationStructureDeviceAddressKHR}},
-    {"vkCmdWriteAccelerationStructuresPropertiesKHR", {kFuncTypeDev, (void*)CmdWriteAccelerationStructuresPropertiesKHR}},
-    {"vkGetDeviceAccelerationStructureCompatibilityKHR", {kFuncTypeDev, (void*)GetDeviceAccelerationStructureCompatibilityKHR}},
-    {"vkGetAccelerationStructureBuildSizesKHR", {kFuncTypeDev, (void*)GetAccelerationStructureBuildSizesKHR}},
-    {"vkCmdTraceRaysKHR", {kFuncTypeDev, (void*)CmdTraceRaysKHR}},
-    {"vkCreateRayTracingPipelinesKHR", {kFuncTypeDev, (void*)CreateRayTracingPipelinesKHR}},
-    {"vkGetRayTracingCaptureReplayShaderGroupHandlesKHR", {kFuncTypeDev, (void*)GetRayTracingCaptureReplayShaderGroupHandlesKHR}},
-    {"vkCmdTraceRaysIndirectKHR", {kFuncTypeDev, (void*)CmdTraceRaysIndirectKHR}},
-    {"vkGetRayTracingShaderGroupStackSizeKHR", {kFuncTypeDev, (void*)GetRayTracingShaderGroupStackSizeKHR}},
-    {"vkCmdSetRayTracingPipelineStackSizeKHR", {kFuncTypeDev, (void*)CmdSetRayTracingPipelineStackSizeKHR}},
-    {"vkCmdDrawMeshTasksEXT", {kFuncTypeDev, (void*)CmdDrawMeshTasksEXT}},
-    {"vkCmdDrawMeshTasksIndirectEXT", {kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectEXT}},
-    {"vkCmdDrawMeshTasksIndirectCountEXT", {kFuncTypeDev, (void*)CmdDrawMeshTasksIndirectCountEXT}},
+    {"vkCmdDrawIndirectCountAMD", kFuncTypeDev, (void*)CmdDrawIndirectCountAMD},
+    {"vkGetPhysicalDeviceImageFormatProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceImageFormatProperties2KHR},
+    {"vkGetPhysicalDeviceMemoryProperties", kFuncTypePdev, (void*)GetPhysicalDeviceMemoryProperties},
+    {"vkCmdNextSubpass2KHR", kFuncTypeDev, (void*)CmdNextSubpass2KHR},
+    {"vkCmdCopyBuffer2", kFuncTypeDev, (void*)CmdCopyBuffer2},
+    {"vkGetRayTracingShaderGroupHandlesKHR", kFuncTypeDev, (void*)GetRayTracingShaderGroupHandlesKHR},
+    {"vkCreateDescriptorPool", kFuncTypeDev, (void*)CreateDescriptorPool},
+    {"vkCmdEndVideoCodingKHR", kFuncTypeDev, (void*)CmdEndVideoCodingKHR},
+    {"vkCreateIndirectCommandsLayoutNV", kFuncTypeDev, (void*)CreateIndirectCommandsLayoutNV},
+    {"vkDestroyCuFunctionNVX", kFuncTypeDev, (void*)DestroyCuFunctionNVX},
+    {"vkDestroyCommandPool", kFuncTypeDev, (void*)DestroyCommandPool},
+    {"vkCreateDeferredOperationKHR", kFuncTypeDev, (void*)CreateDeferredOperationKHR},
+    {"vkCmdWriteAccelerationStructuresPropertiesNV", kFuncTypeDev, (void*)CmdWriteAccelerationStructuresPropertiesNV},
+    {"vkCmdSetDeviceMask", kFuncTypeDev, (void*)CmdSetDeviceMask},
+    {"vkGetPhysicalDeviceSparseImageFormatProperties2KHR", kFuncTypePdev, (void*)GetPhysicalDeviceSparseImageFormatProperties2KHR},
+    {"vkResetFences", kFuncTypeDev, (void*)ResetFences},
+    {"vkSignalSemaphore", kFuncTypeDev, (void*)SignalSemaphore},
+    {"vkCmdTraceRaysIndirectKHR", kFuncTypeDev, (void*)CmdTraceRaysIndirectKHR},
+    {"vkCreateSampler", kFuncTypeDev, (void*)CreateSampler},
+    {"vkCmdSubpassShadingHUAWEI", kFuncTypeDev, (void*)CmdSubpassShadingHUAWEI},
+    {"vkCmdCopyImage2", kFuncTypeDev, (void*)CmdCopyImage2},
 };
 
+static const function_data* GetFunctionData(const char* funcName) {
+    const uint32_t seed = kFunctionDataSeeds[hash_util::PerfectHashString(0, funcName) % std::size(kFunctionDataSeeds)];
+    const function_data& item = kFunctionData[hash_util::PerfectHashString(seed, funcName) % std::size(kFunctionData)];
+    if (item.name && strcmp(item.name, funcName) == 0) {
+        return &item;
+    }
+    return nullptr;
+}
+
 
 } // namespace vulkan_layer_chassis
 
@@ -23,6 +23,7 @@
  ****************************************************************************/
 
 // NOLINTBEGIN
+#include <cstring>
 #include <string>
 #include <functional>
 #include <spirv/unified1/spirv.hpp>
@@ -30,6 +31,7 @@
 #include "state_tracker/shader_module.h"
 #include "state_tracker/device_state.h"
 #include "core_checks/core_validation.h"
+#include "utils/hash_util.h"
 
 struct FeaturePointer {
     // Callable object to test if this feature is enabled in the given aggregate feature struct
@@ -118,289 +120,676 @@ struct RequiredSpirvInfo {
 };
 
 // clang-format off
-static const std::unordered_multimap<uint32_t, RequiredSpirvInfo> spirvCapabilities = {
-    {spv::CapabilityMatrix, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityShader, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityInputAttachment, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilitySampled1D, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityImage1D, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilitySampledBuffer, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityImageBuffer, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityImageQuery, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityDerivativeControl, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityGeometry, {0, &VkPhysicalDeviceFeatures::geometryShader, nullptr, ""}},
-    {spv::CapabilityTessellation, {0, &VkPhysicalDeviceFeatures::tessellationShader, nullptr, ""}},
-    {spv::CapabilityFloat64, {0, &VkPhysicalDeviceFeatures::shaderFloat64, nullptr, ""}},
-    {spv::CapabilityInt64, {0, &VkPhysicalDeviceFeatures::shaderInt64, nullptr, ""}},
-    {spv::CapabilityInt64Atomics, {0, &VkPhysicalDeviceVulkan12Features::shaderBufferInt64Atomics, nullptr, ""}},
-    {spv::CapabilityInt64Atomics, {0, &VkPhysicalDeviceVulkan12Features::shaderSharedInt64Atomics, nullptr, ""}},
-    {spv::CapabilityInt64Atomics, {0, &VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT::shaderImageInt64Atomics, nullptr, ""}},
-    {spv::CapabilityAtomicFloat16AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat16AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat16AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat16AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat32AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderBufferFloat32AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat32AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderSharedFloat32AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat32AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderImageFloat32AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat64AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderBufferFloat64AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat64AddEXT, {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderSharedFloat64AtomicAdd, nullptr, ""}},
-    {spv::CapabilityAtomicFloat16MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat16AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityAtomicFloat16MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat16AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityAtomicFloat32MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat32AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityAtomicFloat32MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat32AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityAtomicFloat32MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderImageFloat32AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityAtomicFloat64MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat64AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityAtomicFloat64MinMaxEXT, {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat64AtomicMinMax, nullptr, ""}},
-    {spv::CapabilityInt64ImageEXT, {0, &VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT::shaderImageInt64Atomics, nullptr, ""}},
-    {spv::CapabilityInt16, {0, &VkPhysicalDeviceFeatures::shaderInt16, nullptr, ""}},
-    {spv::CapabilityTessellationPointSize, {0, &VkPhysicalDeviceFeatures::shaderTessellationAndGeometryPointSize, nullptr, ""}},
-    {spv::CapabilityGeometryPointSize, {0, &VkPhysicalDeviceFeatures::shaderTessellationAndGeometryPointSize, nullptr, ""}},
-    {spv::CapabilityImageGatherExtended, {0, &VkPhysicalDeviceFeatures::shaderImageGatherExtended, nullptr, ""}},
-    {spv::CapabilityStorageImageMultisample, {0, &VkPhysicalDeviceFeatures::shaderStorageImageMultisample, nullptr, ""}},
-    {spv::CapabilityUniformBufferArrayDynamicIndexing, {0, &VkPhysicalDeviceFeatures::shaderUniformBufferArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilitySampledImageArrayDynamicIndexing, {0, &VkPhysicalDeviceFeatures::shaderSampledImageArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilityStorageBufferArrayDynamicIndexing, {0, &VkPhysicalDeviceFeatures::shaderStorageBufferArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilityStorageImageArrayDynamicIndexing, {0, &VkPhysicalDeviceFeatures::shaderStorageImageArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilityClipDistance, {0, &VkPhysicalDeviceFeatures::shaderClipDistance, nullptr, ""}},
-    {spv::CapabilityCullDistance, {0, &VkPhysicalDeviceFeatures::shaderCullDistance, nullptr, ""}},
-    {spv::CapabilityImageCubeArray, {0, &VkPhysicalDeviceFeatures::imageCubeArray, nullptr, ""}},
-    {spv::CapabilitySampleRateShading, {0, &VkPhysicalDeviceFeatures::sampleRateShading, nullptr, ""}},
-    {spv::CapabilitySparseResidency, {0, &VkPhysicalDeviceFeatures::shaderResourceResidency, nullptr, ""}},
-    {spv::CapabilityMinLod, {0, &VkPhysicalDeviceFeatures::shaderResourceMinLod, nullptr, ""}},
-    {spv::CapabilitySampledCubeArray, {0, &VkPhysicalDeviceFeatures::imageCubeArray, nullptr, ""}},
-    {spv::CapabilityImageMSArray, {0, &VkPhysicalDeviceFeatures::shaderStorageImageMultisample, nullptr, ""}},
-    {spv::CapabilityStorageImageExtendedFormats, {VK_API_VERSION_1_0, nullptr, nullptr, ""}},
-    {spv::CapabilityInterpolationFunction, {0, &VkPhysicalDeviceFeatures::sampleRateShading, nullptr, ""}},
-    {spv::CapabilityStorageImageReadWithoutFormat, {0, &VkPhysicalDeviceFeatures::shaderStorageImageReadWithoutFormat, nullptr, ""}},
-    {spv::CapabilityStorageImageReadWithoutFormat, {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {spv::CapabilityStorageImageReadWithoutFormat, {0, nullptr, &DeviceExtensions::vk_khr_format_feature_flags2, ""}},
-    {spv::CapabilityStorageImageWriteWithoutFormat, {0, &VkPhysicalDeviceFeatures::shaderStorageImageWriteWithoutFormat, nullptr, ""}},
-    {spv::CapabilityStorageImageWriteWithoutFormat, {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {spv::CapabilityStorageImageWriteWithoutFormat, {0, nullptr, &DeviceExtensions::vk_khr_format_feature_flags2, ""}},
-    {spv::CapabilityMultiViewport, {0, &VkPhysicalDeviceFeatures::multiViewport, nullptr, ""}},
-    {spv::CapabilityDrawParameters, {0, &VkPhysicalDeviceVulkan11Features::shaderDrawParameters, nullptr, ""}},
-    {spv::CapabilityDrawParameters, {0, nullptr, &DeviceExtensions::vk_khr_shader_draw_parameters, ""}},
-    {spv::CapabilityMultiView, {0, &VkPhysicalDeviceVulkan11Features::multiview, nullptr, ""}},
-    {spv::CapabilityDeviceGroup, {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {spv::CapabilityDeviceGroup, {0, nullptr, &DeviceExtensions::vk_khr_device_group, ""}},
-    {spv::CapabilityVariablePointersStorageBuffer, {0, &VkPhysicalDeviceVulkan11Features::variablePointersStorageBuffer, nullptr, ""}},
-    {spv::CapabilityVariablePointers, {0, &VkPhysicalDeviceVulkan11Features::variablePointers, nullptr, ""}},
-    {spv::CapabilityShaderClockKHR, {0, nullptr, &DeviceExtensions::vk_khr_shader_clock, ""}},
-    {spv::CapabilityStencilExportEXT, {0, nullptr, &DeviceExtensions::vk_ext_shader_stencil_export, ""}},
-    {spv::CapabilitySubgroupBallotKHR, {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_ballot, ""}},
-    {spv::CapabilitySubgroupVoteKHR, {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_vote, ""}},
-    {spv::CapabilityImageReadWriteLodAMD, {0, nullptr, &DeviceExtensions::vk_amd_shader_image_load_store_lod, ""}},
-    {spv::CapabilityImageGatherBiasLodAMD, {0, nullptr, &DeviceExtensions::vk_amd_texture_gather_bias_lod, ""}},
-    {spv::CapabilityFragmentMaskAMD, {0, nullptr, &DeviceExtensions::vk_amd_shader_fragment_mask, ""}},
-    {spv::CapabilitySampleMaskOverrideCoverageNV, {0, nullptr, &DeviceExtensions::vk_nv_sample_mask_override_coverage, ""}},
-    {spv::CapabilityGeometryShaderPassthroughNV, {0, nullptr, &DeviceExtensions::vk_nv_geometry_shader_passthrough, ""}},
-    {spv::CapabilityShaderViewportIndex, {0, &VkPhysicalDeviceVulkan12Features::shaderOutputViewportIndex, nullptr, ""}},
-    {spv::CapabilityShaderLayer, {0, &VkPhysicalDeviceVulkan12Features::shaderOutputLayer, nullptr, ""}},
-    {spv::CapabilityShaderViewportIndexLayerEXT, {0, nullptr, &DeviceExtensions::vk_ext_shader_viewport_index_layer, ""}},
-    {spv::CapabilityShaderViewportIndexLayerNV, {0, nullptr, &DeviceExtensions::vk_nv_viewport_array2, ""}},
-    {spv::CapabilityShaderViewportMaskNV, {0, nullptr, &DeviceExtensions::vk_nv_viewport_array2, ""}},
-    {spv::CapabilityPerViewAttributesNV, {0, nullptr, &DeviceExtensions::vk_nvx_multiview_per_view_attributes, ""}},
-    {spv::CapabilityStorageBuffer16BitAccess, {0, &VkPhysicalDeviceVulkan11Features::storageBuffer16BitAccess, nullptr, ""}},
-    {spv::CapabilityUniformAndStorageBuffer16BitAccess, {0, &VkPhysicalDeviceVulkan11Features::uniformAndStorageBuffer16BitAccess, nullptr, ""}},
-    {spv::CapabilityStoragePushConstant16, {0, &VkPhysicalDeviceVulkan11Features::storagePushConstant16, nullptr, ""}},
-    {spv::CapabilityStorageInputOutput16, {0, &VkPhysicalDeviceVulkan11Features::storageInputOutput16, nullptr, ""}},
-    {spv::CapabilityGroupNonUniform, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_BASIC_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformVote, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_VOTE_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformArithmetic, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_ARITHMETIC_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformBallot, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_BALLOT_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformShuffle, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_SHUFFLE_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformShuffleRelative, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformClustered, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_CLUSTERED_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformQuad, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_QUAD_BIT) != 0"}},
-    {spv::CapabilityGroupNonUniformPartitionedNV, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_PARTITIONED_BIT_NV) != 0"}},
-    {spv::CapabilitySampleMaskPostDepthCoverage, {0, nullptr, &DeviceExtensions::vk_ext_post_depth_coverage, ""}},
-    {spv::CapabilityShaderNonUniform, {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {spv::CapabilityShaderNonUniform, {0, nullptr, &DeviceExtensions::vk_ext_descriptor_indexing, ""}},
-    {spv::CapabilityRuntimeDescriptorArray, {0, &VkPhysicalDeviceVulkan12Features::runtimeDescriptorArray, nullptr, ""}},
-    {spv::CapabilityInputAttachmentArrayDynamicIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderInputAttachmentArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilityUniformTexelBufferArrayDynamicIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderUniformTexelBufferArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilityStorageTexelBufferArrayDynamicIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderStorageTexelBufferArrayDynamicIndexing, nullptr, ""}},
-    {spv::CapabilityUniformBufferArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderUniformBufferArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilitySampledImageArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderSampledImageArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilityStorageBufferArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderStorageBufferArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilityStorageImageArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderStorageImageArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilityInputAttachmentArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderInputAttachmentArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilityUniformTexelBufferArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderUniformTexelBufferArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilityStorageTexelBufferArrayNonUniformIndexing, {0, &VkPhysicalDeviceVulkan12Features::shaderStorageTexelBufferArrayNonUniformIndexing, nullptr, ""}},
-    {spv::CapabilityFragmentFullyCoveredEXT, {0, nullptr, &DeviceExtensions::vk_ext_conservative_rasterization, ""}},
-    {spv::CapabilityFloat16, {0, &VkPhysicalDeviceVulkan12Features::shaderFloat16, nullptr, ""}},
-    {spv::CapabilityFloat16, {0, nullptr, &DeviceExtensions::vk_amd_gpu_shader_half_float, ""}},
-    {spv::CapabilityInt8, {0, &VkPhysicalDeviceVulkan12Features::shaderInt8, nullptr, ""}},
-    {spv::CapabilityStorageBuffer8BitAccess, {0, &VkPhysicalDeviceVulkan12Features::storageBuffer8BitAccess, nullptr, ""}},
-    {spv::CapabilityUniformAndStorageBuffer8BitAccess, {0, &VkPhysicalDeviceVulkan12Features::uniformAndStorageBuffer8BitAccess, nullptr, ""}},
-    {spv::CapabilityStoragePushConstant8, {0, &VkPhysicalDeviceVulkan12Features::storagePushConstant8, nullptr, ""}},
-    {spv::CapabilityVulkanMemoryModel, {0, &VkPhysicalDeviceVulkan12Features::vulkanMemoryModel, nullptr, ""}},
-    {spv::CapabilityVulkanMemoryModelDeviceScope, {0, &VkPhysicalDeviceVulkan12Features::vulkanMemoryModelDeviceScope, nullptr, ""}},
-    {spv::CapabilityDenormPreserve, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormPreserveFloat16 & VK_TRUE) != 0"}},
-    {spv::CapabilityDenormPreserve, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormPreserveFloat32 & VK_TRUE) != 0"}},
-    {spv::CapabilityDenormPreserve, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormPreserveFloat64 & VK_TRUE) != 0"}},
-    {spv::CapabilityDenormFlushToZero, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormFlushToZeroFloat16 & VK_TRUE) != 0"}},
-    {spv::CapabilityDenormFlushToZero, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormFlushToZeroFloat32 & VK_TRUE) != 0"}},
-    {spv::CapabilityDenormFlushToZero, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormFlushToZeroFloat64 & VK_TRUE) != 0"}},
-    {spv::CapabilitySignedZeroInfNanPreserve, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderSignedZeroInfNanPreserveFloat16 & VK_TRUE) != 0"}},
-    {spv::CapabilitySignedZeroInfNanPreserve, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderSignedZeroInfNanPreserveFloat32 & VK_TRUE) != 0"}},
-    {spv::CapabilitySignedZeroInfNanPreserve, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderSignedZeroInfNanPreserveFloat64 & VK_TRUE) != 0"}},
-    {spv::CapabilityRoundingModeRTE, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTEFloat16 & VK_TRUE) != 0"}},
-    {spv::CapabilityRoundingModeRTE, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTEFloat32 & VK_TRUE) != 0"}},
-    {spv::CapabilityRoundingModeRTE, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTEFloat64 & VK_TRUE) != 0"}},
-    {spv::CapabilityRoundingModeRTZ, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTZFloat16 & VK_TRUE) != 0"}},
-    {spv::CapabilityRoundingModeRTZ, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTZFloat32 & VK_TRUE) != 0"}},
-    {spv::CapabilityRoundingModeRTZ, {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTZFloat64 & VK_TRUE) != 0"}},
-    {spv::CapabilityComputeDerivativeGroupQuadsNV, {0, &VkPhysicalDeviceComputeShaderDerivativesFeaturesNV::computeDerivativeGroupQuads, nullptr, ""}},
-    {spv::CapabilityComputeDerivativeGroupLinearNV, {0, &VkPhysicalDeviceComputeShaderDerivativesFeaturesNV::computeDerivativeGroupLinear, nullptr, ""}},
-    {spv::CapabilityFragmentBarycentricNV, {0, &VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV::fragmentShaderBarycentric, nullptr, ""}},
-    {spv::CapabilityImageFootprintNV, {0, &VkPhysicalDeviceShaderImageFootprintFeaturesNV::imageFootprint, nullptr, ""}},
-    {spv::CapabilityShadingRateNV, {0, &VkPhysicalDeviceShadingRateImageFeaturesNV::shadingRateImage, nullptr, ""}},
-    {spv::CapabilityMeshShadingNV, {0, nullptr, &DeviceExtensions::vk_nv_mesh_shader, ""}},
-    {spv::CapabilityRayTracingKHR, {0, &VkPhysicalDeviceRayTracingPipelineFeaturesKHR::rayTracingPipeline, nullptr, ""}},
-    {spv::CapabilityRayQueryKHR, {0, &VkPhysicalDeviceRayQueryFeaturesKHR::rayQuery, nullptr, ""}},
-    {spv::CapabilityRayTraversalPrimitiveCullingKHR, {0, &VkPhysicalDeviceRayTracingPipelineFeaturesKHR::rayTraversalPrimitiveCulling, nullptr, ""}},
-    {spv::CapabilityRayTraversalPrimitiveCullingKHR, {0, &VkPhysicalDeviceRayQueryFeaturesKHR::rayQuery, nullptr, ""}},
-    {spv::CapabilityRayCullMaskKHR, {0, &VkPhysicalDeviceRayTracingMaintenance1FeaturesKHR::rayTracingMaintenance1, nullptr, ""}},
-    {spv::CapabilityRayTracingNV, {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing, ""}},
-    {spv::CapabilityRayTracingMotionBlurNV, {0, &VkPhysicalDeviceRayTracingMotionBlurFeaturesNV::rayTracingMotionBlur, nullptr, ""}},
-    {spv::CapabilityTransformFeedback, {0, &VkPhysicalDeviceTransformFeedbackFeaturesEXT::transformFeedback, nullptr, ""}},
-    {spv::CapabilityGeometryStreams, {0, &VkPhysicalDeviceTransformFeedbackFeaturesEXT::geometryStreams, nullptr, ""}},
-    {spv::CapabilityFragmentDensityEXT, {0, &VkPhysicalDeviceFragmentDensityMapFeaturesEXT::fragmentDensityMap, nullptr, ""}},
-    {spv::CapabilityPhysicalStorageBufferAddresses, {0, &VkPhysicalDeviceVulkan12Features::bufferDeviceAddress, nullptr, ""}},
-    {spv::CapabilityPhysicalStorageBufferAddresses, {0, &VkPhysicalDeviceBufferDeviceAddressFeaturesEXT::bufferDeviceAddress, nullptr, ""}},
-    {spv::CapabilityCooperativeMatrixNV, {0, &VkPhysicalDeviceCooperativeMatrixFeaturesNV::cooperativeMatrix, nullptr, ""}},
-    {spv::CapabilityIntegerFunctions2INTEL, {0, &VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL::shaderIntegerFunctions2, nullptr, ""}},
-    {spv::CapabilityShaderSMBuiltinsNV, {0, &VkPhysicalDeviceShaderSMBuiltinsFeaturesNV::shaderSMBuiltins, nullptr, ""}},
-    {spv::CapabilityFragmentShaderSampleInterlockEXT, {0, &VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT::fragmentShaderSampleInterlock, nullptr, ""}},
-    {spv::CapabilityFragmentShaderPixelInterlockEXT, {0, &VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT::fragmentShaderPixelInterlock, nullptr, ""}},
-    {spv::CapabilityFragmentShaderShadingRateInterlockEXT, {0, &VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT::fragmentShaderShadingRateInterlock, nullptr, ""}},
-    {spv::CapabilityFragmentShaderShadingRateInterlockEXT, {0, &VkPhysicalDeviceShadingRateImageFeaturesNV::shadingRateImage, nullptr, ""}},
-    {spv::CapabilityDemoteToHelperInvocationEXT, {0, &VkPhysicalDeviceVulkan13Features::shaderDemoteToHelperInvocation, nullptr, ""}},
-    {spv::CapabilityDemoteToHelperInvocationEXT, {0, &VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT::shaderDemoteToHelperInvocation, nullptr, ""}},
-    {spv::CapabilityFragmentShadingRateKHR, {0, &VkPhysicalDeviceFragmentShadingRateFeaturesKHR::pipelineFragmentShadingRate, nullptr, ""}},
-    {spv::CapabilityFragmentShadingRateKHR, {0, &VkPhysicalDeviceFragmentShadingRateFeaturesKHR::primitiveFragmentShadingRate, nullptr, ""}},
-    {spv::CapabilityFragmentShadingRateKHR, {0, &VkPhysicalDeviceFragmentShadingRateFeaturesKHR::attachmentFragmentShadingRate, nullptr, ""}},
-    {spv::CapabilityWorkgroupMemoryExplicitLayoutKHR, {0, &VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR::workgroupMemoryExplicitLayout, nullptr, ""}},
-    {spv::CapabilityWorkgroupMemoryExplicitLayout8BitAccessKHR, {0, &VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR::workgroupMemoryExplicitLayout8BitAccess, nullptr, ""}},
-    {spv::CapabilityWorkgroupMemoryExplicitLayout16BitAccessKHR, {0, &VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR::workgroupMemoryExplicitLayout16BitAccess, nullptr, ""}},
-    {spv::CapabilityDotProductInputAllKHR, {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductInputAllKHR, {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductInput4x8BitKHR, {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductInput4x8BitKHR, {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductInput4x8BitPackedKHR, {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductInput4x8BitPackedKHR, {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductKHR, {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityDotProductKHR, {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}},
-    {spv::CapabilityFragmentBarycentricKHR, {0, &VkPhysicalDeviceFragmentShaderBarycentricFeaturesKHR::fragmentShaderBarycentric, nullptr, ""}},
-    {spv::CapabilityTextureSampleWeightedQCOM, {0, &VkPhysicalDeviceImageProcessingFeaturesQCOM::textureSampleWeighted, nullptr, ""}},
-    {spv::CapabilityTextureBoxFilterQCOM, {0, &VkPhysicalDeviceImageProcessingFeaturesQCOM::textureBoxFilter, nullptr, ""}},
-    {spv::CapabilityTextureBlockMatchQCOM, {0, &VkPhysicalDeviceImageProcessingFeaturesQCOM::textureBlockMatch, nullptr, ""}},
-    {spv::CapabilityMeshShadingEXT, {0, nullptr, &DeviceExtensions::vk_ext_mesh_shader, ""}},
-    {spv::CapabilityRayTracingOpacityMicromapEXT, {0, nullptr, &DeviceExtensions::vk_ext_opacity_micromap, ""}},
-    {spv::CapabilityCoreBuiltinsARM, {0, &VkPhysicalDeviceShaderCoreBuiltinsFeaturesARM::shaderCoreBuiltins, nullptr, ""}},
-    {spv::CapabilityShaderInvocationReorderNV, {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing_invocation_reorder, ""}},
+static const RequiredSpirvInfo spirvCapabilities[] = {
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // Matrix
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // Shader
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // InputAttachment
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // Sampled1D
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // Image1D
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // SampledBuffer
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // ImageBuffer
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // ImageQuery
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // DerivativeControl
+    {0, &VkPhysicalDeviceFeatures::geometryShader, nullptr, ""}, // Geometry
+    {0, &VkPhysicalDeviceFeatures::tessellationShader, nullptr, ""}, // Tessellation
+    {0, &VkPhysicalDeviceFeatures::shaderFloat64, nullptr, ""}, // Float64
+    {0, &VkPhysicalDeviceFeatures::shaderInt64, nullptr, ""}, // Int64
+    {0, &VkPhysicalDeviceVulkan12Features::shaderBufferInt64Atomics, nullptr, ""}, // Int64Atomics
+    {0, &VkPhysicalDeviceVulkan12Features::shaderSharedInt64Atomics, nullptr, ""}, // Int64Atomics
+    {0, &VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT::shaderImageInt64Atomics, nullptr, ""}, // Int64Atomics
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat16AtomicAdd, nullptr, ""}, // AtomicFloat16AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat16AtomicAdd, nullptr, ""}, // AtomicFloat16AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderBufferFloat32AtomicAdd, nullptr, ""}, // AtomicFloat32AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderSharedFloat32AtomicAdd, nullptr, ""}, // AtomicFloat32AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderImageFloat32AtomicAdd, nullptr, ""}, // AtomicFloat32AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderBufferFloat64AtomicAdd, nullptr, ""}, // AtomicFloat64AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloatFeaturesEXT::shaderSharedFloat64AtomicAdd, nullptr, ""}, // AtomicFloat64AddEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat16AtomicMinMax, nullptr, ""}, // AtomicFloat16MinMaxEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat16AtomicMinMax, nullptr, ""}, // AtomicFloat16MinMaxEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat32AtomicMinMax, nullptr, ""}, // AtomicFloat32MinMaxEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat32AtomicMinMax, nullptr, ""}, // AtomicFloat32MinMaxEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderImageFloat32AtomicMinMax, nullptr, ""}, // AtomicFloat32MinMaxEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderBufferFloat64AtomicMinMax, nullptr, ""}, // AtomicFloat64MinMaxEXT
+    {0, &VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT::shaderSharedFloat64AtomicMinMax, nullptr, ""}, // AtomicFloat64MinMaxEXT
+    {0, &VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT::shaderImageInt64Atomics, nullptr, ""}, // Int64ImageEXT
+    {0, &VkPhysicalDeviceFeatures::shaderInt16, nullptr, ""}, // Int16
+    {0, &VkPhysicalDeviceFeatures::shaderTessellationAndGeometryPointSize, nullptr, ""}, // TessellationPointSize
+    {0, &VkPhysicalDeviceFeatures::shaderTessellationAndGeometryPointSize, nullptr, ""}, // GeometryPointSize
+    {0, &VkPhysicalDeviceFeatures::shaderImageGatherExtended, nullptr, ""}, // ImageGatherExtended
+    {0, &VkPhysicalDeviceFeatures::shaderStorageImageMultisample, nullptr, ""}, // StorageImageMultisample
+    {0, &VkPhysicalDeviceFeatures::shaderUniformBufferArrayDynamicIndexing, nullptr, ""}, // UniformBufferArrayDynamicIndexing
+    {0, &VkPhysicalDeviceFeatures::shaderSampledImageArrayDynamicIndexing, nullptr, ""}, // SampledImageArrayDynamicIndexing
+    {0, &VkPhysicalDeviceFeatures::shaderStorageBufferArrayDynamicIndexing, nullptr, ""}, // StorageBufferArrayDynamicIndexing
+    {0, &VkPhysicalDeviceFeatures::shaderStorageImageArrayDynamicIndexing, nullptr, ""}, // StorageImageArrayDynamicIndexing
+    {0, &VkPhysicalDeviceFeatures::shaderClipDistance, nullptr, ""}, // ClipDistance
+    {0, &VkPhysicalDeviceFeatures::shaderCullDistance, nullptr, ""}, // CullDistance
+    {0, &VkPhysicalDeviceFeatures::imageCubeArray, nullptr, ""}, // ImageCubeArray
+    {0, &VkPhysicalDeviceFeatures::sampleRateShading, nullptr, ""}, // SampleRateShading
+    {0, &VkPhysicalDeviceFeatures::shaderResourceResidency, nullptr, ""}, // SparseResidency
+    {0, &VkPhysicalDeviceFeatures::shaderResourceMinLod, nullptr, ""}, // MinLod
+    {0, &VkPhysicalDeviceFeatures::imageCubeArray, nullptr, ""}, // SampledCubeArray
+    {0, &VkPhysicalDeviceFeatures::shaderStorageImageMultisample, nullptr, ""}, // ImageMSArray
+    {VK_API_VERSION_1_0, nullptr, nullptr, ""}, // StorageImageExtendedFormats
+    {0, &VkPhysicalDeviceFeatures::sampleRateShading, nullptr, ""}, // InterpolationFunction
+    {0, &VkPhysicalDeviceFeatures::shaderStorageImageReadWithoutFormat, nullptr, ""}, // StorageImageReadWithoutFormat
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // StorageImageReadWithoutFormat
+    {0, nullptr, &DeviceExtensions::vk_khr_format_feature_flags2, ""}, // StorageImageReadWithoutFormat
+    {0, &VkPhysicalDeviceFeatures::shaderStorageImageWriteWithoutFormat, nullptr, ""}, // StorageImageWriteWithoutFormat
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // StorageImageWriteWithoutFormat
+    {0, nullptr, &DeviceExtensions::vk_khr_format_feature_flags2, ""}, // StorageImageWriteWithoutFormat
+    {0, &VkPhysicalDeviceFeatures::multiViewport, nullptr, ""}, // MultiViewport
+    {0, &VkPhysicalDeviceVulkan11Features::shaderDrawParameters, nullptr, ""}, // DrawParameters
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_draw_parameters, ""}, // DrawParameters
+    {0, &VkPhysicalDeviceVulkan11Features::multiview, nullptr, ""}, // MultiView
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // DeviceGroup
+    {0, nullptr, &DeviceExtensions::vk_khr_device_group, ""}, // DeviceGroup
+    {0, &VkPhysicalDeviceVulkan11Features::variablePointersStorageBuffer, nullptr, ""}, // VariablePointersStorageBuffer
+    {0, &VkPhysicalDeviceVulkan11Features::variablePointers, nullptr, ""}, // VariablePointers
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_clock, ""}, // ShaderClockKHR
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_stencil_export, ""}, // StencilExportEXT
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_ballot, ""}, // SubgroupBallotKHR
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_vote, ""}, // SubgroupVoteKHR
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_image_load_store_lod, ""}, // ImageReadWriteLodAMD
+    {0, nullptr, &DeviceExtensions::vk_amd_texture_gather_bias_lod, ""}, // ImageGatherBiasLodAMD
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_fragment_mask, ""}, // FragmentMaskAMD
+    {0, nullptr, &DeviceExtensions::vk_nv_sample_mask_override_coverage, ""}, // SampleMaskOverrideCoverageNV
+    {0, nullptr, &DeviceExtensions::vk_nv_geometry_shader_passthrough, ""}, // GeometryShaderPassthroughNV
+    {0, &VkPhysicalDeviceVulkan12Features::shaderOutputViewportIndex, nullptr, ""}, // ShaderViewportIndex
+    {0, &VkPhysicalDeviceVulkan12Features::shaderOutputLayer, nullptr, ""}, // ShaderLayer
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_viewport_index_layer, ""}, // ShaderViewportIndexLayerEXT
+    {0, nullptr, &DeviceExtensions::vk_nv_viewport_array2, ""}, // ShaderViewportIndexLayerNV
+    {0, nullptr, &DeviceExtensions::vk_nv_viewport_array2, ""}, // ShaderViewportMaskNV
+    {0, nullptr, &DeviceExtensions::vk_nvx_multiview_per_view_attributes, ""}, // PerViewAttributesNV
+    {0, &VkPhysicalDeviceVulkan11Features::storageBuffer16BitAccess, nullptr, ""}, // StorageBuffer16BitAccess
+    {0, &VkPhysicalDeviceVulkan11Features::uniformAndStorageBuffer16BitAccess, nullptr, ""}, // UniformAndStorageBuffer16BitAccess
+    {0, &VkPhysicalDeviceVulkan11Features::storagePushConstant16, nullptr, ""}, // StoragePushConstant16
+    {0, &VkPhysicalDeviceVulkan11Features::storageInputOutput16, nullptr, ""}, // StorageInputOutput16
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_BASIC_BIT) != 0"}, // GroupNonUniform
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_VOTE_BIT) != 0"}, // GroupNonUniformVote
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_ARITHMETIC_BIT) != 0"}, // GroupNonUniformArithmetic
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_BALLOT_BIT) != 0"}, // GroupNonUniformBallot
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_SHUFFLE_BIT) != 0"}, // GroupNonUniformShuffle
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT) != 0"}, // GroupNonUniformShuffleRelative
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_CLUSTERED_BIT) != 0"}, // GroupNonUniformClustered
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_QUAD_BIT) != 0"}, // GroupNonUniformQuad
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan11Properties::subgroupSupportedOperations & VK_SUBGROUP_FEATURE_PARTITIONED_BIT_NV) != 0"}, // GroupNonUniformPartitionedNV
+    {0, nullptr, &DeviceExtensions::vk_ext_post_depth_coverage, ""}, // SampleMaskPostDepthCoverage
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // ShaderNonUniform
+    {0, nullptr, &DeviceExtensions::vk_ext_descriptor_indexing, ""}, // ShaderNonUniform
+    {0, &VkPhysicalDeviceVulkan12Features::runtimeDescriptorArray, nullptr, ""}, // RuntimeDescriptorArray
+    {0, &VkPhysicalDeviceVulkan12Features::shaderInputAttachmentArrayDynamicIndexing, nullptr, ""}, // InputAttachmentArrayDynamicIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderUniformTexelBufferArrayDynamicIndexing, nullptr, ""}, // UniformTexelBufferArrayDynamicIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderStorageTexelBufferArrayDynamicIndexing, nullptr, ""}, // StorageTexelBufferArrayDynamicIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderUniformBufferArrayNonUniformIndexing, nullptr, ""}, // UniformBufferArrayNonUniformIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderSampledImageArrayNonUniformIndexing, nullptr, ""}, // SampledImageArrayNonUniformIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderStorageBufferArrayNonUniformIndexing, nullptr, ""}, // StorageBufferArrayNonUniformIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderStorageImageArrayNonUniformIndexing, nullptr, ""}, // StorageImageArrayNonUniformIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderInputAttachmentArrayNonUniformIndexing, nullptr, ""}, // InputAttachmentArrayNonUniformIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderUniformTexelBufferArrayNonUniformIndexing, nullptr, ""}, // UniformTexelBufferArrayNonUniformIndexing
+    {0, &VkPhysicalDeviceVulkan12Features::shaderStorageTexelBufferArrayNonUniformIndexing, nullptr, ""}, // StorageTexelBufferArrayNonUniformIndexing
+    {0, nullptr, &DeviceExtensions::vk_ext_conservative_rasterization, ""}, // FragmentFullyCoveredEXT
+    {0, &VkPhysicalDeviceVulkan12Features::shaderFloat16, nullptr, ""}, // Float16
+    {0, nullptr, &DeviceExtensions::vk_amd_gpu_shader_half_float, ""}, // Float16
+    {0, &VkPhysicalDeviceVulkan12Features::shaderInt8, nullptr, ""}, // Int8
+    {0, &VkPhysicalDeviceVulkan12Features::storageBuffer8BitAccess, nullptr, ""}, // StorageBuffer8BitAccess
+    {0, &VkPhysicalDeviceVulkan12Features::uniformAndStorageBuffer8BitAccess, nullptr, ""}, // UniformAndStorageBuffer8BitAccess
+    {0, &VkPhysicalDeviceVulkan12Features::storagePushConstant8, nullptr, ""}, // StoragePushConstant8
+    {0, &VkPhysicalDeviceVulkan12Features::vulkanMemoryModel, nullptr, ""}, // VulkanMemoryModel
+    {0, &VkPhysicalDeviceVulkan12Features::vulkanMemoryModelDeviceScope, nullptr, ""}, // VulkanMemoryModelDeviceScope
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormPreserveFloat16 & VK_TRUE) != 0"}, // DenormPreserve
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormPreserveFloat32 & VK_TRUE) != 0"}, // DenormPreserve
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormPreserveFloat64 & VK_TRUE) != 0"}, // DenormPreserve
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormFlushToZeroFloat16 & VK_TRUE) != 0"}, // DenormFlushToZero
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormFlushToZeroFloat32 & VK_TRUE) != 0"}, // DenormFlushToZero
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderDenormFlushToZeroFloat64 & VK_TRUE) != 0"}, // DenormFlushToZero
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderSignedZeroInfNanPreserveFloat16 & VK_TRUE) != 0"}, // SignedZeroInfNanPreserve
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderSignedZeroInfNanPreserveFloat32 & VK_TRUE) != 0"}, // SignedZeroInfNanPreserve
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderSignedZeroInfNanPreserveFloat64 & VK_TRUE) != 0"}, // SignedZeroInfNanPreserve
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTEFloat16 & VK_TRUE) != 0"}, // RoundingModeRTE
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTEFloat32 & VK_TRUE) != 0"}, // RoundingModeRTE
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTEFloat64 & VK_TRUE) != 0"}, // RoundingModeRTE
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTZFloat16 & VK_TRUE) != 0"}, // RoundingModeRTZ
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTZFloat32 & VK_TRUE) != 0"}, // RoundingModeRTZ
+    {0, nullptr, nullptr, "(VkPhysicalDeviceVulkan12Properties::shaderRoundingModeRTZFloat64 & VK_TRUE) != 0"}, // RoundingModeRTZ
+    {0, &VkPhysicalDeviceComputeShaderDerivativesFeaturesNV::computeDerivativeGroupQuads, nullptr, ""}, // ComputeDerivativeGroupQuadsNV
+    {0, &VkPhysicalDeviceComputeShaderDerivativesFeaturesNV::computeDerivativeGroupLinear, nullptr, ""}, // ComputeDerivativeGroupLinearNV
+    {0, &VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV::fragmentShaderBarycentric, nullptr, ""}, // FragmentBarycentricNV
+    {0, &VkPhysicalDeviceFragmentShaderBarycentricFeaturesKHR::fragmentShaderBarycentric, nullptr, ""}, // FragmentBarycentricKHR
+    {0, &VkPhysicalDeviceShaderImageFootprintFeaturesNV::imageFootprint, nullptr, ""}, // ImageFootprintNV
+    {0, &VkPhysicalDeviceShadingRateImageFeaturesNV::shadingRateImage, nullptr, ""}, // ShadingRateNV
+    {0, &VkPhysicalDeviceFragmentDensityMapFeaturesEXT::fragmentDensityMap, nullptr, ""}, // FragmentDensityEXT
+    {0, nullptr, &DeviceExtensions::vk_nv_mesh_shader, ""}, // MeshShadingNV
+    {0, &VkPhysicalDeviceRayTracingPipelineFeaturesKHR::rayTracingPipeline, nullptr, ""}, // RayTracingKHR
+    {0, &VkPhysicalDeviceRayQueryFeaturesKHR::rayQuery, nullptr, ""}, // RayQueryKHR
+    {0, &VkPhysicalDeviceRayTracingPipelineFeaturesKHR::rayTraversalPrimitiveCulling, nullptr, ""}, // RayTraversalPrimitiveCullingKHR
+    {0, &VkPhysicalDeviceRayQueryFeaturesKHR::rayQuery, nullptr, ""}, // RayTraversalPrimitiveCullingKHR
+    {0, &VkPhysicalDeviceRayTracingMaintenance1FeaturesKHR::rayTracingMaintenance1, nullptr, ""}, // RayCullMaskKHR
+    {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing, ""}, // RayTracingNV
+    {0, &VkPhysicalDeviceRayTracingMotionBlurFeaturesNV::rayTracingMotionBlur, nullptr, ""}, // RayTracingMotionBlurNV
+    {0, &VkPhysicalDeviceTransformFeedbackFeaturesEXT::transformFeedback, nullptr, ""}, // TransformFeedback
+    {0, &VkPhysicalDeviceTransformFeedbackFeaturesEXT::geometryStreams, nullptr, ""}, // GeometryStreams
+    {0, &VkPhysicalDeviceVulkan12Features::bufferDeviceAddress, nullptr, ""}, // PhysicalStorageBufferAddresses
+    {0, &VkPhysicalDeviceBufferDeviceAddressFeaturesEXT::bufferDeviceAddress, nullptr, ""}, // PhysicalStorageBufferAddresses
+    {0, &VkPhysicalDeviceCooperativeMatrixFeaturesNV::cooperativeMatrix, nullptr, ""}, // CooperativeMatrixNV
+    {0, &VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL::shaderIntegerFunctions2, nullptr, ""}, // IntegerFunctions2INTEL
+    {0, &VkPhysicalDeviceShaderSMBuiltinsFeaturesNV::shaderSMBuiltins, nullptr, ""}, // ShaderSMBuiltinsNV
+    {0, &VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT::fragmentShaderSampleInterlock, nullptr, ""}, // FragmentShaderSampleInterlockEXT
+    {0, &VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT::fragmentShaderPixelInterlock, nullptr, ""}, // FragmentShaderPixelInterlockEXT
+    {0, &VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT::fragmentShaderShadingRateInterlock, nullptr, ""}, // FragmentShaderShadingRateInterlockEXT
+    {0, &VkPhysicalDeviceShadingRateImageFeaturesNV::shadingRateImage, nullptr, ""}, // FragmentShaderShadingRateInterlockEXT
+    {0, &VkPhysicalDeviceVulkan13Features::shaderDemoteToHelperInvocation, nullptr, ""}, // DemoteToHelperInvocationEXT
+    {0, &VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT::shaderDemoteToHelperInvocation, nullptr, ""}, // DemoteToHelperInvocationEXT
+    {0, &VkPhysicalDeviceFragmentShadingRateFeaturesKHR::pipelineFragmentShadingRate, nullptr, ""}, // FragmentShadingRateKHR
+    {0, &VkPhysicalDeviceFragmentShadingRateFeaturesKHR::primitiveFragmentShadingRate, nullptr, ""}, // FragmentShadingRateKHR
+    {0, &VkPhysicalDeviceFragmentShadingRateFeaturesKHR::attachmentFragmentShadingRate, nullptr, ""}, // FragmentShadingRateKHR
+    {0, &VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR::workgroupMemoryExplicitLayout, nullptr, ""}, // WorkgroupMemoryExplicitLayoutKHR
+    {0, &VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR::workgroupMemoryExplicitLayout8BitAccess, nullptr, ""}, // WorkgroupMemoryExplicitLayout8BitAccessKHR
+    {0, &VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR::workgroupMemoryExplicitLayout16BitAccess, nullptr, ""}, // WorkgroupMemoryExplicitLayout16BitAccessKHR
+    {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}, // DotProductInputAllKHR
+    {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}, // DotProductInputAllKHR
+    {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}, // DotProductInput4x8BitKHR
+    {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}, // DotProductInput4x8BitKHR
+    {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}, // DotProductInput4x8BitPackedKHR
+    {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}, // DotProductInput4x8BitPackedKHR
+    {0, &VkPhysicalDeviceVulkan13Features::shaderIntegerDotProduct, nullptr, ""}, // DotProductKHR
+    {0, &VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR::shaderIntegerDotProduct, nullptr, ""}, // DotProductKHR
+    {0, &VkPhysicalDeviceImageProcessingFeaturesQCOM::textureSampleWeighted, nullptr, ""}, // TextureSampleWeightedQCOM
+    {0, &VkPhysicalDeviceImageProcessingFeaturesQCOM::textureBoxFilter, nullptr, ""}, // TextureBoxFilterQCOM
+    {0, &VkPhysicalDeviceImageProcessingFeaturesQCOM::textureBlockMatch, nullptr, ""}, // TextureBlockMatchQCOM
+    {0, nullptr, &DeviceExtensions::vk_ext_mesh_shader, ""}, // MeshShadingEXT
+    {0, nullptr, &DeviceExtensions::vk_ext_opacity_micromap, ""}, // RayTracingOpacityMicromapEXT
+    {0, &VkPhysicalDeviceShaderCoreBuiltinsFeaturesARM::shaderCoreBuiltins, nullptr, ""}, // CoreBuiltinsARM
+    {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing_invocation_reorder, ""}, // ShaderInvocationReorderNV
     // Not found in current SPIR-V Headers
-    //    {spv::CapabilityClusterCullingShadingHUAWEI, {0, &VkPhysicalDeviceClusterCullingShaderFeaturesHUAWEI::clustercullingShader, nullptr, ""}},
-    {spv::CapabilityRayTracingPositionFetchKHR, {0, &VkPhysicalDeviceRayTracingPositionFetchFeaturesKHR::rayTracingPositionFetch, nullptr, ""}},
-    {spv::CapabilityTileImageColorReadAccessEXT, {0, &VkPhysicalDeviceShaderTileImageFeaturesEXT::shaderTileImageColorReadAccess, nullptr, ""}},
-    {spv::CapabilityTileImageDepthReadAccessEXT, {0, &VkPhysicalDeviceShaderTileImageFeaturesEXT::shaderTileImageDepthReadAccess, nullptr, ""}},
-    {spv::CapabilityTileImageStencilReadAccessEXT, {0, &VkPhysicalDeviceShaderTileImageFeaturesEXT::shaderTileImageStencilReadAccess, nullptr, ""}},
+    //    {0, &VkPhysicalDeviceClusterCullingShaderFeaturesHUAWEI::clustercullingShader, nullptr, ""}, // ClusterCullingShadingHUAWEI
+    {0, &VkPhysicalDeviceRayTracingPositionFetchFeaturesKHR::rayTracingPositionFetch, nullptr, ""}, // RayTracingPositionFetchKHR
+    {0, &VkPhysicalDeviceShaderTileImageFeaturesEXT::shaderTileImageColorReadAccess, nullptr, ""}, // TileImageColorReadAccessEXT
+    {0, &VkPhysicalDeviceShaderTileImageFeaturesEXT::shaderTileImageDepthReadAccess, nullptr, ""}, // TileImageDepthReadAccessEXT
+    {0, &VkPhysicalDeviceShaderTileImageFeaturesEXT::shaderTileImageStencilReadAccess, nullptr, ""}, // TileImageStencilReadAccessEXT
     // Not found in current SPIR-V Headers
-    //    {spv::CapabilityCooperativeMatrixKHR, {0, &VkPhysicalDeviceCooperativeMatrixFeaturesKHR::cooperativeMatrix, nullptr, ""}},
+    //    {0, &VkPhysicalDeviceCooperativeMatrixFeaturesKHR::cooperativeMatrix, nullptr, ""}, // CooperativeMatrixKHR
 };
 // clang-format on
 
+// Returns the requirements of the capability in spirvCapabilities, empty if the capability is not supported by Vulkan
+static vvl::span<const RequiredSpirvInfo> GetSpirvCapabilityRequirements(uint32_t capability) {
+    switch (capability) {
+        case spv::CapabilityMatrix:
+            return {&spirvCapabilities[0], 1};
+        case spv::CapabilityShader:
+            return {&spirvCapabilities[1], 1};
+        case spv::CapabilityInputAttachment:
+            return {&spirvCapabilities[2], 1};
+        case spv::CapabilitySampled1D:
+            return {&spirvCapabilities[3], 1};
+        case spv::CapabilityImage1D:
+            return {&spirvCapabilities[4], 1};
+        case spv::CapabilitySampledBuffer:
+            return {&spirvCapabilities[5], 1};
+        case spv::CapabilityImageBuffer:
+            return {&spirvCapabilities[6], 1};
+        case spv::CapabilityImageQuery:
+            return {&spirvCapabilities[7], 1};
+        case spv::CapabilityDerivativeControl:
+            return {&spirvCapabilities[8], 1};
+        case spv::CapabilityGeometry:
+            return {&spirvCapabilities[9], 1};
+        case spv::CapabilityTessellation:
+            return {&spirvCapabilities[10], 1};
+        case spv::CapabilityFloat64:
+            return {&spirvCapabilities[11], 1};
+        case spv::CapabilityInt64:
+            return {&spirvCapabilities[12], 1};
+        case spv::CapabilityInt64Atomics:
+            return {&spirvCapabilities[13], 3};
+        case spv::CapabilityAtomicFloat16AddEXT:
+            return {&spirvCapabilities[16], 2};
+        case spv::CapabilityAtomicFloat32AddEXT:
+            return {&spirvCapabilities[18], 3};
+        case spv::CapabilityAtomicFloat64AddEXT:
+            return {&spirvCapabilities[21], 2};
+        case spv::CapabilityAtomicFloat16MinMaxEXT:
+            return {&spirvCapabilities[23], 2};
+        case spv::CapabilityAtomicFloat32MinMaxEXT:
+            return {&spirvCapabilities[25], 3};
+        case spv::CapabilityAtomicFloat64MinMaxEXT:
+            return {&spirvCapabilities[28], 2};
+        case spv::CapabilityInt64ImageEXT:
+            return {&spirvCapabilities[30], 1};
+        case spv::CapabilityInt16:
+            return {&spirvCapabilities[31], 1};
+        case spv::CapabilityTessellationPointSize:
+            return {&spirvCapabilities[32], 1};
+        case spv::CapabilityGeometryPointSize:
+            return {&spirvCapabilities[33], 1};
+        case spv::CapabilityImageGatherExtended:
+            return {&spirvCapabilities[34], 1};
+        case spv::CapabilityStorageImageMultisample:
+            return {&spirvCapabilities[35], 1};
+        case spv::CapabilityUniformBufferArrayDynamicIndexing:
+            return {&spirvCapabilities[36], 1};
+        case spv::CapabilitySampledImageArrayDynamicIndexing:
+            return {&spirvCapabilities[37], 1};
+        case spv::CapabilityStorageBufferArrayDynamicIndexing:
+            return {&spirvCapabilities[38], 1};
+        case spv::CapabilityStorageImageArrayDynamicIndexing:
+            return {&spirvCapabilities[39], 1};
+        case spv::CapabilityClipDistance:
+            return {&spirvCapabilities[40], 1};
+        case spv::CapabilityCullDistance:
+            return {&spirvCapabilities[41], 1};
+        case spv::CapabilityImageCubeArray:
+            return {&spirvCapabilities[42], 1};
+        case spv::CapabilitySampleRateShading:
+            return {&spirvCapabilities[43], 1};
+        case spv::CapabilitySparseResidency:
+            return {&spirvCapabilities[44], 1};
+        case spv::CapabilityMinLod:
+            return {&spirvCapabilities[45], 1};
+        case spv::CapabilitySampledCubeArray:
+            return {&spirvCapabilities[46], 1};
+        case spv::CapabilityImageMSArray:
+            return {&spirvCapabilities[47], 1};
+        case spv::CapabilityStorageImageExtendedFormats:
+            return {&spirvCapabilities[48], 1};
+        case spv::CapabilityInterpolationFunction:
+            return {&spirvCapabilities[49], 1};
+        case spv::CapabilityStorageImageReadWithoutFormat:
+            return {&spirvCapabilities[50], 3};
+        case spv::CapabilityStorageImageWriteWithoutFormat:
+            return {&spirvCapabilities[53], 3};
+        case spv::CapabilityMultiViewport:
+            return {&spirvCapabilities[56], 1};
+        case spv::CapabilityDrawParameters:
+            return {&spirvCapabilities[57], 2};
+        case spv::CapabilityMultiView:
+            return {&spirvCapabilities[59], 1};
+        case spv::CapabilityDeviceGroup:
+            return {&spirvCapabilities[60], 2};
+        case spv::CapabilityVariablePointersStorageBuffer:
+            return {&spirvCapabilities[62], 1};
+        case spv::CapabilityVariablePointers:
+            return {&spirvCapabilities[63], 1};
+        case spv::CapabilityShaderClockKHR:
+            return {&spirvCapabilities[64], 1};
+        case spv::CapabilityStencilExportEXT:
+            return {&spirvCapabilities[65], 1};
+        case spv::CapabilitySubgroupBallotKHR:
+            return {&spirvCapabilities[66], 1};
+        case spv::CapabilitySubgroupVoteKHR:
+            return {&spirvCapabilities[67], 1};
+        case spv::CapabilityImageReadWriteLodAMD:
+            return {&spirvCapabilities[68], 1};
+        case spv::CapabilityImageGatherBiasLodAMD:
+            return {&spirvCapabilities[69], 1};
+        case spv::CapabilityFragmentMaskAMD:
+            return {&spirvCapabilities[70], 1};
+        case spv::CapabilitySampleMaskOverrideCoverageNV:
+            return {&spirvCapabilities[71], 1};
+        case spv::CapabilityGeometryShaderPassthroughNV:
+            return {&spirvCapabilities[72], 1};
+        case spv::CapabilityShaderViewportIndex:
+            return {&spirvCapabilities[73], 1};
+        case spv::CapabilityShaderLayer:
+            return {&spirvCapabilities[74], 1};
+        case spv::CapabilityShaderViewportIndexLayerEXT:
+            return {&spirvCapabilities[75], 2};
+        case spv::CapabilityShaderViewportMaskNV:
+            return {&spirvCapabilities[77], 1};
+        case spv::CapabilityPerViewAttributesNV:
+            return {&spirvCapabilities[78], 1};
+        case spv::CapabilityStorageBuffer16BitAccess:
+            return {&spirvCapabilities[79], 1};
+        case spv::CapabilityUniformAndStorageBuffer16BitAccess:
+            return {&spirvCapabilities[80], 1};
+        case spv::CapabilityStoragePushConstant16:
+            return {&spirvCapabilities[81], 1};
+        case spv::CapabilityStorageInputOutput16:
+            return {&spirvCapabilities[82], 1};
+        case spv::CapabilityGroupNonUniform:
+            return {&spirvCapabilities[83], 1};
+        case spv::CapabilityGroupNonUniformVote:
+            return {&spirvCapabilities[84], 1};
+        case spv::CapabilityGroupNonUniformArithmetic:
+            return {&spirvCapabilities[85], 1};
+        case spv::CapabilityGroupNonUniformBallot:
+            return {&spirvCapabilities[86], 1};
+        case spv::CapabilityGroupNonUniformShuffle:
+            return {&spirvCapabilities[87], 1};
+        case spv::CapabilityGroupNonUniformShuffleRelative:
+            return {&spirvCapabilities[88], 1};
+        case spv::CapabilityGroupNonUniformClustered:
+            return {&spirvCapabilities[89], 1};
+        case spv::CapabilityGroupNonUniformQuad:
+            return {&spirvCapabilities[90], 1};
+        case spv::CapabilityGroupNonUniformPartitionedNV:
+            return {&spirvCapabilities[91], 1};
+        case spv::CapabilitySampleMaskPostDepthCoverage:
+            return {&spirvCapabilities[92], 1};
+        case spv::CapabilityShaderNonUniform:
+            return {&spirvCapabilities[93], 2};
+        case spv::CapabilityRuntimeDescriptorArray:
+            return {&spirvCapabilities[95], 1};
+        case spv::CapabilityInputAttachmentArrayDynamicIndexing:
+            return {&spirvCapabilities[96], 1};
+        case spv::CapabilityUniformTexelBufferArrayDynamicIndexing:
+            return {&spirvCapabilities[97], 1};
+        case spv::CapabilityStorageTexelBufferArrayDynamicIndexing:
+            return {&spirvCapabilities[98], 1};
+        case spv::CapabilityUniformBufferArrayNonUniformIndexing:
+            return {&spirvCapabilities[99], 1};
+        case spv::CapabilitySampledImageArrayNonUniformIndexing:
+            return {&spirvCapabilities[100], 1};
+        case spv::CapabilityStorageBufferArrayNonUniformIndexing:
+            return {&spirvCapabilities[101], 1};
+        case spv::CapabilityStorageImageArrayNonUniformIndexing:
+            return {&spirvCapabilities[102], 1};
+        case spv::CapabilityInputAttachmentArrayNonUniformIndexing:
+            return {&spirvCapabilities[103], 1};
+        case spv::CapabilityUniformTexelBufferArrayNonUniformIndexing:
+            return {&spirvCapabilities[104], 1};
+        case spv::CapabilityStorageTexelBufferArrayNonUniformIndexing:
+            return {&spirvCapabilities[105], 1};
+        case spv::CapabilityFragmentFullyCoveredEXT:
+            return {&spirvCapabilities[106], 1};
+        case spv::CapabilityFloat16:
+            return {&spirvCapabilities[107], 2};
+        case spv::CapabilityInt8:
+            return {&spirvCapabilities[109], 1};
+        case spv::CapabilityStorageBuffer8BitAccess:
+            return {&spirvCapabilities[110], 1};
+        case spv::CapabilityUniformAndStorageBuffer8BitAccess:
+            return {&spirvCapabilities[111], 1};
+        case spv::CapabilityStoragePushConstant8:
+            return {&spirvCapabilities[112], 1};
+        case spv::CapabilityVulkanMemoryModel:
+            return {&spirvCapabilities[113], 1};
+        case spv::CapabilityVulkanMemoryModelDeviceScope:
+            return {&spirvCapabilities[114], 1};
+        case spv::CapabilityDenormPreserve:
+            return {&spirvCapabilities[115], 3};
+        case spv::CapabilityDenormFlushToZero:
+            return {&spirvCapabilities[118], 3};
+        case spv::CapabilitySignedZeroInfNanPreserve:
+            return {&spirvCapabilities[121], 3};
+        case spv::CapabilityRoundingModeRTE:
+            return {&spirvCapabilities[124], 3};
+        case spv::CapabilityRoundingModeRTZ:
+            return {&spirvCapabilities[127], 3};
+        case spv::CapabilityComputeDerivativeGroupQuadsNV:
+            return {&spirvCapabilities[130], 1};
+        case spv::CapabilityComputeDerivativeGroupLinearNV:
+            return {&spirvCapabilities[131], 1};
+        case spv::CapabilityFragmentBarycentricKHR:
+            return {&spirvCapabilities[132], 2};
+        case spv::CapabilityImageFootprintNV:
+            return {&spirvCapabilities[134], 1};
+        case spv::CapabilityFragmentDensityEXT:
+            return {&spirvCapabilities[135], 2};
+        case spv::CapabilityMeshShadingNV:
+            return {&spirvCapabilities[137], 1};
+        case spv::CapabilityRayTracingKHR:
+            return {&spirvCapabilities[138], 1};
+        case spv::CapabilityRayQueryKHR:
+            return {&spirvCapabilities[139], 1};
+        case spv::CapabilityRayTraversalPrimitiveCullingKHR:
+            return {&spirvCapabilities[140], 2};
+        case spv::CapabilityRayCullMaskKHR:
+            return {&spirvCapabilities[142], 1};
+        case spv::CapabilityRayTracingNV:
+            return {&spirvCapabilities[143], 1};
+        case spv::CapabilityRayTracingMotionBlurNV:
+            return {&spirvCapabilities[144], 1};
+        case spv::CapabilityTransformFeedback:
+            return {&spirvCapabilities[145], 1};
+        case spv::CapabilityGeometryStreams:
+            return {&spirvCapabilities[146], 1};
+        case spv::CapabilityPhysicalStorageBufferAddresses:
+            return {&spirvCapabilities[147], 2};
+        case spv::CapabilityCooperativeMatrixNV:
+            return {&spirvCapabilities[149], 1};
+        case spv::CapabilityIntegerFunctions2INTEL:
+            return {&spirvCapabilities[150], 1};
+        case spv::CapabilityShaderSMBuiltinsNV:
+            return {&spirvCapabilities[151], 1};
+        case spv::CapabilityFragmentShaderSampleInterlockEXT:
+            return {&spirvCapabilities[152], 1};
+        case spv::CapabilityFragmentShaderPixelInterlockEXT:
+            return {&spirvCapabilities[153], 1};
+        case spv::CapabilityFragmentShaderShadingRateInterlockEXT:
+            return {&spirvCapabilities[154], 2};
+        case spv::CapabilityDemoteToHelperInvocationEXT:
+            return {&spirvCapabilities[156], 2};
+        case spv::CapabilityFragmentShadingRateKHR:
+            return {&spirvCapabilities[158], 3};
+        case spv::CapabilityWorkgroupMemoryExplicitLayoutKHR:
+            return {&spirvCapabilities[161], 1};
+        case spv::CapabilityWorkgroupMemoryExplicitLayout8BitAccessKHR:
+            return {&spirvCapabilities[162], 1};
+        case spv::CapabilityWorkgroupMemoryExplicitLayout16BitAccessKHR:
+            return {&spirvCapabilities[163], 1};
+        case spv::CapabilityDotProductInputAllKHR:
+            return {&spirvCapabilities[164], 2};
+        case spv::CapabilityDotProductInput4x8BitKHR:
+            return {&spirvCapabilities[166], 2};
+        case spv::CapabilityDotProductInput4x8BitPackedKHR:
+            return {&spirvCapabilities[168], 2};
+        case spv::CapabilityDotProductKHR:
+            return {&spirvCapabilities[170], 2};
+        case spv::CapabilityTextureSampleWeightedQCOM:
+            return {&spirvCapabilities[172], 1};
+        case spv::CapabilityTextureBoxFilterQCOM:
+            return {&spirvCapabilities[173], 1};
+        case spv::CapabilityTextureBlockMatchQCOM:
+            return {&spirvCapabilities[174], 1};
+        case spv::CapabilityMeshShadingEXT:
+            return {&spirvCapabilities[175], 1};
+        case spv::CapabilityRayTracingOpacityMicromapEXT:
+            return {&spirvCapabilities[176], 1};
+        case spv::CapabilityCoreBuiltinsARM:
+            return {&spirvCapabilities[177], 1};
+        case spv::CapabilityShaderInvocationReorderNV:
+            return {&spirvCapabilities[178], 1};
+        case spv::CapabilityRayTracingPositionFetchKHR:
+            return {&spirvCapabilities[179], 1};
+        case spv::CapabilityTileImageColorReadAccessEXT:
+            return {&spirvCapabilities[180], 1};
+        case spv::CapabilityTileImageDepthReadAccessEXT:
+            return {&spirvCapabilities[181], 1};
+        case spv::CapabilityTileImageStencilReadAccessEXT:
+            return {&spirvCapabilities[182], 1};
+        default:
+            return {};
+    }
+}
+
 // clang-format off
-static const std::unordered_multimap<std::string, RequiredSpirvInfo> spirvExtensions = {
-    {"SPV_KHR_variable_pointers", {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {"SPV_KHR_variable_pointers", {0, nullptr, &DeviceExtensions::vk_khr_variable_pointers, ""}},
-    {"SPV_AMD_shader_explicit_vertex_parameter", {0, nullptr, &DeviceExtensions::vk_amd_shader_explicit_vertex_parameter, ""}},
-    {"SPV_AMD_gcn_shader", {0, nullptr, &DeviceExtensions::vk_amd_gcn_shader, ""}},
-    {"SPV_AMD_gpu_shader_half_float", {0, nullptr, &DeviceExtensions::vk_amd_gpu_shader_half_float, ""}},
-    {"SPV_AMD_gpu_shader_int16", {0, nullptr, &DeviceExtensions::vk_amd_gpu_shader_int16, ""}},
-    {"SPV_AMD_shader_ballot", {0, nullptr, &DeviceExtensions::vk_amd_shader_ballot, ""}},
-    {"SPV_AMD_shader_fragment_mask", {0, nullptr, &DeviceExtensions::vk_amd_shader_fragment_mask, ""}},
-    {"SPV_AMD_shader_image_load_store_lod", {0, nullptr, &DeviceExtensions::vk_amd_shader_image_load_store_lod, ""}},
-    {"SPV_AMD_shader_trinary_minmax", {0, nullptr, &DeviceExtensions::vk_amd_shader_trinary_minmax, ""}},
-    {"SPV_AMD_texture_gather_bias_lod", {0, nullptr, &DeviceExtensions::vk_amd_texture_gather_bias_lod, ""}},
-    {"SPV_AMD_shader_early_and_late_fragment_tests", {0, nullptr, &DeviceExtensions::vk_amd_shader_early_and_late_fragment_tests, ""}},
-    {"SPV_KHR_shader_draw_parameters", {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {"SPV_KHR_shader_draw_parameters", {0, nullptr, &DeviceExtensions::vk_khr_shader_draw_parameters, ""}},
-    {"SPV_KHR_8bit_storage", {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {"SPV_KHR_8bit_storage", {0, nullptr, &DeviceExtensions::vk_khr_8bit_storage, ""}},
-    {"SPV_KHR_16bit_storage", {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {"SPV_KHR_16bit_storage", {0, nullptr, &DeviceExtensions::vk_khr_16bit_storage, ""}},
-    {"SPV_KHR_shader_clock", {0, nullptr, &DeviceExtensions::vk_khr_shader_clock, ""}},
-    {"SPV_KHR_float_controls", {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {"SPV_KHR_float_controls", {0, nullptr, &DeviceExtensions::vk_khr_shader_float_controls, ""}},
-    {"SPV_KHR_storage_buffer_storage_class", {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {"SPV_KHR_storage_buffer_storage_class", {0, nullptr, &DeviceExtensions::vk_khr_storage_buffer_storage_class, ""}},
-    {"SPV_KHR_post_depth_coverage", {0, nullptr, &DeviceExtensions::vk_ext_post_depth_coverage, ""}},
-    {"SPV_EXT_shader_stencil_export", {0, nullptr, &DeviceExtensions::vk_ext_shader_stencil_export, ""}},
-    {"SPV_KHR_shader_ballot", {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_ballot, ""}},
-    {"SPV_KHR_subgroup_vote", {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_vote, ""}},
-    {"SPV_NV_sample_mask_override_coverage", {0, nullptr, &DeviceExtensions::vk_nv_sample_mask_override_coverage, ""}},
-    {"SPV_NV_geometry_shader_passthrough", {0, nullptr, &DeviceExtensions::vk_nv_geometry_shader_passthrough, ""}},
-    {"SPV_NV_mesh_shader", {0, nullptr, &DeviceExtensions::vk_nv_mesh_shader, ""}},
-    {"SPV_NV_viewport_array2", {0, nullptr, &DeviceExtensions::vk_nv_viewport_array2, ""}},
-    {"SPV_NV_shader_subgroup_partitioned", {0, nullptr, &DeviceExtensions::vk_nv_shader_subgroup_partitioned, ""}},
-    {"SPV_NV_shader_invocation_reorder", {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing_invocation_reorder, ""}},
-    {"SPV_EXT_shader_viewport_index_layer", {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {"SPV_EXT_shader_viewport_index_layer", {0, nullptr, &DeviceExtensions::vk_ext_shader_viewport_index_layer, ""}},
-    {"SPV_NVX_multiview_per_view_attributes", {0, nullptr, &DeviceExtensions::vk_nvx_multiview_per_view_attributes, ""}},
-    {"SPV_EXT_descriptor_indexing", {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {"SPV_EXT_descriptor_indexing", {0, nullptr, &DeviceExtensions::vk_ext_descriptor_indexing, ""}},
-    {"SPV_KHR_vulkan_memory_model", {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {"SPV_KHR_vulkan_memory_model", {0, nullptr, &DeviceExtensions::vk_khr_vulkan_memory_model, ""}},
-    {"SPV_NV_compute_shader_derivatives", {0, nullptr, &DeviceExtensions::vk_nv_compute_shader_derivatives, ""}},
-    {"SPV_NV_fragment_shader_barycentric", {0, nullptr, &DeviceExtensions::vk_nv_fragment_shader_barycentric, ""}},
-    {"SPV_NV_shader_image_footprint", {0, nullptr, &DeviceExtensions::vk_nv_shader_image_footprint, ""}},
-    {"SPV_NV_shading_rate", {0, nullptr, &DeviceExtensions::vk_nv_shading_rate_image, ""}},
-    {"SPV_NV_ray_tracing", {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing, ""}},
-    {"SPV_KHR_ray_tracing", {0, nullptr, &DeviceExtensions::vk_khr_ray_tracing_pipeline, ""}},
-    {"SPV_KHR_ray_query", {0, nullptr, &DeviceExtensions::vk_khr_ray_query, ""}},
-    {"SPV_KHR_ray_cull_mask", {0, nullptr, &DeviceExtensions::vk_khr_ray_tracing_maintenance1, ""}},
-    {"SPV_GOOGLE_hlsl_functionality1", {0, nullptr, &DeviceExtensions::vk_google_hlsl_functionality1, ""}},
-    {"SPV_GOOGLE_user_type", {0, nullptr, &DeviceExtensions::vk_google_user_type, ""}},
-    {"SPV_GOOGLE_decorate_string", {0, nullptr, &DeviceExtensions::vk_google_decorate_string, ""}},
-    {"SPV_EXT_fragment_invocation_density", {0, nullptr, &DeviceExtensions::vk_ext_fragment_density_map, ""}},
-    {"SPV_KHR_physical_storage_buffer", {VK_API_VERSION_1_2, nullptr, nullptr, ""}},
-    {"SPV_KHR_physical_storage_buffer", {0, nullptr, &DeviceExtensions::vk_khr_buffer_device_address, ""}},
-    {"SPV_EXT_physical_storage_buffer", {0, nullptr, &DeviceExtensions::vk_ext_buffer_device_address, ""}},
-    {"SPV_NV_cooperative_matrix", {0, nullptr, &DeviceExtensions::vk_nv_cooperative_matrix, ""}},
-    {"SPV_NV_shader_sm_builtins", {0, nullptr, &DeviceExtensions::vk_nv_shader_sm_builtins, ""}},
-    {"SPV_EXT_fragment_shader_interlock", {0, nullptr, &DeviceExtensions::vk_ext_fragment_shader_interlock, ""}},
-    {"SPV_EXT_demote_to_helper_invocation", {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {"SPV_EXT_demote_to_helper_invocation", {0, nullptr, &DeviceExtensions::vk_ext_shader_demote_to_helper_invocation, ""}},
-    {"SPV_KHR_fragment_shading_rate", {0, nullptr, &DeviceExtensions::vk_khr_fragment_shading_rate, ""}},
-    {"SPV_KHR_non_semantic_info", {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {"SPV_KHR_non_semantic_info", {0, nullptr, &DeviceExtensions::vk_khr_shader_non_semantic_info, ""}},
-    {"SPV_EXT_shader_image_int64", {0, nullptr, &DeviceExtensions::vk_ext_shader_image_atomic_int64, ""}},
-    {"SPV_KHR_terminate_invocation", {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {"SPV_KHR_terminate_invocation", {0, nullptr, &DeviceExtensions::vk_khr_shader_terminate_invocation, ""}},
-    {"SPV_KHR_multiview", {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {"SPV_KHR_multiview", {0, nullptr, &DeviceExtensions::vk_khr_multiview, ""}},
-    {"SPV_KHR_workgroup_memory_explicit_layout", {0, nullptr, &DeviceExtensions::vk_khr_workgroup_memory_explicit_layout, ""}},
-    {"SPV_EXT_shader_atomic_float_add", {0, nullptr, &DeviceExtensions::vk_ext_shader_atomic_float, ""}},
-    {"SPV_KHR_fragment_shader_barycentric", {0, nullptr, &DeviceExtensions::vk_khr_fragment_shader_barycentric, ""}},
-    {"SPV_KHR_subgroup_uniform_control_flow", {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {"SPV_KHR_subgroup_uniform_control_flow", {0, nullptr, &DeviceExtensions::vk_khr_shader_subgroup_uniform_control_flow, ""}},
-    {"SPV_EXT_shader_atomic_float_min_max", {0, nullptr, &DeviceExtensions::vk_ext_shader_atomic_float2, ""}},
-    {"SPV_EXT_shader_atomic_float16_add", {0, nullptr, &DeviceExtensions::vk_ext_shader_atomic_float2, ""}},
-    {"SPV_EXT_fragment_fully_covered", {0, nullptr, &DeviceExtensions::vk_ext_conservative_rasterization, ""}},
-    {"SPV_KHR_integer_dot_product", {VK_API_VERSION_1_3, nullptr, nullptr, ""}},
-    {"SPV_KHR_integer_dot_product", {0, nullptr, &DeviceExtensions::vk_khr_shader_integer_dot_product, ""}},
-    {"SPV_INTEL_shader_integer_functions2", {0, nullptr, &DeviceExtensions::vk_intel_shader_integer_functions2, ""}},
-    {"SPV_KHR_device_group", {VK_API_VERSION_1_1, nullptr, nullptr, ""}},
-    {"SPV_KHR_device_group", {0, nullptr, &DeviceExtensions::vk_khr_device_group, ""}},
-    {"SPV_QCOM_image_processing", {0, nullptr, &DeviceExtensions::vk_qcom_image_processing, ""}},
-    {"SPV_EXT_mesh_shader", {0, nullptr, &DeviceExtensions::vk_ext_mesh_shader, ""}},
-    {"SPV_KHR_ray_tracing_position_fetch", {0, nullptr, &DeviceExtensions::vk_khr_ray_tracing_position_fetch, ""}},
-    {"SPV_EXT_shader_tile_image", {0, nullptr, &DeviceExtensions::vk_ext_shader_tile_image, ""}},
-    {"SPV_EXT_opacity_micromap", {0, nullptr, &DeviceExtensions::vk_ext_opacity_micromap, ""}},
-    {"SPV_KHR_cooperative_matrix", {0, nullptr, &DeviceExtensions::vk_khr_cooperative_matrix, ""}},
+static const RequiredSpirvInfo spirvExtensions[] = {
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // SPV_KHR_variable_pointers
+    {0, nullptr, &DeviceExtensions::vk_khr_variable_pointers, ""}, // SPV_KHR_variable_pointers
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_explicit_vertex_parameter, ""}, // SPV_AMD_shader_explicit_vertex_parameter
+    {0, nullptr, &DeviceExtensions::vk_amd_gcn_shader, ""}, // SPV_AMD_gcn_shader
+    {0, nullptr, &DeviceExtensions::vk_amd_gpu_shader_half_float, ""}, // SPV_AMD_gpu_shader_half_float
+    {0, nullptr, &DeviceExtensions::vk_amd_gpu_shader_int16, ""}, // SPV_AMD_gpu_shader_int16
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_ballot, ""}, // SPV_AMD_shader_ballot
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_fragment_mask, ""}, // SPV_AMD_shader_fragment_mask
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_image_load_store_lod, ""}, // SPV_AMD_shader_image_load_store_lod
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_trinary_minmax, ""}, // SPV_AMD_shader_trinary_minmax
+    {0, nullptr, &DeviceExtensions::vk_amd_texture_gather_bias_lod, ""}, // SPV_AMD_texture_gather_bias_lod
+    {0, nullptr, &DeviceExtensions::vk_amd_shader_early_and_late_fragment_tests, ""}, // SPV_AMD_shader_early_and_late_fragment_tests
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // SPV_KHR_shader_draw_parameters
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_draw_parameters, ""}, // SPV_KHR_shader_draw_parameters
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // SPV_KHR_8bit_storage
+    {0, nullptr, &DeviceExtensions::vk_khr_8bit_storage, ""}, // SPV_KHR_8bit_storage
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // SPV_KHR_16bit_storage
+    {0, nullptr, &DeviceExtensions::vk_khr_16bit_storage, ""}, // SPV_KHR_16bit_storage
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_clock, ""}, // SPV_KHR_shader_clock
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // SPV_KHR_float_controls
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_float_controls, ""}, // SPV_KHR_float_controls
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // SPV_KHR_storage_buffer_storage_class
+    {0, nullptr, &DeviceExtensions::vk_khr_storage_buffer_storage_class, ""}, // SPV_KHR_storage_buffer_storage_class
+    {0, nullptr, &DeviceExtensions::vk_ext_post_depth_coverage, ""}, // SPV_KHR_post_depth_coverage
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_stencil_export, ""}, // SPV_EXT_shader_stencil_export
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_ballot, ""}, // SPV_KHR_shader_ballot
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_subgroup_vote, ""}, // SPV_KHR_subgroup_vote
+    {0, nullptr, &DeviceExtensions::vk_nv_sample_mask_override_coverage, ""}, // SPV_NV_sample_mask_override_coverage
+    {0, nullptr, &DeviceExtensions::vk_nv_geometry_shader_passthrough, ""}, // SPV_NV_geometry_shader_passthrough
+    {0, nullptr, &DeviceExtensions::vk_nv_mesh_shader, ""}, // SPV_NV_mesh_shader
+    {0, nullptr, &DeviceExtensions::vk_nv_viewport_array2, ""}, // SPV_NV_viewport_array2
+    {0, nullptr, &DeviceExtensions::vk_nv_shader_subgroup_partitioned, ""}, // SPV_NV_shader_subgroup_partitioned
+    {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing_invocation_reorder, ""}, // SPV_NV_shader_invocation_reorder
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // SPV_EXT_shader_viewport_index_layer
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_viewport_index_layer, ""}, // SPV_EXT_shader_viewport_index_layer
+    {0, nullptr, &DeviceExtensions::vk_nvx_multiview_per_view_attributes, ""}, // SPV_NVX_multiview_per_view_attributes
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // SPV_EXT_descriptor_indexing
+    {0, nullptr, &DeviceExtensions::vk_ext_descriptor_indexing, ""}, // SPV_EXT_descriptor_indexing
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // SPV_KHR_vulkan_memory_model
+    {0, nullptr, &DeviceExtensions::vk_khr_vulkan_memory_model, ""}, // SPV_KHR_vulkan_memory_model
+    {0, nullptr, &DeviceExtensions::vk_nv_compute_shader_derivatives, ""}, // SPV_NV_compute_shader_derivatives
+    {0, nullptr, &DeviceExtensions::vk_nv_fragment_shader_barycentric, ""}, // SPV_NV_fragment_shader_barycentric
+    {0, nullptr, &DeviceExtensions::vk_nv_shader_image_footprint, ""}, // SPV_NV_shader_image_footprint
+    {0, nullptr, &DeviceExtensions::vk_nv_shading_rate_image, ""}, // SPV_NV_shading_rate
+    {0, nullptr, &DeviceExtensions::vk_nv_ray_tracing, ""}, // SPV_NV_ray_tracing
+    {0, nullptr, &DeviceExtensions::vk_khr_ray_tracing_pipeline, ""}, // SPV_KHR_ray_tracing
+    {0, nullptr, &DeviceExtensions::vk_khr_ray_query, ""}, // SPV_KHR_ray_query
+    {0, nullptr, &DeviceExtensions::vk_khr_ray_tracing_maintenance1, ""}, // SPV_KHR_ray_cull_mask
+    {0, nullptr, &DeviceExtensions::vk_google_hlsl_functionality1, ""}, // SPV_GOOGLE_hlsl_functionality1
+    {0, nullptr, &DeviceExtensions::vk_google_user_type, ""}, // SPV_GOOGLE_user_type
+    {0, nullptr, &DeviceExtensions::vk_google_decorate_string, ""}, // SPV_GOOGLE_decorate_string
+    {0, nullptr, &DeviceExtensions::vk_ext_fragment_density_map, ""}, // SPV_EXT_fragment_invocation_density
+    {VK_API_VERSION_1_2, nullptr, nullptr, ""}, // SPV_KHR_physical_storage_buffer
+    {0, nullptr, &DeviceExtensions::vk_khr_buffer_device_address, ""}, // SPV_KHR_physical_storage_buffer
+    {0, nullptr, &DeviceExtensions::vk_ext_buffer_device_address, ""}, // SPV_EXT_physical_storage_buffer
+    {0, nullptr, &DeviceExtensions::vk_nv_cooperative_matrix, ""}, // SPV_NV_cooperative_matrix
+    {0, nullptr, &DeviceExtensions::vk_nv_shader_sm_builtins, ""}, // SPV_NV_shader_sm_builtins
+    {0, nullptr, &DeviceExtensions::vk_ext_fragment_shader_interlock, ""}, // SPV_EXT_fragment_shader_interlock
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // SPV_EXT_demote_to_helper_invocation
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_demote_to_helper_invocation, ""}, // SPV_EXT_demote_to_helper_invocation
+    {0, nullptr, &DeviceExtensions::vk_khr_fragment_shading_rate, ""}, // SPV_KHR_fragment_shading_rate
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // SPV_KHR_non_semantic_info
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_non_semantic_info, ""}, // SPV_KHR_non_semantic_info
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_image_atomic_int64, ""}, // SPV_EXT_shader_image_int64
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // SPV_KHR_terminate_invocation
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_terminate_invocation, ""}, // SPV_KHR_terminate_invocation
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // SPV_KHR_multiview
+    {0, nullptr, &DeviceExtensions::vk_khr_multiview, ""}, // SPV_KHR_multiview
+    {0, nullptr, &DeviceExtensions::vk_khr_workgroup_memory_explicit_layout, ""}, // SPV_KHR_workgroup_memory_explicit_layout
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_atomic_float, ""}, // SPV_EXT_shader_atomic_float_add
+    {0, nullptr, &DeviceExtensions::vk_khr_fragment_shader_barycentric, ""}, // SPV_KHR_fragment_shader_barycentric
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // SPV_KHR_subgroup_uniform_control_flow
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_subgroup_uniform_control_flow, ""}, // SPV_KHR_subgroup_uniform_control_flow
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_atomic_float2, ""}, // SPV_EXT_shader_atomic_float_min_max
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_atomic_float2, ""}, // SPV_EXT_shader_atomic_float16_add
+    {0, nullptr, &DeviceExtensions::vk_ext_conservative_rasterization, ""}, // SPV_EXT_fragment_fully_covered
+    {VK_API_VERSION_1_3, nullptr, nullptr, ""}, // SPV_KHR_integer_dot_product
+    {0, nullptr, &DeviceExtensions::vk_khr_shader_integer_dot_product, ""}, // SPV_KHR_integer_dot_product
+    {0, nullptr, &DeviceExtensions::vk_intel_shader_integer_functions2, ""}, // SPV_INTEL_shader_integer_functions2
+    {VK_API_VERSION_1_1, nullptr, nullptr, ""}, // SPV_KHR_device_group
+    {0, nullptr, &DeviceExtensions::vk_khr_device_group, ""}, // SPV_KHR_device_group
+    {0, nullptr, &DeviceExtensions::vk_qcom_image_processing, ""}, // SPV_QCOM_image_processing
+    {0, nullptr, &DeviceExtensions::vk_ext_mesh_shader, ""}, // SPV_EXT_mesh_shader
+    {0, nullptr, &DeviceExtensions::vk_khr_ray_tracing_position_fetch, ""}, // SPV_KHR_ray_tracing_position_fetch
+    {0, nullptr, &DeviceExtensions::vk_ext_shader_tile_image, ""}, // SPV_EXT_shader_tile_image
+    {0, nullptr, &DeviceExtensions::vk_ext_opacity_micromap, ""}, // SPV_EXT_opacity_micromap
+    {0, nullptr, &DeviceExtensions::vk_khr_cooperative_matrix, ""}, // SPV_KHR_cooperative_matrix
 };
 // clang-format on
 
+struct SpirvExtensionRequirements {
+    const char* name;
+    uint32_t first;  // index into spirvExtensions
+    uint32_t count;
+};
+
+// Minimal perfect hash of the SPIR-V extension names to their requirements in spirvExtensions
+static constexpr uint32_t kSpirvExtensionSeeds[17] = {
+    57, 4, 42, 33, 31, 107, 33, 369, 4, 34, 30, 293, 110, 16, 6, 3171,
+    9,
+};
+static constexpr SpirvExtensionRequirements kSpirvExtensionRequirements[70] = {
+    {"SPV_EXT_opacity_micromap", 85, 1},
+    {"SPV_AMD_shader_early_and_late_fragment_tests", 11, 1},
+    {"SPV_NV_fragment_shader_barycentric", 41, 1},
+    {"SPV_EXT_descriptor_indexing", 36, 2},
+    {"SPV_QCOM_image_processing", 81, 1},
+    {"SPV_EXT_shader_atomic_float_min_max", 73, 1},
+    {"SPV_GOOGLE_decorate_string", 50, 1},
+    {"SPV_INTEL_shader_integer_functions2", 78, 1},
+    {"SPV_KHR_variable_pointers", 0, 2},
+    {"SPV_KHR_workgroup_memory_explicit_layout", 68, 1},
+    {"SPV_KHR_8bit_storage", 14, 2},
+    {"SPV_AMD_shader_trinary_minmax", 9, 1},
+    {"SPV_KHR_physical_storage_buffer", 52, 2},
+    {"SPV_KHR_ray_query", 46, 1},
+    {"SPV_EXT_shader_viewport_index_layer", 33, 2},
+    {"SPV_AMD_shader_explicit_vertex_parameter", 2, 1},
+    {"SPV_EXT_fragment_fully_covered", 75, 1},
+    {"SPV_GOOGLE_hlsl_functionality1", 48, 1},
+    {"SPV_AMD_gcn_shader", 3, 1},
+    {"SPV_EXT_shader_atomic_float_add", 69, 1},
+    {"SPV_KHR_vulkan_memory_model", 38, 2},
+    {"SPV_KHR_shader_draw_parameters", 12, 2},
+    {"SPV_NV_shader_subgroup_partitioned", 31, 1},
+    {"SPV_NV_sample_mask_override_coverage", 27, 1},
+    {"SPV_AMD_texture_gather_bias_lod", 10, 1},
+    {"SPV_KHR_shader_ballot", 25, 1},
+    {"SPV_EXT_shader_atomic_float16_add", 74, 1},
+    {"SPV_KHR_ray_tracing_position_fetch", 83, 1},
+    {"SPV_KHR_float_controls", 19, 2},
+    {"SPV_NV_shader_invocation_reorder", 32, 1},
+    {"SPV_NV_cooperative_matrix", 55, 1},
+    {"SPV_KHR_ray_tracing", 45, 1},
+    {"SPV_KHR_16bit_storage", 16, 2},
+    {"SPV_KHR_cooperative_matrix", 86, 1},
+    {"SPV_GOOGLE_user_type", 49, 1},
+    {"SPV_AMD_shader_fragment_mask", 7, 1},
+    {"SPV_KHR_terminate_invocation", 64, 2},
+    {"SPV_NV_shader_image_footprint", 42, 1},
+    {"SPV_EXT_demote_to_helper_invocation", 58, 2},
+    {"SPV_EXT_fragment_invocation_density", 51, 1},
+    {"SPV_EXT_physical_storage_buffer", 54, 1},
+    {"SPV_AMD_gpu_shader_int16", 5, 1},
+    {"SPV_AMD_gpu_shader_half_float", 4, 1},
+    {"SPV_KHR_subgroup_vote", 26, 1},
+    {"SPV_NV_mesh_shader", 29, 1},
+    {"SPV_KHR_post_depth_coverage", 23, 1},
+    {"SPV_KHR_ray_cull_mask", 47, 1},
+    {"SPV_NV_compute_shader_derivatives", 40, 1},
+    {"SPV_NV_geometry_shader_passthrough", 28, 1},
+    {"SPV_NV_shader_sm_builtins", 56, 1},
+    {"SPV_KHR_integer_dot_product", 76, 2},
+    {"SPV_EXT_shader_stencil_export", 24, 1},
+    {"SPV_NV_viewport_array2", 30, 1},
+    {"SPV_KHR_storage_buffer_storage_class", 21, 2},
+    {"SPV_KHR_non_semantic_info", 61, 2},
+    {"SPV_NV_ray_tracing", 44, 1},
+    {"SPV_EXT_shader_tile_image", 84, 1},
+    {"SPV_KHR_fragment_shader_barycentric", 70, 1},
+    {"SPV_AMD_shader_image_load_store_lod", 8, 1},
+    {"SPV_KHR_subgroup_uniform_control_flow", 71, 2},
+    {"SPV_KHR_shader_clock", 18, 1},
+    {"SPV_KHR_fragment_shading_rate", 60, 1},
+    {"SPV_NVX_multiview_per_view_attributes", 35, 1},
+    {"SPV_AMD_shader_ballot", 6, 1},
+    {"SPV_KHR_multiview", 66, 2},
+    {"SPV_EXT_mesh_shader", 82, 1},
+    {"SPV_KHR_device_group", 79, 2},
+    {"SPV_EXT_fragment_shader_interlock", 57, 1},
+    {"SPV_EXT_shader_image_int64", 63, 1},
+    {"SPV_NV_shading_rate", 43, 1},
+};
+
+// Returns the requirements of the extension in spirvExtensions, empty if the extension is not supported by Vulkan
+static vvl::span<const RequiredSpirvInfo> GetSpirvExtensionRequirements(const char* extension) {
+    const uint32_t seed = kSpirvExtensionSeeds[hash_util::PerfectHashString(0, extension) % std::size(kSpirvExtensionSeeds)];
+    const SpirvExtensionRequirements& item =
+        kSpirvExtensionRequirements[hash_util::PerfectHashString(seed, extension) % std::size(kSpirvExtensionRequirements)];
+    if (strcmp(item.name, extension) == 0) {
+        return {&spirvExtensions[item.first], item.count};
+    }
+    return {};
+}
+
 static inline const char* string_SpvCapability(uint32_t input_value) {
     switch ((spv::Capability)input_value) {
          case spv::CapabilityMatrix:
@@ -793,7 +1182,8 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
 
     if (insn.Opcode() == spv::OpCapability) {
         // All capabilities are generated so if it is not in the list it is not supported by Vulkan
-        if (spirvCapabilities.count(insn.Word(1)) == 0) {
+        const auto caps = GetSpirvCapabilityRequirements(insn.Word(1));
+        if (caps.empty()) {
             skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08739",
                 "vkCreateShaderModule(): A SPIR-V Capability (%s) was declared that is not supported by Vulkan.", string_SpvCapability(insn.Word(1)));
             return skip; // no known capability to validate
@@ -802,24 +1192,23 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
         // Each capability has one or more requirements to check
         // Only one item has to be satisfied and an error only occurs
         // when all are not satisfied
-        auto caps = spirvCapabilities.equal_range(insn.Word(1));
         bool has_support = false;
-        for (auto it = caps.first; (it != caps.second) && (has_support == false); ++it) {
-            if (it->second.version) {
-                if (api_version >= it->second.version) {
+        for (auto it = caps.begin(); (it != caps.end()) && (has_support == false); ++it) {
+            if (it->version) {
+                if (api_version >= it->version) {
                     has_support = true;
                 }
-            } else if (it->second.feature) {
-                if (it->second.feature.IsEnabled(enabled_features)) {
+            } else if (it->feature) {
+                if (it->feature.IsEnabled(enabled_features)) {
                     has_support = true;
                 }
-            } else if (it->second.extension) {
+            } else if (it->extension) {
                 // kEnabledByApiLevel is not valid as some extension are promoted with feature bits to be used.
-                // If the new Api Level gives support, it will be caught in the "it->second.version" check instead.
-                if (IsExtEnabledByCreateinfo(device_extensions.*(it->second.extension))) {
+                // If the new Api Level gives support, it will be caught in the "it->version" check instead.
+                if (IsExtEnabledByCreateinfo(device_extensions.*(it->extension))) {
                     has_support = true;
                 }
-            } else if (it->second.property) {
+            } else if (it->property) {
                 // support is or'ed as only one has to be supported (if applicable)
                 switch (insn.Word(1)) {
                     case spv::CapabilityDenormFlushToZero:
@@ -895,39 +1284,39 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
             }
         }
     } else if (insn.Opcode() == spv::OpExtension) {
-        static const std::string spv_prefix = "SPV_";
-        std::string extension_name = insn.GetAsString(1);
+        const char* extension_name = insn.GetAsString(1);
+        vvl::span<const RequiredSpirvInfo> ext;
 
-        if (0 == extension_name.compare(0, spv_prefix.size(), spv_prefix)) {
-            if (spirvExtensions.count(extension_name) == 0) {
+        if (strncmp(extension_name, "SPV_", 4) == 0) {
+            ext = GetSpirvExtensionRequirements(extension_name);
+            if (ext.empty()) {
                 skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08741",
-                    "vkCreateShaderModule(): A SPIR-V Extension (%s) was declared that is not supported by Vulkan.", extension_name.c_str());
+                    "vkCreateShaderModule(): A SPIR-V Extension (%s) was declared that is not supported by Vulkan.", extension_name);
                 return skip; // no known extension to validate
             }
         } else {
             skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08741",
                 "vkCreateShaderModule(): The SPIR-V code uses the '%s' extension which is not a SPIR-V extension. Please use a SPIR-V"
                 " extension (https://github.com/KhronosGroup/SPIRV-Registry) for OpExtension instructions. Non-SPIR-V extensions can be"
-                " recorded in SPIR-V using the OpSourceExtension instruction.", extension_name.c_str());
+                " recorded in SPIR-V using the OpSourceExtension instruction.", extension_name);
             return skip; // no known extension to validate
         }
 
         // Each SPIR-V Extension has one or more requirements to check
         // Only one item has to be satisfied and an error only occurs
         // when all are not satisfied
-        auto ext = spirvExtensions.equal_range(extension_name);
         bool has_support = false;
-        for (auto it = ext.first; (it != ext.second) && (has_support == false); ++it) {
-            if (it->second.version) {
-                if (api_version >= it->second.version) {
+        for (auto it = ext.begin(); (it != ext.end()) && (has_support == false); ++it) {
+            if (it->version) {
+                if (api_version >= it->version) {
                     has_support = true;
                 }
-            } else if (it->second.feature) {
-                if (it->second.feature.IsEnabled(enabled_features)) {
+            } else if (it->feature) {
+                if (it->feature.IsEnabled(enabled_features)) {
                     has_support = true;
                 }
-            } else if (it->second.extension) {
-                if (IsExtEnabled(device_extensions.*(it->second.extension))) {
+            } else if (it->extension) {
+                if (IsExtEnabled(device_extensions.*(it->extension))) {
                     has_support = true;
                 }
             }
@@ -935,7 +1324,7 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
 
         if (has_support == false) {
             skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08742",
-                "vkCreateShaderModule(): The SPIR-V Extension (%s) was declared, but none of the requirements were met to use it.", extension_name.c_str());
+                "vkCreateShaderModule(): The SPIR-V Extension (%s) was declared, but none of the requirements were met to use it.", extension_name);
         }
     } //spv::OpExtension
     return skip;
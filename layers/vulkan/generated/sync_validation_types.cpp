@@ -927,13 +927,19 @@ return variable;
 }
 
 
-const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMaskByStageBit() {
-    static const std::map<VkPipelineStageFlags2, SyncStageAccessFlags> variable = {
-    { VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT, (
+const std::array<SyncStageAccessFlags, 64>& syncStageAccessMaskByStageBit() {
+    static constexpr std::array<SyncStageAccessFlags, 64> variable = {{
+    // 0: VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
+    SyncStageAccessFlags(0),
+    // 1: VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
+    (
         SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ_BIT |
         SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT, (
+    ),
+    // 2: VK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT
+    SyncStageAccessFlags(0),
+    // 3: VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT
+    (
         SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_VERTEX_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_VERTEX_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -941,8 +947,9 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_VERTEX_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_VERTEX_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT, (
+    ),
+    // 4: VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT
+    (
         SYNC_TESSELLATION_CONTROL_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -950,8 +957,9 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT, (
+    ),
+    // 5: VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT
+    (
         SYNC_TESSELLATION_EVALUATION_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -959,8 +967,9 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT, (
+    ),
+    // 6: VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT
+    (
         SYNC_GEOMETRY_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_GEOMETRY_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_GEOMETRY_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -968,8 +977,9 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_GEOMETRY_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_GEOMETRY_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_GEOMETRY_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT, (
+    ),
+    // 7: VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT
+    (
         SYNC_FRAGMENT_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_FRAGMENT_SHADER_COLOR_ATTACHMENT_READ_BIT |
         SYNC_FRAGMENT_SHADER_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
@@ -980,21 +990,25 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_FRAGMENT_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_FRAGMENT_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_FRAGMENT_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT, (
+    ),
+    // 8: VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT
+    (
         SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
         SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT, (
+    ),
+    // 9: VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT
+    (
         SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
         SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT, (
+    ),
+    // 10: VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT
+    (
         SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_BIT |
         SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT |
         SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT, (
+    ),
+    // 11: VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT
+    (
         SYNC_COMPUTE_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_COMPUTE_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_COMPUTE_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -1002,19 +1016,31 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_COMPUTE_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_COMPUTE_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_COMPUTE_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_HOST_BIT, (
+    ),
+    // 12: VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT
+    SyncStageAccessFlags(0),
+    // 13: VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
+    SyncStageAccessFlags(0),
+    // 14: VK_PIPELINE_STAGE_2_HOST_BIT
+    (
         SYNC_HOST_HOST_READ_BIT |
         SYNC_HOST_HOST_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV, (
+    ),
+    // 15: VK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT
+    SyncStageAccessFlags(0),
+    // 16: VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT
+    SyncStageAccessFlags(0),
+    // 17: VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV
+    (
         SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_READ_BIT_NV |
         SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_WRITE_BIT_NV
-    )},
-    { VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT, (
+    ),
+    // 18: VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT
+    (
         SYNC_CONDITIONAL_RENDERING_BIT_EXT_CONDITIONAL_RENDERING_READ_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT, (
+    ),
+    // 19: VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT
+    (
         SYNC_TASK_SHADER_EXT_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_TASK_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_TASK_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT |
@@ -1022,8 +1048,9 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ_BIT |
         SYNC_TASK_SHADER_EXT_SHADER_STORAGE_WRITE_BIT |
         SYNC_TASK_SHADER_EXT_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT, (
+    ),
+    // 20: VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT
+    (
         SYNC_MESH_SHADER_EXT_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_MESH_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_MESH_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT |
@@ -1031,8 +1058,9 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_MESH_SHADER_EXT_SHADER_STORAGE_READ_BIT |
         SYNC_MESH_SHADER_EXT_SHADER_STORAGE_WRITE_BIT |
         SYNC_MESH_SHADER_EXT_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR, (
+    ),
+    // 21: VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR
+    (
         SYNC_RAY_TRACING_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_RAY_TRACING_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_RAY_TRACING_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -1040,78 +1068,100 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_RAY_TRACING_SHADER_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, (
+    ),
+    // 22: VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    (
         SYNC_FRAGMENT_SHADING_RATE_ATTACHMENT_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT, (
+    ),
+    // 23: VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT
+    (
         SYNC_FRAGMENT_DENSITY_PROCESS_BIT_EXT_FRAGMENT_DENSITY_MAP_READ_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT, (
+    ),
+    // 24: VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT
+    (
         SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT |
         SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT |
         SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_WRITE_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR, (
+    ),
+    // 25: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR
+    (
         SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_WRITE_BIT |
         SYNC_ACCELERATION_STRUCTURE_BUILD_INDIRECT_COMMAND_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_BUILD_MICROMAP_READ_BIT_EXT |
         SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR, (
+    ),
+    // 26: VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR
+    (
         SYNC_VIDEO_DECODE_VIDEO_DECODE_READ_BIT |
         SYNC_VIDEO_DECODE_VIDEO_DECODE_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR, (
+    ),
+    // 27: VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR
+    (
         SYNC_VIDEO_ENCODE_VIDEO_ENCODE_READ_BIT |
         SYNC_VIDEO_ENCODE_VIDEO_ENCODE_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR, (
+    ),
+    // 28: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR
+    (
         SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_WRITE_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV, (
+    ),
+    // 29: VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV
+    (
         SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_READ_BIT_NV |
         SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_WRITE_BIT_NV
-    )},
-    { VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT, (
+    ),
+    // 30: VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT
+    (
         SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_READ_BIT_EXT |
         SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_WRITE_BIT_EXT |
         SYNC_MICROMAP_BUILD_EXT_TRANSFER_READ_BIT |
         SYNC_MICROMAP_BUILD_EXT_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COPY_BIT, (
+    ),
+    // 31: unused
+    SyncStageAccessFlags(0),
+    // 32: VK_PIPELINE_STAGE_2_COPY_BIT
+    (
         SYNC_COPY_TRANSFER_READ_BIT |
         SYNC_COPY_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RESOLVE_BIT, (
+    ),
+    // 33: VK_PIPELINE_STAGE_2_RESOLVE_BIT
+    (
         SYNC_RESOLVE_TRANSFER_READ_BIT |
         SYNC_RESOLVE_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_BLIT_BIT, (
+    ),
+    // 34: VK_PIPELINE_STAGE_2_BLIT_BIT
+    (
         SYNC_BLIT_TRANSFER_READ_BIT |
         SYNC_BLIT_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CLEAR_BIT, (
+    ),
+    // 35: VK_PIPELINE_STAGE_2_CLEAR_BIT
+    (
         SYNC_CLEAR_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT, (
+    ),
+    // 36: VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT
+    (
         SYNC_INDEX_INPUT_INDEX_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT, (
+    ),
+    // 37: VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT
+    (
         SYNC_VERTEX_ATTRIBUTE_INPUT_VERTEX_ATTRIBUTE_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI, (
+    ),
+    // 38: VK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT
+    SyncStageAccessFlags(0),
+    // 39: VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI
+    (
         SYNC_SUBPASS_SHADING_HUAWEI_INPUT_ATTACHMENT_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI, (
+    ),
+    // 40: VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI
+    (
         SYNC_INVOCATION_MASK_HUAWEI_INVOCATION_MASK_READ_HUAWEI_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI, (
+    ),
+    // 41: VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI
+    (
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_BINDING_TABLE_READ_BIT |
@@ -1119,29 +1169,34 @@ const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMask
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_WRITE_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_PRESENT_ENGINE_BIT_SYNCVAL, (
+    ),
+    // 42: VK_PIPELINE_STAGE_2_PRESENT_ENGINE_BIT_SYNCVAL
+    (
         SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_ACQUIRE_READ_BIT_SYNCVAL |
         SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_PRESENTED_BIT_SYNCVAL
-    )},
-    };
+    ),
+    }};
     return variable;
 }
 
 
-const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAccessBit() {
-    static const std::map<VkAccessFlags2, SyncStageAccessFlags> variable = {
-    { VK_ACCESS_2_INDIRECT_COMMAND_READ_BIT, (
+const std::array<SyncStageAccessFlags, 64>& syncStageAccessMaskByAccessBit() {
+    static constexpr std::array<SyncStageAccessFlags, 64> variable = {{
+    // 0: VK_ACCESS_2_INDIRECT_COMMAND_READ_BIT
+    (
         SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_BUILD_INDIRECT_COMMAND_READ_BIT
-    )},
-    { VK_ACCESS_2_INDEX_READ_BIT, (
+    ),
+    // 1: VK_ACCESS_2_INDEX_READ_BIT
+    (
         SYNC_INDEX_INPUT_INDEX_READ_BIT
-    )},
-    { VK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT, (
+    ),
+    // 2: VK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT
+    (
         SYNC_VERTEX_ATTRIBUTE_INPUT_VERTEX_ATTRIBUTE_READ_BIT
-    )},
-    { VK_ACCESS_2_UNIFORM_READ_BIT, (
+    ),
+    // 3: VK_ACCESS_2_UNIFORM_READ_BIT
+    (
         SYNC_VERTEX_SHADER_UNIFORM_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_UNIFORM_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_UNIFORM_READ_BIT |
@@ -1152,36 +1207,47 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_MESH_SHADER_EXT_UNIFORM_READ_BIT |
         SYNC_RAY_TRACING_SHADER_UNIFORM_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_UNIFORM_READ_BIT
-    )},
-    { VK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT, (
+    ),
+    // 4: VK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT
+    (
         SYNC_FRAGMENT_SHADER_INPUT_ATTACHMENT_READ_BIT |
         SYNC_SUBPASS_SHADING_HUAWEI_INPUT_ATTACHMENT_READ_BIT
-    )},
-    { VK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT, (
+    ),
+    // 5: VK_ACCESS_2_SHADER_READ_BIT
+    SyncStageAccessFlags(0),
+    // 6: VK_ACCESS_2_SHADER_WRITE_BIT
+    SyncStageAccessFlags(0),
+    // 7: VK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT
+    (
         SYNC_FRAGMENT_SHADER_COLOR_ATTACHMENT_READ_BIT |
         SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_BIT
-    )},
-    { VK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT, (
+    ),
+    // 8: VK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT
+    (
         SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT, (
+    ),
+    // 9: VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT
+    (
         SYNC_FRAGMENT_SHADER_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
         SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
         SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT
-    )},
-    { VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT, (
+    ),
+    // 10: VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT
+    (
         SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT |
         SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_ACCESS_2_TRANSFER_READ_BIT, (
+    ),
+    // 11: VK_ACCESS_2_TRANSFER_READ_BIT
+    (
         SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_READ_BIT |
         SYNC_MICROMAP_BUILD_EXT_TRANSFER_READ_BIT |
         SYNC_COPY_TRANSFER_READ_BIT |
         SYNC_RESOLVE_TRANSFER_READ_BIT |
         SYNC_BLIT_TRANSFER_READ_BIT
-    )},
-    { VK_ACCESS_2_TRANSFER_WRITE_BIT, (
+    ),
+    // 12: VK_ACCESS_2_TRANSFER_WRITE_BIT
+    (
         SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_WRITE_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_WRITE_BIT |
         SYNC_MICROMAP_BUILD_EXT_TRANSFER_WRITE_BIT |
@@ -1189,26 +1255,41 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_RESOLVE_TRANSFER_WRITE_BIT |
         SYNC_BLIT_TRANSFER_WRITE_BIT |
         SYNC_CLEAR_TRANSFER_WRITE_BIT
-    )},
-    { VK_ACCESS_2_HOST_READ_BIT, (
+    ),
+    // 13: VK_ACCESS_2_HOST_READ_BIT
+    (
         SYNC_HOST_HOST_READ_BIT
-    )},
-    { VK_ACCESS_2_HOST_WRITE_BIT, (
+    ),
+    // 14: VK_ACCESS_2_HOST_WRITE_BIT
+    (
         SYNC_HOST_HOST_WRITE_BIT
-    )},
-    { VK_ACCESS_2_COMMAND_PREPROCESS_READ_BIT_NV, (
+    ),
+    // 15: VK_ACCESS_2_MEMORY_READ_BIT
+    (
+        syncStageAccessReadMask
+    ),
+    // 16: VK_ACCESS_2_MEMORY_WRITE_BIT
+    (
+        syncStageAccessWriteMask
+    ),
+    // 17: VK_ACCESS_2_COMMAND_PREPROCESS_READ_BIT_NV
+    (
         SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_READ_BIT_NV
-    )},
-    { VK_ACCESS_2_COMMAND_PREPROCESS_WRITE_BIT_NV, (
+    ),
+    // 18: VK_ACCESS_2_COMMAND_PREPROCESS_WRITE_BIT_NV
+    (
         SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_WRITE_BIT_NV
-    )},
-    { VK_ACCESS_2_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT, (
+    ),
+    // 19: VK_ACCESS_2_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT
+    (
         SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT
-    )},
-    { VK_ACCESS_2_CONDITIONAL_RENDERING_READ_BIT_EXT, (
+    ),
+    // 20: VK_ACCESS_2_CONDITIONAL_RENDERING_READ_BIT_EXT
+    (
         SYNC_CONDITIONAL_RENDERING_BIT_EXT_CONDITIONAL_RENDERING_READ_BIT_EXT
-    )},
-    { VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR, (
+    ),
+    // 21: VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR
+    (
         SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
@@ -1221,28 +1302,43 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_ACCELERATION_STRUCTURE_READ_BIT
-    )},
-    { VK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR, (
+    ),
+    // 22: VK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR
+    (
         SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_WRITE_BIT |
         SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_WRITE_BIT
-    )},
-    { VK_ACCESS_2_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR, (
+    ),
+    // 23: VK_ACCESS_2_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR
+    (
         SYNC_FRAGMENT_SHADING_RATE_ATTACHMENT_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT
-    )},
-    { VK_ACCESS_2_FRAGMENT_DENSITY_MAP_READ_BIT_EXT, (
+    ),
+    // 24: VK_ACCESS_2_FRAGMENT_DENSITY_MAP_READ_BIT_EXT
+    (
         SYNC_FRAGMENT_DENSITY_PROCESS_BIT_EXT_FRAGMENT_DENSITY_MAP_READ_BIT_EXT
-    )},
-    { VK_ACCESS_2_TRANSFORM_FEEDBACK_WRITE_BIT_EXT, (
+    ),
+    // 25: VK_ACCESS_2_TRANSFORM_FEEDBACK_WRITE_BIT_EXT
+    (
         SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_WRITE_BIT_EXT
-    )},
-    { VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT, (
+    ),
+    // 26: VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT
+    (
         SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT |
         SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT
-    )},
-    { VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT, (
+    ),
+    // 27: VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT
+    (
         SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT
-    )},
-    { VK_ACCESS_2_SHADER_SAMPLED_READ_BIT, (
+    ),
+    // 28: unused
+    SyncStageAccessFlags(0),
+    // 29: unused
+    SyncStageAccessFlags(0),
+    // 30: unused
+    SyncStageAccessFlags(0),
+    // 31: unused
+    SyncStageAccessFlags(0),
+    // 32: VK_ACCESS_2_SHADER_SAMPLED_READ_BIT
+    (
         SYNC_VERTEX_SHADER_SHADER_SAMPLED_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_SAMPLED_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_SAMPLED_READ_BIT |
@@ -1253,8 +1349,9 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_MESH_SHADER_EXT_SHADER_SAMPLED_READ_BIT |
         SYNC_RAY_TRACING_SHADER_SHADER_SAMPLED_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_SAMPLED_READ_BIT
-    )},
-    { VK_ACCESS_2_SHADER_STORAGE_READ_BIT, (
+    ),
+    // 33: VK_ACCESS_2_SHADER_STORAGE_READ_BIT
+    (
         SYNC_VERTEX_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_READ_BIT |
@@ -1265,8 +1362,9 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_MESH_SHADER_EXT_SHADER_STORAGE_READ_BIT |
         SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_READ_BIT
-    )},
-    { VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT, (
+    ),
+    // 34: VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT
+    (
         SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE_BIT |
@@ -1277,23 +1375,29 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_MESH_SHADER_EXT_SHADER_STORAGE_WRITE_BIT |
         SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_WRITE_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_WRITE_BIT
-    )},
-    { VK_ACCESS_2_VIDEO_DECODE_READ_BIT_KHR, (
+    ),
+    // 35: VK_ACCESS_2_VIDEO_DECODE_READ_BIT_KHR
+    (
         SYNC_VIDEO_DECODE_VIDEO_DECODE_READ_BIT
-    )},
-    { VK_ACCESS_2_VIDEO_DECODE_WRITE_BIT_KHR, (
+    ),
+    // 36: VK_ACCESS_2_VIDEO_DECODE_WRITE_BIT_KHR
+    (
         SYNC_VIDEO_DECODE_VIDEO_DECODE_WRITE_BIT
-    )},
-    { VK_ACCESS_2_VIDEO_ENCODE_READ_BIT_KHR, (
+    ),
+    // 37: VK_ACCESS_2_VIDEO_ENCODE_READ_BIT_KHR
+    (
         SYNC_VIDEO_ENCODE_VIDEO_ENCODE_READ_BIT
-    )},
-    { VK_ACCESS_2_VIDEO_ENCODE_WRITE_BIT_KHR, (
+    ),
+    // 38: VK_ACCESS_2_VIDEO_ENCODE_WRITE_BIT_KHR
+    (
         SYNC_VIDEO_ENCODE_VIDEO_ENCODE_WRITE_BIT
-    )},
-    { VK_ACCESS_2_INVOCATION_MASK_READ_BIT_HUAWEI, (
+    ),
+    // 39: VK_ACCESS_2_INVOCATION_MASK_READ_BIT_HUAWEI
+    (
         SYNC_INVOCATION_MASK_HUAWEI_INVOCATION_MASK_READ_HUAWEI_BIT
-    )},
-    { VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR, (
+    ),
+    // 40: VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR
+    (
         SYNC_VERTEX_SHADER_SHADER_BINDING_TABLE_READ_BIT |
         SYNC_TESSELLATION_CONTROL_SHADER_SHADER_BINDING_TABLE_READ_BIT |
         SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_BINDING_TABLE_READ_BIT |
@@ -1304,8 +1408,9 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_MESH_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT |
         SYNC_RAY_TRACING_SHADER_SHADER_BINDING_TABLE_READ_BIT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_BINDING_TABLE_READ_BIT
-    )},
-    { VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT, (
+    ),
+    // 41: VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT
+    (
         SYNC_VERTEX_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_TESSELLATION_CONTROL_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_TESSELLATION_EVALUATION_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
@@ -1316,44 +1421,50 @@ const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAcces
         SYNC_MESH_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_RAY_TRACING_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         SYNC_CLUSTER_CULLING_SHADER_HUAWEI_DESCRIPTOR_BUFFER_READ_BIT_EXT
-    )},
-    { VK_ACCESS_2_OPTICAL_FLOW_READ_BIT_NV, (
+    ),
+    // 42: VK_ACCESS_2_OPTICAL_FLOW_READ_BIT_NV
+    (
         SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_READ_BIT_NV
-    )},
-    { VK_ACCESS_2_OPTICAL_FLOW_WRITE_BIT_NV, (
+    ),
+    // 43: VK_ACCESS_2_OPTICAL_FLOW_WRITE_BIT_NV
+    (
         SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_WRITE_BIT_NV
-    )},
-    { VK_ACCESS_2_MICROMAP_READ_BIT_EXT, (
+    ),
+    // 44: VK_ACCESS_2_MICROMAP_READ_BIT_EXT
+    (
         SYNC_ACCELERATION_STRUCTURE_BUILD_MICROMAP_READ_BIT_EXT |
         SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_READ_BIT_EXT
-    )},
-    { VK_ACCESS_2_MICROMAP_WRITE_BIT_EXT, (
+    ),
+    // 45: VK_ACCESS_2_MICROMAP_WRITE_BIT_EXT
+    (
         SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_WRITE_BIT_EXT
-    )},
-    { VK_ACCESS_2_PRESENT_ACQUIRE_READ_BIT_SYNCVAL, (
+    ),
+    // 46: VK_ACCESS_2_PRESENT_ACQUIRE_READ_BIT_SYNCVAL
+    (
         SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_ACQUIRE_READ_BIT_SYNCVAL
-    )},
-    { VK_ACCESS_2_PRESENT_PRESENTED_BIT_SYNCVAL, (
+    ),
+    // 47: VK_ACCESS_2_PRESENT_PRESENTED_BIT_SYNCVAL
+    (
         SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_PRESENTED_BIT_SYNCVAL
-    )},
-    { VK_ACCESS_2_MEMORY_READ_BIT, (
-        syncStageAccessReadMask
-    )},
-    { VK_ACCESS_2_MEMORY_WRITE_BIT, (
-        syncStageAccessWriteMask
-    )},
-    };
+    ),
+    }};
     return variable;
 }
 
 
-const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMask() {
-    static const std::map<VkPipelineStageFlags2, VkAccessFlags2> variable = {
-    { VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT, (
+const std::array<VkAccessFlags2, 64>& syncDirectStageToAccessMask() {
+    static constexpr std::array<VkAccessFlags2, 64> variable = {{
+    // 0: VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
+    0,
+    // 1: VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
+    (
         VK_ACCESS_2_INDIRECT_COMMAND_READ_BIT |
         VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT, (
+    ),
+    // 2: VK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT
+    0,
+    // 3: VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1361,8 +1472,9 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT, (
+    ),
+    // 4: VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1370,8 +1482,9 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT, (
+    ),
+    // 5: VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1379,8 +1492,9 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT, (
+    ),
+    // 6: VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1388,8 +1502,9 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT, (
+    ),
+    // 7: VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT |
         VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
@@ -1400,21 +1515,25 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT, (
+    ),
+    // 8: VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT
+    (
         VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
         VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT, (
+    ),
+    // 9: VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT
+    (
         VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT |
         VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT, (
+    ),
+    // 10: VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT
+    (
         VK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT |
         VK_ACCESS_2_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT |
         VK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT, (
+    ),
+    // 11: VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1422,19 +1541,31 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_HOST_BIT, (
+    ),
+    // 12: VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT
+    0,
+    // 13: VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
+    0,
+    // 14: VK_PIPELINE_STAGE_2_HOST_BIT
+    (
         VK_ACCESS_2_HOST_READ_BIT |
         VK_ACCESS_2_HOST_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV, (
+    ),
+    // 15: VK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT
+    0,
+    // 16: VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT
+    0,
+    // 17: VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV
+    (
         VK_ACCESS_2_COMMAND_PREPROCESS_READ_BIT_NV |
         VK_ACCESS_2_COMMAND_PREPROCESS_WRITE_BIT_NV
-    )},
-    { VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT, (
+    ),
+    // 18: VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT
+    (
         VK_ACCESS_2_CONDITIONAL_RENDERING_READ_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT, (
+    ),
+    // 19: VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1442,8 +1573,9 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT, (
+    ),
+    // 20: VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1451,8 +1583,9 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR, (
+    ),
+    // 21: VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1460,78 +1593,100 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, (
+    ),
+    // 22: VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    (
         VK_ACCESS_2_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT, (
+    ),
+    // 23: VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT
+    (
         VK_ACCESS_2_FRAGMENT_DENSITY_MAP_READ_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT, (
+    ),
+    // 24: VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT
+    (
         VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT |
         VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT |
         VK_ACCESS_2_TRANSFORM_FEEDBACK_WRITE_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR, (
+    ),
+    // 25: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR |
         VK_ACCESS_2_INDIRECT_COMMAND_READ_BIT |
         VK_ACCESS_2_MICROMAP_READ_BIT_EXT |
         VK_ACCESS_2_TRANSFER_READ_BIT |
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR, (
+    ),
+    // 26: VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR
+    (
         VK_ACCESS_2_VIDEO_DECODE_READ_BIT_KHR |
         VK_ACCESS_2_VIDEO_DECODE_WRITE_BIT_KHR
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR, (
+    ),
+    // 27: VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR
+    (
         VK_ACCESS_2_VIDEO_ENCODE_READ_BIT_KHR |
         VK_ACCESS_2_VIDEO_ENCODE_WRITE_BIT_KHR
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR, (
+    ),
+    // 28: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR |
         VK_ACCESS_2_TRANSFER_READ_BIT |
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV, (
+    ),
+    // 29: VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV
+    (
         VK_ACCESS_2_OPTICAL_FLOW_READ_BIT_NV |
         VK_ACCESS_2_OPTICAL_FLOW_WRITE_BIT_NV
-    )},
-    { VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT, (
+    ),
+    // 30: VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT
+    (
         VK_ACCESS_2_MICROMAP_READ_BIT_EXT |
         VK_ACCESS_2_MICROMAP_WRITE_BIT_EXT |
         VK_ACCESS_2_TRANSFER_READ_BIT |
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COPY_BIT, (
+    ),
+    // 31: unused
+    0,
+    // 32: VK_PIPELINE_STAGE_2_COPY_BIT
+    (
         VK_ACCESS_2_TRANSFER_READ_BIT |
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RESOLVE_BIT, (
+    ),
+    // 33: VK_PIPELINE_STAGE_2_RESOLVE_BIT
+    (
         VK_ACCESS_2_TRANSFER_READ_BIT |
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_BLIT_BIT, (
+    ),
+    // 34: VK_PIPELINE_STAGE_2_BLIT_BIT
+    (
         VK_ACCESS_2_TRANSFER_READ_BIT |
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CLEAR_BIT, (
+    ),
+    // 35: VK_PIPELINE_STAGE_2_CLEAR_BIT
+    (
         VK_ACCESS_2_TRANSFER_WRITE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT, (
+    ),
+    // 36: VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT
+    (
         VK_ACCESS_2_INDEX_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT, (
+    ),
+    // 37: VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT
+    (
         VK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI, (
+    ),
+    // 38: VK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT
+    0,
+    // 39: VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI
+    (
         VK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI, (
+    ),
+    // 40: VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI
+    (
         VK_ACCESS_2_INVOCATION_MASK_READ_BIT_HUAWEI
-    )},
-    { VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI, (
+    ),
+    // 41: VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI
+    (
         VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR |
         VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT |
         VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR |
@@ -1539,36 +1694,21 @@ const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMa
         VK_ACCESS_2_SHADER_STORAGE_READ_BIT |
         VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT |
         VK_ACCESS_2_UNIFORM_READ_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_PRESENT_ENGINE_BIT_SYNCVAL, (
+    ),
+    // 42: VK_PIPELINE_STAGE_2_PRESENT_ENGINE_BIT_SYNCVAL
+    (
         VK_ACCESS_2_PRESENT_ACQUIRE_READ_BIT_SYNCVAL |
         VK_ACCESS_2_PRESENT_PRESENTED_BIT_SYNCVAL
-    )},
-    };
+    ),
+    }};
     return variable;
 }
 
 
-const std::map<VkQueueFlagBits, VkPipelineStageFlags2>& syncAllCommandStagesByQueueFlags() {
-    static const std::map<VkQueueFlagBits, VkPipelineStageFlags2> variable = {
-    { VK_QUEUE_COMPUTE_BIT, (
-        VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
-        VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
-        VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT |
-        VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT |
-        VK_PIPELINE_STAGE_2_HOST_BIT |
-        VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV |
-        VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT |
-        VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR |
-        VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR |
-        VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR |
-        VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT |
-        VK_PIPELINE_STAGE_2_COPY_BIT |
-        VK_PIPELINE_STAGE_2_RESOLVE_BIT |
-        VK_PIPELINE_STAGE_2_BLIT_BIT |
-        VK_PIPELINE_STAGE_2_CLEAR_BIT
-    )},
-    { VK_QUEUE_GRAPHICS_BIT, (
+const std::array<VkPipelineStageFlags2, 32>& syncAllCommandStagesByQueueFlags() {
+    static constexpr std::array<VkPipelineStageFlags2, 32> variable = {{
+    // 0: VK_QUEUE_GRAPHICS_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT |
@@ -1598,14 +1738,27 @@ const std::map<VkQueueFlagBits, VkPipelineStageFlags2>& syncAllCommandStagesByQu
         VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI |
         VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI |
         VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI
-    )},
-    { VK_QUEUE_OPTICAL_FLOW_BIT_NV, (
+    ),
+    // 1: VK_QUEUE_COMPUTE_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
+        VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
+        VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_HOST_BIT |
-        VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV
-    )},
-    { VK_QUEUE_TRANSFER_BIT, (
+        VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV |
+        VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT |
+        VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR |
+        VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR |
+        VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR |
+        VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT |
+        VK_PIPELINE_STAGE_2_COPY_BIT |
+        VK_PIPELINE_STAGE_2_RESOLVE_BIT |
+        VK_PIPELINE_STAGE_2_BLIT_BIT |
+        VK_PIPELINE_STAGE_2_CLEAR_BIT
+    ),
+    // 2: VK_QUEUE_TRANSFER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_HOST_BIT |
@@ -1614,54 +1767,90 @@ const std::map<VkQueueFlagBits, VkPipelineStageFlags2>& syncAllCommandStagesByQu
         VK_PIPELINE_STAGE_2_RESOLVE_BIT |
         VK_PIPELINE_STAGE_2_BLIT_BIT |
         VK_PIPELINE_STAGE_2_CLEAR_BIT
-    )},
-    { VK_QUEUE_VIDEO_DECODE_BIT_KHR, (
+    ),
+    // 3: VK_QUEUE_SPARSE_BINDING_BIT
+    0,
+    // 4: VK_QUEUE_PROTECTED_BIT
+    0,
+    // 5: VK_QUEUE_VIDEO_DECODE_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_HOST_BIT |
         VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR
-    )},
-    { VK_QUEUE_VIDEO_ENCODE_BIT_KHR, (
+    ),
+    // 6: VK_QUEUE_VIDEO_ENCODE_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_HOST_BIT |
         VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR
-    )},
-    };
+    ),
+    // 7: unused
+    0,
+    // 8: VK_QUEUE_OPTICAL_FLOW_BIT_NV
+    (
+        VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
+        VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT |
+        VK_PIPELINE_STAGE_2_HOST_BIT |
+        VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV
+    ),
+    }};
     return variable;
 }
 
 
-const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarlierStages() {
-    static const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2> variable = {
-    { VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT, (
+// RelatedPipelineStages() only ORs the masks of the stages it is given, so the mask of a stage
+// must already hold every stage related to the stages in it
+static constexpr bool IsTransitivelyClosed(const std::array<VkPipelineStageFlags2, 64>& related_by_stage) {
+    for (size_t stage = 0; stage < related_by_stage.size(); ++stage) {
+        for (size_t related = 0; related < related_by_stage.size(); ++related) {
+            if (((related_by_stage[stage] >> related) & 1) && (related_by_stage[related] & ~related_by_stage[stage])) {
+                return false;
+            }
+        }
+    }
+    return true;
+}
+
+const std::array<VkPipelineStageFlags2, 64>& syncLogicallyEarlierStages() {
+    static constexpr std::array<VkPipelineStageFlags2, 64> variable = {{
+    // 0: VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT, (
+    ),
+    // 1: VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT, (
+    ),
+    // 2: VK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT
+    0,
+    // 3: VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT, (
+    ),
+    // 4: VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT, (
+    ),
+    // 5: VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT, (
+    ),
+    // 6: VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1669,8 +1858,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT, (
+    ),
+    // 7: VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1685,8 +1875,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
         VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT |
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT, (
+    ),
+    // 8: VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1700,8 +1891,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
         VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT, (
+    ),
+    // 9: VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1717,8 +1909,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT |
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT, (
+    ),
+    // 10: VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1735,12 +1928,16 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT |
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT, (
+    ),
+    // 11: VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT, (
+    ),
+    // 12: VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT
+    0,
+    // 13: VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1774,27 +1971,39 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR |
         VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV, (
+    ),
+    // 14: VK_PIPELINE_STAGE_2_HOST_BIT
+    0,
+    // 15: VK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT
+    0,
+    // 16: VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT
+    0,
+    // 17: VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT, (
+    ),
+    // 18: VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT, (
+    ),
+    // 19: VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT, (
+    ),
+    // 20: VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR, (
+    ),
+    // 21: VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, (
+    ),
+    // 22: VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1806,11 +2015,13 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT |
         VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT |
         VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT, (
+    ),
+    // 23: VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT, (
+    ),
+    // 24: VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1819,57 +2030,76 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarli
         VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT |
         VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR, (
+    ),
+    // 25: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR, (
+    ),
+    // 26: VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR, (
+    ),
+    // 27: VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR, (
+    ),
+    // 28: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV, (
+    ),
+    // 29: VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT, (
+    ),
+    // 30: VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COPY_BIT, (
+    ),
+    // 31: unused
+    0,
+    // 32: VK_PIPELINE_STAGE_2_COPY_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RESOLVE_BIT, (
+    ),
+    // 33: VK_PIPELINE_STAGE_2_RESOLVE_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_BLIT_BIT, (
+    ),
+    // 34: VK_PIPELINE_STAGE_2_BLIT_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CLEAR_BIT, (
+    ),
+    // 35: VK_PIPELINE_STAGE_2_CLEAR_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT, (
+    ),
+    // 36: VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT, (
+    ),
+    // 37: VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI, (
+    ),
+    // 38: VK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT
+    0,
+    // 39: VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
-    )},
-    };
+    ),
+    }};
+    static_assert(IsTransitivelyClosed(variable));
     return variable;
 }
 
 
-const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLaterStages() {
-    static const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2> variable = {
-    { VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT, (
+const std::array<VkPipelineStageFlags2, 64>& syncLogicallyLaterStages() {
+    static constexpr std::array<VkPipelineStageFlags2, 64> variable = {{
+    // 0: VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT
+    (
         VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT |
         VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT |
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
@@ -1903,8 +2133,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR |
         VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT, (
+    ),
+    // 1: VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT
+    (
         VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT |
@@ -1922,8 +2153,11 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT |
         VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT, (
+    ),
+    // 2: VK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT
+    0,
+    // 3: VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT |
         VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT |
@@ -1934,8 +2168,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT, (
+    ),
+    // 4: VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT |
         VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT |
@@ -1945,8 +2180,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT, (
+    ),
+    // 5: VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
@@ -1955,8 +2191,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT, (
+    ),
+    // 6: VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
@@ -1964,38 +2201,55 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT, (
+    ),
+    // 7: VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT, (
+    ),
+    // 8: VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT
+    (
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT |
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT, (
+    ),
+    // 9: VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT
+    (
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT, (
+    ),
+    // 10: VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT, (
+    ),
+    // 11: VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT, (
+    ),
+    // 12: VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT
+    0,
+    // 13: VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV, (
+    ),
+    // 14: VK_PIPELINE_STAGE_2_HOST_BIT
+    0,
+    // 15: VK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT
+    0,
+    // 16: VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT
+    0,
+    // 17: VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT, (
+    ),
+    // 18: VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT, (
+    ),
+    // 19: VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
@@ -2003,67 +2257,85 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT, (
+    ),
+    // 20: VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT |
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR, (
+    ),
+    // 21: VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, (
+    ),
+    // 22: VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT |
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT, (
+    ),
+    // 23: VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT, (
+    ),
+    // 24: VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR |
         VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT |
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR, (
+    ),
+    // 25: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR, (
+    ),
+    // 26: VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR, (
+    ),
+    // 27: VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR, (
+    ),
+    // 28: VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV, (
+    ),
+    // 29: VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT, (
+    ),
+    // 30: VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_COPY_BIT, (
+    ),
+    // 31: unused
+    0,
+    // 32: VK_PIPELINE_STAGE_2_COPY_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_RESOLVE_BIT, (
+    ),
+    // 33: VK_PIPELINE_STAGE_2_RESOLVE_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_BLIT_BIT, (
+    ),
+    // 34: VK_PIPELINE_STAGE_2_BLIT_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_CLEAR_BIT, (
+    ),
+    // 35: VK_PIPELINE_STAGE_2_CLEAR_BIT
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT, (
+    ),
+    // 36: VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT
+    (
         VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT |
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT |
@@ -2076,8 +2348,9 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT, (
+    ),
+    // 37: VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT
+    (
         VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT |
         VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT |
@@ -2089,11 +2362,15 @@ const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLater
         VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT |
         VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT |
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    { VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI, (
+    ),
+    // 38: VK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT
+    0,
+    // 39: VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI
+    (
         VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT
-    )},
-    };
+    ),
+    }};
+    static_assert(IsTransitivelyClosed(variable));
     return variable;
 }
 
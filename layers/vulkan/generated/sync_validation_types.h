@@ -23,11 +23,11 @@
 #pragma once
 
 #include <array>
-#include <bitset>
-#include <map>
+#include <cstddef>
 #include <stdint.h>
 #include <vulkan/vulkan.h>
 #include "containers/custom_containers.h"
+#include "utils/vk_layer_utils.h"
 
 // Fake stages and accesses for acquire present support
 static const VkPipelineStageFlagBits2 VK_PIPELINE_STAGE_2_PRESENT_ENGINE_BIT_SYNCVAL = 0x0000040000000000ULL;
@@ -166,135 +166,211 @@ enum SyncStageAccessIndex {
     SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER = 127,
 };
 
-using SyncStageAccessFlags = std::bitset<128>;
+// Bit set with a bit for each stage/access combination, sized to the number of SyncStageAccessIndex values.
+// It has the part of the std::bitset interface used by sync validation, plus word at a time helpers.
+struct SyncStageAccessFlags {
+    static constexpr size_t kWordCount = 2;
+    static constexpr size_t kBitCount = kWordCount * 64;
+    uint64_t words[kWordCount];
+
+    constexpr SyncStageAccessFlags() : words{} {}
+    // Sets the lowest 64 bits, same as the std::bitset constructor
+    constexpr SyncStageAccessFlags(uint64_t low_bits) : words{low_bits} {}
+
+    static constexpr SyncStageAccessFlags FromIndex(size_t index) {
+        SyncStageAccessFlags flags;
+        flags.words[index / 64] = 1ULL << (index % 64);
+        return flags;
+    }
+
+    static constexpr size_t size() { return kBitCount; }
+    constexpr bool test(size_t index) const { return ((words[index / 64] >> (index % 64)) & 1) != 0; }
+    constexpr SyncStageAccessFlags &set(size_t index) {
+        words[index / 64] |= 1ULL << (index % 64);
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &reset(size_t index) {
+        words[index / 64] &= ~(1ULL << (index % 64));
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &reset() {
+        for (auto &word : words) word = 0;
+        return *this;
+    }
+    constexpr bool any() const {
+        uint64_t bits = 0;
+        for (const auto word : words) bits |= word;
+        return bits != 0;
+    }
+    constexpr bool none() const { return !any(); }
+
+    // Returns the index of the lowest set bit, -1 if no bits are set
+    int LeastSignificantBit() const {
+        for (size_t i = 0; i < kWordCount; ++i) {
+            if (words[i]) {
+                return static_cast<int>(i * 64) + ::LeastSignificantBit(words[i]);
+            }
+        }
+        return -1;
+    }
+
+    constexpr SyncStageAccessFlags operator~() const {
+        SyncStageAccessFlags result;
+        for (size_t i = 0; i < kWordCount; ++i) result.words[i] = ~words[i];
+        return result;
+    }
+    constexpr SyncStageAccessFlags &operator&=(const SyncStageAccessFlags &rhs) {
+        for (size_t i = 0; i < kWordCount; ++i) words[i] &= rhs.words[i];
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &operator|=(const SyncStageAccessFlags &rhs) {
+        for (size_t i = 0; i < kWordCount; ++i) words[i] |= rhs.words[i];
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &operator^=(const SyncStageAccessFlags &rhs) {
+        for (size_t i = 0; i < kWordCount; ++i) words[i] ^= rhs.words[i];
+        return *this;
+    }
+    friend constexpr SyncStageAccessFlags operator&(SyncStageAccessFlags lhs, const SyncStageAccessFlags &rhs) { return lhs &= rhs; }
+    friend constexpr SyncStageAccessFlags operator|(SyncStageAccessFlags lhs, const SyncStageAccessFlags &rhs) { return lhs |= rhs; }
+    friend constexpr SyncStageAccessFlags operator^(SyncStageAccessFlags lhs, const SyncStageAccessFlags &rhs) { return lhs ^= rhs; }
+    friend constexpr bool operator==(const SyncStageAccessFlags &lhs, const SyncStageAccessFlags &rhs) {
+        uint64_t diff = 0;
+        for (size_t i = 0; i < kWordCount; ++i) diff |= lhs.words[i] ^ rhs.words[i];
+        return diff == 0;
+    }
+    friend constexpr bool operator!=(const SyncStageAccessFlags &lhs, const SyncStageAccessFlags &rhs) { return !(lhs == rhs); }
+};
+static_assert(SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER < SyncStageAccessFlags::kBitCount);
+
 // Unique bit for each stage/access combination
-static const SyncStageAccessFlags SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ_BIT = (SyncStageAccessFlags(1) << SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ);
-static const SyncStageAccessFlags SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_EXT);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_VERTEX_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_CONTROL_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TESSELLATION_EVALUATION_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_GEOMETRY_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_GEOMETRY_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_COLOR_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_COLOR_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_DEPTH_STENCIL_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_DEPTH_STENCIL_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_INPUT_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_INPUT_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE);
-static const SyncStageAccessFlags SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE);
-static const SyncStageAccessFlags SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_NONCOHERENT_EXT);
-static const SyncStageAccessFlags SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_WRITE);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_COMPUTE_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COMPUTE_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_HOST_HOST_READ_BIT = (SyncStageAccessFlags(1) << SYNC_HOST_HOST_READ);
-static const SyncStageAccessFlags SYNC_HOST_HOST_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_HOST_HOST_WRITE);
-static const SyncStageAccessFlags SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_READ_BIT_NV = (SyncStageAccessFlags(1) << SYNC_COMMAND_PREPROCESS_NV_COMMAND_PREPROCESS_READ_NV);
-static const SyncStageAccessFlags SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_WRITE_BIT_NV = (SyncStageAccessFlags(1) << SYNC_COMMAND_PREPROCESS_NV_COMMAND_PREPROCESS_WRITE_NV);
-static const SyncStageAccessFlags SYNC_CONDITIONAL_RENDERING_BIT_EXT_CONDITIONAL_RENDERING_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_CONDITIONAL_RENDERING_EXT_CONDITIONAL_RENDERING_READ_EXT);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_EXT_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_TASK_SHADER_EXT_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_TASK_SHADER_EXT_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_EXT_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_MESH_SHADER_EXT_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_MESH_SHADER_EXT_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_RAY_TRACING_SHADER_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_SHADING_RATE_ATTACHMENT_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_SHADING_RATE_ATTACHMENT_FRAGMENT_SHADING_RATE_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_FRAGMENT_DENSITY_PROCESS_BIT_EXT_FRAGMENT_DENSITY_MAP_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_FRAGMENT_DENSITY_PROCESS_EXT_FRAGMENT_DENSITY_MAP_READ_EXT);
-static const SyncStageAccessFlags SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_TRANSFORM_FEEDBACK_EXT_TRANSFORM_FEEDBACK_COUNTER_READ_EXT);
-static const SyncStageAccessFlags SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_TRANSFORM_FEEDBACK_EXT_TRANSFORM_FEEDBACK_COUNTER_WRITE_EXT);
-static const SyncStageAccessFlags SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_WRITE_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_TRANSFORM_FEEDBACK_EXT_TRANSFORM_FEEDBACK_WRITE_EXT);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_WRITE);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_INDIRECT_COMMAND_READ_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_BUILD_INDIRECT_COMMAND_READ);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_MICROMAP_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_BUILD_MICROMAP_READ_EXT);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_READ_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_READ);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_VIDEO_DECODE_VIDEO_DECODE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VIDEO_DECODE_VIDEO_DECODE_READ);
-static const SyncStageAccessFlags SYNC_VIDEO_DECODE_VIDEO_DECODE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_VIDEO_DECODE_VIDEO_DECODE_WRITE);
-static const SyncStageAccessFlags SYNC_VIDEO_ENCODE_VIDEO_ENCODE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VIDEO_ENCODE_VIDEO_ENCODE_READ);
-static const SyncStageAccessFlags SYNC_VIDEO_ENCODE_VIDEO_ENCODE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_VIDEO_ENCODE_VIDEO_ENCODE_WRITE);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_WRITE);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_READ_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_READ);
-static const SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_READ_BIT_NV = (SyncStageAccessFlags(1) << SYNC_OPTICAL_FLOW_NV_OPTICAL_FLOW_READ_NV);
-static const SyncStageAccessFlags SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_WRITE_BIT_NV = (SyncStageAccessFlags(1) << SYNC_OPTICAL_FLOW_NV_OPTICAL_FLOW_WRITE_NV);
-static const SyncStageAccessFlags SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_MICROMAP_BUILD_EXT_MICROMAP_READ_EXT);
-static const SyncStageAccessFlags SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_WRITE_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_MICROMAP_BUILD_EXT_MICROMAP_WRITE_EXT);
-static const SyncStageAccessFlags SYNC_MICROMAP_BUILD_EXT_TRANSFER_READ_BIT = (SyncStageAccessFlags(1) << SYNC_MICROMAP_BUILD_EXT_TRANSFER_READ);
-static const SyncStageAccessFlags SYNC_MICROMAP_BUILD_EXT_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_MICROMAP_BUILD_EXT_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_COPY_TRANSFER_READ_BIT = (SyncStageAccessFlags(1) << SYNC_COPY_TRANSFER_READ);
-static const SyncStageAccessFlags SYNC_COPY_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_COPY_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_RESOLVE_TRANSFER_READ_BIT = (SyncStageAccessFlags(1) << SYNC_RESOLVE_TRANSFER_READ);
-static const SyncStageAccessFlags SYNC_RESOLVE_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_RESOLVE_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_BLIT_TRANSFER_READ_BIT = (SyncStageAccessFlags(1) << SYNC_BLIT_TRANSFER_READ);
-static const SyncStageAccessFlags SYNC_BLIT_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_BLIT_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_CLEAR_TRANSFER_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_CLEAR_TRANSFER_WRITE);
-static const SyncStageAccessFlags SYNC_INDEX_INPUT_INDEX_READ_BIT = (SyncStageAccessFlags(1) << SYNC_INDEX_INPUT_INDEX_READ);
-static const SyncStageAccessFlags SYNC_VERTEX_ATTRIBUTE_INPUT_VERTEX_ATTRIBUTE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_VERTEX_ATTRIBUTE_INPUT_VERTEX_ATTRIBUTE_READ);
-static const SyncStageAccessFlags SYNC_SUBPASS_SHADING_HUAWEI_INPUT_ATTACHMENT_READ_BIT = (SyncStageAccessFlags(1) << SYNC_SUBPASS_SHADING_HUAWEI_INPUT_ATTACHMENT_READ);
-static const SyncStageAccessFlags SYNC_INVOCATION_MASK_HUAWEI_INVOCATION_MASK_READ_HUAWEI_BIT = (SyncStageAccessFlags(1) << SYNC_INVOCATION_MASK_HUAWEI_INVOCATION_MASK_READ_HUAWEI);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_ACCELERATION_STRUCTURE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_ACCELERATION_STRUCTURE_READ);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_DESCRIPTOR_BUFFER_READ_BIT_EXT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_DESCRIPTOR_BUFFER_READ_EXT);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_BINDING_TABLE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_BINDING_TABLE_READ);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_SAMPLED_READ_BIT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_SAMPLED_READ);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_READ_BIT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_READ);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_WRITE_BIT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_WRITE);
-static const SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_UNIFORM_READ_BIT = (SyncStageAccessFlags(1) << SYNC_CLUSTER_CULLING_SHADER_HUAWEI_UNIFORM_READ);
-static const SyncStageAccessFlags SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_ACQUIRE_READ_BIT_SYNCVAL = (SyncStageAccessFlags(1) << SYNC_PRESENT_ENGINE_SYNCVAL_PRESENT_ACQUIRE_READ_SYNCVAL);
-static const SyncStageAccessFlags SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_PRESENTED_BIT_SYNCVAL = (SyncStageAccessFlags(1) << SYNC_PRESENT_ENGINE_SYNCVAL_PRESENT_PRESENTED_SYNCVAL);
-static const SyncStageAccessFlags SYNC_IMAGE_LAYOUT_TRANSITION_BIT = (SyncStageAccessFlags(1) << SYNC_IMAGE_LAYOUT_TRANSITION);
-static const SyncStageAccessFlags SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER_BIT = (SyncStageAccessFlags(1) << SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER);
+static constexpr SyncStageAccessFlags SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ);
+static constexpr SyncStageAccessFlags SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_CONTROL_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_CONTROL_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_TESSELLATION_EVALUATION_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TESSELLATION_EVALUATION_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_GEOMETRY_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_GEOMETRY_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_COLOR_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_COLOR_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_DEPTH_STENCIL_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_DEPTH_STENCIL_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_INPUT_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_INPUT_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_EARLY_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE);
+static constexpr SyncStageAccessFlags SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_LATE_FRAGMENT_TESTS_DEPTH_STENCIL_ATTACHMENT_WRITE);
+static constexpr SyncStageAccessFlags SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_READ_NONCOHERENT_EXT);
+static constexpr SyncStageAccessFlags SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_COLOR_ATTACHMENT_OUTPUT_COLOR_ATTACHMENT_WRITE);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_COMPUTE_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COMPUTE_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_HOST_HOST_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_HOST_HOST_READ);
+static constexpr SyncStageAccessFlags SYNC_HOST_HOST_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_HOST_HOST_WRITE);
+static constexpr SyncStageAccessFlags SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_READ_BIT_NV = SyncStageAccessFlags::FromIndex(SYNC_COMMAND_PREPROCESS_NV_COMMAND_PREPROCESS_READ_NV);
+static constexpr SyncStageAccessFlags SYNC_COMMAND_PREPROCESS_BIT_NV_COMMAND_PREPROCESS_WRITE_BIT_NV = SyncStageAccessFlags::FromIndex(SYNC_COMMAND_PREPROCESS_NV_COMMAND_PREPROCESS_WRITE_NV);
+static constexpr SyncStageAccessFlags SYNC_CONDITIONAL_RENDERING_BIT_EXT_CONDITIONAL_RENDERING_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_CONDITIONAL_RENDERING_EXT_CONDITIONAL_RENDERING_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_EXT_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_EXT_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_TASK_SHADER_EXT_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_EXT_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_BIT_EXT_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_EXT_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_MESH_SHADER_EXT_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_MESH_SHADER_EXT_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_RAY_TRACING_SHADER_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_RAY_TRACING_SHADER_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_SHADING_RATE_ATTACHMENT_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_SHADING_RATE_ATTACHMENT_FRAGMENT_SHADING_RATE_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_FRAGMENT_DENSITY_PROCESS_BIT_EXT_FRAGMENT_DENSITY_MAP_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_FRAGMENT_DENSITY_PROCESS_EXT_FRAGMENT_DENSITY_MAP_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_TRANSFORM_FEEDBACK_EXT_TRANSFORM_FEEDBACK_COUNTER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_TRANSFORM_FEEDBACK_EXT_TRANSFORM_FEEDBACK_COUNTER_WRITE_EXT);
+static constexpr SyncStageAccessFlags SYNC_TRANSFORM_FEEDBACK_BIT_EXT_TRANSFORM_FEEDBACK_WRITE_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_TRANSFORM_FEEDBACK_EXT_TRANSFORM_FEEDBACK_WRITE_EXT);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_BUILD_ACCELERATION_STRUCTURE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_INDIRECT_COMMAND_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_BUILD_INDIRECT_COMMAND_READ);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_MICROMAP_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_BUILD_MICROMAP_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_READ);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_BUILD_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_VIDEO_DECODE_VIDEO_DECODE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VIDEO_DECODE_VIDEO_DECODE_READ);
+static constexpr SyncStageAccessFlags SYNC_VIDEO_DECODE_VIDEO_DECODE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_VIDEO_DECODE_VIDEO_DECODE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_VIDEO_ENCODE_VIDEO_ENCODE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VIDEO_ENCODE_VIDEO_ENCODE_READ);
+static constexpr SyncStageAccessFlags SYNC_VIDEO_ENCODE_VIDEO_ENCODE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_VIDEO_ENCODE_VIDEO_ENCODE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_COPY_ACCELERATION_STRUCTURE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_READ);
+static constexpr SyncStageAccessFlags SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_ACCELERATION_STRUCTURE_COPY_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_READ_BIT_NV = SyncStageAccessFlags::FromIndex(SYNC_OPTICAL_FLOW_NV_OPTICAL_FLOW_READ_NV);
+static constexpr SyncStageAccessFlags SYNC_OPTICAL_FLOW_BIT_NV_OPTICAL_FLOW_WRITE_BIT_NV = SyncStageAccessFlags::FromIndex(SYNC_OPTICAL_FLOW_NV_OPTICAL_FLOW_WRITE_NV);
+static constexpr SyncStageAccessFlags SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_MICROMAP_BUILD_EXT_MICROMAP_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_MICROMAP_BUILD_BIT_EXT_MICROMAP_WRITE_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_MICROMAP_BUILD_EXT_MICROMAP_WRITE_EXT);
+static constexpr SyncStageAccessFlags SYNC_MICROMAP_BUILD_EXT_TRANSFER_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_MICROMAP_BUILD_EXT_TRANSFER_READ);
+static constexpr SyncStageAccessFlags SYNC_MICROMAP_BUILD_EXT_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_MICROMAP_BUILD_EXT_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_COPY_TRANSFER_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_COPY_TRANSFER_READ);
+static constexpr SyncStageAccessFlags SYNC_COPY_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_COPY_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_RESOLVE_TRANSFER_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_RESOLVE_TRANSFER_READ);
+static constexpr SyncStageAccessFlags SYNC_RESOLVE_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_RESOLVE_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_BLIT_TRANSFER_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_BLIT_TRANSFER_READ);
+static constexpr SyncStageAccessFlags SYNC_BLIT_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_BLIT_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_CLEAR_TRANSFER_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLEAR_TRANSFER_WRITE);
+static constexpr SyncStageAccessFlags SYNC_INDEX_INPUT_INDEX_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_INDEX_INPUT_INDEX_READ);
+static constexpr SyncStageAccessFlags SYNC_VERTEX_ATTRIBUTE_INPUT_VERTEX_ATTRIBUTE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_VERTEX_ATTRIBUTE_INPUT_VERTEX_ATTRIBUTE_READ);
+static constexpr SyncStageAccessFlags SYNC_SUBPASS_SHADING_HUAWEI_INPUT_ATTACHMENT_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_SUBPASS_SHADING_HUAWEI_INPUT_ATTACHMENT_READ);
+static constexpr SyncStageAccessFlags SYNC_INVOCATION_MASK_HUAWEI_INVOCATION_MASK_READ_HUAWEI_BIT = SyncStageAccessFlags::FromIndex(SYNC_INVOCATION_MASK_HUAWEI_INVOCATION_MASK_READ_HUAWEI);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_ACCELERATION_STRUCTURE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_ACCELERATION_STRUCTURE_READ);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_DESCRIPTOR_BUFFER_READ_BIT_EXT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_DESCRIPTOR_BUFFER_READ_EXT);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_BINDING_TABLE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_BINDING_TABLE_READ);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_SAMPLED_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_SAMPLED_READ);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_READ);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_WRITE_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_SHADER_STORAGE_WRITE);
+static constexpr SyncStageAccessFlags SYNC_CLUSTER_CULLING_SHADER_HUAWEI_UNIFORM_READ_BIT = SyncStageAccessFlags::FromIndex(SYNC_CLUSTER_CULLING_SHADER_HUAWEI_UNIFORM_READ);
+static constexpr SyncStageAccessFlags SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_ACQUIRE_READ_BIT_SYNCVAL = SyncStageAccessFlags::FromIndex(SYNC_PRESENT_ENGINE_SYNCVAL_PRESENT_ACQUIRE_READ_SYNCVAL);
+static constexpr SyncStageAccessFlags SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_PRESENTED_BIT_SYNCVAL = SyncStageAccessFlags::FromIndex(SYNC_PRESENT_ENGINE_SYNCVAL_PRESENT_PRESENTED_SYNCVAL);
+static constexpr SyncStageAccessFlags SYNC_IMAGE_LAYOUT_TRANSITION_BIT = SyncStageAccessFlags::FromIndex(SYNC_IMAGE_LAYOUT_TRANSITION);
+static constexpr SyncStageAccessFlags SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER_BIT = SyncStageAccessFlags::FromIndex(SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER);
 
 struct SyncStageAccessInfoType {
     const char *name;
@@ -308,7 +384,7 @@ struct SyncStageAccessInfoType {
 const std::array<SyncStageAccessInfoType, 128>& syncStageAccessInfoByStageAccessIndex();
 
 // Constants defining the mask of all read and write stage_access states
-static const SyncStageAccessFlags syncStageAccessReadMask = ( //  Mask of all read StageAccess bits
+static constexpr SyncStageAccessFlags syncStageAccessReadMask = ( //  Mask of all read StageAccess bits
     SYNC_DRAW_INDIRECT_INDIRECT_COMMAND_READ_BIT |
     SYNC_DRAW_INDIRECT_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT |
     SYNC_VERTEX_SHADER_ACCELERATION_STRUCTURE_READ_BIT |
@@ -405,7 +481,7 @@ static const SyncStageAccessFlags syncStageAccessReadMask = ( //  Mask of all re
     SYNC_PRESENT_ENGINE_BIT_SYNCVAL_PRESENT_ACQUIRE_READ_BIT_SYNCVAL
 );
 
-static const SyncStageAccessFlags syncStageAccessWriteMask = ( //  Mask of all write StageAccess bits
+static constexpr SyncStageAccessFlags syncStageAccessWriteMask = ( //  Mask of all write StageAccess bits
     SYNC_VERTEX_SHADER_SHADER_STORAGE_WRITE_BIT |
     SYNC_TESSELLATION_CONTROL_SHADER_SHADER_STORAGE_WRITE_BIT |
     SYNC_TESSELLATION_EVALUATION_SHADER_SHADER_STORAGE_WRITE_BIT |
@@ -441,21 +517,22 @@ static const SyncStageAccessFlags syncStageAccessWriteMask = ( //  Mask of all w
     SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER_BIT
 );
 
-// Bit order mask of stage_access bit for each stage
-const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>& syncStageAccessMaskByStageBit();
+// Bit order mask of stage_access bit for each stage, indexed by the stage bit position
+const std::array<SyncStageAccessFlags, 64>& syncStageAccessMaskByStageBit();
 
-// Bit order mask of stage_access bit for each access
-const std::map<VkAccessFlags2, SyncStageAccessFlags>& syncStageAccessMaskByAccessBit();
+// Bit order mask of stage_access bit for each access, indexed by the access bit position
+const std::array<SyncStageAccessFlags, 64>& syncStageAccessMaskByAccessBit();
 
-// Direct VkPipelineStageFlags to valid VkAccessFlags lookup table
-const std::map<VkPipelineStageFlags2, VkAccessFlags2>& syncDirectStageToAccessMask();
+// Direct VkPipelineStageFlags to valid VkAccessFlags lookup table, indexed by the stage bit position
+const std::array<VkAccessFlags2, 64>& syncDirectStageToAccessMask();
 
-// Pipeline stages corresponding to VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT for each VkQueueFlagBits
-const std::map<VkQueueFlagBits, VkPipelineStageFlags2>& syncAllCommandStagesByQueueFlags();
+// Pipeline stages corresponding to VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT for each VkQueueFlagBits,
+// indexed by the queue flag bit position
+const std::array<VkPipelineStageFlags2, 32>& syncAllCommandStagesByQueueFlags();
 
-// Masks of logically earlier stage flags for a given stage flag
-const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyEarlierStages();
+// Masks of logically earlier stage flags for a given stage flag, indexed by the stage bit position
+const std::array<VkPipelineStageFlags2, 64>& syncLogicallyEarlierStages();
 
-// Masks of logically later stage flags for a given stage flag
-const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>& syncLogicallyLaterStages();
+// Masks of logically later stage flags for a given stage flag, indexed by the stage bit position
+const std::array<VkPipelineStageFlags2, 64>& syncLogicallyLaterStages();
 
@@ -26,6 +26,9 @@
 #pragma once
 #include <string>
 #include <vulkan/vulkan.h>
+#if defined(_MSC_VER)
+#include <intrin.h>
+#endif
 
 static inline bool IsDuplicatePnext(VkStructureType input_value) {
     switch (input_value) {
@@ -46,45 +49,32 @@ static inline bool IsDuplicatePnext(VkStructureType input_value) {
 }
 
 static inline const char* string_VkResult(VkResult input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_ERROR_UNKNOWN",
+        "VK_ERROR_FRAGMENTED_POOL",
+        "VK_ERROR_FORMAT_NOT_SUPPORTED",
+        "VK_ERROR_TOO_MANY_OBJECTS",
+        "VK_ERROR_INCOMPATIBLE_DRIVER",
+        "VK_ERROR_FEATURE_NOT_PRESENT",
+        "VK_ERROR_EXTENSION_NOT_PRESENT",
+        "VK_ERROR_LAYER_NOT_PRESENT",
+        "VK_ERROR_MEMORY_MAP_FAILED",
+        "VK_ERROR_DEVICE_LOST",
+        "VK_ERROR_INITIALIZATION_FAILED",
+        "VK_ERROR_OUT_OF_DEVICE_MEMORY",
+        "VK_ERROR_OUT_OF_HOST_MEMORY",
+        "VK_SUCCESS",
+        "VK_NOT_READY",
+        "VK_TIMEOUT",
+        "VK_EVENT_SET",
+        "VK_EVENT_RESET",
+        "VK_INCOMPLETE",
+    };
+    static_assert(std::size(kNames0) == VK_INCOMPLETE - VK_ERROR_UNKNOWN + 1);
+    if (input_value >= VK_ERROR_UNKNOWN && input_value <= VK_INCOMPLETE) {
+        return kNames0[input_value - VK_ERROR_UNKNOWN];
+    }
     switch (input_value) {
-        case VK_SUCCESS:
-            return "VK_SUCCESS";
-        case VK_NOT_READY:
-            return "VK_NOT_READY";
-        case VK_TIMEOUT:
-            return "VK_TIMEOUT";
-        case VK_EVENT_SET:
-            return "VK_EVENT_SET";
-        case VK_EVENT_RESET:
-            return "VK_EVENT_RESET";
-        case VK_INCOMPLETE:
-            return "VK_INCOMPLETE";
-        case VK_ERROR_OUT_OF_HOST_MEMORY:
-            return "VK_ERROR_OUT_OF_HOST_MEMORY";
-        case VK_ERROR_OUT_OF_DEVICE_MEMORY:
-            return "VK_ERROR_OUT_OF_DEVICE_MEMORY";
-        case VK_ERROR_INITIALIZATION_FAILED:
-            return "VK_ERROR_INITIALIZATION_FAILED";
-        case VK_ERROR_DEVICE_LOST:
-            return "VK_ERROR_DEVICE_LOST";
-        case VK_ERROR_MEMORY_MAP_FAILED:
-            return "VK_ERROR_MEMORY_MAP_FAILED";
-        case VK_ERROR_LAYER_NOT_PRESENT:
-            return "VK_ERROR_LAYER_NOT_PRESENT";
-        case VK_ERROR_EXTENSION_NOT_PRESENT:
-            return "VK_ERROR_EXTENSION_NOT_PRESENT";
-        case VK_ERROR_FEATURE_NOT_PRESENT:
-            return "VK_ERROR_FEATURE_NOT_PRESENT";
-        case VK_ERROR_INCOMPATIBLE_DRIVER:
-            return "VK_ERROR_INCOMPATIBLE_DRIVER";
-        case VK_ERROR_TOO_MANY_OBJECTS:
-            return "VK_ERROR_TOO_MANY_OBJECTS";
-        case VK_ERROR_FORMAT_NOT_SUPPORTED:
-            return "VK_ERROR_FORMAT_NOT_SUPPORTED";
-        case VK_ERROR_FRAGMENTED_POOL:
-            return "VK_ERROR_FRAGMENTED_POOL";
-        case VK_ERROR_UNKNOWN:
-            return "VK_ERROR_UNKNOWN";
         case VK_ERROR_OUT_OF_POOL_MEMORY:
             return "VK_ERROR_OUT_OF_POOL_MEMORY";
         case VK_ERROR_INVALID_EXTERNAL_HANDLE:
@@ -148,105 +138,91 @@ static inline const char* string_VkResult(VkResult input_value) {
     }
 }
 static inline const char* string_VkStructureType(VkStructureType input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_STRUCTURE_TYPE_APPLICATION_INFO",
+        "VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_SUBMIT_INFO",
+        "VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO",
+        "VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE",
+        "VK_STRUCTURE_TYPE_BIND_SPARSE_INFO",
+        "VK_STRUCTURE_TYPE_FENCE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_EVENT_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO",
+        "VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET",
+        "VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET",
+        "VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO",
+        "VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO",
+        "VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO",
+        "VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO",
+        "VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER",
+        "VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER",
+        "VK_STRUCTURE_TYPE_MEMORY_BARRIER",
+        "VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES",
+    };
+    static_assert(std::size(kNames0) == VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES - VK_STRUCTURE_TYPE_APPLICATION_INFO + 1);
+    if (input_value >= VK_STRUCTURE_TYPE_APPLICATION_INFO && input_value <= VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES) {
+        return kNames0[input_value - VK_STRUCTURE_TYPE_APPLICATION_INFO];
+    }
+    static constexpr const char* kNames1[] = {
+        "VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_PICTURE_RESOURCE_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR",
+        "VK_STRUCTURE_TYPE_BIND_VIDEO_SESSION_MEMORY_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_SESSION_CREATE_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_BEGIN_CODING_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_END_CODING_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_CODING_CONTROL_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_REFERENCE_SLOT_INFO_KHR",
+        "VK_STRUCTURE_TYPE_QUEUE_FAMILY_VIDEO_PROPERTIES_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR",
+        "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR",
+        "VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR",
+        "VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR",
+    };
+    static_assert(std::size(kNames1) == VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR - VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR + 1);
+    if (input_value >= VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR && input_value <= VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR) {
+        return kNames1[input_value - VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR];
+    }
     switch (input_value) {
-        case VK_STRUCTURE_TYPE_APPLICATION_INFO:
-            return "VK_STRUCTURE_TYPE_APPLICATION_INFO";
-        case VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_SUBMIT_INFO:
-            return "VK_STRUCTURE_TYPE_SUBMIT_INFO";
-        case VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO:
-            return "VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO";
-        case VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE:
-            return "VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE";
-        case VK_STRUCTURE_TYPE_BIND_SPARSE_INFO:
-            return "VK_STRUCTURE_TYPE_BIND_SPARSE_INFO";
-        case VK_STRUCTURE_TYPE_FENCE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_FENCE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_EVENT_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_EVENT_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO:
-            return "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO";
-        case VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET:
-            return "VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET";
-        case VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET:
-            return "VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET";
-        case VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO:
-            return "VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO";
-        case VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO:
-            return "VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO";
-        case VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO:
-            return "VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO";
-        case VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO:
-            return "VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO";
-        case VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER:
-            return "VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER";
-        case VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER:
-            return "VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER";
-        case VK_STRUCTURE_TYPE_MEMORY_BARRIER:
-            return "VK_STRUCTURE_TYPE_MEMORY_BARRIER";
-        case VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO";
-        case VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO:
-            return "VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO";
         case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES:
             return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES";
         case VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO:
@@ -377,14 +353,6 @@ static inline const char* string_VkStructureType(VkStructureType input_value) {
             return "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT";
         case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES:
             return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES";
         case VK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO:
             return "VK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO";
         case VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2:
@@ -477,10 +445,6 @@ static inline const char* string_VkStructureType(VkStructureType input_value) {
             return "VK_STRUCTURE_TYPE_MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO";
         case VK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO:
             return "VK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES";
         case VK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO:
             return "VK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO";
         case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES:
@@ -611,40 +575,6 @@ static inline const char* string_VkStructureType(VkStructureType input_value) {
             return "VK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_TAG_INFO_EXT";
         case VK_STRUCTURE_TYPE_DEBUG_MARKER_MARKER_INFO_EXT:
             return "VK_STRUCTURE_TYPE_DEBUG_MARKER_MARKER_INFO_EXT";
-        case VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_PICTURE_RESOURCE_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_PICTURE_RESOURCE_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR";
-        case VK_STRUCTURE_TYPE_BIND_VIDEO_SESSION_MEMORY_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_BIND_VIDEO_SESSION_MEMORY_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_SESSION_CREATE_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_SESSION_CREATE_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_BEGIN_CODING_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_BEGIN_CODING_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_END_CODING_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_END_CODING_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_CODING_CONTROL_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_CODING_CONTROL_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_REFERENCE_SLOT_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_REFERENCE_SLOT_INFO_KHR";
-        case VK_STRUCTURE_TYPE_QUEUE_FAMILY_VIDEO_PROPERTIES_KHR:
-            return "VK_STRUCTURE_TYPE_QUEUE_FAMILY_VIDEO_PROPERTIES_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR";
-        case VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR:
-            return "VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR";
-        case VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR:
-            return "VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR";
-        case VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR:
-            return "VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR";
         case VK_STRUCTURE_TYPE_VIDEO_DECODE_INFO_KHR:
             return "VK_STRUCTURE_TYPE_VIDEO_DECODE_INFO_KHR";
         case VK_STRUCTURE_TYPE_VIDEO_DECODE_CAPABILITIES_KHR:
@@ -1904,59 +1834,39 @@ static inline const char* string_VkImageLayout(VkImageLayout input_value) {
     }
 }
 static inline const char* string_VkObjectType(VkObjectType input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_OBJECT_TYPE_UNKNOWN",
+        "VK_OBJECT_TYPE_INSTANCE",
+        "VK_OBJECT_TYPE_PHYSICAL_DEVICE",
+        "VK_OBJECT_TYPE_DEVICE",
+        "VK_OBJECT_TYPE_QUEUE",
+        "VK_OBJECT_TYPE_SEMAPHORE",
+        "VK_OBJECT_TYPE_COMMAND_BUFFER",
+        "VK_OBJECT_TYPE_FENCE",
+        "VK_OBJECT_TYPE_DEVICE_MEMORY",
+        "VK_OBJECT_TYPE_BUFFER",
+        "VK_OBJECT_TYPE_IMAGE",
+        "VK_OBJECT_TYPE_EVENT",
+        "VK_OBJECT_TYPE_QUERY_POOL",
+        "VK_OBJECT_TYPE_BUFFER_VIEW",
+        "VK_OBJECT_TYPE_IMAGE_VIEW",
+        "VK_OBJECT_TYPE_SHADER_MODULE",
+        "VK_OBJECT_TYPE_PIPELINE_CACHE",
+        "VK_OBJECT_TYPE_PIPELINE_LAYOUT",
+        "VK_OBJECT_TYPE_RENDER_PASS",
+        "VK_OBJECT_TYPE_PIPELINE",
+        "VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT",
+        "VK_OBJECT_TYPE_SAMPLER",
+        "VK_OBJECT_TYPE_DESCRIPTOR_POOL",
+        "VK_OBJECT_TYPE_DESCRIPTOR_SET",
+        "VK_OBJECT_TYPE_FRAMEBUFFER",
+        "VK_OBJECT_TYPE_COMMAND_POOL",
+    };
+    static_assert(std::size(kNames0) == VK_OBJECT_TYPE_COMMAND_POOL - VK_OBJECT_TYPE_UNKNOWN + 1);
+    if (input_value >= VK_OBJECT_TYPE_UNKNOWN && input_value <= VK_OBJECT_TYPE_COMMAND_POOL) {
+        return kNames0[input_value - VK_OBJECT_TYPE_UNKNOWN];
+    }
     switch (input_value) {
-        case VK_OBJECT_TYPE_UNKNOWN:
-            return "VK_OBJECT_TYPE_UNKNOWN";
-        case VK_OBJECT_TYPE_INSTANCE:
-            return "VK_OBJECT_TYPE_INSTANCE";
-        case VK_OBJECT_TYPE_PHYSICAL_DEVICE:
-            return "VK_OBJECT_TYPE_PHYSICAL_DEVICE";
-        case VK_OBJECT_TYPE_DEVICE:
-            return "VK_OBJECT_TYPE_DEVICE";
-        case VK_OBJECT_TYPE_QUEUE:
-            return "VK_OBJECT_TYPE_QUEUE";
-        case VK_OBJECT_TYPE_SEMAPHORE:
-            return "VK_OBJECT_TYPE_SEMAPHORE";
-        case VK_OBJECT_TYPE_COMMAND_BUFFER:
-            return "VK_OBJECT_TYPE_COMMAND_BUFFER";
-        case VK_OBJECT_TYPE_FENCE:
-            return "VK_OBJECT_TYPE_FENCE";
-        case VK_OBJECT_TYPE_DEVICE_MEMORY:
-            return "VK_OBJECT_TYPE_DEVICE_MEMORY";
-        case VK_OBJECT_TYPE_BUFFER:
-            return "VK_OBJECT_TYPE_BUFFER";
-        case VK_OBJECT_TYPE_IMAGE:
-            return "VK_OBJECT_TYPE_IMAGE";
-        case VK_OBJECT_TYPE_EVENT:
-            return "VK_OBJECT_TYPE_EVENT";
-        case VK_OBJECT_TYPE_QUERY_POOL:
-            return "VK_OBJECT_TYPE_QUERY_POOL";
-        case VK_OBJECT_TYPE_BUFFER_VIEW:
-            return "VK_OBJECT_TYPE_BUFFER_VIEW";
-        case VK_OBJECT_TYPE_IMAGE_VIEW:
-            return "VK_OBJECT_TYPE_IMAGE_VIEW";
-        case VK_OBJECT_TYPE_SHADER_MODULE:
-            return "VK_OBJECT_TYPE_SHADER_MODULE";
-        case VK_OBJECT_TYPE_PIPELINE_CACHE:
-            return "VK_OBJECT_TYPE_PIPELINE_CACHE";
-        case VK_OBJECT_TYPE_PIPELINE_LAYOUT:
-            return "VK_OBJECT_TYPE_PIPELINE_LAYOUT";
-        case VK_OBJECT_TYPE_RENDER_PASS:
-            return "VK_OBJECT_TYPE_RENDER_PASS";
-        case VK_OBJECT_TYPE_PIPELINE:
-            return "VK_OBJECT_TYPE_PIPELINE";
-        case VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT:
-            return "VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT";
-        case VK_OBJECT_TYPE_SAMPLER:
-            return "VK_OBJECT_TYPE_SAMPLER";
-        case VK_OBJECT_TYPE_DESCRIPTOR_POOL:
-            return "VK_OBJECT_TYPE_DESCRIPTOR_POOL";
-        case VK_OBJECT_TYPE_DESCRIPTOR_SET:
-            return "VK_OBJECT_TYPE_DESCRIPTOR_SET";
-        case VK_OBJECT_TYPE_FRAMEBUFFER:
-            return "VK_OBJECT_TYPE_FRAMEBUFFER";
-        case VK_OBJECT_TYPE_COMMAND_POOL:
-            return "VK_OBJECT_TYPE_COMMAND_POOL";
         case VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION:
             return "VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION";
         case VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE:
@@ -2052,445 +1962,238 @@ static inline const char* string_VkInternalAllocationType(VkInternalAllocationTy
     }
 }
 static inline const char* string_VkFormat(VkFormat input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_FORMAT_UNDEFINED",
+        "VK_FORMAT_R4G4_UNORM_PACK8",
+        "VK_FORMAT_R4G4B4A4_UNORM_PACK16",
+        "VK_FORMAT_B4G4R4A4_UNORM_PACK16",
+        "VK_FORMAT_R5G6B5_UNORM_PACK16",
+        "VK_FORMAT_B5G6R5_UNORM_PACK16",
+        "VK_FORMAT_R5G5B5A1_UNORM_PACK16",
+        "VK_FORMAT_B5G5R5A1_UNORM_PACK16",
+        "VK_FORMAT_A1R5G5B5_UNORM_PACK16",
+        "VK_FORMAT_R8_UNORM",
+        "VK_FORMAT_R8_SNORM",
+        "VK_FORMAT_R8_USCALED",
+        "VK_FORMAT_R8_SSCALED",
+        "VK_FORMAT_R8_UINT",
+        "VK_FORMAT_R8_SINT",
+        "VK_FORMAT_R8_SRGB",
+        "VK_FORMAT_R8G8_UNORM",
+        "VK_FORMAT_R8G8_SNORM",
+        "VK_FORMAT_R8G8_USCALED",
+        "VK_FORMAT_R8G8_SSCALED",
+        "VK_FORMAT_R8G8_UINT",
+        "VK_FORMAT_R8G8_SINT",
+        "VK_FORMAT_R8G8_SRGB",
+        "VK_FORMAT_R8G8B8_UNORM",
+        "VK_FORMAT_R8G8B8_SNORM",
+        "VK_FORMAT_R8G8B8_USCALED",
+        "VK_FORMAT_R8G8B8_SSCALED",
+        "VK_FORMAT_R8G8B8_UINT",
+        "VK_FORMAT_R8G8B8_SINT",
+        "VK_FORMAT_R8G8B8_SRGB",
+        "VK_FORMAT_B8G8R8_UNORM",
+        "VK_FORMAT_B8G8R8_SNORM",
+        "VK_FORMAT_B8G8R8_USCALED",
+        "VK_FORMAT_B8G8R8_SSCALED",
+        "VK_FORMAT_B8G8R8_UINT",
+        "VK_FORMAT_B8G8R8_SINT",
+        "VK_FORMAT_B8G8R8_SRGB",
+        "VK_FORMAT_R8G8B8A8_UNORM",
+        "VK_FORMAT_R8G8B8A8_SNORM",
+        "VK_FORMAT_R8G8B8A8_USCALED",
+        "VK_FORMAT_R8G8B8A8_SSCALED",
+        "VK_FORMAT_R8G8B8A8_UINT",
+        "VK_FORMAT_R8G8B8A8_SINT",
+        "VK_FORMAT_R8G8B8A8_SRGB",
+        "VK_FORMAT_B8G8R8A8_UNORM",
+        "VK_FORMAT_B8G8R8A8_SNORM",
+        "VK_FORMAT_B8G8R8A8_USCALED",
+        "VK_FORMAT_B8G8R8A8_SSCALED",
+        "VK_FORMAT_B8G8R8A8_UINT",
+        "VK_FORMAT_B8G8R8A8_SINT",
+        "VK_FORMAT_B8G8R8A8_SRGB",
+        "VK_FORMAT_A8B8G8R8_UNORM_PACK32",
+        "VK_FORMAT_A8B8G8R8_SNORM_PACK32",
+        "VK_FORMAT_A8B8G8R8_USCALED_PACK32",
+        "VK_FORMAT_A8B8G8R8_SSCALED_PACK32",
+        "VK_FORMAT_A8B8G8R8_UINT_PACK32",
+        "VK_FORMAT_A8B8G8R8_SINT_PACK32",
+        "VK_FORMAT_A8B8G8R8_SRGB_PACK32",
+        "VK_FORMAT_A2R10G10B10_UNORM_PACK32",
+        "VK_FORMAT_A2R10G10B10_SNORM_PACK32",
+        "VK_FORMAT_A2R10G10B10_USCALED_PACK32",
+        "VK_FORMAT_A2R10G10B10_SSCALED_PACK32",
+        "VK_FORMAT_A2R10G10B10_UINT_PACK32",
+        "VK_FORMAT_A2R10G10B10_SINT_PACK32",
+        "VK_FORMAT_A2B10G10R10_UNORM_PACK32",
+        "VK_FORMAT_A2B10G10R10_SNORM_PACK32",
+        "VK_FORMAT_A2B10G10R10_USCALED_PACK32",
+        "VK_FORMAT_A2B10G10R10_SSCALED_PACK32",
+        "VK_FORMAT_A2B10G10R10_UINT_PACK32",
+        "VK_FORMAT_A2B10G10R10_SINT_PACK32",
+        "VK_FORMAT_R16_UNORM",
+        "VK_FORMAT_R16_SNORM",
+        "VK_FORMAT_R16_USCALED",
+        "VK_FORMAT_R16_SSCALED",
+        "VK_FORMAT_R16_UINT",
+        "VK_FORMAT_R16_SINT",
+        "VK_FORMAT_R16_SFLOAT",
+        "VK_FORMAT_R16G16_UNORM",
+        "VK_FORMAT_R16G16_SNORM",
+        "VK_FORMAT_R16G16_USCALED",
+        "VK_FORMAT_R16G16_SSCALED",
+        "VK_FORMAT_R16G16_UINT",
+        "VK_FORMAT_R16G16_SINT",
+        "VK_FORMAT_R16G16_SFLOAT",
+        "VK_FORMAT_R16G16B16_UNORM",
+        "VK_FORMAT_R16G16B16_SNORM",
+        "VK_FORMAT_R16G16B16_USCALED",
+        "VK_FORMAT_R16G16B16_SSCALED",
+        "VK_FORMAT_R16G16B16_UINT",
+        "VK_FORMAT_R16G16B16_SINT",
+        "VK_FORMAT_R16G16B16_SFLOAT",
+        "VK_FORMAT_R16G16B16A16_UNORM",
+        "VK_FORMAT_R16G16B16A16_SNORM",
+        "VK_FORMAT_R16G16B16A16_USCALED",
+        "VK_FORMAT_R16G16B16A16_SSCALED",
+        "VK_FORMAT_R16G16B16A16_UINT",
+        "VK_FORMAT_R16G16B16A16_SINT",
+        "VK_FORMAT_R16G16B16A16_SFLOAT",
+        "VK_FORMAT_R32_UINT",
+        "VK_FORMAT_R32_SINT",
+        "VK_FORMAT_R32_SFLOAT",
+        "VK_FORMAT_R32G32_UINT",
+        "VK_FORMAT_R32G32_SINT",
+        "VK_FORMAT_R32G32_SFLOAT",
+        "VK_FORMAT_R32G32B32_UINT",
+        "VK_FORMAT_R32G32B32_SINT",
+        "VK_FORMAT_R32G32B32_SFLOAT",
+        "VK_FORMAT_R32G32B32A32_UINT",
+        "VK_FORMAT_R32G32B32A32_SINT",
+        "VK_FORMAT_R32G32B32A32_SFLOAT",
+        "VK_FORMAT_R64_UINT",
+        "VK_FORMAT_R64_SINT",
+        "VK_FORMAT_R64_SFLOAT",
+        "VK_FORMAT_R64G64_UINT",
+        "VK_FORMAT_R64G64_SINT",
+        "VK_FORMAT_R64G64_SFLOAT",
+        "VK_FORMAT_R64G64B64_UINT",
+        "VK_FORMAT_R64G64B64_SINT",
+        "VK_FORMAT_R64G64B64_SFLOAT",
+        "VK_FORMAT_R64G64B64A64_UINT",
+        "VK_FORMAT_R64G64B64A64_SINT",
+        "VK_FORMAT_R64G64B64A64_SFLOAT",
+        "VK_FORMAT_B10G11R11_UFLOAT_PACK32",
+        "VK_FORMAT_E5B9G9R9_UFLOAT_PACK32",
+        "VK_FORMAT_D16_UNORM",
+        "VK_FORMAT_X8_D24_UNORM_PACK32",
+        "VK_FORMAT_D32_SFLOAT",
+        "VK_FORMAT_S8_UINT",
+        "VK_FORMAT_D16_UNORM_S8_UINT",
+        "VK_FORMAT_D24_UNORM_S8_UINT",
+        "VK_FORMAT_D32_SFLOAT_S8_UINT",
+        "VK_FORMAT_BC1_RGB_UNORM_BLOCK",
+        "VK_FORMAT_BC1_RGB_SRGB_BLOCK",
+        "VK_FORMAT_BC1_RGBA_UNORM_BLOCK",
+        "VK_FORMAT_BC1_RGBA_SRGB_BLOCK",
+        "VK_FORMAT_BC2_UNORM_BLOCK",
+        "VK_FORMAT_BC2_SRGB_BLOCK",
+        "VK_FORMAT_BC3_UNORM_BLOCK",
+        "VK_FORMAT_BC3_SRGB_BLOCK",
+        "VK_FORMAT_BC4_UNORM_BLOCK",
+        "VK_FORMAT_BC4_SNORM_BLOCK",
+        "VK_FORMAT_BC5_UNORM_BLOCK",
+        "VK_FORMAT_BC5_SNORM_BLOCK",
+        "VK_FORMAT_BC6H_UFLOAT_BLOCK",
+        "VK_FORMAT_BC6H_SFLOAT_BLOCK",
+        "VK_FORMAT_BC7_UNORM_BLOCK",
+        "VK_FORMAT_BC7_SRGB_BLOCK",
+        "VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK",
+        "VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK",
+        "VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK",
+        "VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK",
+        "VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK",
+        "VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK",
+        "VK_FORMAT_EAC_R11_UNORM_BLOCK",
+        "VK_FORMAT_EAC_R11_SNORM_BLOCK",
+        "VK_FORMAT_EAC_R11G11_UNORM_BLOCK",
+        "VK_FORMAT_EAC_R11G11_SNORM_BLOCK",
+        "VK_FORMAT_ASTC_4x4_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_4x4_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_5x4_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_5x4_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_5x5_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_5x5_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_6x5_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_6x5_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_6x6_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_6x6_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_8x5_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_8x5_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_8x6_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_8x6_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_8x8_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_8x8_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_10x5_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_10x5_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_10x6_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_10x6_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_10x8_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_10x8_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_10x10_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_10x10_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_12x10_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_12x10_SRGB_BLOCK",
+        "VK_FORMAT_ASTC_12x12_UNORM_BLOCK",
+        "VK_FORMAT_ASTC_12x12_SRGB_BLOCK",
+    };
+    static_assert(std::size(kNames0) == VK_FORMAT_ASTC_12x12_SRGB_BLOCK - VK_FORMAT_UNDEFINED + 1);
+    if (input_value >= VK_FORMAT_UNDEFINED && input_value <= VK_FORMAT_ASTC_12x12_SRGB_BLOCK) {
+        return kNames0[input_value - VK_FORMAT_UNDEFINED];
+    }
+    static constexpr const char* kNames1[] = {
+        "VK_FORMAT_G8B8G8R8_422_UNORM",
+        "VK_FORMAT_B8G8R8G8_422_UNORM",
+        "VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM",
+        "VK_FORMAT_G8_B8R8_2PLANE_420_UNORM",
+        "VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM",
+        "VK_FORMAT_G8_B8R8_2PLANE_422_UNORM",
+        "VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM",
+        "VK_FORMAT_R10X6_UNORM_PACK16",
+        "VK_FORMAT_R10X6G10X6_UNORM_2PACK16",
+        "VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16",
+        "VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16",
+        "VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16",
+        "VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16",
+        "VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16",
+        "VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16",
+        "VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16",
+        "VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16",
+        "VK_FORMAT_R12X4_UNORM_PACK16",
+        "VK_FORMAT_R12X4G12X4_UNORM_2PACK16",
+        "VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16",
+        "VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16",
+        "VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16",
+        "VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16",
+        "VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16",
+        "VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16",
+        "VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16",
+        "VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16",
+        "VK_FORMAT_G16B16G16R16_422_UNORM",
+        "VK_FORMAT_B16G16R16G16_422_UNORM",
+        "VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM",
+        "VK_FORMAT_G16_B16R16_2PLANE_420_UNORM",
+        "VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM",
+        "VK_FORMAT_G16_B16R16_2PLANE_422_UNORM",
+        "VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM",
+    };
+    static_assert(std::size(kNames1) == VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM - VK_FORMAT_G8B8G8R8_422_UNORM + 1);
+    if (input_value >= VK_FORMAT_G8B8G8R8_422_UNORM && input_value <= VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM) {
+        return kNames1[input_value - VK_FORMAT_G8B8G8R8_422_UNORM];
+    }
     switch (input_value) {
-        case VK_FORMAT_UNDEFINED:
-            return "VK_FORMAT_UNDEFINED";
-        case VK_FORMAT_R4G4_UNORM_PACK8:
-            return "VK_FORMAT_R4G4_UNORM_PACK8";
-        case VK_FORMAT_R4G4B4A4_UNORM_PACK16:
-            return "VK_FORMAT_R4G4B4A4_UNORM_PACK16";
-        case VK_FORMAT_B4G4R4A4_UNORM_PACK16:
-            return "VK_FORMAT_B4G4R4A4_UNORM_PACK16";
-        case VK_FORMAT_R5G6B5_UNORM_PACK16:
-            return "VK_FORMAT_R5G6B5_UNORM_PACK16";
-        case VK_FORMAT_B5G6R5_UNORM_PACK16:
-            return "VK_FORMAT_B5G6R5_UNORM_PACK16";
-        case VK_FORMAT_R5G5B5A1_UNORM_PACK16:
-            return "VK_FORMAT_R5G5B5A1_UNORM_PACK16";
-        case VK_FORMAT_B5G5R5A1_UNORM_PACK16:
-            return "VK_FORMAT_B5G5R5A1_UNORM_PACK16";
-        case VK_FORMAT_A1R5G5B5_UNORM_PACK16:
-            return "VK_FORMAT_A1R5G5B5_UNORM_PACK16";
-        case VK_FORMAT_R8_UNORM:
-            return "VK_FORMAT_R8_UNORM";
-        case VK_FORMAT_R8_SNORM:
-            return "VK_FORMAT_R8_SNORM";
-        case VK_FORMAT_R8_USCALED:
-            return "VK_FORMAT_R8_USCALED";
-        case VK_FORMAT_R8_SSCALED:
-            return "VK_FORMAT_R8_SSCALED";
-        case VK_FORMAT_R8_UINT:
-            return "VK_FORMAT_R8_UINT";
-        case VK_FORMAT_R8_SINT:
-            return "VK_FORMAT_R8_SINT";
-        case VK_FORMAT_R8_SRGB:
-            return "VK_FORMAT_R8_SRGB";
-        case VK_FORMAT_R8G8_UNORM:
-            return "VK_FORMAT_R8G8_UNORM";
-        case VK_FORMAT_R8G8_SNORM:
-            return "VK_FORMAT_R8G8_SNORM";
-        case VK_FORMAT_R8G8_USCALED:
-            return "VK_FORMAT_R8G8_USCALED";
-        case VK_FORMAT_R8G8_SSCALED:
-            return "VK_FORMAT_R8G8_SSCALED";
-        case VK_FORMAT_R8G8_UINT:
-            return "VK_FORMAT_R8G8_UINT";
-        case VK_FORMAT_R8G8_SINT:
-            return "VK_FORMAT_R8G8_SINT";
-        case VK_FORMAT_R8G8_SRGB:
-            return "VK_FORMAT_R8G8_SRGB";
-        case VK_FORMAT_R8G8B8_UNORM:
-            return "VK_FORMAT_R8G8B8_UNORM";
-        case VK_FORMAT_R8G8B8_SNORM:
-            return "VK_FORMAT_R8G8B8_SNORM";
-        case VK_FORMAT_R8G8B8_USCALED:
-            return "VK_FORMAT_R8G8B8_USCALED";
-        case VK_FORMAT_R8G8B8_SSCALED:
-            return "VK_FORMAT_R8G8B8_SSCALED";
-        case VK_FORMAT_R8G8B8_UINT:
-            return "VK_FORMAT_R8G8B8_UINT";
-        case VK_FORMAT_R8G8B8_SINT:
-            return "VK_FORMAT_R8G8B8_SINT";
-        case VK_FORMAT_R8G8B8_SRGB:
-            return "VK_FORMAT_R8G8B8_SRGB";
-        case VK_FORMAT_B8G8R8_UNORM:
-            return "VK_FORMAT_B8G8R8_UNORM";
-        case VK_FORMAT_B8G8R8_SNORM:
-            return "VK_FORMAT_B8G8R8_SNORM";
-        case VK_FORMAT_B8G8R8_USCALED:
-            return "VK_FORMAT_B8G8R8_USCALED";
-        case VK_FORMAT_B8G8R8_SSCALED:
-            return "VK_FORMAT_B8G8R8_SSCALED";
-        case VK_FORMAT_B8G8R8_UINT:
-            return "VK_FORMAT_B8G8R8_UINT";
-        case VK_FORMAT_B8G8R8_SINT:
-            return "VK_FORMAT_B8G8R8_SINT";
-        case VK_FORMAT_B8G8R8_SRGB:
-            return "VK_FORMAT_B8G8R8_SRGB";
-        case VK_FORMAT_R8G8B8A8_UNORM:
-            return "VK_FORMAT_R8G8B8A8_UNORM";
-        case VK_FORMAT_R8G8B8A8_SNORM:
-            return "VK_FORMAT_R8G8B8A8_SNORM";
-        case VK_FORMAT_R8G8B8A8_USCALED:
-            return "VK_FORMAT_R8G8B8A8_USCALED";
-        case VK_FORMAT_R8G8B8A8_SSCALED:
-            return "VK_FORMAT_R8G8B8A8_SSCALED";
-        case VK_FORMAT_R8G8B8A8_UINT:
-            return "VK_FORMAT_R8G8B8A8_UINT";
-        case VK_FORMAT_R8G8B8A8_SINT:
-            return "VK_FORMAT_R8G8B8A8_SINT";
-        case VK_FORMAT_R8G8B8A8_SRGB:
-            return "VK_FORMAT_R8G8B8A8_SRGB";
-        case VK_FORMAT_B8G8R8A8_UNORM:
-            return "VK_FORMAT_B8G8R8A8_UNORM";
-        case VK_FORMAT_B8G8R8A8_SNORM:
-            return "VK_FORMAT_B8G8R8A8_SNORM";
-        case VK_FORMAT_B8G8R8A8_USCALED:
-            return "VK_FORMAT_B8G8R8A8_USCALED";
-        case VK_FORMAT_B8G8R8A8_SSCALED:
-            return "VK_FORMAT_B8G8R8A8_SSCALED";
-        case VK_FORMAT_B8G8R8A8_UINT:
-            return "VK_FORMAT_B8G8R8A8_UINT";
-        case VK_FORMAT_B8G8R8A8_SINT:
-            return "VK_FORMAT_B8G8R8A8_SINT";
-        case VK_FORMAT_B8G8R8A8_SRGB:
-            return "VK_FORMAT_B8G8R8A8_SRGB";
-        case VK_FORMAT_A8B8G8R8_UNORM_PACK32:
-            return "VK_FORMAT_A8B8G8R8_UNORM_PACK32";
-        case VK_FORMAT_A8B8G8R8_SNORM_PACK32:
-            return "VK_FORMAT_A8B8G8R8_SNORM_PACK32";
-        case VK_FORMAT_A8B8G8R8_USCALED_PACK32:
-            return "VK_FORMAT_A8B8G8R8_USCALED_PACK32";
-        case VK_FORMAT_A8B8G8R8_SSCALED_PACK32:
-            return "VK_FORMAT_A8B8G8R8_SSCALED_PACK32";
-        case VK_FORMAT_A8B8G8R8_UINT_PACK32:
-            return "VK_FORMAT_A8B8G8R8_UINT_PACK32";
-        case VK_FORMAT_A8B8G8R8_SINT_PACK32:
-            return "VK_FORMAT_A8B8G8R8_SINT_PACK32";
-        case VK_FORMAT_A8B8G8R8_SRGB_PACK32:
-            return "VK_FORMAT_A8B8G8R8_SRGB_PACK32";
-        case VK_FORMAT_A2R10G10B10_UNORM_PACK32:
-            return "VK_FORMAT_A2R10G10B10_UNORM_PACK32";
-        case VK_FORMAT_A2R10G10B10_SNORM_PACK32:
-            return "VK_FORMAT_A2R10G10B10_SNORM_PACK32";
-        case VK_FORMAT_A2R10G10B10_USCALED_PACK32:
-            return "VK_FORMAT_A2R10G10B10_USCALED_PACK32";
-        case VK_FORMAT_A2R10G10B10_SSCALED_PACK32:
-            return "VK_FORMAT_A2R10G10B10_SSCALED_PACK32";
-        case VK_FORMAT_A2R10G10B10_UINT_PACK32:
-            return "VK_FORMAT_A2R10G10B10_UINT_PACK32";
-        case VK_FORMAT_A2R10G10B10_SINT_PACK32:
-            return "VK_FORMAT_A2R10G10B10_SINT_PACK32";
-        case VK_FORMAT_A2B10G10R10_UNORM_PACK32:
-            return "VK_FORMAT_A2B10G10R10_UNORM_PACK32";
-        case VK_FORMAT_A2B10G10R10_SNORM_PACK32:
-            return "VK_FORMAT_A2B10G10R10_SNORM_PACK32";
-        case VK_FORMAT_A2B10G10R10_USCALED_PACK32:
-            return "VK_FORMAT_A2B10G10R10_USCALED_PACK32";
-        case VK_FORMAT_A2B10G10R10_SSCALED_PACK32:
-            return "VK_FORMAT_A2B10G10R10_SSCALED_PACK32";
-        case VK_FORMAT_A2B10G10R10_UINT_PACK32:
-            return "VK_FORMAT_A2B10G10R10_UINT_PACK32";
-        case VK_FORMAT_A2B10G10R10_SINT_PACK32:
-            return "VK_FORMAT_A2B10G10R10_SINT_PACK32";
-        case VK_FORMAT_R16_UNORM:
-            return "VK_FORMAT_R16_UNORM";
-        case VK_FORMAT_R16_SNORM:
-            return "VK_FORMAT_R16_SNORM";
-        case VK_FORMAT_R16_USCALED:
-            return "VK_FORMAT_R16_USCALED";
-        case VK_FORMAT_R16_SSCALED:
-            return "VK_FORMAT_R16_SSCALED";
-        case VK_FORMAT_R16_UINT:
-            return "VK_FORMAT_R16_UINT";
-        case VK_FORMAT_R16_SINT:
-            return "VK_FORMAT_R16_SINT";
-        case VK_FORMAT_R16_SFLOAT:
-            return "VK_FORMAT_R16_SFLOAT";
-        case VK_FORMAT_R16G16_UNORM:
-            return "VK_FORMAT_R16G16_UNORM";
-        case VK_FORMAT_R16G16_SNORM:
-            return "VK_FORMAT_R16G16_SNORM";
-        case VK_FORMAT_R16G16_USCALED:
-            return "VK_FORMAT_R16G16_USCALED";
-        case VK_FORMAT_R16G16_SSCALED:
-            return "VK_FORMAT_R16G16_SSCALED";
-        case VK_FORMAT_R16G16_UINT:
-            return "VK_FORMAT_R16G16_UINT";
-        case VK_FORMAT_R16G16_SINT:
-            return "VK_FORMAT_R16G16_SINT";
-        case VK_FORMAT_R16G16_SFLOAT:
-            return "VK_FORMAT_R16G16_SFLOAT";
-        case VK_FORMAT_R16G16B16_UNORM:
-            return "VK_FORMAT_R16G16B16_UNORM";
-        case VK_FORMAT_R16G16B16_SNORM:
-            return "VK_FORMAT_R16G16B16_SNORM";
-        case VK_FORMAT_R16G16B16_USCALED:
-            return "VK_FORMAT_R16G16B16_USCALED";
-        case VK_FORMAT_R16G16B16_SSCALED:
-            return "VK_FORMAT_R16G16B16_SSCALED";
-        case VK_FORMAT_R16G16B16_UINT:
-            return "VK_FORMAT_R16G16B16_UINT";
-        case VK_FORMAT_R16G16B16_SINT:
-            return "VK_FORMAT_R16G16B16_SINT";
-        case VK_FORMAT_R16G16B16_SFLOAT:
-            return "VK_FORMAT_R16G16B16_SFLOAT";
-        case VK_FORMAT_R16G16B16A16_UNORM:
-            return "VK_FORMAT_R16G16B16A16_UNORM";
-        case VK_FORMAT_R16G16B16A16_SNORM:
-            return "VK_FORMAT_R16G16B16A16_SNORM";
-        case VK_FORMAT_R16G16B16A16_USCALED:
-            return "VK_FORMAT_R16G16B16A16_USCALED";
-        case VK_FORMAT_R16G16B16A16_SSCALED:
-            return "VK_FORMAT_R16G16B16A16_SSCALED";
-        case VK_FORMAT_R16G16B16A16_UINT:
-            return "VK_FORMAT_R16G16B16A16_UINT";
-        case VK_FORMAT_R16G16B16A16_SINT:
-            return "VK_FORMAT_R16G16B16A16_SINT";
-        case VK_FORMAT_R16G16B16A16_SFLOAT:
-            return "VK_FORMAT_R16G16B16A16_SFLOAT";
-        case VK_FORMAT_R32_UINT:
-            return "VK_FORMAT_R32_UINT";
-        case VK_FORMAT_R32_SINT:
-            return "VK_FORMAT_R32_SINT";
-        case VK_FORMAT_R32_SFLOAT:
-            return "VK_FORMAT_R32_SFLOAT";
-        case VK_FORMAT_R32G32_UINT:
-            return "VK_FORMAT_R32G32_UINT";
-        case VK_FORMAT_R32G32_SINT:
-            return "VK_FORMAT_R32G32_SINT";
-        case VK_FORMAT_R32G32_SFLOAT:
-            return "VK_FORMAT_R32G32_SFLOAT";
-        case VK_FORMAT_R32G32B32_UINT:
-            return "VK_FORMAT_R32G32B32_UINT";
-        case VK_FORMAT_R32G32B32_SINT:
-            return "VK_FORMAT_R32G32B32_SINT";
-        case VK_FORMAT_R32G32B32_SFLOAT:
-            return "VK_FORMAT_R32G32B32_SFLOAT";
-        case VK_FORMAT_R32G32B32A32_UINT:
-            return "VK_FORMAT_R32G32B32A32_UINT";
-        case VK_FORMAT_R32G32B32A32_SINT:
-            return "VK_FORMAT_R32G32B32A32_SINT";
-        case VK_FORMAT_R32G32B32A32_SFLOAT:
-            return "VK_FORMAT_R32G32B32A32_SFLOAT";
-        case VK_FORMAT_R64_UINT:
-            return "VK_FORMAT_R64_UINT";
-        case VK_FORMAT_R64_SINT:
-            return "VK_FORMAT_R64_SINT";
-        case VK_FORMAT_R64_SFLOAT:
-            return "VK_FORMAT_R64_SFLOAT";
-        case VK_FORMAT_R64G64_UINT:
-            return "VK_FORMAT_R64G64_UINT";
-        case VK_FORMAT_R64G64_SINT:
-            return "VK_FORMAT_R64G64_SINT";
-        case VK_FORMAT_R64G64_SFLOAT:
-            return "VK_FORMAT_R64G64_SFLOAT";
-        case VK_FORMAT_R64G64B64_UINT:
-            return "VK_FORMAT_R64G64B64_UINT";
-        case VK_FORMAT_R64G64B64_SINT:
-            return "VK_FORMAT_R64G64B64_SINT";
-        case VK_FORMAT_R64G64B64_SFLOAT:
-            return "VK_FORMAT_R64G64B64_SFLOAT";
-        case VK_FORMAT_R64G64B64A64_UINT:
-            return "VK_FORMAT_R64G64B64A64_UINT";
-        case VK_FORMAT_R64G64B64A64_SINT:
-            return "VK_FORMAT_R64G64B64A64_SINT";
-        case VK_FORMAT_R64G64B64A64_SFLOAT:
-            return "VK_FORMAT_R64G64B64A64_SFLOAT";
-        case VK_FORMAT_B10G11R11_UFLOAT_PACK32:
-            return "VK_FORMAT_B10G11R11_UFLOAT_PACK32";
-        case VK_FORMAT_E5B9G9R9_UFLOAT_PACK32:
-            return "VK_FORMAT_E5B9G9R9_UFLOAT_PACK32";
-        case VK_FORMAT_D16_UNORM:
-            return "VK_FORMAT_D16_UNORM";
-        case VK_FORMAT_X8_D24_UNORM_PACK32:
-            return "VK_FORMAT_X8_D24_UNORM_PACK32";
-        case VK_FORMAT_D32_SFLOAT:
-            return "VK_FORMAT_D32_SFLOAT";
-        case VK_FORMAT_S8_UINT:
-            return "VK_FORMAT_S8_UINT";
-        case VK_FORMAT_D16_UNORM_S8_UINT:
-            return "VK_FORMAT_D16_UNORM_S8_UINT";
-        case VK_FORMAT_D24_UNORM_S8_UINT:
-            return "VK_FORMAT_D24_UNORM_S8_UINT";
-        case VK_FORMAT_D32_SFLOAT_S8_UINT:
-            return "VK_FORMAT_D32_SFLOAT_S8_UINT";
-        case VK_FORMAT_BC1_RGB_UNORM_BLOCK:
-            return "VK_FORMAT_BC1_RGB_UNORM_BLOCK";
-        case VK_FORMAT_BC1_RGB_SRGB_BLOCK:
-            return "VK_FORMAT_BC1_RGB_SRGB_BLOCK";
-        case VK_FORMAT_BC1_RGBA_UNORM_BLOCK:
-            return "VK_FORMAT_BC1_RGBA_UNORM_BLOCK";
-        case VK_FORMAT_BC1_RGBA_SRGB_BLOCK:
-            return "VK_FORMAT_BC1_RGBA_SRGB_BLOCK";
-        case VK_FORMAT_BC2_UNORM_BLOCK:
-            return "VK_FORMAT_BC2_UNORM_BLOCK";
-        case VK_FORMAT_BC2_SRGB_BLOCK:
-            return "VK_FORMAT_BC2_SRGB_BLOCK";
-        case VK_FORMAT_BC3_UNORM_BLOCK:
-            return "VK_FORMAT_BC3_UNORM_BLOCK";
-        case VK_FORMAT_BC3_SRGB_BLOCK:
-            return "VK_FORMAT_BC3_SRGB_BLOCK";
-        case VK_FORMAT_BC4_UNORM_BLOCK:
-            return "VK_FORMAT_BC4_UNORM_BLOCK";
-        case VK_FORMAT_BC4_SNORM_BLOCK:
-            return "VK_FORMAT_BC4_SNORM_BLOCK";
-        case VK_FORMAT_BC5_UNORM_BLOCK:
-            return "VK_FORMAT_BC5_UNORM_BLOCK";
-        case VK_FORMAT_BC5_SNORM_BLOCK:
-            return "VK_FORMAT_BC5_SNORM_BLOCK";
-        case VK_FORMAT_BC6H_UFLOAT_BLOCK:
-            return "VK_FORMAT_BC6H_UFLOAT_BLOCK";
-        case VK_FORMAT_BC6H_SFLOAT_BLOCK:
-            return "VK_FORMAT_BC6H_SFLOAT_BLOCK";
-        case VK_FORMAT_BC7_UNORM_BLOCK:
-            return "VK_FORMAT_BC7_UNORM_BLOCK";
-        case VK_FORMAT_BC7_SRGB_BLOCK:
-            return "VK_FORMAT_BC7_SRGB_BLOCK";
-        case VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK:
-            return "VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK";
-        case VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK:
-            return "VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK";
-        case VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK:
-            return "VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK";
-        case VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK:
-            return "VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK";
-        case VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK:
-            return "VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK";
-        case VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK:
-            return "VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK";
-        case VK_FORMAT_EAC_R11_UNORM_BLOCK:
-            return "VK_FORMAT_EAC_R11_UNORM_BLOCK";
-        case VK_FORMAT_EAC_R11_SNORM_BLOCK:
-            return "VK_FORMAT_EAC_R11_SNORM_BLOCK";
-        case VK_FORMAT_EAC_R11G11_UNORM_BLOCK:
-            return "VK_FORMAT_EAC_R11G11_UNORM_BLOCK";
-        case VK_FORMAT_EAC_R11G11_SNORM_BLOCK:
-            return "VK_FORMAT_EAC_R11G11_SNORM_BLOCK";
-        case VK_FORMAT_ASTC_4x4_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_4x4_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_4x4_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_4x4_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_5x4_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_5x4_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_5x4_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_5x4_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_5x5_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_5x5_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_5x5_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_5x5_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_6x5_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_6x5_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_6x5_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_6x5_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_6x6_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_6x6_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_6x6_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_6x6_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_8x5_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_8x5_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_8x5_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_8x5_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_8x6_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_8x6_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_8x6_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_8x6_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_8x8_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_8x8_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_8x8_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_8x8_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_10x5_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_10x5_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_10x5_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_10x5_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_10x6_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_10x6_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_10x6_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_10x6_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_10x8_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_10x8_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_10x8_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_10x8_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_10x10_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_10x10_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_10x10_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_10x10_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_12x10_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_12x10_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_12x10_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_12x10_SRGB_BLOCK";
-        case VK_FORMAT_ASTC_12x12_UNORM_BLOCK:
-            return "VK_FORMAT_ASTC_12x12_UNORM_BLOCK";
-        case VK_FORMAT_ASTC_12x12_SRGB_BLOCK:
-            return "VK_FORMAT_ASTC_12x12_SRGB_BLOCK";
-        case VK_FORMAT_G8B8G8R8_422_UNORM:
-            return "VK_FORMAT_G8B8G8R8_422_UNORM";
-        case VK_FORMAT_B8G8R8G8_422_UNORM:
-            return "VK_FORMAT_B8G8R8G8_422_UNORM";
-        case VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM:
-            return "VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM";
-        case VK_FORMAT_G8_B8R8_2PLANE_420_UNORM:
-            return "VK_FORMAT_G8_B8R8_2PLANE_420_UNORM";
-        case VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM:
-            return "VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM";
-        case VK_FORMAT_G8_B8R8_2PLANE_422_UNORM:
-            return "VK_FORMAT_G8_B8R8_2PLANE_422_UNORM";
-        case VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM:
-            return "VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM";
-        case VK_FORMAT_R10X6_UNORM_PACK16:
-            return "VK_FORMAT_R10X6_UNORM_PACK16";
-        case VK_FORMAT_R10X6G10X6_UNORM_2PACK16:
-            return "VK_FORMAT_R10X6G10X6_UNORM_2PACK16";
-        case VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16:
-            return "VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16";
-        case VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16:
-            return "VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16";
-        case VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16:
-            return "VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16";
-        case VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16:
-            return "VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16";
-        case VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16:
-            return "VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16";
-        case VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16:
-            return "VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16";
-        case VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16:
-            return "VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16";
-        case VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16:
-            return "VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16";
-        case VK_FORMAT_R12X4_UNORM_PACK16:
-            return "VK_FORMAT_R12X4_UNORM_PACK16";
-        case VK_FORMAT_R12X4G12X4_UNORM_2PACK16:
-            return "VK_FORMAT_R12X4G12X4_UNORM_2PACK16";
-        case VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16:
-            return "VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16";
-        case VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16:
-            return "VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16";
-        case VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16:
-            return "VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16";
-        case VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16:
-            return "VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16";
-        case VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16:
-            return "VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16";
-        case VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16:
-            return "VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16";
-        case VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16:
-            return "VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16";
-        case VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16:
-            return "VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16";
-        case VK_FORMAT_G16B16G16R16_422_UNORM:
-            return "VK_FORMAT_G16B16G16R16_422_UNORM";
-        case VK_FORMAT_B16G16R16G16_422_UNORM:
-            return "VK_FORMAT_B16G16R16G16_422_UNORM";
-        case VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM:
-            return "VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM";
-        case VK_FORMAT_G16_B16R16_2PLANE_420_UNORM:
-            return "VK_FORMAT_G16_B16R16_2PLANE_420_UNORM";
-        case VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM:
-            return "VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM";
-        case VK_FORMAT_G16_B16R16_2PLANE_422_UNORM:
-            return "VK_FORMAT_G16_B16R16_2PLANE_422_UNORM";
-        case VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM:
-            return "VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM";
         case VK_FORMAT_G8_B8R8_2PLANE_444_UNORM:
             return "VK_FORMAT_G8_B8R8_2PLANE_444_UNORM";
         case VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16:
@@ -2686,50 +2389,86 @@ static inline const char* string_VkImageViewType(VkImageViewType input_value) {
     }
 }
 static inline const char* string_VkBlendFactor(VkBlendFactor input_value) {
-    switch (input_value) {
-        case VK_BLEND_FACTOR_ZERO:
-            return "VK_BLEND_FACTOR_ZERO";
-        case VK_BLEND_FACTOR_ONE:
-            return "VK_BLEND_FACTOR_ONE";
-        case VK_BLEND_FACTOR_SRC_COLOR:
-            return "VK_BLEND_FACTOR_SRC_COLOR";
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR:
-            return "VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR";
-        case VK_BLEND_FACTOR_DST_COLOR:
-            return "VK_BLEND_FACTOR_DST_COLOR";
-        case VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR:
-            return "VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR";
-        case VK_BLEND_FACTOR_SRC_ALPHA:
-            return "VK_BLEND_FACTOR_SRC_ALPHA";
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA:
-            return "VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA";
-        case VK_BLEND_FACTOR_DST_ALPHA:
-            return "VK_BLEND_FACTOR_DST_ALPHA";
-        case VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA:
-            return "VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA";
-        case VK_BLEND_FACTOR_CONSTANT_COLOR:
-            return "VK_BLEND_FACTOR_CONSTANT_COLOR";
-        case VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR:
-            return "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR";
-        case VK_BLEND_FACTOR_CONSTANT_ALPHA:
-            return "VK_BLEND_FACTOR_CONSTANT_ALPHA";
-        case VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA:
-            return "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA";
-        case VK_BLEND_FACTOR_SRC_ALPHA_SATURATE:
-            return "VK_BLEND_FACTOR_SRC_ALPHA_SATURATE";
-        case VK_BLEND_FACTOR_SRC1_COLOR:
-            return "VK_BLEND_FACTOR_SRC1_COLOR";
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR:
-            return "VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR";
-        case VK_BLEND_FACTOR_SRC1_ALPHA:
-            return "VK_BLEND_FACTOR_SRC1_ALPHA";
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA:
-            return "VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA";
-        default:
-            return "Unhandled VkBlendFactor";
-    }
+    static constexpr const char* kNames0[] = {
+        "VK_BLEND_FACTOR_ZERO",
+        "VK_BLEND_FACTOR_ONE",
+        "VK_BLEND_FACTOR_SRC_COLOR",
+        "VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR",
+        "VK_BLEND_FACTOR_DST_COLOR",
+        "VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR",
+        "VK_BLEND_FACTOR_SRC_ALPHA",
+        "VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA",
+        "VK_BLEND_FACTOR_DST_ALPHA",
+        "VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA",
+        "VK_BLEND_FACTOR_CONSTANT_COLOR",
+        "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR",
+        "VK_BLEND_FACTOR_CONSTANT_ALPHA",
+        "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA",
+        "VK_BLEND_FACTOR_SRC_ALPHA_SATURATE",
+        "VK_BLEND_FACTOR_SRC1_COLOR",
+        "VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR",
+        "VK_BLEND_FACTOR_SRC1_ALPHA",
+        "VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA",
+    };
+    static_assert(std::size(kNames0) == VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA - VK_BLEND_FACTOR_ZERO + 1);
+    if (input_value >= VK_BLEND_FACTOR_ZERO && input_value <= VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA) {
+        return kNames0[input_value - VK_BLEND_FACTOR_ZERO];
+    }
+    return "Unhandled VkBlendFactor";
 }
 static inline const char* string_VkBlendOp(VkBlendOp input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_BLEND_OP_ZERO_EXT",
+        "VK_BLEND_OP_SRC_EXT",
+        "VK_BLEND_OP_DST_EXT",
+        "VK_BLEND_OP_SRC_OVER_EXT",
+        "VK_BLEND_OP_DST_OVER_EXT",
+        "VK_BLEND_OP_SRC_IN_EXT",
+        "VK_BLEND_OP_DST_IN_EXT",
+        "VK_BLEND_OP_SRC_OUT_EXT",
+        "VK_BLEND_OP_DST_OUT_EXT",
+        "VK_BLEND_OP_SRC_ATOP_EXT",
+        "VK_BLEND_OP_DST_ATOP_EXT",
+        "VK_BLEND_OP_XOR_EXT",
+        "VK_BLEND_OP_MULTIPLY_EXT",
+        "VK_BLEND_OP_SCREEN_EXT",
+        "VK_BLEND_OP_OVERLAY_EXT",
+        "VK_BLEND_OP_DARKEN_EXT",
+        "VK_BLEND_OP_LIGHTEN_EXT",
+        "VK_BLEND_OP_COLORDODGE_EXT",
+        "VK_BLEND_OP_COLORBURN_EXT",
+        "VK_BLEND_OP_HARDLIGHT_EXT",
+        "VK_BLEND_OP_SOFTLIGHT_EXT",
+        "VK_BLEND_OP_DIFFERENCE_EXT",
+        "VK_BLEND_OP_EXCLUSION_EXT",
+        "VK_BLEND_OP_INVERT_EXT",
+        "VK_BLEND_OP_INVERT_RGB_EXT",
+        "VK_BLEND_OP_LINEARDODGE_EXT",
+        "VK_BLEND_OP_LINEARBURN_EXT",
+        "VK_BLEND_OP_VIVIDLIGHT_EXT",
+        "VK_BLEND_OP_LINEARLIGHT_EXT",
+        "VK_BLEND_OP_PINLIGHT_EXT",
+        "VK_BLEND_OP_HARDMIX_EXT",
+        "VK_BLEND_OP_HSL_HUE_EXT",
+        "VK_BLEND_OP_HSL_SATURATION_EXT",
+        "VK_BLEND_OP_HSL_COLOR_EXT",
+        "VK_BLEND_OP_HSL_LUMINOSITY_EXT",
+        "VK_BLEND_OP_PLUS_EXT",
+        "VK_BLEND_OP_PLUS_CLAMPED_EXT",
+        "VK_BLEND_OP_PLUS_CLAMPED_ALPHA_EXT",
+        "VK_BLEND_OP_PLUS_DARKER_EXT",
+        "VK_BLEND_OP_MINUS_EXT",
+        "VK_BLEND_OP_MINUS_CLAMPED_EXT",
+        "VK_BLEND_OP_CONTRAST_EXT",
+        "VK_BLEND_OP_INVERT_OVG_EXT",
+        "VK_BLEND_OP_RED_EXT",
+        "VK_BLEND_OP_GREEN_EXT",
+        "VK_BLEND_OP_BLUE_EXT",
+    };
+    static_assert(std::size(kNames0) == VK_BLEND_OP_BLUE_EXT - VK_BLEND_OP_ZERO_EXT + 1);
+    if (input_value >= VK_BLEND_OP_ZERO_EXT && input_value <= VK_BLEND_OP_BLUE_EXT) {
+        return kNames0[input_value - VK_BLEND_OP_ZERO_EXT];
+    }
     switch (input_value) {
         case VK_BLEND_OP_ADD:
             return "VK_BLEND_OP_ADD";
@@ -2741,98 +2480,6 @@ static inline const char* string_VkBlendOp(VkBlendOp input_value) {
             return "VK_BLEND_OP_MIN";
         case VK_BLEND_OP_MAX:
             return "VK_BLEND_OP_MAX";
-        case VK_BLEND_OP_ZERO_EXT:
-            return "VK_BLEND_OP_ZERO_EXT";
-        case VK_BLEND_OP_SRC_EXT:
-            return "VK_BLEND_OP_SRC_EXT";
-        case VK_BLEND_OP_DST_EXT:
-            return "VK_BLEND_OP_DST_EXT";
-        case VK_BLEND_OP_SRC_OVER_EXT:
-            return "VK_BLEND_OP_SRC_OVER_EXT";
-        case VK_BLEND_OP_DST_OVER_EXT:
-            return "VK_BLEND_OP_DST_OVER_EXT";
-        case VK_BLEND_OP_SRC_IN_EXT:
-            return "VK_BLEND_OP_SRC_IN_EXT";
-        case VK_BLEND_OP_DST_IN_EXT:
-            return "VK_BLEND_OP_DST_IN_EXT";
-        case VK_BLEND_OP_SRC_OUT_EXT:
-            return "VK_BLEND_OP_SRC_OUT_EXT";
-        case VK_BLEND_OP_DST_OUT_EXT:
-            return "VK_BLEND_OP_DST_OUT_EXT";
-        case VK_BLEND_OP_SRC_ATOP_EXT:
-            return "VK_BLEND_OP_SRC_ATOP_EXT";
-        case VK_BLEND_OP_DST_ATOP_EXT:
-            return "VK_BLEND_OP_DST_ATOP_EXT";
-        case VK_BLEND_OP_XOR_EXT:
-            return "VK_BLEND_OP_XOR_EXT";
-        case VK_BLEND_OP_MULTIPLY_EXT:
-            return "VK_BLEND_OP_MULTIPLY_EXT";
-        case VK_BLEND_OP_SCREEN_EXT:
-            return "VK_BLEND_OP_SCREEN_EXT";
-        case VK_BLEND_OP_OVERLAY_EXT:
-            return "VK_BLEND_OP_OVERLAY_EXT";
-        case VK_BLEND_OP_DARKEN_EXT:
-            return "VK_BLEND_OP_DARKEN_EXT";
-        case VK_BLEND_OP_LIGHTEN_EXT:
-            return "VK_BLEND_OP_LIGHTEN_EXT";
-        case VK_BLEND_OP_COLORDODGE_EXT:
-            return "VK_BLEND_OP_COLORDODGE_EXT";
-        case VK_BLEND_OP_COLORBURN_EXT:
-            return "VK_BLEND_OP_COLORBURN_EXT";
-        case VK_BLEND_OP_HARDLIGHT_EXT:
-            return "VK_BLEND_OP_HARDLIGHT_EXT";
-        case VK_BLEND_OP_SOFTLIGHT_EXT:
-            return "VK_BLEND_OP_SOFTLIGHT_EXT";
-        case VK_BLEND_OP_DIFFERENCE_EXT:
-            return "VK_BLEND_OP_DIFFERENCE_EXT";
-        case VK_BLEND_OP_EXCLUSION_EXT:
-            return "VK_BLEND_OP_EXCLUSION_EXT";
-        case VK_BLEND_OP_INVERT_EXT:
-            return "VK_BLEND_OP_INVERT_EXT";
-        case VK_BLEND_OP_INVERT_RGB_EXT:
-            return "VK_BLEND_OP_INVERT_RGB_EXT";
-        case VK_BLEND_OP_LINEARDODGE_EXT:
-            return "VK_BLEND_OP_LINEARDODGE_EXT";
-        case VK_BLEND_OP_LINEARBURN_EXT:
-            return "VK_BLEND_OP_LINEARBURN_EXT";
-        case VK_BLEND_OP_VIVIDLIGHT_EXT:
-            return "VK_BLEND_OP_VIVIDLIGHT_EXT";
-        case VK_BLEND_OP_LINEARLIGHT_EXT:
-            return "VK_BLEND_OP_LINEARLIGHT_EXT";
-        case VK_BLEND_OP_PINLIGHT_EXT:
-            return "VK_BLEND_OP_PINLIGHT_EXT";
-        case VK_BLEND_OP_HARDMIX_EXT:
-            return "VK_BLEND_OP_HARDMIX_EXT";
-        case VK_BLEND_OP_HSL_HUE_EXT:
-            return "VK_BLEND_OP_HSL_HUE_EXT";
-        case VK_BLEND_OP_HSL_SATURATION_EXT:
-            return "VK_BLEND_OP_HSL_SATURATION_EXT";
-        case VK_BLEND_OP_HSL_COLOR_EXT:
-            return "VK_BLEND_OP_HSL_COLOR_EXT";
-        case VK_BLEND_OP_HSL_LUMINOSITY_EXT:
-            return "VK_BLEND_OP_HSL_LUMINOSITY_EXT";
-        case VK_BLEND_OP_PLUS_EXT:
-            return "VK_BLEND_OP_PLUS_EXT";
-        case VK_BLEND_OP_PLUS_CLAMPED_EXT:
-            return "VK_BLEND_OP_PLUS_CLAMPED_EXT";
-        case VK_BLEND_OP_PLUS_CLAMPED_ALPHA_EXT:
-            return "VK_BLEND_OP_PLUS_CLAMPED_ALPHA_EXT";
-        case VK_BLEND_OP_PLUS_DARKER_EXT:
-            return "VK_BLEND_OP_PLUS_DARKER_EXT";
-        case VK_BLEND_OP_MINUS_EXT:
-            return "VK_BLEND_OP_MINUS_EXT";
-        case VK_BLEND_OP_MINUS_CLAMPED_EXT:
-            return "VK_BLEND_OP_MINUS_CLAMPED_EXT";
-        case VK_BLEND_OP_CONTRAST_EXT:
-            return "VK_BLEND_OP_CONTRAST_EXT";
-        case VK_BLEND_OP_INVERT_OVG_EXT:
-            return "VK_BLEND_OP_INVERT_OVG_EXT";
-        case VK_BLEND_OP_RED_EXT:
-            return "VK_BLEND_OP_RED_EXT";
-        case VK_BLEND_OP_GREEN_EXT:
-            return "VK_BLEND_OP_GREEN_EXT";
-        case VK_BLEND_OP_BLUE_EXT:
-            return "VK_BLEND_OP_BLUE_EXT";
         default:
             return "Unhandled VkBlendOp";
     }
@@ -2860,6 +2507,43 @@ static inline const char* string_VkCompareOp(VkCompareOp input_value) {
     }
 }
 static inline const char* string_VkDynamicState(VkDynamicState input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT",
+        "VK_DYNAMIC_STATE_DEPTH_CLAMP_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_POLYGON_MODE_EXT",
+        "VK_DYNAMIC_STATE_RASTERIZATION_SAMPLES_EXT",
+        "VK_DYNAMIC_STATE_SAMPLE_MASK_EXT",
+        "VK_DYNAMIC_STATE_ALPHA_TO_COVERAGE_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_ALPHA_TO_ONE_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_LOGIC_OP_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_COLOR_BLEND_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_COLOR_BLEND_EQUATION_EXT",
+        "VK_DYNAMIC_STATE_COLOR_WRITE_MASK_EXT",
+        "VK_DYNAMIC_STATE_RASTERIZATION_STREAM_EXT",
+        "VK_DYNAMIC_STATE_CONSERVATIVE_RASTERIZATION_MODE_EXT",
+        "VK_DYNAMIC_STATE_EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT",
+        "VK_DYNAMIC_STATE_DEPTH_CLIP_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_SAMPLE_LOCATIONS_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_COLOR_BLEND_ADVANCED_EXT",
+        "VK_DYNAMIC_STATE_PROVOKING_VERTEX_MODE_EXT",
+        "VK_DYNAMIC_STATE_LINE_RASTERIZATION_MODE_EXT",
+        "VK_DYNAMIC_STATE_LINE_STIPPLE_ENABLE_EXT",
+        "VK_DYNAMIC_STATE_DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT",
+        "VK_DYNAMIC_STATE_VIEWPORT_W_SCALING_ENABLE_NV",
+        "VK_DYNAMIC_STATE_VIEWPORT_SWIZZLE_NV",
+        "VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_ENABLE_NV",
+        "VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_LOCATION_NV",
+        "VK_DYNAMIC_STATE_COVERAGE_MODULATION_MODE_NV",
+        "VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_ENABLE_NV",
+        "VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_NV",
+        "VK_DYNAMIC_STATE_SHADING_RATE_IMAGE_ENABLE_NV",
+        "VK_DYNAMIC_STATE_REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV",
+        "VK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV",
+    };
+    static_assert(std::size(kNames0) == VK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV - VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT + 1);
+    if (input_value >= VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT && input_value <= VK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV) {
+        return kNames0[input_value - VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT];
+    }
     switch (input_value) {
         case VK_DYNAMIC_STATE_VIEWPORT:
             return "VK_DYNAMIC_STATE_VIEWPORT";
@@ -2941,68 +2625,6 @@ static inline const char* string_VkDynamicState(VkDynamicState input_value) {
             return "VK_DYNAMIC_STATE_LOGIC_OP_EXT";
         case VK_DYNAMIC_STATE_COLOR_WRITE_ENABLE_EXT:
             return "VK_DYNAMIC_STATE_COLOR_WRITE_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT:
-            return "VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT";
-        case VK_DYNAMIC_STATE_DEPTH_CLAMP_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_DEPTH_CLAMP_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_POLYGON_MODE_EXT:
-            return "VK_DYNAMIC_STATE_POLYGON_MODE_EXT";
-        case VK_DYNAMIC_STATE_RASTERIZATION_SAMPLES_EXT:
-            return "VK_DYNAMIC_STATE_RASTERIZATION_SAMPLES_EXT";
-        case VK_DYNAMIC_STATE_SAMPLE_MASK_EXT:
-            return "VK_DYNAMIC_STATE_SAMPLE_MASK_EXT";
-        case VK_DYNAMIC_STATE_ALPHA_TO_COVERAGE_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_ALPHA_TO_COVERAGE_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_ALPHA_TO_ONE_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_ALPHA_TO_ONE_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_LOGIC_OP_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_LOGIC_OP_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_COLOR_BLEND_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_COLOR_BLEND_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_COLOR_BLEND_EQUATION_EXT:
-            return "VK_DYNAMIC_STATE_COLOR_BLEND_EQUATION_EXT";
-        case VK_DYNAMIC_STATE_COLOR_WRITE_MASK_EXT:
-            return "VK_DYNAMIC_STATE_COLOR_WRITE_MASK_EXT";
-        case VK_DYNAMIC_STATE_RASTERIZATION_STREAM_EXT:
-            return "VK_DYNAMIC_STATE_RASTERIZATION_STREAM_EXT";
-        case VK_DYNAMIC_STATE_CONSERVATIVE_RASTERIZATION_MODE_EXT:
-            return "VK_DYNAMIC_STATE_CONSERVATIVE_RASTERIZATION_MODE_EXT";
-        case VK_DYNAMIC_STATE_EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT:
-            return "VK_DYNAMIC_STATE_EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT";
-        case VK_DYNAMIC_STATE_DEPTH_CLIP_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_DEPTH_CLIP_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_SAMPLE_LOCATIONS_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_SAMPLE_LOCATIONS_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_COLOR_BLEND_ADVANCED_EXT:
-            return "VK_DYNAMIC_STATE_COLOR_BLEND_ADVANCED_EXT";
-        case VK_DYNAMIC_STATE_PROVOKING_VERTEX_MODE_EXT:
-            return "VK_DYNAMIC_STATE_PROVOKING_VERTEX_MODE_EXT";
-        case VK_DYNAMIC_STATE_LINE_RASTERIZATION_MODE_EXT:
-            return "VK_DYNAMIC_STATE_LINE_RASTERIZATION_MODE_EXT";
-        case VK_DYNAMIC_STATE_LINE_STIPPLE_ENABLE_EXT:
-            return "VK_DYNAMIC_STATE_LINE_STIPPLE_ENABLE_EXT";
-        case VK_DYNAMIC_STATE_DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT:
-            return "VK_DYNAMIC_STATE_DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT";
-        case VK_DYNAMIC_STATE_VIEWPORT_W_SCALING_ENABLE_NV:
-            return "VK_DYNAMIC_STATE_VIEWPORT_W_SCALING_ENABLE_NV";
-        case VK_DYNAMIC_STATE_VIEWPORT_SWIZZLE_NV:
-            return "VK_DYNAMIC_STATE_VIEWPORT_SWIZZLE_NV";
-        case VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_ENABLE_NV:
-            return "VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_ENABLE_NV";
-        case VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_LOCATION_NV:
-            return "VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_LOCATION_NV";
-        case VK_DYNAMIC_STATE_COVERAGE_MODULATION_MODE_NV:
-            return "VK_DYNAMIC_STATE_COVERAGE_MODULATION_MODE_NV";
-        case VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_ENABLE_NV:
-            return "VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_ENABLE_NV";
-        case VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_NV:
-            return "VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_NV";
-        case VK_DYNAMIC_STATE_SHADING_RATE_IMAGE_ENABLE_NV:
-            return "VK_DYNAMIC_STATE_SHADING_RATE_IMAGE_ENABLE_NV";
-        case VK_DYNAMIC_STATE_REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV:
-            return "VK_DYNAMIC_STATE_REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV";
-        case VK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV:
-            return "VK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV";
         case VK_DYNAMIC_STATE_ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT:
             return "VK_DYNAMIC_STATE_ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT";
         default:
@@ -3094,42 +2716,29 @@ static inline const char* string_VkStencilOp(VkStencilOp input_value) {
     }
 }
 static inline const char* string_VkLogicOp(VkLogicOp input_value) {
-    switch (input_value) {
-        case VK_LOGIC_OP_CLEAR:
-            return "VK_LOGIC_OP_CLEAR";
-        case VK_LOGIC_OP_AND:
-            return "VK_LOGIC_OP_AND";
-        case VK_LOGIC_OP_AND_REVERSE:
-            return "VK_LOGIC_OP_AND_REVERSE";
-        case VK_LOGIC_OP_COPY:
-            return "VK_LOGIC_OP_COPY";
-        case VK_LOGIC_OP_AND_INVERTED:
-            return "VK_LOGIC_OP_AND_INVERTED";
-        case VK_LOGIC_OP_NO_OP:
-            return "VK_LOGIC_OP_NO_OP";
-        case VK_LOGIC_OP_XOR:
-            return "VK_LOGIC_OP_XOR";
-        case VK_LOGIC_OP_OR:
-            return "VK_LOGIC_OP_OR";
-        case VK_LOGIC_OP_NOR:
-            return "VK_LOGIC_OP_NOR";
-        case VK_LOGIC_OP_EQUIVALENT:
-            return "VK_LOGIC_OP_EQUIVALENT";
-        case VK_LOGIC_OP_INVERT:
-            return "VK_LOGIC_OP_INVERT";
-        case VK_LOGIC_OP_OR_REVERSE:
-            return "VK_LOGIC_OP_OR_REVERSE";
-        case VK_LOGIC_OP_COPY_INVERTED:
-            return "VK_LOGIC_OP_COPY_INVERTED";
-        case VK_LOGIC_OP_OR_INVERTED:
-            return "VK_LOGIC_OP_OR_INVERTED";
-        case VK_LOGIC_OP_NAND:
-            return "VK_LOGIC_OP_NAND";
-        case VK_LOGIC_OP_SET:
-            return "VK_LOGIC_OP_SET";
-        default:
-            return "Unhandled VkLogicOp";
-    }
+    static constexpr const char* kNames0[] = {
+        "VK_LOGIC_OP_CLEAR",
+        "VK_LOGIC_OP_AND",
+        "VK_LOGIC_OP_AND_REVERSE",
+        "VK_LOGIC_OP_COPY",
+        "VK_LOGIC_OP_AND_INVERTED",
+        "VK_LOGIC_OP_NO_OP",
+        "VK_LOGIC_OP_XOR",
+        "VK_LOGIC_OP_OR",
+        "VK_LOGIC_OP_NOR",
+        "VK_LOGIC_OP_EQUIVALENT",
+        "VK_LOGIC_OP_INVERT",
+        "VK_LOGIC_OP_OR_REVERSE",
+        "VK_LOGIC_OP_COPY_INVERTED",
+        "VK_LOGIC_OP_OR_INVERTED",
+        "VK_LOGIC_OP_NAND",
+        "VK_LOGIC_OP_SET",
+    };
+    static_assert(std::size(kNames0) == VK_LOGIC_OP_SET - VK_LOGIC_OP_CLEAR + 1);
+    if (input_value >= VK_LOGIC_OP_CLEAR && input_value <= VK_LOGIC_OP_SET) {
+        return kNames0[input_value - VK_LOGIC_OP_CLEAR];
+    }
+    return "Unhandled VkLogicOp";
 }
 static inline const char* string_VkBorderColor(VkBorderColor input_value) {
     switch (input_value) {
@@ -3372,60 +2981,38 @@ static inline const char* string_VkDescriptorUpdateTemplateType(VkDescriptorUpda
     }
 }
 static inline const char* string_VkDriverId(VkDriverId input_value) {
-    switch (input_value) {
-        case VK_DRIVER_ID_AMD_PROPRIETARY:
-            return "VK_DRIVER_ID_AMD_PROPRIETARY";
-        case VK_DRIVER_ID_AMD_OPEN_SOURCE:
-            return "VK_DRIVER_ID_AMD_OPEN_SOURCE";
-        case VK_DRIVER_ID_MESA_RADV:
-            return "VK_DRIVER_ID_MESA_RADV";
-        case VK_DRIVER_ID_NVIDIA_PROPRIETARY:
-            return "VK_DRIVER_ID_NVIDIA_PROPRIETARY";
-        case VK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS:
-            return "VK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS";
-        case VK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA:
-            return "VK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA";
-        case VK_DRIVER_ID_IMAGINATION_PROPRIETARY:
-            return "VK_DRIVER_ID_IMAGINATION_PROPRIETARY";
-        case VK_DRIVER_ID_QUALCOMM_PROPRIETARY:
-            return "VK_DRIVER_ID_QUALCOMM_PROPRIETARY";
-        case VK_DRIVER_ID_ARM_PROPRIETARY:
-            return "VK_DRIVER_ID_ARM_PROPRIETARY";
-        case VK_DRIVER_ID_GOOGLE_SWIFTSHADER:
-            return "VK_DRIVER_ID_GOOGLE_SWIFTSHADER";
-        case VK_DRIVER_ID_GGP_PROPRIETARY:
-            return "VK_DRIVER_ID_GGP_PROPRIETARY";
-        case VK_DRIVER_ID_BROADCOM_PROPRIETARY:
-            return "VK_DRIVER_ID_BROADCOM_PROPRIETARY";
-        case VK_DRIVER_ID_MESA_LLVMPIPE:
-            return "VK_DRIVER_ID_MESA_LLVMPIPE";
-        case VK_DRIVER_ID_MOLTENVK:
-            return "VK_DRIVER_ID_MOLTENVK";
-        case VK_DRIVER_ID_COREAVI_PROPRIETARY:
-            return "VK_DRIVER_ID_COREAVI_PROPRIETARY";
-        case VK_DRIVER_ID_JUICE_PROPRIETARY:
-            return "VK_DRIVER_ID_JUICE_PROPRIETARY";
-        case VK_DRIVER_ID_VERISILICON_PROPRIETARY:
-            return "VK_DRIVER_ID_VERISILICON_PROPRIETARY";
-        case VK_DRIVER_ID_MESA_TURNIP:
-            return "VK_DRIVER_ID_MESA_TURNIP";
-        case VK_DRIVER_ID_MESA_V3DV:
-            return "VK_DRIVER_ID_MESA_V3DV";
-        case VK_DRIVER_ID_MESA_PANVK:
-            return "VK_DRIVER_ID_MESA_PANVK";
-        case VK_DRIVER_ID_SAMSUNG_PROPRIETARY:
-            return "VK_DRIVER_ID_SAMSUNG_PROPRIETARY";
-        case VK_DRIVER_ID_MESA_VENUS:
-            return "VK_DRIVER_ID_MESA_VENUS";
-        case VK_DRIVER_ID_MESA_DOZEN:
-            return "VK_DRIVER_ID_MESA_DOZEN";
-        case VK_DRIVER_ID_MESA_NVK:
-            return "VK_DRIVER_ID_MESA_NVK";
-        case VK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA:
-            return "VK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA";
-        default:
-            return "Unhandled VkDriverId";
-    }
+    static constexpr const char* kNames0[] = {
+        "VK_DRIVER_ID_AMD_PROPRIETARY",
+        "VK_DRIVER_ID_AMD_OPEN_SOURCE",
+        "VK_DRIVER_ID_MESA_RADV",
+        "VK_DRIVER_ID_NVIDIA_PROPRIETARY",
+        "VK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS",
+        "VK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA",
+        "VK_DRIVER_ID_IMAGINATION_PROPRIETARY",
+        "VK_DRIVER_ID_QUALCOMM_PROPRIETARY",
+        "VK_DRIVER_ID_ARM_PROPRIETARY",
+        "VK_DRIVER_ID_GOOGLE_SWIFTSHADER",
+        "VK_DRIVER_ID_GGP_PROPRIETARY",
+        "VK_DRIVER_ID_BROADCOM_PROPRIETARY",
+        "VK_DRIVER_ID_MESA_LLVMPIPE",
+        "VK_DRIVER_ID_MOLTENVK",
+        "VK_DRIVER_ID_COREAVI_PROPRIETARY",
+        "VK_DRIVER_ID_JUICE_PROPRIETARY",
+        "VK_DRIVER_ID_VERISILICON_PROPRIETARY",
+        "VK_DRIVER_ID_MESA_TURNIP",
+        "VK_DRIVER_ID_MESA_V3DV",
+        "VK_DRIVER_ID_MESA_PANVK",
+        "VK_DRIVER_ID_SAMSUNG_PROPRIETARY",
+        "VK_DRIVER_ID_MESA_VENUS",
+        "VK_DRIVER_ID_MESA_DOZEN",
+        "VK_DRIVER_ID_MESA_NVK",
+        "VK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA",
+    };
+    static_assert(std::size(kNames0) == VK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA - VK_DRIVER_ID_AMD_PROPRIETARY + 1);
+    if (input_value >= VK_DRIVER_ID_AMD_PROPRIETARY && input_value <= VK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA) {
+        return kNames0[input_value - VK_DRIVER_ID_AMD_PROPRIETARY];
+    }
+    return "Unhandled VkDriverId";
 }
 static inline const char* string_VkShaderFloatControlsIndependence(VkShaderFloatControlsIndependence input_value) {
     switch (input_value) {
@@ -3692,69 +3279,44 @@ static inline const char* string_VkScopeKHR(VkScopeKHR input_value) {
     }
 }
 static inline const char* string_VkDebugReportObjectTypeEXT(VkDebugReportObjectTypeEXT input_value) {
+    static constexpr const char* kNames0[] = {
+        "VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT",
+        "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT",
+    };
+    static_assert(std::size(kNames0) == VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT - VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT + 1);
+    if (input_value >= VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT && input_value <= VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT) {
+        return kNames0[input_value - VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT];
+    }
     switch (input_value) {
-        case VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT";
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT:
-            return "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT";
         case VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT:
             return "VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT";
         case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT:
@@ -4618,6 +4180,69 @@ static inline const char* string_VkShaderGroupShaderKHR(VkShaderGroupShaderKHR i
     }
 }
 
+// Name of a single bit flag, used to build the table of flag names indexed by bit position
+struct StringHelperFlagName {
+    uint64_t value;
+    const char* name;
+};
+
+struct StringHelperFlagNames {
+    const char* names[64];
+};
+
+// Done at compile time, flags with a value of zero have no bit and are skipped
+template <size_t N>
+static constexpr StringHelperFlagNames StringHelperBuildFlagNames(const StringHelperFlagName (&flags)[N]) {
+    StringHelperFlagNames table{};
+    for (size_t i = 0; i < N; ++i) {
+        if (flags[i].value == 0) continue;
+        uint32_t index = 0;
+        while (((flags[i].value >> index) & 1) == 0) ++index;
+        table.names[index] = flags[i].name;
+    }
+    return table;
+}
+
+// Index of the lowest set bit, value must not be zero
+static inline uint32_t StringHelperLeastSignificantBit(uint64_t value) {
+#if defined(__GNUC__)
+    return static_cast<uint32_t>(__builtin_ctzll(value));
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_ARM64))
+    unsigned long index;
+    _BitScanForward64(&index, value);
+    return static_cast<uint32_t>(index);
+#else
+    uint32_t index = 0;
+    while ((value & 1) == 0) {
+        value >>= 1;
+        ++index;
+    }
+    return index;
+#endif
+}
+
+// Only visits the set bits, and sizes the string up front so it is allocated once
+static inline std::string StringHelperFlagsToString(uint64_t input_value, const StringHelperFlagNames& table, const char* unhandled,
+                                                    const char* empty) {
+    size_t length = 0;
+    for (uint64_t bits = input_value; bits != 0; bits &= bits - 1) {
+        const char* name = table.names[StringHelperLeastSignificantBit(bits)];
+        length += std::char_traits<char>::length(name ? name : unhandled) + 1;
+    }
+    std::string ret;
+    if (length == 0) {
+        ret.append(empty);
+        return ret;
+    }
+    ret.reserve(length - 1);
+    for (uint64_t bits = input_value; bits != 0; bits &= bits - 1) {
+        const char* name = table.names[StringHelperLeastSignificantBit(bits)];
+        if (!ret.empty()) ret.push_back('|');
+        ret.append(name ? name : unhandled);
+    }
+    return ret;
+}
+
 static inline const char* string_VkAccessFlagBits(VkAccessFlagBits input_value) {
     switch (input_value) {
         case VK_ACCESS_INDIRECT_COMMAND_READ_BIT:
@@ -4684,18 +4309,39 @@ static inline const char* string_VkAccessFlagBits(VkAccessFlagBits input_value)
 }
 
 static inline std::string string_VkAccessFlags(VkAccessFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkAccessFlagBits(static_cast<VkAccessFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkAccessFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_ACCESS_INDIRECT_COMMAND_READ_BIT, "VK_ACCESS_INDIRECT_COMMAND_READ_BIT"},
+        {VK_ACCESS_INDEX_READ_BIT, "VK_ACCESS_INDEX_READ_BIT"},
+        {VK_ACCESS_VERTEX_ATTRIBUTE_READ_BIT, "VK_ACCESS_VERTEX_ATTRIBUTE_READ_BIT"},
+        {VK_ACCESS_UNIFORM_READ_BIT, "VK_ACCESS_UNIFORM_READ_BIT"},
+        {VK_ACCESS_INPUT_ATTACHMENT_READ_BIT, "VK_ACCESS_INPUT_ATTACHMENT_READ_BIT"},
+        {VK_ACCESS_SHADER_READ_BIT, "VK_ACCESS_SHADER_READ_BIT"},
+        {VK_ACCESS_SHADER_WRITE_BIT, "VK_ACCESS_SHADER_WRITE_BIT"},
+        {VK_ACCESS_COLOR_ATTACHMENT_READ_BIT, "VK_ACCESS_COLOR_ATTACHMENT_READ_BIT"},
+        {VK_ACCESS_COLOR_ATTACHMENT_WRITE_BIT, "VK_ACCESS_COLOR_ATTACHMENT_WRITE_BIT"},
+        {VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_READ_BIT, "VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_READ_BIT"},
+        {VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT, "VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT"},
+        {VK_ACCESS_TRANSFER_READ_BIT, "VK_ACCESS_TRANSFER_READ_BIT"},
+        {VK_ACCESS_TRANSFER_WRITE_BIT, "VK_ACCESS_TRANSFER_WRITE_BIT"},
+        {VK_ACCESS_HOST_READ_BIT, "VK_ACCESS_HOST_READ_BIT"},
+        {VK_ACCESS_HOST_WRITE_BIT, "VK_ACCESS_HOST_WRITE_BIT"},
+        {VK_ACCESS_MEMORY_READ_BIT, "VK_ACCESS_MEMORY_READ_BIT"},
+        {VK_ACCESS_MEMORY_WRITE_BIT, "VK_ACCESS_MEMORY_WRITE_BIT"},
+        {VK_ACCESS_NONE, "VK_ACCESS_NONE"},
+        {VK_ACCESS_TRANSFORM_FEEDBACK_WRITE_BIT_EXT, "VK_ACCESS_TRANSFORM_FEEDBACK_WRITE_BIT_EXT"},
+        {VK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT, "VK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT"},
+        {VK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT, "VK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT"},
+        {VK_ACCESS_CONDITIONAL_RENDERING_READ_BIT_EXT, "VK_ACCESS_CONDITIONAL_RENDERING_READ_BIT_EXT"},
+        {VK_ACCESS_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT, "VK_ACCESS_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT"},
+        {VK_ACCESS_ACCELERATION_STRUCTURE_READ_BIT_KHR, "VK_ACCESS_ACCELERATION_STRUCTURE_READ_BIT_KHR"},
+        {VK_ACCESS_ACCELERATION_STRUCTURE_WRITE_BIT_KHR, "VK_ACCESS_ACCELERATION_STRUCTURE_WRITE_BIT_KHR"},
+        {VK_ACCESS_FRAGMENT_DENSITY_MAP_READ_BIT_EXT, "VK_ACCESS_FRAGMENT_DENSITY_MAP_READ_BIT_EXT"},
+        {VK_ACCESS_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR, "VK_ACCESS_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR"},
+        {VK_ACCESS_COMMAND_PREPROCESS_READ_BIT_NV, "VK_ACCESS_COMMAND_PREPROCESS_READ_BIT_NV"},
+        {VK_ACCESS_COMMAND_PREPROCESS_WRITE_BIT_NV, "VK_ACCESS_COMMAND_PREPROCESS_WRITE_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkAccessFlagBits", "VkAccessFlags(0)");
 }
 static inline const char* string_VkImageAspectFlagBits(VkImageAspectFlagBits input_value) {
     switch (input_value) {
@@ -4729,18 +4375,22 @@ static inline const char* string_VkImageAspectFlagBits(VkImageAspectFlagBits inp
 }
 
 static inline std::string string_VkImageAspectFlags(VkImageAspectFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageAspectFlagBits(static_cast<VkImageAspectFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageAspectFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_ASPECT_COLOR_BIT, "VK_IMAGE_ASPECT_COLOR_BIT"},
+        {VK_IMAGE_ASPECT_DEPTH_BIT, "VK_IMAGE_ASPECT_DEPTH_BIT"},
+        {VK_IMAGE_ASPECT_STENCIL_BIT, "VK_IMAGE_ASPECT_STENCIL_BIT"},
+        {VK_IMAGE_ASPECT_METADATA_BIT, "VK_IMAGE_ASPECT_METADATA_BIT"},
+        {VK_IMAGE_ASPECT_PLANE_0_BIT, "VK_IMAGE_ASPECT_PLANE_0_BIT"},
+        {VK_IMAGE_ASPECT_PLANE_1_BIT, "VK_IMAGE_ASPECT_PLANE_1_BIT"},
+        {VK_IMAGE_ASPECT_PLANE_2_BIT, "VK_IMAGE_ASPECT_PLANE_2_BIT"},
+        {VK_IMAGE_ASPECT_NONE, "VK_IMAGE_ASPECT_NONE"},
+        {VK_IMAGE_ASPECT_MEMORY_PLANE_0_BIT_EXT, "VK_IMAGE_ASPECT_MEMORY_PLANE_0_BIT_EXT"},
+        {VK_IMAGE_ASPECT_MEMORY_PLANE_1_BIT_EXT, "VK_IMAGE_ASPECT_MEMORY_PLANE_1_BIT_EXT"},
+        {VK_IMAGE_ASPECT_MEMORY_PLANE_2_BIT_EXT, "VK_IMAGE_ASPECT_MEMORY_PLANE_2_BIT_EXT"},
+        {VK_IMAGE_ASPECT_MEMORY_PLANE_3_BIT_EXT, "VK_IMAGE_ASPECT_MEMORY_PLANE_3_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageAspectFlagBits", "VkImageAspectFlags(0)");
 }
 static inline const char* string_VkFormatFeatureFlagBits(VkFormatFeatureFlagBits input_value) {
     switch (input_value) {
@@ -4816,18 +4466,45 @@ static inline const char* string_VkFormatFeatureFlagBits(VkFormatFeatureFlagBits
 }
 
 static inline std::string string_VkFormatFeatureFlags(VkFormatFeatureFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkFormatFeatureFlagBits(static_cast<VkFormatFeatureFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkFormatFeatureFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT"},
+        {VK_FORMAT_FEATURE_STORAGE_IMAGE_BIT, "VK_FORMAT_FEATURE_STORAGE_IMAGE_BIT"},
+        {VK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT, "VK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT"},
+        {VK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT, "VK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT"},
+        {VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT, "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT"},
+        {VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT, "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT"},
+        {VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT, "VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT"},
+        {VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT, "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT"},
+        {VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT, "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT"},
+        {VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT, "VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT"},
+        {VK_FORMAT_FEATURE_BLIT_SRC_BIT, "VK_FORMAT_FEATURE_BLIT_SRC_BIT"},
+        {VK_FORMAT_FEATURE_BLIT_DST_BIT, "VK_FORMAT_FEATURE_BLIT_DST_BIT"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT"},
+        {VK_FORMAT_FEATURE_TRANSFER_SRC_BIT, "VK_FORMAT_FEATURE_TRANSFER_SRC_BIT"},
+        {VK_FORMAT_FEATURE_TRANSFER_DST_BIT, "VK_FORMAT_FEATURE_TRANSFER_DST_BIT"},
+        {VK_FORMAT_FEATURE_MIDPOINT_CHROMA_SAMPLES_BIT, "VK_FORMAT_FEATURE_MIDPOINT_CHROMA_SAMPLES_BIT"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT"},
+        {VK_FORMAT_FEATURE_DISJOINT_BIT, "VK_FORMAT_FEATURE_DISJOINT_BIT"},
+        {VK_FORMAT_FEATURE_COSITED_CHROMA_SAMPLES_BIT, "VK_FORMAT_FEATURE_COSITED_CHROMA_SAMPLES_BIT"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_MINMAX_BIT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_MINMAX_BIT"},
+        {VK_FORMAT_FEATURE_VIDEO_DECODE_OUTPUT_BIT_KHR, "VK_FORMAT_FEATURE_VIDEO_DECODE_OUTPUT_BIT_KHR"},
+        {VK_FORMAT_FEATURE_VIDEO_DECODE_DPB_BIT_KHR, "VK_FORMAT_FEATURE_VIDEO_DECODE_DPB_BIT_KHR"},
+        {VK_FORMAT_FEATURE_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR, "VK_FORMAT_FEATURE_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR"},
+        {VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_CUBIC_BIT_EXT, "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_CUBIC_BIT_EXT"},
+        {VK_FORMAT_FEATURE_FRAGMENT_DENSITY_MAP_BIT_EXT, "VK_FORMAT_FEATURE_FRAGMENT_DENSITY_MAP_BIT_EXT"},
+        {VK_FORMAT_FEATURE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, "VK_FORMAT_FEATURE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_FORMAT_FEATURE_VIDEO_ENCODE_INPUT_BIT_KHR, "VK_FORMAT_FEATURE_VIDEO_ENCODE_INPUT_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_FORMAT_FEATURE_VIDEO_ENCODE_DPB_BIT_KHR, "VK_FORMAT_FEATURE_VIDEO_ENCODE_DPB_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkFormatFeatureFlagBits", "VkFormatFeatureFlags(0)");
 }
 static inline const char* string_VkImageCreateFlagBits(VkImageCreateFlagBits input_value) {
     switch (input_value) {
@@ -4875,18 +4552,29 @@ static inline const char* string_VkImageCreateFlagBits(VkImageCreateFlagBits inp
 }
 
 static inline std::string string_VkImageCreateFlags(VkImageCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageCreateFlagBits(static_cast<VkImageCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_CREATE_SPARSE_BINDING_BIT, "VK_IMAGE_CREATE_SPARSE_BINDING_BIT"},
+        {VK_IMAGE_CREATE_SPARSE_RESIDENCY_BIT, "VK_IMAGE_CREATE_SPARSE_RESIDENCY_BIT"},
+        {VK_IMAGE_CREATE_SPARSE_ALIASED_BIT, "VK_IMAGE_CREATE_SPARSE_ALIASED_BIT"},
+        {VK_IMAGE_CREATE_MUTABLE_FORMAT_BIT, "VK_IMAGE_CREATE_MUTABLE_FORMAT_BIT"},
+        {VK_IMAGE_CREATE_CUBE_COMPATIBLE_BIT, "VK_IMAGE_CREATE_CUBE_COMPATIBLE_BIT"},
+        {VK_IMAGE_CREATE_ALIAS_BIT, "VK_IMAGE_CREATE_ALIAS_BIT"},
+        {VK_IMAGE_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT, "VK_IMAGE_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT"},
+        {VK_IMAGE_CREATE_2D_ARRAY_COMPATIBLE_BIT, "VK_IMAGE_CREATE_2D_ARRAY_COMPATIBLE_BIT"},
+        {VK_IMAGE_CREATE_BLOCK_TEXEL_VIEW_COMPATIBLE_BIT, "VK_IMAGE_CREATE_BLOCK_TEXEL_VIEW_COMPATIBLE_BIT"},
+        {VK_IMAGE_CREATE_EXTENDED_USAGE_BIT, "VK_IMAGE_CREATE_EXTENDED_USAGE_BIT"},
+        {VK_IMAGE_CREATE_PROTECTED_BIT, "VK_IMAGE_CREATE_PROTECTED_BIT"},
+        {VK_IMAGE_CREATE_DISJOINT_BIT, "VK_IMAGE_CREATE_DISJOINT_BIT"},
+        {VK_IMAGE_CREATE_CORNER_SAMPLED_BIT_NV, "VK_IMAGE_CREATE_CORNER_SAMPLED_BIT_NV"},
+        {VK_IMAGE_CREATE_SAMPLE_LOCATIONS_COMPATIBLE_DEPTH_BIT_EXT, "VK_IMAGE_CREATE_SAMPLE_LOCATIONS_COMPATIBLE_DEPTH_BIT_EXT"},
+        {VK_IMAGE_CREATE_SUBSAMPLED_BIT_EXT, "VK_IMAGE_CREATE_SUBSAMPLED_BIT_EXT"},
+        {VK_IMAGE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT, "VK_IMAGE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT"},
+        {VK_IMAGE_CREATE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT, "VK_IMAGE_CREATE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT"},
+        {VK_IMAGE_CREATE_2D_VIEW_COMPATIBLE_BIT_EXT, "VK_IMAGE_CREATE_2D_VIEW_COMPATIBLE_BIT_EXT"},
+        {VK_IMAGE_CREATE_FRAGMENT_DENSITY_MAP_OFFSET_BIT_QCOM, "VK_IMAGE_CREATE_FRAGMENT_DENSITY_MAP_OFFSET_BIT_QCOM"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageCreateFlagBits", "VkImageCreateFlags(0)");
 }
 static inline const char* string_VkSampleCountFlagBits(VkSampleCountFlagBits input_value) {
     switch (input_value) {
@@ -4910,18 +4598,17 @@ static inline const char* string_VkSampleCountFlagBits(VkSampleCountFlagBits inp
 }
 
 static inline std::string string_VkSampleCountFlags(VkSampleCountFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSampleCountFlagBits(static_cast<VkSampleCountFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSampleCountFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SAMPLE_COUNT_1_BIT, "VK_SAMPLE_COUNT_1_BIT"},
+        {VK_SAMPLE_COUNT_2_BIT, "VK_SAMPLE_COUNT_2_BIT"},
+        {VK_SAMPLE_COUNT_4_BIT, "VK_SAMPLE_COUNT_4_BIT"},
+        {VK_SAMPLE_COUNT_8_BIT, "VK_SAMPLE_COUNT_8_BIT"},
+        {VK_SAMPLE_COUNT_16_BIT, "VK_SAMPLE_COUNT_16_BIT"},
+        {VK_SAMPLE_COUNT_32_BIT, "VK_SAMPLE_COUNT_32_BIT"},
+        {VK_SAMPLE_COUNT_64_BIT, "VK_SAMPLE_COUNT_64_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSampleCountFlagBits", "VkSampleCountFlags(0)");
 }
 static inline const char* string_VkImageUsageFlagBits(VkImageUsageFlagBits input_value) {
     switch (input_value) {
@@ -4977,18 +4664,36 @@ static inline const char* string_VkImageUsageFlagBits(VkImageUsageFlagBits input
 }
 
 static inline std::string string_VkImageUsageFlags(VkImageUsageFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageUsageFlagBits(static_cast<VkImageUsageFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageUsageFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_USAGE_TRANSFER_SRC_BIT, "VK_IMAGE_USAGE_TRANSFER_SRC_BIT"},
+        {VK_IMAGE_USAGE_TRANSFER_DST_BIT, "VK_IMAGE_USAGE_TRANSFER_DST_BIT"},
+        {VK_IMAGE_USAGE_SAMPLED_BIT, "VK_IMAGE_USAGE_SAMPLED_BIT"},
+        {VK_IMAGE_USAGE_STORAGE_BIT, "VK_IMAGE_USAGE_STORAGE_BIT"},
+        {VK_IMAGE_USAGE_COLOR_ATTACHMENT_BIT, "VK_IMAGE_USAGE_COLOR_ATTACHMENT_BIT"},
+        {VK_IMAGE_USAGE_DEPTH_STENCIL_ATTACHMENT_BIT, "VK_IMAGE_USAGE_DEPTH_STENCIL_ATTACHMENT_BIT"},
+        {VK_IMAGE_USAGE_TRANSIENT_ATTACHMENT_BIT, "VK_IMAGE_USAGE_TRANSIENT_ATTACHMENT_BIT"},
+        {VK_IMAGE_USAGE_INPUT_ATTACHMENT_BIT, "VK_IMAGE_USAGE_INPUT_ATTACHMENT_BIT"},
+        {VK_IMAGE_USAGE_VIDEO_DECODE_DST_BIT_KHR, "VK_IMAGE_USAGE_VIDEO_DECODE_DST_BIT_KHR"},
+        {VK_IMAGE_USAGE_VIDEO_DECODE_SRC_BIT_KHR, "VK_IMAGE_USAGE_VIDEO_DECODE_SRC_BIT_KHR"},
+        {VK_IMAGE_USAGE_VIDEO_DECODE_DPB_BIT_KHR, "VK_IMAGE_USAGE_VIDEO_DECODE_DPB_BIT_KHR"},
+        {VK_IMAGE_USAGE_FRAGMENT_DENSITY_MAP_BIT_EXT, "VK_IMAGE_USAGE_FRAGMENT_DENSITY_MAP_BIT_EXT"},
+        {VK_IMAGE_USAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, "VK_IMAGE_USAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_IMAGE_USAGE_VIDEO_ENCODE_DST_BIT_KHR, "VK_IMAGE_USAGE_VIDEO_ENCODE_DST_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_IMAGE_USAGE_VIDEO_ENCODE_SRC_BIT_KHR, "VK_IMAGE_USAGE_VIDEO_ENCODE_SRC_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_IMAGE_USAGE_VIDEO_ENCODE_DPB_BIT_KHR, "VK_IMAGE_USAGE_VIDEO_ENCODE_DPB_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_IMAGE_USAGE_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT, "VK_IMAGE_USAGE_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT"},
+        {VK_IMAGE_USAGE_INVOCATION_MASK_BIT_HUAWEI, "VK_IMAGE_USAGE_INVOCATION_MASK_BIT_HUAWEI"},
+        {VK_IMAGE_USAGE_SAMPLE_WEIGHT_BIT_QCOM, "VK_IMAGE_USAGE_SAMPLE_WEIGHT_BIT_QCOM"},
+        {VK_IMAGE_USAGE_SAMPLE_BLOCK_MATCH_BIT_QCOM, "VK_IMAGE_USAGE_SAMPLE_BLOCK_MATCH_BIT_QCOM"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageUsageFlagBits", "VkImageUsageFlags(0)");
 }
 static inline const char* string_VkInstanceCreateFlagBits(VkInstanceCreateFlagBits input_value) {
     switch (input_value) {
@@ -5000,18 +4705,11 @@ static inline const char* string_VkInstanceCreateFlagBits(VkInstanceCreateFlagBi
 }
 
 static inline std::string string_VkInstanceCreateFlags(VkInstanceCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkInstanceCreateFlagBits(static_cast<VkInstanceCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkInstanceCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_INSTANCE_CREATE_ENUMERATE_PORTABILITY_BIT_KHR, "VK_INSTANCE_CREATE_ENUMERATE_PORTABILITY_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkInstanceCreateFlagBits", "VkInstanceCreateFlags(0)");
 }
 static inline const char* string_VkMemoryHeapFlagBits(VkMemoryHeapFlagBits input_value) {
     switch (input_value) {
@@ -5025,18 +4723,12 @@ static inline const char* string_VkMemoryHeapFlagBits(VkMemoryHeapFlagBits input
 }
 
 static inline std::string string_VkMemoryHeapFlags(VkMemoryHeapFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkMemoryHeapFlagBits(static_cast<VkMemoryHeapFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkMemoryHeapFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_MEMORY_HEAP_DEVICE_LOCAL_BIT, "VK_MEMORY_HEAP_DEVICE_LOCAL_BIT"},
+        {VK_MEMORY_HEAP_MULTI_INSTANCE_BIT, "VK_MEMORY_HEAP_MULTI_INSTANCE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkMemoryHeapFlagBits", "VkMemoryHeapFlags(0)");
 }
 static inline const char* string_VkMemoryPropertyFlagBits(VkMemoryPropertyFlagBits input_value) {
     switch (input_value) {
@@ -5064,18 +4756,19 @@ static inline const char* string_VkMemoryPropertyFlagBits(VkMemoryPropertyFlagBi
 }
 
 static inline std::string string_VkMemoryPropertyFlags(VkMemoryPropertyFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkMemoryPropertyFlagBits(static_cast<VkMemoryPropertyFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkMemoryPropertyFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT, "VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT"},
+        {VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT, "VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT"},
+        {VK_MEMORY_PROPERTY_HOST_COHERENT_BIT, "VK_MEMORY_PROPERTY_HOST_COHERENT_BIT"},
+        {VK_MEMORY_PROPERTY_HOST_CACHED_BIT, "VK_MEMORY_PROPERTY_HOST_CACHED_BIT"},
+        {VK_MEMORY_PROPERTY_LAZILY_ALLOCATED_BIT, "VK_MEMORY_PROPERTY_LAZILY_ALLOCATED_BIT"},
+        {VK_MEMORY_PROPERTY_PROTECTED_BIT, "VK_MEMORY_PROPERTY_PROTECTED_BIT"},
+        {VK_MEMORY_PROPERTY_DEVICE_COHERENT_BIT_AMD, "VK_MEMORY_PROPERTY_DEVICE_COHERENT_BIT_AMD"},
+        {VK_MEMORY_PROPERTY_DEVICE_UNCACHED_BIT_AMD, "VK_MEMORY_PROPERTY_DEVICE_UNCACHED_BIT_AMD"},
+        {VK_MEMORY_PROPERTY_RDMA_CAPABLE_BIT_NV, "VK_MEMORY_PROPERTY_RDMA_CAPABLE_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkMemoryPropertyFlagBits", "VkMemoryPropertyFlags(0)");
 }
 static inline const char* string_VkQueueFlagBits(VkQueueFlagBits input_value) {
     switch (input_value) {
@@ -5103,18 +4796,20 @@ static inline const char* string_VkQueueFlagBits(VkQueueFlagBits input_value) {
 }
 
 static inline std::string string_VkQueueFlags(VkQueueFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkQueueFlagBits(static_cast<VkQueueFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkQueueFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_QUEUE_GRAPHICS_BIT, "VK_QUEUE_GRAPHICS_BIT"},
+        {VK_QUEUE_COMPUTE_BIT, "VK_QUEUE_COMPUTE_BIT"},
+        {VK_QUEUE_TRANSFER_BIT, "VK_QUEUE_TRANSFER_BIT"},
+        {VK_QUEUE_SPARSE_BINDING_BIT, "VK_QUEUE_SPARSE_BINDING_BIT"},
+        {VK_QUEUE_PROTECTED_BIT, "VK_QUEUE_PROTECTED_BIT"},
+        {VK_QUEUE_VIDEO_DECODE_BIT_KHR, "VK_QUEUE_VIDEO_DECODE_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_QUEUE_VIDEO_ENCODE_BIT_KHR, "VK_QUEUE_VIDEO_ENCODE_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_QUEUE_OPTICAL_FLOW_BIT_NV, "VK_QUEUE_OPTICAL_FLOW_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkQueueFlagBits", "VkQueueFlags(0)");
 }
 static inline const char* string_VkDeviceQueueCreateFlagBits(VkDeviceQueueCreateFlagBits input_value) {
     switch (input_value) {
@@ -5126,18 +4821,11 @@ static inline const char* string_VkDeviceQueueCreateFlagBits(VkDeviceQueueCreate
 }
 
 static inline std::string string_VkDeviceQueueCreateFlags(VkDeviceQueueCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDeviceQueueCreateFlagBits(static_cast<VkDeviceQueueCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDeviceQueueCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEVICE_QUEUE_CREATE_PROTECTED_BIT, "VK_DEVICE_QUEUE_CREATE_PROTECTED_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDeviceQueueCreateFlagBits", "VkDeviceQueueCreateFlags(0)");
 }
 static inline const char* string_VkPipelineStageFlagBits(VkPipelineStageFlagBits input_value) {
     switch (input_value) {
@@ -5201,18 +4889,37 @@ static inline const char* string_VkPipelineStageFlagBits(VkPipelineStageFlagBits
 }
 
 static inline std::string string_VkPipelineStageFlags(VkPipelineStageFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineStageFlagBits(static_cast<VkPipelineStageFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineStageFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT, "VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT"},
+        {VK_PIPELINE_STAGE_DRAW_INDIRECT_BIT, "VK_PIPELINE_STAGE_DRAW_INDIRECT_BIT"},
+        {VK_PIPELINE_STAGE_VERTEX_INPUT_BIT, "VK_PIPELINE_STAGE_VERTEX_INPUT_BIT"},
+        {VK_PIPELINE_STAGE_VERTEX_SHADER_BIT, "VK_PIPELINE_STAGE_VERTEX_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_TESSELLATION_CONTROL_SHADER_BIT, "VK_PIPELINE_STAGE_TESSELLATION_CONTROL_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_TESSELLATION_EVALUATION_SHADER_BIT, "VK_PIPELINE_STAGE_TESSELLATION_EVALUATION_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_GEOMETRY_SHADER_BIT, "VK_PIPELINE_STAGE_GEOMETRY_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_FRAGMENT_SHADER_BIT, "VK_PIPELINE_STAGE_FRAGMENT_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT, "VK_PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT"},
+        {VK_PIPELINE_STAGE_LATE_FRAGMENT_TESTS_BIT, "VK_PIPELINE_STAGE_LATE_FRAGMENT_TESTS_BIT"},
+        {VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT, "VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT"},
+        {VK_PIPELINE_STAGE_COMPUTE_SHADER_BIT, "VK_PIPELINE_STAGE_COMPUTE_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_TRANSFER_BIT, "VK_PIPELINE_STAGE_TRANSFER_BIT"},
+        {VK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT, "VK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT"},
+        {VK_PIPELINE_STAGE_HOST_BIT, "VK_PIPELINE_STAGE_HOST_BIT"},
+        {VK_PIPELINE_STAGE_ALL_GRAPHICS_BIT, "VK_PIPELINE_STAGE_ALL_GRAPHICS_BIT"},
+        {VK_PIPELINE_STAGE_ALL_COMMANDS_BIT, "VK_PIPELINE_STAGE_ALL_COMMANDS_BIT"},
+        {VK_PIPELINE_STAGE_NONE, "VK_PIPELINE_STAGE_NONE"},
+        {VK_PIPELINE_STAGE_TRANSFORM_FEEDBACK_BIT_EXT, "VK_PIPELINE_STAGE_TRANSFORM_FEEDBACK_BIT_EXT"},
+        {VK_PIPELINE_STAGE_CONDITIONAL_RENDERING_BIT_EXT, "VK_PIPELINE_STAGE_CONDITIONAL_RENDERING_BIT_EXT"},
+        {VK_PIPELINE_STAGE_ACCELERATION_STRUCTURE_BUILD_BIT_KHR, "VK_PIPELINE_STAGE_ACCELERATION_STRUCTURE_BUILD_BIT_KHR"},
+        {VK_PIPELINE_STAGE_RAY_TRACING_SHADER_BIT_KHR, "VK_PIPELINE_STAGE_RAY_TRACING_SHADER_BIT_KHR"},
+        {VK_PIPELINE_STAGE_FRAGMENT_DENSITY_PROCESS_BIT_EXT, "VK_PIPELINE_STAGE_FRAGMENT_DENSITY_PROCESS_BIT_EXT"},
+        {VK_PIPELINE_STAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, "VK_PIPELINE_STAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR"},
+        {VK_PIPELINE_STAGE_COMMAND_PREPROCESS_BIT_NV, "VK_PIPELINE_STAGE_COMMAND_PREPROCESS_BIT_NV"},
+        {VK_PIPELINE_STAGE_TASK_SHADER_BIT_EXT, "VK_PIPELINE_STAGE_TASK_SHADER_BIT_EXT"},
+        {VK_PIPELINE_STAGE_MESH_SHADER_BIT_EXT, "VK_PIPELINE_STAGE_MESH_SHADER_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineStageFlagBits", "VkPipelineStageFlags(0)");
 }
 static inline const char* string_VkSparseMemoryBindFlagBits(VkSparseMemoryBindFlagBits input_value) {
     switch (input_value) {
@@ -5224,18 +4931,11 @@ static inline const char* string_VkSparseMemoryBindFlagBits(VkSparseMemoryBindFl
 }
 
 static inline std::string string_VkSparseMemoryBindFlags(VkSparseMemoryBindFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSparseMemoryBindFlagBits(static_cast<VkSparseMemoryBindFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSparseMemoryBindFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SPARSE_MEMORY_BIND_METADATA_BIT, "VK_SPARSE_MEMORY_BIND_METADATA_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSparseMemoryBindFlagBits", "VkSparseMemoryBindFlags(0)");
 }
 static inline const char* string_VkSparseImageFormatFlagBits(VkSparseImageFormatFlagBits input_value) {
     switch (input_value) {
@@ -5251,18 +4951,13 @@ static inline const char* string_VkSparseImageFormatFlagBits(VkSparseImageFormat
 }
 
 static inline std::string string_VkSparseImageFormatFlags(VkSparseImageFormatFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSparseImageFormatFlagBits(static_cast<VkSparseImageFormatFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSparseImageFormatFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SPARSE_IMAGE_FORMAT_SINGLE_MIPTAIL_BIT, "VK_SPARSE_IMAGE_FORMAT_SINGLE_MIPTAIL_BIT"},
+        {VK_SPARSE_IMAGE_FORMAT_ALIGNED_MIP_SIZE_BIT, "VK_SPARSE_IMAGE_FORMAT_ALIGNED_MIP_SIZE_BIT"},
+        {VK_SPARSE_IMAGE_FORMAT_NONSTANDARD_BLOCK_SIZE_BIT, "VK_SPARSE_IMAGE_FORMAT_NONSTANDARD_BLOCK_SIZE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSparseImageFormatFlagBits", "VkSparseImageFormatFlags(0)");
 }
 static inline const char* string_VkFenceCreateFlagBits(VkFenceCreateFlagBits input_value) {
     switch (input_value) {
@@ -5274,18 +4969,11 @@ static inline const char* string_VkFenceCreateFlagBits(VkFenceCreateFlagBits inp
 }
 
 static inline std::string string_VkFenceCreateFlags(VkFenceCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkFenceCreateFlagBits(static_cast<VkFenceCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkFenceCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_FENCE_CREATE_SIGNALED_BIT, "VK_FENCE_CREATE_SIGNALED_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkFenceCreateFlagBits", "VkFenceCreateFlags(0)");
 }
 static inline const char* string_VkEventCreateFlagBits(VkEventCreateFlagBits input_value) {
     switch (input_value) {
@@ -5297,18 +4985,11 @@ static inline const char* string_VkEventCreateFlagBits(VkEventCreateFlagBits inp
 }
 
 static inline std::string string_VkEventCreateFlags(VkEventCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkEventCreateFlagBits(static_cast<VkEventCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkEventCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EVENT_CREATE_DEVICE_ONLY_BIT, "VK_EVENT_CREATE_DEVICE_ONLY_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkEventCreateFlagBits", "VkEventCreateFlags(0)");
 }
 static inline const char* string_VkQueryPipelineStatisticFlagBits(VkQueryPipelineStatisticFlagBits input_value) {
     switch (input_value) {
@@ -5346,18 +5027,24 @@ static inline const char* string_VkQueryPipelineStatisticFlagBits(VkQueryPipelin
 }
 
 static inline std::string string_VkQueryPipelineStatisticFlags(VkQueryPipelineStatisticFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkQueryPipelineStatisticFlagBits(static_cast<VkQueryPipelineStatisticFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkQueryPipelineStatisticFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_VERTICES_BIT, "VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_VERTICES_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_PRIMITIVES_BIT, "VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_PRIMITIVES_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_VERTEX_SHADER_INVOCATIONS_BIT, "VK_QUERY_PIPELINE_STATISTIC_VERTEX_SHADER_INVOCATIONS_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_INVOCATIONS_BIT, "VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_INVOCATIONS_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_PRIMITIVES_BIT, "VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_PRIMITIVES_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_CLIPPING_INVOCATIONS_BIT, "VK_QUERY_PIPELINE_STATISTIC_CLIPPING_INVOCATIONS_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_CLIPPING_PRIMITIVES_BIT, "VK_QUERY_PIPELINE_STATISTIC_CLIPPING_PRIMITIVES_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_FRAGMENT_SHADER_INVOCATIONS_BIT, "VK_QUERY_PIPELINE_STATISTIC_FRAGMENT_SHADER_INVOCATIONS_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_CONTROL_SHADER_PATCHES_BIT, "VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_CONTROL_SHADER_PATCHES_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_EVALUATION_SHADER_INVOCATIONS_BIT, "VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_EVALUATION_SHADER_INVOCATIONS_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_COMPUTE_SHADER_INVOCATIONS_BIT, "VK_QUERY_PIPELINE_STATISTIC_COMPUTE_SHADER_INVOCATIONS_BIT"},
+        {VK_QUERY_PIPELINE_STATISTIC_TASK_SHADER_INVOCATIONS_BIT_EXT, "VK_QUERY_PIPELINE_STATISTIC_TASK_SHADER_INVOCATIONS_BIT_EXT"},
+        {VK_QUERY_PIPELINE_STATISTIC_MESH_SHADER_INVOCATIONS_BIT_EXT, "VK_QUERY_PIPELINE_STATISTIC_MESH_SHADER_INVOCATIONS_BIT_EXT"},
+        {VK_QUERY_PIPELINE_STATISTIC_CLUSTER_CULLING_SHADER_INVOCATIONS_BIT_HUAWEI, "VK_QUERY_PIPELINE_STATISTIC_CLUSTER_CULLING_SHADER_INVOCATIONS_BIT_HUAWEI"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkQueryPipelineStatisticFlagBits", "VkQueryPipelineStatisticFlags(0)");
 }
 static inline const char* string_VkQueryResultFlagBits(VkQueryResultFlagBits input_value) {
     switch (input_value) {
@@ -5377,18 +5064,15 @@ static inline const char* string_VkQueryResultFlagBits(VkQueryResultFlagBits inp
 }
 
 static inline std::string string_VkQueryResultFlags(VkQueryResultFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkQueryResultFlagBits(static_cast<VkQueryResultFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkQueryResultFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_QUERY_RESULT_64_BIT, "VK_QUERY_RESULT_64_BIT"},
+        {VK_QUERY_RESULT_WAIT_BIT, "VK_QUERY_RESULT_WAIT_BIT"},
+        {VK_QUERY_RESULT_WITH_AVAILABILITY_BIT, "VK_QUERY_RESULT_WITH_AVAILABILITY_BIT"},
+        {VK_QUERY_RESULT_PARTIAL_BIT, "VK_QUERY_RESULT_PARTIAL_BIT"},
+        {VK_QUERY_RESULT_WITH_STATUS_BIT_KHR, "VK_QUERY_RESULT_WITH_STATUS_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkQueryResultFlagBits", "VkQueryResultFlags(0)");
 }
 static inline const char* string_VkBufferCreateFlagBits(VkBufferCreateFlagBits input_value) {
     switch (input_value) {
@@ -5410,18 +5094,16 @@ static inline const char* string_VkBufferCreateFlagBits(VkBufferCreateFlagBits i
 }
 
 static inline std::string string_VkBufferCreateFlags(VkBufferCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkBufferCreateFlagBits(static_cast<VkBufferCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkBufferCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_BUFFER_CREATE_SPARSE_BINDING_BIT, "VK_BUFFER_CREATE_SPARSE_BINDING_BIT"},
+        {VK_BUFFER_CREATE_SPARSE_RESIDENCY_BIT, "VK_BUFFER_CREATE_SPARSE_RESIDENCY_BIT"},
+        {VK_BUFFER_CREATE_SPARSE_ALIASED_BIT, "VK_BUFFER_CREATE_SPARSE_ALIASED_BIT"},
+        {VK_BUFFER_CREATE_PROTECTED_BIT, "VK_BUFFER_CREATE_PROTECTED_BIT"},
+        {VK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT, "VK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT"},
+        {VK_BUFFER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT, "VK_BUFFER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkBufferCreateFlagBits", "VkBufferCreateFlags(0)");
 }
 static inline const char* string_VkBufferUsageFlagBits(VkBufferUsageFlagBits input_value) {
     switch (input_value) {
@@ -5485,18 +5167,39 @@ static inline const char* string_VkBufferUsageFlagBits(VkBufferUsageFlagBits inp
 }
 
 static inline std::string string_VkBufferUsageFlags(VkBufferUsageFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkBufferUsageFlagBits(static_cast<VkBufferUsageFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkBufferUsageFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_BUFFER_USAGE_TRANSFER_SRC_BIT, "VK_BUFFER_USAGE_TRANSFER_SRC_BIT"},
+        {VK_BUFFER_USAGE_TRANSFER_DST_BIT, "VK_BUFFER_USAGE_TRANSFER_DST_BIT"},
+        {VK_BUFFER_USAGE_UNIFORM_TEXEL_BUFFER_BIT, "VK_BUFFER_USAGE_UNIFORM_TEXEL_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_STORAGE_TEXEL_BUFFER_BIT, "VK_BUFFER_USAGE_STORAGE_TEXEL_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT, "VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_STORAGE_BUFFER_BIT, "VK_BUFFER_USAGE_STORAGE_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_INDEX_BUFFER_BIT, "VK_BUFFER_USAGE_INDEX_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_VERTEX_BUFFER_BIT, "VK_BUFFER_USAGE_VERTEX_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_INDIRECT_BUFFER_BIT, "VK_BUFFER_USAGE_INDIRECT_BUFFER_BIT"},
+        {VK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT, "VK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT"},
+        {VK_BUFFER_USAGE_VIDEO_DECODE_SRC_BIT_KHR, "VK_BUFFER_USAGE_VIDEO_DECODE_SRC_BIT_KHR"},
+        {VK_BUFFER_USAGE_VIDEO_DECODE_DST_BIT_KHR, "VK_BUFFER_USAGE_VIDEO_DECODE_DST_BIT_KHR"},
+        {VK_BUFFER_USAGE_TRANSFORM_FEEDBACK_BUFFER_BIT_EXT, "VK_BUFFER_USAGE_TRANSFORM_FEEDBACK_BUFFER_BIT_EXT"},
+        {VK_BUFFER_USAGE_TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT, "VK_BUFFER_USAGE_TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT"},
+        {VK_BUFFER_USAGE_CONDITIONAL_RENDERING_BIT_EXT, "VK_BUFFER_USAGE_CONDITIONAL_RENDERING_BIT_EXT"},
+        {VK_BUFFER_USAGE_ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR, "VK_BUFFER_USAGE_ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR"},
+        {VK_BUFFER_USAGE_ACCELERATION_STRUCTURE_STORAGE_BIT_KHR, "VK_BUFFER_USAGE_ACCELERATION_STRUCTURE_STORAGE_BIT_KHR"},
+        {VK_BUFFER_USAGE_SHADER_BINDING_TABLE_BIT_KHR, "VK_BUFFER_USAGE_SHADER_BINDING_TABLE_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_BUFFER_USAGE_VIDEO_ENCODE_DST_BIT_KHR, "VK_BUFFER_USAGE_VIDEO_ENCODE_DST_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_BUFFER_USAGE_VIDEO_ENCODE_SRC_BIT_KHR, "VK_BUFFER_USAGE_VIDEO_ENCODE_SRC_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_BUFFER_USAGE_SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT, "VK_BUFFER_USAGE_SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT"},
+        {VK_BUFFER_USAGE_RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT, "VK_BUFFER_USAGE_RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT"},
+        {VK_BUFFER_USAGE_PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT, "VK_BUFFER_USAGE_PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT"},
+        {VK_BUFFER_USAGE_MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT, "VK_BUFFER_USAGE_MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT"},
+        {VK_BUFFER_USAGE_MICROMAP_STORAGE_BIT_EXT, "VK_BUFFER_USAGE_MICROMAP_STORAGE_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkBufferUsageFlagBits", "VkBufferUsageFlags(0)");
 }
 static inline const char* string_VkImageViewCreateFlagBits(VkImageViewCreateFlagBits input_value) {
     switch (input_value) {
@@ -5512,18 +5215,13 @@ static inline const char* string_VkImageViewCreateFlagBits(VkImageViewCreateFlag
 }
 
 static inline std::string string_VkImageViewCreateFlags(VkImageViewCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageViewCreateFlagBits(static_cast<VkImageViewCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageViewCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DYNAMIC_BIT_EXT, "VK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DYNAMIC_BIT_EXT"},
+        {VK_IMAGE_VIEW_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT, "VK_IMAGE_VIEW_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT"},
+        {VK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DEFERRED_BIT_EXT, "VK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DEFERRED_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageViewCreateFlagBits", "VkImageViewCreateFlags(0)");
 }
 static inline const char* string_VkPipelineCacheCreateFlagBits(VkPipelineCacheCreateFlagBits input_value) {
     switch (input_value) {
@@ -5535,18 +5233,11 @@ static inline const char* string_VkPipelineCacheCreateFlagBits(VkPipelineCacheCr
 }
 
 static inline std::string string_VkPipelineCacheCreateFlags(VkPipelineCacheCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineCacheCreateFlagBits(static_cast<VkPipelineCacheCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineCacheCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT, "VK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineCacheCreateFlagBits", "VkPipelineCacheCreateFlags(0)");
 }
 static inline const char* string_VkColorComponentFlagBits(VkColorComponentFlagBits input_value) {
     switch (input_value) {
@@ -5564,18 +5255,14 @@ static inline const char* string_VkColorComponentFlagBits(VkColorComponentFlagBi
 }
 
 static inline std::string string_VkColorComponentFlags(VkColorComponentFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkColorComponentFlagBits(static_cast<VkColorComponentFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkColorComponentFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_COLOR_COMPONENT_R_BIT, "VK_COLOR_COMPONENT_R_BIT"},
+        {VK_COLOR_COMPONENT_G_BIT, "VK_COLOR_COMPONENT_G_BIT"},
+        {VK_COLOR_COMPONENT_B_BIT, "VK_COLOR_COMPONENT_B_BIT"},
+        {VK_COLOR_COMPONENT_A_BIT, "VK_COLOR_COMPONENT_A_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkColorComponentFlagBits", "VkColorComponentFlags(0)");
 }
 static inline const char* string_VkPipelineCreateFlagBits(VkPipelineCreateFlagBits input_value) {
     switch (input_value) {
@@ -5649,18 +5336,43 @@ static inline const char* string_VkPipelineCreateFlagBits(VkPipelineCreateFlagBi
 }
 
 static inline std::string string_VkPipelineCreateFlags(VkPipelineCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineCreateFlagBits(static_cast<VkPipelineCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_CREATE_DISABLE_OPTIMIZATION_BIT, "VK_PIPELINE_CREATE_DISABLE_OPTIMIZATION_BIT"},
+        {VK_PIPELINE_CREATE_ALLOW_DERIVATIVES_BIT, "VK_PIPELINE_CREATE_ALLOW_DERIVATIVES_BIT"},
+        {VK_PIPELINE_CREATE_DERIVATIVE_BIT, "VK_PIPELINE_CREATE_DERIVATIVE_BIT"},
+        {VK_PIPELINE_CREATE_VIEW_INDEX_FROM_DEVICE_INDEX_BIT, "VK_PIPELINE_CREATE_VIEW_INDEX_FROM_DEVICE_INDEX_BIT"},
+        {VK_PIPELINE_CREATE_DISPATCH_BASE_BIT, "VK_PIPELINE_CREATE_DISPATCH_BASE_BIT"},
+        {VK_PIPELINE_CREATE_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT, "VK_PIPELINE_CREATE_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT"},
+        {VK_PIPELINE_CREATE_EARLY_RETURN_ON_FAILURE_BIT, "VK_PIPELINE_CREATE_EARLY_RETURN_ON_FAILURE_BIT"},
+        {VK_PIPELINE_CREATE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, "VK_PIPELINE_CREATE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT, "VK_PIPELINE_CREATE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_SKIP_TRIANGLES_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_SKIP_TRIANGLES_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_SKIP_AABBS_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_SKIP_AABBS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR, "VK_PIPELINE_CREATE_RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR"},
+        {VK_PIPELINE_CREATE_DEFER_COMPILE_BIT_NV, "VK_PIPELINE_CREATE_DEFER_COMPILE_BIT_NV"},
+        {VK_PIPELINE_CREATE_CAPTURE_STATISTICS_BIT_KHR, "VK_PIPELINE_CREATE_CAPTURE_STATISTICS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR, "VK_PIPELINE_CREATE_CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR"},
+        {VK_PIPELINE_CREATE_INDIRECT_BINDABLE_BIT_NV, "VK_PIPELINE_CREATE_INDIRECT_BINDABLE_BIT_NV"},
+        {VK_PIPELINE_CREATE_LIBRARY_BIT_KHR, "VK_PIPELINE_CREATE_LIBRARY_BIT_KHR"},
+        {VK_PIPELINE_CREATE_DESCRIPTOR_BUFFER_BIT_EXT, "VK_PIPELINE_CREATE_DESCRIPTOR_BUFFER_BIT_EXT"},
+        {VK_PIPELINE_CREATE_RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT, "VK_PIPELINE_CREATE_RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT"},
+        {VK_PIPELINE_CREATE_LINK_TIME_OPTIMIZATION_BIT_EXT, "VK_PIPELINE_CREATE_LINK_TIME_OPTIMIZATION_BIT_EXT"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_ALLOW_MOTION_BIT_NV, "VK_PIPELINE_CREATE_RAY_TRACING_ALLOW_MOTION_BIT_NV"},
+        {VK_PIPELINE_CREATE_COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT, "VK_PIPELINE_CREATE_COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT"},
+        {VK_PIPELINE_CREATE_DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT, "VK_PIPELINE_CREATE_DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT"},
+        {VK_PIPELINE_CREATE_RAY_TRACING_OPACITY_MICROMAP_BIT_EXT, "VK_PIPELINE_CREATE_RAY_TRACING_OPACITY_MICROMAP_BIT_EXT"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_PIPELINE_CREATE_RAY_TRACING_DISPLACEMENT_MICROMAP_BIT_NV, "VK_PIPELINE_CREATE_RAY_TRACING_DISPLACEMENT_MICROMAP_BIT_NV"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_PIPELINE_CREATE_NO_PROTECTED_ACCESS_BIT_EXT, "VK_PIPELINE_CREATE_NO_PROTECTED_ACCESS_BIT_EXT"},
+        {VK_PIPELINE_CREATE_PROTECTED_ACCESS_ONLY_BIT_EXT, "VK_PIPELINE_CREATE_PROTECTED_ACCESS_ONLY_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineCreateFlagBits", "VkPipelineCreateFlags(0)");
 }
 static inline const char* string_VkPipelineShaderStageCreateFlagBits(VkPipelineShaderStageCreateFlagBits input_value) {
     switch (input_value) {
@@ -5674,18 +5386,12 @@ static inline const char* string_VkPipelineShaderStageCreateFlagBits(VkPipelineS
 }
 
 static inline std::string string_VkPipelineShaderStageCreateFlags(VkPipelineShaderStageCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineShaderStageCreateFlagBits(static_cast<VkPipelineShaderStageCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineShaderStageCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_SHADER_STAGE_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT, "VK_PIPELINE_SHADER_STAGE_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT"},
+        {VK_PIPELINE_SHADER_STAGE_CREATE_REQUIRE_FULL_SUBGROUPS_BIT, "VK_PIPELINE_SHADER_STAGE_CREATE_REQUIRE_FULL_SUBGROUPS_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineShaderStageCreateFlagBits", "VkPipelineShaderStageCreateFlags(0)");
 }
 static inline const char* string_VkShaderStageFlagBits(VkShaderStageFlagBits input_value) {
     switch (input_value) {
@@ -5729,18 +5435,26 @@ static inline const char* string_VkShaderStageFlagBits(VkShaderStageFlagBits inp
 static inline std::string string_VkShaderStageFlags(VkShaderStageFlags input_value) {
     if (input_value == VK_SHADER_STAGE_ALL_GRAPHICS) { return "VK_SHADER_STAGE_ALL_GRAPHICS"; }
     if (input_value == VK_SHADER_STAGE_ALL) { return "VK_SHADER_STAGE_ALL"; }
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkShaderStageFlagBits(static_cast<VkShaderStageFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkShaderStageFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SHADER_STAGE_VERTEX_BIT, "VK_SHADER_STAGE_VERTEX_BIT"},
+        {VK_SHADER_STAGE_TESSELLATION_CONTROL_BIT, "VK_SHADER_STAGE_TESSELLATION_CONTROL_BIT"},
+        {VK_SHADER_STAGE_TESSELLATION_EVALUATION_BIT, "VK_SHADER_STAGE_TESSELLATION_EVALUATION_BIT"},
+        {VK_SHADER_STAGE_GEOMETRY_BIT, "VK_SHADER_STAGE_GEOMETRY_BIT"},
+        {VK_SHADER_STAGE_FRAGMENT_BIT, "VK_SHADER_STAGE_FRAGMENT_BIT"},
+        {VK_SHADER_STAGE_COMPUTE_BIT, "VK_SHADER_STAGE_COMPUTE_BIT"},
+        {VK_SHADER_STAGE_RAYGEN_BIT_KHR, "VK_SHADER_STAGE_RAYGEN_BIT_KHR"},
+        {VK_SHADER_STAGE_ANY_HIT_BIT_KHR, "VK_SHADER_STAGE_ANY_HIT_BIT_KHR"},
+        {VK_SHADER_STAGE_CLOSEST_HIT_BIT_KHR, "VK_SHADER_STAGE_CLOSEST_HIT_BIT_KHR"},
+        {VK_SHADER_STAGE_MISS_BIT_KHR, "VK_SHADER_STAGE_MISS_BIT_KHR"},
+        {VK_SHADER_STAGE_INTERSECTION_BIT_KHR, "VK_SHADER_STAGE_INTERSECTION_BIT_KHR"},
+        {VK_SHADER_STAGE_CALLABLE_BIT_KHR, "VK_SHADER_STAGE_CALLABLE_BIT_KHR"},
+        {VK_SHADER_STAGE_TASK_BIT_EXT, "VK_SHADER_STAGE_TASK_BIT_EXT"},
+        {VK_SHADER_STAGE_MESH_BIT_EXT, "VK_SHADER_STAGE_MESH_BIT_EXT"},
+        {VK_SHADER_STAGE_SUBPASS_SHADING_BIT_HUAWEI, "VK_SHADER_STAGE_SUBPASS_SHADING_BIT_HUAWEI"},
+        {VK_SHADER_STAGE_CLUSTER_CULLING_BIT_HUAWEI, "VK_SHADER_STAGE_CLUSTER_CULLING_BIT_HUAWEI"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkShaderStageFlagBits", "VkShaderStageFlags(0)");
 }
 static inline const char* string_VkCullModeFlagBits(VkCullModeFlagBits input_value) {
     switch (input_value) {
@@ -5757,18 +5471,13 @@ static inline const char* string_VkCullModeFlagBits(VkCullModeFlagBits input_val
 
 static inline std::string string_VkCullModeFlags(VkCullModeFlags input_value) {
     if (input_value == VK_CULL_MODE_FRONT_AND_BACK) { return "VK_CULL_MODE_FRONT_AND_BACK"; }
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkCullModeFlagBits(static_cast<VkCullModeFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkCullModeFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_CULL_MODE_NONE, "VK_CULL_MODE_NONE"},
+        {VK_CULL_MODE_FRONT_BIT, "VK_CULL_MODE_FRONT_BIT"},
+        {VK_CULL_MODE_BACK_BIT, "VK_CULL_MODE_BACK_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkCullModeFlagBits", "VkCullModeFlags(0)");
 }
 static inline const char* string_VkPipelineDepthStencilStateCreateFlagBits(VkPipelineDepthStencilStateCreateFlagBits input_value) {
     switch (input_value) {
@@ -5782,18 +5491,12 @@ static inline const char* string_VkPipelineDepthStencilStateCreateFlagBits(VkPip
 }
 
 static inline std::string string_VkPipelineDepthStencilStateCreateFlags(VkPipelineDepthStencilStateCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineDepthStencilStateCreateFlagBits(static_cast<VkPipelineDepthStencilStateCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineDepthStencilStateCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT, "VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT"},
+        {VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT, "VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineDepthStencilStateCreateFlagBits", "VkPipelineDepthStencilStateCreateFlags(0)");
 }
 static inline const char* string_VkPipelineColorBlendStateCreateFlagBits(VkPipelineColorBlendStateCreateFlagBits input_value) {
     switch (input_value) {
@@ -5805,18 +5508,11 @@ static inline const char* string_VkPipelineColorBlendStateCreateFlagBits(VkPipel
 }
 
 static inline std::string string_VkPipelineColorBlendStateCreateFlags(VkPipelineColorBlendStateCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineColorBlendStateCreateFlagBits(static_cast<VkPipelineColorBlendStateCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineColorBlendStateCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_COLOR_BLEND_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT, "VK_PIPELINE_COLOR_BLEND_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineColorBlendStateCreateFlagBits", "VkPipelineColorBlendStateCreateFlags(0)");
 }
 static inline const char* string_VkPipelineLayoutCreateFlagBits(VkPipelineLayoutCreateFlagBits input_value) {
     switch (input_value) {
@@ -5828,18 +5524,11 @@ static inline const char* string_VkPipelineLayoutCreateFlagBits(VkPipelineLayout
 }
 
 static inline std::string string_VkPipelineLayoutCreateFlags(VkPipelineLayoutCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineLayoutCreateFlagBits(static_cast<VkPipelineLayoutCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineLayoutCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_LAYOUT_CREATE_INDEPENDENT_SETS_BIT_EXT, "VK_PIPELINE_LAYOUT_CREATE_INDEPENDENT_SETS_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineLayoutCreateFlagBits", "VkPipelineLayoutCreateFlags(0)");
 }
 static inline const char* string_VkSamplerCreateFlagBits(VkSamplerCreateFlagBits input_value) {
     switch (input_value) {
@@ -5859,18 +5548,15 @@ static inline const char* string_VkSamplerCreateFlagBits(VkSamplerCreateFlagBits
 }
 
 static inline std::string string_VkSamplerCreateFlags(VkSamplerCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSamplerCreateFlagBits(static_cast<VkSamplerCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSamplerCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SAMPLER_CREATE_SUBSAMPLED_BIT_EXT, "VK_SAMPLER_CREATE_SUBSAMPLED_BIT_EXT"},
+        {VK_SAMPLER_CREATE_SUBSAMPLED_COARSE_RECONSTRUCTION_BIT_EXT, "VK_SAMPLER_CREATE_SUBSAMPLED_COARSE_RECONSTRUCTION_BIT_EXT"},
+        {VK_SAMPLER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT, "VK_SAMPLER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT"},
+        {VK_SAMPLER_CREATE_NON_SEAMLESS_CUBE_MAP_BIT_EXT, "VK_SAMPLER_CREATE_NON_SEAMLESS_CUBE_MAP_BIT_EXT"},
+        {VK_SAMPLER_CREATE_IMAGE_PROCESSING_BIT_QCOM, "VK_SAMPLER_CREATE_IMAGE_PROCESSING_BIT_QCOM"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSamplerCreateFlagBits", "VkSamplerCreateFlags(0)");
 }
 static inline const char* string_VkDescriptorPoolCreateFlagBits(VkDescriptorPoolCreateFlagBits input_value) {
     switch (input_value) {
@@ -5886,18 +5572,13 @@ static inline const char* string_VkDescriptorPoolCreateFlagBits(VkDescriptorPool
 }
 
 static inline std::string string_VkDescriptorPoolCreateFlags(VkDescriptorPoolCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDescriptorPoolCreateFlagBits(static_cast<VkDescriptorPoolCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDescriptorPoolCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DESCRIPTOR_POOL_CREATE_FREE_DESCRIPTOR_SET_BIT, "VK_DESCRIPTOR_POOL_CREATE_FREE_DESCRIPTOR_SET_BIT"},
+        {VK_DESCRIPTOR_POOL_CREATE_UPDATE_AFTER_BIND_BIT, "VK_DESCRIPTOR_POOL_CREATE_UPDATE_AFTER_BIND_BIT"},
+        {VK_DESCRIPTOR_POOL_CREATE_HOST_ONLY_BIT_EXT, "VK_DESCRIPTOR_POOL_CREATE_HOST_ONLY_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDescriptorPoolCreateFlagBits", "VkDescriptorPoolCreateFlags(0)");
 }
 static inline const char* string_VkDescriptorSetLayoutCreateFlagBits(VkDescriptorSetLayoutCreateFlagBits input_value) {
     switch (input_value) {
@@ -5917,18 +5598,15 @@ static inline const char* string_VkDescriptorSetLayoutCreateFlagBits(VkDescripto
 }
 
 static inline std::string string_VkDescriptorSetLayoutCreateFlags(VkDescriptorSetLayoutCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDescriptorSetLayoutCreateFlagBits(static_cast<VkDescriptorSetLayoutCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDescriptorSetLayoutCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DESCRIPTOR_SET_LAYOUT_CREATE_UPDATE_AFTER_BIND_POOL_BIT, "VK_DESCRIPTOR_SET_LAYOUT_CREATE_UPDATE_AFTER_BIND_POOL_BIT"},
+        {VK_DESCRIPTOR_SET_LAYOUT_CREATE_PUSH_DESCRIPTOR_BIT_KHR, "VK_DESCRIPTOR_SET_LAYOUT_CREATE_PUSH_DESCRIPTOR_BIT_KHR"},
+        {VK_DESCRIPTOR_SET_LAYOUT_CREATE_DESCRIPTOR_BUFFER_BIT_EXT, "VK_DESCRIPTOR_SET_LAYOUT_CREATE_DESCRIPTOR_BUFFER_BIT_EXT"},
+        {VK_DESCRIPTOR_SET_LAYOUT_CREATE_EMBEDDED_IMMUTABLE_SAMPLERS_BIT_EXT, "VK_DESCRIPTOR_SET_LAYOUT_CREATE_EMBEDDED_IMMUTABLE_SAMPLERS_BIT_EXT"},
+        {VK_DESCRIPTOR_SET_LAYOUT_CREATE_HOST_ONLY_POOL_BIT_EXT, "VK_DESCRIPTOR_SET_LAYOUT_CREATE_HOST_ONLY_POOL_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDescriptorSetLayoutCreateFlagBits", "VkDescriptorSetLayoutCreateFlags(0)");
 }
 static inline const char* string_VkAttachmentDescriptionFlagBits(VkAttachmentDescriptionFlagBits input_value) {
     switch (input_value) {
@@ -5940,18 +5618,11 @@ static inline const char* string_VkAttachmentDescriptionFlagBits(VkAttachmentDes
 }
 
 static inline std::string string_VkAttachmentDescriptionFlags(VkAttachmentDescriptionFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkAttachmentDescriptionFlagBits(static_cast<VkAttachmentDescriptionFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkAttachmentDescriptionFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_ATTACHMENT_DESCRIPTION_MAY_ALIAS_BIT, "VK_ATTACHMENT_DESCRIPTION_MAY_ALIAS_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkAttachmentDescriptionFlagBits", "VkAttachmentDescriptionFlags(0)");
 }
 static inline const char* string_VkDependencyFlagBits(VkDependencyFlagBits input_value) {
     switch (input_value) {
@@ -5969,18 +5640,14 @@ static inline const char* string_VkDependencyFlagBits(VkDependencyFlagBits input
 }
 
 static inline std::string string_VkDependencyFlags(VkDependencyFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDependencyFlagBits(static_cast<VkDependencyFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDependencyFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEPENDENCY_BY_REGION_BIT, "VK_DEPENDENCY_BY_REGION_BIT"},
+        {VK_DEPENDENCY_DEVICE_GROUP_BIT, "VK_DEPENDENCY_DEVICE_GROUP_BIT"},
+        {VK_DEPENDENCY_VIEW_LOCAL_BIT, "VK_DEPENDENCY_VIEW_LOCAL_BIT"},
+        {VK_DEPENDENCY_FEEDBACK_LOOP_BIT_EXT, "VK_DEPENDENCY_FEEDBACK_LOOP_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDependencyFlagBits", "VkDependencyFlags(0)");
 }
 static inline const char* string_VkFramebufferCreateFlagBits(VkFramebufferCreateFlagBits input_value) {
     switch (input_value) {
@@ -5992,18 +5659,11 @@ static inline const char* string_VkFramebufferCreateFlagBits(VkFramebufferCreate
 }
 
 static inline std::string string_VkFramebufferCreateFlags(VkFramebufferCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkFramebufferCreateFlagBits(static_cast<VkFramebufferCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkFramebufferCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_FRAMEBUFFER_CREATE_IMAGELESS_BIT, "VK_FRAMEBUFFER_CREATE_IMAGELESS_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkFramebufferCreateFlagBits", "VkFramebufferCreateFlags(0)");
 }
 static inline const char* string_VkRenderPassCreateFlagBits(VkRenderPassCreateFlagBits input_value) {
     switch (input_value) {
@@ -6015,18 +5675,11 @@ static inline const char* string_VkRenderPassCreateFlagBits(VkRenderPassCreateFl
 }
 
 static inline std::string string_VkRenderPassCreateFlags(VkRenderPassCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkRenderPassCreateFlagBits(static_cast<VkRenderPassCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkRenderPassCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_RENDER_PASS_CREATE_TRANSFORM_BIT_QCOM, "VK_RENDER_PASS_CREATE_TRANSFORM_BIT_QCOM"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkRenderPassCreateFlagBits", "VkRenderPassCreateFlags(0)");
 }
 static inline const char* string_VkSubpassDescriptionFlagBits(VkSubpassDescriptionFlagBits input_value) {
     switch (input_value) {
@@ -6052,18 +5705,18 @@ static inline const char* string_VkSubpassDescriptionFlagBits(VkSubpassDescripti
 }
 
 static inline std::string string_VkSubpassDescriptionFlags(VkSubpassDescriptionFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSubpassDescriptionFlagBits(static_cast<VkSubpassDescriptionFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSubpassDescriptionFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SUBPASS_DESCRIPTION_PER_VIEW_ATTRIBUTES_BIT_NVX, "VK_SUBPASS_DESCRIPTION_PER_VIEW_ATTRIBUTES_BIT_NVX"},
+        {VK_SUBPASS_DESCRIPTION_PER_VIEW_POSITION_X_ONLY_BIT_NVX, "VK_SUBPASS_DESCRIPTION_PER_VIEW_POSITION_X_ONLY_BIT_NVX"},
+        {VK_SUBPASS_DESCRIPTION_FRAGMENT_REGION_BIT_QCOM, "VK_SUBPASS_DESCRIPTION_FRAGMENT_REGION_BIT_QCOM"},
+        {VK_SUBPASS_DESCRIPTION_SHADER_RESOLVE_BIT_QCOM, "VK_SUBPASS_DESCRIPTION_SHADER_RESOLVE_BIT_QCOM"},
+        {VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_EXT, "VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_EXT"},
+        {VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT, "VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT"},
+        {VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT, "VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT"},
+        {VK_SUBPASS_DESCRIPTION_ENABLE_LEGACY_DITHERING_BIT_EXT, "VK_SUBPASS_DESCRIPTION_ENABLE_LEGACY_DITHERING_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSubpassDescriptionFlagBits", "VkSubpassDescriptionFlags(0)");
 }
 static inline const char* string_VkCommandPoolCreateFlagBits(VkCommandPoolCreateFlagBits input_value) {
     switch (input_value) {
@@ -6079,18 +5732,13 @@ static inline const char* string_VkCommandPoolCreateFlagBits(VkCommandPoolCreate
 }
 
 static inline std::string string_VkCommandPoolCreateFlags(VkCommandPoolCreateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkCommandPoolCreateFlagBits(static_cast<VkCommandPoolCreateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkCommandPoolCreateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_COMMAND_POOL_CREATE_TRANSIENT_BIT, "VK_COMMAND_POOL_CREATE_TRANSIENT_BIT"},
+        {VK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT, "VK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT"},
+        {VK_COMMAND_POOL_CREATE_PROTECTED_BIT, "VK_COMMAND_POOL_CREATE_PROTECTED_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkCommandPoolCreateFlagBits", "VkCommandPoolCreateFlags(0)");
 }
 static inline const char* string_VkCommandPoolResetFlagBits(VkCommandPoolResetFlagBits input_value) {
     switch (input_value) {
@@ -6102,18 +5750,11 @@ static inline const char* string_VkCommandPoolResetFlagBits(VkCommandPoolResetFl
 }
 
 static inline std::string string_VkCommandPoolResetFlags(VkCommandPoolResetFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkCommandPoolResetFlagBits(static_cast<VkCommandPoolResetFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkCommandPoolResetFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT, "VK_COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkCommandPoolResetFlagBits", "VkCommandPoolResetFlags(0)");
 }
 static inline const char* string_VkCommandBufferUsageFlagBits(VkCommandBufferUsageFlagBits input_value) {
     switch (input_value) {
@@ -6129,18 +5770,13 @@ static inline const char* string_VkCommandBufferUsageFlagBits(VkCommandBufferUsa
 }
 
 static inline std::string string_VkCommandBufferUsageFlags(VkCommandBufferUsageFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkCommandBufferUsageFlagBits(static_cast<VkCommandBufferUsageFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkCommandBufferUsageFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT, "VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT"},
+        {VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT, "VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT"},
+        {VK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT, "VK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkCommandBufferUsageFlagBits", "VkCommandBufferUsageFlags(0)");
 }
 static inline const char* string_VkQueryControlFlagBits(VkQueryControlFlagBits input_value) {
     switch (input_value) {
@@ -6152,18 +5788,11 @@ static inline const char* string_VkQueryControlFlagBits(VkQueryControlFlagBits i
 }
 
 static inline std::string string_VkQueryControlFlags(VkQueryControlFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkQueryControlFlagBits(static_cast<VkQueryControlFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkQueryControlFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_QUERY_CONTROL_PRECISE_BIT, "VK_QUERY_CONTROL_PRECISE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkQueryControlFlagBits", "VkQueryControlFlags(0)");
 }
 static inline const char* string_VkCommandBufferResetFlagBits(VkCommandBufferResetFlagBits input_value) {
     switch (input_value) {
@@ -6175,18 +5804,11 @@ static inline const char* string_VkCommandBufferResetFlagBits(VkCommandBufferRes
 }
 
 static inline std::string string_VkCommandBufferResetFlags(VkCommandBufferResetFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkCommandBufferResetFlagBits(static_cast<VkCommandBufferResetFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkCommandBufferResetFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_COMMAND_BUFFER_RESET_RELEASE_RESOURCES_BIT, "VK_COMMAND_BUFFER_RESET_RELEASE_RESOURCES_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkCommandBufferResetFlagBits", "VkCommandBufferResetFlags(0)");
 }
 static inline const char* string_VkStencilFaceFlagBits(VkStencilFaceFlagBits input_value) {
     switch (input_value) {
@@ -6201,18 +5823,12 @@ static inline const char* string_VkStencilFaceFlagBits(VkStencilFaceFlagBits inp
 
 static inline std::string string_VkStencilFaceFlags(VkStencilFaceFlags input_value) {
     if (input_value == VK_STENCIL_FACE_FRONT_AND_BACK) { return "VK_STENCIL_FACE_FRONT_AND_BACK"; }
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkStencilFaceFlagBits(static_cast<VkStencilFaceFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkStencilFaceFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_STENCIL_FACE_FRONT_BIT, "VK_STENCIL_FACE_FRONT_BIT"},
+        {VK_STENCIL_FACE_BACK_BIT, "VK_STENCIL_FACE_BACK_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkStencilFaceFlagBits", "VkStencilFaceFlags(0)");
 }
 static inline const char* string_VkSubgroupFeatureFlagBits(VkSubgroupFeatureFlagBits input_value) {
     switch (input_value) {
@@ -6240,18 +5856,19 @@ static inline const char* string_VkSubgroupFeatureFlagBits(VkSubgroupFeatureFlag
 }
 
 static inline std::string string_VkSubgroupFeatureFlags(VkSubgroupFeatureFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSubgroupFeatureFlagBits(static_cast<VkSubgroupFeatureFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSubgroupFeatureFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SUBGROUP_FEATURE_BASIC_BIT, "VK_SUBGROUP_FEATURE_BASIC_BIT"},
+        {VK_SUBGROUP_FEATURE_VOTE_BIT, "VK_SUBGROUP_FEATURE_VOTE_BIT"},
+        {VK_SUBGROUP_FEATURE_ARITHMETIC_BIT, "VK_SUBGROUP_FEATURE_ARITHMETIC_BIT"},
+        {VK_SUBGROUP_FEATURE_BALLOT_BIT, "VK_SUBGROUP_FEATURE_BALLOT_BIT"},
+        {VK_SUBGROUP_FEATURE_SHUFFLE_BIT, "VK_SUBGROUP_FEATURE_SHUFFLE_BIT"},
+        {VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT, "VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT"},
+        {VK_SUBGROUP_FEATURE_CLUSTERED_BIT, "VK_SUBGROUP_FEATURE_CLUSTERED_BIT"},
+        {VK_SUBGROUP_FEATURE_QUAD_BIT, "VK_SUBGROUP_FEATURE_QUAD_BIT"},
+        {VK_SUBGROUP_FEATURE_PARTITIONED_BIT_NV, "VK_SUBGROUP_FEATURE_PARTITIONED_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSubgroupFeatureFlagBits", "VkSubgroupFeatureFlags(0)");
 }
 static inline const char* string_VkPeerMemoryFeatureFlagBits(VkPeerMemoryFeatureFlagBits input_value) {
     switch (input_value) {
@@ -6269,18 +5886,14 @@ static inline const char* string_VkPeerMemoryFeatureFlagBits(VkPeerMemoryFeature
 }
 
 static inline std::string string_VkPeerMemoryFeatureFlags(VkPeerMemoryFeatureFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPeerMemoryFeatureFlagBits(static_cast<VkPeerMemoryFeatureFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPeerMemoryFeatureFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PEER_MEMORY_FEATURE_COPY_SRC_BIT, "VK_PEER_MEMORY_FEATURE_COPY_SRC_BIT"},
+        {VK_PEER_MEMORY_FEATURE_COPY_DST_BIT, "VK_PEER_MEMORY_FEATURE_COPY_DST_BIT"},
+        {VK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT, "VK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT"},
+        {VK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT, "VK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPeerMemoryFeatureFlagBits", "VkPeerMemoryFeatureFlags(0)");
 }
 static inline const char* string_VkMemoryAllocateFlagBits(VkMemoryAllocateFlagBits input_value) {
     switch (input_value) {
@@ -6296,18 +5909,13 @@ static inline const char* string_VkMemoryAllocateFlagBits(VkMemoryAllocateFlagBi
 }
 
 static inline std::string string_VkMemoryAllocateFlags(VkMemoryAllocateFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkMemoryAllocateFlagBits(static_cast<VkMemoryAllocateFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkMemoryAllocateFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_MEMORY_ALLOCATE_DEVICE_MASK_BIT, "VK_MEMORY_ALLOCATE_DEVICE_MASK_BIT"},
+        {VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_BIT, "VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_BIT"},
+        {VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT, "VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkMemoryAllocateFlagBits", "VkMemoryAllocateFlags(0)");
 }
 static inline const char* string_VkExternalMemoryHandleTypeFlagBits(VkExternalMemoryHandleTypeFlagBits input_value) {
     switch (input_value) {
@@ -6345,18 +5953,24 @@ static inline const char* string_VkExternalMemoryHandleTypeFlagBits(VkExternalMe
 }
 
 static inline std::string string_VkExternalMemoryHandleTypeFlags(VkExternalMemoryHandleTypeFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalMemoryHandleTypeFlagBits(static_cast<VkExternalMemoryHandleTypeFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalMemoryHandleTypeFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_DMA_BUF_BIT_EXT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_DMA_BUF_BIT_EXT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_ANDROID_HARDWARE_BUFFER_BIT_ANDROID, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_ANDROID_HARDWARE_BUFFER_BIT_ANDROID"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_ALLOCATION_BIT_EXT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_ALLOCATION_BIT_EXT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_MAPPED_FOREIGN_MEMORY_BIT_EXT, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_MAPPED_FOREIGN_MEMORY_BIT_EXT"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_ZIRCON_VMO_BIT_FUCHSIA, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_ZIRCON_VMO_BIT_FUCHSIA"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_RDMA_ADDRESS_BIT_NV, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_RDMA_ADDRESS_BIT_NV"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_SCREEN_BUFFER_BIT_QNX, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_SCREEN_BUFFER_BIT_QNX"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalMemoryHandleTypeFlagBits", "VkExternalMemoryHandleTypeFlags(0)");
 }
 static inline const char* string_VkExternalMemoryFeatureFlagBits(VkExternalMemoryFeatureFlagBits input_value) {
     switch (input_value) {
@@ -6372,18 +5986,13 @@ static inline const char* string_VkExternalMemoryFeatureFlagBits(VkExternalMemor
 }
 
 static inline std::string string_VkExternalMemoryFeatureFlags(VkExternalMemoryFeatureFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalMemoryFeatureFlagBits(static_cast<VkExternalMemoryFeatureFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalMemoryFeatureFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT, "VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT"},
+        {VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT, "VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT"},
+        {VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT, "VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalMemoryFeatureFlagBits", "VkExternalMemoryFeatureFlags(0)");
 }
 static inline const char* string_VkExternalFenceHandleTypeFlagBits(VkExternalFenceHandleTypeFlagBits input_value) {
     switch (input_value) {
@@ -6401,18 +6010,14 @@ static inline const char* string_VkExternalFenceHandleTypeFlagBits(VkExternalFen
 }
 
 static inline std::string string_VkExternalFenceHandleTypeFlags(VkExternalFenceHandleTypeFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalFenceHandleTypeFlagBits(static_cast<VkExternalFenceHandleTypeFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalFenceHandleTypeFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT, "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT"},
+        {VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT, "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT"},
+        {VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT, "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT"},
+        {VK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT, "VK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalFenceHandleTypeFlagBits", "VkExternalFenceHandleTypeFlags(0)");
 }
 static inline const char* string_VkExternalFenceFeatureFlagBits(VkExternalFenceFeatureFlagBits input_value) {
     switch (input_value) {
@@ -6426,18 +6031,12 @@ static inline const char* string_VkExternalFenceFeatureFlagBits(VkExternalFenceF
 }
 
 static inline std::string string_VkExternalFenceFeatureFlags(VkExternalFenceFeatureFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalFenceFeatureFlagBits(static_cast<VkExternalFenceFeatureFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalFenceFeatureFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT, "VK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT"},
+        {VK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT, "VK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalFenceFeatureFlagBits", "VkExternalFenceFeatureFlags(0)");
 }
 static inline const char* string_VkFenceImportFlagBits(VkFenceImportFlagBits input_value) {
     switch (input_value) {
@@ -6449,18 +6048,11 @@ static inline const char* string_VkFenceImportFlagBits(VkFenceImportFlagBits inp
 }
 
 static inline std::string string_VkFenceImportFlags(VkFenceImportFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkFenceImportFlagBits(static_cast<VkFenceImportFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkFenceImportFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_FENCE_IMPORT_TEMPORARY_BIT, "VK_FENCE_IMPORT_TEMPORARY_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkFenceImportFlagBits", "VkFenceImportFlags(0)");
 }
 static inline const char* string_VkSemaphoreImportFlagBits(VkSemaphoreImportFlagBits input_value) {
     switch (input_value) {
@@ -6472,18 +6064,11 @@ static inline const char* string_VkSemaphoreImportFlagBits(VkSemaphoreImportFlag
 }
 
 static inline std::string string_VkSemaphoreImportFlags(VkSemaphoreImportFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSemaphoreImportFlagBits(static_cast<VkSemaphoreImportFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSemaphoreImportFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SEMAPHORE_IMPORT_TEMPORARY_BIT, "VK_SEMAPHORE_IMPORT_TEMPORARY_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSemaphoreImportFlagBits", "VkSemaphoreImportFlags(0)");
 }
 static inline const char* string_VkExternalSemaphoreHandleTypeFlagBits(VkExternalSemaphoreHandleTypeFlagBits input_value) {
     switch (input_value) {
@@ -6505,18 +6090,16 @@ static inline const char* string_VkExternalSemaphoreHandleTypeFlagBits(VkExterna
 }
 
 static inline std::string string_VkExternalSemaphoreHandleTypeFlags(VkExternalSemaphoreHandleTypeFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalSemaphoreHandleTypeFlagBits(static_cast<VkExternalSemaphoreHandleTypeFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalSemaphoreHandleTypeFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT, "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT"},
+        {VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT, "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT"},
+        {VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT, "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT"},
+        {VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT, "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT"},
+        {VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT, "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT"},
+        {VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_ZIRCON_EVENT_BIT_FUCHSIA, "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_ZIRCON_EVENT_BIT_FUCHSIA"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalSemaphoreHandleTypeFlagBits", "VkExternalSemaphoreHandleTypeFlags(0)");
 }
 static inline const char* string_VkExternalSemaphoreFeatureFlagBits(VkExternalSemaphoreFeatureFlagBits input_value) {
     switch (input_value) {
@@ -6530,18 +6113,12 @@ static inline const char* string_VkExternalSemaphoreFeatureFlagBits(VkExternalSe
 }
 
 static inline std::string string_VkExternalSemaphoreFeatureFlags(VkExternalSemaphoreFeatureFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalSemaphoreFeatureFlagBits(static_cast<VkExternalSemaphoreFeatureFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalSemaphoreFeatureFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT, "VK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT"},
+        {VK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT, "VK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalSemaphoreFeatureFlagBits", "VkExternalSemaphoreFeatureFlags(0)");
 }
 static inline const char* string_VkResolveModeFlagBits(VkResolveModeFlagBits input_value) {
     switch (input_value) {
@@ -6561,18 +6138,15 @@ static inline const char* string_VkResolveModeFlagBits(VkResolveModeFlagBits inp
 }
 
 static inline std::string string_VkResolveModeFlags(VkResolveModeFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkResolveModeFlagBits(static_cast<VkResolveModeFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkResolveModeFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_RESOLVE_MODE_NONE, "VK_RESOLVE_MODE_NONE"},
+        {VK_RESOLVE_MODE_SAMPLE_ZERO_BIT, "VK_RESOLVE_MODE_SAMPLE_ZERO_BIT"},
+        {VK_RESOLVE_MODE_AVERAGE_BIT, "VK_RESOLVE_MODE_AVERAGE_BIT"},
+        {VK_RESOLVE_MODE_MIN_BIT, "VK_RESOLVE_MODE_MIN_BIT"},
+        {VK_RESOLVE_MODE_MAX_BIT, "VK_RESOLVE_MODE_MAX_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkResolveModeFlagBits", "VkResolveModeFlags(0)");
 }
 static inline const char* string_VkDescriptorBindingFlagBits(VkDescriptorBindingFlagBits input_value) {
     switch (input_value) {
@@ -6590,18 +6164,14 @@ static inline const char* string_VkDescriptorBindingFlagBits(VkDescriptorBinding
 }
 
 static inline std::string string_VkDescriptorBindingFlags(VkDescriptorBindingFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDescriptorBindingFlagBits(static_cast<VkDescriptorBindingFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDescriptorBindingFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT, "VK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT"},
+        {VK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT, "VK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT"},
+        {VK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT, "VK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT"},
+        {VK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT, "VK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDescriptorBindingFlagBits", "VkDescriptorBindingFlags(0)");
 }
 static inline const char* string_VkSemaphoreWaitFlagBits(VkSemaphoreWaitFlagBits input_value) {
     switch (input_value) {
@@ -6613,18 +6183,11 @@ static inline const char* string_VkSemaphoreWaitFlagBits(VkSemaphoreWaitFlagBits
 }
 
 static inline std::string string_VkSemaphoreWaitFlags(VkSemaphoreWaitFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSemaphoreWaitFlagBits(static_cast<VkSemaphoreWaitFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSemaphoreWaitFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SEMAPHORE_WAIT_ANY_BIT, "VK_SEMAPHORE_WAIT_ANY_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSemaphoreWaitFlagBits", "VkSemaphoreWaitFlags(0)");
 }
 static inline const char* string_VkPipelineCreationFeedbackFlagBits(VkPipelineCreationFeedbackFlagBits input_value) {
     switch (input_value) {
@@ -6640,18 +6203,13 @@ static inline const char* string_VkPipelineCreationFeedbackFlagBits(VkPipelineCr
 }
 
 static inline std::string string_VkPipelineCreationFeedbackFlags(VkPipelineCreationFeedbackFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineCreationFeedbackFlagBits(static_cast<VkPipelineCreationFeedbackFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineCreationFeedbackFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_CREATION_FEEDBACK_VALID_BIT, "VK_PIPELINE_CREATION_FEEDBACK_VALID_BIT"},
+        {VK_PIPELINE_CREATION_FEEDBACK_APPLICATION_PIPELINE_CACHE_HIT_BIT, "VK_PIPELINE_CREATION_FEEDBACK_APPLICATION_PIPELINE_CACHE_HIT_BIT"},
+        {VK_PIPELINE_CREATION_FEEDBACK_BASE_PIPELINE_ACCELERATION_BIT, "VK_PIPELINE_CREATION_FEEDBACK_BASE_PIPELINE_ACCELERATION_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineCreationFeedbackFlagBits", "VkPipelineCreationFeedbackFlags(0)");
 }
 static inline const char* string_VkToolPurposeFlagBits(VkToolPurposeFlagBits input_value) {
     switch (input_value) {
@@ -6675,18 +6233,17 @@ static inline const char* string_VkToolPurposeFlagBits(VkToolPurposeFlagBits inp
 }
 
 static inline std::string string_VkToolPurposeFlags(VkToolPurposeFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkToolPurposeFlagBits(static_cast<VkToolPurposeFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkToolPurposeFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_TOOL_PURPOSE_VALIDATION_BIT, "VK_TOOL_PURPOSE_VALIDATION_BIT"},
+        {VK_TOOL_PURPOSE_PROFILING_BIT, "VK_TOOL_PURPOSE_PROFILING_BIT"},
+        {VK_TOOL_PURPOSE_TRACING_BIT, "VK_TOOL_PURPOSE_TRACING_BIT"},
+        {VK_TOOL_PURPOSE_ADDITIONAL_FEATURES_BIT, "VK_TOOL_PURPOSE_ADDITIONAL_FEATURES_BIT"},
+        {VK_TOOL_PURPOSE_MODIFYING_FEATURES_BIT, "VK_TOOL_PURPOSE_MODIFYING_FEATURES_BIT"},
+        {VK_TOOL_PURPOSE_DEBUG_REPORTING_BIT_EXT, "VK_TOOL_PURPOSE_DEBUG_REPORTING_BIT_EXT"},
+        {VK_TOOL_PURPOSE_DEBUG_MARKERS_BIT_EXT, "VK_TOOL_PURPOSE_DEBUG_MARKERS_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkToolPurposeFlagBits", "VkToolPurposeFlags(0)");
 }
 static inline const char* string_VkPipelineStageFlagBits2(uint64_t input_value) {
     switch (input_value) {
@@ -6782,18 +6339,54 @@ static inline const char* string_VkPipelineStageFlagBits2(uint64_t input_value)
 }
 
 static inline std::string string_VkPipelineStageFlags2(VkPipelineStageFlags2 input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPipelineStageFlagBits2(static_cast<uint64_t>(1ULL << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPipelineStageFlags2(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PIPELINE_STAGE_2_NONE, "VK_PIPELINE_STAGE_2_NONE"},
+        {VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT, "VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT"},
+        {VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT, "VK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT"},
+        {VK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT, "VK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT"},
+        {VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT, "VK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT, "VK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT, "VK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT, "VK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT, "VK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT, "VK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT"},
+        {VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT, "VK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT"},
+        {VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT, "VK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT"},
+        {VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT, "VK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT"},
+        {VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT, "VK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT"},
+        {VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT, "VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT"},
+        {VK_PIPELINE_STAGE_2_HOST_BIT, "VK_PIPELINE_STAGE_2_HOST_BIT"},
+        {VK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT, "VK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT"},
+        {VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT, "VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT"},
+        {VK_PIPELINE_STAGE_2_COPY_BIT, "VK_PIPELINE_STAGE_2_COPY_BIT"},
+        {VK_PIPELINE_STAGE_2_RESOLVE_BIT, "VK_PIPELINE_STAGE_2_RESOLVE_BIT"},
+        {VK_PIPELINE_STAGE_2_BLIT_BIT, "VK_PIPELINE_STAGE_2_BLIT_BIT"},
+        {VK_PIPELINE_STAGE_2_CLEAR_BIT, "VK_PIPELINE_STAGE_2_CLEAR_BIT"},
+        {VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT, "VK_PIPELINE_STAGE_2_INDEX_INPUT_BIT"},
+        {VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT, "VK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT"},
+        {VK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT, "VK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT"},
+        {VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR, "VK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR, "VK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT, "VK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT"},
+        {VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT, "VK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT"},
+        {VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV, "VK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV"},
+        {VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, "VK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR"},
+        {VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR, "VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR"},
+        {VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR, "VK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR"},
+        {VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT, "VK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT"},
+        {VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT, "VK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT"},
+        {VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT, "VK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT"},
+        {VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI, "VK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI"},
+        {VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI, "VK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI"},
+        {VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR, "VK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR"},
+        {VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT, "VK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT"},
+        {VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI, "VK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI"},
+        {VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV, "VK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPipelineStageFlagBits2", "VkPipelineStageFlags2(0)");
 }
 static inline const char* string_VkAccessFlagBits2(uint64_t input_value) {
     switch (input_value) {
@@ -6893,18 +6486,57 @@ static inline const char* string_VkAccessFlagBits2(uint64_t input_value) {
 }
 
 static inline std::string string_VkAccessFlags2(VkAccessFlags2 input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkAccessFlagBits2(static_cast<uint64_t>(1ULL << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkAccessFlags2(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_ACCESS_2_NONE, "VK_ACCESS_2_NONE"},
+        {VK_ACCESS_2_INDIRECT_COMMAND_READ_BIT, "VK_ACCESS_2_INDIRECT_COMMAND_READ_BIT"},
+        {VK_ACCESS_2_INDEX_READ_BIT, "VK_ACCESS_2_INDEX_READ_BIT"},
+        {VK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT, "VK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT"},
+        {VK_ACCESS_2_UNIFORM_READ_BIT, "VK_ACCESS_2_UNIFORM_READ_BIT"},
+        {VK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT, "VK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT"},
+        {VK_ACCESS_2_SHADER_READ_BIT, "VK_ACCESS_2_SHADER_READ_BIT"},
+        {VK_ACCESS_2_SHADER_WRITE_BIT, "VK_ACCESS_2_SHADER_WRITE_BIT"},
+        {VK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT, "VK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT"},
+        {VK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT, "VK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT"},
+        {VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT, "VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT"},
+        {VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT, "VK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT"},
+        {VK_ACCESS_2_TRANSFER_READ_BIT, "VK_ACCESS_2_TRANSFER_READ_BIT"},
+        {VK_ACCESS_2_TRANSFER_WRITE_BIT, "VK_ACCESS_2_TRANSFER_WRITE_BIT"},
+        {VK_ACCESS_2_HOST_READ_BIT, "VK_ACCESS_2_HOST_READ_BIT"},
+        {VK_ACCESS_2_HOST_WRITE_BIT, "VK_ACCESS_2_HOST_WRITE_BIT"},
+        {VK_ACCESS_2_MEMORY_READ_BIT, "VK_ACCESS_2_MEMORY_READ_BIT"},
+        {VK_ACCESS_2_MEMORY_WRITE_BIT, "VK_ACCESS_2_MEMORY_WRITE_BIT"},
+        {VK_ACCESS_2_SHADER_SAMPLED_READ_BIT, "VK_ACCESS_2_SHADER_SAMPLED_READ_BIT"},
+        {VK_ACCESS_2_SHADER_STORAGE_READ_BIT, "VK_ACCESS_2_SHADER_STORAGE_READ_BIT"},
+        {VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT, "VK_ACCESS_2_SHADER_STORAGE_WRITE_BIT"},
+        {VK_ACCESS_2_VIDEO_DECODE_READ_BIT_KHR, "VK_ACCESS_2_VIDEO_DECODE_READ_BIT_KHR"},
+        {VK_ACCESS_2_VIDEO_DECODE_WRITE_BIT_KHR, "VK_ACCESS_2_VIDEO_DECODE_WRITE_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_ACCESS_2_VIDEO_ENCODE_READ_BIT_KHR, "VK_ACCESS_2_VIDEO_ENCODE_READ_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_ACCESS_2_VIDEO_ENCODE_WRITE_BIT_KHR, "VK_ACCESS_2_VIDEO_ENCODE_WRITE_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_ACCESS_2_TRANSFORM_FEEDBACK_WRITE_BIT_EXT, "VK_ACCESS_2_TRANSFORM_FEEDBACK_WRITE_BIT_EXT"},
+        {VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT, "VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT"},
+        {VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT, "VK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT"},
+        {VK_ACCESS_2_CONDITIONAL_RENDERING_READ_BIT_EXT, "VK_ACCESS_2_CONDITIONAL_RENDERING_READ_BIT_EXT"},
+        {VK_ACCESS_2_COMMAND_PREPROCESS_READ_BIT_NV, "VK_ACCESS_2_COMMAND_PREPROCESS_READ_BIT_NV"},
+        {VK_ACCESS_2_COMMAND_PREPROCESS_WRITE_BIT_NV, "VK_ACCESS_2_COMMAND_PREPROCESS_WRITE_BIT_NV"},
+        {VK_ACCESS_2_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR, "VK_ACCESS_2_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR"},
+        {VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR, "VK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR"},
+        {VK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR, "VK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR"},
+        {VK_ACCESS_2_FRAGMENT_DENSITY_MAP_READ_BIT_EXT, "VK_ACCESS_2_FRAGMENT_DENSITY_MAP_READ_BIT_EXT"},
+        {VK_ACCESS_2_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT, "VK_ACCESS_2_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT"},
+        {VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT, "VK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT"},
+        {VK_ACCESS_2_INVOCATION_MASK_READ_BIT_HUAWEI, "VK_ACCESS_2_INVOCATION_MASK_READ_BIT_HUAWEI"},
+        {VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR, "VK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR"},
+        {VK_ACCESS_2_MICROMAP_READ_BIT_EXT, "VK_ACCESS_2_MICROMAP_READ_BIT_EXT"},
+        {VK_ACCESS_2_MICROMAP_WRITE_BIT_EXT, "VK_ACCESS_2_MICROMAP_WRITE_BIT_EXT"},
+        {VK_ACCESS_2_OPTICAL_FLOW_READ_BIT_NV, "VK_ACCESS_2_OPTICAL_FLOW_READ_BIT_NV"},
+        {VK_ACCESS_2_OPTICAL_FLOW_WRITE_BIT_NV, "VK_ACCESS_2_OPTICAL_FLOW_WRITE_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkAccessFlagBits2", "VkAccessFlags2(0)");
 }
 static inline const char* string_VkSubmitFlagBits(VkSubmitFlagBits input_value) {
     switch (input_value) {
@@ -6916,18 +6548,11 @@ static inline const char* string_VkSubmitFlagBits(VkSubmitFlagBits input_value)
 }
 
 static inline std::string string_VkSubmitFlags(VkSubmitFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSubmitFlagBits(static_cast<VkSubmitFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSubmitFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SUBMIT_PROTECTED_BIT, "VK_SUBMIT_PROTECTED_BIT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSubmitFlagBits", "VkSubmitFlags(0)");
 }
 static inline const char* string_VkRenderingFlagBits(VkRenderingFlagBits input_value) {
     switch (input_value) {
@@ -6945,18 +6570,14 @@ static inline const char* string_VkRenderingFlagBits(VkRenderingFlagBits input_v
 }
 
 static inline std::string string_VkRenderingFlags(VkRenderingFlags input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkRenderingFlagBits(static_cast<VkRenderingFlagBits>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkRenderingFlags(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_RENDERING_CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT, "VK_RENDERING_CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT"},
+        {VK_RENDERING_SUSPENDING_BIT, "VK_RENDERING_SUSPENDING_BIT"},
+        {VK_RENDERING_RESUMING_BIT, "VK_RENDERING_RESUMING_BIT"},
+        {VK_RENDERING_ENABLE_LEGACY_DITHERING_BIT_EXT, "VK_RENDERING_ENABLE_LEGACY_DITHERING_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkRenderingFlagBits", "VkRenderingFlags(0)");
 }
 static inline const char* string_VkFormatFeatureFlagBits2(uint64_t input_value) {
     switch (input_value) {
@@ -7054,18 +6675,56 @@ static inline const char* string_VkFormatFeatureFlagBits2(uint64_t input_value)
 }
 
 static inline std::string string_VkFormatFeatureFlags2(VkFormatFeatureFlags2 input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkFormatFeatureFlagBits2(static_cast<uint64_t>(1ULL << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkFormatFeatureFlags2(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_BIT"},
+        {VK_FORMAT_FEATURE_2_STORAGE_IMAGE_BIT, "VK_FORMAT_FEATURE_2_STORAGE_IMAGE_BIT"},
+        {VK_FORMAT_FEATURE_2_STORAGE_IMAGE_ATOMIC_BIT, "VK_FORMAT_FEATURE_2_STORAGE_IMAGE_ATOMIC_BIT"},
+        {VK_FORMAT_FEATURE_2_UNIFORM_TEXEL_BUFFER_BIT, "VK_FORMAT_FEATURE_2_UNIFORM_TEXEL_BUFFER_BIT"},
+        {VK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_BIT, "VK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_BIT"},
+        {VK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_ATOMIC_BIT, "VK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_ATOMIC_BIT"},
+        {VK_FORMAT_FEATURE_2_VERTEX_BUFFER_BIT, "VK_FORMAT_FEATURE_2_VERTEX_BUFFER_BIT"},
+        {VK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BIT, "VK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BIT"},
+        {VK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BLEND_BIT, "VK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BLEND_BIT"},
+        {VK_FORMAT_FEATURE_2_DEPTH_STENCIL_ATTACHMENT_BIT, "VK_FORMAT_FEATURE_2_DEPTH_STENCIL_ATTACHMENT_BIT"},
+        {VK_FORMAT_FEATURE_2_BLIT_SRC_BIT, "VK_FORMAT_FEATURE_2_BLIT_SRC_BIT"},
+        {VK_FORMAT_FEATURE_2_BLIT_DST_BIT, "VK_FORMAT_FEATURE_2_BLIT_DST_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_LINEAR_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_LINEAR_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_CUBIC_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_CUBIC_BIT"},
+        {VK_FORMAT_FEATURE_2_TRANSFER_SRC_BIT, "VK_FORMAT_FEATURE_2_TRANSFER_SRC_BIT"},
+        {VK_FORMAT_FEATURE_2_TRANSFER_DST_BIT, "VK_FORMAT_FEATURE_2_TRANSFER_DST_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_MINMAX_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_MINMAX_BIT"},
+        {VK_FORMAT_FEATURE_2_MIDPOINT_CHROMA_SAMPLES_BIT, "VK_FORMAT_FEATURE_2_MIDPOINT_CHROMA_SAMPLES_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT"},
+        {VK_FORMAT_FEATURE_2_DISJOINT_BIT, "VK_FORMAT_FEATURE_2_DISJOINT_BIT"},
+        {VK_FORMAT_FEATURE_2_COSITED_CHROMA_SAMPLES_BIT, "VK_FORMAT_FEATURE_2_COSITED_CHROMA_SAMPLES_BIT"},
+        {VK_FORMAT_FEATURE_2_STORAGE_READ_WITHOUT_FORMAT_BIT, "VK_FORMAT_FEATURE_2_STORAGE_READ_WITHOUT_FORMAT_BIT"},
+        {VK_FORMAT_FEATURE_2_STORAGE_WRITE_WITHOUT_FORMAT_BIT, "VK_FORMAT_FEATURE_2_STORAGE_WRITE_WITHOUT_FORMAT_BIT"},
+        {VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_DEPTH_COMPARISON_BIT, "VK_FORMAT_FEATURE_2_SAMPLED_IMAGE_DEPTH_COMPARISON_BIT"},
+        {VK_FORMAT_FEATURE_2_VIDEO_DECODE_OUTPUT_BIT_KHR, "VK_FORMAT_FEATURE_2_VIDEO_DECODE_OUTPUT_BIT_KHR"},
+        {VK_FORMAT_FEATURE_2_VIDEO_DECODE_DPB_BIT_KHR, "VK_FORMAT_FEATURE_2_VIDEO_DECODE_DPB_BIT_KHR"},
+        {VK_FORMAT_FEATURE_2_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR, "VK_FORMAT_FEATURE_2_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR"},
+        {VK_FORMAT_FEATURE_2_FRAGMENT_DENSITY_MAP_BIT_EXT, "VK_FORMAT_FEATURE_2_FRAGMENT_DENSITY_MAP_BIT_EXT"},
+        {VK_FORMAT_FEATURE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR, "VK_FORMAT_FEATURE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_FORMAT_FEATURE_2_VIDEO_ENCODE_INPUT_BIT_KHR, "VK_FORMAT_FEATURE_2_VIDEO_ENCODE_INPUT_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_FORMAT_FEATURE_2_VIDEO_ENCODE_DPB_BIT_KHR, "VK_FORMAT_FEATURE_2_VIDEO_ENCODE_DPB_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_FORMAT_FEATURE_2_LINEAR_COLOR_ATTACHMENT_BIT_NV, "VK_FORMAT_FEATURE_2_LINEAR_COLOR_ATTACHMENT_BIT_NV"},
+        {VK_FORMAT_FEATURE_2_WEIGHT_IMAGE_BIT_QCOM, "VK_FORMAT_FEATURE_2_WEIGHT_IMAGE_BIT_QCOM"},
+        {VK_FORMAT_FEATURE_2_WEIGHT_SAMPLED_IMAGE_BIT_QCOM, "VK_FORMAT_FEATURE_2_WEIGHT_SAMPLED_IMAGE_BIT_QCOM"},
+        {VK_FORMAT_FEATURE_2_BLOCK_MATCHING_BIT_QCOM, "VK_FORMAT_FEATURE_2_BLOCK_MATCHING_BIT_QCOM"},
+        {VK_FORMAT_FEATURE_2_BOX_FILTER_SAMPLED_BIT_QCOM, "VK_FORMAT_FEATURE_2_BOX_FILTER_SAMPLED_BIT_QCOM"},
+        {VK_FORMAT_FEATURE_2_OPTICAL_FLOW_IMAGE_BIT_NV, "VK_FORMAT_FEATURE_2_OPTICAL_FLOW_IMAGE_BIT_NV"},
+        {VK_FORMAT_FEATURE_2_OPTICAL_FLOW_VECTOR_BIT_NV, "VK_FORMAT_FEATURE_2_OPTICAL_FLOW_VECTOR_BIT_NV"},
+        {VK_FORMAT_FEATURE_2_OPTICAL_FLOW_COST_BIT_NV, "VK_FORMAT_FEATURE_2_OPTICAL_FLOW_COST_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkFormatFeatureFlagBits2", "VkFormatFeatureFlags2(0)");
 }
 static inline const char* string_VkSurfaceTransformFlagBitsKHR(VkSurfaceTransformFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7093,18 +6752,19 @@ static inline const char* string_VkSurfaceTransformFlagBitsKHR(VkSurfaceTransfor
 }
 
 static inline std::string string_VkSurfaceTransformFlagsKHR(VkSurfaceTransformFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSurfaceTransformFlagBitsKHR(static_cast<VkSurfaceTransformFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSurfaceTransformFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SURFACE_TRANSFORM_IDENTITY_BIT_KHR, "VK_SURFACE_TRANSFORM_IDENTITY_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_ROTATE_90_BIT_KHR, "VK_SURFACE_TRANSFORM_ROTATE_90_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_ROTATE_180_BIT_KHR, "VK_SURFACE_TRANSFORM_ROTATE_180_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_ROTATE_270_BIT_KHR, "VK_SURFACE_TRANSFORM_ROTATE_270_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_BIT_KHR, "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_90_BIT_KHR, "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_90_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_180_BIT_KHR, "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_180_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_270_BIT_KHR, "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_270_BIT_KHR"},
+        {VK_SURFACE_TRANSFORM_INHERIT_BIT_KHR, "VK_SURFACE_TRANSFORM_INHERIT_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSurfaceTransformFlagBitsKHR", "VkSurfaceTransformFlagsKHR(0)");
 }
 static inline const char* string_VkCompositeAlphaFlagBitsKHR(VkCompositeAlphaFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7122,18 +6782,14 @@ static inline const char* string_VkCompositeAlphaFlagBitsKHR(VkCompositeAlphaFla
 }
 
 static inline std::string string_VkCompositeAlphaFlagsKHR(VkCompositeAlphaFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkCompositeAlphaFlagBitsKHR(static_cast<VkCompositeAlphaFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkCompositeAlphaFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR, "VK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR"},
+        {VK_COMPOSITE_ALPHA_PRE_MULTIPLIED_BIT_KHR, "VK_COMPOSITE_ALPHA_PRE_MULTIPLIED_BIT_KHR"},
+        {VK_COMPOSITE_ALPHA_POST_MULTIPLIED_BIT_KHR, "VK_COMPOSITE_ALPHA_POST_MULTIPLIED_BIT_KHR"},
+        {VK_COMPOSITE_ALPHA_INHERIT_BIT_KHR, "VK_COMPOSITE_ALPHA_INHERIT_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkCompositeAlphaFlagBitsKHR", "VkCompositeAlphaFlagsKHR(0)");
 }
 static inline const char* string_VkSwapchainCreateFlagBitsKHR(VkSwapchainCreateFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7151,18 +6807,14 @@ static inline const char* string_VkSwapchainCreateFlagBitsKHR(VkSwapchainCreateF
 }
 
 static inline std::string string_VkSwapchainCreateFlagsKHR(VkSwapchainCreateFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSwapchainCreateFlagBitsKHR(static_cast<VkSwapchainCreateFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSwapchainCreateFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SWAPCHAIN_CREATE_PROTECTED_BIT_KHR, "VK_SWAPCHAIN_CREATE_PROTECTED_BIT_KHR"},
+        {VK_SWAPCHAIN_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR, "VK_SWAPCHAIN_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR"},
+        {VK_SWAPCHAIN_CREATE_MUTABLE_FORMAT_BIT_KHR, "VK_SWAPCHAIN_CREATE_MUTABLE_FORMAT_BIT_KHR"},
+        {VK_SWAPCHAIN_CREATE_DEFERRED_MEMORY_ALLOCATION_BIT_EXT, "VK_SWAPCHAIN_CREATE_DEFERRED_MEMORY_ALLOCATION_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSwapchainCreateFlagBitsKHR", "VkSwapchainCreateFlagsKHR(0)");
 }
 static inline const char* string_VkDeviceGroupPresentModeFlagBitsKHR(VkDeviceGroupPresentModeFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7180,18 +6832,14 @@ static inline const char* string_VkDeviceGroupPresentModeFlagBitsKHR(VkDeviceGro
 }
 
 static inline std::string string_VkDeviceGroupPresentModeFlagsKHR(VkDeviceGroupPresentModeFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDeviceGroupPresentModeFlagBitsKHR(static_cast<VkDeviceGroupPresentModeFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDeviceGroupPresentModeFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_BIT_KHR, "VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_BIT_KHR"},
+        {VK_DEVICE_GROUP_PRESENT_MODE_REMOTE_BIT_KHR, "VK_DEVICE_GROUP_PRESENT_MODE_REMOTE_BIT_KHR"},
+        {VK_DEVICE_GROUP_PRESENT_MODE_SUM_BIT_KHR, "VK_DEVICE_GROUP_PRESENT_MODE_SUM_BIT_KHR"},
+        {VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_MULTI_DEVICE_BIT_KHR, "VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_MULTI_DEVICE_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDeviceGroupPresentModeFlagBitsKHR", "VkDeviceGroupPresentModeFlagsKHR(0)");
 }
 static inline const char* string_VkDisplayPlaneAlphaFlagBitsKHR(VkDisplayPlaneAlphaFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7209,18 +6857,14 @@ static inline const char* string_VkDisplayPlaneAlphaFlagBitsKHR(VkDisplayPlaneAl
 }
 
 static inline std::string string_VkDisplayPlaneAlphaFlagsKHR(VkDisplayPlaneAlphaFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDisplayPlaneAlphaFlagBitsKHR(static_cast<VkDisplayPlaneAlphaFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDisplayPlaneAlphaFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DISPLAY_PLANE_ALPHA_OPAQUE_BIT_KHR, "VK_DISPLAY_PLANE_ALPHA_OPAQUE_BIT_KHR"},
+        {VK_DISPLAY_PLANE_ALPHA_GLOBAL_BIT_KHR, "VK_DISPLAY_PLANE_ALPHA_GLOBAL_BIT_KHR"},
+        {VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_BIT_KHR, "VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_BIT_KHR"},
+        {VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_PREMULTIPLIED_BIT_KHR, "VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_PREMULTIPLIED_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDisplayPlaneAlphaFlagBitsKHR", "VkDisplayPlaneAlphaFlagsKHR(0)");
 }
 static inline const char* string_VkVideoCodecOperationFlagBitsKHR(VkVideoCodecOperationFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7244,18 +6888,19 @@ static inline const char* string_VkVideoCodecOperationFlagBitsKHR(VkVideoCodecOp
 }
 
 static inline std::string string_VkVideoCodecOperationFlagsKHR(VkVideoCodecOperationFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoCodecOperationFlagBitsKHR(static_cast<VkVideoCodecOperationFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoCodecOperationFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_CODEC_OPERATION_NONE_KHR, "VK_VIDEO_CODEC_OPERATION_NONE_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_VIDEO_CODEC_OPERATION_ENCODE_H264_BIT_EXT, "VK_VIDEO_CODEC_OPERATION_ENCODE_H264_BIT_EXT"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_VIDEO_CODEC_OPERATION_ENCODE_H265_BIT_EXT, "VK_VIDEO_CODEC_OPERATION_ENCODE_H265_BIT_EXT"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_VIDEO_CODEC_OPERATION_DECODE_H264_BIT_KHR, "VK_VIDEO_CODEC_OPERATION_DECODE_H264_BIT_KHR"},
+        {VK_VIDEO_CODEC_OPERATION_DECODE_H265_BIT_KHR, "VK_VIDEO_CODEC_OPERATION_DECODE_H265_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoCodecOperationFlagBitsKHR", "VkVideoCodecOperationFlagsKHR(0)");
 }
 static inline const char* string_VkVideoChromaSubsamplingFlagBitsKHR(VkVideoChromaSubsamplingFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7275,18 +6920,15 @@ static inline const char* string_VkVideoChromaSubsamplingFlagBitsKHR(VkVideoChro
 }
 
 static inline std::string string_VkVideoChromaSubsamplingFlagsKHR(VkVideoChromaSubsamplingFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoChromaSubsamplingFlagBitsKHR(static_cast<VkVideoChromaSubsamplingFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoChromaSubsamplingFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_CHROMA_SUBSAMPLING_INVALID_KHR, "VK_VIDEO_CHROMA_SUBSAMPLING_INVALID_KHR"},
+        {VK_VIDEO_CHROMA_SUBSAMPLING_MONOCHROME_BIT_KHR, "VK_VIDEO_CHROMA_SUBSAMPLING_MONOCHROME_BIT_KHR"},
+        {VK_VIDEO_CHROMA_SUBSAMPLING_420_BIT_KHR, "VK_VIDEO_CHROMA_SUBSAMPLING_420_BIT_KHR"},
+        {VK_VIDEO_CHROMA_SUBSAMPLING_422_BIT_KHR, "VK_VIDEO_CHROMA_SUBSAMPLING_422_BIT_KHR"},
+        {VK_VIDEO_CHROMA_SUBSAMPLING_444_BIT_KHR, "VK_VIDEO_CHROMA_SUBSAMPLING_444_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoChromaSubsamplingFlagBitsKHR", "VkVideoChromaSubsamplingFlagsKHR(0)");
 }
 static inline const char* string_VkVideoComponentBitDepthFlagBitsKHR(VkVideoComponentBitDepthFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7304,18 +6946,14 @@ static inline const char* string_VkVideoComponentBitDepthFlagBitsKHR(VkVideoComp
 }
 
 static inline std::string string_VkVideoComponentBitDepthFlagsKHR(VkVideoComponentBitDepthFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoComponentBitDepthFlagBitsKHR(static_cast<VkVideoComponentBitDepthFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoComponentBitDepthFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_COMPONENT_BIT_DEPTH_INVALID_KHR, "VK_VIDEO_COMPONENT_BIT_DEPTH_INVALID_KHR"},
+        {VK_VIDEO_COMPONENT_BIT_DEPTH_8_BIT_KHR, "VK_VIDEO_COMPONENT_BIT_DEPTH_8_BIT_KHR"},
+        {VK_VIDEO_COMPONENT_BIT_DEPTH_10_BIT_KHR, "VK_VIDEO_COMPONENT_BIT_DEPTH_10_BIT_KHR"},
+        {VK_VIDEO_COMPONENT_BIT_DEPTH_12_BIT_KHR, "VK_VIDEO_COMPONENT_BIT_DEPTH_12_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoComponentBitDepthFlagBitsKHR", "VkVideoComponentBitDepthFlagsKHR(0)");
 }
 static inline const char* string_VkVideoCapabilityFlagBitsKHR(VkVideoCapabilityFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7329,18 +6967,12 @@ static inline const char* string_VkVideoCapabilityFlagBitsKHR(VkVideoCapabilityF
 }
 
 static inline std::string string_VkVideoCapabilityFlagsKHR(VkVideoCapabilityFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoCapabilityFlagBitsKHR(static_cast<VkVideoCapabilityFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoCapabilityFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_CAPABILITY_PROTECTED_CONTENT_BIT_KHR, "VK_VIDEO_CAPABILITY_PROTECTED_CONTENT_BIT_KHR"},
+        {VK_VIDEO_CAPABILITY_SEPARATE_REFERENCE_IMAGES_BIT_KHR, "VK_VIDEO_CAPABILITY_SEPARATE_REFERENCE_IMAGES_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoCapabilityFlagBitsKHR", "VkVideoCapabilityFlagsKHR(0)");
 }
 static inline const char* string_VkVideoSessionCreateFlagBitsKHR(VkVideoSessionCreateFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7356,18 +6988,14 @@ static inline const char* string_VkVideoSessionCreateFlagBitsKHR(VkVideoSessionC
 }
 
 static inline std::string string_VkVideoSessionCreateFlagsKHR(VkVideoSessionCreateFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoSessionCreateFlagBitsKHR(static_cast<VkVideoSessionCreateFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoSessionCreateFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_SESSION_CREATE_PROTECTED_CONTENT_BIT_KHR, "VK_VIDEO_SESSION_CREATE_PROTECTED_CONTENT_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_VIDEO_SESSION_CREATE_ALLOW_ENCODE_PARAMETER_OPTIMIZATIONS_BIT_KHR, "VK_VIDEO_SESSION_CREATE_ALLOW_ENCODE_PARAMETER_OPTIMIZATIONS_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoSessionCreateFlagBitsKHR", "VkVideoSessionCreateFlagsKHR(0)");
 }
 static inline const char* string_VkVideoCodingControlFlagBitsKHR(VkVideoCodingControlFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7387,18 +7015,17 @@ static inline const char* string_VkVideoCodingControlFlagBitsKHR(VkVideoCodingCo
 }
 
 static inline std::string string_VkVideoCodingControlFlagsKHR(VkVideoCodingControlFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoCodingControlFlagBitsKHR(static_cast<VkVideoCodingControlFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoCodingControlFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_CODING_CONTROL_RESET_BIT_KHR, "VK_VIDEO_CODING_CONTROL_RESET_BIT_KHR"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_VIDEO_CODING_CONTROL_ENCODE_RATE_CONTROL_BIT_KHR, "VK_VIDEO_CODING_CONTROL_ENCODE_RATE_CONTROL_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_VIDEO_CODING_CONTROL_ENCODE_QUALITY_LEVEL_BIT_KHR, "VK_VIDEO_CODING_CONTROL_ENCODE_QUALITY_LEVEL_BIT_KHR"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoCodingControlFlagBitsKHR", "VkVideoCodingControlFlagsKHR(0)");
 }
 static inline const char* string_VkVideoDecodeCapabilityFlagBitsKHR(VkVideoDecodeCapabilityFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7412,18 +7039,12 @@ static inline const char* string_VkVideoDecodeCapabilityFlagBitsKHR(VkVideoDecod
 }
 
 static inline std::string string_VkVideoDecodeCapabilityFlagsKHR(VkVideoDecodeCapabilityFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoDecodeCapabilityFlagBitsKHR(static_cast<VkVideoDecodeCapabilityFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoDecodeCapabilityFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_COINCIDE_BIT_KHR, "VK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_COINCIDE_BIT_KHR"},
+        {VK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_DISTINCT_BIT_KHR, "VK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_DISTINCT_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoDecodeCapabilityFlagBitsKHR", "VkVideoDecodeCapabilityFlagsKHR(0)");
 }
 static inline const char* string_VkVideoDecodeUsageFlagBitsKHR(VkVideoDecodeUsageFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7441,18 +7062,14 @@ static inline const char* string_VkVideoDecodeUsageFlagBitsKHR(VkVideoDecodeUsag
 }
 
 static inline std::string string_VkVideoDecodeUsageFlagsKHR(VkVideoDecodeUsageFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoDecodeUsageFlagBitsKHR(static_cast<VkVideoDecodeUsageFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoDecodeUsageFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_DECODE_USAGE_DEFAULT_KHR, "VK_VIDEO_DECODE_USAGE_DEFAULT_KHR"},
+        {VK_VIDEO_DECODE_USAGE_TRANSCODING_BIT_KHR, "VK_VIDEO_DECODE_USAGE_TRANSCODING_BIT_KHR"},
+        {VK_VIDEO_DECODE_USAGE_OFFLINE_BIT_KHR, "VK_VIDEO_DECODE_USAGE_OFFLINE_BIT_KHR"},
+        {VK_VIDEO_DECODE_USAGE_STREAMING_BIT_KHR, "VK_VIDEO_DECODE_USAGE_STREAMING_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoDecodeUsageFlagBitsKHR", "VkVideoDecodeUsageFlagsKHR(0)");
 }
 static inline const char* string_VkVideoDecodeH264PictureLayoutFlagBitsKHR(VkVideoDecodeH264PictureLayoutFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7468,18 +7085,13 @@ static inline const char* string_VkVideoDecodeH264PictureLayoutFlagBitsKHR(VkVid
 }
 
 static inline std::string string_VkVideoDecodeH264PictureLayoutFlagsKHR(VkVideoDecodeH264PictureLayoutFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoDecodeH264PictureLayoutFlagBitsKHR(static_cast<VkVideoDecodeH264PictureLayoutFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoDecodeH264PictureLayoutFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_PROGRESSIVE_KHR, "VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_PROGRESSIVE_KHR"},
+        {VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_INTERLEAVED_LINES_BIT_KHR, "VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_INTERLEAVED_LINES_BIT_KHR"},
+        {VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_SEPARATE_PLANES_BIT_KHR, "VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_SEPARATE_PLANES_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoDecodeH264PictureLayoutFlagBitsKHR", "VkVideoDecodeH264PictureLayoutFlagsKHR(0)");
 }
 static inline const char* string_VkPerformanceCounterDescriptionFlagBitsKHR(VkPerformanceCounterDescriptionFlagBitsKHR input_value) {
     switch (input_value) {
@@ -7493,18 +7105,12 @@ static inline const char* string_VkPerformanceCounterDescriptionFlagBitsKHR(VkPe
 }
 
 static inline std::string string_VkPerformanceCounterDescriptionFlagsKHR(VkPerformanceCounterDescriptionFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPerformanceCounterDescriptionFlagBitsKHR(static_cast<VkPerformanceCounterDescriptionFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPerformanceCounterDescriptionFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PERFORMANCE_COUNTER_DESCRIPTION_PERFORMANCE_IMPACTING_BIT_KHR, "VK_PERFORMANCE_COUNTER_DESCRIPTION_PERFORMANCE_IMPACTING_BIT_KHR"},
+        {VK_PERFORMANCE_COUNTER_DESCRIPTION_CONCURRENTLY_IMPACTED_BIT_KHR, "VK_PERFORMANCE_COUNTER_DESCRIPTION_CONCURRENTLY_IMPACTED_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPerformanceCounterDescriptionFlagBitsKHR", "VkPerformanceCounterDescriptionFlagsKHR(0)");
 }
 #ifdef VK_ENABLE_BETA_EXTENSIONS
 static inline const char* string_VkVideoEncodeCapabilityFlagBitsKHR(VkVideoEncodeCapabilityFlagBitsKHR input_value) {
@@ -7517,18 +7123,11 @@ static inline const char* string_VkVideoEncodeCapabilityFlagBitsKHR(VkVideoEncod
 }
 
 static inline std::string string_VkVideoEncodeCapabilityFlagsKHR(VkVideoEncodeCapabilityFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeCapabilityFlagBitsKHR(static_cast<VkVideoEncodeCapabilityFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeCapabilityFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_CAPABILITY_PRECEDING_EXTERNALLY_ENCODED_BYTES_BIT_KHR, "VK_VIDEO_ENCODE_CAPABILITY_PRECEDING_EXTERNALLY_ENCODED_BYTES_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeCapabilityFlagBitsKHR", "VkVideoEncodeCapabilityFlagsKHR(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7548,18 +7147,14 @@ static inline const char* string_VkVideoEncodeRateControlModeFlagBitsKHR(VkVideo
 }
 
 static inline std::string string_VkVideoEncodeRateControlModeFlagsKHR(VkVideoEncodeRateControlModeFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeRateControlModeFlagBitsKHR(static_cast<VkVideoEncodeRateControlModeFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeRateControlModeFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_RATE_CONTROL_MODE_DEFAULT_KHR, "VK_VIDEO_ENCODE_RATE_CONTROL_MODE_DEFAULT_KHR"},
+        {VK_VIDEO_ENCODE_RATE_CONTROL_MODE_DISABLED_BIT_KHR, "VK_VIDEO_ENCODE_RATE_CONTROL_MODE_DISABLED_BIT_KHR"},
+        {VK_VIDEO_ENCODE_RATE_CONTROL_MODE_CBR_BIT_KHR, "VK_VIDEO_ENCODE_RATE_CONTROL_MODE_CBR_BIT_KHR"},
+        {VK_VIDEO_ENCODE_RATE_CONTROL_MODE_VBR_BIT_KHR, "VK_VIDEO_ENCODE_RATE_CONTROL_MODE_VBR_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeRateControlModeFlagBitsKHR", "VkVideoEncodeRateControlModeFlagsKHR(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7577,18 +7172,13 @@ static inline const char* string_VkVideoEncodeFeedbackFlagBitsKHR(VkVideoEncodeF
 }
 
 static inline std::string string_VkVideoEncodeFeedbackFlagsKHR(VkVideoEncodeFeedbackFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeFeedbackFlagBitsKHR(static_cast<VkVideoEncodeFeedbackFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeFeedbackFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BUFFER_OFFSET_BIT_KHR, "VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BUFFER_OFFSET_BIT_KHR"},
+        {VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BYTES_WRITTEN_BIT_KHR, "VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BYTES_WRITTEN_BIT_KHR"},
+        {VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_HAS_OVERRIDES_BIT_KHR, "VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_HAS_OVERRIDES_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeFeedbackFlagBitsKHR", "VkVideoEncodeFeedbackFlagsKHR(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7610,18 +7200,15 @@ static inline const char* string_VkVideoEncodeUsageFlagBitsKHR(VkVideoEncodeUsag
 }
 
 static inline std::string string_VkVideoEncodeUsageFlagsKHR(VkVideoEncodeUsageFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeUsageFlagBitsKHR(static_cast<VkVideoEncodeUsageFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeUsageFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_USAGE_DEFAULT_KHR, "VK_VIDEO_ENCODE_USAGE_DEFAULT_KHR"},
+        {VK_VIDEO_ENCODE_USAGE_TRANSCODING_BIT_KHR, "VK_VIDEO_ENCODE_USAGE_TRANSCODING_BIT_KHR"},
+        {VK_VIDEO_ENCODE_USAGE_STREAMING_BIT_KHR, "VK_VIDEO_ENCODE_USAGE_STREAMING_BIT_KHR"},
+        {VK_VIDEO_ENCODE_USAGE_RECORDING_BIT_KHR, "VK_VIDEO_ENCODE_USAGE_RECORDING_BIT_KHR"},
+        {VK_VIDEO_ENCODE_USAGE_CONFERENCING_BIT_KHR, "VK_VIDEO_ENCODE_USAGE_CONFERENCING_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeUsageFlagBitsKHR", "VkVideoEncodeUsageFlagsKHR(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7641,18 +7228,14 @@ static inline const char* string_VkVideoEncodeContentFlagBitsKHR(VkVideoEncodeCo
 }
 
 static inline std::string string_VkVideoEncodeContentFlagsKHR(VkVideoEncodeContentFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeContentFlagBitsKHR(static_cast<VkVideoEncodeContentFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeContentFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_CONTENT_DEFAULT_KHR, "VK_VIDEO_ENCODE_CONTENT_DEFAULT_KHR"},
+        {VK_VIDEO_ENCODE_CONTENT_CAMERA_BIT_KHR, "VK_VIDEO_ENCODE_CONTENT_CAMERA_BIT_KHR"},
+        {VK_VIDEO_ENCODE_CONTENT_DESKTOP_BIT_KHR, "VK_VIDEO_ENCODE_CONTENT_DESKTOP_BIT_KHR"},
+        {VK_VIDEO_ENCODE_CONTENT_RENDERED_BIT_KHR, "VK_VIDEO_ENCODE_CONTENT_RENDERED_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeContentFlagBitsKHR", "VkVideoEncodeContentFlagsKHR(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 static inline const char* string_VkDebugReportFlagBitsEXT(VkDebugReportFlagBitsEXT input_value) {
@@ -7673,18 +7256,15 @@ static inline const char* string_VkDebugReportFlagBitsEXT(VkDebugReportFlagBitsE
 }
 
 static inline std::string string_VkDebugReportFlagsEXT(VkDebugReportFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDebugReportFlagBitsEXT(static_cast<VkDebugReportFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDebugReportFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEBUG_REPORT_INFORMATION_BIT_EXT, "VK_DEBUG_REPORT_INFORMATION_BIT_EXT"},
+        {VK_DEBUG_REPORT_WARNING_BIT_EXT, "VK_DEBUG_REPORT_WARNING_BIT_EXT"},
+        {VK_DEBUG_REPORT_PERFORMANCE_WARNING_BIT_EXT, "VK_DEBUG_REPORT_PERFORMANCE_WARNING_BIT_EXT"},
+        {VK_DEBUG_REPORT_ERROR_BIT_EXT, "VK_DEBUG_REPORT_ERROR_BIT_EXT"},
+        {VK_DEBUG_REPORT_DEBUG_BIT_EXT, "VK_DEBUG_REPORT_DEBUG_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDebugReportFlagBitsEXT", "VkDebugReportFlagsEXT(0)");
 }
 #ifdef VK_ENABLE_BETA_EXTENSIONS
 static inline const char* string_VkVideoEncodeH264CapabilityFlagBitsEXT(VkVideoEncodeH264CapabilityFlagBitsEXT input_value) {
@@ -7713,18 +7293,19 @@ static inline const char* string_VkVideoEncodeH264CapabilityFlagBitsEXT(VkVideoE
 }
 
 static inline std::string string_VkVideoEncodeH264CapabilityFlagsEXT(VkVideoEncodeH264CapabilityFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH264CapabilityFlagBitsEXT(static_cast<VkVideoEncodeH264CapabilityFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH264CapabilityFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_HRD_COMPLIANCE_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_HRD_COMPLIANCE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_ROW_UNALIGNED_SLICE_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_ROW_UNALIGNED_SLICE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_DIFFERENT_SLICE_TYPE_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_DIFFERENT_SLICE_TYPE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_PER_SLICE_CONSTANT_QP_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_PER_SLICE_CONSTANT_QP_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_CAPABILITY_GENERATE_PREFIX_NALU_BIT_EXT, "VK_VIDEO_ENCODE_H264_CAPABILITY_GENERATE_PREFIX_NALU_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH264CapabilityFlagBitsEXT", "VkVideoEncodeH264CapabilityFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7772,18 +7353,28 @@ static inline const char* string_VkVideoEncodeH264StdFlagBitsEXT(VkVideoEncodeH2
 }
 
 static inline std::string string_VkVideoEncodeH264StdFlagsEXT(VkVideoEncodeH264StdFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH264StdFlagBitsEXT(static_cast<VkVideoEncodeH264StdFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH264StdFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H264_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_SCALING_MATRIX_PRESENT_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_SCALING_MATRIX_PRESENT_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_CHROMA_QP_INDEX_OFFSET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_CHROMA_QP_INDEX_OFFSET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_SECOND_CHROMA_QP_INDEX_OFFSET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_SECOND_CHROMA_QP_INDEX_OFFSET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_PIC_INIT_QP_MINUS26_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_PIC_INIT_QP_MINUS26_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_WEIGHTED_PRED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_WEIGHTED_PRED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_EXPLICIT_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_EXPLICIT_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_IMPLICIT_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_IMPLICIT_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_TRANSFORM_8X8_MODE_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_TRANSFORM_8X8_MODE_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_DIRECT_SPATIAL_MV_PRED_FLAG_UNSET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_DIRECT_SPATIAL_MV_PRED_FLAG_UNSET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_UNSET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_UNSET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_DIRECT_8X8_INFERENCE_FLAG_UNSET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_DIRECT_8X8_INFERENCE_FLAG_UNSET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_DISABLED_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_DISABLED_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_ENABLED_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_ENABLED_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_PARTIAL_BIT_EXT, "VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_PARTIAL_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH264StdFlagBitsEXT", "VkVideoEncodeH264StdFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7805,18 +7396,15 @@ static inline const char* string_VkVideoEncodeH264RateControlFlagBitsEXT(VkVideo
 }
 
 static inline std::string string_VkVideoEncodeH264RateControlFlagsEXT(VkVideoEncodeH264RateControlFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH264RateControlFlagBitsEXT(static_cast<VkVideoEncodeH264RateControlFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH264RateControlFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H264_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_EXT, "VK_VIDEO_ENCODE_H264_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_RATE_CONTROL_REGULAR_GOP_BIT_EXT, "VK_VIDEO_ENCODE_H264_RATE_CONTROL_REGULAR_GOP_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_EXT, "VK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_EXT, "VK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H264_RATE_CONTROL_TEMPORAL_LAYER_PATTERN_DYADIC_BIT_EXT, "VK_VIDEO_ENCODE_H264_RATE_CONTROL_TEMPORAL_LAYER_PATTERN_DYADIC_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH264RateControlFlagBitsEXT", "VkVideoEncodeH264RateControlFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7848,18 +7436,20 @@ static inline const char* string_VkVideoEncodeH265CapabilityFlagBitsEXT(VkVideoE
 }
 
 static inline std::string string_VkVideoEncodeH265CapabilityFlagsEXT(VkVideoEncodeH265CapabilityFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH265CapabilityFlagBitsEXT(static_cast<VkVideoEncodeH265CapabilityFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH265CapabilityFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_HRD_COMPLIANCE_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_HRD_COMPLIANCE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_ROW_UNALIGNED_SLICE_SEGMENT_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_ROW_UNALIGNED_SLICE_SEGMENT_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_DIFFERENT_SLICE_SEGMENT_TYPE_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_DIFFERENT_SLICE_SEGMENT_TYPE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_PER_SLICE_SEGMENT_CONSTANT_QP_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_PER_SLICE_SEGMENT_CONSTANT_QP_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_TILES_PER_SLICE_SEGMENT_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_TILES_PER_SLICE_SEGMENT_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_SLICE_SEGMENTS_PER_TILE_BIT_EXT, "VK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_SLICE_SEGMENTS_PER_TILE_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH265CapabilityFlagBitsEXT", "VkVideoEncodeH265CapabilityFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7909,18 +7499,29 @@ static inline const char* string_VkVideoEncodeH265StdFlagBitsEXT(VkVideoEncodeH2
 }
 
 static inline std::string string_VkVideoEncodeH265StdFlagsEXT(VkVideoEncodeH265StdFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH265StdFlagBitsEXT(static_cast<VkVideoEncodeH265StdFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH265StdFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H265_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_SCALING_LIST_DATA_PRESENT_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_SCALING_LIST_DATA_PRESENT_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_PCM_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_PCM_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_SPS_TEMPORAL_MVP_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_SPS_TEMPORAL_MVP_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_INIT_QP_MINUS26_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_INIT_QP_MINUS26_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_WEIGHTED_PRED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_WEIGHTED_PRED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_WEIGHTED_BIPRED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_WEIGHTED_BIPRED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_LOG2_PARALLEL_MERGE_LEVEL_MINUS2_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_LOG2_PARALLEL_MERGE_LEVEL_MINUS2_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_SIGN_DATA_HIDING_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_SIGN_DATA_HIDING_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_UNSET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_UNSET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_TRANSQUANT_BYPASS_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_TRANSQUANT_BYPASS_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_ENTROPY_CODING_SYNC_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_ENTROPY_CODING_SYNC_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_DEBLOCKING_FILTER_OVERRIDE_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_DEBLOCKING_FILTER_OVERRIDE_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENTS_ENABLED_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENTS_ENABLED_FLAG_SET_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENT_FLAG_SET_BIT_EXT, "VK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENT_FLAG_SET_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH265StdFlagBitsEXT", "VkVideoEncodeH265StdFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7938,18 +7539,13 @@ static inline const char* string_VkVideoEncodeH265CtbSizeFlagBitsEXT(VkVideoEnco
 }
 
 static inline std::string string_VkVideoEncodeH265CtbSizeFlagsEXT(VkVideoEncodeH265CtbSizeFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH265CtbSizeFlagBitsEXT(static_cast<VkVideoEncodeH265CtbSizeFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH265CtbSizeFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H265_CTB_SIZE_16_BIT_EXT, "VK_VIDEO_ENCODE_H265_CTB_SIZE_16_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CTB_SIZE_32_BIT_EXT, "VK_VIDEO_ENCODE_H265_CTB_SIZE_32_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_CTB_SIZE_64_BIT_EXT, "VK_VIDEO_ENCODE_H265_CTB_SIZE_64_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH265CtbSizeFlagBitsEXT", "VkVideoEncodeH265CtbSizeFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -7969,18 +7565,14 @@ static inline const char* string_VkVideoEncodeH265TransformBlockSizeFlagBitsEXT(
 }
 
 static inline std::string string_VkVideoEncodeH265TransformBlockSizeFlagsEXT(VkVideoEncodeH265TransformBlockSizeFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH265TransformBlockSizeFlagBitsEXT(static_cast<VkVideoEncodeH265TransformBlockSizeFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH265TransformBlockSizeFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_4_BIT_EXT, "VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_4_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_8_BIT_EXT, "VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_8_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_16_BIT_EXT, "VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_16_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_32_BIT_EXT, "VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_32_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH265TransformBlockSizeFlagBitsEXT", "VkVideoEncodeH265TransformBlockSizeFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 #ifdef VK_ENABLE_BETA_EXTENSIONS
@@ -8002,18 +7594,15 @@ static inline const char* string_VkVideoEncodeH265RateControlFlagBitsEXT(VkVideo
 }
 
 static inline std::string string_VkVideoEncodeH265RateControlFlagsEXT(VkVideoEncodeH265RateControlFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkVideoEncodeH265RateControlFlagBitsEXT(static_cast<VkVideoEncodeH265RateControlFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkVideoEncodeH265RateControlFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_VIDEO_ENCODE_H265_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_EXT, "VK_VIDEO_ENCODE_H265_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_RATE_CONTROL_REGULAR_GOP_BIT_EXT, "VK_VIDEO_ENCODE_H265_RATE_CONTROL_REGULAR_GOP_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_EXT, "VK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_EXT, "VK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_EXT"},
+        {VK_VIDEO_ENCODE_H265_RATE_CONTROL_TEMPORAL_SUB_LAYER_PATTERN_DYADIC_BIT_EXT, "VK_VIDEO_ENCODE_H265_RATE_CONTROL_TEMPORAL_SUB_LAYER_PATTERN_DYADIC_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkVideoEncodeH265RateControlFlagBitsEXT", "VkVideoEncodeH265RateControlFlagsEXT(0)");
 }
 #endif //VK_ENABLE_BETA_EXTENSIONS
 static inline const char* string_VkExternalMemoryHandleTypeFlagBitsNV(VkExternalMemoryHandleTypeFlagBitsNV input_value) {
@@ -8032,18 +7621,14 @@ static inline const char* string_VkExternalMemoryHandleTypeFlagBitsNV(VkExternal
 }
 
 static inline std::string string_VkExternalMemoryHandleTypeFlagsNV(VkExternalMemoryHandleTypeFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalMemoryHandleTypeFlagBitsNV(static_cast<VkExternalMemoryHandleTypeFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalMemoryHandleTypeFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_NV, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_NV"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_NV, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_NV"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_BIT_NV, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_BIT_NV"},
+        {VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_KMT_BIT_NV, "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_KMT_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalMemoryHandleTypeFlagBitsNV", "VkExternalMemoryHandleTypeFlagsNV(0)");
 }
 static inline const char* string_VkExternalMemoryFeatureFlagBitsNV(VkExternalMemoryFeatureFlagBitsNV input_value) {
     switch (input_value) {
@@ -8059,18 +7644,13 @@ static inline const char* string_VkExternalMemoryFeatureFlagBitsNV(VkExternalMem
 }
 
 static inline std::string string_VkExternalMemoryFeatureFlagsNV(VkExternalMemoryFeatureFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExternalMemoryFeatureFlagBitsNV(static_cast<VkExternalMemoryFeatureFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExternalMemoryFeatureFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_NV, "VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_NV"},
+        {VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_NV, "VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_NV"},
+        {VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_NV, "VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExternalMemoryFeatureFlagBitsNV", "VkExternalMemoryFeatureFlagsNV(0)");
 }
 static inline const char* string_VkConditionalRenderingFlagBitsEXT(VkConditionalRenderingFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8082,18 +7662,11 @@ static inline const char* string_VkConditionalRenderingFlagBitsEXT(VkConditional
 }
 
 static inline std::string string_VkConditionalRenderingFlagsEXT(VkConditionalRenderingFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkConditionalRenderingFlagBitsEXT(static_cast<VkConditionalRenderingFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkConditionalRenderingFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_CONDITIONAL_RENDERING_INVERTED_BIT_EXT, "VK_CONDITIONAL_RENDERING_INVERTED_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkConditionalRenderingFlagBitsEXT", "VkConditionalRenderingFlagsEXT(0)");
 }
 static inline const char* string_VkSurfaceCounterFlagBitsEXT(VkSurfaceCounterFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8105,18 +7678,11 @@ static inline const char* string_VkSurfaceCounterFlagBitsEXT(VkSurfaceCounterFla
 }
 
 static inline std::string string_VkSurfaceCounterFlagsEXT(VkSurfaceCounterFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkSurfaceCounterFlagBitsEXT(static_cast<VkSurfaceCounterFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkSurfaceCounterFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SURFACE_COUNTER_VBLANK_BIT_EXT, "VK_SURFACE_COUNTER_VBLANK_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkSurfaceCounterFlagBitsEXT", "VkSurfaceCounterFlagsEXT(0)");
 }
 static inline const char* string_VkDebugUtilsMessageSeverityFlagBitsEXT(VkDebugUtilsMessageSeverityFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8134,18 +7700,14 @@ static inline const char* string_VkDebugUtilsMessageSeverityFlagBitsEXT(VkDebugU
 }
 
 static inline std::string string_VkDebugUtilsMessageSeverityFlagsEXT(VkDebugUtilsMessageSeverityFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDebugUtilsMessageSeverityFlagBitsEXT(static_cast<VkDebugUtilsMessageSeverityFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDebugUtilsMessageSeverityFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT"},
+        {VK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT"},
+        {VK_DEBUG_UTILS_MESSAGE_SEVERITY_WARNING_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_SEVERITY_WARNING_BIT_EXT"},
+        {VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDebugUtilsMessageSeverityFlagBitsEXT", "VkDebugUtilsMessageSeverityFlagsEXT(0)");
 }
 static inline const char* string_VkDebugUtilsMessageTypeFlagBitsEXT(VkDebugUtilsMessageTypeFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8163,18 +7725,14 @@ static inline const char* string_VkDebugUtilsMessageTypeFlagBitsEXT(VkDebugUtils
 }
 
 static inline std::string string_VkDebugUtilsMessageTypeFlagsEXT(VkDebugUtilsMessageTypeFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDebugUtilsMessageTypeFlagBitsEXT(static_cast<VkDebugUtilsMessageTypeFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDebugUtilsMessageTypeFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT"},
+        {VK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT"},
+        {VK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT"},
+        {VK_DEBUG_UTILS_MESSAGE_TYPE_DEVICE_ADDRESS_BINDING_BIT_EXT, "VK_DEBUG_UTILS_MESSAGE_TYPE_DEVICE_ADDRESS_BINDING_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDebugUtilsMessageTypeFlagBitsEXT", "VkDebugUtilsMessageTypeFlagsEXT(0)");
 }
 static inline const char* string_VkGeometryFlagBitsKHR(VkGeometryFlagBitsKHR input_value) {
     switch (input_value) {
@@ -8188,18 +7746,12 @@ static inline const char* string_VkGeometryFlagBitsKHR(VkGeometryFlagBitsKHR inp
 }
 
 static inline std::string string_VkGeometryFlagsKHR(VkGeometryFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkGeometryFlagBitsKHR(static_cast<VkGeometryFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkGeometryFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_GEOMETRY_OPAQUE_BIT_KHR, "VK_GEOMETRY_OPAQUE_BIT_KHR"},
+        {VK_GEOMETRY_NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_KHR, "VK_GEOMETRY_NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkGeometryFlagBitsKHR", "VkGeometryFlagsKHR(0)");
 }
 static inline const char* string_VkGeometryInstanceFlagBitsKHR(VkGeometryInstanceFlagBitsKHR input_value) {
     switch (input_value) {
@@ -8221,18 +7773,16 @@ static inline const char* string_VkGeometryInstanceFlagBitsKHR(VkGeometryInstanc
 }
 
 static inline std::string string_VkGeometryInstanceFlagsKHR(VkGeometryInstanceFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkGeometryInstanceFlagBitsKHR(static_cast<VkGeometryInstanceFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkGeometryInstanceFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_GEOMETRY_INSTANCE_TRIANGLE_FACING_CULL_DISABLE_BIT_KHR, "VK_GEOMETRY_INSTANCE_TRIANGLE_FACING_CULL_DISABLE_BIT_KHR"},
+        {VK_GEOMETRY_INSTANCE_TRIANGLE_FLIP_FACING_BIT_KHR, "VK_GEOMETRY_INSTANCE_TRIANGLE_FLIP_FACING_BIT_KHR"},
+        {VK_GEOMETRY_INSTANCE_FORCE_OPAQUE_BIT_KHR, "VK_GEOMETRY_INSTANCE_FORCE_OPAQUE_BIT_KHR"},
+        {VK_GEOMETRY_INSTANCE_FORCE_NO_OPAQUE_BIT_KHR, "VK_GEOMETRY_INSTANCE_FORCE_NO_OPAQUE_BIT_KHR"},
+        {VK_GEOMETRY_INSTANCE_FORCE_OPACITY_MICROMAP_2_STATE_EXT, "VK_GEOMETRY_INSTANCE_FORCE_OPACITY_MICROMAP_2_STATE_EXT"},
+        {VK_GEOMETRY_INSTANCE_DISABLE_OPACITY_MICROMAPS_EXT, "VK_GEOMETRY_INSTANCE_DISABLE_OPACITY_MICROMAPS_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkGeometryInstanceFlagBitsKHR", "VkGeometryInstanceFlagsKHR(0)");
 }
 static inline const char* string_VkBuildAccelerationStructureFlagBitsKHR(VkBuildAccelerationStructureFlagBitsKHR input_value) {
     switch (input_value) {
@@ -8266,18 +7816,23 @@ static inline const char* string_VkBuildAccelerationStructureFlagBitsKHR(VkBuild
 }
 
 static inline std::string string_VkBuildAccelerationStructureFlagsKHR(VkBuildAccelerationStructureFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkBuildAccelerationStructureFlagBitsKHR(static_cast<VkBuildAccelerationStructureFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkBuildAccelerationStructureFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_UPDATE_BIT_KHR, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_UPDATE_BIT_KHR"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_COMPACTION_BIT_KHR, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_COMPACTION_BIT_KHR"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_TRACE_BIT_KHR, "VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_TRACE_BIT_KHR"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_BUILD_BIT_KHR, "VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_BUILD_BIT_KHR"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_LOW_MEMORY_BIT_KHR, "VK_BUILD_ACCELERATION_STRUCTURE_LOW_MEMORY_BIT_KHR"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_MOTION_BIT_NV, "VK_BUILD_ACCELERATION_STRUCTURE_MOTION_BIT_NV"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_UPDATE_EXT, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_UPDATE_EXT"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DISABLE_OPACITY_MICROMAPS_EXT, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DISABLE_OPACITY_MICROMAPS_EXT"},
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_DATA_UPDATE_EXT, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_DATA_UPDATE_EXT"},
+#ifdef VK_ENABLE_BETA_EXTENSIONS
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DISPLACEMENT_MICROMAP_UPDATE_NV, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DISPLACEMENT_MICROMAP_UPDATE_NV"},
+#endif //VK_ENABLE_BETA_EXTENSIONS
+        {VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DATA_ACCESS_KHR, "VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DATA_ACCESS_KHR"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkBuildAccelerationStructureFlagBitsKHR", "VkBuildAccelerationStructureFlagsKHR(0)");
 }
 static inline const char* string_VkPresentScalingFlagBitsEXT(VkPresentScalingFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8293,18 +7848,13 @@ static inline const char* string_VkPresentScalingFlagBitsEXT(VkPresentScalingFla
 }
 
 static inline std::string string_VkPresentScalingFlagsEXT(VkPresentScalingFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPresentScalingFlagBitsEXT(static_cast<VkPresentScalingFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPresentScalingFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PRESENT_SCALING_ONE_TO_ONE_BIT_EXT, "VK_PRESENT_SCALING_ONE_TO_ONE_BIT_EXT"},
+        {VK_PRESENT_SCALING_ASPECT_RATIO_STRETCH_BIT_EXT, "VK_PRESENT_SCALING_ASPECT_RATIO_STRETCH_BIT_EXT"},
+        {VK_PRESENT_SCALING_STRETCH_BIT_EXT, "VK_PRESENT_SCALING_STRETCH_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPresentScalingFlagBitsEXT", "VkPresentScalingFlagsEXT(0)");
 }
 static inline const char* string_VkPresentGravityFlagBitsEXT(VkPresentGravityFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8320,18 +7870,13 @@ static inline const char* string_VkPresentGravityFlagBitsEXT(VkPresentGravityFla
 }
 
 static inline std::string string_VkPresentGravityFlagsEXT(VkPresentGravityFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkPresentGravityFlagBitsEXT(static_cast<VkPresentGravityFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkPresentGravityFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_PRESENT_GRAVITY_MIN_BIT_EXT, "VK_PRESENT_GRAVITY_MIN_BIT_EXT"},
+        {VK_PRESENT_GRAVITY_MAX_BIT_EXT, "VK_PRESENT_GRAVITY_MAX_BIT_EXT"},
+        {VK_PRESENT_GRAVITY_CENTERED_BIT_EXT, "VK_PRESENT_GRAVITY_CENTERED_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkPresentGravityFlagBitsEXT", "VkPresentGravityFlagsEXT(0)");
 }
 static inline const char* string_VkIndirectStateFlagBitsNV(VkIndirectStateFlagBitsNV input_value) {
     switch (input_value) {
@@ -8343,18 +7888,11 @@ static inline const char* string_VkIndirectStateFlagBitsNV(VkIndirectStateFlagBi
 }
 
 static inline std::string string_VkIndirectStateFlagsNV(VkIndirectStateFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkIndirectStateFlagBitsNV(static_cast<VkIndirectStateFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkIndirectStateFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_INDIRECT_STATE_FLAG_FRONTFACE_BIT_NV, "VK_INDIRECT_STATE_FLAG_FRONTFACE_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkIndirectStateFlagBitsNV", "VkIndirectStateFlagsNV(0)");
 }
 static inline const char* string_VkIndirectCommandsLayoutUsageFlagBitsNV(VkIndirectCommandsLayoutUsageFlagBitsNV input_value) {
     switch (input_value) {
@@ -8370,18 +7908,13 @@ static inline const char* string_VkIndirectCommandsLayoutUsageFlagBitsNV(VkIndir
 }
 
 static inline std::string string_VkIndirectCommandsLayoutUsageFlagsNV(VkIndirectCommandsLayoutUsageFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkIndirectCommandsLayoutUsageFlagBitsNV(static_cast<VkIndirectCommandsLayoutUsageFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkIndirectCommandsLayoutUsageFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_INDIRECT_COMMANDS_LAYOUT_USAGE_EXPLICIT_PREPROCESS_BIT_NV, "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_EXPLICIT_PREPROCESS_BIT_NV"},
+        {VK_INDIRECT_COMMANDS_LAYOUT_USAGE_INDEXED_SEQUENCES_BIT_NV, "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_INDEXED_SEQUENCES_BIT_NV"},
+        {VK_INDIRECT_COMMANDS_LAYOUT_USAGE_UNORDERED_SEQUENCES_BIT_NV, "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_UNORDERED_SEQUENCES_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkIndirectCommandsLayoutUsageFlagBitsNV", "VkIndirectCommandsLayoutUsageFlagsNV(0)");
 }
 static inline const char* string_VkDeviceDiagnosticsConfigFlagBitsNV(VkDeviceDiagnosticsConfigFlagBitsNV input_value) {
     switch (input_value) {
@@ -8399,18 +7932,14 @@ static inline const char* string_VkDeviceDiagnosticsConfigFlagBitsNV(VkDeviceDia
 }
 
 static inline std::string string_VkDeviceDiagnosticsConfigFlagsNV(VkDeviceDiagnosticsConfigFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDeviceDiagnosticsConfigFlagBitsNV(static_cast<VkDeviceDiagnosticsConfigFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDeviceDiagnosticsConfigFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_DEBUG_INFO_BIT_NV, "VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_DEBUG_INFO_BIT_NV"},
+        {VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_RESOURCE_TRACKING_BIT_NV, "VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_RESOURCE_TRACKING_BIT_NV"},
+        {VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_AUTOMATIC_CHECKPOINTS_BIT_NV, "VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_AUTOMATIC_CHECKPOINTS_BIT_NV"},
+        {VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_ERROR_REPORTING_BIT_NV, "VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_ERROR_REPORTING_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDeviceDiagnosticsConfigFlagBitsNV", "VkDeviceDiagnosticsConfigFlagsNV(0)");
 }
 #ifdef VK_USE_PLATFORM_METAL_EXT
 static inline const char* string_VkExportMetalObjectTypeFlagBitsEXT(VkExportMetalObjectTypeFlagBitsEXT input_value) {
@@ -8433,18 +7962,16 @@ static inline const char* string_VkExportMetalObjectTypeFlagBitsEXT(VkExportMeta
 }
 
 static inline std::string string_VkExportMetalObjectTypeFlagsEXT(VkExportMetalObjectTypeFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkExportMetalObjectTypeFlagBitsEXT(static_cast<VkExportMetalObjectTypeFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkExportMetalObjectTypeFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_EXPORT_METAL_OBJECT_TYPE_METAL_DEVICE_BIT_EXT, "VK_EXPORT_METAL_OBJECT_TYPE_METAL_DEVICE_BIT_EXT"},
+        {VK_EXPORT_METAL_OBJECT_TYPE_METAL_COMMAND_QUEUE_BIT_EXT, "VK_EXPORT_METAL_OBJECT_TYPE_METAL_COMMAND_QUEUE_BIT_EXT"},
+        {VK_EXPORT_METAL_OBJECT_TYPE_METAL_BUFFER_BIT_EXT, "VK_EXPORT_METAL_OBJECT_TYPE_METAL_BUFFER_BIT_EXT"},
+        {VK_EXPORT_METAL_OBJECT_TYPE_METAL_TEXTURE_BIT_EXT, "VK_EXPORT_METAL_OBJECT_TYPE_METAL_TEXTURE_BIT_EXT"},
+        {VK_EXPORT_METAL_OBJECT_TYPE_METAL_IOSURFACE_BIT_EXT, "VK_EXPORT_METAL_OBJECT_TYPE_METAL_IOSURFACE_BIT_EXT"},
+        {VK_EXPORT_METAL_OBJECT_TYPE_METAL_SHARED_EVENT_BIT_EXT, "VK_EXPORT_METAL_OBJECT_TYPE_METAL_SHARED_EVENT_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkExportMetalObjectTypeFlagBitsEXT", "VkExportMetalObjectTypeFlagsEXT(0)");
 }
 #endif //VK_USE_PLATFORM_METAL_EXT
 static inline const char* string_VkGraphicsPipelineLibraryFlagBitsEXT(VkGraphicsPipelineLibraryFlagBitsEXT input_value) {
@@ -8463,18 +7990,14 @@ static inline const char* string_VkGraphicsPipelineLibraryFlagBitsEXT(VkGraphics
 }
 
 static inline std::string string_VkGraphicsPipelineLibraryFlagsEXT(VkGraphicsPipelineLibraryFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkGraphicsPipelineLibraryFlagBitsEXT(static_cast<VkGraphicsPipelineLibraryFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkGraphicsPipelineLibraryFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_GRAPHICS_PIPELINE_LIBRARY_VERTEX_INPUT_INTERFACE_BIT_EXT, "VK_GRAPHICS_PIPELINE_LIBRARY_VERTEX_INPUT_INTERFACE_BIT_EXT"},
+        {VK_GRAPHICS_PIPELINE_LIBRARY_PRE_RASTERIZATION_SHADERS_BIT_EXT, "VK_GRAPHICS_PIPELINE_LIBRARY_PRE_RASTERIZATION_SHADERS_BIT_EXT"},
+        {VK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_SHADER_BIT_EXT, "VK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_SHADER_BIT_EXT"},
+        {VK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_OUTPUT_INTERFACE_BIT_EXT, "VK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_OUTPUT_INTERFACE_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkGraphicsPipelineLibraryFlagBitsEXT", "VkGraphicsPipelineLibraryFlagsEXT(0)");
 }
 static inline const char* string_VkImageCompressionFlagBitsEXT(VkImageCompressionFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8492,18 +8015,14 @@ static inline const char* string_VkImageCompressionFlagBitsEXT(VkImageCompressio
 }
 
 static inline std::string string_VkImageCompressionFlagsEXT(VkImageCompressionFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageCompressionFlagBitsEXT(static_cast<VkImageCompressionFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageCompressionFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_COMPRESSION_DEFAULT_EXT, "VK_IMAGE_COMPRESSION_DEFAULT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_DEFAULT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_DEFAULT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_EXPLICIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_EXPLICIT_EXT"},
+        {VK_IMAGE_COMPRESSION_DISABLED_EXT, "VK_IMAGE_COMPRESSION_DISABLED_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageCompressionFlagBitsEXT", "VkImageCompressionFlagsEXT(0)");
 }
 static inline const char* string_VkImageCompressionFixedRateFlagBitsEXT(VkImageCompressionFixedRateFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8563,18 +8082,35 @@ static inline const char* string_VkImageCompressionFixedRateFlagBitsEXT(VkImageC
 }
 
 static inline std::string string_VkImageCompressionFixedRateFlagsEXT(VkImageCompressionFixedRateFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageCompressionFixedRateFlagBitsEXT(static_cast<VkImageCompressionFixedRateFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageCompressionFixedRateFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_NONE_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_NONE_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_1BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_1BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_2BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_2BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_3BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_3BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_4BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_4BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_5BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_5BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_6BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_6BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_7BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_7BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_8BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_8BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_9BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_9BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_10BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_10BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_11BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_11BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_12BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_12BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_13BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_13BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_14BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_14BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_15BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_15BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_16BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_16BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_17BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_17BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_18BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_18BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_19BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_19BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_20BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_20BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_21BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_21BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_22BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_22BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_23BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_23BPC_BIT_EXT"},
+        {VK_IMAGE_COMPRESSION_FIXED_RATE_24BPC_BIT_EXT, "VK_IMAGE_COMPRESSION_FIXED_RATE_24BPC_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageCompressionFixedRateFlagBitsEXT", "VkImageCompressionFixedRateFlagsEXT(0)");
 }
 static inline const char* string_VkDeviceAddressBindingFlagBitsEXT(VkDeviceAddressBindingFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8586,18 +8122,11 @@ static inline const char* string_VkDeviceAddressBindingFlagBitsEXT(VkDeviceAddre
 }
 
 static inline std::string string_VkDeviceAddressBindingFlagsEXT(VkDeviceAddressBindingFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkDeviceAddressBindingFlagBitsEXT(static_cast<VkDeviceAddressBindingFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkDeviceAddressBindingFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_DEVICE_ADDRESS_BINDING_INTERNAL_OBJECT_BIT_EXT, "VK_DEVICE_ADDRESS_BINDING_INTERNAL_OBJECT_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkDeviceAddressBindingFlagBitsEXT", "VkDeviceAddressBindingFlagsEXT(0)");
 }
 #ifdef VK_USE_PLATFORM_FUCHSIA
 static inline const char* string_VkImageConstraintsInfoFlagBitsFUCHSIA(VkImageConstraintsInfoFlagBitsFUCHSIA input_value) {
@@ -8618,18 +8147,15 @@ static inline const char* string_VkImageConstraintsInfoFlagBitsFUCHSIA(VkImageCo
 }
 
 static inline std::string string_VkImageConstraintsInfoFlagsFUCHSIA(VkImageConstraintsInfoFlagsFUCHSIA input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkImageConstraintsInfoFlagBitsFUCHSIA(static_cast<VkImageConstraintsInfoFlagBitsFUCHSIA>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkImageConstraintsInfoFlagsFUCHSIA(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_IMAGE_CONSTRAINTS_INFO_CPU_READ_RARELY_FUCHSIA, "VK_IMAGE_CONSTRAINTS_INFO_CPU_READ_RARELY_FUCHSIA"},
+        {VK_IMAGE_CONSTRAINTS_INFO_CPU_READ_OFTEN_FUCHSIA, "VK_IMAGE_CONSTRAINTS_INFO_CPU_READ_OFTEN_FUCHSIA"},
+        {VK_IMAGE_CONSTRAINTS_INFO_CPU_WRITE_RARELY_FUCHSIA, "VK_IMAGE_CONSTRAINTS_INFO_CPU_WRITE_RARELY_FUCHSIA"},
+        {VK_IMAGE_CONSTRAINTS_INFO_CPU_WRITE_OFTEN_FUCHSIA, "VK_IMAGE_CONSTRAINTS_INFO_CPU_WRITE_OFTEN_FUCHSIA"},
+        {VK_IMAGE_CONSTRAINTS_INFO_PROTECTED_OPTIONAL_FUCHSIA, "VK_IMAGE_CONSTRAINTS_INFO_PROTECTED_OPTIONAL_FUCHSIA"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkImageConstraintsInfoFlagBitsFUCHSIA", "VkImageConstraintsInfoFlagsFUCHSIA(0)");
 }
 #endif //VK_USE_PLATFORM_FUCHSIA
 static inline const char* string_VkBuildMicromapFlagBitsEXT(VkBuildMicromapFlagBitsEXT input_value) {
@@ -8646,18 +8172,13 @@ static inline const char* string_VkBuildMicromapFlagBitsEXT(VkBuildMicromapFlagB
 }
 
 static inline std::string string_VkBuildMicromapFlagsEXT(VkBuildMicromapFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkBuildMicromapFlagBitsEXT(static_cast<VkBuildMicromapFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkBuildMicromapFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_BUILD_MICROMAP_PREFER_FAST_TRACE_BIT_EXT, "VK_BUILD_MICROMAP_PREFER_FAST_TRACE_BIT_EXT"},
+        {VK_BUILD_MICROMAP_PREFER_FAST_BUILD_BIT_EXT, "VK_BUILD_MICROMAP_PREFER_FAST_BUILD_BIT_EXT"},
+        {VK_BUILD_MICROMAP_ALLOW_COMPACTION_BIT_EXT, "VK_BUILD_MICROMAP_ALLOW_COMPACTION_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkBuildMicromapFlagBitsEXT", "VkBuildMicromapFlagsEXT(0)");
 }
 static inline const char* string_VkMicromapCreateFlagBitsEXT(VkMicromapCreateFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8669,18 +8190,11 @@ static inline const char* string_VkMicromapCreateFlagBitsEXT(VkMicromapCreateFla
 }
 
 static inline std::string string_VkMicromapCreateFlagsEXT(VkMicromapCreateFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkMicromapCreateFlagBitsEXT(static_cast<VkMicromapCreateFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkMicromapCreateFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_MICROMAP_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT, "VK_MICROMAP_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkMicromapCreateFlagBitsEXT", "VkMicromapCreateFlagsEXT(0)");
 }
 static inline const char* string_VkMemoryDecompressionMethodFlagBitsNV(uint64_t input_value) {
     switch (input_value) {
@@ -8692,18 +8206,11 @@ static inline const char* string_VkMemoryDecompressionMethodFlagBitsNV(uint64_t
 }
 
 static inline std::string string_VkMemoryDecompressionMethodFlagsNV(VkMemoryDecompressionMethodFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkMemoryDecompressionMethodFlagBitsNV(static_cast<uint64_t>(1ULL << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkMemoryDecompressionMethodFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_MEMORY_DECOMPRESSION_METHOD_GDEFLATE_1_0_BIT_NV, "VK_MEMORY_DECOMPRESSION_METHOD_GDEFLATE_1_0_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkMemoryDecompressionMethodFlagBitsNV", "VkMemoryDecompressionMethodFlagsNV(0)");
 }
 static inline const char* string_VkOpticalFlowGridSizeFlagBitsNV(VkOpticalFlowGridSizeFlagBitsNV input_value) {
     switch (input_value) {
@@ -8723,18 +8230,15 @@ static inline const char* string_VkOpticalFlowGridSizeFlagBitsNV(VkOpticalFlowGr
 }
 
 static inline std::string string_VkOpticalFlowGridSizeFlagsNV(VkOpticalFlowGridSizeFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkOpticalFlowGridSizeFlagBitsNV(static_cast<VkOpticalFlowGridSizeFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkOpticalFlowGridSizeFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_OPTICAL_FLOW_GRID_SIZE_UNKNOWN_NV, "VK_OPTICAL_FLOW_GRID_SIZE_UNKNOWN_NV"},
+        {VK_OPTICAL_FLOW_GRID_SIZE_1X1_BIT_NV, "VK_OPTICAL_FLOW_GRID_SIZE_1X1_BIT_NV"},
+        {VK_OPTICAL_FLOW_GRID_SIZE_2X2_BIT_NV, "VK_OPTICAL_FLOW_GRID_SIZE_2X2_BIT_NV"},
+        {VK_OPTICAL_FLOW_GRID_SIZE_4X4_BIT_NV, "VK_OPTICAL_FLOW_GRID_SIZE_4X4_BIT_NV"},
+        {VK_OPTICAL_FLOW_GRID_SIZE_8X8_BIT_NV, "VK_OPTICAL_FLOW_GRID_SIZE_8X8_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkOpticalFlowGridSizeFlagBitsNV", "VkOpticalFlowGridSizeFlagsNV(0)");
 }
 static inline const char* string_VkOpticalFlowUsageFlagBitsNV(VkOpticalFlowUsageFlagBitsNV input_value) {
     switch (input_value) {
@@ -8756,18 +8260,16 @@ static inline const char* string_VkOpticalFlowUsageFlagBitsNV(VkOpticalFlowUsage
 }
 
 static inline std::string string_VkOpticalFlowUsageFlagsNV(VkOpticalFlowUsageFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkOpticalFlowUsageFlagBitsNV(static_cast<VkOpticalFlowUsageFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkOpticalFlowUsageFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_OPTICAL_FLOW_USAGE_UNKNOWN_NV, "VK_OPTICAL_FLOW_USAGE_UNKNOWN_NV"},
+        {VK_OPTICAL_FLOW_USAGE_INPUT_BIT_NV, "VK_OPTICAL_FLOW_USAGE_INPUT_BIT_NV"},
+        {VK_OPTICAL_FLOW_USAGE_OUTPUT_BIT_NV, "VK_OPTICAL_FLOW_USAGE_OUTPUT_BIT_NV"},
+        {VK_OPTICAL_FLOW_USAGE_HINT_BIT_NV, "VK_OPTICAL_FLOW_USAGE_HINT_BIT_NV"},
+        {VK_OPTICAL_FLOW_USAGE_COST_BIT_NV, "VK_OPTICAL_FLOW_USAGE_COST_BIT_NV"},
+        {VK_OPTICAL_FLOW_USAGE_GLOBAL_FLOW_BIT_NV, "VK_OPTICAL_FLOW_USAGE_GLOBAL_FLOW_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkOpticalFlowUsageFlagBitsNV", "VkOpticalFlowUsageFlagsNV(0)");
 }
 static inline const char* string_VkOpticalFlowSessionCreateFlagBitsNV(VkOpticalFlowSessionCreateFlagBitsNV input_value) {
     switch (input_value) {
@@ -8787,18 +8289,15 @@ static inline const char* string_VkOpticalFlowSessionCreateFlagBitsNV(VkOpticalF
 }
 
 static inline std::string string_VkOpticalFlowSessionCreateFlagsNV(VkOpticalFlowSessionCreateFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkOpticalFlowSessionCreateFlagBitsNV(static_cast<VkOpticalFlowSessionCreateFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkOpticalFlowSessionCreateFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_HINT_BIT_NV, "VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_HINT_BIT_NV"},
+        {VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_COST_BIT_NV, "VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_COST_BIT_NV"},
+        {VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_GLOBAL_FLOW_BIT_NV, "VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_GLOBAL_FLOW_BIT_NV"},
+        {VK_OPTICAL_FLOW_SESSION_CREATE_ALLOW_REGIONS_BIT_NV, "VK_OPTICAL_FLOW_SESSION_CREATE_ALLOW_REGIONS_BIT_NV"},
+        {VK_OPTICAL_FLOW_SESSION_CREATE_BOTH_DIRECTIONS_BIT_NV, "VK_OPTICAL_FLOW_SESSION_CREATE_BOTH_DIRECTIONS_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkOpticalFlowSessionCreateFlagBitsNV", "VkOpticalFlowSessionCreateFlagsNV(0)");
 }
 static inline const char* string_VkOpticalFlowExecuteFlagBitsNV(VkOpticalFlowExecuteFlagBitsNV input_value) {
     switch (input_value) {
@@ -8810,18 +8309,11 @@ static inline const char* string_VkOpticalFlowExecuteFlagBitsNV(VkOpticalFlowExe
 }
 
 static inline std::string string_VkOpticalFlowExecuteFlagsNV(VkOpticalFlowExecuteFlagsNV input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkOpticalFlowExecuteFlagBitsNV(static_cast<VkOpticalFlowExecuteFlagBitsNV>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkOpticalFlowExecuteFlagsNV(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_OPTICAL_FLOW_EXECUTE_DISABLE_TEMPORAL_HINTS_BIT_NV, "VK_OPTICAL_FLOW_EXECUTE_DISABLE_TEMPORAL_HINTS_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkOpticalFlowExecuteFlagBitsNV", "VkOpticalFlowExecuteFlagsNV(0)");
 }
 static inline const char* string_VkShaderCreateFlagBitsEXT(VkShaderCreateFlagBitsEXT input_value) {
     switch (input_value) {
@@ -8845,18 +8337,17 @@ static inline const char* string_VkShaderCreateFlagBitsEXT(VkShaderCreateFlagBit
 }
 
 static inline std::string string_VkShaderCreateFlagsEXT(VkShaderCreateFlagsEXT input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkShaderCreateFlagBitsEXT(static_cast<VkShaderCreateFlagBitsEXT>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkShaderCreateFlagsEXT(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_SHADER_CREATE_LINK_STAGE_BIT_EXT, "VK_SHADER_CREATE_LINK_STAGE_BIT_EXT"},
+        {VK_SHADER_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT, "VK_SHADER_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT"},
+        {VK_SHADER_CREATE_REQUIRE_FULL_SUBGROUPS_BIT_EXT, "VK_SHADER_CREATE_REQUIRE_FULL_SUBGROUPS_BIT_EXT"},
+        {VK_SHADER_CREATE_NO_TASK_SHADER_BIT_EXT, "VK_SHADER_CREATE_NO_TASK_SHADER_BIT_EXT"},
+        {VK_SHADER_CREATE_DISPATCH_BASE_BIT_EXT, "VK_SHADER_CREATE_DISPATCH_BASE_BIT_EXT"},
+        {VK_SHADER_CREATE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_EXT, "VK_SHADER_CREATE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_EXT"},
+        {VK_SHADER_CREATE_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT, "VK_SHADER_CREATE_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkShaderCreateFlagBitsEXT", "VkShaderCreateFlagsEXT(0)");
 }
 static inline const char* string_VkAccelerationStructureCreateFlagBitsKHR(VkAccelerationStructureCreateFlagBitsKHR input_value) {
     switch (input_value) {
@@ -8872,18 +8363,13 @@ static inline const char* string_VkAccelerationStructureCreateFlagBitsKHR(VkAcce
 }
 
 static inline std::string string_VkAccelerationStructureCreateFlagsKHR(VkAccelerationStructureCreateFlagsKHR input_value) {
-    std::string ret;
-    int index = 0;
-    while(input_value) {
-        if (input_value & 1) {
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_VkAccelerationStructureCreateFlagBitsKHR(static_cast<VkAccelerationStructureCreateFlagBitsKHR>(1U << index)));
-        }
-        ++index;
-        input_value >>= 1;
-    }
-    if (ret.empty()) ret.append("VkAccelerationStructureCreateFlagsKHR(0)");
-    return ret;
+    static constexpr StringHelperFlagName kFlags[] = {
+        {VK_ACCELERATION_STRUCTURE_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR, "VK_ACCELERATION_STRUCTURE_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR"},
+        {VK_ACCELERATION_STRUCTURE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT, "VK_ACCELERATION_STRUCTURE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT"},
+        {VK_ACCELERATION_STRUCTURE_CREATE_MOTION_BIT_NV, "VK_ACCELERATION_STRUCTURE_CREATE_MOTION_BIT_NV"},
+    };
+    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);
+    return StringHelperFlagsToString(input_value, kNames, "Unhandled VkAccelerationStructureCreateFlagBitsKHR", "VkAccelerationStructureCreateFlagsKHR(0)");
 }
 
 // NOLINTEND
@@ -43,8 +43,8 @@ struct COMPONENT_INFO {
     COMPONENT_TYPE type;
     uint32_t size; // bits
 
-    COMPONENT_INFO() : type(COMPONENT_TYPE::NONE), size(0) {};
-    COMPONENT_INFO(COMPONENT_TYPE type, uint32_t size) : type(type), size(size) {};
+    constexpr COMPONENT_INFO() : type(COMPONENT_TYPE::NONE), size(0) {};
+    constexpr COMPONENT_INFO(COMPONENT_TYPE type, uint32_t size) : type(type), size(size) {};
 };
 
 // Generic information for all formats
@@ -55,763 +55,1075 @@ struct FORMAT_INFO {
     VkExtent3D block_extent;
     uint32_t component_count;
     COMPONENT_INFO components[FORMAT_MAX_COMPONENTS];
+    uint32_t properties; // FORMAT_PROPERTY_* bits
 };
 
-namespace std {
-template <>
-struct hash<VkFormat> {
-    size_t operator()(VkFormat fmt) const noexcept {
-        return hash<uint32_t>()(static_cast<uint32_t>(fmt));
-    }
-};
-}
+// Properties of a format packed in FORMAT_INFO::properties, used to look up the simple format predicates
+static constexpr uint32_t FORMAT_PROPERTY_SFLOAT = 1u << 0;
+static constexpr uint32_t FORMAT_PROPERTY_SINT = 1u << 1;
+static constexpr uint32_t FORMAT_PROPERTY_SNORM = 1u << 2;
+static constexpr uint32_t FORMAT_PROPERTY_SRGB = 1u << 3;
+static constexpr uint32_t FORMAT_PROPERTY_SSCALED = 1u << 4;
+static constexpr uint32_t FORMAT_PROPERTY_UFLOAT = 1u << 5;
+static constexpr uint32_t FORMAT_PROPERTY_UINT = 1u << 6;
+static constexpr uint32_t FORMAT_PROPERTY_UNORM = 1u << 7;
+static constexpr uint32_t FORMAT_PROPERTY_USCALED = 1u << 8;
+static constexpr uint32_t FORMAT_PROPERTY_COMPRESSED_ASTC_HDR = 1u << 9;
+static constexpr uint32_t FORMAT_PROPERTY_COMPRESSED_ASTC_LDR = 1u << 10;
+static constexpr uint32_t FORMAT_PROPERTY_COMPRESSED_BC = 1u << 11;
+static constexpr uint32_t FORMAT_PROPERTY_COMPRESSED_EAC = 1u << 12;
+static constexpr uint32_t FORMAT_PROPERTY_COMPRESSED_ETC2 = 1u << 13;
+static constexpr uint32_t FORMAT_PROPERTY_COMPRESSED_PVRTC = 1u << 14;
+static constexpr uint32_t FORMAT_PROPERTY_DEPTH = 1u << 15;
+static constexpr uint32_t FORMAT_PROPERTY_STENCIL = 1u << 16;
 
 // clang-format off
-static const vvl::unordered_map<VkFormat, FORMAT_INFO> kVkFormatTable = {
-    {VK_FORMAT_R4G4_UNORM_PACK8,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::G, 4}} }},
-    {VK_FORMAT_R4G4B4A4_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::B, 4}, {COMPONENT_TYPE::A, 4}} }},
-    {VK_FORMAT_B4G4R4A4_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::A, 4}} }},
-    {VK_FORMAT_R5G6B5_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::G, 6}, {COMPONENT_TYPE::B, 5}} }},
-    {VK_FORMAT_B5G6R5_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 5}, {COMPONENT_TYPE::G, 6}, {COMPONENT_TYPE::R, 5}} }},
-    {VK_FORMAT_R5G5B5A1_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::G, 5}, {COMPONENT_TYPE::B, 5}, {COMPONENT_TYPE::A, 1}} }},
-    {VK_FORMAT_B5G5R5A1_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 5}, {COMPONENT_TYPE::G, 5}, {COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::A, 1}} }},
-    {VK_FORMAT_A1R5G5B5_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 1}, {COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::G, 5}, {COMPONENT_TYPE::B, 5}} }},
-    {VK_FORMAT_R8_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8_SRGB,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8G8_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8_SRGB,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_R8G8B8_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_R8G8B8_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_R8G8B8_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_R8G8B8_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_R8G8B8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_R8G8B8_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_R8G8B8_SRGB,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}} }},
-    {VK_FORMAT_B8G8R8_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8_SRGB,
-        {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R8G8B8A8_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_R8G8B8A8_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_R8G8B8A8_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_R8G8B8A8_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_R8G8B8A8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_R8G8B8A8_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_R8G8B8A8_SRGB,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_B8G8R8A8_SRGB,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}} }},
-    {VK_FORMAT_A8B8G8R8_UNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A8B8G8R8_SNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A8B8G8R8_USCALED_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A8B8G8R8_SSCALED_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A8B8G8R8_UINT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A8B8G8R8_SINT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A8B8G8R8_SRGB_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_A2R10G10B10_UNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}} }},
-    {VK_FORMAT_A2R10G10B10_SNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}} }},
-    {VK_FORMAT_A2R10G10B10_USCALED_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}} }},
-    {VK_FORMAT_A2R10G10B10_SSCALED_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}} }},
-    {VK_FORMAT_A2R10G10B10_UINT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}} }},
-    {VK_FORMAT_A2R10G10B10_SINT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}} }},
-    {VK_FORMAT_A2B10G10R10_UNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_A2B10G10R10_SNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_A2B10G10R10_USCALED_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_A2B10G10R10_SSCALED_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_A2B10G10R10_UINT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_A2B10G10R10_SINT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_R16_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_R16G16_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_R16G16B16_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}} }},
-    {VK_FORMAT_R16G16B16A16_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R16G16B16A16_SNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R16G16B16A16_USCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R16G16B16A16_SSCALED,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R16G16B16A16_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R16G16B16A16_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R16G16B16A16_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}} }},
-    {VK_FORMAT_R32_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 32}} }},
-    {VK_FORMAT_R32_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 32}} }},
-    {VK_FORMAT_R32_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 32}} }},
-    {VK_FORMAT_R32G32_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}} }},
-    {VK_FORMAT_R32G32_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}} }},
-    {VK_FORMAT_R32G32_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}} }},
-    {VK_FORMAT_R32G32B32_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_96BIT, 12, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}} }},
-    {VK_FORMAT_R32G32B32_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_96BIT, 12, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}} }},
-    {VK_FORMAT_R32G32B32_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_96BIT, 12, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}} }},
-    {VK_FORMAT_R32G32B32A32_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}, {COMPONENT_TYPE::A, 32}} }},
-    {VK_FORMAT_R32G32B32A32_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}, {COMPONENT_TYPE::A, 32}} }},
-    {VK_FORMAT_R32G32B32A32_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}, {COMPONENT_TYPE::A, 32}} }},
-    {VK_FORMAT_R64_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 64}} }},
-    {VK_FORMAT_R64_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 64}} }},
-    {VK_FORMAT_R64_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 64}} }},
-    {VK_FORMAT_R64G64_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::B, 64}} }},
-    {VK_FORMAT_R64G64_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::B, 64}} }},
-    {VK_FORMAT_R64G64_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::B, 64}} }},
-    {VK_FORMAT_R64G64B64_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_192BIT, 24, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}} }},
-    {VK_FORMAT_R64G64B64_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_192BIT, 24, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}} }},
-    {VK_FORMAT_R64G64B64_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_192BIT, 24, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}} }},
-    {VK_FORMAT_R64G64B64A64_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::_256BIT, 32, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}, {COMPONENT_TYPE::A, 64}} }},
-    {VK_FORMAT_R64G64B64A64_SINT,
-        {FORMAT_COMPATIBILITY_CLASS::_256BIT, 32, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}, {COMPONENT_TYPE::A, 64}} }},
-    {VK_FORMAT_R64G64B64A64_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::_256BIT, 32, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}, {COMPONENT_TYPE::A, 64}} }},
-    {VK_FORMAT_B10G11R11_UFLOAT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 11}, {COMPONENT_TYPE::R, 11}} }},
-    {VK_FORMAT_E5B9G9R9_UFLOAT_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::B, 9}, {COMPONENT_TYPE::G, 9}, {COMPONENT_TYPE::R, 9}} }},
-    {VK_FORMAT_D16_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::D16, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::D, 16}} }},
-    {VK_FORMAT_X8_D24_UNORM_PACK32,
-        {FORMAT_COMPATIBILITY_CLASS::D24, 4, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::D, 24}} }},
-    {VK_FORMAT_D32_SFLOAT,
-        {FORMAT_COMPATIBILITY_CLASS::D32, 4, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::D, 32}} }},
-    {VK_FORMAT_S8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::S8, 1, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::S, 8}} }},
-    {VK_FORMAT_D16_UNORM_S8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::D16S8, 3, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::D, 16}, {COMPONENT_TYPE::S, 8}} }},
-    {VK_FORMAT_D24_UNORM_S8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::D24S8, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::D, 24}, {COMPONENT_TYPE::S, 8}} }},
-    {VK_FORMAT_D32_SFLOAT_S8_UINT,
-        {FORMAT_COMPATIBILITY_CLASS::D32S8, 5, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::D, 32}, {COMPONENT_TYPE::S, 8}} }},
-    {VK_FORMAT_BC1_RGB_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC1_RGB, 8, 16, {4, 4, 1}, 3,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC1_RGB_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC1_RGB, 8, 16, {4, 4, 1}, 3,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC1_RGBA_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC1_RGBA, 8, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC1_RGBA_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC1_RGBA, 8, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC2_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC2, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC2_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC2, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC3_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC3, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC3_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC3, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC4_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC4, 8, 16, {4, 4, 1}, 1,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC4_SNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC4, 8, 16, {4, 4, 1}, 1,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC5_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC5, 16, 16, {4, 4, 1}, 2,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC5_SNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC5, 16, 16, {4, 4, 1}, 2,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC6H_UFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC6H, 16, 16, {4, 4, 1}, 3,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC6H_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC6H, 16, 16, {4, 4, 1}, 3,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC7_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC7, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_BC7_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::BC7, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ETC2_RGB, 8, 16, {4, 4, 1}, 3,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ETC2_RGB, 8, 16, {4, 4, 1}, 3,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ETC2_RGBA, 8, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ETC2_RGBA, 8, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ETC2_EAC_RGBA, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ETC2_EAC_RGBA, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_EAC_R11_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::EAC_R, 8, 16, {4, 4, 1}, 1,
-        {{COMPONENT_TYPE::R, 11}} }},
-    {VK_FORMAT_EAC_R11_SNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::EAC_R, 8, 16, {4, 4, 1}, 1,
-        {{COMPONENT_TYPE::R, 11}} }},
-    {VK_FORMAT_EAC_R11G11_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::EAC_RG, 16, 16, {4, 4, 1}, 2,
-        {{COMPONENT_TYPE::R, 11}, {COMPONENT_TYPE::G, 11}} }},
-    {VK_FORMAT_EAC_R11G11_SNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::EAC_RG, 16, 16, {4, 4, 1}, 2,
-        {{COMPONENT_TYPE::R, 11}, {COMPONENT_TYPE::G, 11}} }},
-    {VK_FORMAT_ASTC_4x4_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_4X4, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_4x4_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_4X4, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_5x4_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_5X4, 16, 20, {5, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_5x4_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_5X4, 16, 20, {5, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_5x5_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_5X5, 16, 25, {5, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_5x5_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_5X5, 16, 25, {5, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_6x5_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_6X5, 16, 30, {6, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_6x5_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_6X5, 16, 30, {6, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_6x6_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_6X6, 16, 36, {6, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_6x6_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_6X6, 16, 36, {6, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x5_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X5, 16, 40, {8, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x5_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X5, 16, 40, {8, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x6_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X6, 16, 48, {8, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x6_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X6, 16, 48, {8, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x8_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X8, 16, 64, {8, 8, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x8_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X8, 16, 64, {8, 8, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x5_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X5, 16, 50, {10, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x5_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X5, 16, 50, {10, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x6_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X6, 16, 60, {10, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x6_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X6, 16, 60, {10, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x8_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X8, 16, 80, {10, 8, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x8_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X8, 16, 80, {10, 8, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x10_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X10, 16, 100, {10, 10, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x10_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X10, 16, 100, {10, 10, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_12x10_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_12X10, 16, 120, {12, 10, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_12x10_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_12X10, 16, 120, {12, 10, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_12x12_UNORM_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_12X12, 16, 144, {12, 12, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_12x12_SRGB_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_12X12, 16, 144, {12, 12, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_G8B8G8R8_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT_G8B8G8R8, 4, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_B8G8R8G8_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT_B8G8R8G8, 4, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}} }},
-    {VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT_3PLANE_420, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_G8_B8R8_2PLANE_420_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT_2PLANE_420, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT_3PLANE_422, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_G8_B8R8_2PLANE_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT_2PLANE_422, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT_3PLANE_444, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_R10X6_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_R10X6G10X6_UNORM_2PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}} }},
-    {VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_R10G10B10A10, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::A, 10}} }},
-    {VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_G10B10G10R10, 8, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_B10G10R10G10, 8, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}} }},
-    {VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_10BIT_3PLANE_420, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_10BIT_2PLANE_420, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_10BIT_3PLANE_422, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_10BIT_2PLANE_422, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_10BIT_3PLANE_444, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_R12X4_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
-        {{COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_R12X4G12X4_UNORM_2PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 12}, {COMPONENT_TYPE::G, 12}} }},
-    {VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_R12G12B12A12, 8, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::R, 12}, {COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::A, 12}} }},
-    {VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_G12B12G12R12, 8, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_B12G12R12G12, 8, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::R, 12}, {COMPONENT_TYPE::G, 12}} }},
-    {VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_12BIT_3PLANE_420, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_12BIT_2PLANE_420, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_12BIT_3PLANE_422, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_12BIT_2PLANE_422, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_12BIT_3PLANE_444, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_G16B16G16R16_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_G16B16G16R16, 8, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_B16G16R16G16_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_64BIT_B16G16R16G16, 8, 1, {2, 1, 1}, 4,
-        {{COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT_3PLANE_420, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_G16_B16R16_2PLANE_420_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT_2PLANE_420, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT_3PLANE_422, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_G16_B16R16_2PLANE_422_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT_2PLANE_422, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT_3PLANE_444, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC1_2BPP, 8, 1, {8, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC1_4BPP_UNORM_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC1_4BPP, 8, 1, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC2_2BPP_UNORM_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC2_2BPP, 8, 1, {8, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC2_4BPP_UNORM_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC2_4BPP, 8, 1, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC1_2BPP_SRGB_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC1_2BPP, 8, 1, {8, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC1_4BPP_SRGB_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC1_4BPP, 8, 1, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC2_2BPP_SRGB_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC2_2BPP, 8, 1, {8, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG,
-        {FORMAT_COMPATIBILITY_CLASS::PVRTC2_4BPP, 8, 1, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_4X4, 16, 16, {4, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_5x4_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_5X4, 16, 20, {5, 4, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_5x5_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_5X5, 16, 25, {5, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_6x5_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_6X5, 16, 30, {6, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_6x6_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_6X6, 16, 36, {6, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x5_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X5, 16, 40, {8, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x6_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X6, 16, 48, {8, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_8x8_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_8X8, 16, 64, {8, 8, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x5_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X5, 16, 50, {10, 5, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x6_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X6, 16, 60, {10, 6, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x8_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X8, 16, 80, {10, 8, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_10x10_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_10X10, 16, 100, {10, 10, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_12x10_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_12X10, 16, 120, {12, 10, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK,
-        {FORMAT_COMPATIBILITY_CLASS::ASTC_12X12, 16, 144, {12, 12, 1}, 4,
-        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}} }},
-    {VK_FORMAT_G8_B8R8_2PLANE_444_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_8BIT_2PLANE_444, 3, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}} }},
-    {VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_10BIT_2PLANE_444, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}} }},
-    {VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_12BIT_2PLANE_444, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}} }},
-    {VK_FORMAT_G16_B16R16_2PLANE_444_UNORM,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT_2PLANE_444, 6, 1, {1, 1, 1}, 3,
-        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}} }},
-    {VK_FORMAT_A4R4G4B4_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 4}, {COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::B, 4}} }},
-    {VK_FORMAT_A4B4G4R4_UNORM_PACK16,
-        {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
-        {{COMPONENT_TYPE::A, 4}, {COMPONENT_TYPE::B, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::R, 4}} }},
-    {VK_FORMAT_R16G16_S10_5_NV,
-        {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
-        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}} }},
-    {VK_FORMAT_UNDEFINED, {FORMAT_COMPATIBILITY_CLASS::NONE, 0, 0, {0, 0, 0}, 0, {}}}};
+static constexpr FORMAT_INFO kVkFormatTable0[] = {
+    // VK_FORMAT_UNDEFINED
+    {FORMAT_COMPATIBILITY_CLASS::NONE, 0, 0, {0, 0, 0}, 0, {}, 0},
+    // VK_FORMAT_R4G4_UNORM_PACK8
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::G, 4}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R4G4B4A4_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::B, 4}, {COMPONENT_TYPE::A, 4}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B4G4R4A4_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::A, 4}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R5G6B5_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::G, 6}, {COMPONENT_TYPE::B, 5}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B5G6R5_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 5}, {COMPONENT_TYPE::G, 6}, {COMPONENT_TYPE::R, 5}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R5G5B5A1_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::G, 5}, {COMPONENT_TYPE::B, 5}, {COMPONENT_TYPE::A, 1}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B5G5R5A1_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 5}, {COMPONENT_TYPE::G, 5}, {COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::A, 1}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_A1R5G5B5_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 1}, {COMPONENT_TYPE::R, 5}, {COMPONENT_TYPE::G, 5}, {COMPONENT_TYPE::B, 5}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R8_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R8_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R8_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R8_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R8_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R8_SRGB
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_R8G8_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R8G8_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R8G8_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R8G8_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R8G8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R8G8_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R8G8_SRGB
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_R8G8B8_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R8G8B8_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R8G8B8_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R8G8B8_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R8G8B8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R8G8B8_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R8G8B8_SRGB
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_B8G8R8_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B8G8R8_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_B8G8R8_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_B8G8R8_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_B8G8R8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_B8G8R8_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_B8G8R8_SRGB
+    {FORMAT_COMPATIBILITY_CLASS::_24BIT, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_R8G8B8A8_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R8G8B8A8_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R8G8B8A8_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R8G8B8A8_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R8G8B8A8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R8G8B8A8_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R8G8B8A8_SRGB
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_B8G8R8A8_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B8G8R8A8_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_B8G8R8A8_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_B8G8R8A8_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_B8G8R8A8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_B8G8R8A8_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_B8G8R8A8_SRGB
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::A, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_A8B8G8R8_UNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_A8B8G8R8_SNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_A8B8G8R8_USCALED_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_A8B8G8R8_SSCALED_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_A8B8G8R8_UINT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_A8B8G8R8_SINT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_A8B8G8R8_SRGB_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_SRGB},
+    // VK_FORMAT_A2R10G10B10_UNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_A2R10G10B10_SNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_A2R10G10B10_USCALED_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_A2R10G10B10_SSCALED_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_A2R10G10B10_UINT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_A2R10G10B10_SINT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_A2B10G10R10_UNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_A2B10G10R10_SNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_A2B10G10R10_USCALED_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_A2B10G10R10_SSCALED_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_A2B10G10R10_UINT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_A2B10G10R10_SINT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 2}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R16_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R16_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R16_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R16_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R16_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R16_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R16_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R16G16_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R16G16_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R16G16_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R16G16_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R16G16_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R16G16_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R16G16_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R16G16B16_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R16G16B16_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R16G16B16_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R16G16B16_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R16G16B16_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R16G16B16_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R16G16B16_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_48BIT, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R16G16B16A16_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R16G16B16A16_SNORM
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_SNORM},
+    // VK_FORMAT_R16G16B16A16_USCALED
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_USCALED},
+    // VK_FORMAT_R16G16B16A16_SSCALED
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_SSCALED},
+    // VK_FORMAT_R16G16B16A16_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R16G16B16A16_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R16G16B16A16_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::A, 16}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R32_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 32}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R32_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 32}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R32_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 32}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R32G32_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R32G32_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R32G32_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R32G32B32_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_96BIT, 12, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R32G32B32_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_96BIT, 12, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R32G32B32_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_96BIT, 12, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R32G32B32A32_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}, {COMPONENT_TYPE::A, 32}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R32G32B32A32_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}, {COMPONENT_TYPE::A, 32}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R32G32B32A32_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 32}, {COMPONENT_TYPE::G, 32}, {COMPONENT_TYPE::B, 32}, {COMPONENT_TYPE::A, 32}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R64_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 64}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R64_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 64}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R64_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT, 8, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 64}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R64G64_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::B, 64}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R64G64_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::B, 64}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R64G64_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_128BIT, 16, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::B, 64}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R64G64B64_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_192BIT, 24, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R64G64B64_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_192BIT, 24, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R64G64B64_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_192BIT, 24, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_R64G64B64A64_UINT
+    {FORMAT_COMPATIBILITY_CLASS::_256BIT, 32, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}, {COMPONENT_TYPE::A, 64}},
+        FORMAT_PROPERTY_UINT},
+    // VK_FORMAT_R64G64B64A64_SINT
+    {FORMAT_COMPATIBILITY_CLASS::_256BIT, 32, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}, {COMPONENT_TYPE::A, 64}},
+        FORMAT_PROPERTY_SINT},
+    // VK_FORMAT_R64G64B64A64_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::_256BIT, 32, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 64}, {COMPONENT_TYPE::G, 64}, {COMPONENT_TYPE::B, 64}, {COMPONENT_TYPE::A, 64}},
+        FORMAT_PROPERTY_SFLOAT},
+    // VK_FORMAT_B10G11R11_UFLOAT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 11}, {COMPONENT_TYPE::R, 11}},
+        FORMAT_PROPERTY_UFLOAT},
+    // VK_FORMAT_E5B9G9R9_UFLOAT_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::B, 9}, {COMPONENT_TYPE::G, 9}, {COMPONENT_TYPE::R, 9}},
+        FORMAT_PROPERTY_UFLOAT},
+    // VK_FORMAT_D16_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::D16, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::D, 16}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_DEPTH},
+    // VK_FORMAT_X8_D24_UNORM_PACK32
+    {FORMAT_COMPATIBILITY_CLASS::D24, 4, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::D, 24}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_DEPTH},
+    // VK_FORMAT_D32_SFLOAT
+    {FORMAT_COMPATIBILITY_CLASS::D32, 4, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::D, 32}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_DEPTH},
+    // VK_FORMAT_S8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::S8, 1, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::S, 8}},
+        FORMAT_PROPERTY_UINT | FORMAT_PROPERTY_STENCIL},
+    // VK_FORMAT_D16_UNORM_S8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::D16S8, 3, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::D, 16}, {COMPONENT_TYPE::S, 8}},
+        FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL},
+    // VK_FORMAT_D24_UNORM_S8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::D24S8, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::D, 24}, {COMPONENT_TYPE::S, 8}},
+        FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL},
+    // VK_FORMAT_D32_SFLOAT_S8_UINT
+    {FORMAT_COMPATIBILITY_CLASS::D32S8, 5, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::D, 32}, {COMPONENT_TYPE::S, 8}},
+        FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL},
+    // VK_FORMAT_BC1_RGB_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC1_RGB, 8, 16, {4, 4, 1}, 3,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC1_RGB_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC1_RGB, 8, 16, {4, 4, 1}, 3,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC1_RGBA_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC1_RGBA, 8, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC1_RGBA_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC1_RGBA, 8, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC2_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC2, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC2_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC2, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC3_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC3, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC3_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC3, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC4_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC4, 8, 16, {4, 4, 1}, 1,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC4_SNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC4, 8, 16, {4, 4, 1}, 1,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC5_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC5, 16, 16, {4, 4, 1}, 2,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC5_SNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC5, 16, 16, {4, 4, 1}, 2,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC6H_UFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC6H, 16, 16, {4, 4, 1}, 3,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UFLOAT | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC6H_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC6H, 16, 16, {4, 4, 1}, 3,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC7_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC7, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_BC7_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::BC7, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_BC},
+    // VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ETC2_RGB, 8, 16, {4, 4, 1}, 3,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ETC2},
+    // VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ETC2_RGB, 8, 16, {4, 4, 1}, 3,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ETC2},
+    // VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ETC2_RGBA, 8, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ETC2},
+    // VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ETC2_RGBA, 8, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ETC2},
+    // VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ETC2_EAC_RGBA, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ETC2},
+    // VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ETC2_EAC_RGBA, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ETC2},
+    // VK_FORMAT_EAC_R11_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::EAC_R, 8, 16, {4, 4, 1}, 1,
+        {{COMPONENT_TYPE::R, 11}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_EAC},
+    // VK_FORMAT_EAC_R11_SNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::EAC_R, 8, 16, {4, 4, 1}, 1,
+        {{COMPONENT_TYPE::R, 11}},
+        FORMAT_PROPERTY_SNORM | FORMAT_PROPERTY_COMPRESSED_EAC},
+    // VK_FORMAT_EAC_R11G11_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::EAC_RG, 16, 16, {4, 4, 1}, 2,
+        {{COMPONENT_TYPE::R, 11}, {COMPONENT_TYPE::G, 11}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_EAC},
+    // VK_FORMAT_EAC_R11G11_SNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::EAC_RG, 16, 16, {4, 4, 1}, 2,
+        {{COMPONENT_TYPE::R, 11}, {COMPONENT_TYPE::G, 11}},
+        FORMAT_PROPERTY_SNORM | FORMAT_PROPERTY_COMPRESSED_EAC},
+    // VK_FORMAT_ASTC_4x4_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_4X4, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_4x4_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_4X4, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_5x4_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_5X4, 16, 20, {5, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_5x4_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_5X4, 16, 20, {5, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_5x5_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_5X5, 16, 25, {5, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_5x5_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_5X5, 16, 25, {5, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_6x5_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_6X5, 16, 30, {6, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_6x5_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_6X5, 16, 30, {6, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_6x6_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_6X6, 16, 36, {6, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_6x6_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_6X6, 16, 36, {6, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_8x5_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X5, 16, 40, {8, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_8x5_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X5, 16, 40, {8, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_8x6_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X6, 16, 48, {8, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_8x6_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X6, 16, 48, {8, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_8x8_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X8, 16, 64, {8, 8, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_8x8_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X8, 16, 64, {8, 8, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x5_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X5, 16, 50, {10, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x5_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X5, 16, 50, {10, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x6_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X6, 16, 60, {10, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x6_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X6, 16, 60, {10, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x8_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X8, 16, 80, {10, 8, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x8_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X8, 16, 80, {10, 8, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x10_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X10, 16, 100, {10, 10, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_10x10_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X10, 16, 100, {10, 10, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_12x10_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_12X10, 16, 120, {12, 10, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_12x10_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_12X10, 16, 120, {12, 10, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_12x12_UNORM_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_12X12, 16, 144, {12, 12, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+    // VK_FORMAT_ASTC_12x12_SRGB_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_12X12, 16, 144, {12, 12, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_ASTC_LDR},
+};
+static_assert(std::size(kVkFormatTable0) == static_cast<size_t>(VK_FORMAT_ASTC_12x12_SRGB_BLOCK - VK_FORMAT_UNDEFINED + 1));
+static constexpr FORMAT_INFO kVkFormatTable1000054000[] = {
+    // VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC1_2BPP, 8, 1, {8, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC1_4BPP_UNORM_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC1_4BPP, 8, 1, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC2_2BPP_UNORM_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC2_2BPP, 8, 1, {8, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC2_4BPP_UNORM_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC2_4BPP, 8, 1, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_UNORM | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC1_2BPP_SRGB_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC1_2BPP, 8, 1, {8, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC1_4BPP_SRGB_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC1_4BPP, 8, 1, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC2_2BPP_SRGB_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC2_2BPP, 8, 1, {8, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+    // VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG
+    {FORMAT_COMPATIBILITY_CLASS::PVRTC2_4BPP, 8, 1, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SRGB | FORMAT_PROPERTY_COMPRESSED_PVRTC},
+};
+static_assert(std::size(kVkFormatTable1000054000) == static_cast<size_t>(VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG - VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG + 1));
+static constexpr FORMAT_INFO kVkFormatTable1000066000[] = {
+    // VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_4X4, 16, 16, {4, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_5x4_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_5X4, 16, 20, {5, 4, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_5x5_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_5X5, 16, 25, {5, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_6x5_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_6X5, 16, 30, {6, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_6x6_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_6X6, 16, 36, {6, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_8x5_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X5, 16, 40, {8, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_8x6_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X6, 16, 48, {8, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_8x8_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_8X8, 16, 64, {8, 8, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_10x5_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X5, 16, 50, {10, 5, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_10x6_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X6, 16, 60, {10, 6, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_10x8_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X8, 16, 80, {10, 8, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_10x10_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_10X10, 16, 100, {10, 10, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_12x10_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_12X10, 16, 120, {12, 10, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+    // VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK
+    {FORMAT_COMPATIBILITY_CLASS::ASTC_12X12, 16, 144, {12, 12, 1}, 4,
+        {{COMPONENT_TYPE::R, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::G, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::B, COMPRESSED_COMPONENT}, {COMPONENT_TYPE::A, COMPRESSED_COMPONENT}},
+        FORMAT_PROPERTY_SFLOAT | FORMAT_PROPERTY_COMPRESSED_ASTC_HDR},
+};
+static_assert(std::size(kVkFormatTable1000066000) == static_cast<size_t>(VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK - VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK + 1));
+static constexpr FORMAT_INFO kVkFormatTable1000156000[] = {
+    // VK_FORMAT_G8B8G8R8_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT_G8B8G8R8, 4, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B8G8R8G8_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT_B8G8R8G8, 4, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::R, 8}, {COMPONENT_TYPE::G, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT_3PLANE_420, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G8_B8R8_2PLANE_420_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT_2PLANE_420, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT_3PLANE_422, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G8_B8R8_2PLANE_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT_2PLANE_422, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT_3PLANE_444, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R10X6_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R10X6G10X6_UNORM_2PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_R10G10B10A10, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::A, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_G10B10G10R10, 8, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_B10G10R10G10, 8, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::R, 10}, {COMPONENT_TYPE::G, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_10BIT_3PLANE_420, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_10BIT_2PLANE_420, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_10BIT_3PLANE_422, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_10BIT_2PLANE_422, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_10BIT_3PLANE_444, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R12X4_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 1,
+        {{COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R12X4G12X4_UNORM_2PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 12}, {COMPONENT_TYPE::G, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_R12G12B12A12, 8, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::R, 12}, {COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::A, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_G12B12G12R12, 8, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_B12G12R12G12, 8, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::R, 12}, {COMPONENT_TYPE::G, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_12BIT_3PLANE_420, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_12BIT_2PLANE_420, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_12BIT_3PLANE_422, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_12BIT_2PLANE_422, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_12BIT_3PLANE_444, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16B16G16R16_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_G16B16G16R16, 8, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_B16G16R16G16_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_64BIT_B16G16R16G16, 8, 1, {2, 1, 1}, 4,
+        {{COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT_3PLANE_420, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16_B16R16_2PLANE_420_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT_2PLANE_420, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT_3PLANE_422, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16_B16R16_2PLANE_422_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT_2PLANE_422, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT_3PLANE_444, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+};
+static_assert(std::size(kVkFormatTable1000156000) == static_cast<size_t>(VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM - VK_FORMAT_G8B8G8R8_422_UNORM + 1));
+static constexpr FORMAT_INFO kVkFormatTable1000330000[] = {
+    // VK_FORMAT_G8_B8R8_2PLANE_444_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_8BIT_2PLANE_444, 3, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 8}, {COMPONENT_TYPE::B, 8}, {COMPONENT_TYPE::R, 8}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_10BIT_2PLANE_444, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 10}, {COMPONENT_TYPE::B, 10}, {COMPONENT_TYPE::R, 10}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_12BIT_2PLANE_444, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 12}, {COMPONENT_TYPE::B, 12}, {COMPONENT_TYPE::R, 12}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_G16_B16R16_2PLANE_444_UNORM
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT_2PLANE_444, 6, 1, {1, 1, 1}, 3,
+        {{COMPONENT_TYPE::G, 16}, {COMPONENT_TYPE::B, 16}, {COMPONENT_TYPE::R, 16}},
+        FORMAT_PROPERTY_UNORM},
+};
+static_assert(std::size(kVkFormatTable1000330000) == static_cast<size_t>(VK_FORMAT_G16_B16R16_2PLANE_444_UNORM - VK_FORMAT_G8_B8R8_2PLANE_444_UNORM + 1));
+static constexpr FORMAT_INFO kVkFormatTable1000340000[] = {
+    // VK_FORMAT_A4R4G4B4_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 4}, {COMPONENT_TYPE::R, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::B, 4}},
+        FORMAT_PROPERTY_UNORM},
+    // VK_FORMAT_A4B4G4R4_UNORM_PACK16
+    {FORMAT_COMPATIBILITY_CLASS::_16BIT, 2, 1, {1, 1, 1}, 4,
+        {{COMPONENT_TYPE::A, 4}, {COMPONENT_TYPE::B, 4}, {COMPONENT_TYPE::G, 4}, {COMPONENT_TYPE::R, 4}},
+        FORMAT_PROPERTY_UNORM},
+};
+static_assert(std::size(kVkFormatTable1000340000) == static_cast<size_t>(VK_FORMAT_A4B4G4R4_UNORM_PACK16 - VK_FORMAT_A4R4G4B4_UNORM_PACK16 + 1));
+static constexpr FORMAT_INFO kVkFormatTable1000464000[] = {
+    // VK_FORMAT_R16G16_S10_5_NV
+    {FORMAT_COMPATIBILITY_CLASS::_32BIT, 4, 1, {1, 1, 1}, 2,
+        {{COMPONENT_TYPE::R, 16}, {COMPONENT_TYPE::G, 16}},
+        FORMAT_PROPERTY_SINT},
+};
+static_assert(std::size(kVkFormatTable1000464000) == static_cast<size_t>(VK_FORMAT_R16G16_S10_5_NV - VK_FORMAT_R16G16_S10_5_NV + 1));
 // clang-format on
 
+// VkFormat values come in blocks of consecutive values (core and one block per extension),
+// each block has a dense table so a lookup is only a range check and an index
+static const FORMAT_INFO* GetFormatInfo(VkFormat format) {
+    if (format >= VK_FORMAT_UNDEFINED && format <= VK_FORMAT_ASTC_12x12_SRGB_BLOCK) {
+        return &kVkFormatTable0[format - VK_FORMAT_UNDEFINED];
+    }
+    if (format >= VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG && format <= VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG) {
+        return &kVkFormatTable1000054000[format - VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG];
+    }
+    if (format >= VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK && format <= VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK) {
+        return &kVkFormatTable1000066000[format - VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK];
+    }
+    if (format >= VK_FORMAT_G8B8G8R8_422_UNORM && format <= VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM) {
+        return &kVkFormatTable1000156000[format - VK_FORMAT_G8B8G8R8_422_UNORM];
+    }
+    if (format >= VK_FORMAT_G8_B8R8_2PLANE_444_UNORM && format <= VK_FORMAT_G16_B16R16_2PLANE_444_UNORM) {
+        return &kVkFormatTable1000330000[format - VK_FORMAT_G8_B8R8_2PLANE_444_UNORM];
+    }
+    if (format >= VK_FORMAT_A4R4G4B4_UNORM_PACK16 && format <= VK_FORMAT_A4B4G4R4_UNORM_PACK16) {
+        return &kVkFormatTable1000340000[format - VK_FORMAT_A4R4G4B4_UNORM_PACK16];
+    }
+    if (format >= VK_FORMAT_R16G16_S10_5_NV && format <= VK_FORMAT_R16G16_S10_5_NV) {
+        return &kVkFormatTable1000464000[format - VK_FORMAT_R16G16_S10_5_NV];
+    }
+    return nullptr;
+}
+
+// Returns the FORMAT_PROPERTY_* bits of the format, zero if the format is not known
+static uint32_t FormatProperties(VkFormat format) {
+    const auto* format_info = GetFormatInfo(format);
+    return format_info ? format_info->properties : 0;
+}
+
 struct PER_PLANE_COMPATIBILITY {
     uint32_t width_divisor;
     uint32_t height_divisor;
@@ -820,8 +1132,8 @@ struct PER_PLANE_COMPATIBILITY {
     // Need default otherwise if app tries to grab a plane that doesn't exist it will crash
     // if returned the value of 0 in IMAGE_STATE::GetEffectiveSubresourceExtent()
     // This is ok, because there are VUs later that will catch the bad app behaviour
-    PER_PLANE_COMPATIBILITY() : width_divisor(1), height_divisor(1), compatible_format(VK_FORMAT_UNDEFINED) {}
-    PER_PLANE_COMPATIBILITY(uint32_t width_divisor, uint32_t height_divisor, VkFormat compatible_format) :
+    constexpr PER_PLANE_COMPATIBILITY() : width_divisor(1), height_divisor(1), compatible_format(VK_FORMAT_UNDEFINED) {}
+    constexpr PER_PLANE_COMPATIBILITY(uint32_t width_divisor, uint32_t height_divisor, VkFormat compatible_format) :
         width_divisor(width_divisor), height_divisor(height_divisor), compatible_format(compatible_format) {}
 };
 
@@ -831,693 +1143,261 @@ struct MULTIPLANE_COMPATIBILITY {
 };
 
 // Source: Vulkan spec Table 47. Plane Format Compatibility Table
+// Uses the same blocks as kVkFormatTable, trimmed to the multiplane formats in the block.
+// Other formats in between get the default, which acts the same as a format that isn't found
 // clang-format off
-static const vvl::unordered_map<VkFormat, MULTIPLANE_COMPATIBILITY> kVkMultiplaneCompatibilityMap {
-    { VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM, {{
+static constexpr MULTIPLANE_COMPATIBILITY kVkMultiplaneCompatibility1000156002[] = {
+    // VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM
+    {{
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 2, 2, VK_FORMAT_R8_UNORM },
         { 2, 2, VK_FORMAT_R8_UNORM }
-    }}},
-    { VK_FORMAT_G8_B8R8_2PLANE_420_UNORM, {{
+    }},
+    // VK_FORMAT_G8_B8R8_2PLANE_420_UNORM
+    {{
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 2, 2, VK_FORMAT_R8G8_UNORM }
-    }}},
-    { VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM, {{
+    }},
+    // VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM
+    {{
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 2, 1, VK_FORMAT_R8_UNORM },
         { 2, 1, VK_FORMAT_R8_UNORM }
-    }}},
-    { VK_FORMAT_G8_B8R8_2PLANE_422_UNORM, {{
+    }},
+    // VK_FORMAT_G8_B8R8_2PLANE_422_UNORM
+    {{
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 2, 1, VK_FORMAT_R8G8_UNORM }
-    }}},
-    { VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM, {{
+    }},
+    // VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM
+    {{
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 1, 1, VK_FORMAT_R8_UNORM }
-    }}},
-    { VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_R10X6_UNORM_PACK16
+    {},
+    // VK_FORMAT_R10X6G10X6_UNORM_2PACK16
+    {},
+    // VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16
+    {},
+    // VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16
+    {},
+    // VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16
+    {},
+    // VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 2, 2, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 2, 2, VK_FORMAT_R10X6_UNORM_PACK16 }
-    }}},
-    { VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 2, 2, VK_FORMAT_R10X6G10X6_UNORM_2PACK16 }
-    }}},
-    { VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 2, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 2, 1, VK_FORMAT_R10X6_UNORM_PACK16 }
-    }}},
-    { VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 2, 1, VK_FORMAT_R10X6G10X6_UNORM_2PACK16 }
-    }}},
-    { VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 }
-    }}},
-    { VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_R12X4_UNORM_PACK16
+    {},
+    // VK_FORMAT_R12X4G12X4_UNORM_2PACK16
+    {},
+    // VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16
+    {},
+    // VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16
+    {},
+    // VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16
+    {},
+    // VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 2, 2, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 2, 2, VK_FORMAT_R12X4_UNORM_PACK16 }
-    }}},
-    { VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 2, 2, VK_FORMAT_R12X4G12X4_UNORM_2PACK16 }
-    }}},
-    { VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 2, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 2, 1, VK_FORMAT_R12X4_UNORM_PACK16 }
-    }}},
-    { VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 2, 1, VK_FORMAT_R12X4G12X4_UNORM_2PACK16 }
-    }}},
-    { VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 }
-    }}},
-    { VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM, {{
+    }},
+    // VK_FORMAT_G16B16G16R16_422_UNORM
+    {},
+    // VK_FORMAT_B16G16R16G16_422_UNORM
+    {},
+    // VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM
+    {{
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 2, 2, VK_FORMAT_R16_UNORM },
         { 2, 2, VK_FORMAT_R16_UNORM }
-    }}},
-    { VK_FORMAT_G16_B16R16_2PLANE_420_UNORM, {{
+    }},
+    // VK_FORMAT_G16_B16R16_2PLANE_420_UNORM
+    {{
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 2, 2, VK_FORMAT_R16G16_UNORM }
-    }}},
-    { VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM, {{
+    }},
+    // VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM
+    {{
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 2, 1, VK_FORMAT_R16_UNORM },
         { 2, 1, VK_FORMAT_R16_UNORM }
-    }}},
-    { VK_FORMAT_G16_B16R16_2PLANE_422_UNORM, {{
+    }},
+    // VK_FORMAT_G16_B16R16_2PLANE_422_UNORM
+    {{
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 2, 1, VK_FORMAT_R16G16_UNORM }
-    }}},
-    { VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM, {{
+    }},
+    // VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM
+    {{
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 1, 1, VK_FORMAT_R16_UNORM }
-    }}},
-    { VK_FORMAT_G8_B8R8_2PLANE_444_UNORM, {{
+    }},
+};
+static_assert(std::size(kVkMultiplaneCompatibility1000156002) == static_cast<size_t>(VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM - VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM + 1));
+static constexpr MULTIPLANE_COMPATIBILITY kVkMultiplaneCompatibility1000330000[] = {
+    // VK_FORMAT_G8_B8R8_2PLANE_444_UNORM
+    {{
         { 1, 1, VK_FORMAT_R8_UNORM },
         { 1, 1, VK_FORMAT_R8G8_UNORM }
-    }}},
-    { VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R10X6_UNORM_PACK16 },
         { 1, 1, VK_FORMAT_R10X6G10X6_UNORM_2PACK16 }
-    }}},
-    { VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16, {{
+    }},
+    // VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16
+    {{
         { 1, 1, VK_FORMAT_R12X4_UNORM_PACK16 },
         { 1, 1, VK_FORMAT_R12X4G12X4_UNORM_2PACK16 }
-    }}},
-    { VK_FORMAT_G16_B16R16_2PLANE_444_UNORM, {{
+    }},
+    // VK_FORMAT_G16_B16R16_2PLANE_444_UNORM
+    {{
         { 1, 1, VK_FORMAT_R16_UNORM },
         { 1, 1, VK_FORMAT_R16G16_UNORM }
-    }}},
+    }},
 };
+static_assert(std::size(kVkMultiplaneCompatibility1000330000) == static_cast<size_t>(VK_FORMAT_G16_B16R16_2PLANE_444_UNORM - VK_FORMAT_G8_B8R8_2PLANE_444_UNORM + 1));
 // clang-format on
 
-
-// Return true if all components in the format are an SFLOAT
-bool FormatIsSFLOAT(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R16_SFLOAT:
-        case VK_FORMAT_R16G16_SFLOAT:
-        case VK_FORMAT_R16G16B16_SFLOAT:
-        case VK_FORMAT_R16G16B16A16_SFLOAT:
-        case VK_FORMAT_R32_SFLOAT:
-        case VK_FORMAT_R32G32_SFLOAT:
-        case VK_FORMAT_R32G32B32_SFLOAT:
-        case VK_FORMAT_R32G32B32A32_SFLOAT:
-        case VK_FORMAT_R64_SFLOAT:
-        case VK_FORMAT_R64G64_SFLOAT:
-        case VK_FORMAT_R64G64B64_SFLOAT:
-        case VK_FORMAT_R64G64B64A64_SFLOAT:
-        case VK_FORMAT_D32_SFLOAT:
-        case VK_FORMAT_BC6H_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_5x4_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_5x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_6x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_6x6_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_8x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_8x6_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_8x8_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x6_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x8_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x10_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_12x10_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
+static const MULTIPLANE_COMPATIBILITY* GetMultiplaneCompatibility(VkFormat format) {
+    if (format >= VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM && format <= VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM) {
+        return &kVkMultiplaneCompatibility1000156002[format - VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM];
     }
-    return found;
+    if (format >= VK_FORMAT_G8_B8R8_2PLANE_444_UNORM && format <= VK_FORMAT_G16_B16R16_2PLANE_444_UNORM) {
+        return &kVkMultiplaneCompatibility1000330000[format - VK_FORMAT_G8_B8R8_2PLANE_444_UNORM];
+    }
+    return nullptr;
 }
 
+
+// Return true if all components in the format are an SFLOAT
+bool FormatIsSFLOAT(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_SFLOAT) != 0; }
+
 // Return true if all components in the format are an SINT
-bool FormatIsSINT(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R8_SINT:
-        case VK_FORMAT_R8G8_SINT:
-        case VK_FORMAT_R8G8B8_SINT:
-        case VK_FORMAT_B8G8R8_SINT:
-        case VK_FORMAT_R8G8B8A8_SINT:
-        case VK_FORMAT_B8G8R8A8_SINT:
-        case VK_FORMAT_A8B8G8R8_SINT_PACK32:
-        case VK_FORMAT_A2R10G10B10_SINT_PACK32:
-        case VK_FORMAT_A2B10G10R10_SINT_PACK32:
-        case VK_FORMAT_R16_SINT:
-        case VK_FORMAT_R16G16_SINT:
-        case VK_FORMAT_R16G16B16_SINT:
-        case VK_FORMAT_R16G16B16A16_SINT:
-        case VK_FORMAT_R32_SINT:
-        case VK_FORMAT_R32G32_SINT:
-        case VK_FORMAT_R32G32B32_SINT:
-        case VK_FORMAT_R32G32B32A32_SINT:
-        case VK_FORMAT_R64_SINT:
-        case VK_FORMAT_R64G64_SINT:
-        case VK_FORMAT_R64G64B64_SINT:
-        case VK_FORMAT_R64G64B64A64_SINT:
-        case VK_FORMAT_R16G16_S10_5_NV:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsSINT(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_SINT) != 0; }
 
 // Return true if all components in the format are an SNORM
-bool FormatIsSNORM(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R8_SNORM:
-        case VK_FORMAT_R8G8_SNORM:
-        case VK_FORMAT_R8G8B8_SNORM:
-        case VK_FORMAT_B8G8R8_SNORM:
-        case VK_FORMAT_R8G8B8A8_SNORM:
-        case VK_FORMAT_B8G8R8A8_SNORM:
-        case VK_FORMAT_A8B8G8R8_SNORM_PACK32:
-        case VK_FORMAT_A2R10G10B10_SNORM_PACK32:
-        case VK_FORMAT_A2B10G10R10_SNORM_PACK32:
-        case VK_FORMAT_R16_SNORM:
-        case VK_FORMAT_R16G16_SNORM:
-        case VK_FORMAT_R16G16B16_SNORM:
-        case VK_FORMAT_R16G16B16A16_SNORM:
-        case VK_FORMAT_EAC_R11_SNORM_BLOCK:
-        case VK_FORMAT_EAC_R11G11_SNORM_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsSNORM(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_SNORM) != 0; }
 
 // Return true if all components in the format are an SRGB
-bool FormatIsSRGB(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R8_SRGB:
-        case VK_FORMAT_R8G8_SRGB:
-        case VK_FORMAT_R8G8B8_SRGB:
-        case VK_FORMAT_B8G8R8_SRGB:
-        case VK_FORMAT_R8G8B8A8_SRGB:
-        case VK_FORMAT_B8G8R8A8_SRGB:
-        case VK_FORMAT_A8B8G8R8_SRGB_PACK32:
-        case VK_FORMAT_BC1_RGB_SRGB_BLOCK:
-        case VK_FORMAT_BC1_RGBA_SRGB_BLOCK:
-        case VK_FORMAT_BC2_SRGB_BLOCK:
-        case VK_FORMAT_BC3_SRGB_BLOCK:
-        case VK_FORMAT_BC4_SNORM_BLOCK:
-        case VK_FORMAT_BC5_SNORM_BLOCK:
-        case VK_FORMAT_BC7_SRGB_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_4x4_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_5x4_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_5x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_6x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_6x6_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_8x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_8x6_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_8x8_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x6_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x8_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x10_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_12x10_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_12x12_SRGB_BLOCK:
-        case VK_FORMAT_PVRTC1_2BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC1_4BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_2BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsSRGB(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_SRGB) != 0; }
 
 // Return true if all components in the format are an SSCALED
-bool FormatIsSSCALED(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R8_SSCALED:
-        case VK_FORMAT_R8G8_SSCALED:
-        case VK_FORMAT_R8G8B8_SSCALED:
-        case VK_FORMAT_B8G8R8_SSCALED:
-        case VK_FORMAT_R8G8B8A8_SSCALED:
-        case VK_FORMAT_B8G8R8A8_SSCALED:
-        case VK_FORMAT_A8B8G8R8_SSCALED_PACK32:
-        case VK_FORMAT_A2R10G10B10_SSCALED_PACK32:
-        case VK_FORMAT_A2B10G10R10_SSCALED_PACK32:
-        case VK_FORMAT_R16_SSCALED:
-        case VK_FORMAT_R16G16_SSCALED:
-        case VK_FORMAT_R16G16B16_SSCALED:
-        case VK_FORMAT_R16G16B16A16_SSCALED:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsSSCALED(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_SSCALED) != 0; }
 
 // Return true if all components in the format are an UFLOAT
-bool FormatIsUFLOAT(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_B10G11R11_UFLOAT_PACK32:
-        case VK_FORMAT_E5B9G9R9_UFLOAT_PACK32:
-        case VK_FORMAT_BC6H_UFLOAT_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsUFLOAT(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_UFLOAT) != 0; }
 
 // Return true if all components in the format are an UINT
-bool FormatIsUINT(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R8_UINT:
-        case VK_FORMAT_R8G8_UINT:
-        case VK_FORMAT_R8G8B8_UINT:
-        case VK_FORMAT_B8G8R8_UINT:
-        case VK_FORMAT_R8G8B8A8_UINT:
-        case VK_FORMAT_B8G8R8A8_UINT:
-        case VK_FORMAT_A8B8G8R8_UINT_PACK32:
-        case VK_FORMAT_A2R10G10B10_UINT_PACK32:
-        case VK_FORMAT_A2B10G10R10_UINT_PACK32:
-        case VK_FORMAT_R16_UINT:
-        case VK_FORMAT_R16G16_UINT:
-        case VK_FORMAT_R16G16B16_UINT:
-        case VK_FORMAT_R16G16B16A16_UINT:
-        case VK_FORMAT_R32_UINT:
-        case VK_FORMAT_R32G32_UINT:
-        case VK_FORMAT_R32G32B32_UINT:
-        case VK_FORMAT_R32G32B32A32_UINT:
-        case VK_FORMAT_R64_UINT:
-        case VK_FORMAT_R64G64_UINT:
-        case VK_FORMAT_R64G64B64_UINT:
-        case VK_FORMAT_R64G64B64A64_UINT:
-        case VK_FORMAT_S8_UINT:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsUINT(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_UINT) != 0; }
 
 // Return true if all components in the format are an UNORM
-bool FormatIsUNORM(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R4G4_UNORM_PACK8:
-        case VK_FORMAT_R4G4B4A4_UNORM_PACK16:
-        case VK_FORMAT_B4G4R4A4_UNORM_PACK16:
-        case VK_FORMAT_R5G6B5_UNORM_PACK16:
-        case VK_FORMAT_B5G6R5_UNORM_PACK16:
-        case VK_FORMAT_R5G5B5A1_UNORM_PACK16:
-        case VK_FORMAT_B5G5R5A1_UNORM_PACK16:
-        case VK_FORMAT_A1R5G5B5_UNORM_PACK16:
-        case VK_FORMAT_R8_UNORM:
-        case VK_FORMAT_R8G8_UNORM:
-        case VK_FORMAT_R8G8B8_UNORM:
-        case VK_FORMAT_B8G8R8_UNORM:
-        case VK_FORMAT_R8G8B8A8_UNORM:
-        case VK_FORMAT_B8G8R8A8_UNORM:
-        case VK_FORMAT_A8B8G8R8_UNORM_PACK32:
-        case VK_FORMAT_A2R10G10B10_UNORM_PACK32:
-        case VK_FORMAT_A2B10G10R10_UNORM_PACK32:
-        case VK_FORMAT_R16_UNORM:
-        case VK_FORMAT_R16G16_UNORM:
-        case VK_FORMAT_R16G16B16_UNORM:
-        case VK_FORMAT_R16G16B16A16_UNORM:
-        case VK_FORMAT_D16_UNORM:
-        case VK_FORMAT_X8_D24_UNORM_PACK32:
-        case VK_FORMAT_BC1_RGB_UNORM_BLOCK:
-        case VK_FORMAT_BC1_RGBA_UNORM_BLOCK:
-        case VK_FORMAT_BC2_UNORM_BLOCK:
-        case VK_FORMAT_BC3_UNORM_BLOCK:
-        case VK_FORMAT_BC4_UNORM_BLOCK:
-        case VK_FORMAT_BC5_UNORM_BLOCK:
-        case VK_FORMAT_BC7_UNORM_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK:
-        case VK_FORMAT_EAC_R11_UNORM_BLOCK:
-        case VK_FORMAT_EAC_R11G11_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_4x4_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_5x4_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_5x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_6x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_6x6_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_8x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_8x6_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_8x8_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x6_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x8_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x10_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_12x10_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_12x12_UNORM_BLOCK:
-        case VK_FORMAT_G8B8G8R8_422_UNORM:
-        case VK_FORMAT_B8G8R8G8_422_UNORM:
-        case VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM:
-        case VK_FORMAT_G8_B8R8_2PLANE_420_UNORM:
-        case VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM:
-        case VK_FORMAT_G8_B8R8_2PLANE_422_UNORM:
-        case VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM:
-        case VK_FORMAT_R10X6_UNORM_PACK16:
-        case VK_FORMAT_R10X6G10X6_UNORM_2PACK16:
-        case VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16:
-        case VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16:
-        case VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16:
-        case VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16:
-        case VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16:
-        case VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16:
-        case VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16:
-        case VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16:
-        case VK_FORMAT_R12X4_UNORM_PACK16:
-        case VK_FORMAT_R12X4G12X4_UNORM_2PACK16:
-        case VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16:
-        case VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16:
-        case VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16:
-        case VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16:
-        case VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16:
-        case VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16:
-        case VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16:
-        case VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16:
-        case VK_FORMAT_G16B16G16R16_422_UNORM:
-        case VK_FORMAT_B16G16R16G16_422_UNORM:
-        case VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM:
-        case VK_FORMAT_G16_B16R16_2PLANE_420_UNORM:
-        case VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM:
-        case VK_FORMAT_G16_B16R16_2PLANE_422_UNORM:
-        case VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM:
-        case VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_PVRTC1_4BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_2BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_4BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_G8_B8R8_2PLANE_444_UNORM:
-        case VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16:
-        case VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16:
-        case VK_FORMAT_G16_B16R16_2PLANE_444_UNORM:
-        case VK_FORMAT_A4R4G4B4_UNORM_PACK16:
-        case VK_FORMAT_A4B4G4R4_UNORM_PACK16:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsUNORM(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_UNORM) != 0; }
 
 // Return true if all components in the format are an USCALED
-bool FormatIsUSCALED(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_R8_USCALED:
-        case VK_FORMAT_R8G8_USCALED:
-        case VK_FORMAT_R8G8B8_USCALED:
-        case VK_FORMAT_B8G8R8_USCALED:
-        case VK_FORMAT_R8G8B8A8_USCALED:
-        case VK_FORMAT_B8G8R8A8_USCALED:
-        case VK_FORMAT_A8B8G8R8_USCALED_PACK32:
-        case VK_FORMAT_A2R10G10B10_USCALED_PACK32:
-        case VK_FORMAT_A2B10G10R10_USCALED_PACK32:
-        case VK_FORMAT_R16_USCALED:
-        case VK_FORMAT_R16G16_USCALED:
-        case VK_FORMAT_R16G16B16_USCALED:
-        case VK_FORMAT_R16G16B16A16_USCALED:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsUSCALED(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_USCALED) != 0; }
 
 
 // Return true if the format is a ASTC_HDR compressed image format
-bool FormatIsCompressed_ASTC_HDR(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_ASTC_10x10_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x6_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_10x8_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_12x10_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_5x4_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_5x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_6x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_6x6_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_8x5_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_8x6_SFLOAT_BLOCK:
-        case VK_FORMAT_ASTC_8x8_SFLOAT_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsCompressed_ASTC_HDR(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_ASTC_HDR) != 0; }
 
 // Return true if the format is a ASTC_LDR compressed image format
-bool FormatIsCompressed_ASTC_LDR(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_ASTC_10x10_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x10_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x6_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x6_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_10x8_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_10x8_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_12x10_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_12x10_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_12x12_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_12x12_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_4x4_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_4x4_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_5x4_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_5x4_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_5x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_5x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_6x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_6x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_6x6_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_6x6_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_8x5_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_8x5_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_8x6_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_8x6_UNORM_BLOCK:
-        case VK_FORMAT_ASTC_8x8_SRGB_BLOCK:
-        case VK_FORMAT_ASTC_8x8_UNORM_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsCompressed_ASTC_LDR(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_ASTC_LDR) != 0; }
 
 // Return true if the format is a BC compressed image format
-bool FormatIsCompressed_BC(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_BC1_RGBA_SRGB_BLOCK:
-        case VK_FORMAT_BC1_RGBA_UNORM_BLOCK:
-        case VK_FORMAT_BC1_RGB_SRGB_BLOCK:
-        case VK_FORMAT_BC1_RGB_UNORM_BLOCK:
-        case VK_FORMAT_BC2_SRGB_BLOCK:
-        case VK_FORMAT_BC2_UNORM_BLOCK:
-        case VK_FORMAT_BC3_SRGB_BLOCK:
-        case VK_FORMAT_BC3_UNORM_BLOCK:
-        case VK_FORMAT_BC4_SNORM_BLOCK:
-        case VK_FORMAT_BC4_UNORM_BLOCK:
-        case VK_FORMAT_BC5_SNORM_BLOCK:
-        case VK_FORMAT_BC5_UNORM_BLOCK:
-        case VK_FORMAT_BC6H_SFLOAT_BLOCK:
-        case VK_FORMAT_BC6H_UFLOAT_BLOCK:
-        case VK_FORMAT_BC7_SRGB_BLOCK:
-        case VK_FORMAT_BC7_UNORM_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsCompressed_BC(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_BC) != 0; }
 
 // Return true if the format is a EAC compressed image format
-bool FormatIsCompressed_EAC(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_EAC_R11G11_SNORM_BLOCK:
-        case VK_FORMAT_EAC_R11G11_UNORM_BLOCK:
-        case VK_FORMAT_EAC_R11_SNORM_BLOCK:
-        case VK_FORMAT_EAC_R11_UNORM_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsCompressed_EAC(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_EAC) != 0; }
 
 // Return true if the format is a ETC2 compressed image format
-bool FormatIsCompressed_ETC2(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK:
-        case VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsCompressed_ETC2(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_ETC2) != 0; }
 
 // Return true if the format is a PVRTC compressed image format
-bool FormatIsCompressed_PVRTC(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_PVRTC1_2BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_PVRTC1_4BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC1_4BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_2BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_2BPP_UNORM_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG:
-        case VK_FORMAT_PVRTC2_4BPP_UNORM_BLOCK_IMG:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}
+bool FormatIsCompressed_PVRTC(VkFormat format) { return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_PVRTC) != 0; }
 
 // Return true if the format is any compressed image format
 bool FormatIsCompressed(VkFormat format) {
-    return (
-      FormatIsCompressed_ASTC_HDR(format) ||
-      FormatIsCompressed_ASTC_LDR(format) ||
-      FormatIsCompressed_BC(format) ||
-      FormatIsCompressed_EAC(format) ||
-      FormatIsCompressed_ETC2(format) ||
-      FormatIsCompressed_PVRTC(format));
+    constexpr uint32_t compressed =
+        FORMAT_PROPERTY_COMPRESSED_ASTC_HDR |
+        FORMAT_PROPERTY_COMPRESSED_ASTC_LDR |
+        FORMAT_PROPERTY_COMPRESSED_BC |
+        FORMAT_PROPERTY_COMPRESSED_EAC |
+        FORMAT_PROPERTY_COMPRESSED_ETC2 |
+        FORMAT_PROPERTY_COMPRESSED_PVRTC;
+    return (FormatProperties(format) & compressed) != 0;
 }
 
 
 // Return true if format is a depth OR stencil format
 bool FormatIsDepthOrStencil(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_D16_UNORM:
-        case VK_FORMAT_X8_D24_UNORM_PACK32:
-        case VK_FORMAT_D32_SFLOAT:
-        case VK_FORMAT_S8_UINT:
-        case VK_FORMAT_D16_UNORM_S8_UINT:
-        case VK_FORMAT_D24_UNORM_S8_UINT:
-        case VK_FORMAT_D32_SFLOAT_S8_UINT:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) != 0;
 }
 
 // Return true if format is a depth AND stencil format
 bool FormatIsDepthAndStencil(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_D16_UNORM_S8_UINT:
-        case VK_FORMAT_D24_UNORM_S8_UINT:
-        case VK_FORMAT_D32_SFLOAT_S8_UINT:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) == (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL);
 }
 
 // Return true if format is a depth ONLY format
 bool FormatIsDepthOnly(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_D16_UNORM:
-        case VK_FORMAT_X8_D24_UNORM_PACK32:
-        case VK_FORMAT_D32_SFLOAT:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) == FORMAT_PROPERTY_DEPTH;
 }
 
 // Return true if format is a stencil ONLY format
 bool FormatIsStencilOnly(VkFormat format) {
-    bool found = false;
-    switch (format) {
-        case VK_FORMAT_S8_UINT:
-            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) == FORMAT_PROPERTY_STENCIL;
 }
 
 // Returns size of depth component in bits
@@ -1755,49 +1635,49 @@ bool FormatIsYChromaSubsampled(VkFormat format) {
 // Will return VK_FORMAT_UNDEFINED if given a plane aspect that doesn't exist for the format
 VkFormat FindMultiplaneCompatibleFormat(VkFormat mp_fmt, VkImageAspectFlags plane_aspect) {
     const uint32_t plane_idx = GetPlaneIndex(plane_aspect);
-    auto it = kVkMultiplaneCompatibilityMap.find(mp_fmt);
-    if ((it == kVkMultiplaneCompatibilityMap.end()) || (plane_idx >= FORMAT_MAX_PLANES)) {
+    const auto* compatibility = GetMultiplaneCompatibility(mp_fmt);
+    if ((compatibility == nullptr) || (plane_idx >= FORMAT_MAX_PLANES)) {
         return VK_FORMAT_UNDEFINED;
     }
 
-    return it->second.per_plane[plane_idx].compatible_format;
+    return compatibility->per_plane[plane_idx].compatible_format;
 }
 
 // Will return {1, 1} if given a plane aspect that doesn't exist for the format
 VkExtent2D FindMultiplaneExtentDivisors(VkFormat mp_fmt, VkImageAspectFlags plane_aspect) {
     VkExtent2D divisors = {1, 1};
     const uint32_t plane_idx = GetPlaneIndex(plane_aspect);
-    auto it = kVkMultiplaneCompatibilityMap.find(mp_fmt);
-    if ((it == kVkMultiplaneCompatibilityMap.end()) || (plane_idx >= FORMAT_MAX_PLANES)) {
+    const auto* compatibility = GetMultiplaneCompatibility(mp_fmt);
+    if ((compatibility == nullptr) || (plane_idx >= FORMAT_MAX_PLANES)) {
         return divisors;
     }
 
-    divisors.width = it->second.per_plane[plane_idx].width_divisor;
-    divisors.height = it->second.per_plane[plane_idx].height_divisor;
+    divisors.width = compatibility->per_plane[plane_idx].width_divisor;
+    divisors.height = compatibility->per_plane[plane_idx].height_divisor;
     return divisors;
 }
 
 
 uint32_t FormatComponentCount(VkFormat format) {
-    auto format_info = kVkFormatTable.find(format);
-    if (format_info != kVkFormatTable.end()) {
-        return format_info->second.component_count;
+    const auto* format_info = GetFormatInfo(format);
+    if (format_info) {
+        return format_info->component_count;
     }
     return 0;
 }
 
 VkExtent3D FormatTexelBlockExtent(VkFormat format) {
-    auto format_info = kVkFormatTable.find(format);
-    if (format_info != kVkFormatTable.end()) {
-        return format_info->second.block_extent;
+    const auto* format_info = GetFormatInfo(format);
+    if (format_info) {
+        return format_info->block_extent;
     }
     return {1, 1, 1};
 }
 
 FORMAT_COMPATIBILITY_CLASS FormatCompatibilityClass(VkFormat format) {
-    auto format_info = kVkFormatTable.find(format);
-    if (format_info != kVkFormatTable.end()) {
-        return format_info->second.compatibility;
+    const auto* format_info = GetFormatInfo(format);
+    if (format_info) {
+        return format_info->compatibility;
     }
     return FORMAT_COMPATIBILITY_CLASS::NONE;
 }
@@ -1825,9 +1705,9 @@ uint32_t FormatElementSize(VkFormat format, VkImageAspectFlags aspectMask) {
         format = FindMultiplaneCompatibleFormat(format, aspectMask);
     }
 
-    auto item = kVkFormatTable.find(format);
-    if (item != kVkFormatTable.end()) {
-        return item->second.block_size;
+    const auto* item = GetFormatInfo(format);
+    if (item) {
+        return item->block_size;
     }
     return 0;
 }
@@ -1845,22 +1725,22 @@ double FormatTexelSize(VkFormat format, VkImageAspectFlags aspectMask) {
 }
 
 bool FormatHasComponentSize(VkFormat format, uint32_t size) {
-    auto item = kVkFormatTable.find(format);
-    if (item == kVkFormatTable.end()) {
+    const auto* item = GetFormatInfo(format);
+    if (!item) {
         return false;
     }
-    const COMPONENT_INFO* begin = item->second.components;
-    const COMPONENT_INFO* end = item->second.components + FORMAT_MAX_COMPONENTS;
+    const COMPONENT_INFO* begin = item->components;
+    const COMPONENT_INFO* end = item->components + FORMAT_MAX_COMPONENTS;
     return std::find_if(begin, end, [size](const COMPONENT_INFO& info) { return info.size == size; }) != end;
 }
 
 static bool FormatHasComponentType(VkFormat format, COMPONENT_TYPE component) {
-    auto item = kVkFormatTable.find(format);
-    if (item == kVkFormatTable.end()) {
+    const auto* item = GetFormatInfo(format);
+    if (!item) {
         return false;
     }
-    const COMPONENT_INFO* begin = item->second.components;
-    const COMPONENT_INFO* end = item->second.components + FORMAT_MAX_COMPONENTS;
+    const COMPONENT_INFO* begin = item->components;
+    const COMPONENT_INFO* end = item->components + FORMAT_MAX_COMPONENTS;
     return std::find_if(begin, end, [component](const COMPONENT_INFO& info) { return info.type == component; }) != end;
 }
 
@@ -1881,20 +1761,20 @@ bool FormatHasAlpha(VkFormat format) {
 }
 
 bool FormatsSameComponentBits(VkFormat format_a, VkFormat format_b) {
-    const auto item_a = kVkFormatTable.find(format_a);
-    const auto item_b = kVkFormatTable.find(format_b);
-    if (item_a == kVkFormatTable.end() || item_b == kVkFormatTable.end()) {
+    const auto* item_a = GetFormatInfo(format_a);
+    const auto* item_b = GetFormatInfo(format_b);
+    if (!item_a || !item_b) {
         return false;
-    } else if (item_a->second.component_count != item_b->second.component_count) {
+    } else if (item_a->component_count != item_b->component_count) {
         return false;
     }
     // Need to loop match each component type is found in both formats
     // formats are maxed at 4 components, so the double loop is not going to scale
-    for (uint32_t i = 0; i < item_a->second.component_count; i++) {
-        const auto& component_a = item_a->second.components[i];
+    for (uint32_t i = 0; i < item_a->component_count; i++) {
+        const auto& component_a = item_a->components[i];
         bool component_match = false;
-        for (uint32_t j = 0; j < item_b->second.component_count; j++) {
-            const auto& component_b = item_b->second.components[j];
+        for (uint32_t j = 0; j < item_b->component_count; j++) {
+            const auto& component_b = item_b->components[j];
             if ((component_a.type == component_b.type) && (component_a.size == component_b.size)) {
                 component_match = true;
                 break;
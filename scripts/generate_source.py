@@ -18,7 +18,10 @@
 # limitations under the License.
 
 import argparse
+import ast
+import concurrent.futures
 import filecmp
+import hashlib
 import os
 import shutil
 import subprocess
@@ -31,6 +34,100 @@ import json
 # files to exclude from --verify check
 verify_exclude = ['.clang-format']
 
+# cache of the parsed registry, it is invalidated when vk.xml or the scripts parsing it change
+default_cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'vvl_codegen')
+
+# Runs a single generator command, the output is captured so that
+# generators running in parallel don't interleave their messages
+def run_generator(cmd, cwd):
+    result = subprocess.run([sys.executable] + cmd, cwd=cwd,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True)
+    return (result.returncode, result.stdout)
+
+# Returns the scripts found in search_dirs that are imported by script, directly or
+# indirectly, including script itself
+def get_script_dependencies(script, search_dirs, found=None):
+    if found is None:
+        found = set()
+    if script in found or not os.path.isfile(script):
+        return found
+    found.add(script)
+    with open(script, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=script)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module is not None and node.level == 0:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            for search_dir in search_dirs:
+                module_file = os.path.join(search_dir, *module.split('.')) + '.py'
+                if os.path.isfile(module_file):
+                    get_script_dependencies(module_file, search_dirs, found)
+                    break
+    return found
+
+# Reads the genOpts table of lvl_genvk.py and returns, for each target, the generator
+# module it uses and the names of the BaseGeneratorOptions it sets
+def get_lvl_genvk_targets(lvl_genvk):
+    with open(lvl_genvk, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=lvl_genvk)
+
+    class_modules = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module is not None and node.module.startswith('generators.'):
+            for alias in node.names:
+                class_modules[alias.asname or alias.name] = node.module
+
+    targets = {}
+    for node in ast.walk(tree):
+        # genOpts['target'] = [GeneratorClass, BaseGeneratorOptions(...)]
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1 or not isinstance(node.value, ast.List):
+            continue
+        subscript = node.targets[0]
+        if not isinstance(subscript, ast.Subscript) or not isinstance(subscript.value, ast.Name) or subscript.value.id != 'genOpts':
+            continue
+        key = subscript.slice.value if isinstance(subscript.slice, ast.Index) else subscript.slice
+        (generator_class, options) = node.value.elts
+        targets[ast.literal_eval(key)] = (class_modules[generator_class.id], {keyword.arg for keyword in options.keywords})
+    return targets
+
+file_hashes = {}
+def get_file_hash(filename):
+    if filename not in file_hashes:
+        with open(filename, 'rb') as f:
+            file_hashes[filename] = hashlib.sha256(f.read()).hexdigest()
+    return file_hashes[filename]
+
+# A single hash of everything a target depends on, the command used to generate it and the content of each input file
+def get_inputs_hash(cmd, inputs):
+    inputs_hash = hashlib.sha256(' '.join(cmd).encode('utf-8'))
+    for filename in sorted(inputs):
+        inputs_hash.update(f'{filename}:{get_file_hash(filename)}'.encode('utf-8'))
+    return inputs_hash.hexdigest()
+
+# The manifest records for each generated file the hash of its inputs and of the file itself
+# as of the last --incremental run, so a file is only generated again if one of those changed
+MANIFEST_VERSION = 1
+
+def load_manifest(manifest_file):
+    try:
+        with open(manifest_file, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def save_manifest(manifest_file, files):
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+    with open(manifest_file, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump({'version': MANIFEST_VERSION, 'files': files}, f, indent=4, sort_keys=True)
+
 def main(argv):
     parser = argparse.ArgumentParser(description='Generate source code for this repository')
     parser.add_argument('--api',
@@ -40,73 +137,146 @@ def main(argv):
     parser.add_argument('registry', metavar='REGISTRY_PATH', help='path to the Vulkan-Headers registry directory')
     parser.add_argument('grammar', metavar='GRAMMAR_PATH', help='path to the SPIRV-Headers grammar directory')
     parser.add_argument('--generated-version', help='sets the header version used to generate the repo')
+    parser.add_argument('--single-process', action='store_true', help='load vk.xml once and run all registry generators in a single process')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of generators to run in parallel')
+    parser.add_argument('--cache-dir', default=default_cache_dir, help='directory to cache the parsed registry in between runs')
+    parser.add_argument('--no-cache', action='store_true', help='always parse the registry instead of using the cache')
     group = parser.add_mutually_exclusive_group()
     group.add_argument('-i', '--incremental', action='store_true', help='only update repo files that change')
     group.add_argument('-v', '--verify', action='store_true', help='verify repo files match generator output')
     args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
 
     # We need modules from the registry directory, add it here so no one has to set it in PYTHONPATH
     sys.path.insert(0, args.registry)
     import common_codegen
 
-    gen_cmds = [*[[common_codegen.repo_relative('scripts/lvl_genvk.py'),
-                   '-registry', os.path.abspath(os.path.join(args.registry,  'vk.xml')),
-                   '-grammar', os.path.abspath(os.path.join(args.grammar,  'spirv.core.grammar.json')),
-                   '-quiet',
-                   '-api', args.api,
-                   filename] for filename in ["chassis.cpp",
-                                              "chassis.h",
-                                              "chassis_dispatch_helper.h",
-                                              "layer_chassis_dispatch.cpp",
-                                              "layer_chassis_dispatch.h",
-                                              "object_tracker.cpp",
-                                              "object_tracker.h",
-                                              "parameter_validation.cpp",
-                                              "parameter_validation.h",
-                                              "enum_flag_bits.h",
-                                              "sync_validation_types.cpp",
-                                              "sync_validation_types.h",
-                                              "thread_safety.cpp",
-                                              "thread_safety_commands.h",
-                                              "thread_safety_counter_definitions.h",
-                                              "thread_safety_counter_instances.h",
-                                              "thread_safety_counter_bodies.h",
-                                              "vk_dispatch_table_helper.h",
-                                              "vk_enum_string_helper.h",
-                                              "vk_extension_helper.h",
-                                              "vk_layer_dispatch_table.h",
-                                              "vk_object_types.h",
-                                              "vk_safe_struct.h",
-                                              "vk_safe_struct_utils.cpp",
-                                              "vk_safe_struct_core.cpp",
-                                              "vk_safe_struct_khr.cpp",
-                                              "vk_safe_struct_ext.cpp",
-                                              "vk_safe_struct_vendor.cpp",
-                                              "lvt_function_pointers.cpp",
-                                              "lvt_function_pointers.h",
-                                              "vk_typemap_helper.h",
-                                              "best_practices.h",
-                                              "best_practices.cpp",
-                                              "spirv_validation_helper.cpp",
-                                              "spirv_grammar_helper.cpp",
-                                              "spirv_grammar_helper.h",
-                                              "command_validation.cpp",
-                                              "command_validation.h",
-                                              "dynamic_state_helper.cpp",
-                                              "dynamic_state_helper.h",
-                                              "vk_format_utils.cpp",
-                                              "vk_format_utils.h"]],
-                [common_codegen.repo_relative('scripts/vk_validation_stats.py'),
-                 os.path.abspath(os.path.join(args.registry, 'validusage.json')),
-                 '-export_header'],
-                [common_codegen.repo_relative('scripts/generators/external_revision_generator.py'),
-                 '--json_file', common_codegen.repo_relative('scripts/known_good.json'),
-                 '--json_keys', 'repos,3,commit',
-                 '-s', 'SPIRV_TOOLS_COMMIT_ID',
-                 '-o', 'spirv_tools_commit_id.h']]
+    # files generated by lvl_genvk.py from the vk.xml registry (and SPIR-V grammar)
+    registry_targets = ["chassis.cpp",
+                        "chassis.h",
+                        "chassis_dispatch_helper.h",
+                        "layer_chassis_dispatch.cpp",
+                        "layer_chassis_dispatch.h",
+                        "object_tracker.cpp",
+                        "object_tracker.h",
+                        "parameter_validation.cpp",
+                        "parameter_validation.h",
+                        "enum_flag_bits.h",
+                        "sync_validation_types.cpp",
+                        "sync_validation_types.h",
+                        "thread_safety.cpp",
+                        "thread_safety_commands.h",
+                        "thread_safety_counter_definitions.h",
+                        "thread_safety_counter_instances.h",
+                        "thread_safety_counter_bodies.h",
+                        "vk_dispatch_table_helper.h",
+                        "vk_enum_string_helper.h",
+                        "vk_extension_helper.h",
+                        "vk_layer_dispatch_table.h",
+                        "vk_object_types.h",
+                        "vk_safe_struct.h",
+                        "vk_safe_struct_utils.cpp",
+                        "vk_safe_struct_core.cpp",
+                        "vk_safe_struct_khr.cpp",
+                        "vk_safe_struct_ext.cpp",
+                        "vk_safe_struct_vendor.cpp",
+                        "lvt_function_pointers.cpp",
+                        "lvt_function_pointers.h",
+                        "vk_typemap_helper.h",
+                        "best_practices.h",
+                        "best_practices.cpp",
+                        "spirv_validation_helper.cpp",
+                        "spirv_grammar_helper.cpp",
+                        "spirv_grammar_helper.h",
+                        "command_validation.cpp",
+                        "command_validation.h",
+                        "dynamic_state_helper.cpp",
+                        "dynamic_state_helper.h",
+                        "vk_format_utils.cpp",
+                        "vk_format_utils.h"]
+
+    vk_xml = os.path.abspath(os.path.join(args.registry, 'vk.xml'))
+    valid_usage_json = os.path.abspath(os.path.join(args.registry, 'validusage.json'))
+    grammar_json = os.path.abspath(os.path.join(args.grammar, 'spirv.core.grammar.json'))
+    known_good_json = common_codegen.repo_relative('scripts/known_good.json')
+    lvl_genvk = common_codegen.repo_relative('scripts/lvl_genvk.py')
+    vk_validation_stats = common_codegen.repo_relative('scripts/vk_validation_stats.py')
+    external_revision_generator = common_codegen.repo_relative('scripts/generators/external_revision_generator.py')
+
+    lvl_genvk_cmd = [lvl_genvk,
+                     '-registry', vk_xml,
+                     '-grammar', grammar_json,
+                     '-quiet',
+                     '-api', args.api]
+
+    # commands of the generators that are not driven by lvl_genvk.py, by the file they generate
+    other_cmds = {'vk_validation_error_messages.h' : [vk_validation_stats,
+                                                      valid_usage_json,
+                                                      '-export_header'],
+                  'spirv_tools_commit_id.h' : [external_revision_generator,
+                                               '--json_file', known_good_json,
+                                               '--json_keys', 'repos,3,commit',
+                                               '-s', 'SPIRV_TOOLS_COMMIT_ID',
+                                               '-o', 'spirv_tools_commit_id.h']}
 
     repo_dir = common_codegen.repo_relative(f'layers/{args.api}/generated')
 
+    # only use the manifest to skip up to date files when updating the repo files
+    manifest_file = None
+    if args.incremental and not args.no_cache:
+        repo_hash = hashlib.sha256(repo_dir.encode('utf-8')).hexdigest()[:16]
+        manifest_file = os.path.join(os.path.abspath(args.cache_dir), f'manifest_{repo_hash}.json')
+
+    manifest = {}
+    inputs_hashes = {}
+    if manifest_file is not None:
+        manifest = load_manifest(manifest_file)
+
+        scripts_dir = common_codegen.repo_relative('scripts')
+        search_dirs = [scripts_dir, os.path.abspath(args.registry)]
+        registry_scripts = get_script_dependencies(os.path.join(os.path.abspath(args.registry), 'reg.py'), search_dirs)
+
+        for filename, (module, options) in get_lvl_genvk_targets(lvl_genvk).items():
+            if filename not in registry_targets:
+                continue
+            inputs = {lvl_genvk, vk_xml} | registry_scripts
+            inputs |= get_script_dependencies(os.path.join(scripts_dir, *module.split('.')) + '.py', search_dirs)
+            if 'valid_usage_path' in options:
+                inputs.add(valid_usage_json)
+            if 'grammar' in options:
+                inputs.add(grammar_json)
+            inputs_hashes[filename] = get_inputs_hash(lvl_genvk_cmd + [filename], inputs)
+
+        other_inputs = {'vk_validation_error_messages.h' : {valid_usage_json} | get_script_dependencies(vk_validation_stats, search_dirs),
+                        'spirv_tools_commit_id.h' : {known_good_json} | get_script_dependencies(external_revision_generator, search_dirs)}
+        for filename, inputs in other_inputs.items():
+            inputs_hashes[filename] = get_inputs_hash(other_cmds[filename], inputs)
+
+    # a file is up to date if neither its inputs nor the repo file itself changed since it was last generated
+    def is_up_to_date(filename):
+        repo_filename = os.path.join(repo_dir, filename)
+        return filename in manifest and filename in inputs_hashes and os.path.isfile(repo_filename) and \
+               manifest[filename]['inputs'] == inputs_hashes[filename] and \
+               manifest[filename]['output'] == get_file_hash(repo_filename)
+
+    stale_targets = [filename for filename in registry_targets if not is_up_to_date(filename)]
+    stale_other = [filename for filename in other_cmds if not is_up_to_date(filename)]
+    if manifest_file is not None:
+        for filename in sorted(set(registry_targets) - set(stale_targets)) + sorted(set(other_cmds) - set(stale_other)):
+            print('up to date', os.path.join(repo_dir, filename))
+
+    if not args.no_cache:
+        lvl_genvk_cmd += ['-cache', os.path.abspath(args.cache_dir)]
+
+    if args.single_process:
+        # parse vk.xml once (per job) and run every generator from the same registry
+        gen_cmds = [lvl_genvk_cmd + stale_targets[i::args.jobs] for i in range(min(args.jobs, len(stale_targets)))]
+    else:
+        gen_cmds = [lvl_genvk_cmd + [filename] for filename in stale_targets]
+
+    gen_cmds += [other_cmds[filename] for filename in stale_other]
+
     # Update the api_version in the respective json files
     if args.generated_version:
         json_files = []
@@ -132,13 +302,28 @@ def main(argv):
         gen_dir = repo_dir
 
     # run each code generator
-    for cmd in gen_cmds:
-        print(' '.join(cmd))
-        try:
-            subprocess.check_call([sys.executable] + cmd, cwd=gen_dir)
-        except Exception as e:
-            print('ERROR:', str(e))
+    if args.jobs > 1:
+        # each generator writes its own files, so running them in parallel gives the same output as a serial run
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            results = executor.map(run_generator, gen_cmds, [gen_dir] * len(gen_cmds))
+            failed = False
+            # report in the same order as a serial run
+            for cmd, (returncode, output) in zip(gen_cmds, results):
+                print(' '.join(cmd))
+                print(output, end='')
+                if returncode != 0:
+                    print('ERROR:', str(subprocess.CalledProcessError(returncode, [sys.executable] + cmd)))
+                    failed = True
+        if failed:
             return 1
+    else:
+        for cmd in gen_cmds:
+            print(' '.join(cmd))
+            try:
+                subprocess.check_call([sys.executable] + cmd, cwd=gen_dir)
+            except Exception as e:
+                print('ERROR:', str(e))
+                return 1
 
     # optional post-generation steps
     if args.verify:
@@ -185,6 +370,15 @@ def main(argv):
                 print('update', repo_filename)
                 shutil.copyfile(temp_filename, repo_filename)
 
+        if manifest_file is not None:
+            for filename in stale_targets + stale_other:
+                repo_filename = os.path.join(repo_dir, filename)
+                if filename in inputs_hashes and os.path.isfile(repo_filename):
+                    file_hashes.pop(repo_filename, None)
+                    manifest[filename] = {'inputs' : inputs_hashes[filename],
+                                          'output' : get_file_hash(repo_filename)}
+            save_manifest(manifest_file, manifest)
+
     return 0
 
 if __name__ == '__main__':
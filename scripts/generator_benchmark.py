@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2023 Valve Corporation
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Benchmark each lvl_genvk.py target against vk.xml and against synthetic registries
+# where the extensions (and the commands and structs they add) are duplicated to
+# make the registry 2x, 5x, 10x, etc. larger. Used to catch generators that scale badly
+# before the real registry grows into it.
+
+import argparse
+import copy
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as etree
+
+import common_codegen
+from generate_source import get_lvl_genvk_targets
+
+# A growth exponent above this between two scales is reported as a possible quadratic (or worse) generator
+SUPERLINEAR_THRESHOLD = 1.5
+
+# Adds (scale - 1) renamed copies of every extension to the registry tree.
+# Each copy gets its own extension number and its own copy of the commands and structs
+# it requires, and renamed enum values extending the core enums (ex. VkStructureType).
+# Only enum values given as an offset are copied, as moving them to the new extension number
+# keeps them unique; bitpos and value enums would duplicate the original values and are dropped.
+def inflate_registry(tree, scale):
+    root = tree.getroot()
+    commands = root.find('commands')
+    types = root.find('types')
+    extensions = root.find('extensions')
+
+    command_elems = {}
+    for command in commands.findall('command'):
+        if command.get('alias') is None:
+            command_elems[command.find('proto/name').text] = command
+    struct_elems = {}
+    for type in types.findall('type'):
+        if type.get('category') in ('struct', 'union') and type.get('alias') is None:
+            struct_elems[type.get('name')] = type
+
+    original_extensions = [ext for ext in extensions.findall('extension') if ext.get('supported') != 'disabled']
+    next_number = max(int(ext.get('number')) for ext in extensions.findall('extension')) + 1
+
+    # enums that are renamed in every copy, so structs only point at sType values that exist
+    copied_enums = set()
+    for extension in original_extensions:
+        for elem in extension.findall('require/enum'):
+            if elem.get('alias') is None and (elem.get('offset') is not None or
+                                              (elem.get('extends') is None and elem.get('value') is not None)):
+                copied_enums.add(elem.get('name'))
+
+    for copy_index in range(1, scale):
+        suffix = f'Bench{copy_index}'
+        enum_suffix = f'_BENCH{copy_index}'
+        # extension number of each original extension in this copy
+        new_numbers = {}
+        for extension in original_extensions:
+            new_numbers[extension.get('number')] = str(next_number)
+            next_number += 1
+
+        for extension in original_extensions:
+            new_extension = copy.deepcopy(extension)
+            new_extension.set('name', f'{extension.get("name")}_bench{copy_index}')
+            new_extension.set('number', new_numbers[extension.get('number')])
+
+            for require in new_extension.findall('require'):
+                for elem in list(require):
+                    name = elem.get('name')
+                    if elem.tag == 'command':
+                        if name not in command_elems:
+                            # aliases are not duplicated
+                            require.remove(elem)
+                            continue
+                        new_command = copy.deepcopy(command_elems[name])
+                        new_command.find('proto/name').text = name + suffix
+                        commands.append(new_command)
+                        elem.set('name', name + suffix)
+                    elif elem.tag == 'type' and name in struct_elems:
+                        new_struct = copy.deepcopy(struct_elems[name])
+                        new_struct.set('name', name + suffix)
+                        # point at the renamed VkStructureType value of this copy
+                        for member in new_struct.findall('member[@values]'):
+                            if member.get('values') in copied_enums:
+                                member.set('values', member.get('values') + enum_suffix)
+                        types.append(new_struct)
+                        elem.set('name', name + suffix)
+                    elif elem.tag == 'enum':
+                        if name not in copied_enums:
+                            # aliases and bitpos/value enums are not duplicated, references to existing enums are kept
+                            if elem.get('alias') is not None or elem.get('extends') is not None:
+                                require.remove(elem)
+                            continue
+                        # values given with an offset are unique as they are based on the new extension number
+                        if elem.get('extnumber') is not None:
+                            elem.set('extnumber', new_numbers[elem.get('extnumber')])
+                        elem.set('name', name + enum_suffix)
+            extensions.append(new_extension)
+    return tree
+
+def write_registry(registry_file, scale, output_file):
+    tree = etree.parse(registry_file)
+    if scale > 1:
+        inflate_registry(tree, scale)
+    tree.write(output_file, encoding='utf-8', xml_declaration=True)
+
+# Runs a single target in its own process so the time and peak memory belong to that target alone
+def run_target(registry_file, scripts_dir, grammar_file, target, work_dir):
+    profile_file = os.path.join(work_dir, f'{target}.profile.json')
+    cmd = [sys.executable, common_codegen.repo_relative('scripts/lvl_genvk.py'),
+           '-registry', registry_file,
+           '-scripts', scripts_dir,
+           '-grammar', grammar_file,
+           '-quiet',
+           '-profile', profile_file,
+           '-o', work_dir,
+           target]
+    result = subprocess.run(cmd, cwd=work_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if result.returncode != 0:
+        return {'error': result.stdout}
+    with open(profile_file, encoding='utf-8') as f:
+        profile = json.load(f)
+    phases = profile['phases']
+    return {
+        'wall': profile['targets'][target]['wall'],
+        'cpu': profile['targets'][target]['cpu'],
+        'totalWall': sum(phase['wall'] for phase in phases.values()) + profile['targets'][target]['wall'],
+        'peakRss': profile['peakRss'],
+        'callbacks': profile['targets'][target]['callbacks'],
+    }
+
+def growth_exponent(base_time, base_scale, time, scale):
+    if base_time <= 0 or time <= 0 or scale == base_scale:
+        return None
+    return math.log(time / base_time) / math.log(scale / base_scale)
+
+def format_bytes(value):
+    return 'n/a' if value is None else f'{value / (1024 * 1024):.1f}MiB'
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Benchmark the code generators against real and synthetically scaled registries')
+    parser.add_argument('registry', metavar='REGISTRY_PATH', help='path to the Vulkan-Headers registry directory')
+    parser.add_argument('grammar', metavar='GRAMMAR_PATH', help='path to the SPIRV-Headers grammar directory')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 2, 5, 10],
+                        help='registry sizes to benchmark, as a multiple of the extensions in vk.xml')
+    parser.add_argument('--target', nargs='+', default=None,
+                        help='only benchmark these targets (default is every lvl_genvk.py target)')
+    parser.add_argument('-o', '--output', default=None, help='write the results as JSON to this file')
+    args = parser.parse_args(argv)
+
+    registry_dir = os.path.abspath(args.registry)
+    registry_file = os.path.join(registry_dir, 'vk.xml')
+    grammar_file = os.path.abspath(os.path.join(args.grammar, 'spirv.core.grammar.json'))
+    scales = sorted(set(args.scale))
+    if scales[0] < 1:
+        parser.error('--scale values must be at least 1')
+
+    targets = args.target if args.target else list(get_lvl_genvk_targets(common_codegen.repo_relative('scripts/lvl_genvk.py')).keys())
+
+    results = {}
+    failed = False
+    with tempfile.TemporaryDirectory(prefix='vvl_benchmark_') as temp_dir:
+        for scale in scales:
+            scale_dir = os.path.join(temp_dir, f'x{scale}')
+            os.makedirs(scale_dir)
+            scaled_registry = os.path.join(scale_dir, 'vk.xml')
+            if scale == 1:
+                scaled_registry = registry_file
+            else:
+                write_registry(registry_file, scale, scaled_registry)
+
+            results[scale] = {}
+            for target in targets:
+                print(f'x{scale} {target}', flush=True)
+                # registry scripts and validusage.json are still taken from the real registry directory
+                results[scale][target] = run_target(scaled_registry, registry_dir, grammar_file, target, scale_dir)
+                if 'error' in results[scale][target]:
+                    print(results[scale][target]['error'])
+                    failed = True
+
+    # Report
+    base_scale = scales[0]
+    print()
+    # each cell is the target wall time, the wall time including the registry parse, and the peak memory
+    print(f'{"target":<40}' + ''.join(f'{"x" + str(scale):>32}' for scale in scales) + f'{"growth":>10}')
+    for target in targets:
+        line = f'{target:<40}'
+        for scale in scales:
+            result = results[scale][target]
+            line += f'{"failed":>32}' if 'error' in result else \
+                f'{result["wall"]:>10.2f}s {result["totalWall"]:>8.2f}s {format_bytes(result["peakRss"]):>10}'
+        # growth exponent between the smallest and largest scale: ~1 is linear, ~2 is quadratic
+        exponent = None
+        base = results[base_scale][target]
+        last = results[scales[-1]][target]
+        if 'error' not in base and 'error' not in last:
+            exponent = growth_exponent(base['wall'], base_scale, last['wall'], scales[-1])
+        if exponent is None:
+            line += f'{"":>10}'
+        else:
+            line += f'{exponent:>10.2f}'
+            if exponent > SUPERLINEAR_THRESHOLD:
+                line += '  <-- scales worse than linear'
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump({str(scale): result for scale, result in results.items()}, f, indent=4)
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
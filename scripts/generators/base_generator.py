@@ -16,14 +16,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import sys
-import json
+import copy
 from generator import *
 from common_codegen import *
 
 from vkconventions import VulkanConventions
 from generators.vulkan_object import *
+from generators.vuid_index import GetValidVuids
 
 # An API style convention object
 vulkanConventions = VulkanConventions()
@@ -51,20 +51,10 @@ def intIfGet(elem, name):
 def boolGet(elem, name):
     return elem.get(name) is not None and elem.get(name) == "true"
 
-#
-# Walk the JSON-derived dict and find all "vuid" key values
-def ExtractVUIDs(vuid_dict):
-    if hasattr(vuid_dict, 'items'):
-        for key, value in vuid_dict.items():
-            if key == "vuid":
-                yield value
-            elif isinstance(value, dict):
-                for vuid in ExtractVUIDs(value):
-                    yield vuid
-            elif isinstance (value, list):
-                for listValue in value:
-                    for vuid in ExtractVUIDs(listValue):
-                        yield vuid
+# Flat list of the extensions of an enum value listed more than once, the latest listing first
+def mergeExtensions(extensions, previousExtensions):
+    merged = (extensions or []) + (previousExtensions or [])
+    return merged if len(merged) > 0 else None
 
 # This Generator Option is used across all Validation Layer generators
 # After years of use, it has shown that all the options are unified across each generator (file)
@@ -120,7 +110,7 @@ class BaseGenerator(OutputGenerator):
         self.currentFeature = None
 
         # These are custom fields for the Validation Layers
-        self.valid_vuids = set() # Set of all valid VUIDs
+        self.valid_vuids = frozenset() # Set of all valid VUIDs
 
     def write(self, data):
         # Prevents having to check before writting
@@ -138,20 +128,13 @@ class BaseGenerator(OutputGenerator):
         self.warnExtensions = genOpts.warnExtensions
         self.grammar = genOpts.grammar
 
-        # Build a set of all vuid text strings found in validusage.json
+        # Set of all vuid text strings found in validusage.json
         if self.valid_usage_path is not None:
-            vu_json_filename = os.path.join(self.valid_usage_path, 'validusage.json')
-            if not os.path.isfile(vu_json_filename):
-                print(f'Error: Could not find, or error loading {vu_json_filename}')
-                sys.exit(1)
-            json_file = open(vu_json_filename, 'r', encoding='utf-8')
-            vuid_dict = json.load(json_file)
-            json_file.close()
-            if len(vuid_dict) == 0:
-                print(f'Error: Failed to load {vu_json_filename}')
-                sys.exit(1)
-            for json_vuid_string in ExtractVUIDs(vuid_dict):
-                self.valid_vuids.add(json_vuid_string)
+            self.valid_vuids = GetValidVuids(self.valid_usage_path)
+
+        # Nothing to collect from the registry if the VulkanObject was already built
+        if self.registry is None:
+            return
 
         # Initialize members that require the tree
         self.handle_types = GetHandleTypes(self.registry.tree)
@@ -165,6 +148,13 @@ class BaseGenerator(OutputGenerator):
         for tag in tags:
             self.vk.vendorTags.append(tag.get('name'))
 
+    # Generates the file from an already built VulkanObject (ex. loaded from the cache)
+    # without running through reg.apiGen()
+    def generateFromVulkanObject(self, genOpts, vk: VulkanObject):
+        self.vk = vk
+        self.beginFile(genOpts)
+        self.endFile()
+
     # This function should be overloaded
     def generate(self):
         print("WARNING: This should not be called from the child class")
@@ -173,6 +163,7 @@ class BaseGenerator(OutputGenerator):
     def endFile(self):
         # This is the point were reg.py has ran, everything is collected
         # All inherited generators should run from here
+        self.vk.buildIndexes()
         self.generate()
         # This should not have to do anything but call into OutputGenerator
         OutputGenerator.endFile(self)
@@ -278,26 +269,27 @@ class BaseGenerator(OutputGenerator):
         groupProtect = self.currentFeature.protect if hasattr(self.currentFeature, 'protect') and self.currentFeature.protect is not None else None
         enumElem = groupinfo.elem
         bitwidth = 32 if enumElem.get('bitwidth') is None else enumElem.get('bitwidth')
-        fields = []
+        # Fields indexed by name, in the order they will be listed in
+        fields = {}
         if enumElem.get('type') == "enum":
             for elem in enumElem.findall('enum'):
                 if elem.get('alias') is not None:
                     continue
                 fieldName = elem.get('name')
+                # Extension values are given as an offset from the extension number
+                fieldValue = self.enumToValue(elem, True)[0]
                 negative = elem.get('dir') != None
                 extensions = None if elem.get('extname') is None else [elem.get('extname')]
                 protect = elem.get('protect')
 
                 # Some values have multiple extensions (ex VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_PUSH_DESCRIPTORS_KHR)
                 # genGroup() lists them twice, so need to just remove, update, re-add if we find a duplicate
-                for field in fields:
-                    if field.name == fieldName:
-                        extensions.append(field.extensions)
-                        fields.remove(field)
+                if fieldName in fields:
+                    extensions = mergeExtensions(extensions, fields.pop(fieldName).extensions)
 
-                fields.append(EnumField(fieldName, negative, extensions, protect))
+                fields[fieldName] = EnumField(fieldName, fieldValue, negative, extensions, protect)
 
-            self.vk.enums[name] = Enum(name, bitwidth, groupProtect, fields)
+            self.vk.enums[name] = Enum(name, bitwidth, groupProtect, list(fields.values()))
 
         else: # "bitmask"
             for elem in enumElem.findall('enum'):
@@ -316,16 +308,14 @@ class BaseGenerator(OutputGenerator):
 
                 # Some values have multiple extensions (ex VK_TOOL_PURPOSE_DEBUG_REPORTING_BIT_EXT)
                 # genGroup() lists them twice, so need to just remove, update, re-add if we find a duplicate
-                for field in fields:
-                    if field.name == fieldName:
-                        extensions.append(field.extensions)
-                        fields.remove(field)
+                if fieldName in fields:
+                    extensions = mergeExtensions(extensions, fields.pop(fieldName).extensions)
 
-                fields.append(Flag(fieldName, fieldValue, fieldMultiBit, fieldZero,
-                                      extensions, protect))
+                fields[fieldName] = Flag(fieldName, fieldValue, fieldMultiBit, fieldZero,
+                                         extensions, protect)
 
             flagName = name.replace('FlagBits', 'Flags')
-            self.vk.bitmasks[name] = Bitmask(name, flagName, bitwidth, groupProtect, fields)
+            self.vk.bitmasks[name] = Bitmask(name, flagName, bitwidth, groupProtect, list(fields.values()))
 
     def genType(self, typeInfo, typeName, alias):
         OutputGenerator.genType(self, typeInfo, typeName, alias)
@@ -344,6 +334,9 @@ class BaseGenerator(OutputGenerator):
             members = []
             sType = None
             for member in membersElem:
+                # Strip the <comment> from a shallow copy so the registry tree stays
+                # untouched for any other generator sharing it in the same process
+                member = copy.copy(member)
                 for comment in member.findall('comment'):
                     member.remove(comment)
 
@@ -24,6 +24,9 @@ from common_codegen import *
 from generators.generator_utils import *
 from generators.base_generator import BaseGenerator
 
+# Runs of at least this many consecutive enum values are looked up in an array instead of a switch
+denseEnumMinimumRun = 16
+
 class EnumStringHelperOutputGenerator(BaseGenerator):
     def __init__(self,
                  errFile = sys.stderr,
@@ -58,7 +61,10 @@ class EnumStringHelperOutputGenerator(BaseGenerator):
         self.write('''
 #pragma once
 #include <string>
-#include <vulkan/vulkan.h>''')
+#include <vulkan/vulkan.h>
+#if defined(_MSC_VER)
+#include <intrin.h>
+#endif''')
 
         # TODO - this should be moved into different generated util file
         out = []
@@ -78,23 +84,74 @@ class EnumStringHelperOutputGenerator(BaseGenerator):
         out = []
         # If there are no fields (empty enum) ignore
         for enum in [x for x in self.vk.enums.values() if len(x.fields) > 0]:
-            groupType = enum.name if enum.bitWidth == 32 else 'uint64_t'
-            out.extend([f'#ifdef {enum.protect}\n'] if enum.protect else [])
-            out.append(f'static inline const char* string_{enum.name}({groupType} input_value) {{\n')
-            out.append('    switch (input_value) {\n')
-            for field in enum.fields:
-                out.extend([f'#ifdef {field.protect}\n'] if field.protect else [])
-                out.append(f'        case {field.name}:\n')
-                out.append(f'            return "{field.name}";\n')
-                out.extend([f'#endif //{field.protect}\n'] if field.protect else [])
-            out.append('        default:\n')
-            out.append(f'            return "Unhandled {enum.name}";\n')
-            out.append('    }\n')
-            out.append('}\n')
-            out.extend([f'#endif //{enum.protect}\n'] if enum.protect else [])
+            out.extend(self.enumToString(enum))
         self.write("".join(out))
 
-        # For bitmask, first create a string for FlagBits, then a Flags version that calls into it
+        self.write('''// Name of a single bit flag, used to build the table of flag names indexed by bit position
+struct StringHelperFlagName {
+    uint64_t value;
+    const char* name;
+};
+
+struct StringHelperFlagNames {
+    const char* names[64];
+};
+
+// Done at compile time, flags with a value of zero have no bit and are skipped
+template <size_t N>
+static constexpr StringHelperFlagNames StringHelperBuildFlagNames(const StringHelperFlagName (&flags)[N]) {
+    StringHelperFlagNames table{};
+    for (size_t i = 0; i < N; ++i) {
+        if (flags[i].value == 0) continue;
+        uint32_t index = 0;
+        while (((flags[i].value >> index) & 1) == 0) ++index;
+        table.names[index] = flags[i].name;
+    }
+    return table;
+}
+
+// Index of the lowest set bit, value must not be zero
+static inline uint32_t StringHelperLeastSignificantBit(uint64_t value) {
+#if defined(__GNUC__)
+    return static_cast<uint32_t>(__builtin_ctzll(value));
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_ARM64))
+    unsigned long index;
+    _BitScanForward64(&index, value);
+    return static_cast<uint32_t>(index);
+#else
+    uint32_t index = 0;
+    while ((value & 1) == 0) {
+        value >>= 1;
+        ++index;
+    }
+    return index;
+#endif
+}
+
+// Only visits the set bits, and sizes the string up front so it is allocated once
+static inline std::string StringHelperFlagsToString(uint64_t input_value, const StringHelperFlagNames& table, const char* unhandled,
+                                                    const char* empty) {
+    size_t length = 0;
+    for (uint64_t bits = input_value; bits != 0; bits &= bits - 1) {
+        const char* name = table.names[StringHelperLeastSignificantBit(bits)];
+        length += std::char_traits<char>::length(name ? name : unhandled) + 1;
+    }
+    std::string ret;
+    if (length == 0) {
+        ret.append(empty);
+        return ret;
+    }
+    ret.reserve(length - 1);
+    for (uint64_t bits = input_value; bits != 0; bits &= bits - 1) {
+        const char* name = table.names[StringHelperLeastSignificantBit(bits)];
+        if (!ret.empty()) ret.push_back('|');
+        ret.append(name ? name : unhandled);
+    }
+    return ret;
+}
+''')
+
+        # For bitmask, first create a string for FlagBits, then a Flags version that looks up the name of each set bit
         out = []
         # If there are no flags (empty bitmask) ignore
         for bitmask in [x for x in self.vk.bitmasks.values() if len(x.flags) > 0]:
@@ -112,27 +169,82 @@ class EnumStringHelperOutputGenerator(BaseGenerator):
             out.append('    }\n')
             out.append('}\n')
 
-            mulitBitChecks = ''
-            for flag in [x for x in bitmask.flags if x.multiBit]:
-                mulitBitChecks += f'    if (input_value == {flag.name}) {{ return "{flag.name}"; }}\n'
-            intSuffix = 'U' if bitmask.bitWidth == 32 else 'ULL'
-
-            out.append(f'''
-static inline std::string string_{bitmask.flagName}({bitmask.flagName} input_value) {{
-{mulitBitChecks}    std::string ret;
-    int index = 0;
-    while(input_value) {{
-        if (input_value & 1) {{
-            if( !ret.empty()) ret.append("|");
-            ret.append(string_{bitmask.name}(static_cast<{groupType}>(1{intSuffix} << index)));
-        }}
-        ++index;
-        input_value >>= 1;
-    }}
-    if (ret.empty()) ret.append("{bitmask.flagName}(0)");
-    return ret;
-}}\n''')
+            out.extend(self.flagsToString(bitmask))
             out.extend([f'#endif //{bitmask.protect}\n'] if bitmask.protect else [])
         self.write("".join(out))
 
         self.write('// NOLINTEND') # Wrap for clang-tidy to ignore
+
+    #
+    # Splits the enum fields into runs of consecutive values, sorted by value
+    # Only the runs long enough to be worth an array are returned
+    def getDenseRuns(self, enum) -> list:
+        fields = sorted(enum.fields, key=lambda x: x.value)
+        runs = []
+        for field in fields:
+            if len(runs) != 0:
+                last = runs[-1][-1]
+                if field.value == last.value + 1 and field.protect == last.protect:
+                    runs[-1].append(field)
+                    continue
+            runs.append([field])
+        return [x for x in runs if len(x) >= denseEnumMinimumRun]
+
+    #
+    # Dense runs of values index an array of names, the rest of the values (sparse enums and extension values) use a switch
+    def enumToString(self, enum) -> list:
+        out = []
+        groupType = enum.name if enum.bitWidth == 32 else 'uint64_t'
+        out.extend([f'#ifdef {enum.protect}\n'] if enum.protect else [])
+        out.append(f'static inline const char* string_{enum.name}({groupType} input_value) {{\n')
+        denseRuns = self.getDenseRuns(enum)
+        for index, run in enumerate(denseRuns):
+            (first, last) = (run[0], run[-1])
+            out.extend([f'#ifdef {first.protect}\n'] if first.protect else [])
+            out.append(f'    static constexpr const char* kNames{index}[] = {{\n')
+            out.extend([f'        "{field.name}",\n' for field in run])
+            out.append('    };\n')
+            out.append(f'    static_assert(std::size(kNames{index}) == {last.name} - {first.name} + 1);\n')
+            out.append(f'    if (input_value >= {first.name} && input_value <= {last.name}) {{\n')
+            out.append(f'        return kNames{index}[input_value - {first.name}];\n')
+            out.append('    }\n')
+            out.extend([f'#endif //{first.protect}\n'] if first.protect else [])
+        denseNames = set(field.name for run in denseRuns for field in run)
+        sparseFields = [x for x in enum.fields if x.name not in denseNames]
+        if len(sparseFields) == 0:
+            out.append(f'    return "Unhandled {enum.name}";\n')
+        else:
+            out.append('    switch (input_value) {\n')
+            for field in sparseFields:
+                out.extend([f'#ifdef {field.protect}\n'] if field.protect else [])
+                out.append(f'        case {field.name}:\n')
+                out.append(f'            return "{field.name}";\n')
+                out.extend([f'#endif //{field.protect}\n'] if field.protect else [])
+            out.append('        default:\n')
+            out.append(f'            return "Unhandled {enum.name}";\n')
+            out.append('    }\n')
+        out.append('}\n')
+        out.extend([f'#endif //{enum.protect}\n'] if enum.protect else [])
+        return out
+
+    #
+    # The Flags version of the bitmask string, the names of the single bit flags are put in a table by bit position
+    def flagsToString(self, bitmask) -> list:
+        out = []
+        out.append(f'\nstatic inline std::string string_{bitmask.flagName}({bitmask.flagName} input_value) {{\n')
+        for flag in [x for x in bitmask.flags if x.multiBit]:
+            out.append(f'    if (input_value == {flag.name}) {{ return "{flag.name}"; }}\n')
+        flags = [x for x in bitmask.flags if not x.multiBit]
+        if len(flags) == 0:
+            out.append('    static constexpr StringHelperFlagNames kNames{};\n')
+        else:
+            out.append('    static constexpr StringHelperFlagName kFlags[] = {\n')
+            for flag in flags:
+                out.extend([f'#ifdef {flag.protect}\n'] if flag.protect else [])
+                out.append(f'        {{{flag.name}, "{flag.name}"}},\n')
+                out.extend([f'#endif //{flag.protect}\n'] if flag.protect else [])
+            out.append('    };\n')
+            out.append('    static constexpr StringHelperFlagNames kNames = StringHelperBuildFlagNames(kFlags);\n')
+        out.append(f'    return StringHelperFlagsToString(input_value, kNames, "Unhandled {bitmask.name}", "{bitmask.flagName}(0)");\n')
+        out.append('}\n')
+        return out
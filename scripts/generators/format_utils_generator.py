@@ -178,8 +178,8 @@ struct COMPONENT_INFO {
     COMPONENT_TYPE type;
     uint32_t size; // bits
 
-    COMPONENT_INFO() : type(COMPONENT_TYPE::NONE), size(0) {};
-    COMPONENT_INFO(COMPONENT_TYPE type, uint32_t size) : type(type), size(size) {};
+    constexpr COMPONENT_INFO() : type(COMPONENT_TYPE::NONE), size(0) {};
+    constexpr COMPONENT_INFO(COMPONENT_TYPE type, uint32_t size) : type(type), size(size) {};
 };
 
 // Generic information for all formats
@@ -190,35 +190,62 @@ struct FORMAT_INFO {
     VkExtent3D block_extent;
     uint32_t component_count;
     COMPONENT_INFO components[FORMAT_MAX_COMPONENTS];
+    uint32_t properties; // FORMAT_PROPERTY_* bits
 };
 
-namespace std {
-template <>
-struct hash<VkFormat> {
-    size_t operator()(VkFormat fmt) const noexcept {
-        return hash<uint32_t>()(static_cast<uint32_t>(fmt));
-    }
-};
-}
-
-// clang-format off
-static const vvl::unordered_map<VkFormat, FORMAT_INFO> kVkFormatTable = {
 ''')
-            for f in self.vk.formats.values():
-                className = getClassName(f.className)
-                blockExtent = ', '.join(f.blockExtent) if f.blockExtent is not None else '1, 1, 1'
-                out.append(f'    {{{f.name},\n')
-                out.append(f'        {{FORMAT_COMPATIBILITY_CLASS::{className}, {f.blockSize}, {f.texelsPerBlock}, {{{blockExtent}}}, {len(f.components)},\n        {{')
-                for index, component in enumerate(f.components):
-                    bits = 'COMPRESSED_COMPONENT' if component.bits == 'compressed' else component.bits
-                    out.append(f'{{COMPONENT_TYPE::{component.type}, {bits}}}')
-                    out.append(', ' if (index + 1 != len(f.components)) else '')
-                out.append('} }},\n')
-
-            out.append('    {VK_FORMAT_UNDEFINED, {FORMAT_COMPATIBILITY_CLASS::NONE, 0, 0, {0, 0, 0}, 0, {}}}')
-            out.append('};\n')
+            out.append('// Properties of a format packed in FORMAT_INFO::properties, used to look up the simple format predicates\n')
+            propertyNames = self.getPropertyNames()
+            if len(propertyNames) > 32:
+                self.logMsg('error', 'FORMAT_INFO::properties needs to be larger than 32 bits')
+            for index, name in enumerate(propertyNames):
+                out.append(f'static constexpr uint32_t {name} = 1u << {index};\n')
+            out.append('\n')
+            out.append('// clang-format off\n')
+            formatRanges = self.getFormatRanges()
+            for formatRange in formatRanges:
+                (first, last) = (formatRange[0][0], formatRange[-1][0])
+                if first.protect is not None:
+                    out.append(f'#ifdef {first.protect}\n')
+                out.append(f'static constexpr FORMAT_INFO kVkFormatTable{first.value}[] = {{\n')
+                for (field, f) in formatRange:
+                    out.append(f'    // {field.name}\n')
+                    if f is None:
+                        out.append('    {FORMAT_COMPATIBILITY_CLASS::NONE, 0, 0, {0, 0, 0}, 0, {}, 0},\n')
+                        continue
+                    className = getClassName(f.className)
+                    blockExtent = ', '.join(f.blockExtent) if f.blockExtent is not None else '1, 1, 1'
+                    out.append(f'    {{FORMAT_COMPATIBILITY_CLASS::{className}, {f.blockSize}, {f.texelsPerBlock}, {{{blockExtent}}}, {len(f.components)},\n        {{')
+                    for index, component in enumerate(f.components):
+                        bits = 'COMPRESSED_COMPONENT' if component.bits == 'compressed' else component.bits
+                        out.append(f'{{COMPONENT_TYPE::{component.type}, {bits}}}')
+                        out.append(', ' if (index + 1 != len(f.components)) else '')
+                    properties = ' | '.join(self.getFormatProperties(f)) or '0'
+                    out.append(f'}},\n        {properties}}},\n')
+                out.append('};\n')
+                out.append(f'static_assert(std::size(kVkFormatTable{first.value}) == static_cast<size_t>({last.name} - {first.name} + 1));\n')
+                if first.protect is not None:
+                    out.append('#endif\n')
             out.append('// clang-format on\n')
 
+            out.append('''
+// VkFormat values come in blocks of consecutive values (core and one block per extension),
+// each block has a dense table so a lookup is only a range check and an index
+static const FORMAT_INFO* GetFormatInfo(VkFormat format) {
+''')
+            for formatRange in formatRanges:
+                out.extend(self.formatRangeCheck(formatRange, 'kVkFormatTable'))
+            out.append('    return nullptr;\n')
+            out.append('}\n')
+
+            out.append('''
+// Returns the FORMAT_PROPERTY_* bits of the format, zero if the format is not known
+static uint32_t FormatProperties(VkFormat format) {
+    const auto* format_info = GetFormatInfo(format);
+    return format_info ? format_info->properties : 0;
+}
+''')
+
             out.append('''
 struct PER_PLANE_COMPATIBILITY {
     uint32_t width_divisor;
@@ -228,8 +255,8 @@ struct PER_PLANE_COMPATIBILITY {
     // Need default otherwise if app tries to grab a plane that doesn't exist it will crash
     // if returned the value of 0 in IMAGE_STATE::GetEffectiveSubresourceExtent()
     // This is ok, because there are VUs later that will catch the bad app behaviour
-    PER_PLANE_COMPATIBILITY() : width_divisor(1), height_divisor(1), compatible_format(VK_FORMAT_UNDEFINED) {}
-    PER_PLANE_COMPATIBILITY(uint32_t width_divisor, uint32_t height_divisor, VkFormat compatible_format) :
+    constexpr PER_PLANE_COMPATIBILITY() : width_divisor(1), height_divisor(1), compatible_format(VK_FORMAT_UNDEFINED) {}
+    constexpr PER_PLANE_COMPATIBILITY(uint32_t width_divisor, uint32_t height_divisor, VkFormat compatible_format) :
         width_divisor(width_divisor), height_divisor(height_divisor), compatible_format(compatible_format) {}
 };
 
@@ -239,20 +266,46 @@ struct MULTIPLANE_COMPATIBILITY {
 };
 
 // Source: Vulkan spec Table 47. Plane Format Compatibility Table
+// Uses the same blocks as kVkFormatTable, trimmed to the multiplane formats in the block.
+// Other formats in between get the default, which acts the same as a format that isn't found
 // clang-format off
-static const vvl::unordered_map<VkFormat, MULTIPLANE_COMPATIBILITY> kVkMultiplaneCompatibilityMap {
 ''')
-
-            for f in filter(lambda x: len(x.planes) != 0, self.vk.formats.values()):
-                out.append(f'    {{ {f.name}, {{{{\n')
-                for index, plane in enumerate(f.planes):
-                    if (index != plane.index):
-                        self.logMsg('error', 'index of planes were not added in order')
-                    out.append(f'        {{ {plane.widthDivisor}, {plane.heightDivisor}, {plane.compatible} }}')
-                    out.append(',\n' if (index + 1 != len(f.planes)) else '\n    }}},\n')
-            out.append('};\n')
+            multiplaneRanges = []
+            for formatRange in formatRanges:
+                planeIndexes = [index for index, (field, f) in enumerate(formatRange) if f is not None and len(f.planes) != 0]
+                if len(planeIndexes) != 0:
+                    multiplaneRanges.append(formatRange[planeIndexes[0]:planeIndexes[-1] + 1])
+
+            for formatRange in multiplaneRanges:
+                (first, last) = (formatRange[0][0], formatRange[-1][0])
+                if first.protect is not None:
+                    out.append(f'#ifdef {first.protect}\n')
+                out.append(f'static constexpr MULTIPLANE_COMPATIBILITY kVkMultiplaneCompatibility{first.value}[] = {{\n')
+                for (field, f) in formatRange:
+                    out.append(f'    // {field.name}\n')
+                    if len(f.planes) == 0:
+                        out.append('    {},\n')
+                        continue
+                    out.append('    {{\n')
+                    for index, plane in enumerate(f.planes):
+                        if (index != plane.index):
+                            self.logMsg('error', 'index of planes were not added in order')
+                        out.append(f'        {{ {plane.widthDivisor}, {plane.heightDivisor}, {plane.compatible} }}')
+                        out.append(',\n' if (index + 1 != len(f.planes)) else '\n    }},\n')
+                out.append('};\n')
+                out.append(f'static_assert(std::size(kVkMultiplaneCompatibility{first.value}) == static_cast<size_t>({last.name} - {first.name} + 1));\n')
+                if first.protect is not None:
+                    out.append('#endif\n')
             out.append('// clang-format on\n')
 
+            out.append('''
+static const MULTIPLANE_COMPATIBILITY* GetMultiplaneCompatibility(VkFormat format) {
+''')
+            for formatRange in multiplaneRanges:
+                out.extend(self.formatRangeCheck(formatRange, 'kVkMultiplaneCompatibility'))
+            out.append('    return nullptr;\n')
+            out.append('}\n')
+
         elif self.headerFile:
             out.append(f'static constexpr uint32_t FORMAT_MAX_PLANES = {self.maxPlaneCount};\n')
             out.append(f'static constexpr uint32_t FORMAT_MAX_COMPONENTS = {self.maxComponentCount};\n')
@@ -267,9 +320,7 @@ static const vvl::unordered_map<VkFormat, MULTIPLANE_COMPATIBILITY> kVkMultiplan
             out.append('enum class FORMAT_COMPATIBILITY_CLASS {\n')
             out.append('    NONE = 0,\n')
 
-            classNames = set()
-            for f in self.vk.formats.values():
-                classNames.add(getClassName(f.className))
+            classNames = set([getClassName(x) for x in self.vk.formatsByClass.keys()])
 
             for count, className in enumerate(sorted(classNames), start=1):
                 out.append(f'    {className}')
@@ -277,6 +328,59 @@ static const vvl::unordered_map<VkFormat, MULTIPLANE_COMPATIBILITY> kVkMultiplan
             out.append('};\n')
         self.write("".join(out))
     #
+    # Splits the formats into lists of (EnumField, Format) with consecutive VkFormat values, sorted by value
+    # VK_FORMAT_UNDEFINED has no <format> and is listed with None as the Format
+    def getFormatRanges(self) -> list:
+        fields = {x.name: x for x in self.vk.enums['VkFormat'].fields}
+        entries = [(fields['VK_FORMAT_UNDEFINED'], None)]
+        entries.extend([(fields[f.name], f) for f in self.vk.formats.values() if f.name in fields])
+        entries.sort(key=lambda x: x[0].value)
+
+        formatRanges = []
+        for (field, f) in entries:
+            if len(formatRanges) != 0:
+                last = formatRanges[-1][-1][0]
+                if field.value == last.value + 1 and field.protect == last.protect:
+                    formatRanges[-1].append((field, f))
+                    continue
+            formatRanges.append([(field, f)])
+        return formatRanges
+
+    #
+    # Names of the FORMAT_PROPERTY_* bits
+    def getPropertyNames(self) -> list:
+        names = [f'FORMAT_PROPERTY_{x}' for x in sorted(self.numericFormats)]
+        names.extend([f'FORMAT_PROPERTY_COMPRESSED_{x}' for x in sorted(self.compressedFormats.keys())])
+        names.extend(['FORMAT_PROPERTY_DEPTH', 'FORMAT_PROPERTY_STENCIL'])
+        return names
+
+    #
+    # FORMAT_PROPERTY_* bits that are set for the format
+    def getFormatProperties(self, format: Format) -> list:
+        properties = [f'FORMAT_PROPERTY_{x}' for x in sorted(self.numericFormats) if formatHasNumericFormat(format, x)]
+        if format.compressed:
+            properties.append(f'FORMAT_PROPERTY_COMPRESSED_{format.compressed.replace(" ", "_")}')
+        if formatHasDepth(format):
+            properties.append('FORMAT_PROPERTY_DEPTH')
+        if formatHasStencil(format):
+            properties.append('FORMAT_PROPERTY_STENCIL')
+        return properties
+
+    #
+    # Returns the formats in the range from the dense table
+    def formatRangeCheck(self, formatRange: list, table: str) -> list:
+        (first, last) = (formatRange[0][0], formatRange[-1][0])
+        out = []
+        if first.protect is not None:
+            out.append(f'#ifdef {first.protect}\n')
+        out.append(f'    if (format >= {first.name} && format <= {last.name}) {{\n')
+        out.append(f'        return &{table}{first.value}[format - {first.name}];\n')
+        out.append('    }\n')
+        if first.protect is not None:
+            out.append('#endif\n')
+        return out
+
+    #
     # Generate functions for numeric based functions
     def numericFunctions(self):
         out = []
@@ -298,11 +402,7 @@ static inline bool FormatIsSampledFloat(VkFormat format) {
         elif self.sourceFile:
             for numericFormat in sorted(self.numericFormats):
                 out.append(f'\n// Return true if all components in the format are an {numericFormat}\n')
-                out.append(f'bool FormatIs{numericFormat}(VkFormat format) {{\n')
-                out.append('    bool found = false;\n')
-                out.append('    switch (format) {\n')
-                out.extend([f'        case {f.name}:\n' for f in self.vk.formats.values() if formatHasNumericFormat(f, numericFormat)])
-                out.append(self.commonBoolSwitch)
+                out.append(f'bool FormatIs{numericFormat}(VkFormat format) {{ return (FormatProperties(format) & FORMAT_PROPERTY_{numericFormat}) != 0; }}\n')
 
         self.write("".join(out))
     #
@@ -318,19 +418,15 @@ static inline bool FormatIsSampledFloat(VkFormat format) {
         elif self.sourceFile:
             for key in sorted(self.compressedFormats.keys()):
                 out.append(f'\n// Return true if the format is a {key} compressed image format\n')
-                out.append(f'bool FormatIsCompressed_{key}(VkFormat format) {{\n')
-                out.append('    bool found = false;\n')
-                out.append('    switch (format) {\n')
-                for f in sorted(self.compressedFormats[key]):
-                    out.append(f'        case {f}:\n')
-                out.append(self.commonBoolSwitch)
+                out.append(f'bool FormatIsCompressed_{key}(VkFormat format) {{ return (FormatProperties(format) & FORMAT_PROPERTY_COMPRESSED_{key}) != 0; }}\n')
 
             out.append('\n// Return true if the format is any compressed image format\n')
             out.append('bool FormatIsCompressed(VkFormat format) {\n')
-            out.append('    return (\n')
+            out.append('    constexpr uint32_t compressed =\n')
             for index, key in enumerate(sorted(self.compressedFormats.keys()), start=1):
-                out.append(f'      FormatIsCompressed_{key}(format)')
-                out.append(' ||\n' if (index != len(self.compressedFormats.keys())) else ');\n')
+                out.append(f'        FORMAT_PROPERTY_COMPRESSED_{key}')
+                out.append(' |\n' if (index != len(self.compressedFormats.keys())) else ';\n')
+            out.append('    return (FormatProperties(format) & compressed) != 0;\n')
             out.append('}\n')
 
         self.write("".join(out))
@@ -353,33 +449,27 @@ FORMAT_NUMERICAL_TYPE FormatDepthNumericalType(VkFormat format);
 FORMAT_NUMERICAL_TYPE FormatStencilNumericalType(VkFormat format);
 ''')
         elif self.sourceFile:
-            out.append('\n// Return true if format is a depth OR stencil format\n')
-            out.append('bool FormatIsDepthOrStencil(VkFormat format) {\n')
-            out.append('    bool found = false;\n')
-            out.append('    switch (format) {\n')
-            out.extend([f'        case {f.name}:\n' for f in self.vk.formats.values() if formatHasDepth(f) or formatHasStencil(f)])
-            out.append(self.commonBoolSwitch)
+            out.append('''
+// Return true if format is a depth OR stencil format
+bool FormatIsDepthOrStencil(VkFormat format) {
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) != 0;
+}
 
-            out.append('\n// Return true if format is a depth AND stencil format\n')
-            out.append('bool FormatIsDepthAndStencil(VkFormat format) {\n')
-            out.append('    bool found = false;\n')
-            out.append('    switch (format) {\n')
-            out.extend([f'        case {f.name}:\n' for f in self.vk.formats.values() if formatHasDepth(f) and formatHasStencil(f)])
-            out.append(self.commonBoolSwitch)
+// Return true if format is a depth AND stencil format
+bool FormatIsDepthAndStencil(VkFormat format) {
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) == (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL);
+}
 
-            out.append('\n// Return true if format is a depth ONLY format\n')
-            out.append('bool FormatIsDepthOnly(VkFormat format) {\n')
-            out.append('    bool found = false;\n')
-            out.append('    switch (format) {\n')
-            out.extend([f'        case {f.name}:\n' for f in self.vk.formats.values() if formatHasDepth(f) and not formatHasStencil(f)])
-            out.append(self.commonBoolSwitch)
+// Return true if format is a depth ONLY format
+bool FormatIsDepthOnly(VkFormat format) {
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) == FORMAT_PROPERTY_DEPTH;
+}
 
-            out.append('\n// Return true if format is a stencil ONLY format\n')
-            out.append('bool FormatIsStencilOnly(VkFormat format) {\n')
-            out.append('    bool found = false;\n')
-            out.append('    switch (format) {\n')
-            out.extend([f'        case {f.name}:\n' for f in self.vk.formats.values() if formatHasStencil(f) and not formatHasDepth(f)])
-            out.append(self.commonBoolSwitch)
+// Return true if format is a stencil ONLY format
+bool FormatIsStencilOnly(VkFormat format) {
+    return (FormatProperties(format) & (FORMAT_PROPERTY_DEPTH | FORMAT_PROPERTY_STENCIL)) == FORMAT_PROPERTY_STENCIL;
+}
+''')
 
             out.append('\n// Returns size of depth component in bits')
             out.append('\n// Returns zero if no depth component\n')
@@ -542,25 +632,25 @@ VkExtent2D FindMultiplaneExtentDivisors(VkFormat mp_fmt, VkImageAspectFlags plan
 // Will return VK_FORMAT_UNDEFINED if given a plane aspect that doesn't exist for the format
 VkFormat FindMultiplaneCompatibleFormat(VkFormat mp_fmt, VkImageAspectFlags plane_aspect) {
     const uint32_t plane_idx = GetPlaneIndex(plane_aspect);
-    auto it = kVkMultiplaneCompatibilityMap.find(mp_fmt);
-    if ((it == kVkMultiplaneCompatibilityMap.end()) || (plane_idx >= FORMAT_MAX_PLANES)) {
+    const auto* compatibility = GetMultiplaneCompatibility(mp_fmt);
+    if ((compatibility == nullptr) || (plane_idx >= FORMAT_MAX_PLANES)) {
         return VK_FORMAT_UNDEFINED;
     }
 
-    return it->second.per_plane[plane_idx].compatible_format;
+    return compatibility->per_plane[plane_idx].compatible_format;
 }
 
 // Will return {1, 1} if given a plane aspect that doesn't exist for the format
 VkExtent2D FindMultiplaneExtentDivisors(VkFormat mp_fmt, VkImageAspectFlags plane_aspect) {
     VkExtent2D divisors = {1, 1};
     const uint32_t plane_idx = GetPlaneIndex(plane_aspect);
-    auto it = kVkMultiplaneCompatibilityMap.find(mp_fmt);
-    if ((it == kVkMultiplaneCompatibilityMap.end()) || (plane_idx >= FORMAT_MAX_PLANES)) {
+    const auto* compatibility = GetMultiplaneCompatibility(mp_fmt);
+    if ((compatibility == nullptr) || (plane_idx >= FORMAT_MAX_PLANES)) {
         return divisors;
     }
 
-    divisors.width = it->second.per_plane[plane_idx].width_divisor;
-    divisors.height = it->second.per_plane[plane_idx].height_divisor;
+    divisors.width = compatibility->per_plane[plane_idx].width_divisor;
+    divisors.height = compatibility->per_plane[plane_idx].height_divisor;
     return divisors;
 }
 ''')
@@ -599,25 +689,25 @@ bool FormatsSameComponentBits(VkFormat format_a, VkFormat format_b);
         elif self.sourceFile:
             out.append('''
 uint32_t FormatComponentCount(VkFormat format) {
-    auto format_info = kVkFormatTable.find(format);
-    if (format_info != kVkFormatTable.end()) {
-        return format_info->second.component_count;
+    const auto* format_info = GetFormatInfo(format);
+    if (format_info) {
+        return format_info->component_count;
     }
     return 0;
 }
 
 VkExtent3D FormatTexelBlockExtent(VkFormat format) {
-    auto format_info = kVkFormatTable.find(format);
-    if (format_info != kVkFormatTable.end()) {
-        return format_info->second.block_extent;
+    const auto* format_info = GetFormatInfo(format);
+    if (format_info) {
+        return format_info->block_extent;
     }
     return {1, 1, 1};
 }
 
 FORMAT_COMPATIBILITY_CLASS FormatCompatibilityClass(VkFormat format) {
-    auto format_info = kVkFormatTable.find(format);
-    if (format_info != kVkFormatTable.end()) {
-        return format_info->second.compatibility;
+    const auto* format_info = GetFormatInfo(format);
+    if (format_info) {
+        return format_info->compatibility;
     }
     return FORMAT_COMPATIBILITY_CLASS::NONE;
 }
@@ -645,9 +735,9 @@ uint32_t FormatElementSize(VkFormat format, VkImageAspectFlags aspectMask) {
         format = FindMultiplaneCompatibleFormat(format, aspectMask);
     }
 
-    auto item = kVkFormatTable.find(format);
-    if (item != kVkFormatTable.end()) {
-        return item->second.block_size;
+    const auto* item = GetFormatInfo(format);
+    if (item) {
+        return item->block_size;
     }
     return 0;
 }
@@ -665,22 +755,22 @@ double FormatTexelSize(VkFormat format, VkImageAspectFlags aspectMask) {
 }
 
 bool FormatHasComponentSize(VkFormat format, uint32_t size) {
-    auto item = kVkFormatTable.find(format);
-    if (item == kVkFormatTable.end()) {
+    const auto* item = GetFormatInfo(format);
+    if (!item) {
         return false;
     }
-    const COMPONENT_INFO* begin = item->second.components;
-    const COMPONENT_INFO* end = item->second.components + FORMAT_MAX_COMPONENTS;
+    const COMPONENT_INFO* begin = item->components;
+    const COMPONENT_INFO* end = item->components + FORMAT_MAX_COMPONENTS;
     return std::find_if(begin, end, [size](const COMPONENT_INFO& info) { return info.size == size; }) != end;
 }
 
 static bool FormatHasComponentType(VkFormat format, COMPONENT_TYPE component) {
-    auto item = kVkFormatTable.find(format);
-    if (item == kVkFormatTable.end()) {
+    const auto* item = GetFormatInfo(format);
+    if (!item) {
         return false;
     }
-    const COMPONENT_INFO* begin = item->second.components;
-    const COMPONENT_INFO* end = item->second.components + FORMAT_MAX_COMPONENTS;
+    const COMPONENT_INFO* begin = item->components;
+    const COMPONENT_INFO* end = item->components + FORMAT_MAX_COMPONENTS;
     return std::find_if(begin, end, [component](const COMPONENT_INFO& info) { return info.type == component; }) != end;
 }
 
@@ -701,20 +791,20 @@ bool FormatHasAlpha(VkFormat format) {
 }
 
 bool FormatsSameComponentBits(VkFormat format_a, VkFormat format_b) {
-    const auto item_a = kVkFormatTable.find(format_a);
-    const auto item_b = kVkFormatTable.find(format_b);
-    if (item_a == kVkFormatTable.end() || item_b == kVkFormatTable.end()) {
+    const auto* item_a = GetFormatInfo(format_a);
+    const auto* item_b = GetFormatInfo(format_b);
+    if (!item_a || !item_b) {
         return false;
-    } else if (item_a->second.component_count != item_b->second.component_count) {
+    } else if (item_a->component_count != item_b->component_count) {
         return false;
     }
     // Need to loop match each component type is found in both formats
     // formats are maxed at 4 components, so the double loop is not going to scale
-    for (uint32_t i = 0; i < item_a->second.component_count; i++) {
-        const auto& component_a = item_a->second.components[i];
+    for (uint32_t i = 0; i < item_a->component_count; i++) {
+        const auto& component_a = item_a->components[i];
         bool component_match = false;
-        for (uint32_t j = 0; j < item_b->second.component_count; j++) {
-            const auto& component_b = item_b->second.components[j];
+        for (uint32_t j = 0; j < item_b->component_count; j++) {
+            const auto& component_b = item_b->components[j];
             if ((component_a.type == component_b.type) && (component_a.size == component_b.size)) {
                 component_match = true;
                 break;
@@ -0,0 +1,150 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2023 Valve Corporation
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import json
+import time
+import cProfile
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+# Callbacks reg.py makes into the OutputGenerator that are timed for each target
+generatorCallbacks = [
+    'beginFile',
+    'endFile',
+    'beginFeature',
+    'endFeature',
+    'genType',
+    'genStruct',
+    'genGroup',
+    'genEnum',
+    'genCmd',
+    'genSpirv',
+    'genFormat',
+    'genSyncStage',
+    'genSyncAccess',
+    'genSyncPipeline',
+]
+
+# Peak resident set size of the process in bytes, None if unknown
+def getPeakRss() -> int:
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+class Timing:
+    def __init__(self):
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def add(self, wall: float, cpu: float):
+        self.count += 1
+        self.wall += wall
+        self.cpu += cpu
+
+    def toDict(self) -> dict:
+        return {'count': self.count, 'wall': self.wall, 'cpu': self.cpu}
+
+#
+# Collects wall time, CPU time, peak RSS and call counts of each phase of lvl_genvk.py
+# and of every generator callback, and writes them out as JSON
+class GeneratorProfiler:
+    def __init__(self, enabled: bool = False, cprofileDirectory: str = None):
+        self.enabled = enabled or cprofileDirectory is not None
+        self.cprofileDirectory = cprofileDirectory
+        self.phases = {}
+        self.targets = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        timing = self.phases.setdefault(name, {'timing': Timing(), 'peakRss': None})
+        wallStart = time.perf_counter()
+        cpuStart = time.process_time()
+        try:
+            yield
+        finally:
+            timing['timing'].add(time.perf_counter() - wallStart, time.process_time() - cpuStart)
+            timing['peakRss'] = getPeakRss()
+
+    # Times the generation of a single target, including each callback into its generator
+    @contextmanager
+    def target(self, filename: str, gen):
+        if not self.enabled:
+            yield
+            return
+        callbacks = {}
+        for name in generatorCallbacks:
+            if hasattr(gen, name):
+                callbacks[name] = Timing()
+                setattr(gen, name, self.wrapCallback(getattr(gen, name), callbacks[name]))
+
+        profile = None
+        if self.cprofileDirectory is not None:
+            profile = cProfile.Profile()
+
+        timing = Timing()
+        wallStart = time.perf_counter()
+        cpuStart = time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+                os.makedirs(self.cprofileDirectory, exist_ok=True)
+                profile.dump_stats(os.path.join(self.cprofileDirectory, f'{filename}.pstats'))
+            timing.add(time.perf_counter() - wallStart, time.process_time() - cpuStart)
+            self.targets[filename] = {
+                'wall': timing.wall,
+                'cpu': timing.cpu,
+                'peakRss': getPeakRss(),
+                'callbacks': {name: callback.toDict() for name, callback in callbacks.items() if callback.count > 0}
+            }
+
+    @staticmethod
+    def wrapCallback(callback, timing: Timing):
+        def wrapped(*args, **kwargs):
+            wallStart = time.perf_counter()
+            cpuStart = time.process_time()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                timing.add(time.perf_counter() - wallStart, time.process_time() - cpuStart)
+        return wrapped
+
+    def write(self, filename: str):
+        report = {
+            'phases': {name: {**phase['timing'].toDict(), 'peakRss': phase['peakRss']} for name, phase in self.phases.items()},
+            'targets': self.targets,
+            'peakRss': getPeakRss(),
+        }
+        with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(report, f, indent=4)
+            f.write('\n')
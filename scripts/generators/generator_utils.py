@@ -15,7 +15,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import glob
+import pickle
+import tempfile
+import contextlib
 from generators.vulkan_object import *
+from typing import List, Tuple
 
 # TODO - Remove common_codegen.py
 # This file is trying to replace common_codegen.py using new VulkanObject class
@@ -41,4 +47,94 @@ def getFormatedLength(length: str):
         result = length if 'null-terminated' not in length else length.split(',')[0]
         # Spec has now notation for len attributes, using :: instead of platform specific pointer symbol
         result = result.replace('::', '->')
-    return result
\ No newline at end of file
+    return result
+
+# Must match hash_util::PerfectHashString() in layers/utils/hash_util.h
+def perfectHashString(seed: int, string: str) -> int:
+    hash = 2166136261 ^ seed
+    for byte in string.encode('utf-8'):
+        hash ^= byte
+        hash = (hash * 16777619) & 0xFFFFFFFF
+    hash ^= hash >> 16
+    hash = (hash * 0x85EBCA6B) & 0xFFFFFFFF
+    hash ^= hash >> 13
+    hash = (hash * 0xC2B2AE35) & 0xFFFFFFFF
+    hash ^= hash >> 16
+    return hash
+
+# Seeds tried for a single bucket before giving up, well above the few thousand the chassis functions need
+perfectHashMaxSeed = 1 << 20
+
+# Builds a minimal perfect hash (hash and displace) of the unique keys so the C++ lookup is
+#   slot = PerfectHashString(seeds[PerfectHashString(0, key) % len(seeds)], key) % len(keys)
+# Returns the seeds and, for each slot, the index of the key that goes in it
+def buildPerfectHash(keys: List[str]) -> Tuple[List[int], List[int]]:
+    # A duplicate key would never find a seed that puts it in two free slots
+    assert len(set(keys)) == len(keys), 'buildPerfectHash keys must be unique'
+    if len(keys) == 0:
+        return ([0], [])
+    bucketCount = max(1, len(keys) // 4)
+    buckets = [[] for _ in range(bucketCount)]
+    for index, key in enumerate(keys):
+        buckets[perfectHashString(0, key) % bucketCount].append(index)
+
+    seeds = [0] * bucketCount
+    slots = [None] * len(keys)
+    # Place the largest buckets first while there are still many free slots
+    for bucket in sorted(range(bucketCount), key=lambda x: len(buckets[x]), reverse=True):
+        if len(buckets[bucket]) == 0:
+            break
+        for seed in range(1, perfectHashMaxSeed + 1):
+            positions = [perfectHashString(seed, keys[index]) % len(keys) for index in buckets[bucket]]
+            if len(set(positions)) == len(positions) and all(slots[position] is None for position in positions):
+                break
+        else:
+            raise RuntimeError(f'buildPerfectHash found no seed for the keys {[keys[index] for index in buckets[bucket]]}')
+        seeds[bucket] = seed
+        for index, position in zip(buckets[bucket], positions):
+            slots[position] = index
+    return (seeds, slots)
+
+# Permissions of a file created by open(), mkstemp() only gives access to the owner
+fileUmask = os.umask(0)
+os.umask(fileUmask)
+fileCreationMode = 0o666 & ~fileUmask
+
+# Yields the path of a temp file next to filename, which replaces filename when the with block is done,
+# so a concurrent reader never sees a partially written file. The temp file is removed if the block fails
+@contextlib.contextmanager
+def atomicFileReplace(filename: str):
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    (fd, tempFile) = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(fd)
+    try:
+        os.chmod(tempFile, fileCreationMode)
+        yield tempFile
+        os.replace(tempFile, filename)
+    finally:
+        if os.path.isfile(tempFile):
+            os.remove(tempFile)
+
+def savePickle(filename: str, data):
+    with atomicFileReplace(filename) as tempFile, open(tempFile, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Returns None if there is no file, a corrupt or incompatible file is treated the same
+def loadPickle(filename: str):
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with open(filename, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+# Removes the files matching pattern other than keepFile, used to drop cache entries that are out of date
+def removeStaleFiles(pattern: str, keepFile: str):
+    for staleFile in glob.glob(pattern):
+        if staleFile != keepFile:
+            try:
+                os.remove(staleFile)
+            except OSError:
+                pass
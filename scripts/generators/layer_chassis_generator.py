@@ -24,6 +24,7 @@
 import sys
 from generator import *
 from common_codegen import *
+from generators.generator_utils import buildPerfectHash
 
 # NOTE: should be removed if generation scripts ever get refactored
 from generators.parameter_validation_generator import ParameterValidationOutputGenerator
@@ -528,6 +529,7 @@ class ValidationObject {
 #include "chassis.h"
 #include "layer_options.h"
 #include "layer_chassis_dispatch.h"
+#include "utils/hash_util.h"
 
 small_unordered_map<void*, ValidationObject*, 2> layer_data_map;
 
@@ -560,11 +562,13 @@ typedef enum ApiFunctionType {
 } ApiFunctionType;
 
 typedef struct {
+    const char* name;
     ApiFunctionType function_type;
     void* funcptr;
 } function_data;
 
-extern const vvl::unordered_map<std::string, function_data> name_to_funcptr_map;
+// Returns nullptr if the function is not intercepted by the layer
+static const function_data* GetFunctionData(const char* funcName);
 
 // Manually written functions
 
@@ -665,12 +669,12 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
     if (!ApiParentExtensionEnabled(funcName, &layer_data->device_extensions)) {
         return nullptr;
     }
-    const auto &item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        if (item->second.function_type != kFuncTypeDev) {
+    const auto *item = GetFunctionData(funcName);
+    if (item) {
+        if (item->function_type != kFuncTypeDev) {
             return nullptr;
         } else {
-            return reinterpret_cast<PFN_vkVoidFunction>(item->second.funcptr);
+            return reinterpret_cast<PFN_vkVoidFunction>(item->funcptr);
         }
     }
     auto &table = layer_data->device_dispatch_table;
@@ -679,9 +683,9 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance, const char *funcName) {
-    const auto &item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second.funcptr);
+    const auto *item = GetFunctionData(funcName);
+    if (item) {
+        return reinterpret_cast<PFN_vkVoidFunction>(item->funcptr);
     }
     auto layer_data = GetLayerDataPtr(get_dispatch_key(instance), layer_data_map);
     auto &table = layer_data->instance_dispatch_table;
@@ -690,12 +694,12 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetPhysicalDeviceProcAddr(VkInstance instance, const char *funcName) {
-    const auto &item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        if (item->second.function_type != kFuncTypePdev) {
+    const auto *item = GetFunctionData(funcName);
+    if (item) {
+        if (item->function_type != kFuncTypePdev) {
             return nullptr;
         } else {
-            return reinterpret_cast<PFN_vkVoidFunction>(item->second.funcptr);
+            return reinterpret_cast<PFN_vkVoidFunction>(item->funcptr);
         }
     }
     auto layer_data = GetLayerDataPtr(get_dispatch_key(instance), layer_data_map);
@@ -1604,7 +1608,8 @@ VVL_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionProperties(V
         self.sections = dict([(section, []) for section in self.ALL_SECTIONS])
         # We need to manually add an entry for vk_layerGetPhysicalDeviceProcAddr because it isn't in the xml,
         # but it must be queryable from vkGetInstanceProcAddr()
-        self.intercepts = [ '    {"%s", {%s, (void*)%s}},' % ("vk_layerGetPhysicalDeviceProcAddr", "kFuncTypeInst", "GetPhysicalDeviceProcAddr") ]
+        # List of (name, function type, function pointer, protect)
+        self.intercepts = [ ('vk_layerGetPhysicalDeviceProcAddr', 'kFuncTypeInst', 'GetPhysicalDeviceProcAddr', None) ]
         self.intercept_enums = ''
         self.dispatch_vector_fcns = ''
         self.virtual_fcn_defs = ''
@@ -1745,13 +1750,7 @@ VVL_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionProperties(V
         self.newline()
         if self.chassis_source:
             # Record intercepted procedures
-            write('// Map of intercepted ApiName to its associated function data', file=self.outFile)
-            write('#ifdef _MSC_VER', file=self.outFile)
-            write('#pragma warning( suppress: 6262 ) // VS analysis: this uses more than 16 kiB, which is fine here at global scope', file=self.outFile)
-            write('#endif', file=self.outFile)
-            write('const vvl::unordered_map<std::string, function_data> name_to_funcptr_map = {', file=self.outFile)
-            write('\n'.join(self.intercepts), file=self.outFile)
-            write('};\n', file=self.outFile)
+            write(self.genFunctionDataTable(), file=self.outFile)
             self.newline()
             write('} // namespace vulkan_layer_chassis', file=self.outFile)
             write(self.inline_custom_source_postamble, file=self.outFile)
@@ -1787,6 +1786,43 @@ VVL_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionProperties(V
         # Finish processing in superclass
         OutputGenerator.endFile(self)
 
+    #
+    # The intercepted functions are found with a minimal perfect hash computed here, so looking up a
+    # function is two string hashes and a single strcmp without any allocations or a map to build at load time
+    def genFunctionDataTable(self):
+        (seeds, slots) = buildPerfectHash([x[0] for x in self.intercepts])
+        out = []
+        out.append('// Minimal perfect hash of intercepted ApiName to its associated function data\n')
+        out.append(f'static const uint32_t kFunctionDataSeeds[{len(seeds)}] = {{\n')
+        for index in range(0, len(seeds), 16):
+            out.append('    ' + ', '.join([str(x) for x in seeds[index:index + 16]]) + ',\n')
+        out.append('};\n\n')
+        out.append('#ifdef _MSC_VER\n')
+        out.append('#pragma warning( suppress: 6262 ) // VS analysis: this uses more than 16 kiB, which is fine here at global scope\n')
+        out.append('#endif\n')
+        out.append(f'static const function_data kFunctionData[{len(slots)}] = {{\n')
+        for slot in slots:
+            (name, function_type, funcptr, protect) = self.intercepts[slot]
+            if protect is not None:
+                out.append(f'#ifdef {protect}\n')
+            out.append(f'    {{"{name}", {function_type}, (void*){funcptr}}},\n')
+            if protect is not None:
+                # Keep the slot so the positions of the other functions don't depend on the platform
+                out.append('#else\n')
+                out.append(f'    {{nullptr, {function_type}, nullptr}},\n')
+                out.append('#endif\n')
+        out.append('};\n')
+        out.append('\n')
+        out.append('static const function_data* GetFunctionData(const char* funcName) {\n')
+        out.append('    const uint32_t seed = kFunctionDataSeeds[hash_util::PerfectHashString(0, funcName) % std::size(kFunctionDataSeeds)];\n')
+        out.append('    const function_data& item = kFunctionData[hash_util::PerfectHashString(seed, funcName) % std::size(kFunctionData)];\n')
+        out.append('    if (item.name && strcmp(item.name, funcName) == 0) {\n')
+        out.append('        return &item;\n')
+        out.append('    }\n')
+        out.append('    return nullptr;\n')
+        out.append('}\n')
+        return ''.join(out)
+
     def beginFeature(self, interface, emit):
         # Start processing in superclass
         OutputGenerator.beginFeature(self, interface, emit)
@@ -1918,18 +1954,10 @@ VVL_EXPORT VKAPI_ATTR VkResult VKAPI_CALL vkEnumerateDeviceExtensionProperties(V
                 function_type = 'kFuncTypeDev'
 
             if name in self.manual_functions:
-                if (self.featureExtraProtect != None):
-                    self.intercepts += [ '#ifdef %s' % self.featureExtraProtect ]
-                self.intercepts += [ '    {"%s", {%s, (void*)%s}},' % (name, function_type, name[2:]) ]
-                if (self.featureExtraProtect != None):
-                    self.intercepts += [ '#endif' ]
+                self.intercepts += [ (name, function_type, name[2:], self.featureExtraProtect) ]
                 return
             # Record that the function will be intercepted
-            if (self.featureExtraProtect != None):
-                self.intercepts += [ '#ifdef %s' % self.featureExtraProtect ]
-            self.intercepts += [ '    {"%s", {%s, (void*)%s}},' % (name, function_type, name[2:]) ]
-            if (self.featureExtraProtect != None):
-                self.intercepts += [ '#endif' ]
+            self.intercepts += [ (name, function_type, name[2:], self.featureExtraProtect) ]
             OutputGenerator.genCmd(self, cmdinfo, name, alias)
             #
             decls = self.makeCDecls(cmdinfo.elem)
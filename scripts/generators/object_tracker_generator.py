@@ -18,11 +18,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os,re,sys,json
+import os,re,sys
 import xml.etree.ElementTree as etree
 from generator import *
 from collections import namedtuple
 from common_codegen import *
+from generators.vuid_index import GetValidVuids
 
 # This is a workaround to use a Python 2.7 and 3.x compatible syntax.
 from io import open
@@ -170,8 +171,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
         self.CommandParam = namedtuple('CommandParam', ['type', 'name', 'isconst', 'isoptional', 'iscount', 'iscreate', 'len', 'extstructs', 'cdecl', 'islocal'])
         self.StructMemberData = namedtuple('StructMemberData', ['name', 'members'])
         self.object_types = []         # List of all handle types
-        self.valid_vuids = set()       # Set of all valid VUIDs
-        self.vuid_dict = dict()        # VUID dictionary (from JSON)
+        self.valid_vuids = frozenset() # Set of all valid VUIDs
     #
     # Check if the parameter passed in is optional
     def paramIsOptional(self, param):
@@ -285,20 +285,6 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
         return output_func
 
     #
-    # Walk the JSON-derived dict and find all "vuid" key values
-    def ExtractVUIDs(self, d):
-        if hasattr(d, 'items'):
-            for k, v in d.items():
-                if k == "vuid":
-                    yield v
-                elif isinstance(v, dict):
-                    for s in self.ExtractVUIDs(v):
-                        yield s
-                elif isinstance (v, list):
-                    for l in v:
-                        for s in self.ExtractVUIDs(l):
-                            yield s
-    #
     # Separate content for validation source and header files
     def otwrite(self, dest, formatstring):
         if 'object_tracker.h' in self.genOpts.filename and (dest == 'hdr' or dest == 'both'):
@@ -325,18 +311,8 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             sys.exit(1)
 
         self.valid_usage_path = genOpts.valid_usage_path
-        vu_json_filename = os.path.join(self.valid_usage_path + os.sep, 'validusage.json')
-        if os.path.isfile(vu_json_filename):
-            json_file = open(vu_json_filename, 'r', encoding='utf-8')
-            self.vuid_dict = json.load(json_file)
-            json_file.close()
-        if len(self.vuid_dict) == 0:
-            print("Error: Could not find, or error loading %s/validusage.json\n", vu_json_filename)
-            sys.exit(1)
-
-        # Build a set of all vuid text strings found in validusage.json
-        for json_vuid_string in self.ExtractVUIDs(self.vuid_dict):
-            self.valid_vuids.add(json_vuid_string)
+        # Set of all vuid text strings found in validusage.json
+        self.valid_vuids = GetValidVuids(self.valid_usage_path)
 
         # File Comment
         file_comment = '// *** THIS FILE IS GENERATED - DO NOT EDIT ***\n'
@@ -18,10 +18,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os,re,sys,json
+import os,re,sys
 from generator import *
 from collections import namedtuple
 from common_codegen import *
+from generators.vuid_index import GetValidVuids
 
 # Helper for iterating over a list where each element is possibly a single element or another 1-dimensional list
 # Generates (setter, deleter, element) for each element where:
@@ -287,8 +288,7 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         self.extension_names = dict()                     # Dictionary of extension names to extension name defines
         self.structextends_list = []                      # List of extensions which extend another struct
         self.struct_feature_protect = dict()              # Dictionary of structnames and FeatureExtraProtect strings
-        self.valid_vuids = set()                          # Set of all valid VUIDs
-        self.vuid_dict = dict()                           # VUID dictionary (from JSON)
+        self.valid_vuids = frozenset()                    # Set of all valid VUIDs
         self.alias_dict = dict()                          # Dict of cmd|struct aliases
         self.header_file = False                          # Header file generation flag
         self.source_file = False                          # Source file generation flag
@@ -347,20 +347,6 @@ class ParameterValidationOutputGenerator(OutputGenerator):
             return indent[:-self.INDENT_SPACES]
         return ''
     #
-    # Walk the JSON-derived dict and find all "vuid" key values
-    def ExtractVUIDs(self, d):
-        if hasattr(d, 'items'):
-            for k, v in d.items():
-                if k == "vuid":
-                    yield v
-                elif isinstance(v, dict):
-                    for s in self.ExtractVUIDs(v):
-                        yield s
-                elif isinstance (v, list):
-                    for l in v:
-                        for s in self.ExtractVUIDs(l):
-                            yield s
-    #
     # Called at file creation time
     def beginFile(self, genOpts):
         OutputGenerator.beginFile(self, genOpts)
@@ -433,18 +419,8 @@ class ParameterValidationOutputGenerator(OutputGenerator):
                 self.structTypes[struct.get('name')] = stype.get('values')
 
         self.valid_usage_path = genOpts.valid_usage_path
-        vu_json_filename = os.path.join(self.valid_usage_path + os.sep, 'validusage.json')
-        if os.path.isfile(vu_json_filename):
-            json_file = open(vu_json_filename, 'r', encoding='utf-8')
-            self.vuid_dict = json.load(json_file)
-            json_file.close()
-        if len(self.vuid_dict) == 0:
-            print("Error: Could not find, or error loading %s/validusage.json\n", vu_json_filename)
-            sys.exit(1)
-        #
-        # Build a set of all vuid text strings found in validusage.json
-        for json_vuid_string in self.ExtractVUIDs(self.vuid_dict):
-            self.valid_vuids.add(json_vuid_string)
+        # Set of all vuid text strings found in validusage.json
+        self.valid_vuids = GetValidVuids(self.valid_usage_path)
         #
         # Headers
         write('#include "chassis.h"', file=self.outFile)
@@ -50,15 +50,6 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
         self.imageOperandsParamCount = [[] for i in range(3)]
 
         # Lots of switch statements share same ending
-        self.commonBoolSwitch = '''            found = true;
-            break;
-        default:
-            break;
-    }
-    return found;
-}\n
-'''
-
     def commonParamSwitch(self, variableName):
         return '''        default:
             break;
@@ -109,7 +100,8 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
         write(copyright, file=self.outFile)
 
         if self.sourceFile:
-            write('#include "containers/custom_containers.h"', file=self.outFile)
+            write('#include <array>', file=self.outFile)
+            write('#include <iterator>', file=self.outFile)
             write('#include "spirv_grammar_helper.h"', file=self.outFile)
             write('#include "state_tracker/shader_instruction.h"', file=self.outFile)
         elif self.headerFile:
@@ -200,15 +192,15 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
                 }
 
                 if instruction['class'] == 'Atomic':
-                    self.atomicsOps.append(opname)
+                    self.atomicsOps.append(opcode)
                 if instruction['class'] == 'Non-Uniform':
-                    self.groupOps.append(opname)
+                    self.groupOps.append(opcode)
                 if re.search("OpImage.*Gather", opname) is not None:
-                    self.imageGatherOps.append(opname)
+                    self.imageGatherOps.append(opcode)
                 if re.search("OpImageFetch.*", opname) is not None:
-                    self.imageFetchOps.append(opname)
+                    self.imageFetchOps.append(opcode)
                 if re.search("OpImageSample.*", opname) is not None:
-                    self.imageSampleOps.append(opname)
+                    self.imageSampleOps.append(opcode)
                 if 'operands' in instruction:
                     for index, operand in enumerate(instruction['operands']):
                         if operand['kind'] == 'IdResultType':
@@ -265,6 +257,7 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
         if self.sourceFile:
             output += '// All information related to each SPIR-V opcode instruction\n'
             output += 'struct InstructionInfo {\n'
+            output += '    uint32_t opcode;\n'
             output += '    const char* name;\n'
             output += '    bool has_type; // always operand 0 if present\n'
             output += '    bool has_result; // always operand 1 if present\n'
@@ -272,18 +265,25 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
             output += '    uint32_t memory_scope_position; // operand ID position or zero if not present\n'
             output += '    uint32_t execution_scope_position; // operand ID position or zero if not present\n'
             output += '    uint32_t image_operands_position; // operand ID position or zero if not present\n'
+            output += '    uint32_t storage_class_position; // operand ID position or zero if not present\n'
             output += '\n'
             output += '    uint32_t image_access_operands_position; // operand ID position or zero if not present\n'
             output += '    uint32_t sampled_image_access_operands_position; // operand ID position or zero if not present\n'
+            output += '\n'
+            output += '    bool atomic_operation;\n'
+            output += '    bool group_operation;\n'
+            output += '    bool image_gather_operation;\n'
+            output += '    bool image_fetch_operation;\n'
+            output += '    bool image_sample_operation;\n'
             output += '};\n'
             output += '\n'
             output += '// Static table to replace having many large switch statement functions for looking up each part\n'
-            output += '// of a given SPIR-V opcode instruction\n'
+            output += '// of a given SPIR-V opcode instruction, sorted by opcode\n'
             output += '//\n'
             output += '// clang-format off\n'
-            output += 'static const vvl::unordered_map<uint32_t, InstructionInfo> kInstructionTable {\n'
+            output += 'static constexpr InstructionInfo kInstructionTable[] = {\n'
             for opcode, info in sorted(self.opcodes.items()):
-                output += '    {{spv::{}, {{"{}", {}, {}, {}, {}, {}, {}, {}}}}},\n'.format(
+                output += '    {{spv::{}, "{}", {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}}},\n'.format(
                     info['name'],
                     info['name'],
                     info['hasType'],
@@ -291,11 +291,37 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
                     info['memoryScopePosition'],
                     info['executionScopePosition'],
                     info['imageOperandsPosition'],
+                    info['storageClassPosition'],
                     info['imageRefPosition'],
                     info['sampledImageRefPosition'],
+                    'true' if opcode in self.atomicsOps else 'false',
+                    'true' if opcode in self.groupOps else 'false',
+                    'true' if opcode in self.imageGatherOps else 'false',
+                    'true' if opcode in self.imageFetchOps else 'false',
+                    'true' if opcode in self.imageSampleOps else 'false',
                 )
             output += '};\n'
             output += '// clang-format on\n'
+            output += '\n'
+            output += '// Opcodes are not contiguous (extensions are given their own blocks of values), so instead of a table\n'
+            output += '// entry for every possible opcode, this maps each opcode to its index in kInstructionTable plus one\n'
+            output += '// (zero is an unknown opcode)\n'
+            output += 'static constexpr uint32_t kMaxInstructionOpcode = kInstructionTable[std::size(kInstructionTable) - 1].opcode;\n'
+            output += 'static_assert(std::size(kInstructionTable) < UINT16_MAX);\n'
+            output += 'static constexpr std::array<uint16_t, kMaxInstructionOpcode + 1> kInstructionIndex = [] {\n'
+            output += '    std::array<uint16_t, kMaxInstructionOpcode + 1> index{};\n'
+            output += '    for (size_t i = 0; i < std::size(kInstructionTable); ++i) {\n'
+            output += '        index[kInstructionTable[i].opcode] = static_cast<uint16_t>(i + 1);\n'
+            output += '    }\n'
+            output += '    return index;\n'
+            output += '}();\n'
+            output += '\n'
+            output += 'static const InstructionInfo* GetInstructionInfo(uint32_t opcode) {\n'
+            output += '    if (opcode > kMaxInstructionOpcode || kInstructionIndex[opcode] == 0) {\n'
+            output += '        return nullptr;\n'
+            output += '    }\n'
+            output += '    return &kInstructionTable[kInstructionIndex[opcode] - 1];\n'
+            output += '}\n'
         return output;
     #
     # Generate functions for numeric based functions
@@ -306,11 +332,9 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
         elif self.sourceFile:
             output += '// Any non supported operation will be covered with VUID 01090\n'
             output += 'bool AtomicOperation(uint32_t opcode) {\n'
-            output += '    bool found = false;\n'
-            output += '    switch (opcode) {\n'
-            for f in self.atomicsOps:
-                output += '        case spv::{}:\n'.format(f)
-            output += self.commonBoolSwitch
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->atomic_operation;\n'
+            output += '}\n'
 
         return output;
     #
@@ -322,11 +346,9 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
         elif self.sourceFile:
             output += '// Any non supported operation will be covered with VUID 01090\n'
             output += 'bool GroupOperation(uint32_t opcode) {\n'
-            output += '    bool found = false;\n'
-            output += '    switch (opcode) {\n'
-            for f in self.groupOps:
-                output += '        case spv::{}:\n'.format(f)
-            output += self.commonBoolSwitch
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->group_operation;\n'
+            output += '}\n'
 
         return output;
     #
@@ -335,16 +357,12 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
         output = ''
         if self.sourceFile:
             output += 'spv::StorageClass Instruction::StorageClass() const {\n'
-            output += '    spv::StorageClass storage_class = spv::StorageClassMax;\n'
-            output += '    switch (Opcode()) {\n'
-            for opcode, info in sorted(self.opcodes.items()):
-                operand = info['storageClassPosition']
-                if operand == 0:
-                    continue
-                output += '        case spv::{}:\n'.format(info['name'])
-                output += '            storage_class = static_cast<spv::StorageClass>(Word({}));\n'.format(info['storageClassPosition'])
-                output += '            break;\n'
-            output += self.commonParamSwitch('storage_class')
+            output += '    const InstructionInfo* info = GetInstructionInfo(Opcode());\n'
+            output += '    if (info == nullptr || info->storage_class_position == 0) {\n'
+            output += '        return spv::StorageClassMax;\n'
+            output += '    }\n'
+            output += '    return static_cast<spv::StorageClass>(Word(info->storage_class_position));\n'
+            output += '}\n'
         return output;
     #
     # Generate functions for image operations
@@ -358,46 +376,30 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
             output += 'uint32_t SampledImageAccessOperandsPosition(uint32_t opcode);\n'
         elif self.sourceFile:
             output += 'bool ImageGatherOperation(uint32_t opcode) {\n'
-            output += '    bool found = false;\n'
-            output += '    switch (opcode) {\n'
-            for f in self.imageGatherOps:
-                output += '        case spv::{}:\n'.format(f)
-            output += self.commonBoolSwitch
-            output += '\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->image_gather_operation;\n'
+            output += '}\n\n'
 
             output += 'bool ImageFetchOperation(uint32_t opcode) {\n'
-            output += '    bool found = false;\n'
-            output += '    switch (opcode) {\n'
-            for f in self.imageFetchOps:
-                output += '        case spv::{}:\n'.format(f)
-            output += self.commonBoolSwitch
-            output += '\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->image_fetch_operation;\n'
+            output += '}\n\n'
 
             output += 'bool ImageSampleOperation(uint32_t opcode) {\n'
-            output += '    bool found = false;\n'
-            output += '    switch (opcode) {\n'
-            for f in self.imageSampleOps:
-                output += '        case spv::{}:\n'.format(f)
-            output += self.commonBoolSwitch
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->image_sample_operation;\n'
+            output += '}\n\n'
 
             output += '// Return operand position of Image IdRef or zero if there is none\n'
             output += 'uint32_t ImageAccessOperandsPosition(uint32_t opcode) {\n'
-            output += '    uint32_t position = 0;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        position = format_info->second.image_access_operands_position;\n'
-            output += '    }\n'
-            output += '    return position;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr ? info->image_access_operands_position : 0;\n'
             output += '}\n\n'
 
             output += '// Return operand position of \'Sampled Image\' IdRef or zero if there is none\n'
             output += 'uint32_t SampledImageAccessOperandsPosition(uint32_t opcode) {\n'
-            output += '    uint32_t position = 0;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        position = format_info->second.sampled_image_access_operands_position;\n'
-            output += '    }\n'
-            output += '    return position;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr ? info->sampled_image_access_operands_position : 0;\n'
             output += '}\n\n'
 
         return output;
@@ -416,51 +418,31 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
             output += 'uint32_t ImageOperandsParamCount(uint32_t opcode);\n'
         elif self.sourceFile:
             output += 'bool OpcodeHasType(uint32_t opcode) {\n'
-            output += '    bool has_type = false;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        has_type = format_info->second.has_type;\n'
-            output += '    }\n'
-            output += '    return has_type;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->has_type;\n'
             output += '}\n\n'
 
             output += 'bool OpcodeHasResult(uint32_t opcode) {\n'
-            output += '    bool has_result = false;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        has_result = format_info->second.has_result;\n'
-            output += '    }\n'
-            output += '    return has_result;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr && info->has_result;\n'
             output += '}\n\n'
 
             output += '// Return operand position of Memory Scope <ID> or zero if there is none\n'
             output += 'uint32_t OpcodeMemoryScopePosition(uint32_t opcode) {\n'
-            output += '    uint32_t position = 0;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        position = format_info->second.memory_scope_position;\n'
-            output += '    }\n'
-            output += '    return position;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr ? info->memory_scope_position : 0;\n'
             output += '}\n\n'
 
             output += '// Return operand position of Execution Scope <ID> or zero if there is none\n'
             output += 'uint32_t OpcodeExecutionScopePosition(uint32_t opcode) {\n'
-            output += '    uint32_t position = 0;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        position = format_info->second.execution_scope_position;\n'
-            output += '    }\n'
-            output += '    return position;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr ? info->execution_scope_position : 0;\n'
             output += '}\n\n'
 
             output += '// Return operand position of Image Operands <ID> or zero if there is none\n'
             output += 'uint32_t OpcodeImageOperandsPosition(uint32_t opcode) {\n'
-            output += '    uint32_t position = 0;\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        position = format_info->second.image_operands_position;\n'
-            output += '    }\n'
-            output += '    return position;\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr ? info->image_operands_position : 0;\n'
             output += '}\n\n'
 
             output += '// Return number of optional parameter from ImageOperands\n'
@@ -491,12 +473,8 @@ class SpirvGrammarHelperOutputGenerator(OutputGenerator):
             output +=  'const char* string_SpvDim(uint32_t dim);\n'
         elif self.sourceFile:
             output =  'const char* string_SpvOpcode(uint32_t opcode) {\n'
-            output += '    auto format_info = kInstructionTable.find(opcode);\n'
-            output += '    if (format_info != kInstructionTable.end()) {\n'
-            output += '        return format_info->second.name;\n'
-            output += '    } else {\n'
-            output += '        return \"Unknown Opcode\";\n'
-            output += '    }\n'
+            output += '    const InstructionInfo* info = GetInstructionInfo(opcode);\n'
+            output += '    return info != nullptr ? info->name : \"Unknown Opcode\";\n'
             output += '};\n'
 
             output += '\nconst char* string_SpvStorageClass(uint32_t storage_class) {\n'
@@ -38,12 +38,12 @@ class SpirvValidationHelperOutputGenerator(BaseGenerator):
         ]
 
         # There are some enums that share the same value in the SPIR-V header.
-        # This array remove the duplicate to not print out, usually due to being the older value given
-        self.capabilityAliasList = [
-          'ShaderViewportIndexLayerNV',
-          'ShadingRateNV',
-          'FragmentBarycentricNV',
-        ]
+        # This maps the duplicate to the capability it shares the value with, usually due to being the older value given
+        self.capabilityAliasList = {
+          'ShaderViewportIndexLayerNV' : 'ShaderViewportIndexLayerEXT',
+          'ShadingRateNV' : 'FragmentDensityEXT',
+          'FragmentBarycentricNV' : 'FragmentBarycentricKHR',
+        }
 
         # This is a list that maps the Vulkan struct a feature field is with the internal
         # state tracker's enabled features value
@@ -180,6 +180,7 @@ class SpirvValidationHelperOutputGenerator(BaseGenerator):
  ****************************************************************************/\n'''
         self.write(copyright)
         self.write('// NOLINTBEGIN') # Wrap for clang-tidy to ignore
+        self.write('#include <cstring>')
         self.write('#include <string>')
         self.write('#include <functional>')
         self.write('#include <spirv/unified1/spirv.hpp>')
@@ -187,6 +188,7 @@ class SpirvValidationHelperOutputGenerator(BaseGenerator):
         self.write('#include "state_tracker/shader_module.h"')
         self.write('#include "state_tracker/device_state.h"')
         self.write('#include "core_checks/core_validation.h"')
+        self.write('#include "utils/hash_util.h"')
 
         #
         # Creates the FeaturePointer struct to map features with those in the layers state tracker
@@ -223,32 +225,96 @@ struct RequiredSpirvInfo {
 
         #
         # Build the struct with all the requirments for the spirv capabilities
-        out = []
-        out.append('// clang-format off\n')
-        out.append('static const std::unordered_multimap<uint32_t, RequiredSpirvInfo> spirvCapabilities = {\n')
+        # The requirements of a capability are next to each other and a switch gives the range of them,
+        # aliases share the value (and the case) of the capability they alias
+        capabilities = {}
         for spirv in filter(lambda x: x.capability, self.vk.spirv):
             for enable in spirv.enable:
                 if enable.struct is not None and enable.struct in self.promotedFeatures:
                     continue
-                if spirv.name in self.capabilityExcludeList:
-                    out.append('    // Not found in current SPIR-V Headers\n    //')
-                out.append(f'    {{spv::Capability{spirv.name}, {self.createMapValue(spirv.name, enable, False)}}},\n')
+                name = self.capabilityAliasList.get(spirv.name, spirv.name)
+                capabilities.setdefault(name, []).append((spirv.name, self.createMapValue(spirv.name, enable, False)))
+        out = []
+        out.append('// clang-format off\n')
+        out.append('static const RequiredSpirvInfo spirvCapabilities[] = {\n')
+        capabilityRanges = []
+        index = 0
+        for name, requirements in capabilities.items():
+            if name in self.capabilityExcludeList:
+                out.append('    // Not found in current SPIR-V Headers\n')
+                out.extend([f'    //    {value}, // {spirvName}\n' for (spirvName, value) in requirements])
+                continue
+            out.extend([f'    {value}, // {spirvName}\n' for (spirvName, value) in requirements])
+            capabilityRanges.append((name, index, len(requirements)))
+            index += len(requirements)
         out.append('};\n')
         out.append('// clang-format on\n')
+        out.append('''
+// Returns the requirements of the capability in spirvCapabilities, empty if the capability is not supported by Vulkan
+static vvl::span<const RequiredSpirvInfo> GetSpirvCapabilityRequirements(uint32_t capability) {
+    switch (capability) {
+''')
+        for (name, first, count) in capabilityRanges:
+            out.append(f'        case spv::Capability{name}:\n')
+            out.append(f'            return {{&spirvCapabilities[{first}], {count}}};\n')
+        out.append('        default:\n')
+        out.append('            return {};\n')
+        out.append('    }\n')
+        out.append('}\n')
         self.write("".join(out))
 
         #
         # Build the struct with all the requirments for the spirv extensions
-        out = []
-        out.append('// clang-format off\n')
-        out.append('static const std::unordered_multimap<std::string, RequiredSpirvInfo> spirvExtensions = {\n')
+        # The extension names are found with a minimal perfect hash, so there is no map to build at load time
+        # and looking up an extension is two string hashes and a single strcmp
+        extensions = {}
         for spirv in filter(lambda x: x.extension, self.vk.spirv):
             for enable in spirv.enable:
-                out.append(f'    {{"{spirv.name}", {self.createMapValue(spirv.name, enable, True)}}},\n')
+                extensions.setdefault(spirv.name, []).append(self.createMapValue(spirv.name, enable, True))
+        out = []
+        out.append('// clang-format off\n')
+        out.append('static const RequiredSpirvInfo spirvExtensions[] = {\n')
+        extensionRanges = []
+        index = 0
+        for name, requirements in extensions.items():
+            out.extend([f'    {value}, // {name}\n' for value in requirements])
+            extensionRanges.append((name, index, len(requirements)))
+            index += len(requirements)
         out.append('};\n')
         out.append('// clang-format on\n')
-        self.write("".join(out))
 
+        (seeds, slots) = buildPerfectHash([x[0] for x in extensionRanges])
+        out.append('''
+struct SpirvExtensionRequirements {
+    const char* name;
+    uint32_t first;  // index into spirvExtensions
+    uint32_t count;
+};
+
+// Minimal perfect hash of the SPIR-V extension names to their requirements in spirvExtensions
+''')
+        out.append(f'static constexpr uint32_t kSpirvExtensionSeeds[{len(seeds)}] = {{\n')
+        for index in range(0, len(seeds), 16):
+            out.append('    ' + ', '.join([str(x) for x in seeds[index:index + 16]]) + ',\n')
+        out.append('};\n')
+        out.append(f'static constexpr SpirvExtensionRequirements kSpirvExtensionRequirements[{len(slots)}] = {{\n')
+        for slot in slots:
+            (name, first, count) = extensionRanges[slot]
+            out.append(f'    {{"{name}", {first}, {count}}},\n')
+        out.append('};\n')
+        out.append('''
+// Returns the requirements of the extension in spirvExtensions, empty if the extension is not supported by Vulkan
+static vvl::span<const RequiredSpirvInfo> GetSpirvExtensionRequirements(const char* extension) {
+    const uint32_t seed = kSpirvExtensionSeeds[hash_util::PerfectHashString(0, extension) % std::size(kSpirvExtensionSeeds)];
+    const SpirvExtensionRequirements& item =
+        kSpirvExtensionRequirements[hash_util::PerfectHashString(seed, extension) % std::size(kSpirvExtensionRequirements)];
+    if (strcmp(item.name, extension) == 0) {
+        return {&spirvExtensions[item.first], item.count};
+    }
+    return {};
+}
+''')
+        self.write("".join(out))
 
         #
         # Creates the Enum string helpers for better error messages. Same idea of vk_enum_string_helper.h but for SPIR-V
@@ -301,7 +367,8 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
 
     if (insn.Opcode() == spv::OpCapability) {
         // All capabilities are generated so if it is not in the list it is not supported by Vulkan
-        if (spirvCapabilities.count(insn.Word(1)) == 0) {
+        const auto caps = GetSpirvCapabilityRequirements(insn.Word(1));
+        if (caps.empty()) {
             skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08739",
                 "vkCreateShaderModule(): A SPIR-V Capability (%s) was declared that is not supported by Vulkan.", string_SpvCapability(insn.Word(1)));
             return skip; // no known capability to validate
@@ -310,24 +377,23 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
         // Each capability has one or more requirements to check
         // Only one item has to be satisfied and an error only occurs
         // when all are not satisfied
-        auto caps = spirvCapabilities.equal_range(insn.Word(1));
         bool has_support = false;
-        for (auto it = caps.first; (it != caps.second) && (has_support == false); ++it) {
-            if (it->second.version) {
-                if (api_version >= it->second.version) {
+        for (auto it = caps.begin(); (it != caps.end()) && (has_support == false); ++it) {
+            if (it->version) {
+                if (api_version >= it->version) {
                     has_support = true;
                 }
-            } else if (it->second.feature) {
-                if (it->second.feature.IsEnabled(enabled_features)) {
+            } else if (it->feature) {
+                if (it->feature.IsEnabled(enabled_features)) {
                     has_support = true;
                 }
-            } else if (it->second.extension) {
+            } else if (it->extension) {
                 // kEnabledByApiLevel is not valid as some extension are promoted with feature bits to be used.
-                // If the new Api Level gives support, it will be caught in the "it->second.version" check instead.
-                if (IsExtEnabledByCreateinfo(device_extensions.*(it->second.extension))) {
+                // If the new Api Level gives support, it will be caught in the "it->version" check instead.
+                if (IsExtEnabledByCreateinfo(device_extensions.*(it->extension))) {
                     has_support = true;
                 }
-            } else if (it->second.property) {
+            } else if (it->property) {
                 // support is or'ed as only one has to be supported (if applicable)
                 switch (insn.Word(1)) {''')
 
@@ -370,39 +436,39 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
             }
         }
     } else if (insn.Opcode() == spv::OpExtension) {
-        static const std::string spv_prefix = "SPV_";
-        std::string extension_name = insn.GetAsString(1);
+        const char* extension_name = insn.GetAsString(1);
+        vvl::span<const RequiredSpirvInfo> ext;
 
-        if (0 == extension_name.compare(0, spv_prefix.size(), spv_prefix)) {
-            if (spirvExtensions.count(extension_name) == 0) {
+        if (strncmp(extension_name, "SPV_", 4) == 0) {
+            ext = GetSpirvExtensionRequirements(extension_name);
+            if (ext.empty()) {
                 skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08741",
-                    "vkCreateShaderModule(): A SPIR-V Extension (%s) was declared that is not supported by Vulkan.", extension_name.c_str());
+                    "vkCreateShaderModule(): A SPIR-V Extension (%s) was declared that is not supported by Vulkan.", extension_name);
                 return skip; // no known extension to validate
             }
         } else {
             skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08741",
                 "vkCreateShaderModule(): The SPIR-V code uses the '%s' extension which is not a SPIR-V extension. Please use a SPIR-V"
                 " extension (https://github.com/KhronosGroup/SPIRV-Registry) for OpExtension instructions. Non-SPIR-V extensions can be"
-                " recorded in SPIR-V using the OpSourceExtension instruction.", extension_name.c_str());
+                " recorded in SPIR-V using the OpSourceExtension instruction.", extension_name);
             return skip; // no known extension to validate
         }
 
         // Each SPIR-V Extension has one or more requirements to check
         // Only one item has to be satisfied and an error only occurs
         // when all are not satisfied
-        auto ext = spirvExtensions.equal_range(extension_name);
         bool has_support = false;
-        for (auto it = ext.first; (it != ext.second) && (has_support == false); ++it) {
-            if (it->second.version) {
-                if (api_version >= it->second.version) {
+        for (auto it = ext.begin(); (it != ext.end()) && (has_support == false); ++it) {
+            if (it->version) {
+                if (api_version >= it->version) {
                     has_support = true;
                 }
-            } else if (it->second.feature) {
-                if (it->second.feature.IsEnabled(enabled_features)) {
+            } else if (it->feature) {
+                if (it->feature.IsEnabled(enabled_features)) {
                     has_support = true;
                 }
-            } else if (it->second.extension) {
-                if (IsExtEnabled(device_extensions.*(it->second.extension))) {
+            } else if (it->extension) {
+                if (IsExtEnabled(device_extensions.*(it->extension))) {
                     has_support = true;
                 }
             }
@@ -410,7 +476,7 @@ bool CoreChecks::ValidateShaderCapabilitiesAndExtensions(const Instruction &insn
 
         if (has_support == false) {
             skip |= LogError(device, "VUID-VkShaderModuleCreateInfo-pCode-08742",
-                "vkCreateShaderModule(): The SPIR-V Extension (%s) was declared, but none of the requirements were met to use it.", extension_name.c_str());
+                "vkCreateShaderModule(): The SPIR-V Extension (%s) was declared, but none of the requirements were met to use it.", extension_name);
         }
     } //spv::OpExtension
     return skip;
@@ -34,6 +34,11 @@ syncEnumTypes = (syncEnumStageType, syncEnumAccessType)
 
 separator = ' |\n        '
 
+# Size of the tables indexed by the bit position of a VkFlags64 (stage or access) flag
+flagBitCount = 64
+# Size of the tables indexed by the bit position of a VkQueueFlagBits flag
+queueFlagBitCount = 32
+
 # Maps the 'queuetype' in XML to VkQueueFlagBits
 queueTypeToQueueFlags = {
     'transfer' : 'VK_QUEUE_TRANSFER_BIT',
@@ -74,9 +79,6 @@ def BitSuffixed(name):
                 break
     return bit_suf
 
-def SortSetBasedOnOrder(stage_set, stage_order):
-    return [ stage for stage in stage_order if stage in stage_set]
-
 # SyncValidationOutputGenerator - Generate sync validation
 class SyncValidationOutputGenerator(OutputGenerator):
     def __init__(self,
@@ -121,6 +123,9 @@ class SyncValidationOutputGenerator(OutputGenerator):
         # < stage, [accesses] >
         self.stageToAccessMap = dict()
 
+        # < VkQueueFlagBits, bit position >
+        self.queueFlagBits = dict()
+
         self.enumsInBitOrder = dict()
         self.stageAccessCombo = []
 
@@ -161,11 +166,11 @@ class SyncValidationOutputGenerator(OutputGenerator):
         elif self.headerFile:
             write('#pragma once\n', file=self.outFile)
             write('#include <array>', file=self.outFile)
-            write('#include <bitset>', file=self.outFile)
-            write('#include <map>', file=self.outFile)
+            write('#include <cstddef>', file=self.outFile)
             write('#include <stdint.h>', file=self.outFile)
             write('#include <vulkan/vulkan.h>', file=self.outFile)
             write('#include "containers/custom_containers.h"', file=self.outFile)
+            write('#include "utils/vk_layer_utils.h"', file=self.outFile)
 
     # Write generated file content to output file
     def endFile(self):
@@ -194,8 +199,8 @@ class SyncValidationOutputGenerator(OutputGenerator):
         write(self.stageAccessMaskByAccess(), file=self.outFile)
         write(self.accessMaskByStage(), file=self.outFile)
         write(self.allCommandStagesByQueueFlags(), file=self.outFile)
-        write(self.logicallyEarlierStages(), file=self.outFile)
-        write(self.logicallyLaterStages(), file=self.outFile)
+        write(self.logicallyRelatedStages(True), file=self.outFile)
+        write(self.logicallyRelatedStages(False), file=self.outFile)
 
         # Finish processing in superclass
         OutputGenerator.endFile(self)
@@ -218,6 +223,10 @@ class SyncValidationOutputGenerator(OutputGenerator):
                 elif groupName == syncEnumAccessType:
                     self.accessEquivalent[name] = []
                     self.accessToStageMap[name] = []
+        elif groupName == 'VkQueueFlagBits':
+            for elem in groupinfo.elem.findall('enum'):
+                if elem.get('supported') != 'disabled' and elem.get('bitpos') is not None:
+                    self.queueFlagBits[elem.get('name')] = int(elem.get('bitpos'))
 
     # Gets all <syncstage>
     def genSyncStage(self, sync):
@@ -358,20 +367,59 @@ class SyncValidationOutputGenerator(OutputGenerator):
     def getStagesInLogicalOrder(self):
         logical_order = ['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT']
         for pipeline_name in self.pipelineNames:
-            for index, stage_info in enumerate(self.pipelineStagesOrdered[pipeline_name]):
-                stage = stage_info['stage']
+            pipeline_stages = [s['stage'] for s in self.pipelineStagesOrdered[pipeline_name]]
+            for index, stage in enumerate(pipeline_stages):
                 if stage not in logical_order:
-                    later_stages =[s['stage'] for s in self.pipelineStagesOrdered[pipeline_name][index+1:]]
-                    insert_loc = len(logical_order)
-                    while insert_loc > 0:
-                        if any(s in logical_order[:insert_loc] for s in later_stages):
-                            insert_loc -= 1
-                        else:
-                            break
+                    # Insert before the first already placed stage that comes later in this pipeline
+                    later_stages = set(pipeline_stages[index+1:])
+                    insert_loc = next((i for i, s in enumerate(logical_order) if s in later_stages), len(logical_order))
                     logical_order.insert(insert_loc, stage)
         logical_order.append('VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT')
         return logical_order
 
+    # Masks of the logically earlier (or later) stages for each stage, built with a single pass over
+    # each pipeline and then closed transitively, so the runtime only has to OR the masks of the set bits.
+    # Returns < stage, mask >
+    def getRelatedStageMasks(self, earlier):
+        bit = {e['name']: e['mask'] for e in self.enumsInBitOrder[syncEnumStageType]}
+        (first, last) = ('VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT', 'VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT')
+        if not earlier:
+            (first, last) = (last, first)
+
+        masks = {first: bit[first], last: bit[first] | bit[last]}
+        for stages in self.pipelineStagesOrdered.values():
+            # Stages before (or after) the current stage in this pipeline.
+            # Later stages only include ordered stages.
+            related = 0
+            for stage_order in (stages if earlier else reversed(stages)):
+                stage = stage_order['stage']
+                if stage != 'VK_PIPELINE_STAGE_2_HOST_BIT':
+                    if stage not in masks:
+                        masks[stage] = bit[first]
+                        masks[last] |= bit[stage]
+                    if not stage_order['ordered']:
+                        masks[stage] = bit[first]
+                    else:
+                        masks[stage] |= related
+                if earlier or stage_order['ordered']:
+                    related |= bit[stage]
+
+        # A stage logically earlier than an earlier stage is earlier as well
+        mask_by_bit = {bit[stage]: mask for stage, mask in masks.items()}
+        changed = True
+        while changed:
+            changed = False
+            for stage, mask in masks.items():
+                closure = mask
+                for stage_bit, related_mask in mask_by_bit.items():
+                    if mask & stage_bit:
+                        closure |= related_mask
+                if closure != mask:
+                    masks[stage] = closure
+                    mask_by_bit[bit[stage]] = closure
+                    changed = True
+        return masks
+
     #
     # Create defines that are used either by other files (headerFile) or just internally (sourceFile)
     def defines(self):
@@ -403,12 +451,94 @@ class SyncValidationOutputGenerator(OutputGenerator):
     def accessFlags(self):
         output = ''
         if self.headerFile:
+            # One bit for each SyncStageAccessIndex, in as few 64-bit words as possible
+            word_count = (len(self.stageAccessCombo) + 63) // 64
+            for access in self.stageAccessCombo:
+                if access['index'] >= word_count * 64:
+                    self.logMsg('error', f'{access["stage_access"]} has index {access["index"]}, which does not fit in SyncStageAccessFlags of {word_count * 64} bits')
+
             output = '\n'
-            output += 'using SyncStageAccessFlags = std::bitset<128>;\n'
+            output += '// Bit set with a bit for each stage/access combination, sized to the number of SyncStageAccessIndex values.\n'
+            output += '// It has the part of the std::bitset interface used by sync validation, plus word at a time helpers.\n'
+            output += 'struct SyncStageAccessFlags {\n'
+            output += f'    static constexpr size_t kWordCount = {word_count};\n'
+            output += '''    static constexpr size_t kBitCount = kWordCount * 64;
+    uint64_t words[kWordCount];
+
+    constexpr SyncStageAccessFlags() : words{} {}
+    // Sets the lowest 64 bits, same as the std::bitset constructor
+    constexpr SyncStageAccessFlags(uint64_t low_bits) : words{low_bits} {}
+
+    static constexpr SyncStageAccessFlags FromIndex(size_t index) {
+        SyncStageAccessFlags flags;
+        flags.words[index / 64] = 1ULL << (index % 64);
+        return flags;
+    }
+
+    static constexpr size_t size() { return kBitCount; }
+    constexpr bool test(size_t index) const { return ((words[index / 64] >> (index % 64)) & 1) != 0; }
+    constexpr SyncStageAccessFlags &set(size_t index) {
+        words[index / 64] |= 1ULL << (index % 64);
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &reset(size_t index) {
+        words[index / 64] &= ~(1ULL << (index % 64));
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &reset() {
+        for (auto &word : words) word = 0;
+        return *this;
+    }
+    constexpr bool any() const {
+        uint64_t bits = 0;
+        for (const auto word : words) bits |= word;
+        return bits != 0;
+    }
+    constexpr bool none() const { return !any(); }
+
+    // Returns the index of the lowest set bit, -1 if no bits are set
+    int LeastSignificantBit() const {
+        for (size_t i = 0; i < kWordCount; ++i) {
+            if (words[i]) {
+                return static_cast<int>(i * 64) + ::LeastSignificantBit(words[i]);
+            }
+        }
+        return -1;
+    }
+
+    constexpr SyncStageAccessFlags operator~() const {
+        SyncStageAccessFlags result;
+        for (size_t i = 0; i < kWordCount; ++i) result.words[i] = ~words[i];
+        return result;
+    }
+    constexpr SyncStageAccessFlags &operator&=(const SyncStageAccessFlags &rhs) {
+        for (size_t i = 0; i < kWordCount; ++i) words[i] &= rhs.words[i];
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &operator|=(const SyncStageAccessFlags &rhs) {
+        for (size_t i = 0; i < kWordCount; ++i) words[i] |= rhs.words[i];
+        return *this;
+    }
+    constexpr SyncStageAccessFlags &operator^=(const SyncStageAccessFlags &rhs) {
+        for (size_t i = 0; i < kWordCount; ++i) words[i] ^= rhs.words[i];
+        return *this;
+    }
+    friend constexpr SyncStageAccessFlags operator&(SyncStageAccessFlags lhs, const SyncStageAccessFlags &rhs) { return lhs &= rhs; }
+    friend constexpr SyncStageAccessFlags operator|(SyncStageAccessFlags lhs, const SyncStageAccessFlags &rhs) { return lhs |= rhs; }
+    friend constexpr SyncStageAccessFlags operator^(SyncStageAccessFlags lhs, const SyncStageAccessFlags &rhs) { return lhs ^= rhs; }
+    friend constexpr bool operator==(const SyncStageAccessFlags &lhs, const SyncStageAccessFlags &rhs) {
+        uint64_t diff = 0;
+        for (size_t i = 0; i < kWordCount; ++i) diff |= lhs.words[i] ^ rhs.words[i];
+        return diff == 0;
+    }
+    friend constexpr bool operator!=(const SyncStageAccessFlags &lhs, const SyncStageAccessFlags &rhs) { return !(lhs == rhs); }
+};
+'''
+            output += f'static_assert({self.stageAccessCombo[-1]["stage_access"]} < SyncStageAccessFlags::kBitCount);\n\n'
             output += '// Unique bit for each stage/access combination\n'
             for access in self.stageAccessCombo:
                 if access['stage_access_bit'] is not None:
-                    output += 'static const SyncStageAccessFlags {} = (SyncStageAccessFlags(1) << {});\n'.format(access['stage_access_bit'], access['stage_access'])
+                    output += 'static constexpr SyncStageAccessFlags {} = SyncStageAccessFlags::FromIndex({});\n'.format(access['stage_access_bit'], access['stage_access'])
         return output
 
 
@@ -426,13 +556,13 @@ class SyncValidationOutputGenerator(OutputGenerator):
                     write_list.append(e['stage_access_bit'])
 
             output += '// Constants defining the mask of all read and write stage_access states\n'
-            output += 'static const SyncStageAccessFlags syncStageAccessReadMask = ( //  Mask of all read StageAccess bits\n'
+            output += 'static constexpr SyncStageAccessFlags syncStageAccessReadMask = ( //  Mask of all read StageAccess bits\n'
             for bit in read_list:
                 output += '    {}{}\n'.format(bit, ' |' if bit != read_list[-1] else '')
             output += ');'
             output += '\n\n'
 
-            output += 'static const SyncStageAccessFlags syncStageAccessWriteMask = ( //  Mask of all write StageAccess bits\n'
+            output += 'static constexpr SyncStageAccessFlags syncStageAccessWriteMask = ( //  Mask of all write StageAccess bits\n'
             for bit in write_list:
                 output += '    {}{}\n'.format(bit, ' |' if bit != write_list[-1] else '')
             output += ');\n'
@@ -469,195 +599,154 @@ class SyncValidationOutputGenerator(OutputGenerator):
         return output
 
 
+    # Tables indexed by the bit position of a flag, so a mask is expanded by walking its set bits
+    # and indexing directly instead of searching a map for each bit.
+    # bit_names is a list of (bitpos, name) and values maps a name to the list of values OR'ed together
+    # check is an optional constant expression on the table (named variable) that is static_assert'ed
+    def bitIndexedTable(self, value_type, func_name, table_size, bit_names, values, empty_value, check=None):
+        array_type = f'std::array<{value_type}, {table_size}>'
+        names_by_bit = {}
+        for bitpos, name in bit_names:
+            if bitpos >= table_size:
+                self.logMsg('error', f'{name} has bit position {bitpos}, which does not fit in {func_name}() table of size {table_size}')
+            names_by_bit[bitpos] = name
+        for name in [x for x in values if x not in names_by_bit.values()]:
+            self.logMsg('error', f'{name} has no bit position, so its values would be left out of the {func_name}() table')
+        used_bits =[bitpos for bitpos, name in names_by_bit.items() if name in values]
+
+        output = f'const {array_type}& {func_name}() {{\n'
+        output += f'    static constexpr {array_type} variable = {{{{\n'
+        # Trailing unused bits are value initialized
+        for bitpos in range(max(used_bits) + 1 if used_bits else 0):
+            name = names_by_bit.get(bitpos)
+            output += f'    // {bitpos}: {name if name is not None else "unused"}\n'
+            if name in values:
+                output += f'    (\n        {separator.join(values[name])}\n    ),\n'
+            else:
+                output += f'    {empty_value},\n'
+        output += '    }};\n'
+        if check is not None:
+            output += f'    static_assert({check});\n'
+        output += '    return variable;\n'
+        output += '}\n\n'
+        return output
+
     def stageAccessMaskByStage(self):
-        map_type = 'const std::map<VkPipelineStageFlags2, SyncStageAccessFlags>'
+        array_type = f'const std::array<SyncStageAccessFlags, {flagBitCount}>'
         func_name = 'syncStageAccessMaskByStageBit'
         output = ''
         if self.headerFile:
-            output += '// Bit order mask of stage_access bit for each stage\n'
-            output += f'{map_type}& {func_name}();\n'
+            output += '// Bit order mask of stage_access bit for each stage, indexed by the stage bit position\n'
+            output += f'{array_type}& {func_name}();\n'
         elif self.sourceFile:
-            output += f'{map_type}& {func_name}() {{\n'
-            output += f'    static {map_type} variable = {{\n'
             stage_to_stageAccess = {}
             for stageAccess_info in self.stageAccessCombo:
                 stage = stageAccess_info['stage']
                 if stage == 'VK_PIPELINE_STAGE_2_NONE_KHR': continue
                 stageAccess_bit = stageAccess_info['stage_access_bit']
                 stage_to_stageAccess[stage] = stage_to_stageAccess.get(stage, []) + [stageAccess_bit]
-            stages_in_bit_order = [e['name'] for e in self.enumsInBitOrder['VkPipelineStageFlagBits2']]
-            for stage in stages_in_bit_order:
-                if stage in stage_to_stageAccess:
-                    output += f'    {{ {stage}, (\n        {separator.join(stage_to_stageAccess[stage])}\n    )}},\n'
-            output += '    };\n'
-            output += '    return variable;\n'
-            output += '}\n\n'
+            stage_bits = [(e['bitpos'], e['name']) for e in self.enumsInBitOrder['VkPipelineStageFlagBits2']]
+            output += self.bitIndexedTable('SyncStageAccessFlags', func_name, flagBitCount, stage_bits, stage_to_stageAccess,
+                                           'SyncStageAccessFlags(0)')
         return output
 
 
     def stageAccessMaskByAccess(self):
-        map_type = 'const std::map<VkAccessFlags2, SyncStageAccessFlags>'
+        array_type = f'const std::array<SyncStageAccessFlags, {flagBitCount}>'
         func_name = 'syncStageAccessMaskByAccessBit'
         output = ''
         if self.headerFile:
-            output += '// Bit order mask of stage_access bit for each access\n'
-            output += f'{map_type}& {func_name}();\n'
+            output += '// Bit order mask of stage_access bit for each access, indexed by the access bit position\n'
+            output += f'{array_type}& {func_name}();\n'
         elif self.sourceFile:
-            output += f'{map_type}& {func_name}() {{\n'
-            output += f'    static {map_type} variable = {{\n'
             access_to_stageAccess = {}
             for stageAccess_info in self.stageAccessCombo:
                 access = stageAccess_info['access']
                 if access == 'VK_ACCESS_2_FLAG_NONE_KHR': continue
                 stageAccess_bit = stageAccess_info['stage_access_bit']
                 access_to_stageAccess[access] = access_to_stageAccess.get(access, []) + [stageAccess_bit]
-            accesses_in_bit_order = [e['name'] for e in self.enumsInBitOrder['VkAccessFlagBits2']]
-            for access in accesses_in_bit_order:
-                if access in access_to_stageAccess:
-                    output += f'    {{ {access}, (\n        {separator.join(access_to_stageAccess[access])}\n    )}},\n'
-            output += '    { VK_ACCESS_2_MEMORY_READ_BIT, (\n        syncStageAccessReadMask\n    )},\n'
-            output += '    { VK_ACCESS_2_MEMORY_WRITE_BIT, (\n        syncStageAccessWriteMask\n    )},\n'
-            output += '    };\n'
-            output += '    return variable;\n'
-            output += '}\n\n'
+            access_to_stageAccess['VK_ACCESS_2_MEMORY_READ_BIT'] = ['syncStageAccessReadMask']
+            access_to_stageAccess['VK_ACCESS_2_MEMORY_WRITE_BIT'] = ['syncStageAccessWriteMask']
+            access_bits = [(e['bitpos'], e['name']) for e in self.enumsInBitOrder['VkAccessFlagBits2']]
+            output += self.bitIndexedTable('SyncStageAccessFlags', func_name, flagBitCount, access_bits, access_to_stageAccess,
+                                           'SyncStageAccessFlags(0)')
         return output
 
 
     def accessMaskByStage(self):
-        map_type = 'const std::map<VkPipelineStageFlags2, VkAccessFlags2>'
+        array_type = f'const std::array<VkAccessFlags2, {flagBitCount}>'
         func_name = 'syncDirectStageToAccessMask'
         output = ''
         if self.headerFile:
-            output += '// Direct VkPipelineStageFlags to valid VkAccessFlags lookup table\n'
-            output += f'{map_type}& {func_name}();\n'
+            output += '// Direct VkPipelineStageFlags to valid VkAccessFlags lookup table, indexed by the stage bit position\n'
+            output += f'{array_type}& {func_name}();\n'
         elif self.sourceFile:
-            output += f'{map_type}& {func_name}() {{\n'
-            output += f'    static {map_type} variable = {{\n'
             stage_to_access = {}
             for stageAccess_info in self.stageAccessCombo:
                 stage = stageAccess_info['stage']
                 if stage == 'VK_PIPELINE_STAGE_2_NONE_KHR': continue
                 stage_to_access[stage] = stage_to_access.get(stage, []) + [stageAccess_info['access']]
-            stages_in_bit_order = [e['name'] for e in self.enumsInBitOrder['VkPipelineStageFlagBits2']]
-            for stage in stages_in_bit_order:
-                if stage in stage_to_access:
-                    output += f'    {{ {stage}, (\n        {separator.join(stage_to_access[stage])}\n    )}},\n'
-            output += '    };\n'
-            output += '    return variable;\n'
-            output += '}\n\n'
+            stage_bits = [(e['bitpos'], e['name']) for e in self.enumsInBitOrder['VkPipelineStageFlagBits2']]
+            output += self.bitIndexedTable('VkAccessFlags2', func_name, flagBitCount, stage_bits, stage_to_access, '0')
         return output
 
 
     def allCommandStagesByQueueFlags(self):
-        map_type = 'const std::map<VkQueueFlagBits, VkPipelineStageFlags2>'
+        array_type = f'const std::array<VkPipelineStageFlags2, {queueFlagBitCount}>'
         func_name = 'syncAllCommandStagesByQueueFlags'
         output = ''
         if self.headerFile:
-            output += '// Pipeline stages corresponding to VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT for each VkQueueFlagBits\n'
-            output += f'{map_type}& {func_name}();\n'
+            output += '// Pipeline stages corresponding to VK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT for each VkQueueFlagBits,\n'
+            output += '// indexed by the queue flag bit position\n'
+            output += f'{array_type}& {func_name}();\n'
         elif self.sourceFile:
-            output += f'{map_type}& {func_name}() {{\n'
-            output += f'    static {map_type} variable = {{\n'
-            queue_caps = []
             queue_cap_to_stages = {}
             for queue_name, stages in self.queueToStages.items():
                 if queue_name == 'sparse_binding': continue
                 cap_flag = queueTypeToQueueFlags[queue_name]
-                queue_caps.append(cap_flag)
                 queue_cap_to_stages[cap_flag] = []
                 for stage in self.stages:
                     if stage in stages and stage not in multiStages and stage != 'VK_PIPELINE_STAGE_2_NONE':
                         queue_cap_to_stages[cap_flag].append(stage)
-            queue_caps.sort()
-            for cap_flag in queue_caps:
-                output += f'    {{ {cap_flag}, (\n        {separator.join(queue_cap_to_stages[cap_flag])}\n    )}},\n'
-            output += '    };\n'
-            output += '    return variable;\n'
-            output += '}\n\n'
-        return output
-
-
-    def logicallyEarlierStages(self):
-        map_type = 'const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>'
-        func_name = 'syncLogicallyEarlierStages'
-        output = ''
-        if self.headerFile:
-            output += '// Masks of logically earlier stage flags for a given stage flag\n'
-            output += f'{map_type}& {func_name}();\n'
-        elif self.sourceFile:
-            output += f'{map_type}& {func_name}() {{\n'
-            output += f'    static {map_type} variable = {{\n'
-
-            earlier_stages = {}
-            earlier_stages['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT'] = set(['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT'])
-            earlier_stages['VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'] = set(['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT', 'VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'])
-
-            for stages in self.pipelineStagesOrdered.values():
-                for i in range(len(stages)):
-                    stage_order = stages[i]
-                    stage = stage_order['stage']
-                    if stage == 'VK_PIPELINE_STAGE_2_HOST_BIT':
-                        continue
-                    if stage not in earlier_stages:
-                        earlier_stages[stage] = set(['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT'])
-                        earlier_stages['VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'].update([stage])
-
-                    if not stage_order['ordered']:
-                        earlier_stages[stage] = set(['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT'])
-                    else:
-                        earlier_stages[stage].update([s['stage'] for s in stages[:i]])
-
-            earlier_stages = { key:SortSetBasedOnOrder(values, self.logicallyOrderedStages) for key, values in earlier_stages.items() }
-
-            for stage in self.stages:
-                if stage in earlier_stages and len(earlier_stages[stage]) > 0:
-                    output += f'    {{ {stage}, (\n        {separator.join(earlier_stages[stage])}\n    )}},\n'
-
-            output += '    };\n'
-            output += '    return variable;\n'
-            output += '}\n\n'
+            queue_bits = [(bitpos, name) for name, bitpos in self.queueFlagBits.items()]
+            output += self.bitIndexedTable('VkPipelineStageFlags2', func_name, queueFlagBitCount, queue_bits, queue_cap_to_stages, '0')
         return output
 
 
-    def logicallyLaterStages(self):
-        map_type = 'const std::map<VkPipelineStageFlags2, VkPipelineStageFlags2>'
-        func_name = 'syncLogicallyLaterStages'
+    def logicallyRelatedStages(self, earlier):
+        array_type = f'const std::array<VkPipelineStageFlags2, {flagBitCount}>'
+        func_name = 'syncLogicallyEarlierStages' if earlier else 'syncLogicallyLaterStages'
         output = ''
         if self.headerFile:
-            output += '// Masks of logically later stage flags for a given stage flag\n'
-            output += f'{map_type}& {func_name}();\n'
+            output += f'// Masks of logically {"earlier" if earlier else "later"} stage flags for a given stage flag, indexed by the stage bit position\n'
+            output += f'{array_type}& {func_name}();\n'
         elif self.sourceFile:
-            output += f'{map_type}& {func_name}() {{\n'
-            output += f'    static {map_type} variable = {{\n'
-
-            later_stages = {}
-            later_stages['VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'] = set(['VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'])
-            later_stages['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT'] = set(['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT', 'VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'])
-
-            for stages in self.pipelineStagesOrdered.values():
-                for i in range(len(stages)):
-                    stage_order = stages[i]
-                    stage = stage_order['stage']
-                    if stage == 'VK_PIPELINE_STAGE_2_HOST_BIT':
-                        continue
-                    if stage not in later_stages:
-                        later_stages[stage] = set(['VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'])
-                        later_stages['VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT'].update([stage])
-
-                    if not stage_order['ordered']:
-                        later_stages[stage] = set(['VK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT'])
-                    else:
-                        later_stages[stage].update([s['stage'] for s in stages[i+1:] if s['ordered']])
-
-            later_stages = { key:SortSetBasedOnOrder(values, self.logicallyOrderedStages) for key, values in later_stages.items() }
-
+            bit = {e['name']: e['mask'] for e in self.enumsInBitOrder[syncEnumStageType]}
+            masks = self.getRelatedStageMasks(earlier)
+            related_stages = {}
             for stage in self.stages:
-                if stage in later_stages and len(later_stages[stage]) > 0:
-                    output += f'    {{ {stage}, (\n        {separator.join(later_stages[stage])}\n    )}},\n'
+                if stage in masks:
+                    stage_list = [s for s in self.logicallyOrderedStages if masks[stage] & bit[s]]
+                    if len(stage_list) > 0:
+                        related_stages[stage] = stage_list
+            stage_bits = [(e['bitpos'], e['name']) for e in self.enumsInBitOrder[syncEnumStageType]]
+            if earlier:
+                output += '// RelatedPipelineStages() only ORs the masks of the stages it is given, so the mask of a stage\n'
+                output += '// must already hold every stage related to the stages in it\n'
+                output += f'static constexpr bool IsTransitivelyClosed({array_type}& related_by_stage) {{\n'
+                output += '''    for (size_t stage = 0; stage < related_by_stage.size(); ++stage) {
+        for (size_t related = 0; related < related_by_stage.size(); ++related) {
+            if (((related_by_stage[stage] >> related) & 1) && (related_by_stage[related] & ~related_by_stage[stage])) {
+                return false;
+            }
+        }
+    }
+    return true;
+}
 
-            output += '    };\n'
-            output += '    return variable;\n'
-            output += '}\n\n'
+'''
+            output += self.bitIndexedTable('VkPipelineStageFlags2', func_name, flagBitCount, stage_bits, related_stages, '0',
+                                           'IsTransitivelyClosed(variable)')
         return output
 
 
@@ -0,0 +1,93 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2023 Valve Corporation
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import json
+import hashlib
+from generators.generator_utils import atomicFileReplace, removeStaleFiles
+
+# Several generators need to know which VUIDs exist in validusage.json.
+# The file is multiple megabytes, so it is only parsed once per process and the
+# resulting set is shared between all generators.
+# If a cache directory is set, the VUIDs are also stored there as a sorted
+# string table (one VUID per line) so other processes don't have to parse the JSON.
+
+vuidCacheDirectory = None
+def SetVuidCacheDirectory(directory):
+    global vuidCacheDirectory
+    vuidCacheDirectory = directory
+
+# validusage.json path -> frozenset of VUIDs
+validVuids = {}
+
+#
+# Walk the JSON-derived dict and find all "vuid" key values
+def ExtractVUIDs(vuid_dict):
+    if hasattr(vuid_dict, 'items'):
+        for key, value in vuid_dict.items():
+            if key == "vuid":
+                yield value
+            elif isinstance(value, dict):
+                for vuid in ExtractVUIDs(value):
+                    yield vuid
+            elif isinstance (value, list):
+                for listValue in value:
+                    for vuid in ExtractVUIDs(listValue):
+                        yield vuid
+
+def loadVuidTable(tableFile: str) -> frozenset:
+    if not os.path.isfile(tableFile):
+        return None
+    with open(tableFile, 'r', encoding='utf-8') as f:
+        return frozenset(f.read().splitlines())
+
+def saveVuidTable(tableFile: str, vuids: frozenset):
+    # Tables for any other version of validusage.json are out of date now
+    removeStaleFiles(os.path.join(os.path.dirname(tableFile), 'vuids_*.txt'), tableFile)
+    with atomicFileReplace(tableFile) as tempFile, open(tempFile, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(sorted(vuids)))
+
+# Returns the set of all VUIDs found in the validusage.json in the given directory
+def GetValidVuids(validUsagePath: str) -> frozenset:
+    filename = os.path.abspath(os.path.join(validUsagePath, 'validusage.json'))
+    if filename in validVuids:
+        return validVuids[filename]
+
+    if not os.path.isfile(filename):
+        print(f'Error: Could not find, or error loading {filename}')
+        sys.exit(1)
+
+    vuids = None
+    tableFile = None
+    with open(filename, 'rb') as f:
+        content = f.read()
+    if vuidCacheDirectory is not None:
+        tableFile = os.path.join(vuidCacheDirectory, f'vuids_{hashlib.sha256(content).hexdigest()}.txt')
+        vuids = loadVuidTable(tableFile)
+
+    if vuids is None:
+        vuid_dict = json.loads(content)
+        if len(vuid_dict) == 0:
+            print(f'Error: Failed to load {filename}')
+            sys.exit(1)
+        vuids = frozenset(ExtractVUIDs(vuid_dict))
+        if tableFile is not None:
+            saveVuidTable(tableFile, vuids)
+
+    validVuids[filename] = vuids
+    return vuids
@@ -15,12 +15,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import IntFlag, Enum, auto
 # Use the List and Dict types because support for default dict/list is
 # not supported until Python 3.9+
 from typing import List, Dict
 
+# Same as @dataclass(slots=True) which is not supported until Python 3.10
+# There are tens of thousands of these objects, without a __dict__ per object they are
+# much smaller and faster to access
+def slots(cls):
+    names = tuple(f.name for f in fields(cls))
+    classDict = {key: value for key, value in cls.__dict__.items() if key not in names + ('__dict__', '__weakref__')}
+    classDict['__slots__'] = names
+    slotsClass = type(cls)(cls.__name__, cls.__bases__, classDict)
+    slotsClass.__qualname__ = cls.__qualname__
+
+    # pickle (used for the cache) can't restore frozen objects with setattr
+    def getState(self):
+        return tuple(getattr(self, name) for name in names)
+    def setState(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+    slotsClass.__getstate__ = getState
+    slotsClass.__setstate__ = setState
+    return slotsClass
+
+@slots
 @dataclass(frozen=True)
 class Extension:
     """<extension>"""
@@ -41,12 +62,14 @@ class Extension:
     obsoletedBy: str
     specialUse: List[str]
 
+@slots
 @dataclass(frozen=True)
 class Version:
     """<feature> which represents a version"""
     name: str # VK_VERSION_1_0
     number: str # 1.0
 
+@slots
 @dataclass(frozen=True)
 class Handle:
     """<type> which represents a dispatch handle"""
@@ -58,6 +81,7 @@ class Handle:
     device: bool
     dispatchable: bool
 
+@slots
 @dataclass(frozen=True)
 class CommandParam:
     """<command/param>"""
@@ -85,6 +109,7 @@ class CommandScope(Enum):
     OUTSIDE = auto()
     BOTH = auto()
 
+@slots
 @dataclass(frozen=True)
 class Command:
     """<command>"""
@@ -124,15 +149,18 @@ class Command:
     #   (const VkInstanceCreateInfo* pCreateInfo, const VkAllocationCallbacks* pAllocator, VkInstance* pInstance);'
     cFunctionPointer: str
 
+@slots
 @dataclass(frozen=True)
 class EnumField:
     """<enum> of type enum"""
     name: str
+    value: int
     negative: bool # True if negative values are allowed (ex. VkResult)
     # some fields are enabled from 2 extensions (ex. VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_PUSH_DESCRIPTORS_KHR)
     extensions: List[str] # None if part of 1.0 core
     protect: str # ex. 'VK_ENABLE_BETA_EXTENSIONS'
 
+@slots
 @dataclass(frozen=True)
 class Enum:
     """<enums> of type enum"""
@@ -141,6 +169,7 @@ class Enum:
     protect: str  # ex. 'VK_ENABLE_BETA_EXTENSIONS'
     fields: List[EnumField]
 
+@slots
 @dataclass(frozen=True)
 class Flag:
     """<enum> of type bitmask"""
@@ -152,6 +181,7 @@ class Flag:
     extensions: List[str] # None if part of 1.0 core
     protect: str   # ex. 'VK_ENABLE_BETA_EXTENSIONS'
 
+@slots
 @dataclass(frozen=True)
 class Bitmask:
     """<enums> of type bitmask"""
@@ -161,6 +191,7 @@ class Bitmask:
     protect: str  # ex. 'VK_ENABLE_BETA_EXTENSIONS'
     flags: List[Flag]
 
+@slots
 @dataclass(frozen=True)
 class Member:
     """<member>"""
@@ -179,6 +210,7 @@ class Member:
     #   - VkStructureType sType
     cDeclaration: str
 
+@slots
 @dataclass(frozen=True)
 class Struct:
     """<type category="struct"> or <type category="union">"""
@@ -191,6 +223,7 @@ class Struct:
     allowDuplicate: bool
     members: List[Member]
 
+@slots
 @dataclass(frozen=True)
 class FormatComponent:
     """<format/component>"""
@@ -199,6 +232,7 @@ class FormatComponent:
     numericFormat: str # 'UNORM', 'SINT', etc
     planeIndex: int # None if no planeIndex in format
 
+@slots
 @dataclass(frozen=True)
 class FormatPlane:
     """<format/plane>"""
@@ -207,6 +241,7 @@ class FormatPlane:
     heightDivisor: int
     compatible: str
 
+@slots
 @dataclass(frozen=True)
 class Format:
     """<format>"""
@@ -222,18 +257,21 @@ class Format:
     planes: List[FormatPlane]  # <format/plane>
     spirvImageFormat: str
 
+@slots
 @dataclass(frozen=True)
 class SyncSupport:
     """<syncsupport>"""
     queues: List[str]
     stage: List[str]
 
+@slots
 @dataclass(frozen=True)
 class SyncEquivalent:
     """<syncequivalent>"""
     stage: List[str]
     access: List[str]
 
+@slots
 @dataclass(frozen=True)
 class SyncStage:
     """<syncstage>"""
@@ -241,6 +279,7 @@ class SyncStage:
     support: SyncSupport
     equivalent: SyncEquivalent
 
+@slots
 @dataclass(frozen=True)
 class SyncAccess:
     """<syncaccess>"""
@@ -248,6 +287,7 @@ class SyncAccess:
     support: SyncSupport
     equivalent: SyncEquivalent
 
+@slots
 @dataclass(frozen=True)
 class SyncPipelineStage:
     """<syncpipelinestage>"""
@@ -256,6 +296,7 @@ class SyncPipelineStage:
     after: str
     value: str
 
+@slots
 @dataclass(frozen=True)
 class SyncPipeline:
     """<syncpipeline>"""
@@ -263,6 +304,7 @@ class SyncPipeline:
     depends: List[str]
     stages: List[SyncPipelineStage]
 
+@slots
 @dataclass(frozen=True)
 class SpirvEnables:
     """What is needed to enable the SPIR-V element"""
@@ -275,6 +317,7 @@ class SpirvEnables:
     member: str
     value: str
 
+@slots
 @dataclass(frozen=True)
 class Spirv:
     """<spirvextension> and <spirvcapability>"""
@@ -308,3 +351,14 @@ class VulkanObject():
     platforms: Dict[str, str]        = field(default_factory=dict, init=False)
     # # List of all vendor Sufix names (ex. 'KHR', 'EXT', etc. )
     vendorTags: List[str]            = field(default_factory=list, init=False)
+
+    # Reverse indexes, filled in by buildIndexes() once everything above is parsed
+    # so generators don't need to rescan every format to find related items
+    # ex. [ '32-bit' : [ Format(VK_FORMAT_R8G8B8A8_UNORM), ... ] ]
+    formatsByClass:    Dict[str, List[Format]]    = field(default_factory=dict, init=False)
+
+    # Safe to call more than once, each call rebuilds the indexes from scratch
+    def buildIndexes(self):
+        self.formatsByClass = {}
+        for format in self.formats.values():
+            self.formatsByClass.setdefault(format.className, []).append(format)
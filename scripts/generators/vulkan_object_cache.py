@@ -0,0 +1,58 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2023 Valve Corporation
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import hashlib
+from generators.vulkan_object import VulkanObject
+from generators.generator_utils import loadPickle, savePickle, removeStaleFiles
+
+# Bump this when the format of the cache file changes
+CACHE_VERSION = 1
+
+# The VulkanObject only depends on the XML and the scripts that turn it into the object
+# (the registry scripts and base_generator.py), if any of these change the cache is invalid
+def getCacheKey(registryFile: str, registryScriptsDirectory: str, apiName: str) -> str:
+    generatorsDirectory = os.path.dirname(os.path.abspath(__file__))
+    sources = [registryFile,
+               os.path.join(registryScriptsDirectory, 'reg.py'),
+               os.path.join(registryScriptsDirectory, 'generator.py'),
+               os.path.join(generatorsDirectory, 'base_generator.py'),
+               os.path.join(generatorsDirectory, 'vulkan_object.py')]
+
+    sha = hashlib.sha256()
+    sha.update(f'{CACHE_VERSION}:{apiName}'.encode('utf-8'))
+    for source in sources:
+        if os.path.isfile(source):
+            with open(source, 'rb') as f:
+                sha.update(f.read())
+    return sha.hexdigest()
+
+def getCacheFile(cacheDirectory: str, key: str) -> str:
+    return os.path.join(cacheDirectory, f'vulkan_object_{key}.pickle')
+
+# Returns None if there is no valid cached VulkanObject for the key
+def loadVulkanObject(cacheDirectory: str, key: str) -> VulkanObject:
+    data = loadPickle(getCacheFile(cacheDirectory, key))
+    if data is None or data.get('version') != CACHE_VERSION or data.get('key') != key:
+        return None
+    return data['vk']
+
+def saveVulkanObject(cacheDirectory: str, key: str, vk: VulkanObject):
+    cacheFile = getCacheFile(cacheDirectory, key)
+    # Entries for any other key are out of date now
+    removeStaleFiles(getCacheFile(cacheDirectory, '*'), cacheFile)
+    savePickle(cacheFile, {'version': CACHE_VERSION, 'key': key, 'vk': vk})
@@ -15,7 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import argparse, pdb, sys, time, os
+import argparse, pdb, sys, time, os, traceback
 
 # Simple timer functions
 startTime = None
@@ -58,8 +58,10 @@ def makeGenOpts(args):
     # Output target directory
     from generators.base_generator import SetOutputDirectory
     from generators.base_generator import SetTargetApiName
+    from generators.vuid_index import SetVuidCacheDirectory
     SetOutputDirectory(args.directory)
     SetTargetApiName(args.api)
+    SetVuidCacheDirectory(args.cache)
 
     # ValidationLayer Generators
     # Options for thread safety header code-generation
@@ -405,18 +407,18 @@ def makeGenOpts(args):
 # This is encapsulated in a function so it can be profiled and/or timed.
 # The args parameter is an parsed argument object containing the following
 # fields that are used:
-#   target - target to generate
 #   directory - directory to generate it in
 #   interfaces
-def genTarget(args):
+# The target parameter is the name of the target to generate
+def genTarget(args, target):
     global genOpts
 
     # Create generator options with parameters specified on command line
     makeGenOpts(args)
 
-    if (args.target in genOpts.keys()):
-        createGenerator = genOpts[args.target][0]
-        options = genOpts[args.target][1]
+    if (target in genOpts.keys()):
+        createGenerator = genOpts[target][0]
+        options = genOpts[target][1]
 
         if not args.quiet:
             write('* Building', options.filename, file=sys.stderr)
@@ -429,8 +431,47 @@ def genTarget(args):
         return (gen, options)
     else:
         write('No generator options for unknown target:',
-              args.target, file=sys.stderr)
-        return none
+              target, file=sys.stderr)
+        return None
+
+# Point an already loaded registry at a new generator and its options.
+# Every target uses the same API and merge settings, so the ElementTree
+# parsed for the first target can be shared by all of them.
+def setRegistryTarget(reg, gen, options):
+    reg.genOpts = options
+    reg.genOpts.registry = reg
+    reg.setGenerator(gen)
+
+# Create the registry object with the specified generator and generator
+# options and load the registry XML into it.
+# The options are set before XML loading as they may affect it.
+def loadRegistry(args, gen, options):
+    reg = Registry(gen, options)
+
+    # Parse the specified registry XML into an ElementTree object
+    startTimer(args.time)
+    with profiler.phase('parse'):
+        tree = etree.parse(args.registry)
+    endTimer(args.time, '* Time to make ElementTree =')
+
+    # Filter out non-Vulkan extensions
+    if args.api == 'vulkan':
+        [exts.remove(e) for exts in tree.findall('extensions') for e in exts.findall('extension') if (sup := e.get('supported')) is not None and options.apiname not in sup.split(',')]
+
+    # Load the XML tree into the registry object
+    startTimer(args.time)
+    with profiler.phase('loadElementTree'):
+        reg.loadElementTree(tree)
+    endTimer(args.time, '* Time to parse ElementTree =')
+
+    if (args.validate):
+        reg.validateGroups()
+
+    if (args.dump):
+        write('* Dumping registry to regdump.txt', file=sys.stderr)
+        reg.dumpReg(filehandle = open('regdump.txt', 'w', encoding='utf-8'))
+
+    return reg
 
 # -extension name
 # For both, "name" may be a single name, or a space-separated list
@@ -463,13 +504,22 @@ if __name__ == '__main__':
                         help='Use specified grammar file instead of spirv.core.grammar.json')
     parser.add_argument('-time', action='store_true',
                         help='Enable timing')
+    parser.add_argument('-profile', action='store',
+                        default=None,
+                        help='Write wall/CPU time, peak RSS and call counts of each phase and generator callback to the specified JSON file')
+    parser.add_argument('-cprofile', action='store',
+                        default=None,
+                        help='Write cProfile statistics of each target to <target>.pstats in the specified directory')
+    parser.add_argument('-cache', action='store',
+                        default=None,
+                        help='Cache the parsed VulkanObject in the specified directory')
     parser.add_argument('-validate', action='store_true',
                         help='Enable XML group validation')
     parser.add_argument('-o', action='store', dest='directory',
                         default='.',
                         help='Create target and related files in specified directory')
-    parser.add_argument('target', metavar='target', nargs='?',
-                        help='Specify target')
+    parser.add_argument('target', metavar='target', nargs='*',
+                        help='Specify target(s), multiple targets share a single load of the registry')
     parser.add_argument('-quiet', action='store_true', default=True,
                         help='Suppress script output during normal execution.')
     parser.add_argument('-verbose', action='store_false', dest='quiet', default=True,
@@ -494,7 +544,9 @@ if __name__ == '__main__':
     from cgenerator import CGeneratorOptions, COutputGenerator
 
     # ValidationLayer Generator Modifications
-    from generators.base_generator import BaseGeneratorOptions
+    from generators.base_generator import BaseGeneratorOptions, BaseGenerator
+    from generators.vulkan_object_cache import getCacheKey, loadVulkanObject, saveVulkanObject
+    from generators.generator_profiler import GeneratorProfiler
 
     from generators.thread_safety_generator import ThreadOutputGenerator
     from generators.parameter_validation_generator import ParameterValidationOutputGenerator
@@ -528,39 +580,67 @@ if __name__ == '__main__':
     else:
         diag = None
 
-    # Create the API generator & generator options
-    (gen, options) = genTarget(args)
-
-    # Create the registry object with the specified generator and generator
-    # options. The options are set before XML loading as they may affect it.
-    reg = Registry(gen, options)
-
-    # Parse the specified registry XML into an ElementTree object
-    startTimer(args.time)
-    tree = etree.parse(args.registry)
-    endTimer(args.time, '* Time to make ElementTree =')
+    if not args.target:
+        write('No target specified', file=sys.stderr)
+        sys.exit(1)
 
-    # Filter out non-Vulkan extensions
-    if args.api == 'vulkan':
-        [exts.remove(e) for exts in tree.findall('extensions') for e in exts.findall('extension') if (sup := e.get('supported')) is not None and options.apiname not in sup.split(',')]
+    profiler = GeneratorProfiler(args.profile is not None, args.cprofile)
 
-    # Load the XML tree into the registry object
-    startTimer(args.time)
-    reg.loadElementTree(tree)
-    endTimer(args.time, '* Time to parse ElementTree =')
-
-    if (args.validate):
-        reg.validateGroups()
-
-    if (args.dump):
-        write('* Dumping registry to regdump.txt', file=sys.stderr)
-        reg.dumpReg(filehandle = open('regdump.txt', 'w', encoding='utf-8'))
-
-    # Finally, use the output generator to create the requested target
-    if (args.debug):
-        pdb.run('reg.apiGen()')
-    else:
-        startTimer(args.time)
-        reg.apiGen()
-        endTimer(args.time, '* Time to generate ' + options.filename + ' =')
-        genTarget(args)
+    # Create the API generator & generator options
+    targets = [genTarget(args, target) for target in args.target]
+    if None in targets:
+        sys.exit(1)
+
+    # Targets built on BaseGenerator only need the VulkanObject, which can be
+    # loaded from the cache, or reused from the first target that built it
+    cacheKey = None
+    cachedVk = None
+    if args.cache is not None:
+        cacheKey = getCacheKey(args.registry, registry_headers_path, args.api)
+        with profiler.phase('loadCache'):
+            cachedVk = loadVulkanObject(args.cache, cacheKey)
+
+    # The registry is only loaded if a target still needs to run reg.apiGen()
+    reg = None
+
+    # Finally, use the output generators to create the requested targets
+    # A failing target is reported and the remaining targets still run
+    failedTargets = []
+    for (gen, options) in targets:
+        if cachedVk is not None and isinstance(gen, BaseGenerator):
+            startTimer(args.time)
+            try:
+                with profiler.target(options.filename, gen):
+                    gen.generateFromVulkanObject(options, cachedVk)
+            except Exception:
+                write('ERROR: Failed to generate', options.filename, file=sys.stderr)
+                traceback.print_exc()
+                failedTargets.append(options.filename)
+            endTimer(args.time, '* Time to generate ' + options.filename + ' from VulkanObject =')
+            continue
+
+        if reg is None:
+            reg = loadRegistry(args, gen, options)
+        setRegistryTarget(reg, gen, options)
+        if (args.debug):
+            pdb.run('reg.apiGen()')
+        else:
+            startTimer(args.time)
+            try:
+                with profiler.target(options.filename, gen):
+                    reg.apiGen()
+                if isinstance(gen, BaseGenerator):
+                    cachedVk = gen.vk
+                    if args.cache is not None:
+                        saveVulkanObject(args.cache, cacheKey, cachedVk)
+            except Exception:
+                write('ERROR: Failed to generate', options.filename, file=sys.stderr)
+                traceback.print_exc()
+                failedTargets.append(options.filename)
+            endTimer(args.time, '* Time to generate ' + options.filename + ' =')
+
+    if args.profile:
+        profiler.write(args.profile)
+
+    if failedTargets:
+        sys.exit(1)
@@ -17,22 +17,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import argparse
+import concurrent.futures
 import csv
 import glob
+import gzip
+import hashlib
 import html
+import itertools
 import json
+import mmap
 import operator
 import os
 import re
+import sqlite3
 import sys
 import unicodedata
 import subprocess
 from collections import defaultdict
 from collections import OrderedDict
 from dataclasses import dataclass
+from generators.generator_utils import atomicFileReplace, loadPickle, savePickle
 
 verbose_mode = False
-vuid_prefixes = ['VUID-', 'UNASSIGNED-', 'kVUID_']
 
 # Hard-coded flags that could be command line args, if we decide that's useful
 ignore_unassigned = True # These are not found in layer code unless they appear explicitly (most don't), so produce false positives
@@ -42,6 +48,39 @@ ignore_unassigned = True # These are not found in layer code unless they appear
 spirvtools_source_files = ["source/val/validation_state.cpp"]
 spirvtools_test_files = ["test/val/*.cpp"]
 
+# Bump this when the format of the scan cache file changes
+SCAN_CACHE_VERSION = 2
+
+# Bump this when the tables written by -db change, the query command only reads a database with the same version
+DB_VERSION = 1
+db_schema = """
+CREATE TABLE info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE vuids (vuid TEXT NOT NULL, type TEXT NOT NULL, api TEXT NOT NULL, ext TEXT NOT NULL, text TEXT NOT NULL);
+CREATE INDEX vuids_vuid ON vuids (vuid);
+CREATE INDEX vuids_api ON vuids (api);
+CREATE TABLE vuid_extensions (vuid TEXT NOT NULL, extension TEXT NOT NULL);
+CREATE INDEX vuid_extensions_vuid ON vuid_extensions (vuid);
+CREATE INDEX vuid_extensions_extension ON vuid_extensions (extension);
+CREATE TABLE checks (vuid TEXT NOT NULL, type TEXT NOT NULL, file TEXT NOT NULL, line INTEGER NOT NULL, spirv INTEGER NOT NULL);
+CREATE INDEX checks_vuid ON checks (vuid);
+CREATE INDEX checks_file ON checks (file);
+CREATE TABLE tests (vuid TEXT NOT NULL, type TEXT NOT NULL, test TEXT NOT NULL, spirv INTEGER NOT NULL);
+CREATE INDEX tests_vuid ON tests (vuid);
+CREATE INDEX tests_test ON tests (test);
+"""
+
+# Opens an output file for writing text, compressed with gzip if the filename ends in .gz
+def open_output(filename, newline=None):
+    if filename.endswith('.gz'):
+        return gzip.open(filename, 'wt', newline=newline)
+    return open(filename, 'w', newline=newline)
+
+# Returns 'explicit', 'implicit' or 'unassigned' for a VUID found in the layer source or tests
+def vuid_type(vuid):
+    if vuid.startswith('VUID-'):
+        return 'explicit' if vuid[-5:-1].isdecimal() else 'implicit' # explicit end in 5 numeric chars
+    return 'unassigned'
+
 class ValidationJSON:
     def __init__(self, filename):
         self.filename = filename
@@ -53,8 +92,10 @@ class ValidationJSON:
         self.duplicate_vuids = set()
 
         # A set of specific regular expression substitutions needed to clean up VUID text
+        # Tags are stripped in their own pass before the other substitutions, as removing
+        # a tag can expose one of them (ex. "\(codeSize <code>\over</code> 4\)")
+        self.tag_regex = re.compile('<.*?>|&(amp;)+lt;|&(amp;)+gt;')
         self.regex_dict = {}
-        self.regex_dict[re.compile('<.*?>|&(amp;)+lt;|&(amp;)+gt;')] = ""
         self.regex_dict[re.compile(r'\\\(codeSize \\over 4\\\)')] = "(codeSize/4)"
         self.regex_dict[re.compile(r'\\\(\\lceil\{\\mathit\{rasterizationSamples} \\over 32}\\rceil\\\)')] = "(rasterizationSamples/32)"
         self.regex_dict[re.compile(r'\\\(\\left\\lceil{\\frac{maxFramebufferWidth}{minFragmentDensityTexelSize_{width}}}\\right\\rceil\\\)')] = "the ceiling of maxFramebufferWidth/minFragmentDensityTexelSize.width"
@@ -78,25 +119,39 @@ class ValidationJSON:
             '\u2032' : "'",  # PRIME
             '\u2192' : '->', # RIGHTWARDS ARROW
         }
+        self.unicode_table = str.maketrans(self.unicode_dict)
+
+        # The remaining regex substitutions are combined into a single regex so they only take one scan
+        # of each VUID text, the name of the alternative that matched selects the replacement
+        self.sanitize_replacements = {}
+        alternatives = []
+        for index, (regex, replacement) in enumerate(self.regex_dict.items()):
+            self.sanitize_replacements[f'regex{index}'] = replacement
+            alternatives.append(f'(?P<regex{index}>{regex.pattern})')
+        self.sanitize_regex = re.compile('|'.join(alternatives))
+
+    def sanitize_match(self, match):
+        return self.sanitize_replacements[match.lastgroup]
 
     def sanitize(self, text, location):
         # Strip leading/trailing whitespace
         text = text.strip()
         # Apply regex text substitutions
-        for regex, replacement in self.regex_dict.items():
-            text = re.sub(regex, replacement, text)
+        text = self.tag_regex.sub('', text)
+        text = self.sanitize_regex.sub(self.sanitize_match, text)
         # Un-escape html entity codes, ie &#XXXX;
+        # Not part of the regex above as removing a tag can join the text around it into a new entity code
         text = html.unescape(text)
         # Apply unicode substitutions
-        for unicode in self.unicode_regex.findall(text):
-            try:
-                # Replace known chars
-                text = text.replace(unicode, self.unicode_dict[unicode])
-            except KeyError:
-                # Strip and warn on unrecognized chars
-                text = text.replace(unicode, '')
+        text = text.translate(self.unicode_table)
+        if not text.isascii():
+            # Strip and warn on unrecognized chars
+            def strip_unknown(match):
+                unicode = match.group()
                 name = unicodedata.name(unicode, 'UNKNOWN')
                 print('Warning: Unknown unicode character \\u{:04x} ({}) at {}'.format(ord(unicode), name, location))
+                return ''
+            text = self.unicode_regex.sub(strip_unknown, text)
         return text
 
     def read(self):
@@ -137,15 +192,64 @@ class ValidationJSON:
             print("Warning: duplicate VUIDs found in validusage.json")
 
 
+# Finds the TEST_F(group, name) headers and the VUID strings in a file in a single pass
+# A VUID string that has been broken by clang will start a word, end with - and continue in a string on the next line,
+# the two are joined (strings split right after a '(' are not, tests use that to hide VUIDs from this script)
+vuid_token_regex = re.compile(rb'''
+    (?=[TUVk]) # cheap reject for the positions that can't start a token
+    (?:
+        TEST_F\(\s*(?P<group>\w+)\s*,\s*(?P<test>\w+)\s*\)
+      | (?P<vuid>(?:VUID-|UNASSIGNED-|kVUID_)[\w:*-]*)(?:(?<=-)"[ \t]*\r?\n[ \t]*"?(?P<rest>[\w:*-]*))?
+    )
+''', re.VERBOSE)
+
+# Yields (vuid, file, line number, test) for each VUID string in a layer source or test file, where test is the name of
+# the enclosing TEST_F (or '' before the first one)
+# Lines starting with a comment are skipped, unless vuid_comments is set and the line has a VUID- without a TODO:
+# kVUID_* names are left as is
+def tokenize_vuids(filename, vuid_comments=False):
+    if os.path.getsize(filename) == 0:
+        return # can't map an empty file
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        testname = ''
+        line_num = 1
+        line_num_pos = 0
+        skipped_lines = {} # line start offset to whether the line is skipped, a line can have more than one token
+        for match in vuid_token_regex.finditer(data):
+            start = match.start()
+            line_num += data[line_num_pos:start].count(b'\n')
+            line_num_pos = start
+
+            line_start = data.rfind(b'\n', 0, start) + 1
+            skipped = skipped_lines.get(line_start)
+            if skipped is None:
+                line_end = data.find(b'\n', start)
+                line = data[line_start:line_end if line_end >= 0 else len(data)].strip()
+                skipped = line.startswith((b'//', b'/*')) and not (vuid_comments and b'VUID-' in line and b'TODO:' not in line)
+                skipped_lines[line_start] = skipped
+            if skipped:
+                continue
+
+            if match.lastgroup == 'test':
+                testname = '%s.%s' % (match.group('group').decode(), match.group('test').decode())
+            elif match.group('rest') is not None and start >= 2 and data[start - 1] == ord('"') and chr(data[start - 2]).isspace():
+                # reported on the line the string ends, like the rest of the broken line
+                yield ((match.group('vuid') + match.group('rest')).decode().rstrip(':*'), filename, line_num + 1, testname)
+            else:
+                yield (match.group('vuid').decode().rstrip(':*'), filename, line_num, testname)
+
+kvuid_dict_cache = {} # ValidationSource and ValidationTests parse the same files
+
 def buildKvuidDict(unassigned_vuid_files):
+    key = tuple(unassigned_vuid_files)
+    if key in kvuid_dict_cache:
+        return kvuid_dict_cache[key]
     kvuid_dict = {}
 
     for uf in unassigned_vuid_files:
-        line_num = 0
         with open(uf) as f:
             for line in f:
-                line_num = line_num + 1
-                if True in [line.strip().startswith(comment) for comment in ['//', '/*']]:
+                if line.lstrip().startswith(('//', '/*')):
                     continue
 
                 if 'kVUID_' in line:
@@ -155,12 +259,86 @@ def buildKvuidDict(unassigned_vuid_files):
                         kvuid = line[kvuid_pos:eq_pos].strip(' \t\n;"')
                         unassigned_str = line[eq_pos+1:].strip(' \t\n;"')
                         kvuid_dict[kvuid] = unassigned_str
+    kvuid_dict_cache[key] = kvuid_dict
     return kvuid_dict
 
+# Returns the VUIDs found in a layer source file as a list of (vuid, line number)
+# kVUID_* names are left as is, they are resolved when the results of all files are merged
+def scan_source_file(filename):
+    return [(vuid, line_num) for (vuid, _, line_num, _) in tokenize_vuids(filename, vuid_comments=True)]
+
+# Returns the VUIDs found in a test file as a list of (vuid, test name)
+# kVUID_* names are left as is, they are resolved when the results of all files are merged
+def scan_test_file(filename):
+    return [(vuid, testname) for (vuid, _, _, testname) in tokenize_vuids(filename)]
+
+# Per-file scan results, reused as long as the modification time and size of the file are unchanged
+# Any change to this script invalidates the whole cache, as the results depend on how the files are scanned
+class ScanCache:
+    def __init__(self, filename):
+        self.filename = filename
+        self.entries = {} # Maps (scan function, file) to ((mtime, size), results)
+        self.dirty = False
+        self.script_hash = hashlib.sha256(open(__file__, 'rb').read()).hexdigest()
+        data = loadPickle(filename)
+        if data is not None and data.get('version') == SCAN_CACHE_VERSION and data.get('script') == self.script_hash:
+            self.entries = data['entries']
+
+    @staticmethod
+    def stamp(filename):
+        stat = os.stat(filename)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, kind, filename, stamp):
+        entry = self.entries.get((kind, filename))
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def put(self, kind, filename, stamp, results):
+        self.entries[(kind, filename)] = (stamp, results)
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        savePickle(self.filename, {'version': SCAN_CACHE_VERSION, 'script': self.script_hash, 'entries': self.entries})
+        self.dirty = False
+
+# Runs scan_function over each file, returns the list of results in the same order as the files
+# Files not found in the cache are scanned in a process pool when jobs is more than 1
+def scan_files(scan_function, files, jobs=1, cache=None):
+    kind = scan_function.__name__
+    results = [None] * len(files)
+    stamps = {}
+    missing = []
+    for index, filename in enumerate(files):
+        if cache is not None:
+            stamps[index] = ScanCache.stamp(filename)
+            results[index] = cache.get(kind, filename, stamps[index])
+        if results[index] is None:
+            missing.append(index)
+
+    if jobs > 1 and len(missing) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(missing) // (jobs * 4))
+            for index, file_results in zip(missing, executor.map(scan_function, [files[i] for i in missing], chunksize=chunksize)):
+                results[index] = file_results
+    else:
+        for index in missing:
+            results[index] = scan_function(files[index])
+
+    if cache is not None:
+        for index in missing:
+            cache.put(kind, files[index], stamps[index], results[index])
+    return results
+
 class ValidationSource:
-    def __init__(self, source_file_list, unassigned_vuid_files):
+    def __init__(self, source_file_list, unassigned_vuid_files, jobs=1, cache=None):
         self.source_files = source_file_list
         self.unassigned_vuid_files = unassigned_vuid_files
+        self.jobs = jobs
+        self.cache = cache
         self.vuid_count_dict = {} # dict of vuid values to the count of how much they're used, and location of where they're used
         self.duplicated_checks = 0
         self.explicit_vuids = set()
@@ -175,49 +353,23 @@ class ValidationSource:
             self.source_files.extend(spirv_val.source_files)
 
         # build self.vuid_count_dict
-        prepend = None
-        for sf in self.source_files:
+        spirv_file = False
+        for sf, file_results in zip(self.source_files, scan_files(scan_source_file, self.source_files, self.jobs, self.cache)):
             spirv_file = True if spirv_val.enabled and sf.startswith(spirv_val.repo_path) else False
-            line_num = 0
-            with open(sf, encoding='utf-8') as f:
-                for line in f:
-                    line_num = line_num + 1
-                    if True in [line.strip().startswith(comment) for comment in ['//', '/*']]:
-                        if 'VUID-' not in line or 'TODO:' in line:
-                            continue
-                    # Find vuid strings
-                    if prepend is not None:
-                        line = prepend[:-2] + line.lstrip().lstrip('"') # join lines skipping CR, whitespace and trailing/leading quote char
-                        prepend = None
-                    if any(prefix in line for prefix in vuid_prefixes):
-                        # Replace the '(' of lines containing validation helper functions with ' ' to make them easier to parse
-                        line = line.replace("(", " ")
-                        line_list = line.split()
-
-                        # A VUID string that has been broken by clang will start with a vuid prefix and end with -, and will be last in the list
-                        broken_vuid = line_list[-1].strip('"')
-                        if any(broken_vuid.startswith(prefix) for prefix in vuid_prefixes) and broken_vuid.endswith('-'):
-                            prepend = line
-                            continue
-
-                        vuid_list = []
-                        for str in line_list:
-                            if any(prefix in str for prefix in vuid_prefixes):
-                                vuid_list.append(str.strip(',);{}"*'))
-                        for vuid in vuid_list:
-                            if vuid.startswith('kVUID_'): vuid = kvuid_dict[vuid]
-                            if vuid not in self.vuid_count_dict:
-                                self.vuid_count_dict[vuid] = {}
-                                self.vuid_count_dict[vuid]['count'] = 1
-                                self.vuid_count_dict[vuid]['file_line'] = []
-                                self.vuid_count_dict[vuid]['spirv'] = False # default
-                            else:
-                                if self.vuid_count_dict[vuid]['count'] == 1:    # only count first time duplicated
-                                    self.duplicated_checks = self.duplicated_checks + 1
-                                self.vuid_count_dict[vuid]['count'] = self.vuid_count_dict[vuid]['count'] + 1
-                            self.vuid_count_dict[vuid]['file_line'].append('%s,%d' % (sf, line_num))
-                            if spirv_file:
-                                self.vuid_count_dict[vuid]['spirv'] = True
+            for vuid, line_num in file_results:
+                if vuid.startswith('kVUID_'): vuid = kvuid_dict[vuid]
+                if vuid not in self.vuid_count_dict:
+                    self.vuid_count_dict[vuid] = {}
+                    self.vuid_count_dict[vuid]['count'] = 1
+                    self.vuid_count_dict[vuid]['file_line'] = []
+                    self.vuid_count_dict[vuid]['spirv'] = False # default
+                else:
+                    if self.vuid_count_dict[vuid]['count'] == 1:    # only count first time duplicated
+                        self.duplicated_checks = self.duplicated_checks + 1
+                    self.vuid_count_dict[vuid]['count'] = self.vuid_count_dict[vuid]['count'] + 1
+                self.vuid_count_dict[vuid]['file_line'].append('%s,%d' % (sf, line_num))
+                if spirv_file:
+                    self.vuid_count_dict[vuid]['spirv'] = True
         # Sort vuids by type
         for vuid in self.vuid_count_dict.keys():
             if (vuid.startswith('VUID-')):
@@ -241,10 +393,11 @@ class ValidationSource:
 
 # Class to parse the validation layer test source and store testnames
 class ValidationTests:
-    def __init__(self, test_file_list, unassigned_vuid_files):
+    def __init__(self, test_file_list, unassigned_vuid_files, jobs=1, cache=None):
         self.test_files = test_file_list
         self.unassigned_vuid_files = unassigned_vuid_files
-        self.test_trigger_txt_list = ['TEST_F(']
+        self.jobs = jobs
+        self.cache = cache
         self.explicit_vuids = set()
         self.implicit_vuids = set()
         self.unassigned_vuids = set()
@@ -259,66 +412,27 @@ class ValidationTests:
         if spirv_val and spirv_val.enabled:
             self.test_files.extend(spirv_val.test_files)
 
-        # For each test file, parse test names into set
-        grab_next_line = False # handle testname on separate line than wildcard
-        testname = ''
-        prepend = None
-        for test_file in self.test_files:
+        # For each test file, find the VUIDs and the test they are in
+        for test_file, file_results in zip(self.test_files, scan_files(scan_test_file, self.test_files, self.jobs, self.cache)):
             spirv_file = True if spirv_val.enabled and test_file.startswith(spirv_val.repo_path) else False
-            with open(test_file) as tf:
-                for line in tf:
-                    if True in [line.strip().startswith(comment) for comment in ['//', '/*']]:
-                        continue
-
-                    # if line ends in a broken VUID string, fix that before proceeding
-                    if prepend is not None:
-                        line = prepend[:-2] + line.lstrip().lstrip('"') # join lines skipping CR, whitespace and trailing/leading quote char
-                        prepend = None
-                    if any(prefix in line for prefix in vuid_prefixes):
-                        line_list = line.split()
-
-                        # A VUID string that has been broken by clang will start with a vuid prefix and end with -, and will be last in the list
-                        broken_vuid = line_list[-1].strip('"')
-                        if any(broken_vuid.startswith(prefix) for prefix in vuid_prefixes) and broken_vuid.endswith('-'):
-                            prepend = line
-                            continue
-
-                    if any(ttt in line for ttt in self.test_trigger_txt_list):
-                        testname = line.split(',')[-1]
-                        testname = testname.strip().strip(' {)')
-                        if ('' == testname):
-                            grab_next_line = True
-                            continue
-                        testgroup = line.split(',')[0][line.index('(') + 1:]
-                        testname = testgroup + '.' + testname
-                        #self.test_to_vuids[testname] = []
-                    if grab_next_line: # test name on its own line
-                        grab_next_line = False
-                        testname = testname.strip().strip(' {)')
-                        #self.test_to_vuids[testname] = []
-                    if any(prefix in line for prefix in vuid_prefixes):
-                        line_list = re.split('[\s{}[\]()"]+',line)
-                        for sub_str in line_list:
-                            if any(prefix in sub_str for prefix in vuid_prefixes):
-                                vuid_str = sub_str.strip(',);:"*')
-                                if vuid_str.startswith('kVUID_'): vuid_str = kvuid_dict[vuid_str]
-                                self.vuid_to_tests[vuid_str].add(testname)
-                                #self.test_to_vuids[testname].append(vuid_str)
-                                if (vuid_str.startswith('VUID-')):
-                                    if (vuid_str[-5:-1].isdecimal()):
-                                        self.explicit_vuids.add(vuid_str)    # explicit end in 5 numeric chars
-                                        if spirv_file:
-                                            spirv_val.test_explicit_vuids.add(vuid_str)
-                                    else:
-                                        self.implicit_vuids.add(vuid_str)
-                                        if spirv_file:
-                                            spirv_val.test_implicit_vuids.add(vuid_str)
-                                elif (vuid_str.startswith('UNASSIGNED-')):
-                                    self.unassigned_vuids.add(vuid_str)
-                                else:
-                                    print("Unable to categorize VUID: %s" % vuid_str)
-                                    print("Confused while parsing VUIDs in test code - cannot proceed. (FIXME)")
-                                    exit(-1)
+            for vuid_str, testname in file_results:
+                if vuid_str.startswith('kVUID_'): vuid_str = kvuid_dict[vuid_str]
+                self.vuid_to_tests[vuid_str].add(testname)
+                if (vuid_str.startswith('VUID-')):
+                    if (vuid_str[-5:-1].isdecimal()):
+                        self.explicit_vuids.add(vuid_str)    # explicit end in 5 numeric chars
+                        if spirv_file:
+                            spirv_val.test_explicit_vuids.add(vuid_str)
+                    else:
+                        self.implicit_vuids.add(vuid_str)
+                        if spirv_file:
+                            spirv_val.test_implicit_vuids.add(vuid_str)
+                elif (vuid_str.startswith('UNASSIGNED-')):
+                    self.unassigned_vuids.add(vuid_str)
+                else:
+                    print("Unable to categorize VUID: %s" % vuid_str)
+                    print("Confused while parsing VUIDs in test code - cannot proceed. (FIXME)")
+                    exit(-1)
         self.all_vuids = self.explicit_vuids | self.implicit_vuids | self.unassigned_vuids
 
 # Class to do consistency checking
@@ -394,6 +508,8 @@ class OutputDatabase:
         self.vs = val_source
         self.vt = val_tests
         self.sv = spirv_val
+        self.sorted_vuids = None # see get_sorted_vuids
+        self.test_strings = None # see get_test_strings
         self.header_version = "/* THIS FILE IS GENERATED - DO NOT EDIT (scripts/vk_validation_stats.py) */"
         self.header_version += "\n/* Vulkan specification version: %s */" % val_json.apiversion
         self.header_preamble = """
@@ -432,102 +548,104 @@ static const vuid_spec_text_pair vuid_spec_text[] = {
 """
         self.header_postamble = """};
 """
+    # All VUIDs in validusage.json, sorted. Built once and shared by all the outputs
+    def get_sorted_vuids(self):
+        if self.sorted_vuids is None:
+            self.sorted_vuids = sorted(self.vj.all_vuids)
+        return self.sorted_vuids
+
+    # The tests of each VUID as a single string, sorted for diff-ability. Built once and shared by all the outputs
+    def get_test_strings(self):
+        if self.test_strings is None:
+            self.test_strings = {vuid: ', '.join(sorted(tests)) for vuid, tests in self.vt.vuid_to_tests.items()}
+        return self.test_strings
+
+    # Yields (vuid, db_entry, checked, spirv, test) for each row of the text, csv and html outputs
+    def dump_rows(self, only_unimplemented, sort_by_ext=False):
+        test_strings = self.get_test_strings()
+        for vuid in self.get_sorted_vuids():
+            checked = vuid in self.vs.all_vuids
+            if checked and only_unimplemented:
+                continue
+            spirv = checked and vuid in self.sv.source_all_vuids
+            test = test_strings.get(vuid, 'None')
+            db_list = self.vj.vuid_db[vuid]
+            if sort_by_ext:
+                db_list = sorted(db_list, key=operator.itemgetter('ext'))
+            for db_entry in db_list:
+                yield (vuid, db_entry, checked, spirv, test)
+
     def dump_txt(self, filename, only_unimplemented=False):
         print(f'\nDumping database to text file: {filename}')
-        with open (filename, 'w') as txt:
+        with open_output(filename) as txt:
             txt.write("## VUID Database\n")
             txt.write("## Format: VUID_NAME | CHECKED | SPIRV-TOOL | TEST | TYPE | API/STRUCT | EXTENSION | VUID_TEXT\n##\n")
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                db_list = self.vj.vuid_db[vuid]
-                db_list.sort(key=operator.itemgetter('ext')) # sort list to ease diffs of output file
-                for db_entry in db_list:
-                    checked = 'N'
-                    spirv = 'N'
-                    if vuid in self.vs.all_vuids:
-                        if only_unimplemented:
-                            continue
-                        else:
-                            checked = 'Y'
-                            if vuid in self.sv.source_all_vuids:
-                                spirv = 'Y'
-                    test = 'None'
-                    if vuid in self.vt.vuid_to_tests:
-                        test_list = list(self.vt.vuid_to_tests[vuid])
-                        test_list.sort()   # sort tests, for diff-ability
-                        sep = ', '
-                        test = sep.join(test_list)
-
-                    txt.write("%s | %s | %s | %s | %s | %s | %s | %s\n" % (vuid, checked, test, spirv, db_entry['type'], db_entry['api'], db_entry['ext'], db_entry['text']))
+            # entries of a VUID are sorted by extension to ease diffs of output file
+            txt.writelines("%s | %s | %s | %s | %s | %s | %s | %s\n" % (vuid, 'Y' if checked else 'N', test, 'Y' if spirv else 'N', db_entry['type'], db_entry['api'], db_entry['ext'], db_entry['text'])
+                           for (vuid, db_entry, checked, spirv, test) in self.dump_rows(only_unimplemented, sort_by_ext=True))
 
     def dump_csv(self, filename, only_unimplemented=False):
         print(f'\nDumping database to csv file: {filename}')
-        with open (filename, 'w', newline='') as csvfile:
+        with open_output(filename, newline='') as csvfile:
             cw = csv.writer(csvfile)
             cw.writerow(['VUID_NAME','CHECKED','SPIRV-TOOL', 'TEST','TYPE','API/STRUCT','EXTENSION','VUID_TEXT'])
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                for db_entry in self.vj.vuid_db[vuid]:
-                    row = [vuid]
-                    if vuid in self.vs.all_vuids:
-                        if only_unimplemented:
-                            continue
-                        else:
-                            row.append('Y') # checked
-                            if vuid in self.sv.source_all_vuids:
-                                row.append('Y') # spirv-tool
-                            else:
-                                row.append('N') # spirv-tool
+            cw.writerows([vuid, 'Y' if checked else 'N', 'Y' if spirv else 'N', test, db_entry['type'], db_entry['api'], db_entry['ext'], db_entry['text']]
+                         for (vuid, db_entry, checked, spirv, test) in self.dump_rows(only_unimplemented))
 
-                    else:
-                        row.append('N') # checked
-                        row.append('N') # spirv-tool
-                    test = 'None'
-                    if vuid in self.vt.vuid_to_tests:
-                        sep = ', '
-                        test = sep.join(self.vt.vuid_to_tests[vuid])
-                    row.append(test)
-                    row.append(db_entry['type'])
-                    row.append(db_entry['api'])
-                    row.append(db_entry['ext'])
-                    row.append(db_entry['text'])
-                    cw.writerow(row)
-
-    def dump_html(self, filename, only_unimplemented=False):
+    # Returns the filename of a page of the html output, the first page is the filename itself
+    @staticmethod
+    def html_page_filename(filename, page):
+        if page == 1:
+            return filename
+        suffix = '.gz' if filename.endswith('.gz') else ''
+        (root, ext) = os.path.splitext(filename[:len(filename) - len(suffix)])
+        return f'{root}-{page}{ext}{suffix}'
+
+    # page_size splits the table into pages of at most page_size rows, each page links to the previous and next ones
+    def dump_html(self, filename, only_unimplemented=False, page_size=None):
         print(f'\nDumping database to html file: {filename}')
         preamble = '<!DOCTYPE html>\n<html>\n<head>\n<style>\ntable, th, td {\n border: 1px solid black;\n border-collapse: collapse; \n}\n</style>\n<body>\n<h2>Valid Usage Database</h2>\n<font size="2" face="Arial">\n<table style="width:100%">\n'
         headers = '<tr><th>VUID NAME</th><th>CHECKED</th><th>SPIRV-TOOL</th><th>TEST</th><th>TYPE</th><th>API/STRUCT</th><th>EXTENSION</th><th>VUID TEXT</th></tr>\n'
-        with open(filename, 'w') as hfile:
-            hfile.write(preamble)
-            hfile.write(headers)
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                for db_entry in self.vj.vuid_db[vuid]:
-                    checked = '<span style="color:red;">N</span>'
-                    spirv = ''
-                    if vuid in self.vs.all_vuids:
-                        if only_unimplemented:
-                            continue
-                        else:
-                            checked = '<span style="color:limegreen;">Y</span>'
-                            if vuid in self.sv.source_all_vuids:
-                                spirv = 'Y'
-                    hfile.write('<tr><th>%s</th>' % vuid)
-                    hfile.write('<th>%s</th>' % checked)
-                    hfile.write('<th>%s</th>' % spirv)
-                    test = 'None'
-                    if vuid in self.vt.vuid_to_tests:
-                        sep = ', '
-                        test = sep.join(self.vt.vuid_to_tests[vuid])
-                    hfile.write('<th>%s</th>' % test)
-                    hfile.write('<th>%s</th>' % db_entry['type'])
-                    hfile.write('<th>%s</th>' % db_entry['api'])
-                    hfile.write('<th>%s</th>' % db_entry['ext'])
-                    hfile.write('<th>%s</th></tr>\n' % db_entry['text'])
-            hfile.write('</table>\n</body>\n</html>\n')
+        postamble = '</table>\n</body>\n</html>\n'
+
+        rows = ('<tr><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th></tr>\n' % (
+                    vuid,
+                    '<span style="color:limegreen;">Y</span>' if checked else '<span style="color:red;">N</span>',
+                    'Y' if spirv else '',
+                    test, db_entry['type'], db_entry['api'], db_entry['ext'], db_entry['text'])
+                for (vuid, db_entry, checked, spirv, test) in self.dump_rows(only_unimplemented))
+
+        if page_size is None:
+            with open_output(filename) as hfile:
+                hfile.write(preamble)
+                hfile.write(headers)
+                hfile.writelines(rows)
+                hfile.write(postamble)
+            return
+
+        # Only one page of rows is held at a time, looking one row ahead to know if there is a next page
+        page = 1
+        next_row = next(rows, None)
+        while True:
+            page_rows = [] if next_row is None else [next_row]
+            page_rows.extend(itertools.islice(rows, page_size - len(page_rows)))
+            next_row = next(rows, None)
+            links = []
+            if page > 1:
+                links.append('<a href="%s">Previous</a>' % os.path.basename(self.html_page_filename(filename, page - 1)))
+            links.append('Page %d' % page)
+            if next_row is not None:
+                links.append('<a href="%s">Next</a>' % os.path.basename(self.html_page_filename(filename, page + 1)))
+            navigation = '<p>%s</p>\n' % ' | '.join(links)
+            with open_output(self.html_page_filename(filename, page)) as hfile:
+                hfile.write(preamble.replace('<table style', navigation + '<table style'))
+                hfile.write(headers)
+                hfile.writelines(page_rows)
+                hfile.write(postamble)
+                hfile.write(navigation)
+            if next_row is None:
+                break
+            page += 1
 
     def dump_extension_coverage(self, filename):
         print(f'\nDumping extension coverage report to file: {filename}')
@@ -551,72 +669,119 @@ static const vuid_spec_text_pair vuid_spec_text[] = {
                 ext_entry = ext_db[ext_name]
                 cw.writerow([ext_name, ext_entry.checked, ext_entry.total, ext_entry.checked/ext_entry.total])
 
-    # make list of spec versions containing given VUID
+    def export_db(self, filename):
+        print(f'\nExporting database to sqlite file: {filename}')
+        spirv_tests = self.sv.test_explicit_vuids | self.sv.test_implicit_vuids
+        # Write to a temp file first so a query never reads a partial database
+        with atomicFileReplace(filename) as temp_file:
+            con = sqlite3.connect(temp_file)
+            try:
+                with con:
+                    con.executescript(db_schema)
+                    con.execute(f'PRAGMA user_version = {DB_VERSION}')
+                    con.executemany('INSERT INTO info VALUES (?, ?)', [
+                        ('api_version', self.vj.apiversion),
+                        ('spirv_tools_version', self.sv.version if self.sv.enabled else None)])
+                    con.executemany('INSERT INTO vuids VALUES (?, ?, ?, ?, ?)',
+                        ((vuid, db_entry['type'], db_entry['api'], db_entry['ext'], db_entry['text'])
+                            for vuid in sorted(self.vj.all_vuids) for db_entry in self.vj.vuid_db[vuid]))
+                    con.executemany('INSERT INTO vuid_extensions VALUES (?, ?)',
+                        ((vuid, ext_name) for vuid in sorted(self.vj.all_vuids)
+                            for ext_name in sorted(set(ext_name for db_entry in self.vj.vuid_db[vuid] for ext_name in re.findall(r'\w+', db_entry['ext'])))))
+                    con.executemany('INSERT INTO checks VALUES (?, ?, ?, ?, ?)',
+                        ((vuid, vuid_type(vuid), file, int(line), int(self.vs.vuid_count_dict[vuid]['spirv']))
+                            for vuid in sorted(self.vs.vuid_count_dict) for (file, line) in (file_line.rsplit(',', 1) for file_line in self.vs.vuid_count_dict[vuid]['file_line'])))
+                    con.executemany('INSERT INTO tests VALUES (?, ?, ?, ?)',
+                        ((vuid, vuid_type(vuid), test, int(vuid in spirv_tests))
+                            for vuid in sorted(self.vt.vuid_to_tests) for test in sorted(self.vt.vuid_to_tests[vuid])))
+            finally:
+                con.close()
+
+    # Spec version lists by (pattern, max_minor_version), there are only a few thousand distinct patterns for all VUIDs
+    vuid_spec_version_lists = {}
+    # Predicates by pattern, see parse_vuid_spec_pattern
+    vuid_spec_pattern_predicates = {}
+
+    # make list of all spec versions, from newest to oldest
     @staticmethod
-    def make_vuid_spec_version_list(pattern, max_minor_version):
-        assert pattern
-
+    def make_spec_edition_list(max_minor_version):
         all_editions_list = []
         for e in reversed(range(max_minor_version+1)):
             all_editions_list.append({"version": e, "ext": True,  "khr" : False})
             all_editions_list.append({"version": e, "ext": False, "khr" : True})
             all_editions_list.append({"version": e, "ext": False, "khr" : False})
+        return all_editions_list
+
+    # Returns a function that takes a spec edition and returns whether the pattern is satisfied in that edition
+    #
+    # pattern is series of parentheses separated by plus
+    # each parentheses can be prepended by negation (!)
+    # each parentheses contains list of extensions or vk versions separated by either comma or plus
+    @staticmethod
+    def parse_vuid_spec_pattern(pattern):
+        # Each feature is reduced to (minimum minor version or None, is extension, is KHR extension)
+        def parseFeature(feature):
+            def getVersion(f): return int(f.replace('VK_VERSION_1_', '', 1))
+            def isVersion(f): return f.startswith('VK_VERSION_') and feature != 'VK_VERSION_1_0' and getVersion(feature) < 1024
+            def isScVersion(f): return f.startswith('VKSC_VERSION_')
+            def isExtension(f): return f.startswith('VK_') and not isVersion(f)
+            def isKhr(f): return f.startswith('VK_KHR_')
+
+            assert isExtension(feature) or isVersion(feature) or isScVersion(feature)
+
+            return (getVersion(feature) if isVersion(feature) else None, isExtension(feature), isKhr(feature))
+
+        def isDefined(feature, edition):
+            (version, extension, khr) = feature
+            return (version is not None and version <= edition['version']) or (extension and edition['ext']) or (khr and edition['khr'])
+
+        terms = []
+        raw_terms = re.split(r'\)\+', pattern)
+        for raw_term in raw_terms:
+            negated = raw_term.startswith('!')
+            term = raw_term.lstrip('!(').rstrip(')')
+            conjunction = '+' in term
+            disjunction = ',' in term
+            assert not (conjunction and disjunction)
+            if conjunction: features = term.split('+')
+            elif disjunction: features = term.split(',')
+            else: features = [term]
+            assert features
+            features = [parseFeature(feature) for feature in features]
+
+            if not negated and (conjunction or (not conjunction and not disjunction)): # all defined
+                terms.append(lambda edition, features=features: all(isDefined(feature, edition) for feature in features))
+            elif negated and conjunction: # at least one not defined
+                terms.append(lambda edition, features=features: not all(isDefined(feature, edition) for feature in features))
+            elif not negated and disjunction: # at least one defined
+                terms.append(lambda edition, features=features: any(isDefined(feature, edition) for feature in features))
+            elif negated and (disjunction or (not conjunction and not disjunction)): # none defined
+                terms.append(lambda edition, features=features: not any(isDefined(feature, edition) for feature in features))
+
+        return lambda edition: all(term(edition) for term in terms)
 
+    # make list of spec versions containing given VUID
+    # The list is shared between all callers with the same pattern, it must not be modified
+    @staticmethod
+    def make_vuid_spec_version_list(pattern, max_minor_version):
+        assert pattern
+
+        key = (pattern, max_minor_version)
+        edition_list_out = OutputDatabase.vuid_spec_version_lists.get(key)
+        if edition_list_out is not None:
+            return edition_list_out
+
+        all_editions_list = OutputDatabase.make_spec_edition_list(max_minor_version)
         if pattern == 'core':
-            return all_editions_list
-
-        # pattern is series of parentheses separated by plus
-        # each parentheses can be prepended by negation (!)
-        # each parentheses contains list of extensions or vk versions separated by either comma or plus
-        edition_list_out = []
-        for edition in all_editions_list:
-            resolved_pattern = True
-
-            raw_terms = re.split(r'\)\+', pattern)
-            for raw_term in raw_terms:
-                negated = raw_term.startswith('!')
-                term = raw_term.lstrip('!(').rstrip(')')
-                conjunction = '+' in term
-                disjunction = ',' in term
-                assert not (conjunction and disjunction)
-                if conjunction: features = term.split('+')
-                elif disjunction: features = term.split(',')
-                else: features = [term]
-                assert features
-
-                def isDefined(feature, edition):
-                    def getVersion(f): return int(f.replace('VK_VERSION_1_', '', 1))
-                    def isVersion(f): return f.startswith('VK_VERSION_') and feature != 'VK_VERSION_1_0' and getVersion(feature) < 1024
-                    def isScVersion(f): return f.startswith('VKSC_VERSION_')
-                    def isExtension(f): return f.startswith('VK_') and not isVersion(f)
-                    def isKhr(f): return f.startswith('VK_KHR_')
-
-                    assert isExtension(feature) or isVersion(feature) or isScVersion(feature)
-
-                    if isVersion(feature) and getVersion(feature) <= edition['version']: return True
-                    elif isExtension(feature) and edition['ext']: return True
-                    elif isKhr(feature) and edition['khr']: return True
-                    else: return False
-
-                if not negated and (conjunction or (not conjunction and not disjunction)): # all defined
-                    resolved_term = True
-                    for feature in features:
-                        if not isDefined(feature, edition): resolved_term = False
-                elif negated and conjunction: # at least one not defined
-                    resolved_term = False
-                    for feature in features:
-                        if not isDefined(feature, edition): resolved_term = True
-                elif not negated and disjunction: # at least one defined
-                    resolved_term = False
-                    for feature in features:
-                        if isDefined(feature, edition): resolved_term = True
-                elif negated and (disjunction or (not conjunction and not disjunction)): # none defined
-                    resolved_term = True
-                    for feature in features:
-                        if isDefined(feature, edition): resolved_term = False
-
-                resolved_pattern = resolved_pattern and resolved_term
-            if resolved_pattern: edition_list_out.append(edition)
+            edition_list_out = all_editions_list
+        else:
+            predicate = OutputDatabase.vuid_spec_pattern_predicates.get(pattern)
+            if predicate is None:
+                predicate = OutputDatabase.parse_vuid_spec_pattern(pattern)
+                OutputDatabase.vuid_spec_pattern_predicates[pattern] = predicate
+            edition_list_out = [edition for edition in all_editions_list if predicate(edition)]
+
+        OutputDatabase.vuid_spec_version_lists[key] = edition_list_out
         return edition_list_out
 
 
@@ -626,11 +791,9 @@ static const vuid_spec_text_pair vuid_spec_text[] = {
         with open (filename, 'w', newline='\n') as hfile:
             hfile.write(self.header_version)
             hfile.write(self.header_preamble)
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
             minor_version = int(self.vj.apiversion.split('.')[1])
 
-            for vuid in vuid_list:
+            for vuid in self.get_sorted_vuids():
                 db_entry = self.vj.vuid_db[vuid][0]
 
                 spec_list = self.make_vuid_spec_version_list(db_entry['ext'], minor_version)
@@ -685,14 +848,157 @@ class SpirvValidation:
             self.test_files.extend(glob.glob(os.path.join(self.repo_path, path)))
 
 
+# counts are (explicit, implicit, total) tuples, spirv_* are None when SPIRV-Tools is not used
+def print_summary(apiversion, spirv_version, json_counts, check_counts, test_counts, spirv_check_counts, spirv_test_counts):
+    (exp_json, imp_json, all_json) = json_counts
+    (exp_checks, imp_checks, all_checks) = check_counts
+    (exp_tests, imp_tests, all_tests) = test_counts
+    # A -api or -ext filter of the query command can leave nothing to compare against
+    def percent(count, total): return (100.0 * count / total) if total != 0 else 0.0
+    if spirv_version is not None:
+        print("\nValidation Statistics (using validusage.json version %s and SPIRV-Tools version %s)" % (apiversion, spirv_version))
+    else:
+        print("\nValidation Statistics (using validusage.json version %s)" % apiversion)
+    print("  VUIDs defined in JSON file:  %04d explicit, %04d implicit, %04d total." % (exp_json, imp_json, all_json))
+    print("  VUIDs checked in layer code: %04d explicit, %04d implicit, %04d total." % (exp_checks, imp_checks, all_checks))
+    if spirv_check_counts is not None:
+        print("             From SPIRV-Tools: %04d explicit, %04d implicit, %04d total." % spirv_check_counts)
+    print("  VUIDs tested in layer tests: %04d explicit, %04d implicit, %04d total." % (exp_tests, imp_tests, all_tests))
+    if spirv_test_counts is not None:
+        print("             From SPIRV-Tools: %04d explicit, %04d implicit, %04d total." % spirv_test_counts)
+
+    print("\nVUID check coverage")
+    print("  Explicit VUIDs checked: %.1f%% (%d checked vs %d defined)" % (percent(exp_checks, exp_json), exp_checks, exp_json))
+    print("  Implicit VUIDs checked: %.1f%% (%d checked vs %d defined)" % (percent(imp_checks, imp_json), imp_checks, imp_json))
+    print("  Overall VUIDs checked:  %.1f%% (%d checked vs %d defined)" % (percent(all_checks, all_json), all_checks, all_json))
+
+    print("\nVUID test coverage")
+    print("  Explicit VUIDs tested: %.1f%% (%d tested vs %d checks)" % (percent(exp_tests, exp_checks), exp_tests, exp_checks))
+    print("  Implicit VUIDs tested: %.1f%% (%d tested vs %d checks)" % (percent(imp_tests, imp_checks), imp_tests, imp_checks))
+    print("  Overall VUIDs tested:  %.1f%% (%d tested vs %d checks)" % (percent(all_tests, all_checks), all_tests, all_checks))
+
+# Answers coverage questions from a database exported with -db, without reading validusage.json or any source file
+def query_main(argv):
+    parser = argparse.ArgumentParser(prog='vk_validation_stats.py query',
+                                     description='report VUID coverage from a database exported with -db')
+    parser.add_argument('db_file', help='database file exported with -db')
+    parser.add_argument('-summary', action='store_true',
+                        help='output summary of VUID coverage')
+    parser.add_argument('-todo', action='store_true',
+                        help='report unimplemented VUIDs')
+    parser.add_argument('-unassigned', action='store_true',
+                        help='report unassigned VUIDs')
+    parser.add_argument('-vuid', metavar='VUID_NAME',
+                        help='report status of individual VUID <VUID_NAME>')
+    parser.add_argument('-api', metavar='API_NAME',
+                        help='only count and report the VUIDs of <API_NAME> (command or struct) with -summary and -todo')
+    parser.add_argument('-ext', metavar='EXTENSION',
+                        help='only count and report the VUIDs depending on <EXTENSION> (or version) with -summary and -todo')
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.db_file):
+        print("Error: Could not find database file <%s>" % args.db_file)
+        return -1
+    con = sqlite3.connect(args.db_file)
+    if con.execute('PRAGMA user_version').fetchone()[0] != DB_VERSION:
+        print("Error: Database file <%s> was exported by a different version of this script, export it again with -db" % args.db_file)
+        return -1
+    info = dict(con.execute('SELECT key, value FROM info'))
+
+    # Restricts the VUIDs from validusage.json to the -api and -ext filters
+    filters = []
+    params = []
+    if args.api:
+        filters.append('api = ?')
+        params.append(args.api)
+    if args.ext:
+        filters.append('vuid IN (SELECT vuid FROM vuid_extensions WHERE extension = ?)')
+        params.append(args.ext)
+    vuid_filter = ('WHERE ' + ' AND '.join(filters)) if filters else ''
+    # Checks and tests of VUIDs not in validusage.json (ex. UNASSIGNED-) only count when nothing is filtered
+    found_filter = f'WHERE vuid IN (SELECT vuid FROM vuids {vuid_filter})' if filters else ''
+
+    def counts(query, query_params):
+        by_type = dict(con.execute(query, query_params))
+        return (by_type.get('explicit', 0), by_type.get('implicit', 0), sum(by_type.values()))
+
+    if args.summary:
+        spirv_version = info.get('spirv_tools_version')
+        json_counts = counts(f'SELECT type, COUNT(DISTINCT vuid) FROM vuids {vuid_filter} GROUP BY type', params)
+        check_counts = counts(f'SELECT type, COUNT(DISTINCT vuid) FROM checks {found_filter} GROUP BY type', params)
+        test_counts = counts(f'SELECT type, COUNT(DISTINCT vuid) FROM tests {found_filter} GROUP BY type', params)
+        spirv_check_counts = None
+        spirv_test_counts = None
+        if spirv_version is not None:
+            spirv_filter = f'{found_filter} AND spirv = 1' if filters else 'WHERE spirv = 1'
+            spirv_check_counts = counts(f"SELECT type, COUNT(DISTINCT vuid) FROM checks {spirv_filter} AND type != 'unassigned' GROUP BY type", params)
+            spirv_test_counts = counts(f"SELECT type, COUNT(DISTINCT vuid) FROM tests {spirv_filter} AND type != 'unassigned' GROUP BY type", params)
+        print_summary(info['api_version'], spirv_version, json_counts, check_counts, test_counts, spirv_check_counts, spirv_test_counts)
+
+    # Report status of a single VUID
+    if args.vuid:
+        print("\n\nChecking status of <%s>" % args.vuid);
+        defined = con.execute('SELECT 1 FROM vuids WHERE vuid = ? LIMIT 1', (args.vuid,)).fetchone() is not None
+        if not defined and not args.vuid.startswith('UNASSIGNED-'):
+            print('  Not a valid VUID string.')
+        else:
+            checks = con.execute('SELECT type, file, line FROM checks WHERE vuid = ? ORDER BY rowid', (args.vuid,)).fetchall()
+            if len(checks) != 0 and checks[0][0] != 'unassigned':
+                print('  Implemented!' if checks[0][0] == 'explicit' else '  Implemented! (Implicit)')
+                for (_, file, line) in checks:
+                    print('    => %s,%d' % (file, line))
+            else:
+                print('  Not implemented.')
+            tests = [test for (test,) in con.execute('SELECT test FROM tests WHERE vuid = ? ORDER BY test', (args.vuid,))]
+            if len(tests) != 0:
+                print('  Has a test!')
+                for test in tests:
+                    print('    => %s' % test)
+            else:
+                print('  Not tested.')
+
+    # Report unimplemented explicit VUIDs
+    if args.todo:
+        explicit_filter = f"{vuid_filter} AND type = 'explicit'" if filters else "WHERE type = 'explicit'"
+        ulist = [vuid for (vuid,) in con.execute(f'SELECT DISTINCT vuid FROM vuids {explicit_filter} AND vuid NOT IN (SELECT vuid FROM checks) ORDER BY vuid', params)]
+        print("\n\n%d explicit VUID checks remain unimplemented:" % len(ulist))
+        for vuid in ulist:
+            print("  => %s" % vuid)
+
+    # Report unassigned VUIDs
+    if args.unassigned:
+        checks = defaultdict(list)
+        for (vuid, file, line) in con.execute("SELECT vuid, file, line FROM checks WHERE type = 'unassigned' ORDER BY rowid"):
+            checks[vuid].append('%s,%d' % (file, line))
+        print("\n\n%d checks without a spec VUID:" % len(checks))
+        for vuid in sorted(checks):
+            print("  => %s" % vuid)
+            for line in checks[vuid]:
+                print('    => %s' % line)
+        tests = defaultdict(list)
+        for (vuid, test) in con.execute("SELECT vuid, test FROM tests WHERE type = 'unassigned' ORDER BY test"):
+            tests[vuid].append(test)
+        print("\n%d tests without a spec VUID:" % len(tests))
+        for vuid in sorted(tests):
+            print("  => %s" % vuid)
+            for test in tests[vuid]:
+                print('    => %s' % test)
+
+    con.close()
+    return 0
+
 def main(argv):
+    if len(argv) > 0 and argv[0] == 'query':
+        return query_main(argv[1:])
+
     TXT_FILENAME = "validation_error_database.txt"
     CSV_FILENAME = "validation_error_database.csv"
     HTML_FILENAME = "validation_error_database.html"
     HEADER_FILENAME = "vk_validation_error_messages.h"
+    DB_FILENAME = "validation_error_database.sqlite"
     EXTENSION_COVERAGE_FILENAME = "validation_extension_coverage.csv"
 
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(epilog='Run "vk_validation_stats.py query -h" to report coverage from a database exported with -db')
     parser.add_argument('json_file', help="registry file 'validusage.json'")
     parser.add_argument('-api',
                         default='vulkan',
@@ -709,20 +1015,32 @@ def main(argv):
     parser.add_argument('-spirvtools', metavar='PATH',
                         help='when pointed to root directory of SPIRV-Tools repo, will search the repo for VUs that are implemented there')
     parser.add_argument('-text', nargs='?', const=TXT_FILENAME, metavar='FILENAME',
-                        help=f'export the error database in text format to <FILENAME>, defaults to {TXT_FILENAME}')
+                        help=f'export the error database in text format to <FILENAME> (gzip compressed if it ends in .gz), defaults to {TXT_FILENAME}')
     parser.add_argument('-csv', nargs='?', const=CSV_FILENAME, metavar='FILENAME',
-                        help=f'export the error database in csv format to <FILENAME>, defaults to {CSV_FILENAME}')
+                        help=f'export the error database in csv format to <FILENAME> (gzip compressed if it ends in .gz), defaults to {CSV_FILENAME}')
     parser.add_argument('-html', nargs='?', const=HTML_FILENAME, metavar='FILENAME',
-                        help=f'export the error database in html format to <FILENAME>, defaults to {HTML_FILENAME}')
+                        help=f'export the error database in html format to <FILENAME> (gzip compressed if it ends in .gz), defaults to {HTML_FILENAME}')
+    parser.add_argument('-html_page_size', type=int, metavar='N',
+                        help='split the html export into pages of N VUID entries, <FILENAME>, <FILENAME>-2, ...')
     parser.add_argument('-extension_coverage', nargs='?', const=EXTENSION_COVERAGE_FILENAME, metavar='FILENAME',
                         help=f'export an extension coverage report to <FILENAME>, defaults to {EXTENSION_COVERAGE_FILENAME}')
+    parser.add_argument('-db', nargs='?', const=DB_FILENAME, metavar='FILENAME',
+                        help=f'export the error database, layer checks and tests to a sqlite database <FILENAME> for the query command, defaults to {DB_FILENAME}')
     parser.add_argument('-export_header', action='store_true',
                         help=f'export a new VUID error text header file to {HEADER_FILENAME}')
     parser.add_argument('-summary', action='store_true',
                         help='output summary of VUID coverage')
     parser.add_argument('-verbose', action='store_true',
                         help='show your work (to stdout)')
-    args = parser.parse_args()
+    parser.add_argument('-jobs', type=int, default=1, metavar='N',
+                        help='scan the layer and test source files with N processes')
+    parser.add_argument('-cache', metavar='FILENAME',
+                        help='reuse the scan results of unchanged layer and test source files from <FILENAME>, and update it')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('-jobs must be at least 1')
+    if args.html_page_size is not None and args.html_page_size < 1:
+        parser.error('-html_page_size must be at least 1')
 
     # We need python modules found in the registry directory. This assumes that the validusage.json file is in that directory,
     # and hasn't been copied elsewhere.
@@ -781,8 +1099,10 @@ def main(argv):
                 for ext in val_json.vuid_db[vuid]:
                     print("    with extension: %s" % ext['ext'])
 
+    scan_cache = ScanCache(args.cache) if args.cache else None
+
     # Parse layer source files
-    val_source = ValidationSource(layer_source_files, unassigned_vuid_files)
+    val_source = ValidationSource(layer_source_files, unassigned_vuid_files, args.jobs, scan_cache)
     val_source.parse(spirv_val)
     exp_checks = len(val_source.explicit_vuids)
     imp_checks = len(val_source.implicit_vuids)
@@ -802,8 +1122,10 @@ def main(argv):
         print("  %d checks are implemented more that once" % val_source.duplicated_checks)
 
     # Parse test files
-    val_tests = ValidationTests(test_source_files, unassigned_vuid_files)
+    val_tests = ValidationTests(test_source_files, unassigned_vuid_files, args.jobs, scan_cache)
     val_tests.parse(spirv_val)
+    if scan_cache is not None:
+        scan_cache.save()
     exp_tests = len(val_tests.explicit_vuids)
     imp_tests = len(val_tests.implicit_vuids)
     all_tests = len(val_tests.all_vuids)
@@ -822,27 +1144,10 @@ def main(argv):
 
     # Process stats
     if args.summary:
-        if spirv_val.enabled:
-            print("\nValidation Statistics (using validusage.json version %s and SPIRV-Tools version %s)" % (val_json.apiversion, spirv_val.version))
-        else:
-            print("\nValidation Statistics (using validusage.json version %s)" % val_json.apiversion)
-        print("  VUIDs defined in JSON file:  %04d explicit, %04d implicit, %04d total." % (exp_json, imp_json, all_json))
-        print("  VUIDs checked in layer code: %04d explicit, %04d implicit, %04d total." % (exp_checks, imp_checks, all_checks))
-        if spirv_val.enabled:
-            print("             From SPIRV-Tools: %04d explicit, %04d implicit, %04d total." % (spirv_exp_checks, spirv_imp_checks, spirv_all_checks))
-        print("  VUIDs tested in layer tests: %04d explicit, %04d implicit, %04d total." % (exp_tests, imp_tests, all_tests))
-        if spirv_val.enabled:
-            print("             From SPIRV-Tools: %04d explicit, %04d implicit, %04d total." % (spirv_exp_tests, spirv_imp_tests, spirv_all_tests))
-
-        print("\nVUID check coverage")
-        print("  Explicit VUIDs checked: %.1f%% (%d checked vs %d defined)" % ((100.0 * exp_checks / exp_json), exp_checks, exp_json))
-        print("  Implicit VUIDs checked: %.1f%% (%d checked vs %d defined)" % ((100.0 * imp_checks / imp_json), imp_checks, imp_json))
-        print("  Overall VUIDs checked:  %.1f%% (%d checked vs %d defined)" % ((100.0 * all_checks / all_json), all_checks, all_json))
-
-        print("\nVUID test coverage")
-        print("  Explicit VUIDs tested: %.1f%% (%d tested vs %d checks)" % ((100.0 * exp_tests / exp_checks), exp_tests, exp_checks))
-        print("  Implicit VUIDs tested: %.1f%% (%d tested vs %d checks)" % ((100.0 * imp_tests / imp_checks), imp_tests, imp_checks))
-        print("  Overall VUIDs tested:  %.1f%% (%d tested vs %d checks)" % ((100.0 * all_tests / all_checks), all_tests, all_checks))
+        print_summary(val_json.apiversion, spirv_val.version if spirv_val.enabled else None,
+                      (exp_json, imp_json, all_json), (exp_checks, imp_checks, all_checks), (exp_tests, imp_tests, all_tests),
+                      (spirv_exp_checks, spirv_imp_checks, spirv_all_checks) if spirv_val.enabled else None,
+                      (spirv_exp_tests, spirv_imp_tests, spirv_all_tests) if spirv_val.enabled else None)
 
     # Report status of a single VUID
     if args.vuid:
@@ -917,9 +1222,11 @@ def main(argv):
     if args.csv:
         db_out.dump_csv(args.csv, args.todo)
     if args.html:
-        db_out.dump_html(args.html, args.todo)
+        db_out.dump_html(args.html, args.todo, args.html_page_size)
     if args.extension_coverage:
         db_out.dump_extension_coverage(args.extension_coverage)
+    if args.db:
+        db_out.export_db(args.db)
     if args.export_header:
         db_out.export_header(HEADER_FILENAME)
 
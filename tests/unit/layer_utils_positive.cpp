@@ -13,6 +13,8 @@
 #include "../framework/layer_validation_tests.h"
 #include "generated/vk_extension_helper.h"
 #include "utils/vk_layer_utils.h"
+#include "utils/hash_util.h"
+#include "generated/sync_validation_types.h"
 
 class PositiveLayerUtils : public VkPositiveLayerTest {};
 
@@ -198,3 +200,116 @@ TEST_F(PositiveLayerUtils, IsImageLayoutStencilOnly) {
         ASSERT_FALSE(IsImageLayoutStencilOnly(layout));
     }
 }
+
+TEST_F(PositiveLayerUtils, LeastSignificantBit) {
+    TEST_DESCRIPTION("Test the 64-bit LeastSignificantBit and the portable version used without a bit scan intrinsic");
+
+    constexpr std::array masks{uint64_t{1}, uint64_t{1} << 63, uint64_t{0x8000000100000A00}, uint64_t{0xF0F0000000000000}};
+    constexpr std::array expected{0, 63, 9, 52};
+    for (size_t i = 0; i < masks.size(); ++i) {
+        ASSERT_EQ(LeastSignificantBit(masks[i]), expected[i]);
+        ASSERT_EQ(LeastSignificantBitPortable(masks[i]), expected[i]);
+    }
+    ASSERT_EQ(LeastSignificantBit(uint64_t{0}), -1);
+    ASSERT_EQ(LeastSignificantBitPortable(uint64_t{0}), -1);
+
+    for (int bit = 0; bit < 64; ++bit) {
+        const uint64_t mask = (~uint64_t{0}) << bit;
+        ASSERT_EQ(LeastSignificantBit(mask), bit);
+        ASSERT_EQ(LeastSignificantBitPortable(mask), bit);
+    }
+}
+
+TEST_F(PositiveLayerUtils, PerfectHashString) {
+    TEST_DESCRIPTION("Test a perfect hash table built by buildPerfectHash() in scripts/generators/generator_utils.py");
+
+    // Values from perfectHashString() in generator_utils.py, the generated tables are only valid if both hash the same
+    static_assert(hash_util::PerfectHashString(0, "vkCreateInstance") == 3760140296u);
+    static_assert(hash_util::PerfectHashString(0, "") == 2872998923u);
+    static_assert(hash_util::PerfectHashString(7, "vkCmdDraw") == 137676592u);
+
+    // buildPerfectHash() of these keys, laid out the same as the chassis kFunctionDataSeeds and kFunctionData
+    constexpr std::array<uint32_t, 3> seeds{72, 3, 21};
+    constexpr std::array<const char *, 12> keys{"vkGetInstanceProcAddr", "vkEnumeratePhysicalDevices",
+                                                "vkQueueSubmit",         "vkDestroyDevice",
+                                                "vkDestroyInstance",     "vkCmdDraw",
+                                                "vkCmdDrawIndexed",      "vkCmdDispatch",
+                                                "vkCreateDevice",        "vkQueueSubmit2",
+                                                "vkCreateInstance",      "vkGetDeviceProcAddr"};
+    const auto lookup = [&](const char *name) -> const char * {
+        const uint32_t seed = seeds[hash_util::PerfectHashString(0, name) % seeds.size()];
+        const char *key = keys[hash_util::PerfectHashString(seed, name) % keys.size()];
+        return strcmp(key, name) == 0 ? key : nullptr;
+    };
+
+    for (const char *key : keys) {
+        ASSERT_EQ(lookup(key), key);
+    }
+    // Near misses land on the slot of another key and are rejected by the string compare
+    for (const char *name : {"vkCreateinstance", "vkCmdDraw2", "vkQueueSubmit3", "vkCmdDra", ""}) {
+        ASSERT_EQ(lookup(name), nullptr);
+    }
+}
+
+TEST_F(PositiveLayerUtils, SyncStageAccessFlags) {
+    TEST_DESCRIPTION("Test the SyncStageAccessFlags bit set on both sides of the 64-bit word boundary");
+
+    // Bits 63 and 64 are the last bit of the first word and the first bit of the second one
+    const SyncStageAccessFlags low = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_SHADER_SAMPLED_READ);
+    const SyncStageAccessFlags high = SyncStageAccessFlags::FromIndex(SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ);
+    ASSERT_EQ(SYNC_TASK_SHADER_EXT_SHADER_SAMPLED_READ, 63);
+    ASSERT_EQ(SYNC_TASK_SHADER_EXT_SHADER_STORAGE_READ, 64);
+
+    SyncStageAccessFlags flags;
+    ASSERT_TRUE(flags.none());
+    ASSERT_FALSE(flags.any());
+    ASSERT_EQ(flags.LeastSignificantBit(), -1);
+
+    for (const size_t index : {size_t{0}, size_t{63}, size_t{64}, size_t{SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER}}) {
+        SyncStageAccessFlags bit;
+        bit.set(index);
+        ASSERT_TRUE(bit.test(index));
+        ASSERT_TRUE(bit.any());
+        ASSERT_FALSE(bit.none());
+        ASSERT_TRUE(bit == SyncStageAccessFlags::FromIndex(index));
+        ASSERT_EQ(bit.LeastSignificantBit(), static_cast<int>(index));
+        for (size_t other = 0; other < SyncStageAccessFlags::size(); ++other) {
+            ASSERT_EQ(bit.test(other), other == index);
+        }
+        bit.reset(index);
+        ASSERT_TRUE(bit.none());
+    }
+
+    // The constructor only sets the first word, like std::bitset
+    ASSERT_TRUE(SyncStageAccessFlags(1ULL << 63) == low);
+    ASSERT_TRUE(SyncStageAccessFlags(1ULL << 63).words[1] == 0);
+
+    flags = low | high;
+    ASSERT_TRUE(flags.test(63));
+    ASSERT_TRUE(flags.test(64));
+    ASSERT_FALSE(flags.test(62));
+    ASSERT_FALSE(flags.test(65));
+    ASSERT_EQ(flags.LeastSignificantBit(), 63);
+    ASSERT_TRUE((flags & high) == high);
+    ASSERT_TRUE((flags & low) == low);
+    ASSERT_TRUE((low & high).none());
+    ASSERT_TRUE((flags & ~low) == high);
+    ASSERT_TRUE((flags ^ high) == low);
+    ASSERT_TRUE(flags != low);
+
+    flags &= high;
+    ASSERT_FALSE(flags.test(63));
+    ASSERT_TRUE(flags.test(64));
+    ASSERT_EQ(flags.LeastSignificantBit(), 64);
+    flags |= SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER_BIT;
+    ASSERT_TRUE(flags.test(SYNC_QUEUE_FAMILY_OWNERSHIP_TRANSFER));
+    ASSERT_EQ(flags.LeastSignificantBit(), 64);
+    flags &= low;
+    ASSERT_TRUE(flags.none());
+
+    flags = ~SyncStageAccessFlags();
+    ASSERT_TRUE(flags.test(0));
+    ASSERT_TRUE(flags.test(SyncStageAccessFlags::size() - 1));
+    flags.reset();
+    ASSERT_TRUE(flags.none());
+}